@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import json
+import os
 from pathlib import Path
 import subprocess
 import typer
@@ -7,25 +8,68 @@ import logging
 import datetime
 import time
 import sys
+import numpy as np
 import xarray as xr
+from typing import Callable, Dict, List, Optional
 
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid
+from ifs_physics_common.framework.stencil import STENCIL_COLLECTION
 
 from ice3_gt4py.components.ice_adjust import IceAdjust
 from ice3_gt4py.components.rain_ice import RainIce
 from ice3_gt4py.initialisation.state_ice_adjust import (
+    allocate_state_ice_adjust,
     get_state_ice_adjust,
 )
-from ice3_gt4py.initialisation.state_rain_ice import get_state_rain_ice
-from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.initialisation.state_ice_adjust import (
+    initialize_state as initialize_state_ice_adjust,
+)
+from ice3_gt4py.initialisation.state_rain_ice import (
+    allocate_state_rain_ice,
+    get_state_rain_ice,
+)
+from ice3_gt4py.initialisation.state_rain_ice import (
+    initialize_state as initialize_state_rain_ice,
+)
+from ice3_gt4py.phyex_common.param_ice import Sedim
+from ice3_gt4py.phyex_common.phyex_cache import load_phyex
+from ice3_gt4py.stencils import import_all_collections
+from ice3_gt4py.utils.compilation import defer_stencil, parallel_compilation
+from ice3_gt4py.utils.decomposition import (
+    ColumnFactory,
+    ColumnThreads,
+    ColumnWorkers,
+)
+from ice3_gt4py.utils.precision import errors_report, field_errors, with_precision
 from ice3_gt4py.utils.reader import NetCDFReader
+from ice3_gt4py.utils.stencil_cache import (
+    get_stencil_cache,
+    parse_size,
+    set_stencil_cache,
+)
+from ice3_gt4py.utils.stencil_registry import get_stencil_registry
+from ice3_gt4py.utils.streaming import NetCDFAppender, column_chunks, stream_columns
+from ice3_gt4py.utils.table_registry import get_table_registry
 
 logging.basicConfig(level=logging.DEBUG, stream=sys.stdout)
 logging.getLogger()
 
 app = typer.Typer()
 
+# Components run by the generic drivers, with their state initialisation
+COMPONENTS = {
+    "ice-adjust": (IceAdjust, get_state_ice_adjust),
+    "rain-ice": (RainIce, get_state_rain_ice),
+}
+
+# State allocation and initialisation from a reader, for the streaming driver
+STREAMED_STATES = {
+    "ice-adjust": (allocate_state_ice_adjust, initialize_state_ice_adjust),
+    "rain-ice": (allocate_state_rain_ice, initialize_state_rain_ice),
+}
+
+
 ######################## GT4Py drivers #######################
 @app.command()
 def run_ice_adjust(
@@ -33,10 +77,19 @@ def run_ice_adjust(
     dataset: str,
     output_path: str,
     tracking_file: str,
-    rebuild: bool = True,
+    rebuild: bool = False,
     validate_args: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_max_size: Optional[str] = None,
+    compile_workers: Optional[int] = None,
+    precision: str = "double",
+    workers: int = 1,
 ):
-    """Run ice_adjust component"""
+    """Run ice_adjust component
+
+    With --workers N, columns are split in N chunks run by N processes
+    on a shared memory copy of the state.
+    """
 
     ##### Grid #####
     logging.info("Initializing grid ...")
@@ -49,21 +102,34 @@ def run_ice_adjust(
     ################## Phyex #################
     logging.info("Initializing Phyex ...")
     cprogram = "AROME"
-    phyex = Phyex(cprogram)
+    phyex = load_phyex(cprogram)
 
     ######## Backend and gt4py config #######
-    logging.info(f"With backend {backend}")
-    gt4py_config = GT4PyConfig(
-        backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+    logging.info(f"With backend {backend}, {precision} precision")
+    gt4py_config = with_precision(
+        GT4PyConfig(
+            backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+        ),
+        precision,
     )
 
     ######## Instanciation + compilation #####
+    if cache_dir is not None:
+        logging.info(f"Stencil cache in {cache_dir}")
+        set_stencil_cache(cache_dir, parse_size(cache_max_size))
+    stencil_cache = get_stencil_cache()
+
     logging.info(f"Compilation for IceAdjust stencils")
     start = time.time()
-    ice_adjust = IceAdjust(grid, gt4py_config, phyex)
+    with parallel_compilation(compile_workers):
+        ice_adjust = IceAdjust(grid, gt4py_config, phyex)
     stop = time.time()
     elapsed_time = stop - start
     logging.info(f"Compilation duration for IceAdjust : {elapsed_time} s")
+    if stencil_cache is not None:
+        logging.info(f"Stencil cache : {stencil_cache.stats}")
+    logging.info(f"Stencil registry : {get_stencil_registry().report()}")
+    logging.info(f"Lookup tables : {get_table_registry().report()}")
 
     ####### Create state for AroAdjust #######
     reader = NetCDFReader(Path(dataset))
@@ -75,11 +141,27 @@ def run_ice_adjust(
     ###### Launching IceAdjust ###############
     logging.info("Launching IceAdjust")
 
-    start = time.time()
-    tends, diags = ice_adjust(state, dt)
-    stop = time.time()
-    elapsed_time = stop - start
-    logging.info(f"Execution duration for IceAdjust : {elapsed_time} s")
+    if workers > 1:
+        factory = ColumnFactory(
+            IceAdjust,
+            ny,
+            nz,
+            {
+                "gt4py_config": gt4py_config.copy(update={"rebuild": False}),
+                "phyex": phyex,
+            },
+        )
+        arrays = {key: field.data for key, field in state.items() if key != "time"}
+        with ColumnWorkers(factory, workers) as column_workers:
+            stats = column_workers.run(arrays, dt)
+        logging.info(f"Execution for IceAdjust : {stats}")
+    else:
+        start = time.time()
+        tends, diags = ice_adjust(state, dt)
+        stop = time.time()
+        elapsed_time = stop - start
+        logging.info(f"Execution duration for IceAdjust : {elapsed_time} s")
+        logging.info(f"Throughput : {nx * ny / elapsed_time:.0f} columns/s")
 
     logging.info(f"Extracting state data to {output_path}")
     output_fields = xr.Dataset(state)
@@ -109,10 +191,22 @@ def run_rain_ice(
     dataset: str,
     output_path: str,
     tracking_file: str,
-    rebuild: bool = True,
+    rebuild: bool = False,
     validate_args: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_max_size: Optional[str] = None,
+    compile_workers: Optional[int] = None,
+    convergence_check_interval: int = 1,
+    recompaction_threshold: float = 0.0,
+    fused: bool = False,
+    precision: str = "double",
+    workers: int = 1,
 ):
-    """Run aro_rain_ice component"""
+    """Run aro_rain_ice component
+
+    With --workers N, columns are split in N chunks run by N processes
+    on a shared memory copy of the state.
+    """
 
     ##### Grid #####
     logging.info("Initializing grid ...")
@@ -125,21 +219,41 @@ def run_rain_ice(
     ################## Phyex #################
     logging.info("Initializing Phyex ...")
     cprogram = "AROME"
-    phyex = Phyex(cprogram)
+    phyex = load_phyex(cprogram)
 
     ######## Backend and gt4py config #######
-    logging.info(f"With backend {backend}")
-    gt4py_config = GT4PyConfig(
-        backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+    logging.info(f"With backend {backend}, {precision} precision")
+    gt4py_config = with_precision(
+        GT4PyConfig(
+            backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+        ),
+        precision,
     )
 
     ######## Instanciation + compilation #####
+    if cache_dir is not None:
+        logging.info(f"Stencil cache in {cache_dir}")
+        set_stencil_cache(cache_dir, parse_size(cache_max_size))
+    stencil_cache = get_stencil_cache()
+
     logging.info(f"Compilation for RainIce stencils")
     start = time.time()
-    rain_ice = RainIce(grid, gt4py_config, phyex)
+    with parallel_compilation(compile_workers):
+        rain_ice = RainIce(
+            grid,
+            gt4py_config,
+            phyex,
+            convergence_check_interval=convergence_check_interval,
+            recompaction_threshold=recompaction_threshold,
+            fused=fused,
+        )
     stop = time.time()
     elapsed_time = stop - start
     logging.info(f"Compilation duration for RainIce : {elapsed_time} s")
+    if stencil_cache is not None:
+        logging.info(f"Stencil cache : {stencil_cache.stats}")
+    logging.info(f"Stencil registry : {get_stencil_registry().report()}")
+    logging.info(f"Lookup tables : {get_table_registry().report()}")
 
     ####### Create state for AroAdjust #######
     reader = NetCDFReader(Path(dataset))
@@ -151,11 +265,34 @@ def run_rain_ice(
     ###### Launching RainIce ###############
     logging.info("Launching RainIce")
 
-    start = time.time()
-    tends, diags = rain_ice(state, dt)
-    stop = time.time()
-    elapsed_time = stop - start
-    logging.info(f"Execution duration for RainIce : {elapsed_time} s")
+    if workers > 1:
+        # Counters of the components stay in the workers
+        factory = ColumnFactory(
+            RainIce,
+            ny,
+            nz,
+            {
+                "gt4py_config": gt4py_config.copy(update={"rebuild": False}),
+                "phyex": phyex,
+                "convergence_check_interval": convergence_check_interval,
+                "recompaction_threshold": recompaction_threshold,
+                "fused": fused,
+            },
+        )
+        arrays = {key: field.data for key, field in state.items() if key != "time"}
+        with ColumnWorkers(factory, workers) as column_workers:
+            stats = column_workers.run(arrays, dt)
+        logging.info(f"Execution for RainIce : {stats}")
+    else:
+        start = time.time()
+        tends, diags = rain_ice(state, dt)
+        stop = time.time()
+        elapsed_time = stop - start
+        logging.info(f"Execution duration for RainIce : {elapsed_time} s")
+        logging.info(f"Throughput : {nx * ny / elapsed_time:.0f} columns/s")
+        logging.info(f"Ice4Pack : {rain_ice.ice4_pack.pack_stats}")
+        logging.info(f"Ice4Stepping : {rain_ice.ice4_pack.stats}")
+        logging.info(f"Workspace : {rain_ice.workspace.stats}")
 
     logging.info(f"Extracting state data to {output_path}")
     output_fields = xr.Dataset(state)
@@ -181,6 +318,416 @@ def run_rain_ice(
         json.dump(gt4py_config.exec_info, file)
 
 
+def run_precision(
+    component: str, backend: str, dataset: str, precision: str, rebuild: bool
+) -> Dict[str, np.ndarray]:
+    """Run IceAdjust or RainIce on a dataset with the dtypes of precision
+
+    Args:
+        component (str): "ice-adjust" or "rain-ice"
+        backend (str): gt4py backend
+        dataset (str): path to the reference NetCDF
+        precision (str): "double" or "single"
+        rebuild (bool): force compilation
+
+    Returns:
+        Dict[str, np.ndarray]: fields of the state after the run
+    """
+    grid = ComputationalGrid(10000, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = load_phyex("AROME")
+    gt4py_config = with_precision(
+        GT4PyConfig(
+            backend=backend, rebuild=rebuild, validate_args=False, verbose=True
+        ),
+        precision,
+    )
+    reader = NetCDFReader(Path(dataset))
+
+    if component not in COMPONENTS:
+        raise KeyError(f"Component not in {list(COMPONENTS)}, got {component}")
+    component_class, get_state = COMPONENTS[component]
+    run = component_class(grid, gt4py_config, phyex)
+    state = get_state(grid, gt4py_config=gt4py_config, netcdf_reader=reader)
+
+    start = time.time()
+    run(state, dt)
+    stop = time.time()
+    nbytes = sum(field.data.nbytes for key, field in state.items() if key != "time")
+    logging.info(
+        f"{component}, {precision} precision : {stop - start} s, "
+        f"state {nbytes / 2**20:.1f} MiB"
+    )
+
+    return {
+        key: np.asarray(field.data) for key, field in state.items() if key != "time"
+    }
+
+
+@app.command()
+def compare_precision(
+    component: str,
+    backend: str,
+    dataset: str,
+    report_path: str,
+    rebuild: bool = False,
+):
+    """Run IceAdjust or RainIce (component : ice-adjust, rain-ice) in double and
+    single precision over a reference dataset, and report the error of each field
+    of the single precision run against the double precision one.
+    """
+
+    fields = {
+        precision: run_precision(component, backend, dataset, precision, rebuild)
+        for precision in ["double", "single"]
+    }
+    errors = field_errors(fields["double"], fields["single"])
+    for key, error in errors.items():
+        logging.info(f"{key} : {error}")
+
+    logging.info(f"Writing precision report to {report_path}")
+    with open(report_path, "w") as file:
+        json.dump(
+            {
+                "component": component,
+                "backend": backend,
+                "dataset": dataset,
+                "errors": errors_report(errors),
+            },
+            file,
+            indent=2,
+        )
+
+
+def best_elapsed(
+    run: Callable[[], float],
+    arrays: Dict[str, np.ndarray],
+    initial: Dict[str, np.ndarray],
+    repetitions: int,
+) -> float:
+    """Best elapsed time of run over repetitions, each starting from initial.
+    A first run, not timed, warms up (builds components, plans and temporaries).
+
+    Args:
+        run (Callable[[], float]): runs on arrays, returns the elapsed time
+        arrays (Dict[str, np.ndarray]): fields of the state, updated by run
+        initial (Dict[str, np.ndarray]): initial values of arrays
+        repetitions (int): number of timed runs
+
+    Returns:
+        float: best elapsed time
+    """
+    run()
+    elapsed = []
+    for _ in range(repetitions):
+        for key, array in initial.items():
+            arrays[key][...] = array
+        elapsed.append(run())
+    return min(elapsed)
+
+
+@app.command()
+def bench_workers(
+    component: str,
+    backend: str,
+    dataset: str,
+    report_path: str,
+    workers: List[int] = typer.Option([1, 2, 4]),
+    repetitions: int = 3,
+    rebuild: bool = False,
+):
+    """Throughput of IceAdjust or RainIce (component : ice-adjust, rain-ice)
+    run on column chunks by worker processes, for each number of workers.
+
+    Each run starts from the dataset state. The first run of a pool builds the
+    components of the workers and is not timed, the best of the next runs is kept.
+    Speedups are relative to the first number of workers.
+    """
+
+    nx, ny, nz = 10000, 1, 15
+    grid = ComputationalGrid(nx, ny, nz)
+    dt = datetime.timedelta(seconds=1)
+    phyex = load_phyex("AROME")
+    gt4py_config = GT4PyConfig(
+        backend=backend, rebuild=rebuild, validate_args=False, verbose=True
+    )
+
+    if component not in COMPONENTS:
+        raise KeyError(f"Component not in {list(COMPONENTS)}, got {component}")
+    component_class, get_state = COMPONENTS[component]
+
+    # Stencils are compiled here, workers load them
+    component_class(grid, gt4py_config, phyex)
+    state = get_state(
+        grid, gt4py_config=gt4py_config, netcdf_reader=NetCDFReader(Path(dataset))
+    )
+    initial = {
+        key: np.array(field.data) for key, field in state.items() if key != "time"
+    }
+    arrays = {key: array.copy() for key, array in initial.items()}
+
+    factory = ColumnFactory(
+        component_class,
+        ny,
+        nz,
+        {"gt4py_config": gt4py_config.copy(update={"rebuild": False}), "phyex": phyex},
+    )
+
+    results = []
+    for n_workers in workers:
+        with ColumnWorkers(factory, n_workers) as column_workers:
+            best = best_elapsed(
+                lambda: column_workers.run(arrays, dt).elapsed,
+                arrays,
+                initial,
+                repetitions,
+            )
+
+        results.append(
+            {
+                "workers": n_workers,
+                "elapsed": best,
+                "throughput": nx * ny / best,
+                "speedup": results[0]["elapsed"] / best if results else 1.0,
+            }
+        )
+        logging.info(
+            f"{n_workers} workers : {best:.3f} s, "
+            f"{results[-1]['throughput']:.0f} columns/s, "
+            f"speedup {results[-1]['speedup']:.2f}"
+        )
+
+    logging.info(f"Writing scaling report to {report_path}")
+    with open(report_path, "w") as file:
+        json.dump(
+            {
+                "component": component,
+                "backend": backend,
+                "columns": nx * ny,
+                "repetitions": repetitions,
+                "runs": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+@app.command()
+def bench_threads(
+    component: str,
+    backend: str,
+    dataset: str,
+    report_path: str,
+    threads: List[int] = typer.Option([1, 2, 4]),
+    repetitions: int = 3,
+    rebuild: bool = False,
+):
+    """Throughput of IceAdjust or RainIce (component : ice-adjust, rain-ice)
+    run on tiles of the IJ plane by a thread pool, for each number of threads,
+    against the component run on the whole domain (OpenMP only).
+
+    Speedups are relative to the whole domain run. Set OMP_NUM_THREADS
+    to share the cores between the OpenMP and pool threads.
+    """
+
+    nx, ny, nz = 10000, 1, 15
+    grid = ComputationalGrid(nx, ny, nz)
+    dt = datetime.timedelta(seconds=1)
+    phyex = load_phyex("AROME")
+    gt4py_config = GT4PyConfig(
+        backend=backend, rebuild=rebuild, validate_args=False, verbose=True
+    )
+
+    if component not in COMPONENTS:
+        raise KeyError(f"Component not in {list(COMPONENTS)}, got {component}")
+    component_class, get_state = COMPONENTS[component]
+
+    whole_domain = component_class(grid, gt4py_config, phyex)
+    state = get_state(
+        grid, gt4py_config=gt4py_config, netcdf_reader=NetCDFReader(Path(dataset))
+    )
+    arrays = {key: field.data for key, field in state.items() if key != "time"}
+    initial = {key: np.array(array) for key, array in arrays.items()}
+
+    def run_whole_domain() -> float:
+        start = time.perf_counter()
+        whole_domain.nested_call(arrays, dt)
+        return time.perf_counter() - start
+
+    best = best_elapsed(run_whole_domain, arrays, initial, repetitions)
+    results = [
+        {"threads": 0, "elapsed": best, "throughput": nx * ny / best, "speedup": 1.0}
+    ]
+    logging.info(f"OpenMP only : {best:.3f} s, {nx * ny / best:.0f} columns/s")
+
+    factory = ColumnFactory(
+        component_class, ny, nz, {"gt4py_config": gt4py_config, "phyex": phyex}
+    )
+    for n_threads in threads:
+        with ColumnThreads(factory, nx, n_threads) as column_threads:
+            best = best_elapsed(
+                lambda: column_threads.run(arrays, dt).elapsed,
+                arrays,
+                initial,
+                repetitions,
+            )
+
+        results.append(
+            {
+                "threads": n_threads,
+                "elapsed": best,
+                "throughput": nx * ny / best,
+                "speedup": results[0]["elapsed"] / best,
+            }
+        )
+        logging.info(
+            f"{n_threads} threads : {best:.3f} s, "
+            f"{results[-1]['throughput']:.0f} columns/s, "
+            f"speedup {results[-1]['speedup']:.2f}"
+        )
+
+    logging.info(f"Writing scaling report to {report_path}")
+    with open(report_path, "w") as file:
+        json.dump(
+            {
+                "component": component,
+                "backend": backend,
+                "columns": nx * ny,
+                "omp_num_threads": os.environ.get("OMP_NUM_THREADS"),
+                "repetitions": repetitions,
+                "runs": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+@app.command()
+def run_streaming(
+    component: str,
+    backend: str,
+    dataset: str,
+    output_path: str,
+    chunk_size: int = 10000,
+    max_columns: Optional[int] = None,
+    rebuild: bool = False,
+    cache_dir: Optional[str] = None,
+    cache_max_size: Optional[str] = None,
+    precision: str = "double",
+):
+    """Run IceAdjust or RainIce (component : ice-adjust, rain-ice) over the columns
+    of a dataset, chunk by chunk.
+
+    The state is allocated once on chunk_size columns. Each chunk of the dataset
+    is read into it, run, and appended to output_path : memory is bounded
+    by chunk_size rather than by the dataset size.
+    """
+
+    if component not in COMPONENTS:
+        raise KeyError(f"Component not in {list(COMPONENTS)}, got {component}")
+    component_class, _ = COMPONENTS[component]
+    allocate_state, initialize_state = STREAMED_STATES[component]
+
+    dims = NetCDFReader(Path(dataset)).get_dims()
+    logging.info(f"{dims['IJ']} columns of {dims['K']} levels in {dataset}")
+    grid = ComputationalGrid(chunk_size, 1, dims["K"])
+    dt = datetime.timedelta(seconds=1)
+    phyex = load_phyex("AROME")
+    gt4py_config = with_precision(
+        GT4PyConfig(
+            backend=backend, rebuild=rebuild, validate_args=False, verbose=True
+        ),
+        precision,
+    )
+
+    if cache_dir is not None:
+        logging.info(f"Stencil cache in {cache_dir}")
+        set_stencil_cache(cache_dir, parse_size(cache_max_size))
+
+    run = component_class(grid, gt4py_config, phyex)
+    state = allocate_state(grid, gt4py_config=gt4py_config)
+
+    logging.info(f"Streaming {component} by chunks of {chunk_size} columns")
+    with NetCDFAppender(output_path) as writer:
+        stats = stream_columns(
+            column_chunks(dataset, chunk_size, max_columns=max_columns),
+            state,
+            initialize_state,
+            lambda storages: run.nested_call(storages, dt),
+            writer,
+        )
+    logging.info(f"Streaming : {stats}")
+
+
+@app.command()
+def precompile(
+    cache_dir: str,
+    backend: List[str] = typer.Option(["gt:cpu_ifirst"]),
+    program: List[str] = typer.Option(["AROME", "MESO-NH"]),
+    sedim: List[str] = typer.Option([option.name for option in Sedim]),
+    precision: List[str] = typer.Option(["double"]),
+    rebuild: bool = False,
+    compile_workers: Optional[int] = None,
+):
+    """Compile every stencil collection in a cache directory,
+    for each backend, precision and Phyex variant (program x sedimentation scheme).
+
+    The cache directory can be shipped to compute nodes (same python version)
+    and used with --cache-dir, so that runs never compile.
+
+    Each stencil is compiled independently : the ones failing to compile are
+    reported at the end, the others are written to the cache, and the command
+    exits with code 1.
+    """
+
+    logging.info(f"Stencil cache in {cache_dir}")
+    stencil_cache = set_stencil_cache(cache_dir)
+
+    import_all_collections()
+    logging.info(f"{len(STENCIL_COLLECTION)} stencil collections")
+    start = time.time()
+    with parallel_compilation(compile_workers, keep_going=True) as failures:
+        for backend_name in backend:
+            for precision_name in precision:
+                gt4py_config = with_precision(
+                    GT4PyConfig(
+                        backend=backend_name,
+                        rebuild=rebuild,
+                        validate_args=False,
+                        verbose=True,
+                    ),
+                    precision_name,
+                )
+                for cprogram in program:
+                    for sedim_name in sedim:
+                        logging.info(
+                            f"{backend_name}, {precision_name} precision, "
+                            f"{cprogram}, SEDIM={sedim_name}"
+                        )
+                        phyex = load_phyex(cprogram, PROGRAM=cprogram)
+                        phyex.param_icen.SEDIM = Sedim[sedim_name].value
+                        externals = phyex.to_externals()
+                        for name in STENCIL_COLLECTION:
+                            defer_stencil(name, gt4py_config, externals)
+    stop = time.time()
+    elapsed_time = stop - start
+    logging.info(f"Precompilation duration : {elapsed_time} s")
+    logging.info(f"Stencil cache : {stencil_cache.report()}")
+    logging.info(f"Stencil registry : {get_stencil_registry().report()}")
+
+    if failures:
+        failed = sorted(
+            {
+                (deferred.name, deferred.gt4py_config.backend, type(error).__name__)
+                for deferred, error in failures
+            }
+        )
+        logging.error(f"{len(failures)} compilation requests failed :")
+        for name, backend_name, error in failed:
+            logging.error(f"  {name} on {backend_name} : {error}")
+        raise typer.Exit(code=1)
+
+
 ##################### Fortran drivers #########################
 @app.command()
 def run_ice_adjust_fortran(
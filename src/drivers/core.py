@@ -13,7 +13,7 @@ from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid
 from ifs_physics_common.framework.components import ImplicitTendencyComponent
 
-from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.phyex_common.phyex_cache import load_phyex
 
 from ifs_physics_common.utils.typingx import (
     DataArray,
@@ -49,7 +49,7 @@ def core(
     ################## Phyex #################
     logging.info("Initializing Phyex ...")
     cprogram = "AROME"
-    phyex = Phyex(cprogram)
+    phyex = load_phyex(cprogram)
 
     ######## Instanciation + compilation #####
     logging.info(f"Compilation for AroAdjust stencils")
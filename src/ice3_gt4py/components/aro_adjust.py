@@ -7,23 +7,24 @@ from functools import cached_property
 from itertools import repeat
 from typing import Dict
 
-from gt4py.storage import from_array, ones
+from gt4py.storage import ones
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
 from ifs_physics_common.framework.storage import managed_temporary_storage
 from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
+from ice3_gt4py.components.base import Ice3Component
 from ice3_gt4py.phyex_common.phyex import Phyex
 import sys
 from ice3_gt4py.phyex_common.tables import src_1d
+from ice3_gt4py.utils.table_registry import get_table_registry
 
 logging.basicConfig(level=logging.DEBUG, stream=sys.stdout)
 logging.getLogger()
 
 
-class AroAdjust(ImplicitTendencyComponent):
+class AroAdjust(Ice3Component):
     """Implicit Tendency Component calling sequentially
     - aro_filter : negativity filters
     - ice_adjust : saturation adjustment of temperature and mixing ratios
@@ -53,6 +54,11 @@ class AroAdjust(ImplicitTendencyComponent):
         # ice_adjust stands for ice_adjust.f90
         self.ice_adjust = self.compile_stencil("ice_adjust", externals)
 
+        # Lookup table, uploaded once per backend
+        self.src_1d = get_table_registry().get(
+            "src_1d", src_1d, self.gt4py_config.backend, self.gt4py_config.dtypes.float
+        )
+
     @cached_property
     def _input_properties(self) -> PropertyDict:
         # TODO : sort input properties from state
@@ -243,17 +249,13 @@ class AroAdjust(ImplicitTendencyComponent):
                 "inq1": inq1,
             }
 
-            # Global Table
-            logging.info("Loading src_1d GlobalTable")
-            src_1D = from_array(src_1d, backend=self.gt4py_config.backend)
-
             # Timestep
             logging.info("Launching ice_adjust")
             self.ice_adjust(
                 **state_ice_adjust,
                 **diags_ice_adjust,
                 **temporaries_ice_adjust,
-                src_1d=src_1D,
+                src_1d=self.src_1d,
                 dt=timestep.total_seconds(),
                 origin=(0, 0, 0),
                 domain=self.computational_grid.grids[I, J, K].shape,
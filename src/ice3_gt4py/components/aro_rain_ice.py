@@ -5,20 +5,19 @@ from datetime import timedelta
 from functools import cached_property
 from itertools import repeat
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
-from ifs_physics_common.framework.stencil import compile_stencil
 from ifs_physics_common.framework.storage import managed_temporary_storage
 from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 from ifs_physics_common.utils.f2py import ported_method
 
 
+from ice3_gt4py.components.base import Ice3Component
 from ice3_gt4py.components.ice4_stepping import Ice4Stepping
 from ice3_gt4py.phyex_common.phyex import Phyex
 
 
-class AroRainIce(ImplicitTendencyComponent):
+class AroRainIce(Ice3Component):
     """Component for step computation"""
 
     def __init__(
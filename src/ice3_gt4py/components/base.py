@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from gt4py.cartesian.stencil_object import StencilObject
+from ifs_physics_common.framework.components import ImplicitTendencyComponent
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid
+from ifs_physics_common.utils.typingx import NDArrayLikeDict
+
+from ice3_gt4py.utils.call_plan import CallPlan, CallPlanCache
+from ice3_gt4py.utils.compilation import defer_stencil
+from ice3_gt4py.utils.stencil_registry import get_stencil_registry
+from ice3_gt4py.utils.workspace import Workspace
+
+
+class Ice3Component(ImplicitTendencyComponent):
+    """Implicit tendency component compiling its stencils
+    through the persistent stencil cache (see ice3_gt4py.utils.stencil_cache)
+
+    A stencil already compiled in the process, by this or another component,
+    for the same backend and externals is reused (see ice3_gt4py.utils.stencil_registry).
+
+    Inside a parallel_compilation block (see ice3_gt4py.utils.compilation),
+    compilations are deferred and run on a process pool at the end of the block.
+
+    Temporaries are taken from workspace (see ice3_gt4py.utils.workspace),
+    handed down by the parent component or owned by the component if None.
+
+    Stencil arguments are bound once in call plans (see ice3_gt4py.utils.call_plan),
+    replayed by later calls on the same storages. With call_plans=False,
+    arguments are assembled at each call.
+
+    Nested in another component, a component is called on storages
+    with nested_call, rather than on DataArrays through __call__.
+    """
+
+    def __init__(
+        self,
+        computational_grid: ComputationalGrid,
+        *,
+        enable_checks: bool = True,
+        gt4py_config: GT4PyConfig,
+        workspace: Optional[Workspace] = None,
+        call_plans: bool = True,
+    ) -> None:
+        super().__init__(
+            computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config
+        )
+        self.workspace = workspace if workspace is not None else Workspace(gt4py_config)
+        self.call_plans = CallPlanCache() if call_plans else None
+
+    def compile_stencil(
+        self, name: str, externals: Optional[Dict[str, Any]] = None
+    ) -> StencilObject:
+        deferred = defer_stencil(name, self.gt4py_config, externals)
+        if deferred is not None:
+            return deferred
+        return get_stencil_registry().get_or_compile(name, self.gt4py_config, externals)
+
+    def call_plan(
+        self, storages: Iterable[Any], build: Callable[[], CallPlan]
+    ) -> CallPlan:
+        """Plan binding storages, cached if call plans are enabled
+
+        Args:
+            storages (Iterable[Any]): storages bound by the plan
+            build (Callable[[], CallPlan]): builds the plan
+
+        Returns:
+            CallPlan: plan to replay
+        """
+        if self.call_plans is None:
+            return build()
+        return self.call_plans.get(storages, build)
+
+    def nested_call(
+        self, state: NDArrayLikeDict, timestep: timedelta, **kwargs: Any
+    ) -> None:
+        """Array-level call, for a component nested in another one
+
+        array_call runs on the storages of state directly : no DataArray is built
+        and input properties are not validated. Tendencies and diagnostics are not
+        allocated, nested components write their outputs in state.
+
+        Args:
+            state (NDArrayLikeDict): storages of the inputs, on the grid of the component
+            timestep (timedelta): timestep
+            kwargs: extra arguments of array_call (e.g. ldsoft)
+        """
+        self.array_call(
+            state=state,
+            timestep=timestep,
+            out_tendencies={},
+            out_diagnostics={},
+            overwrite_tendencies={},
+            **kwargs,
+        )
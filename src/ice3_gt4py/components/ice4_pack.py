@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import cached_property
+from itertools import repeat
+from typing import Dict, Optional
+
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
+from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
+
+from ice3_gt4py.components.base import Ice3Component
+from ice3_gt4py.components.ice4_stepping import (
+    STEPPING_FIELDS,
+    STEPPING_INPUTS,
+    STEPPING_WORK,
+    Ice4Stepping,
+    SteppingStats,
+)
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.packing import gather, pack_size, scatter
+from ice3_gt4py.utils.workspace import Workspace
+
+
+@dataclass
+class PackStats:
+    """Active (ldmicro) points and packs processed by Ice4Pack"""
+
+    calls: int = 0
+    packs: int = 0
+    packed_points: int = 0
+    total_points: int = 0
+
+    def __str__(self) -> str:
+        ratio = self.packed_points / self.total_points if self.total_points else 0.0
+        return (
+            f"{self.packed_points} / {self.total_points} points packed ({ratio:.1%}), "
+            f"{self.packs} packs over {self.calls} calls"
+        )
+
+
+class Ice4Pack(Ice3Component):
+    """Component running Ice4Stepping on the ldmicro points only
+
+    With LPACK_MICRO, ldmicro points are gathered in packs of NPROMICRO points
+    (all points in one pack if NPROMICRO = 0), laid out as a (NPROMICRO, 1, 1) domain.
+    Ice4Stepping runs on each pack and its outputs are scattered back.
+    The tail of the last pack repeats its last point with ldmicro False.
+
+    Without LPACK_MICRO, Ice4Stepping runs on the whole domain with the ldmicro mask.
+    """
+
+    def __init__(
+        self,
+        computational_grid: ComputationalGrid,
+        gt4py_config: GT4PyConfig,
+        phyex: Phyex,
+        *,
+        enable_checks: bool = True,
+        convergence_check_interval: int = 1,
+        recompaction_threshold: float = 0.0,
+        workspace: Optional[Workspace] = None,
+        fused: bool = False,
+        call_plans: bool = True,
+    ) -> None:
+        super().__init__(
+            computational_grid,
+            enable_checks=enable_checks,
+            gt4py_config=gt4py_config,
+            workspace=workspace,
+            call_plans=call_plans,
+        )
+
+        self.phyex = phyex
+        self.convergence_check_interval = convergence_check_interval
+        self.recompaction_threshold = recompaction_threshold
+        self.fused = fused
+        self.lpack_micro = phyex.param_icen.LPACK_MICRO
+        self.npromicro = phyex.param_icen.NPROMICRO
+
+        # Counters shared by the steppers of every packed domain
+        self.stats = SteppingStats()
+        self.pack_stats = PackStats()
+        self._steppers: Dict[int, Ice4Stepping] = {}
+
+        # Stencils are compiled with the first stepper, and reused by the next ones
+        if self.lpack_micro:
+            nx, ny, nz = self.computational_grid.grids[(I, J, K)].shape
+            self.stepper(self.npromicro or nx * ny * nz)
+        else:
+            self.stepper()
+
+    @cached_property
+    def _input_properties(self) -> PropertyDict:
+        return {
+            "ldmicro": {"grid": (I, J, K), "units": ""},
+            **{key: {"grid": (I, J, K), "units": ""} for key in STEPPING_FIELDS},
+        }
+
+    @cached_property
+    def _tendency_properties(self) -> PropertyDict:
+        return {}
+
+    @cached_property
+    def _diagnostic_properties(self) -> PropertyDict:
+        return {}
+
+    @cached_property
+    def _temporaries(self) -> PropertyDict:
+        return {}
+
+    def stepper(self, kproma: Optional[int] = None) -> Ice4Stepping:
+        """Ice4Stepping on a packed domain of kproma points
+
+        Args:
+            kproma (Optional[int]): number of points of the pack,
+                None for the whole domain
+
+        Returns:
+            Ice4Stepping: stepping component
+        """
+        key = 0 if kproma is None else kproma
+        if key not in self._steppers:
+            grid = (
+                self.computational_grid
+                if kproma is None
+                else ComputationalGrid(kproma, 1, 1)
+            )
+            self._steppers[key] = Ice4Stepping(
+                grid,
+                self.gt4py_config,
+                self.phyex,
+                convergence_check_interval=self.convergence_check_interval,
+                stats=self.stats,
+                recompaction_threshold=self.recompaction_threshold,
+                workspace=self.workspace,
+                fused=self.fused,
+                call_plans=self.call_plans is not None,
+            )
+        return self._steppers[key]
+
+    def array_call(
+        self,
+        state: NDArrayLikeDict,
+        timestep: timedelta,
+        out_tendencies: NDArrayLikeDict,
+        out_diagnostics: NDArrayLikeDict,
+        overwrite_tendencies: Dict[str, bool],
+    ):
+
+        # Translation note : packing loop of ICE4_PACK in mode_ice4_pack.F90
+        self.pack_stats.calls += 1
+
+        if not self.lpack_micro:
+            self.stepper().nested_call(state, timestep)
+            return
+
+        # Translation note : indices of ldmicro points, I1/I2/I3 in mode_ice4_pack.F90
+        ldmicro = state["ldmicro"]
+        ii, jj, kk = ldmicro.nonzero()
+        n_points = int(ii.shape[0])
+        self.pack_stats.packed_points += n_points
+        self.pack_stats.total_points += ldmicro.size
+
+        if n_points == 0:
+            return
+
+        kproma = pack_size(self.npromicro, n_points, ldmicro.size)
+        stepper = self.stepper(kproma)
+
+        keys = STEPPING_FIELDS + tuple(key for key in STEPPING_WORK if key in state)
+        with self.workspace.temporaries(
+            stepper.computational_grid,
+            ((I, J, K), "bool"),
+            *repeat(((I, J, K), "float"), len(STEPPING_FIELDS) + len(STEPPING_WORK)),
+        ) as (packed_ldmicro, *packed_fields):
+            packed_state = {
+                "ldmicro": packed_ldmicro,
+                **dict(zip(STEPPING_FIELDS + STEPPING_WORK, packed_fields)),
+            }
+
+            for start in range(0, n_points, kproma):
+                points = (
+                    ii[start : start + kproma],
+                    jj[start : start + kproma],
+                    kk[start : start + kproma],
+                )
+
+                size = gather(state, packed_state, keys, points)
+                packed_ldmicro[:size, 0, 0] = True
+                packed_ldmicro[size:, 0, 0] = False
+
+                stepper.nested_call(packed_state, timestep)
+
+                scatter(
+                    packed_state,
+                    state,
+                    [key for key in keys if key not in STEPPING_INPUTS],
+                    points,
+                )
+                self.pack_stats.packs += 1
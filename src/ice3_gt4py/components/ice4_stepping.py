@@ -1,26 +1,134 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass, field
 from datetime import timedelta
 from functools import cached_property
 from itertools import repeat
-from typing import Dict
+from typing import Dict, List, Optional
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
-from ifs_physics_common.framework.storage import managed_temporary_storage
-from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
+from ifs_physics_common.utils.typingx import (
+    NDArrayLike,
+    NDArrayLikeDict,
+    PropertyDict,
+)
 from ifs_physics_common.utils.f2py import ported_method
-import numpy as np
 
 
-from ice3_gt4py.components.ice4_tendencies import Ice4Tendencies
+from ice3_gt4py.components.base import Ice3Component
+from ice3_gt4py.components.ice4_tendencies import SOFT_RATES, Ice4Tendencies
 from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.call_plan import CallPlan, bind
+from ice3_gt4py.utils.packing import gather, pack_size, scatter
+from ice3_gt4py.utils.workspace import Workspace
+
+# Fields read by Ice4Stepping
+STEPPING_FIELDS = (
+    "rhodref",
+    "pabs_t",
+    "exn",
+    "cf",
+    "sigma_rc",
+    "ci_t",
+    "hlc_hcf",
+    "hlc_hrc",
+    "hli_hcf",
+    "hli_hri",
+    "th_t",
+    "ls_fact",
+    "lv_fact",
+    "t",
+    "rv_t",
+    "rc_t",
+    "rr_t",
+    "ri_t",
+    "rs_t",
+    "rg_t",
+)
+
+# Fields only read by Ice4Stepping, not scattered back after packing
+STEPPING_INPUTS = ("rhodref", "pabs_t", "exn", "cf", "sigma_rc")
+
+# Work fields of Ice4Tendencies, packed only if given in state
+STEPPING_WORK = (
+    "ai",
+    "cj",
+    "ssi",
+    "hlc_lcf",
+    "hlc_lrc",
+    "hli_lcf",
+    "hli_lri",
+    "fr",
+)
+
+# Increments and tendencies of Ice4Tendencies, accumulated over the iterations
+# of run_loops (never reset) : carried along when recompacting
+STEPPING_ACCUMULATED = (
+    "theta_b",
+    "rv_b",
+    "rc_b",
+    "rr_b",
+    "ri_b",
+    "rs_b",
+    "rg_b",
+    "theta_a_tnd",
+    "rv_a_tnd",
+    "rc_a_tnd",
+    "rr_a_tnd",
+    "ri_a_tnd",
+    "rs_a_tnd",
+    "rg_a_tnd",
+)
+
+
+@dataclass
+class SteppingStats:
+    """Iteration and convergence check counters of Ice4Stepping
+
+    active_counts holds the number of active points read at each check.
+    """
+
+    outer_iterations: int = 0
+    inner_iterations: int = 0
+    checks: int = 0
+    check_time: float = 0.0
+    recompactions: int = 0
+    active_counts: List[int] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.outer_iterations} outer iterations, "
+            f"{self.inner_iterations} inner iterations, "
+            f"{self.checks} convergence checks ({self.check_time:.4f} s), "
+            f"{self.recompactions} recompactions, "
+            f"active points per check : {self.active_counts}"
+        )
+
+
+class Ice4Stepping(Ice3Component):
+    """Component for step computation
 
+    Loops stop on the number of active points (ldcompute) counted per column
+    by the stencils updating ldcompute. Reading it back to the host synchronises
+    the device : the inner loop reads it every convergence_check_interval iterations.
+    Iterations past convergence run with ldcompute False everywhere (delta_t_micro = 0).
+    Counters can be shared between steppers through stats (see Ice4Pack).
 
-class Ice4Stepping(ImplicitTendencyComponent):
-    """Component for step computation"""
+    When the active points fall below recompaction_threshold (fraction of the domain)
+    at the start of an outer iteration, the points left are gathered on a
+    smaller (kproma, 1, 1) domain where the remaining iterations run,
+    and scattered back at the end. Recompaction is disabled with a threshold of 0.
+    It only happens between outer iterations : the increments and tendencies keep
+    being added to at every inner iteration, on points stopped by the step limiter
+    too, and those points still have time left for the next outer iteration.
+
+    With fused=True, Ice4Tendencies runs its stencil chain as a single stencil,
+    and the step limiter, mixing ratio limiter and state update run as one stencil
+    (step_limiter_state_update). The unfused path is kept as the validation reference.
+    """
 
     def __init__(
         self,
@@ -29,21 +137,51 @@ class Ice4Stepping(ImplicitTendencyComponent):
         phyex: Phyex,
         *,
         enable_checks: bool = True,
+        convergence_check_interval: int = 1,
+        stats: Optional[SteppingStats] = None,
+        recompaction_threshold: float = 0.0,
+        workspace: Optional[Workspace] = None,
+        fused: bool = False,
+        call_plans: bool = True,
     ) -> None:
         super().__init__(
-            computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config
+            computational_grid,
+            enable_checks=enable_checks,
+            gt4py_config=gt4py_config,
+            workspace=workspace,
+            call_plans=call_plans,
         )
 
+        if convergence_check_interval < 1:
+            raise ValueError(
+                f"convergence_check_interval must be >= 1, got {convergence_check_interval}"
+            )
+        if not 0 <= recompaction_threshold < 1:
+            raise ValueError(
+                f"recompaction_threshold must be in [0, 1), got {recompaction_threshold}"
+            )
+        self.convergence_check_interval = convergence_check_interval
+        self.recompaction_threshold = recompaction_threshold
+        self.fused = fused
+        self.stats = stats if stats is not None else SteppingStats()
+        self.phyex = phyex
+        self._compacted: Dict[int, Ice4Stepping] = {}
+
         externals = phyex.to_externals()
 
         # Stencil collections
 
         self.ice4_stepping_heat = self.compile_stencil("ice4_stepping_heat", externals)
-        self.ice4_step_limiter = self.compile_stencil("step_limiter", externals)
-        self.ice4_mixing_ratio_step_limiter = self.compile_stencil(
-            "mixing_ratio_step_limiter", externals
-        )
-        self.ice4_state_update = self.compile_stencil("state_update", externals)
+        if self.fused:
+            self.ice4_step_update = self.compile_stencil(
+                "step_limiter_state_update", externals
+            )
+        else:
+            self.ice4_step_limiter = self.compile_stencil("step_limiter", externals)
+            self.ice4_mixing_ratio_step_limiter = self.compile_stencil(
+                "mixing_ratio_step_limiter", externals
+            )
+            self.ice4_state_update = self.compile_stencil("state_update", externals)
         self.external_tendencies_update = self.compile_stencil(
             "external_tendencies_update", externals
         )
@@ -55,7 +193,12 @@ class Ice4Stepping(ImplicitTendencyComponent):
 
         # Component for tendency update
         self.ice4_tendencies = Ice4Tendencies(
-            self.computational_grid, self.gt4py_config, phyex
+            self.computational_grid,
+            self.gt4py_config,
+            phyex,
+            workspace=self.workspace,
+            fused=self.fused,
+            call_plans=self.call_plans is not None,
         )
 
     @cached_property
@@ -104,196 +247,397 @@ class Ice4Stepping(ImplicitTendencyComponent):
     def _temporaries(self) -> PropertyDict:
         return {}
 
+    def active_points(self, ldcompute_count) -> int:
+        """Number of points with ldcompute, from the per-column counts
+
+        Args:
+            ldcompute_count: number of points with ldcompute per column (I, J)
+
+        Returns:
+            int: number of active points
+        """
+        start = time.perf_counter()
+        count = int(ldcompute_count.sum())
+        self.stats.checks += 1
+        self.stats.active_counts.append(count)
+        self.stats.check_time += time.perf_counter() - start
+        return count
+
+    def compacted(self, kproma: int) -> Ice4Stepping:
+        """Ice4Stepping on a compacted domain of kproma points
+
+        Args:
+            kproma (int): number of points of the compacted domain
+
+        Returns:
+            Ice4Stepping: stepping component, sharing stats
+        """
+        if kproma not in self._compacted:
+            self._compacted[kproma] = Ice4Stepping(
+                ComputationalGrid(kproma, 1, 1),
+                self.gt4py_config,
+                self.phyex,
+                convergence_check_interval=self.convergence_check_interval,
+                stats=self.stats,
+                recompaction_threshold=self.recompaction_threshold,
+                workspace=self.workspace,
+                fused=self.fused,
+                call_plans=self.call_plans is not None,
+            )
+        return self._compacted[kproma]
+
+    def recompact(
+        self,
+        state: NDArrayLikeDict,
+        t_micro: NDArrayLike,
+        ldcompute: NDArrayLike,
+        accumulated: NDArrayLikeDict,
+        dt: float,
+        max_outerloop_iterations: int,
+    ) -> None:
+        """Run the remaining outer iterations on the ldcompute points only
+
+        Args:
+            state (NDArrayLikeDict): fields on the current domain
+            t_micro (NDArrayLike): time of microphysics on the current domain
+            ldcompute (NDArrayLike): points left, t_micro < dt
+                (see ice4_stepping_ldcompute_init)
+            accumulated (NDArrayLikeDict): increments and tendencies accumulated
+                by Ice4Tendencies (see STEPPING_ACCUMULATED)
+            dt (float): timestep
+            max_outerloop_iterations (int): outer iterations left
+        """
+        points = ldcompute.nonzero()
+        n_points = int(points[0].shape[0])
+        stepper = self.compacted(pack_size(0, n_points, ldcompute.size))
+        self.stats.recompactions += 1
+
+        keys = STEPPING_FIELDS + tuple(key for key in STEPPING_WORK if key in state)
+        with self.workspace.temporaries(
+            stepper.computational_grid,
+            ((I, J, K), "bool"),
+            *repeat(((I, J, K), "float"), len(keys) + len(STEPPING_ACCUMULATED) + 1),
+        ) as (packed_ldmicro, packed_t_micro, *packed_fields):
+            packed_state = {"ldmicro": packed_ldmicro, **dict(zip(keys, packed_fields))}
+            packed_accumulated = dict(
+                zip(STEPPING_ACCUMULATED, packed_fields[len(keys) :])
+            )
+            gather(state, packed_state, keys, points)
+            gather(accumulated, packed_accumulated, STEPPING_ACCUMULATED, points)
+            gather(
+                {"t_micro": t_micro}, {"t_micro": packed_t_micro}, ["t_micro"], points
+            )
+
+            # Tail of the pack : inactive points, with the timestep already elapsed
+            #                    (t_micro = dt fails t_micro < dt in ldcompute_init)
+            packed_ldmicro[:n_points, 0, 0] = True
+            packed_ldmicro[n_points:, 0, 0] = False
+            packed_t_micro[n_points:, 0, 0] = dt
+
+            stepper.run_loops(
+                packed_state,
+                dt,
+                t_micro_0=packed_t_micro,
+                max_outerloop_iterations=max_outerloop_iterations,
+                accumulated_0=packed_accumulated,
+            )
+
+            scatter(
+                packed_state,
+                state,
+                [key for key in keys if key not in STEPPING_INPUTS],
+                points,
+            )
+
     @ported_method(
         from_file="PHYEX/src/common/micro/mode_ice4_stepping.F90",
         from_line=214,
         to_line=438,
     )
-    def array_call(
+    def run_loops(
         self,
         state: NDArrayLikeDict,
-        timestep: timedelta,
-        out_tendencies: NDArrayLikeDict,
-        out_diagnostics: NDArrayLikeDict,
-        overwrite_tendencies: Dict[str, bool],
-    ):
-
-        with managed_temporary_storage(
+        dt: float,
+        t_micro_0: Optional[NDArrayLike] = None,
+        max_outerloop_iterations: int = 10,
+        accumulated_0: Optional[NDArrayLikeDict] = None,
+    ) -> None:
+        """Outer and inner loops of ice4_stepping
+
+        Args:
+            state (NDArrayLikeDict): fields on the domain of the component
+            dt (float): timestep
+            t_micro_0 (Optional[NDArrayLike]): time of microphysics reached,
+                initialised from ldmicro if None
+            max_outerloop_iterations (int): maximum number of outer iterations
+            accumulated_0 (Optional[NDArrayLikeDict]): increments and tendencies
+                accumulated before recompaction (see recompact), zero if None
+        """
+
+        with self.workspace.temporaries(
             self.computational_grid,
             *repeat(((I, J, K), "bool"), 1),
-            *repeat(((I, J, K), "float"), 28),
-            gt4py_config=self.gt4py_config,
-        ) as (
-            # masks
-            ldcompute,
-            # intial mixing ratios
-            rc_0r_t,
-            rr_0r_t,
-            ri_0r_t,
-            rs_0r_t,
-            rg_0r_t,
-            # increments
-            theta_b,
-            rv_b,
-            rc_b,
-            rr_b,
-            ri_b,
-            rs_b,
-            rg_b,
-            # tnd update
-            theta_a_tnd,
-            rv_a_tnd,
-            rc_a_tnd,
-            rr_a_tnd,
-            ri_a_tnd,
-            rs_a_tnd,
-            rg_a_tnd,
-            # tendances externes
-            theta_ext_tnd,
-            rc_ext_tnd,
-            rr_ext_tnd,
-            ri_ext_tnd,
-            rs_ext_tnd,
-            rg_ext_tnd,
-            # timing
-            t_micro,
-            delta_t_micro,
-            time_threshold_tmp,
-        ):
+            *repeat(((I, J, K), "float"), 32),
+            ((I, J), "int"),
+            *repeat(((I, J, K), "float"), len(SOFT_RATES)),
+        ) as buffers:
+            (
+                # masks
+                ldcompute,
+                # intial mixing ratios
+                rc_0r_t,
+                rr_0r_t,
+                ri_0r_t,
+                rs_0r_t,
+                rg_0r_t,
+                # increments
+                theta_b,
+                rv_b,
+                rc_b,
+                rr_b,
+                ri_b,
+                rs_b,
+                rg_b,
+                # tnd update
+                theta_a_tnd,
+                rv_a_tnd,
+                rc_a_tnd,
+                rr_a_tnd,
+                ri_a_tnd,
+                rs_a_tnd,
+                rg_a_tnd,
+                # external tendencies
+                theta_ext_tnd,
+                rc_ext_tnd,
+                rr_ext_tnd,
+                ri_ext_tnd,
+                rs_ext_tnd,
+                rg_ext_tnd,
+                # thermal conductivity and vapour diffusivity, from Ice4Tendencies
+                ka,
+                dv,
+                # timing
+                t_micro,
+                delta_t_micro,
+                time_threshold_tmp,
+                t_soft,
+                delta_t_soft,
+                # active points per column
+                ldcompute_count,
+                # process rates, kept with lsoft
+                *soft_rates,
+            ) = buffers
+
             # Translation note : Ice4Stepping is implemented assuming PARAMI%XTSTEP_TS = 0
             #                   l225 to l229 omitted
             #                   l334 to l341 omitted
             #                   l174 to l178 omitted
 
-            ############## t_micro_init ################
-            dt = timestep.total_seconds()
+            # Translation note : no external tendencies in AROME, t_soft and delta_t_soft
+            #                    are only read by step_limiter under XTSTEP_TS != 0
+            for buffer in [
+                theta_ext_tnd,
+                rc_ext_tnd,
+                rr_ext_tnd,
+                ri_ext_tnd,
+                rs_ext_tnd,
+                rg_ext_tnd,
+                t_soft,
+                delta_t_soft,
+            ]:
+                buffer[...] = 0
 
-            state_tmicro_init = {"ldmicro": state["ldmicro"], "t_micro": t_micro}
-
-            self.tmicro_init(**state_tmicro_init)
+            ############## t_micro_init ################
+            if t_micro_0 is None:
+                state_tmicro_init = {"ldmicro": state["ldmicro"], "t_micro": t_micro}
+                self.tmicro_init(**state_tmicro_init, dt=dt)
+            else:
+                t_micro[...] = t_micro_0
 
             outerloop_counter = 0
-            max_outerloop_iterations = 10
-            lsoft = False
-
-            # l223 in f90
-            while np.any(t_micro[...] < dt):
-
-                # Translation note XTSTEP_TS == 0 is assumed implying no loops over t_soft
-                innerloop_counter = 0
-                max_innerloop_iterations = 10
-
-                # Translation note : l230 to l 237 in Fortran
-                self.ldcompute_init(ldcompute, t_micro)
-
-                # Iterations limiter
-                if outerloop_counter >= max_outerloop_iterations:
-                    break
-
-                while np.any(ldcompute[...]):
-
-                    # Iterations limiter
-                    if innerloop_counter >= max_innerloop_iterations:
-                        break
-
-                    ####### ice4_stepping_heat #############
-                    state_stepping_heat = {
+            rates = dict(zip(SOFT_RATES, soft_rates))
+
+            accumulated = dict(
+                zip(
+                    STEPPING_ACCUMULATED,
+                    [
+                        theta_b,
+                        rv_b,
+                        rc_b,
+                        rr_b,
+                        ri_b,
+                        rs_b,
+                        rg_b,
+                        theta_a_tnd,
+                        rv_a_tnd,
+                        rc_a_tnd,
+                        rr_a_tnd,
+                        ri_a_tnd,
+                        rs_a_tnd,
+                        rg_a_tnd,
+                    ],
+                )
+            )
+            if accumulated_0 is not None:
+                for key, buffer in accumulated_0.items():
+                    accumulated[key][...] = buffer
+
+            # Inner iteration, arguments bound once (see ice3_gt4py.utils.call_plan)
+            def build_inner_plan() -> CallPlan:
+                calls = []
+
+                ####### ice4_stepping_heat #############
+                state_stepping_heat = {
+                    key: state[key]
+                    for key in [
+                        "rv_t",
+                        "rc_t",
+                        "rr_t",
+                        "ri_t",
+                        "rs_t",
+                        "rg_t",
+                        "exn",
+                        "th_t",
+                        "ls_fact",
+                        "lv_fact",
+                        "t",
+                    ]
+                }
+
+                calls.append(bind(self.ice4_stepping_heat, state_stepping_heat))
+
+                ####### tendencies #######
+                state_ice4_tendencies = {
+                    **{
                         key: state[key]
                         for key in [
+                            "rhodref",
+                            "exn",
+                            "ls_fact",
+                            "lv_fact",
+                            "rv_t",
+                            "cf",
+                            "sigma_rc",
+                            "ci_t",
+                            "ai",
+                            "cj",
+                            "ssi",
+                            "t",
+                            "th_t",
                             "rv_t",
                             "rc_t",
                             "rr_t",
                             "ri_t",
                             "rs_t",
                             "rg_t",
+                            "hlc_hcf",
+                            "hlc_lcf",
+                            "hlc_hrc",
+                            "hlc_lrc",
+                            "hli_hcf",
+                            "hli_lcf",
+                            "hli_hri",
+                            "hli_lri",
+                            "fr",
+                        ]
+                    },
+                    **{"pres": state["pabs_t"]},
+                    **{
+                        "ldcompute": ldcompute,
+                        "ka": ka,
+                        "dv": dv,
+                        "theta_tnd": theta_a_tnd,
+                        "rv_tnd": rv_a_tnd,
+                        "rc_tnd": rc_a_tnd,
+                        "rr_tnd": rr_a_tnd,
+                        "ri_tnd": ri_a_tnd,
+                        "rs_tnd": rs_a_tnd,
+                        "rg_tnd": rg_a_tnd,
+                        "theta_increment": theta_b,
+                        "rv_increment": rv_b,
+                        "rc_increment": rc_b,
+                        "rr_increment": rr_b,
+                        "ri_increment": ri_b,
+                        "rs_increment": rs_b,
+                        "rg_increment": rg_b,
+                    },
+                    **rates,
+                }
+
+                calls.append(
+                    bind(
+                        self.ice4_tendencies.nested_call,
+                        {"state": state_ice4_tendencies},
+                        scalars=("ldsoft", "timestep"),
+                    )
+                )
+
+                # Translation note : l277 to l283 omitted, no external tendencies in AROME
+
+                if self.fused:
+                    # l290 to l404 in a single stencil
+                    state_step_update = {
+                        key: state[key]
+                        for key in [
                             "exn",
                             "th_t",
-                            "ls_fact",
-                            "lv_fact",
-                            "t",
+                            "rc_t",
+                            "rr_t",
+                            "ri_t",
+                            "rs_t",
+                            "rg_t",
+                            "ci_t",
+                            "ldmicro",
                         ]
                     }
 
-                    self.ice4_stepping_heat(**state_stepping_heat)
+                    tmps_step_update = {
+                        "theta_a_tnd": theta_a_tnd,
+                        "rc_a_tnd": rc_a_tnd,
+                        "rr_a_tnd": rr_a_tnd,
+                        "ri_a_tnd": ri_a_tnd,
+                        "rs_a_tnd": rs_a_tnd,
+                        "rg_a_tnd": rg_a_tnd,
+                        "theta_b": theta_b,
+                        "rc_b": rc_b,
+                        "rr_b": rr_b,
+                        "ri_b": ri_b,
+                        "rs_b": rs_b,
+                        "rg_b": rg_b,
+                        "rc_0r_t": rc_0r_t,
+                        "rr_0r_t": rr_0r_t,
+                        "ri_0r_t": ri_0r_t,
+                        "rs_0r_t": rs_0r_t,
+                        "rg_0r_t": rg_0r_t,
+                        "t_micro": t_micro,
+                        "ldcompute": ldcompute,
+                        "ldcompute_count": ldcompute_count,
+                    }
+
+                    calls.append(
+                        bind(
+                            self.ice4_step_update,
+                            state_step_update,
+                            tmps_step_update,
+                            scalars=("dt",),
+                        )
+                    )
 
-                    ####### tendencies #######
-                    state_ice4_tendencies = {
+                else:
+                    ######### ice4_step_limiter ############################
+                    state_step_limiter = {
                         **{
                             key: state[key]
                             for key in [
-                                "rhodref",
                                 "exn",
-                                "ls_fact",
-                                "lv_fact",
-                                "rv_t",
-                                "cf",
-                                "sigma_rc",
-                                "ci_t",
-                                "ai",
-                                "cj",
-                                "ssi",
-                                "t",
-                                "th_t",
-                                "rv_t",
                                 "rc_t",
                                 "rr_t",
                                 "ri_t",
                                 "rs_t",
                                 "rg_t",
-                                "hlc_hcf",
-                                "hlc_lcf",
-                                "hlc_hrc",
-                                "hlc_lrc",
-                                "hli_hcf",
-                                "hli_lcf",
-                                "hli_hri",
-                                "hli_lri",
-                                "fr",
                             ]
                         },
-                        **{"pres": state["pabs_t"]},
-                        **{
-                            "ldcompute": ldcompute,
-                            "theta_tnd": theta_a_tnd,
-                            "rv_tnd": rv_a_tnd,
-                            "rc_tnd": rc_a_tnd,
-                            "rr_tnd": rr_a_tnd,
-                            "ri_tnd": ri_a_tnd,
-                            "rs_tnd": rs_a_tnd,
-                            "rg_tnd": rg_a_tnd,
-                            "theta_increment": theta_b,
-                            "rv_increment": rv_b,
-                            "rc_increment": rc_b,
-                            "rr_increment": rr_b,
-                            "ri_increment": ri_b,
-                            "rs_increment": rs_b,
-                            "rg_increment": rg_b,
-                        },
-                    }
-
-                    self.ice4_tendencies.array_call(
-                        ldsoft=lsoft,
-                        state=state_ice4_tendencies,
-                        timestep=dt,
-                        out_diagnostics={},
-                        out_tendencies={},
-                        overwrite_tendencies={},
-                    )
-
-                    # Translation note : l277 to l283 omitted, no external tendencies in AROME
-
-                    ######### ice4_step_limiter ############################
-                    state_step_limiter = {
-                        key: state[key]
-                        for key in [
-                            "exn",
-                            "rc_t",
-                            "rr_t",
-                            "ri_t",
-                            "rs_t",
-                            "rg_t",
-                            "th_t",
-                        ]
+                        **{"theta_t": state["th_t"]},
                     }
 
                     tmps_step_limiter = {
@@ -312,9 +656,24 @@ class Ice4Stepping(ImplicitTendencyComponent):
                         "ri_b": ri_b,
                         "rs_b": rs_b,
                         "rg_b": rg_b,
+                        "theta_ext_tnd": theta_ext_tnd,
+                        "rc_ext_tnd": rc_ext_tnd,
+                        "rr_ext_tnd": rr_ext_tnd,
+                        "ri_ext_tnd": ri_ext_tnd,
+                        "rs_ext_tnd": rs_ext_tnd,
+                        "rg_ext_tnd": rg_ext_tnd,
+                        "t_soft": t_soft,
+                        "delta_t_soft": delta_t_soft,
                     }
 
-                    self.ice4_step_limiter(**state_step_limiter, **tmps_step_limiter)
+                    calls.append(
+                        bind(
+                            self.ice4_step_limiter,
+                            state_step_limiter,
+                            tmps_step_limiter,
+                            scalars=("dt",),
+                        )
+                    )
 
                     # l346 to l388
                     ############ ice4_mixing_ratio_step_limiter ############
@@ -325,13 +684,11 @@ class Ice4Stepping(ImplicitTendencyComponent):
 
                     temporaries_mixing_ratio_step_limiter = {
                         "ldcompute": ldcompute,
-                        "theta_a_tnd": theta_a_tnd,
-                        "rc_a_tnd": rc_a_tnd,
-                        "rr_a_tnd": rr_a_tnd,
-                        "ri_a_tnd": ri_a_tnd,
-                        "rs_a_tnd": rs_a_tnd,
-                        "rg_a_tnd": rg_a_tnd,
-                        "theta_b": theta_b,
+                        "rc_tnd_a": rc_a_tnd,
+                        "rr_tnd_a": rr_a_tnd,
+                        "ri_tnd_a": ri_a_tnd,
+                        "rs_tnd_a": rs_a_tnd,
+                        "rg_tnd_a": rg_a_tnd,
                         "rc_b": rc_b,
                         "rr_b": rr_b,
                         "ri_b": ri_b,
@@ -343,11 +700,15 @@ class Ice4Stepping(ImplicitTendencyComponent):
                         "rs_0r_t": rs_0r_t,
                         "rg_0r_t": rg_0r_t,
                         "delta_t_micro": delta_t_micro,
+                        "ldcompute_count": ldcompute_count,
                     }
 
-                    self.ice4_mixing_ratio_step_limiter(
-                        **state_mixing_ratio_step_limiter,
-                        **temporaries_mixing_ratio_step_limiter,
+                    calls.append(
+                        bind(
+                            self.ice4_mixing_ratio_step_limiter,
+                            state_mixing_ratio_step_limiter,
+                            temporaries_mixing_ratio_step_limiter,
+                        )
                     )
 
                     # l394 to l404
@@ -368,12 +729,12 @@ class Ice4Stepping(ImplicitTendencyComponent):
                     }
 
                     tmps_state_update = {
-                        "theta_a_tnd": theta_a_tnd,
-                        "rc_a_tnd": rc_a_tnd,
-                        "rr_a_tnd": rr_a_tnd,
-                        "ri_a_tnd": ri_a_tnd,
-                        "rs_a_tnd": rs_a_tnd,
-                        "rg_a_tnd": rg_a_tnd,
+                        "theta_tnd_a": theta_a_tnd,
+                        "rc_tnd_a": rc_a_tnd,
+                        "rr_tnd_a": rr_a_tnd,
+                        "ri_tnd_a": ri_a_tnd,
+                        "rs_tnd_a": rs_a_tnd,
+                        "rg_tnd_a": rg_a_tnd,
                         "theta_b": theta_b,
                         "rc_b": rc_b,
                         "rr_b": rr_b,
@@ -384,12 +745,117 @@ class Ice4Stepping(ImplicitTendencyComponent):
                         "t_micro": t_micro,
                     }
 
-                    self.ice4_state_update(**state_state_update, **tmps_state_update)
+                    calls.append(
+                        bind(
+                            self.ice4_state_update,
+                            state_state_update,
+                            tmps_state_update,
+                        )
+                    )
+
+                return CallPlan(tuple(calls))
+
+            inner_iteration = self.call_plan(
+                (*state.values(), *buffers), build_inner_plan
+            )
+
+            # l223 in f90
+            while outerloop_counter < max_outerloop_iterations:
+
+                # Translation note : LSOFT = .FALSE. at each outer iteration,
+                #                    rates are really computed on its first inner iteration
+                lsoft = False
+
+                # Translation note XTSTEP_TS == 0 is assumed implying no loops over t_soft
+                innerloop_counter = 0
+                max_innerloop_iterations = 10
 
-                    # TODO : next loop
+                # Translation note : l230 to l 237 in Fortran
+                self.ldcompute_init(
+                    ldcompute=ldcompute,
+                    t_micro=t_micro,
+                    ldcompute_count=ldcompute_count,
+                    dt=dt,
+                )
+
+                # Translation note : ANY(ZTIME < PTSTEP) read from ldcompute_count
+                n_active = self.active_points(ldcompute_count)
+                if n_active == 0:
+                    break
+
+                # Remaining outer iterations on the points left only
+                if (
+                    n_active < self.recompaction_threshold * ldcompute.size
+                    and pack_size(0, n_active, ldcompute.size) < ldcompute.size
+                ):
+                    self.recompact(
+                        state,
+                        t_micro,
+                        ldcompute,
+                        accumulated,
+                        dt,
+                        max_outerloop_iterations - outerloop_counter,
+                    )
+                    break
+
+                while innerloop_counter < max_innerloop_iterations:
+
+                    inner_iteration(ldsoft=lsoft, timestep=dt, dt=dt)
+
+                    # Next inner iterations reuse the rates, as LSOFT = .TRUE. in PHYEX
                     lsoft = True
                     innerloop_counter += 1
+                    self.stats.inner_iterations += 1
+
+                    # Translation note : ANY(LLCOMPUTE) read from ldcompute_count,
+                    #                    every convergence_check_interval iterations
+                    if (
+                        innerloop_counter % self.convergence_check_interval == 0
+                        and self.active_points(ldcompute_count) == 0
+                    ):
+                        break
+
                 outerloop_counter += 1
+                self.stats.outer_iterations += 1
+
+    @ported_method(
+        from_file="PHYEX/src/common/micro/mode_ice4_stepping.F90",
+        from_line=214,
+        to_line=452,
+    )
+    def array_call(
+        self,
+        state: NDArrayLikeDict,
+        timestep: timedelta,
+        out_tendencies: NDArrayLikeDict,
+        out_diagnostics: NDArrayLikeDict,
+        overwrite_tendencies: Dict[str, bool],
+    ):
+
+        with self.workspace.temporaries(
+            self.computational_grid,
+            *repeat(((I, J, K), "float"), 6),
+        ) as (
+            # tendances externes
+            theta_ext_tnd,
+            rc_ext_tnd,
+            rr_ext_tnd,
+            ri_ext_tnd,
+            rs_ext_tnd,
+            rg_ext_tnd,
+        ):
+            # Translation note : no external tendencies in AROME
+            for ext_tnd in [
+                theta_ext_tnd,
+                rc_ext_tnd,
+                rr_ext_tnd,
+                ri_ext_tnd,
+                rs_ext_tnd,
+                rg_ext_tnd,
+            ]:
+                ext_tnd[...] = 0
+
+            self.run_loops(state, timestep.total_seconds())
 
             # l440 to l452
             ################ external_tendencies_update ############
@@ -418,5 +884,7 @@ class Ice4Stepping(ImplicitTendencyComponent):
             }
 
             self.external_tendencies_update(
-                **state_external_tendencies_update, **tmps_external_tendencies_update
+                **state_external_tendencies_update,
+                **tmps_external_tendencies_update,
+                dt=timestep.total_seconds(),
             )
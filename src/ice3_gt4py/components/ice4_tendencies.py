@@ -6,27 +6,161 @@ from dataclasses import asdict
 from datetime import timedelta
 from functools import cached_property
 from itertools import repeat
-from typing import Dict
-from gt4py.storage import from_array
+from typing import Dict, List, Optional, Sequence
 import numpy as np
-from ice3_gt4py.phyex_common.xker_raccs import ker_raccs, ker_raccss, ker_saccrg
-from ice3_gt4py.phyex_common.xker_sdryg import ker_sdryg
-from ice3_gt4py.phyex_common.xker_rdryg import ker_rdryg
+from ice3_gt4py.components.base import Ice3Component
 
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
-from ifs_physics_common.framework.storage import managed_temporary_storage
 from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
 from ice3_gt4py.phyex_common.phyex import Phyex
-
-
-class Ice4Tendencies(ImplicitTendencyComponent):
+from ice3_gt4py.utils.call_plan import CallPlan, bind
+from ice3_gt4py.utils.table_registry import get_table_registry
+from ice3_gt4py.utils.liveness import (
+    AliasingPlan,
+    alias_temporaries,
+    call_accesses,
+)
+from ice3_gt4py.utils.workspace import Workspace
+
+# Process rates computed with ldsoft False and kept with ldsoft True,
+# owned by Ice4Stepping across its inner loop
+SOFT_RATES = (
+    "rc_honi_tnd",
+    "rv_deps_tnd",
+    "ri_aggs_tnd",
+    "ri_auts_tnd",
+    "rv_depg_tnd",
+    "rcautr",
+    "rcaccr",
+    "rrevav",
+    "rs_mltg_tnd",
+    "rc_mltsr_tnd",
+    "rs_rcrims_tnd",
+    "rs_rcrimss_tnd",
+    "rs_rsrimcg_tnd",
+    "rs_rraccs_tnd",
+    "rs_rraccss_tnd",
+    "rs_rsaccrg_tnd",
+    "rs_freez1_tnd",
+    "rs_freez2_tnd",
+    "rg_rcdry_tnd",
+    "rg_ridry_tnd",
+    "rg_rsdry_tnd",
+    "rg_rrdry_tnd",
+    "rg_riwet_tnd",
+    "rg_rswet_tnd",
+    "rg_freez1_tnd",
+    "rg_freez2_tnd",
+    "ricfrrg",
+    "rrcfrig",
+    "ricfrr",
+    "rgmltr",
+    "rc_beri_tnd",
+)
+
+# State fields of the fused stencil, besides SOFT_RATES
+FUSED_FIELDS = (
+    "ldcompute",
+    "pres",
+    "rhodref",
+    "exn",
+    "ls_fact",
+    "lv_fact",
+    "t",
+    "th_t",
+    "rv_t",
+    "rc_t",
+    "rr_t",
+    "ri_t",
+    "rs_t",
+    "rg_t",
+    "ci_t",
+    "cf",
+    "sigma_rc",
+    "ssi",
+    "ka",
+    "dv",
+    "ai",
+    "cj",
+    "hlc_hcf",
+    "hlc_lcf",
+    "hlc_hrc",
+    "hlc_lrc",
+    "hli_hcf",
+    "hli_lcf",
+    "hli_hri",
+    "hli_lri",
+    "fr",
+    "theta_tnd",
+    "rv_tnd",
+    "rc_tnd",
+    "rr_tnd",
+    "ri_tnd",
+    "rs_tnd",
+    "rg_tnd",
+    "theta_increment",
+    "rv_increment",
+    "rc_increment",
+    "rr_increment",
+    "ri_increment",
+    "rs_increment",
+    "rg_increment",
+)
+
+# Temporaries of array_call, (name, dtype)
+TEMPORARIES = (
+    ("rvheni_mr", "float"),
+    ("rrhong_mr", "float"),
+    ("rimltc_mr", "float"),
+    ("rgsi_mr", "float"),
+    ("rsrimcg_mr", "float"),
+    ("lbdar", "float"),
+    ("lbdar_rf", "float"),
+    ("lbdas", "float"),
+    ("lbdag", "float"),
+    ("rgsi", "float"),
+    ("rchoni", "float"),
+    ("rvdeps", "float"),
+    ("riaggs", "float"),
+    ("riauts", "float"),
+    ("rvdepg", "float"),
+    ("rcberi", "float"),
+    ("rsmltg", "float"),
+    ("rcmltsr", "float"),
+    ("rraccss", "float"),
+    ("rraccsg", "float"),
+    ("rsaccrg", "float"),
+    ("rcrimss", "float"),
+    ("rcrimsg", "float"),
+    ("rsrimcg", "float"),
+    ("rcwetg", "float"),
+    ("riwetg", "float"),
+    ("rrwetg", "float"),
+    ("rswetg", "float"),
+    ("rcdryg", "float"),
+    ("ridryg", "float"),
+    ("rrdryg", "float"),
+    ("rsdryg", "float"),
+    ("index_floor", "int"),
+    ("index_floor_r", "int"),
+    ("index_floor_s", "int"),
+    ("index_floor_g", "int"),
+)
+
+
+class Ice4Tendencies(Ice3Component):
     """Implicit Tendency Component calling
     ice_adjust : saturation adjustment of temperature and mixing ratios
 
     ice_adjust stencil is ice_adjust.F90 in PHYEX
+
+    Temporaries with disjoint lifetimes over the calls share a buffer
+    (see ice3_gt4py.utils.liveness), one buffer each with aliasing=False.
+
+    With fused=True, the stencil chain runs as a single stencil
+    (ice4_tendencies_fused), intermediates being stencil temporaries.
     """
 
     def __init__(
@@ -36,22 +170,60 @@ class Ice4Tendencies(ImplicitTendencyComponent):
         phyex: Phyex,
         *,
         enable_checks: bool = True,
+        workspace: Optional[Workspace] = None,
+        aliasing: bool = True,
+        fused: bool = False,
+        call_plans: bool = True,
     ) -> None:
         super().__init__(
-            computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config
+            computational_grid,
+            enable_checks=enable_checks,
+            gt4py_config=gt4py_config,
+            workspace=workspace,
+            call_plans=call_plans,
         )
 
+        self.aliasing = aliasing
+        self.fused = fused
         externals = phyex.to_externals()
 
-        self.gaminc_rim1 = phyex.rain_ice_param.GAMINC_RIM1
-        self.gaminc_rim2 = phyex.rain_ice_param.GAMINC_RIM2
-        self.gaminc_rim4 = phyex.rain_ice_param.GAMINC_RIM4
+        # Lookup tables, uploaded once per backend
+        tables = get_table_registry()
+        backend = self.gt4py_config.backend
+        dtype = self.gt4py_config.dtypes.float
+        rain_ice_param = phyex.rain_ice_param
+
+        self.gaminc_rim1 = tables.get(
+            "gaminc_rim1", rain_ice_param.GAMINC_RIM1, backend, dtype
+        )
+        self.gaminc_rim2 = tables.get(
+            "gaminc_rim2", rain_ice_param.GAMINC_RIM2, backend, dtype
+        )
+        self.gaminc_rim4 = tables.get(
+            "gaminc_rim4", rain_ice_param.GAMINC_RIM4, backend, dtype
+        )
+
+        self.ker_raccs = tables.get(
+            "ker_raccs", rain_ice_param.ker_raccs, backend, dtype
+        )
+        self.ker_raccss = tables.get(
+            "ker_raccss", rain_ice_param.ker_raccss, backend, dtype
+        )
+        self.ker_saccrg = tables.get(
+            "ker_saccrg", rain_ice_param.ker_saccrg, backend, dtype
+        )
+        self.ker_sdryg = tables.get(
+            "ker_sdryg", rain_ice_param.ker_sdryg, backend, dtype
+        )
+        self.ker_rdryg = tables.get(
+            "ker_rdryg", rain_ice_param.ker_rdryg, backend, dtype
+        )
 
-        self.ker_raccs = phyex.rain_ice_param.ker_raccs
-        self.ker_raccss = phyex.rain_ice_param.ker_raccss
-        self.ker_saccrg = phyex.rain_ice_param.ker_saccrg
-        self.ker_sdryg = phyex.rain_ice_param.ker_sdryg
-        self.ker_rdryg = phyex.rain_ice_param.ker_rdryg
+        if self.fused:
+            self.ice4_tendencies_fused = self.compile_stencil(
+                "ice4_tendencies_fused", externals
+            )
+            return
 
         # Tendencies
         self.ice4_nucleation = self.compile_stencil("ice4_nucleation", externals)
@@ -115,6 +287,8 @@ class Ice4Tendencies(ImplicitTendencyComponent):
             "ai": {"grid": (I, J, K), "units": ""},
             "cj": {"grid": (I, J, K), "units": ""},
             "ssi": {"grid": (I, J, K), "units": ""},
+            "ka": {"grid": (I, J, K), "units": ""},
+            "dv": {"grid": (I, J, K), "units": ""},
             "t": {"grid": (I, J, K), "units": ""},
             "th_t": {"grid": (I, J, K), "units": ""},
             # PVART in f90
@@ -150,6 +324,8 @@ class Ice4Tendencies(ImplicitTendencyComponent):
             "hli_hri": {"grid": (I, J, K), "units": ""},
             "hli_lri": {"grid": (I, J, K), "units": ""},
             "fr": {"grid": (I, J, K), "units": ""},
+            # process rates kept with ldsoft
+            **{name: {"grid": (I, J, K), "units": ""} for name in SOFT_RATES},
         }
 
     @cached_property
@@ -164,6 +340,81 @@ class Ice4Tendencies(ImplicitTendencyComponent):
     def _temporaries(self) -> PropertyDict:
         return {}
 
+    @cached_property
+    def aliasing_plan(self) -> AliasingPlan:
+        """Buffers of the temporaries, shared between temporaries with disjoint lifetimes
+
+        The stencil chain is bound once to placeholders, on first call : the
+        temporaries of each call are found in its arguments, and their accesses
+        are read from the compiled stencils. Temporaries read before being
+        written are found the same way with aliasing=False.
+        """
+        placeholders = [object() for _ in TEMPORARIES]
+        names = {
+            id(placeholder): name
+            for placeholder, (name, _) in zip(placeholders, TEMPORARIES)
+        }
+        state = {key: object() for key in self._input_properties}
+        calls = [
+            call_accesses(call, names)
+            for call in self.build_plan(state, placeholders).calls
+        ]
+        plan = alias_temporaries(TEMPORARIES, calls, share=self.aliasing)
+        logging.info(f"Ice4Tendencies : {plan}")
+        return plan
+
+    def fused_call(self, ldsoft: bool, state: NDArrayLikeDict) -> None:
+        """Single launch of the stencil chain
+
+        Args:
+            ldsoft (bool): keep the process rates computed at the previous call
+            state (NDArrayLikeDict): fields of the component
+        """
+        with self.workspace.temporaries(
+            self.computational_grid, *repeat(((I, J, K), "int"), 4)
+        ) as buffers:
+            plan = self.call_plan(
+                (*state.values(), *buffers),
+                lambda: self.build_fused_plan(state, buffers),
+            )
+            plan(ldsoft=ldsoft)
+
+    def build_fused_plan(self, state: NDArrayLikeDict, buffers: List) -> CallPlan:
+        """Fused stencil with its arguments bound to state and buffers
+
+        Args:
+            state (NDArrayLikeDict): fields of the component
+            buffers (List): index_floor, index_floor_r, index_floor_s, index_floor_g
+
+        Returns:
+            CallPlan: single call, replayed with ldsoft
+        """
+        index_floor, index_floor_r, index_floor_s, index_floor_g = buffers
+        return CallPlan(
+            (
+                bind(
+                    self.ice4_tendencies_fused,
+                    {key: state[key] for key in FUSED_FIELDS},
+                    {name: state[name] for name in SOFT_RATES},
+                    {
+                        "gaminc_rim1": self.gaminc_rim1,
+                        "gaminc_rim2": self.gaminc_rim2,
+                        "gaminc_rim4": self.gaminc_rim4,
+                        "ker_raccs": self.ker_raccs,
+                        "ker_raccss": self.ker_raccss,
+                        "ker_saccrg": self.ker_saccrg,
+                        "ker_sdryg": self.ker_sdryg,
+                        "ker_rdryg": self.ker_rdryg,
+                        "index_floor": index_floor,
+                        "index_floor_r": index_floor_r,
+                        "index_floor_s": index_floor_s,
+                        "index_floor_g": index_floor_g,
+                    },
+                    scalars=("ldsoft",),
+                ),
+            )
+        )
+
     def array_call(
         self,
         ldsoft: bool,
@@ -173,12 +424,38 @@ class Ice4Tendencies(ImplicitTendencyComponent):
         out_diagnostics: NDArrayLikeDict,
         overwrite_tendencies: Dict[str, bool],
     ) -> None:
-        with managed_temporary_storage(
+        if self.fused:
+            self.fused_call(ldsoft, state)
+            return
+
+        # Pinned slots are zero-filled at each call, the others written first
+        with self.workspace.temporaries(
             self.computational_grid,
-            *repeat(((I, J, K), "float"), 63),
-            *repeat(((I, J, K), "int"), 4),
-            gt4py_config=self.gt4py_config,
-        ) as (
+            *(((I, J, K), dtype) for dtype in self.aliasing_plan.dtypes),
+            written=self.aliasing_plan.written(),
+        ) as buffers:
+            plan = self.call_plan(
+                (*state.values(), *buffers),
+                lambda: self.build_plan(
+                    state,
+                    self.aliasing_plan.assign(
+                        [name for name, _ in TEMPORARIES], buffers
+                    ),
+                ),
+            )
+            plan(ldsoft=ldsoft)
+
+    def build_plan(self, state: NDArrayLikeDict, temporaries: Sequence) -> CallPlan:
+        """Calls of the stencil chain, arguments bound to state and temporaries
+
+        Args:
+            state (NDArrayLikeDict): fields of the component
+            temporaries (Sequence): buffer of each temporary, in the order of TEMPORARIES
+
+        Returns:
+            CallPlan: calls in order, replayed with ldsoft
+        """
+        (
             # mr
             rvheni_mr,
             rrhong_mr,
@@ -190,41 +467,12 @@ class Ice4Tendencies(ImplicitTendencyComponent):
             lbdar_rf,
             lbdas,
             lbdag,
-            # tnd
-            rc_honi_tnd,
-            rv_deps_tnd,
-            ri_aggs_tnd,
-            ri_auts_tnd,
-            rv_depg_tnd,
-            rs_mltg_tnd,
-            rc_mltsr_tnd,
-            rs_rcrims_tnd,
-            rs_rcrimss_tnd,
-            rs_rsrimcg_tnd,
-            rs_rraccs_tnd,
-            rs_rraccss_tnd,
-            rs_rsaccrg_tnd,
-            rs_freez1_tnd,
-            rs_freez2_tnd,
-            rg_rcdry_tnd,
-            rg_ridry_tnd,
-            rg_rsdry_tnd,
-            rg_rrdry_tnd,
-            rg_riwet_tnd,
-            rg_rswet_tnd,
-            rg_freez1_tnd,
-            rg_freez2_tnd,
-            rc_beri_tnd,
-            # transfos
             rgsi,
             rchoni,
             rvdeps,
             riaggs,
             riauts,
             rvdepg,
-            rcautr,
-            rcaccr,
-            rrevav,
             rcberi,
             rsmltg,
             rcmltsr,
@@ -234,9 +482,6 @@ class Ice4Tendencies(ImplicitTendencyComponent):
             rcrimss,  # 16
             rcrimsg,  # 17
             rsrimcg,  # 18
-            ricfrrg,  # 19
-            rrcfrig,  # 20
-            ricfrr,  # 21
             rcwetg,  # 22
             riwetg,  # 23
             rrwetg,  # 24
@@ -245,166 +490,216 @@ class Ice4Tendencies(ImplicitTendencyComponent):
             ridryg,  # 27
             rrdryg,  # 28
             rsdryg,  # 29
-            rgmltr,  # 31
             index_floor,
             index_floor_r,
             index_floor_s,
             index_floor_g,
-        ):
-
-            ############## ice4_nucleation ################
-            state_nucleation = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "ldcompute",
-                        "th_t",
-                        "rhodref",
-                        "exn",
-                        "ls_fact",
-                        "t",
-                        "rv_t",
-                        "ci_t",
-                        "ssi",
-                    ]
-                },
-                **{"pabs_t": state["pres"]},
-            }
-
-            temporaries_nucleation = {
-                "rvheni_mr": rvheni_mr,
-            }
-
-            # timestep
-            self.ice4_nucleation(**state_nucleation, **temporaries_nucleation)
-
-            ############## ice4_nucleation_post_processing ####################
-
-            state_nucleation_pp = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "t",
-                        "exn",
-                        "ls_fact",
-                        "lv_fact",
-                        "th_t",
-                        "rv_t",
-                        "ri_t",
-                    ]
-                },
-            }
+        ) = temporaries
+
+        # Process rates, kept across calls of the inner loop of Ice4Stepping
+        (
+            rc_honi_tnd,
+            rv_deps_tnd,
+            ri_aggs_tnd,
+            ri_auts_tnd,
+            rv_depg_tnd,
+            rcautr,
+            rcaccr,
+            rrevav,
+            rs_mltg_tnd,
+            rc_mltsr_tnd,
+            rs_rcrims_tnd,
+            rs_rcrimss_tnd,
+            rs_rsrimcg_tnd,
+            rs_rraccs_tnd,
+            rs_rraccss_tnd,
+            rs_rsaccrg_tnd,
+            rs_freez1_tnd,
+            rs_freez2_tnd,
+            rg_rcdry_tnd,
+            rg_ridry_tnd,
+            rg_rsdry_tnd,
+            rg_rrdry_tnd,
+            rg_riwet_tnd,
+            rg_rswet_tnd,
+            rg_freez1_tnd,
+            rg_freez2_tnd,
+            ricfrrg,
+            rrcfrig,
+            ricfrr,
+            rgmltr,
+            rc_beri_tnd,
+        ) = (state[name] for name in SOFT_RATES)
+
+        calls = []
+
+        ############## ice4_nucleation ################
+        state_nucleation = {
+            **{
+                key: state[key]
+                for key in [
+                    "ldcompute",
+                    "th_t",
+                    "rhodref",
+                    "exn",
+                    "ls_fact",
+                    "t",
+                    "rv_t",
+                    "ci_t",
+                    "ssi",
+                ]
+            },
+            **{"pabs_t": state["pres"]},
+        }
 
-            tmps_nucleation_pp = {"rvheni_mr": rvheni_mr}
+        temporaries_nucleation = {
+            "rvheni_mr": rvheni_mr,
+        }
 
-            # Timestep
-            self.ice4_nucleation_post_processing(
-                **state_nucleation_pp, **tmps_nucleation_pp
+        # timestep
+        calls.append(
+            bind(self.ice4_nucleation, state_nucleation, temporaries_nucleation)
+        )
+
+        ############## ice4_nucleation_post_processing ####################
+
+        state_nucleation_pp = {
+            **{
+                key: state[key]
+                for key in [
+                    "t",
+                    "exn",
+                    "ls_fact",
+                    "lv_fact",
+                    "th_t",
+                    "rv_t",
+                    "ri_t",
+                ]
+            },
+        }
+
+        tmps_nucleation_pp = {"rvheni_mr": rvheni_mr}
+
+        # Timestep
+        calls.append(
+            bind(
+                self.ice4_nucleation_post_processing,
+                state_nucleation_pp,
+                tmps_nucleation_pp,
             )
+        )
 
-            ########################### ice4_rrhong #################################
-            state_rrhong = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in ["t", "exn", "lv_fact", "ls_fact", "th_t", "rr_t"]
-                },
-            }
-
-            tmps_rrhong = {"rrhong_mr": rrhong_mr}
-
-            self.ice4_rrhong(**state_rrhong, **rrhong_mr)
-
-            ########################### ice4_rrhong_post_processing #################
-            state_rrhong_pp = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "t",
-                        "exn",
-                        "lv_fact",
-                        "ls_fact",
-                        "th_t",
-                        "rg_t",
-                        "rr_t",
-                    ]
-                },
-            }
-
-            self.ice4_rrhong_post_processing(**state_rrhong_pp, **tmps_rrhong)
-
-            ########################## ice4_rimltc ##################################
-            state_rimltc = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "t",
-                        "exn",
-                        "lv_fact",
-                        "ls_fact",
-                        "th_t",
-                        "ri_t",
-                    ]
-                },
-            }
-
-            tmps_rimltc = {"rimltc_mr": rimltc_mr}
-
-            self.ice4_rimltc(**state_rimltc, **tmps_rimltc)
-
-            ####################### ice4_rimltc_post_processing #####################
-
-            state_rimltc_pp = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "t",
-                        "exn",
-                        "lv_fact",
-                        "ls_fact",
-                        "th_t",
-                        "rc_t",
-                        "ri_t",
-                    ]
-                },
-            }
-
-            self.ice4_rimltc_post_processing(**state_rimltc_pp, **tmps_rimltc)
-
-            ######################## ice4_increment_update ##########################
-            state_increment_update = {
-                **{key: state[key] for key in ["ls_fact", "lv_fact"]},
-                **{
-                    key: state[key]
-                    for key in [
-                        "theta_increment",
-                        "rv_increment",
-                        "rc_increment",
-                        "rr_increment",
-                        "ri_increment",
-                        "rs_increment",
-                        "rg_increment",
-                    ]
-                },  # PB in F90
-            }
-
-            tmps_increment_update = {
-                "rvheni_mr": rvheni_mr,
-                "rimltc_mr": rimltc_mr,
-                "rrhong_mr": rrhong_mr,
-                "rsrimcg_mr": rsrimcg_mr,
-            }
-
-            self.ice4_increment_update(
-                **state_increment_update, **tmps_increment_update
+        ########################### ice4_rrhong #################################
+        state_rrhong = {
+            "ldcompute": state["ldcompute"],
+            "tht": state["th_t"],
+            **{key: state[key] for key in ["t", "exn", "lv_fact", "ls_fact", "rr_t"]},
+        }
+
+        tmps_rrhong = {"rrhong_mr": rrhong_mr}
+
+        calls.append(bind(self.ice4_rrhong, state_rrhong, tmps_rrhong))
+
+        ########################### ice4_rrhong_post_processing #################
+        state_rrhong_pp = {
+            "tht": state["th_t"],
+            **{
+                key: state[key]
+                for key in [
+                    "t",
+                    "exn",
+                    "lv_fact",
+                    "ls_fact",
+                    "rg_t",
+                    "rr_t",
+                ]
+            },
+        }
+
+        calls.append(
+            bind(self.ice4_rrhong_post_processing, state_rrhong_pp, tmps_rrhong)
+        )
+
+        ########################## ice4_rimltc ##################################
+        state_rimltc = {
+            "ldcompute": state["ldcompute"],
+            "tht": state["th_t"],
+            **{
+                key: state[key]
+                for key in [
+                    "t",
+                    "exn",
+                    "lv_fact",
+                    "ls_fact",
+                    "ri_t",
+                ]
+            },
+        }
+
+        tmps_rimltc = {"rimltc_mr": rimltc_mr}
+
+        calls.append(bind(self.ice4_rimltc, state_rimltc, tmps_rimltc))
+
+        ####################### ice4_rimltc_post_processing #####################
+
+        state_rimltc_pp = {
+            "tht": state["th_t"],
+            **{
+                key: state[key]
+                for key in [
+                    "t",
+                    "exn",
+                    "lv_fact",
+                    "ls_fact",
+                    "rc_t",
+                    "ri_t",
+                ]
+            },
+        }
+
+        calls.append(
+            bind(self.ice4_rimltc_post_processing, state_rimltc_pp, tmps_rimltc)
+        )
+
+        ######################## ice4_increment_update ##########################
+        state_increment_update = {
+            **{key: state[key] for key in ["ls_fact", "lv_fact"]},
+            **{
+                key: state[key]
+                for key in [
+                    "theta_increment",
+                    "rv_increment",
+                    "rc_increment",
+                    "rr_increment",
+                    "ri_increment",
+                    "rs_increment",
+                    "rg_increment",
+                ]
+            },  # PB in F90
+        }
+
+        tmps_increment_update = {
+            "rvheni_mr": rvheni_mr,
+            "rimltc_mr": rimltc_mr,
+            "rrhong_mr": rrhong_mr,
+            "rsrimcg_mr": rsrimcg_mr,
+        }
+
+        calls.append(
+            bind(
+                self.ice4_increment_update,
+                state_increment_update,
+                tmps_increment_update,
             )
+        )
 
-            ######################## ice4_compute_pdf ###############################
-            state_compute_pdf = {
+        ######################## ice4_compute_pdf ###############################
+        state_compute_pdf = {
+            "ldmicro": state["ldcompute"],
+            "rf": state["fr"],
+            **{
                 key: state[key]
                 for key in [
-                    "ldcompute",
                     "rhodref",
                     "rc_t",
                     "ri_t",
@@ -419,350 +714,339 @@ class Ice4Tendencies(ImplicitTendencyComponent):
                     "hli_lcf",
                     "hli_hri",
                     "hli_lri",
-                    "fr",
                 ]
-            }
+            },
+        }
 
-            self.ice4_compute_pdf(**state_compute_pdf)
+        calls.append(bind(self.ice4_compute_pdf, state_compute_pdf))
+
+        # l263 to l278 omitted because LLRFR is False in AROME
+
+        ######################## ice4_derived_fields ############################
+        state_derived_fields = {
+            key: state[key]
+            for key in [
+                "t",
+                "rhodref",
+                "rv_t",
+                "pres",
+                "ssi",
+                "ka",
+                "dv",
+                "ai",
+                "cj",
+            ]
+        }
+
+        calls.append(bind(self.ice4_derived_fields, state_derived_fields))
 
-            # l263 to l278 omitted because LLRFR is False in AROME
+        ######################## ice4_slope_parameters ##########################
+        state_slope_parameters = {
+            **{key: state[key] for key in ["rhodref", "t", "rr_t", "rs_t", "rg_t"]},
+        }
 
-            ######################## ice4_derived_fields ############################
-            state_derived_fields = {
+        tmps_slopes = {
+            "lbdar": lbdar,
+            "lbdar_rf": lbdar_rf,
+            "lbdas": lbdas,
+            "lbdag": lbdag,
+        }
+
+        calls.append(
+            bind(self.ice4_slope_parameters, state_slope_parameters, tmps_slopes)
+        )
+
+        ######################## ice4_slow ######################################
+        state_slow = {
+            "ldcompute": state["ldcompute"],
+            **{
                 key: state[key]
                 for key in [
+                    "rhodref",
                     "t",
+                    "ssi",
+                    "lv_fact",
+                    "ls_fact",
+                    "rv_t",
+                    "rc_t",
+                    "ri_t",
+                    "rs_t",
+                    "rg_t",
+                    "ai",
+                    "cj",
+                    "hli_hcf",
+                    "hli_hri",
+                ]
+            },
+        }
+
+        tmps_slow = {
+            "lbdas": lbdas,
+            "lbdag": lbdag,
+            "rc_honi_tnd": rc_honi_tnd,
+            "rv_deps_tnd": rv_deps_tnd,
+            "ri_aggs_tnd": ri_aggs_tnd,
+            "ri_auts_tnd": ri_auts_tnd,
+            "rv_depg_tnd": rv_depg_tnd,
+        }
+
+        calls.append(bind(self.ice4_slow, state_slow, tmps_slow, scalars=("ldsoft",)))
+
+        ######################## ice4_warm ######################################
+        state_warm = {
+            "ldcompute": state["ldcompute"],
+            **{
+                key: state[key]
+                for key in [
+                    "rhodref",
+                    "lv_fact",
+                    "t",  # temperature
+                    "pres",
+                    "ka",  # thermal conductivity of the air
+                    "dv",  # diffusivity of water vapour
+                    "cj",  # function to compute the ventilation coefficient
+                    "hlc_hcf",  # High Cloud Fraction in grid
+                    "hlc_lcf",  # Low Cloud Fraction in grid
+                    "hlc_hrc",  # LWC that is high in grid
+                    "hlc_lrc",  # LWC that is low in grid
+                    "rv_t",  # water vapour mixing ratio at t
+                    "rc_t",  # cloud water mixing ratio at t
+                    "rr_t",  # rain water mixing ratio at t
+                    "cf",
+                ]
+            },
+            "tht": state["th_t"],
+            # Translation note : precipitation fraction, fr of ice4_compute_pdf
+            "rf": state["fr"],
+        }
+
+        tmps_warm = {
+            "lbdar": lbdar,
+            "lbdar_rf": lbdar_rf,
+            "rcautr": rcautr,
+            "rcaccr": rcaccr,
+            "rrevav": rrevav,
+        }
+
+        calls.append(bind(self.ice4_warm, state_warm, tmps_warm, scalars=("ldsoft",)))
+
+        ######################## ice4_fast_rs ###################################
+        state_fast_rs = {
+            "ldcompute": state["ldcompute"],
+            **{
+                key: state[key]
+                for key in [
                     "rhodref",
+                    "lv_fact",
+                    "ls_fact",
+                    "pres",  # absolute pressure at t
+                    "dv",  # diffusivity of water vapor in the air
+                    "ka",  # thermal conductivity of the air
+                    "cj",  # function to compute the ventilation coefficient
+                    "t",
                     "rv_t",
+                    "rc_t",
+                    "rr_t",
+                    "rs_t",
+                ]
+            },
+        }
+
+        temporaries_fast_rs = {
+            "lbdar": lbdar,
+            "lbdas": lbdas,
+            "rs_mltg_tnd": rs_mltg_tnd,
+            "rc_mltsr_tnd": rc_mltsr_tnd,
+            "rs_rcrims_tnd": rs_rcrims_tnd,  # extra dimension 8 in Fortran PRS_TEND
+            "rs_rcrimss_tnd": rs_rcrimss_tnd,
+            "rs_rsrimcg_tnd": rs_rsrimcg_tnd,
+            "rs_rraccs_tnd": rs_rraccs_tnd,
+            "rs_rraccss_tnd": rs_rraccss_tnd,
+            "rs_rsaccrg_tnd": rs_rsaccrg_tnd,
+            "rs_freez1_tnd": rs_freez1_tnd,
+            "rs_freez2_tnd": rs_freez2_tnd,
+            "riaggs": riaggs,
+            "rcrimss": rcrimss,
+            "rcrimsg": rcrimsg,
+            "rsrimcg": rsrimcg,
+            "rraccss": rraccss,
+            "rraccsg": rraccsg,
+            "rsaccrg": rsaccrg,
+            "index_floor": index_floor,
+            "index_floor_r": index_floor_r,
+            "index_floor_s": index_floor_s,
+        }
+
+        calls.append(
+            bind(
+                self.ice4_fast_rs,
+                {
+                    "gaminc_rim1": self.gaminc_rim1,
+                    "gaminc_rim2": self.gaminc_rim2,
+                    "gaminc_rim4": self.gaminc_rim4,
+                    "ker_raccs": self.ker_raccs,
+                    "ker_raccss": self.ker_raccss,
+                    "ker_saccrg": self.ker_saccrg,
+                },
+                state_fast_rs,
+                temporaries_fast_rs,
+                scalars=("ldsoft",),
+            )
+        )
+
+        ######################## ice4_fast_rg_pre_processing ####################
+        tmps_fast_rg_pp = {
+            "rgsi": rgsi,
+            "rvdepg": rvdepg,
+            "rsmltg": rsmltg,
+            "rraccsg": rraccsg,
+            "rsaccrg": rsaccrg,
+            "rcrimsg": rcrimsg,
+            "rsrimcg": rsrimcg,
+            "rgsi_mr": rgsi_mr,
+            "rrhong_mr": rrhong_mr,
+            "rsrimcg_mr": rsrimcg_mr,
+        }
+
+        calls.append(bind(self.ice4_fast_rg_pre_processing, tmps_fast_rg_pp))
+
+        ######################## ice4_fast_rg ###################################
+        state_fast_rg = {
+            "ldcompute": state["ldcompute"],
+            **{
+                key: state[key]
+                for key in [
+                    "t",
+                    "rhodref",
                     "pres",
-                    "ssi",
+                    "rv_t",
+                    "rr_t",
+                    "ri_t",
+                    "rg_t",
+                    "rc_t",
+                    "rs_t",
+                    "ci_t",
                     "ka",
                     "dv",
-                    "ai",
                     "cj",
                 ]
-            }
-
-            self.ice4_derived_fields(**state_derived_fields)
-
-            ######################## ice4_slope_parameters ##########################
-            state_slope_parameters = {
-                **{key: state[key] for key in ["rhodref", "t", "rr_t", "rs_t", "rg_t"]},
-            }
-
-            tmps_slopes = {
-                "lbdar": lbdar,
-                "lbdar_rf": lbdar_rf,
-                "lbdas": lbdas,
-                "lbdag": lbdag,
-            }
-
-            self.ice4_slope_parameters(**state_slope_parameters, **tmps_slopes)
-
-            ######################## ice4_slow ######################################
-            state_slow = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "rhodref",
-                        "t",
-                        "ssi",
-                        "lv_fact",
-                        "ls_fact",
-                        "rv_t",
-                        "rc_t",
-                        "ri_t",
-                        "rs_t",
-                        "rg_t",
-                        "ai",
-                        "cj",
-                        "hli_hcf",
-                        "hli_hri",
-                    ]
-                },
-            }
-
-            tmps_slow = {
-                "lbdas": lbdas,
-                "lbdag": lbdag,
-                "rc_honi_tnd": rc_honi_tnd,
-                "rv_deps_tnd": rv_deps_tnd,
-                "ri_aggs_tnd": ri_aggs_tnd,
-                "ri_auts_tnd": ri_auts_tnd,
-                "rv_depg_tnd": rv_depg_tnd,
-            }
-
-            self.ice4_slow(ldsoft=ldsoft, **state_slow, **tmps_slow)
-
-            ######################## ice4_warm ######################################
-            state_warm = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "rhodref",
-                        "lv_fact",
-                        "t",  # temperature
-                        "th_t",
-                        "pres",
-                        "ka",  # thermal conductivity of the air
-                        "dv",  # diffusivity of water vapour
-                        "cj",  # function to compute the ventilation coefficient
-                        "hlc_hcf",  # High Cloud Fraction in grid
-                        "hlc_lcf",  # Low Cloud Fraction in grid
-                        "hlc_hrc",  # LWC that is high in grid
-                        "hlc_lrc",  # LWC that is low in grid
-                        "rv_t",  # water vapour mixing ratio at t
-                        "rc_t",  # cloud water mixing ratio at t
-                        "rr_t",  # rain water mixing ratio at t
-                        "cf",
-                        "rf",
-                    ]
-                },
-            }
-
-            tmps_warm = {
-                "lbdar": lbdar,
-                "lbdar_rf": lbdar_rf,
-                "rcautr": rcautr,
-                "rcaccr": rcaccr,
-                "rrevav": rrevav,
-            }
-
-            self.ice4_warm(ldsoft=ldsoft, **state_warm, **tmps_warm)
-
-            ######################## ice4_fast_rs ###################################
-            state_fast_rs = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "rhodref",
-                        "lv_fact",
-                        "ls_fact",
-                        "pres",  # absolute pressure at t
-                        "dv",  # diffusivity of water vapor in the air
-                        "ka",  # thermal conductivity of the air
-                        "cj",  # function to compute the ventilation coefficient
-                        "t",
-                        "rv_t",
-                        "rc_t",
-                        "rr_t",
-                        "rs_t",
-                    ]
-                },
-            }
-
-            temporaries_fast_rs = {
-                "lbdar": lbdar,
-                "lbdar_rf": lbdar_rf,
-                "rs_mltg_tnd": rs_mltg_tnd,
-                "rc_mltsr_tnd": rc_mltsr_tnd,
-                "rs_rcrims_tnd": rs_rcrims_tnd,  # extra dimension 8 in Fortran PRS_TEND
-                "rs_rcrimss_tnd": rs_rcrimss_tnd,
-                "rs_rsrimcg_tnd": rs_rsrimcg_tnd,
-                "rs_rraccs_tnd": rs_rraccs_tnd,
-                "rs_rraccss_tnd": rs_rraccss_tnd,
-                "rs_rsaccrg_tnd": rs_rsaccrg_tnd,
-                "rs_freez1_tnd": rs_freez1_tnd,
-                "rs_freez2_tnd": rs_freez2_tnd,
-                "riaggs": riaggs,
-                "rcrimss": rcrimss,
-                "rcrimsg": rcrimsg,
-                "rsrimcg": rsrimcg,
-                "rraccss": rraccss,
-                "rraccsg": rraccsg,
-                "rsaccrg": rsaccrg,
-                "index_floor": index_floor,
-                "index_floor_r": index_floor_r,
-                "index_floor_s": index_floor_s,
-            }
-
-            gaminc_rim1 = from_array(
-                self.gaminc_rim1, backend=self.gt4py_config.backend
-            )
-            gaminc_rim2 = from_array(
-                self.gaminc_rim2, backend=self.gt4py_config.backend
-            )
-            gaminc_rim4 = from_array(
-                self.gaminc_rim4, backend=self.gt4py_config.backend
-            )
+            },
+        }
 
-            ker_raccs = from_array(self.ker_raccs, backend=self.gt4py_config.backend)
-            ker_raccss = from_array(
-                self.ker_raccss, backend=self.gt4py_config.backendEND
-            )
-            ker_saccrg = from_array(self.ker_saccrg, backend=self.gt4py_config.backend)
-
-            self.ice4_fast_rs(
-                ldsoft=ldsoft,
-                gaminc_rim1=gaminc_rim1,
-                gaminc_rim2=gaminc_rim2,
-                gaminc_rim4=gaminc_rim4,
-                ker_raccs=ker_raccs,
-                ker_raccss=ker_raccss,
-                ker_saccrg=ker_saccrg,
-                **state_fast_rs,
-                **temporaries_fast_rs,
-            )
+        temporaries_fast_rg = {
+            "lbdar": lbdar,
+            "lbdas": lbdas,
+            "lbdag": lbdag,
+            "rg_rcdry_tnd": rg_rcdry_tnd,
+            "rg_ridry_tnd": rg_ridry_tnd,
+            "rg_rsdry_tnd": rg_rsdry_tnd,
+            "rg_rrdry_tnd": rg_rrdry_tnd,
+            "rg_riwet_tnd": rg_riwet_tnd,
+            "rg_rswet_tnd": rg_rswet_tnd,
+            "rg_freez1_tnd": rg_freez1_tnd,
+            "rg_freez2_tnd": rg_freez2_tnd,
+            "ricfrrg": ricfrrg,
+            "rrcfrig": rrcfrig,
+            "ricfrr": ricfrr,
+            "rgmltr": rgmltr,
+            "index_floor_s": index_floor_s,
+            "index_floor_g": index_floor_g,
+            "index_floor_r": index_floor_r,
+        }
 
-            ######################## ice4_fast_rg_pre_processing ####################
-            state_fast_rg_pp = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "rgsi",
-                        "rvdepg",
-                        "rsmltg",
-                        "rraccsg",
-                        "rsaccrg",
-                        "rcrimsg",
-                        "rsrimcg",
-                    ]
-                },
-            }
-
-            tmps_fast_rg_pp = {
-                "rgsi_mr": rgsi_mr,
-                "rrhong_mr": rrhong_mr,
-                "rsrimcg_mr": rsrimcg_mr,
-            }
-
-            self.ice4_fast_rg_pre_processing(**state_fast_rg_pp, **tmps_fast_rg_pp)
-
-            ######################## ice4_fast_rg ###################################
-            state_fast_rg = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "t",
-                        "rhodref",
-                        "pres",
-                        "rv_t",
-                        "rr_t",
-                        "ri_t",
-                        "rg_t",
-                        "rc_t",
-                        "rs_t",
-                        "ci_t",
-                        "ka",
-                        "dv",
-                        "cj",
-                    ]
-                },
-            }
-
-            temporaries_fast_rg = {
-                "lbdar": lbdar,
-                "lbdas": lbdas,
-                "lbdag": lbdag,
-                "rg_rcdry_tnd": rg_rcdry_tnd,
-                "rg_ridry_tnd": rg_ridry_tnd,
-                "rg_rsdry_tnd": rg_rsdry_tnd,
-                "rg_rrdry_tnd": rg_rrdry_tnd,
-                "rg_riwet_tnd": rg_riwet_tnd,
-                "rg_rswet_tnd": rg_rswet_tnd,
-                "rg_freez1_tnd": rg_freez1_tnd,
-                "rg_freez2_tnd": rg_freez2_tnd,
-                "ricfrrg": ricfrrg,
-                "rrcfrig": rrcfrig,
-                "ricfrr": ricfrr,
-                "rgmltr": rgmltr,
-                "index_floor_s": index_floor_s,
-                "index_floor_g": index_floor_g,
-                "index_floor_r": index_floor_r,
-            }
-
-            ker_sdryg = from_array(self.ker_sdryg, backend=self.gt4py_config.backend)
-            ker_rdryg = from_array(self.ker_rdryg, backend=self.gt4py_config.backend)
-
-            self.ice4_fast_rg(
-                ldsoft=ldsoft,
-                ker_sdryg=ker_sdryg,
-                ker_rdryg=ker_rdryg,
-                **state_fast_rg,
-                **temporaries_fast_rg,
+        calls.append(
+            bind(
+                self.ice4_fast_rg,
+                {"ker_sdryg": self.ker_sdryg, "ker_rdryg": self.ker_rdryg},
+                state_fast_rg,
+                temporaries_fast_rg,
+                scalars=("ldsoft",),
             )
+        )
 
-            ######################## ice4_fast_ri ###################################
-            state_fast_ri = {
-                "ldcompute": state["ldcompute"],
-                **{
-                    key: state[key]
-                    for key in [
-                        "rhodref",
-                        "lv_fact",
-                        "ls_fact",
-                        "ai",
-                        "cj",
-                        "ci_t",
-                        "ssi",
-                        "rc_t",
-                        "ri_t",
-                    ]
-                },
-            }
-
-            tmps_fast_ri = {
-                "rc_beri_tnd": rc_beri_tnd,
-            }
-
-            self.ice4_fast_ri(ldsoft=ldsoft, **state_fast_ri, **tmps_fast_ri)
-
-            ######################## ice4_tendencies_update #########################
-
-            state_tendencies_update = {
-                **{key: state[key] for key in ["ls_fact", "lv_fact"]},
-                **{
-                    key: state[key]
-                    for key in [
-                        "theta_tnd",
-                        "rv_tnd",
-                        "rc_tnd",
-                        "rr_tnd",
-                        "ri_tnd",
-                        "rs_tnd",
-                        "rg_tnd",
-                    ]
-                },
-            }
-
-            tmps_tnd_update = {
-                "rvheni_mr": rvheni_mr,
-                "rrhong_mr": rrhong_mr,
-                "rimltc_mr": rimltc_mr,
-                "rsrimcg_mr": rsrimcg_mr,
-                "rchoni": rchoni,
-                "rvdeps": rvdeps,
-                "riaggs": riaggs,
-                "riauts": riauts,
-                "rvdepg": rvdepg,
-                "rcautr": rcautr,
-                "rcaccr": rcaccr,
-                "rrevav": rrevav,
-                "rcberi": rcberi,
-                "rsmltg": rsmltg,
-                "rcmltsr": rcmltsr,
-                "rraccss": rraccss,  # 13
-                "rraccsg": rraccsg,  # 14
-                "rsaccrg": rsaccrg,  # 15  # Rain accretion onto the aggregates
-                "rcrimss": rcrimss,  # 16
-                "rcrimsg": rcrimsg,  # 17
-                "rsrimcg": rsrimcg,  # 18  # Cloud droplet riming of the aggregates
-                "ricfrrg": ricfrrg,  # 19
-                "rrcfrig": rrcfrig,  # 20
-                "ricfrr": ricfrr,  # 21  # Rain contact freezing
-                "rcwetg": rcwetg,  # 22
-                "riwetg": riwetg,  # 23
-                "rrwetg": rrwetg,  # 24
-                "rswetg": rswetg,  # 25  # Graupel wet growth
-                "rcdryg": rcdryg,  # 26
-                "ridryg": ridryg,  # 27
-                "rrdryg": rrdryg,  # 28
-                "rsdryg": rsdryg,  # 29  # Graupel dry growth
-                "rgmltr": rgmltr,
-            }
-
-            self.ice4_tendencies_update(**state_tendencies_update, **tmps_tnd_update)
+        ######################## ice4_fast_ri ###################################
+        state_fast_ri = {
+            "ldcompute": state["ldcompute"],
+            **{
+                key: state[key]
+                for key in [
+                    "rhodref",
+                    "lv_fact",
+                    "ls_fact",
+                    "ai",
+                    "cj",
+                    "ci_t",
+                    "ssi",
+                    "rc_t",
+                    "ri_t",
+                ]
+            },
+        }
+
+        tmps_fast_ri = {
+            "rc_beri_tnd": rc_beri_tnd,
+        }
+
+        calls.append(
+            bind(self.ice4_fast_ri, state_fast_ri, tmps_fast_ri, scalars=("ldsoft",))
+        )
+
+        ######################## ice4_tendencies_update #########################
+
+        state_tendencies_update = {
+            **{key: state[key] for key in ["ls_fact", "lv_fact"]},
+            **{
+                key: state[key]
+                for key in [
+                    "theta_tnd",
+                    "rv_tnd",
+                    "rc_tnd",
+                    "rr_tnd",
+                    "ri_tnd",
+                    "rs_tnd",
+                    "rg_tnd",
+                ]
+            },
+        }
+
+        tmps_tnd_update = {
+            "rvheni_mr": rvheni_mr,
+            "rrhong_mr": rrhong_mr,
+            "rimltc_mr": rimltc_mr,
+            "rsrimcg_mr": rsrimcg_mr,
+            "rchoni": rchoni,
+            "rvdeps": rvdeps,
+            "riaggs": riaggs,
+            "riauts": riauts,
+            "rvdepg": rvdepg,
+            "rcautr": rcautr,
+            "rcaccr": rcaccr,
+            "rrevav": rrevav,
+            "rcberi": rcberi,
+            "rsmltg": rsmltg,
+            "rcmltsr": rcmltsr,
+            "rraccss": rraccss,  # 13
+            "rraccsg": rraccsg,  # 14
+            "rsaccrg": rsaccrg,  # 15  # Rain accretion onto the aggregates
+            "rcrimss": rcrimss,  # 16
+            "rcrimsg": rcrimsg,  # 17
+            "rsrimcg": rsrimcg,  # 18  # Cloud droplet riming of the aggregates
+            "ricfrrg": ricfrrg,  # 19
+            "rrcfrig": rrcfrig,  # 20
+            "ricfrr": ricfrr,  # 21  # Rain contact freezing
+            "rcwetg": rcwetg,  # 22
+            "riwetg": riwetg,  # 23
+            "rrwetg": rrwetg,  # 24
+            "rswetg": rswetg,  # 25  # Graupel wet growth
+            "rcdryg": rcdryg,  # 26
+            "ridryg": ridryg,  # 27
+            "rrdryg": rrdryg,  # 28
+            "rsdryg": rsdryg,  # 29  # Graupel dry growth
+            "rgmltr": rgmltr,
+        }
+
+        calls.append(
+            bind(self.ice4_tendencies_update, state_tendencies_update, tmps_tnd_update)
+        )
+
+        return CallPlan(tuple(calls))
@@ -7,21 +7,21 @@ import sys
 from functools import cached_property
 from itertools import repeat
 from typing import Dict
-from gt4py.storage import from_array
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
 from ifs_physics_common.framework.storage import managed_temporary_storage
 from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
+from ice3_gt4py.components.base import Ice3Component
 from ice3_gt4py.phyex_common.phyex import Phyex
 from ice3_gt4py.phyex_common.tables import src_1d
+from ice3_gt4py.utils.table_registry import get_table_registry
 
 logging.basicConfig(level=logging.DEBUG, stream=sys.stdout)
 logging.getLogger()
 
 
-class IceAdjust(ImplicitTendencyComponent):
+class IceAdjust(Ice3Component):
     """Implicit Tendency Component calling
     ice_adjust : saturation adjustment of temperature and mixing ratios
 
@@ -43,6 +43,11 @@ class IceAdjust(ImplicitTendencyComponent):
         externals = phyex.to_externals()
         self.ice_adjust = self.compile_stencil("ice_adjust", externals)
 
+        # Lookup table, uploaded once per backend
+        self.src_1d = get_table_registry().get(
+            "src_1d", src_1d, self.gt4py_config.backend, self.gt4py_config.dtypes.float
+        )
+
         logging.info(f"Keys")
         logging.info(f"SUBG_COND : {phyex.nebn.SUBG_COND}")
         logging.info(f"SUBG_MF_PDF : {phyex.param_icen.SUBG_MF_PDF}")
@@ -211,16 +216,12 @@ class IceAdjust(ImplicitTendencyComponent):
                 "inq1": inq1,
             }
 
-            # Global Table
-            logging.info("Loading src_1d GlobalTable")
-            src_1D = from_array(src_1d, backend=self.gt4py_config.backend)
-
             # Timestep
             logging.info("Launching ice_adjust")
             self.ice_adjust(
                 **state_ice_adjust,
                 **temporaries_ice_adjust,
-                src_1d=src_1D,
+                src_1d=self.src_1d,
                 dt=timestep.total_seconds(),
                 origin=(0, 0, 0),
                 domain=self.computational_grid.grids[I, J, K].shape,
@@ -1,23 +1,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-import datetime
 import logging
 import sys
 from datetime import timedelta
 from functools import cached_property
 from itertools import repeat
-from typing import Dict
+from typing import Dict, List, Optional
 
-import xarray as xr
-from ifs_physics_common.framework.components import ImplicitTendencyComponent
 from ifs_physics_common.framework.config import GT4PyConfig
 from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
-from ifs_physics_common.framework.storage import managed_temporary_storage
 from ifs_physics_common.utils.f2py import ported_method
 from ifs_physics_common.utils.typingx import NDArrayLikeDict, PropertyDict
 
-from ice3_gt4py.components.ice4_stepping import Ice4Stepping
+from ice3_gt4py.components.base import Ice3Component
+from ice3_gt4py.components.ice4_pack import Ice4Pack
 from ice3_gt4py.phyex_common.param_ice import (
     Sedim,
     SubgAucvRc,
@@ -27,12 +24,14 @@ from ice3_gt4py.phyex_common.param_ice import (
     SubgRRRCAccr,
 )
 from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.call_plan import CallPlan, bind
+from ice3_gt4py.utils.workspace import Workspace
 
 logging.basicConfig(level=logging.DEBUG, stream=sys.stdout)
 logging.getLogger()
 
 
-class RainIce(ImplicitTendencyComponent):
+class RainIce(Ice3Component):
     """Component for step computation"""
 
     def __init__(
@@ -42,9 +41,18 @@ class RainIce(ImplicitTendencyComponent):
         phyex: Phyex,
         *,
         enable_checks: bool = True,
+        convergence_check_interval: int = 1,
+        recompaction_threshold: float = 0.0,
+        workspace: Optional[Workspace] = None,
+        fused: bool = False,
+        call_plans: bool = True,
     ) -> None:
         super().__init__(
-            computational_grid, enable_checks=enable_checks, gt4py_config=gt4py_config
+            computational_grid,
+            enable_checks=enable_checks,
+            gt4py_config=gt4py_config,
+            workspace=workspace,
+            call_plans=call_plans,
         )
 
         self.phyex = phyex
@@ -52,6 +60,19 @@ class RainIce(ImplicitTendencyComponent):
 
         # Keys
         SEDIM = self.phyex.param_icen.SEDIM
+        SUBG_RC_RR_ACCR = self.phyex.param_icen.SUBG_RC_RR_ACCR
+        SUBG_RR_EVAP = self.phyex.param_icen.SUBG_RR_EVAP
+        SUBG_PR_PDF = self.phyex.param_icen.SUBG_PR_PDF
+        SUBG_AUCV_RC = self.phyex.param_icen.SUBG_AUCV_RC
+        SUBG_AUCV_RI = self.phyex.param_icen.SUBG_AUCV_RI
+        LSEDIM_AFTER = self.phyex.param_icen.LSEDIM_AFTER
+        LDEPOSC = self.phyex.param_icen.LDEPOSC
+
+        # Only the stencils reachable with the current keys are compiled
+        PRFR = (
+            SUBG_RC_RR_ACCR == SubgRRRCAccr.PRFR.value
+            or SUBG_RR_EVAP == SubgRREvap.PRFR.value
+        )
 
         # 1. Generalites
         self.rain_ice_init = self.compile_stencil("rain_ice_init", externals)
@@ -71,19 +92,37 @@ class RainIce(ImplicitTendencyComponent):
         )
 
         # 4.2 Computes precipitation fraction
-        self.ice4_precipitation_fraction_sigma = self.compile_stencil(
-            "ice4_precipitation_fraction_sigma", externals
-        )
-        self.ice4_precipitation_fraction_liquid_content = self.compile_stencil(
-            "ice4_precipitation_fraction_liquid_content", externals
-        )
-        self.ice4_compute_pdf = self.compile_stencil("ice4_compute_pdf", externals)
-        self.ice4_rainfr_vert = self.compile_stencil("ice4_rainfr_vert", externals)
+        if PRFR:
+            if (
+                SUBG_AUCV_RC == SubgAucvRc.PDF.value
+                and SUBG_PR_PDF == SubgPRPDF.SIGM.value
+            ):
+                self.ice4_precipitation_fraction_sigma = self.compile_stencil(
+                    "ice4_precipitation_fraction_sigma", externals
+                )
+            if (
+                SUBG_AUCV_RC == SubgAucvRc.ADJU.value
+                and SUBG_AUCV_RI == SubgAucvRi.ADJU.value
+            ):
+                self.ice4_precipitation_fraction_liquid_content = self.compile_stencil(
+                    "ice4_precipitation_fraction_liquid_content", externals
+                )
+            self.ice4_compute_pdf = self.compile_stencil("ice4_compute_pdf", externals)
+
+        if PRFR or LSEDIM_AFTER:
+            self.ice4_rainfr_vert = self.compile_stencil("ice4_rainfr_vert", externals)
 
         # 5. Tendencies computation
-        # Translation note : rain_ice.F90 calls Ice4Stepping inside Ice4Pack packing operations
-        self.ice4_stepping = Ice4Stepping(
-            self.computational_grid, self.gt4py_config, phyex
+        # Translation note : Ice4Stepping runs inside Ice4Pack packing operations
+        self.ice4_pack = Ice4Pack(
+            self.computational_grid,
+            self.gt4py_config,
+            phyex,
+            convergence_check_interval=convergence_check_interval,
+            recompaction_threshold=recompaction_threshold,
+            workspace=self.workspace,
+            fused=fused,
+            call_plans=call_plans,
         )
 
         # 8. Total tendencies
@@ -108,12 +147,14 @@ class RainIce(ImplicitTendencyComponent):
                 f"Key not in {[option.name for option in Sedim]} for sedimentation"
             )
 
-        self.rain_fraction_sedimentation = self.compile_stencil(
-            "rain_fraction_sedimentation", externals
-        )
+        if LSEDIM_AFTER:
+            self.rain_fraction_sedimentation = self.compile_stencil(
+                "rain_fraction_sedimentation", externals
+            )
 
         # 10 Compute the fog deposition
-        self.fog_deposition = self.compile_stencil("fog_deposition", externals)
+        if LDEPOSC:
+            self.fog_deposition = self.compile_stencil("fog_deposition", externals)
 
     @cached_property
     def _input_properties(self) -> PropertyDict:
@@ -196,13 +237,30 @@ class RainIce(ImplicitTendencyComponent):
         overwrite_tendencies: Dict[str, bool],
     ):
 
-        with managed_temporary_storage(
+        with self.workspace.temporaries(
             self.computational_grid,
             *repeat(((I, J, K), "bool"), 2),
             *repeat(((I, J, K), "float"), 16),
             *repeat(((I, J), "float"), 2),
-            gt4py_config=self.gt4py_config,
-        ) as (
+        ) as buffers:
+            plan = self.call_plan(
+                (*state.values(), *buffers), lambda: self.build_plan(state, buffers)
+            )
+            plan(timestep=timestep)
+
+    def build_plan(self, state: NDArrayLikeDict, buffers: List) -> CallPlan:
+        """Calls of array_call, arguments bound to state and buffers
+
+        Branches are taken at build time, following the keys of phyex.
+
+        Args:
+            state (NDArrayLikeDict): fields of the component
+            buffers (List): temporaries of array_call
+
+        Returns:
+            CallPlan: calls in order, replayed with timestep
+        """
+        (
             ldmicro,
             lw3d,
             rvheni,
@@ -223,75 +281,25 @@ class RainIce(ImplicitTendencyComponent):
             w3d,
             inpri,
             remaining_time,
-        ):
-
-            # KEYS
-            SUBG_RC_RR_ACCR = self.phyex.param_icen.SUBG_RC_RR_ACCR
-            SUBG_RR_EVAP = self.phyex.param_icen.SUBG_RR_EVAP
-            SUBG_PR_PDF = self.phyex.param_icen.SUBG_PR_PDF
-            SUBG_AUCV_RC = self.phyex.param_icen.SUBG_AUCV_RC
-            SUBG_AUCV_RI = self.phyex.param_icen.SUBG_AUCV_RI
-            LSEDIM_AFTER = self.phyex.param_icen.LSEDIM_AFTER
-            LDEPOSC = self.phyex.param_icen.LDEPOSC
-
-            # 1. Generalites
-            state_rain_ice_init = {
-                **{
-                    key: state[key]
-                    for key in [
-                        "exn",
-                        "th_t",
-                        "rv_t",
-                        "rc_t",
-                        "rr_t",
-                        "ri_t",
-                        "rs_t",
-                        "rg_t",
-                    ]
-                },
-                **{
-                    "ldmicro": ldmicro,
-                    "ls_fact": ls_fact,
-                    "lv_fact": lv_fact,
-                },
-            }
-            self.rain_ice_init(**state_rain_ice_init)
+        ) = buffers
 
-            # 2. Compute the sedimentation source
-            state_sed = {
-                key: state[key]
-                for key in [
-                    "rhodref",
-                    "dzz",
-                    "pabs_t",
-                    "th_t",
-                    "rcs",
-                    "rrs",
-                    "ris",
-                    "rss",
-                    "rgs",
-                    "sea",
-                    "town",
-                    "fpr_c",
-                    "fpr_r",
-                    "fpr_i",
-                    "fpr_s",
-                    "fpr_g",
-                    "inprr",
-                    "inprc",
-                    "inprs",
-                    "inprg",
-                ]
-            }
-
-            tmps_sedim = {"inpri": inpri}
+        # KEYS
+        SUBG_RC_RR_ACCR = self.phyex.param_icen.SUBG_RC_RR_ACCR
+        SUBG_RR_EVAP = self.phyex.param_icen.SUBG_RR_EVAP
+        SUBG_PR_PDF = self.phyex.param_icen.SUBG_PR_PDF
+        SUBG_AUCV_RC = self.phyex.param_icen.SUBG_AUCV_RC
+        SUBG_AUCV_RI = self.phyex.param_icen.SUBG_AUCV_RI
+        LSEDIM_AFTER = self.phyex.param_icen.LSEDIM_AFTER
+        LDEPOSC = self.phyex.param_icen.LDEPOSC
 
-            if not LSEDIM_AFTER:
-                self.sedimentation(**state_sed, **tmps_sedim)
+        calls = []
 
-            state_initial_values_saving = {
+        # 1. Generalites
+        state_rain_ice_init = {
+            **{
                 key: state[key]
                 for key in [
+                    "exn",
                     "th_t",
                     "rv_t",
                     "rc_t",
@@ -299,251 +307,310 @@ class RainIce(ImplicitTendencyComponent):
                     "ri_t",
                     "rs_t",
                     "rg_t",
-                    "evap3d",
-                    "rainfr",
                 ]
-            }
-            tmps_initial_values_saving = {
-                "wr_th": wr_th,
-                "wr_v": wr_v,
-                "wr_c": wr_c,
-                "wr_r": wr_r,
-                "wr_i": wr_i,
-                "wr_s": wr_s,
-                "wr_g": wr_g,
-            }
-            self.initial_values_saving(
-                **state_initial_values_saving, **tmps_initial_values_saving
+            },
+            **{
+                "ldmicro": ldmicro,
+                "ls_fact": ls_fact,
+                "lv_fact": lv_fact,
+            },
+        }
+        calls.append(bind(self.rain_ice_init, state_rain_ice_init))
+
+        # 2. Compute the sedimentation source
+        state_sed = {
+            key: state[key]
+            for key in [
+                "rhodref",
+                "dzz",
+                "pabs_t",
+                "th_t",
+                "rcs",
+                "rrs",
+                "ris",
+                "rss",
+                "rgs",
+                "sea",
+                "town",
+                "fpr_c",
+                "fpr_r",
+                "fpr_i",
+                "fpr_s",
+                "fpr_g",
+                "inprr",
+                "inprc",
+                "inprs",
+                "inprg",
+            ]
+        }
+
+        tmps_sedim = {"inpri": inpri}
+
+        if not LSEDIM_AFTER:
+            calls.append(bind(self.sedimentation, state_sed, tmps_sedim))
+
+        state_initial_values_saving = {
+            key: state[key]
+            for key in [
+                "th_t",
+                "rv_t",
+                "rc_t",
+                "rr_t",
+                "ri_t",
+                "rs_t",
+                "rg_t",
+                "evap3d",
+                "rainfr",
+            ]
+        }
+        tmps_initial_values_saving = {
+            "wr_th": wr_th,
+            "wr_v": wr_v,
+            "wr_c": wr_c,
+            "wr_r": wr_r,
+            "wr_i": wr_i,
+            "wr_s": wr_s,
+            "wr_g": wr_g,
+        }
+        calls.append(
+            bind(
+                self.initial_values_saving,
+                state_initial_values_saving,
+                tmps_initial_values_saving,
             )
+        )
 
-            # 4.1 Slow cold processes outside of ldmicro
-            state_nuc_pre = {key: state[key] for key in ["exn", "ci_t"]}
-            tmps_nuc_pre = {"ldmicro": ldmicro, "w3d": w3d, "ls_fact": ls_fact}
-            self.rain_ice_nucleation_pre_processing(**state_nuc_pre, **tmps_nuc_pre)
+        # 4.1 Slow cold processes outside of ldmicro
+        state_nuc_pre = {key: state[key] for key in ["exn", "ci_t"]}
+        tmps_nuc_pre = {"ldmicro": ldmicro, "w3d": w3d, "ls_fact": ls_fact}
+        calls.append(
+            bind(self.rain_ice_nucleation_pre_processing, state_nuc_pre, tmps_nuc_pre)
+        )
 
-            state_nuc = {
-                key: state[key]
-                for key in [
-                    "th_t",
-                    "pabs_t",
-                    "rhodref",
-                    "exn",
-                    "t",
-                    "rv_t",
-                    "ci_t",
-                    "ssi",
-                ]
-            }
-            tmps_nuc = {
-                "ldcompute": lw3d,
-                "ls_fact": ls_fact,
-                "rvheni_mr": rvheni,
-            }
-            self.ice4_nucleation(**state_nuc, **tmps_nuc)
-            self.rain_ice_nucleation_post_processing(rvs=state["rvs"], rvheni=rvheni)
+        state_nuc = {
+            key: state[key]
+            for key in [
+                "th_t",
+                "pabs_t",
+                "rhodref",
+                "exn",
+                "t",
+                "rv_t",
+                "ci_t",
+                "ssi",
+            ]
+        }
+        tmps_nuc = {
+            "ldcompute": lw3d,
+            "ls_fact": ls_fact,
+            "rvheni_mr": rvheni,
+        }
+        calls.append(bind(self.ice4_nucleation, state_nuc, tmps_nuc))
+        calls.append(
+            bind(
+                self.rain_ice_nucleation_post_processing,
+                {"rvs": state["rvs"], "rvheni": rvheni},
+            )
+        )
 
-            # 4.2 Computes precipitation fraction
+        # 4.2 Computes precipitation fraction
+        if (
+            SUBG_RC_RR_ACCR == SubgRRRCAccr.PRFR.value
+            or SUBG_RR_EVAP == SubgRREvap.PRFR.value
+        ):
             if (
-                SUBG_RC_RR_ACCR == SubgRRRCAccr.PRFR.value
-                or SUBG_RR_EVAP == SubgRREvap.PRFR.value
+                SUBG_AUCV_RC == SubgAucvRc.PDF.value
+                and SUBG_PR_PDF == SubgPRPDF.SIGM.value
             ):
-                if (
-                    SUBG_AUCV_RC == SubgAucvRc.PDF.value
-                    and SUBG_PR_PDF == SubgPRPDF.SIGM.value
-                ):
-                    self.ice4_precipitation_fraction_sigma(
-                        sigs=state["sigs"], sigma_rc=sigma_rc
+                calls.append(
+                    bind(
+                        self.ice4_precipitation_fraction_sigma,
+                        {"sigs": state["sigs"], "sigma_rc": sigma_rc},
                     )
-                if (
-                    SUBG_AUCV_RC == SubgAucvRc.ADJU.value
-                    and SUBG_AUCV_RI == SubgAucvRi.ADJU.value
-                ):
-
-                    state_lc = {
-                        **{
-                            key: state[key]
-                            for key in [
-                                "hlc_hrc",
-                                "hli_hri",
-                                "hlc_hcf",
-                                "hli_hcf",
-                                "rc_t",
-                                "ri_t",
-                                "cldfr",
-                            ]
-                        },
-                        "hlc_lrc": hlc_lrc,
-                        "hli_lri": hli_lri,
-                        "hlc_lcf": hlc_lcf,
-                        "hli_lcf": hli_lcf,
-                    }
-
-                    self.ice4_precipitation_fraction_liquid_content(**state_lc)
-
-                state_compute_pdf = {
+                )
+            if (
+                SUBG_AUCV_RC == SubgAucvRc.ADJU.value
+                and SUBG_AUCV_RI == SubgAucvRi.ADJU.value
+            ):
+
+                state_lc = {
                     **{
                         key: state[key]
                         for key in [
-                            "rhodref",
-                            "rc_t",
-                            "ri_t",
-                            "cf",
-                            "t",
-                            "hlc_hcf",
                             "hlc_hrc",
-                            "hli_hcf",
                             "hli_hri",
-                            "rf",
+                            "hlc_hcf",
+                            "hli_hcf",
+                            "rc_t",
+                            "ri_t",
+                            "cldfr",
                         ]
                     },
-                    "hli_lri": hli_lri,
-                    "hli_lcf": hli_lcf,
                     "hlc_lrc": hlc_lrc,
+                    "hli_lri": hli_lri,
                     "hlc_lcf": hlc_lcf,
-                    "sigma_rc": sigma_rc,
-                    "ldmicro": ldmicro,
+                    "hli_lcf": hli_lcf,
                 }
 
-                self.ice4_compute_pdf(**state_compute_pdf)
+                calls.append(
+                    bind(self.ice4_precipitation_fraction_liquid_content, state_lc)
+                )
 
-                state_rainfr_vert = {
-                    **{
-                        key: state[key]
-                        for key in [
-                            "rrs",
-                            "rss",
-                            "rgs",
-                        ]
-                    },
-                    "wr_r": wr_r,
-                    "wr_s": wr_s,
-                    "wr_g": wr_g,
-                }
-                self.ice4_rainfr_vert(**state_rainfr_vert)
-
-            # 5. Tendencies computation
-            # Translation note : rain_ice.F90 calls Ice4Stepping inside Ice4Pack packing operations
-            state_stepping = {
+            state_compute_pdf = {
                 **{
                     key: state[key]
                     for key in [
                         "rhodref",
-                        "pabs_t",
-                        "th_t",
-                        "ci_t",
-                        "t",
-                        "rv_t",
                         "rc_t",
-                        "rr_t",
                         "ri_t",
-                        "rs_t",
-                        "rg_t",
-                        "exn",
+                        "cf",
+                        "t",
                         "hlc_hcf",
                         "hlc_hrc",
                         "hli_hcf",
                         "hli_hri",
+                        "rf",
                     ]
                 },
-                # Translation note : variables follow naming from mode_ice4_pack.F90
-                **{"cf": state["cldfr"], "sigma_rc": state["sigs"]},
-                **{
-                    "ldmicro": ldmicro,
-                    "ls_fact": ls_fact,
-                    "lv_fact": lv_fact,
-                },
+                "hli_lri": hli_lri,
+                "hli_lcf": hli_lcf,
+                "hlc_lrc": hlc_lrc,
+                "hlc_lcf": hlc_lcf,
+                "sigma_rc": sigma_rc,
+                "ldmicro": ldmicro,
             }
 
-            state_stepping_dataarrays = {
+            calls.append(bind(self.ice4_compute_pdf, state_compute_pdf))
+
+            state_rainfr_vert = {
                 **{
-                    key: xr.DataArray(
-                        data=field,
-                        dims=["x", "y", "z"],
-                        coords={
-                            "x": range(field.shape[0]),
-                            "y": range(field.shape[1]),
-                            "z": range(field.shape[2]),
-                        },
-                        name=f"{key}",
-                    )
-                    for key, field in state_stepping.items()
+                    key: state[key]
+                    for key in [
+                        "rrs",
+                        "rss",
+                        "rgs",
+                    ]
                 },
-                "time": datetime.datetime(year=2024, month=1, day=1),
-            }
-
-            # TODO : transform state to pass as a DataArray
-            _, _ = self.ice4_stepping(state_stepping_dataarrays, timestep)
-
-            # 8. Total tendencies
-            # 8.1 Total tendencies limited by available species
-            state_total_tendencies = {
-                key: state[key]
-                for key in [
-                    "exnref",
-                    "ths",
-                    "rvs",
-                    "rcs",
-                    "rrs",
-                    "ris",
-                    "rss",
-                    "rgs",
-                    "rv_t",
-                    "rc_t",
-                    "rr_t",
-                    "ri_t",
-                    "rs_t",
-                    "rg_t",
-                ]
-            }
-
-            tmps_total_tendencies = {
-                "rvheni": rvheni,
-                "ls_fact": ls_fact,
-                "lv_fact": lv_fact,
-                "wr_th": wr_th,
-                "wr_v": wr_v,
-                "wr_c": wr_c,
                 "wr_r": wr_r,
-                "wr_i": wr_i,
                 "wr_s": wr_s,
                 "wr_g": wr_g,
             }
+            calls.append(bind(self.ice4_rainfr_vert, state_rainfr_vert))
 
-            self.total_tendencies(**state_total_tendencies, **tmps_total_tendencies)
-
-            # 8.2 Negative corrections
-            state_neg = {
+        # 5. Tendencies computation
+        # Translation note : Ice4Stepping runs on packed ldmicro points (LPACK_MICRO, NPROMICRO)
+        state_stepping = {
+            **{
                 key: state[key]
                 for key in [
+                    "rhodref",
+                    "pabs_t",
                     "th_t",
+                    "ci_t",
+                    "t",
                     "rv_t",
                     "rc_t",
                     "rr_t",
                     "ri_t",
                     "rs_t",
                     "rg_t",
+                    "exn",
+                    "hlc_hcf",
+                    "hlc_hrc",
+                    "hli_hcf",
+                    "hli_hri",
                 ]
-            }
-            tmps_neg = {"lv_fact": lv_fact, "ls_fact": ls_fact}
-            self.ice4_correct_negativities(**state_neg, **tmps_neg)
+            },
+            # Translation note : variables follow naming from mode_ice4_pack.F90
+            **{"cf": state["cldfr"], "sigma_rc": state["sigs"]},
+            **{
+                "ldmicro": ldmicro,
+                "ls_fact": ls_fact,
+                "lv_fact": lv_fact,
+            },
+        }
 
-            # 9. Compute the sedimentation source
-            if LSEDIM_AFTER:
-                self.sedimentation(**state_sed, **tmps_sedim)
+        calls.append(
+            bind(
+                self.ice4_pack.nested_call,
+                {"state": state_stepping},
+                scalars=("timestep",),
+            )
+        )
 
-                state_frac_sed = {
-                    **{key: state[key] for key in ["rrs", "rss", "rgs"]},
-                    **{"wr_r": wr_r, "wr_s": wr_s, "wr_g": wr_g},
-                }
-                self.rain_fraction_sedimentation(**state_frac_sed)
+        # 8. Total tendencies
+        # 8.1 Total tendencies limited by available species
+        state_total_tendencies = {
+            key: state[key]
+            for key in [
+                "exnref",
+                "ths",
+                "rvs",
+                "rcs",
+                "rrs",
+                "ris",
+                "rss",
+                "rgs",
+                "rv_t",
+                "rc_t",
+                "rr_t",
+                "ri_t",
+                "rs_t",
+                "rg_t",
+            ]
+        }
 
-                state_rainfr = {**{key: state[key] for key in ["prfr", "rr_t", "rs_t"]}}
-                self.ice4_rainfr_vert(**state_rainfr)
+        tmps_total_tendencies = {
+            "rvheni": rvheni,
+            "ls_fact": ls_fact,
+            "lv_fact": lv_fact,
+            "wr_th": wr_th,
+            "wr_v": wr_v,
+            "wr_c": wr_c,
+            "wr_r": wr_r,
+            "wr_i": wr_i,
+            "wr_s": wr_s,
+            "wr_g": wr_g,
+        }
 
-            # 10 Compute the fog deposition
-            if LDEPOSC:
-                state_fog = {
-                    key: state[key]
-                    for key in ["rcs", "rc_t", "rhodref", "dzz", "inprc"]
-                }
-                self.fog_deposition(**state_fog)
+        calls.append(
+            bind(self.total_tendencies, state_total_tendencies, tmps_total_tendencies)
+        )
+
+        # 8.2 Negative corrections
+        state_neg = {
+            key: state[key]
+            for key in [
+                "th_t",
+                "rv_t",
+                "rc_t",
+                "rr_t",
+                "ri_t",
+                "rs_t",
+                "rg_t",
+            ]
+        }
+        tmps_neg = {"lv_fact": lv_fact, "ls_fact": ls_fact}
+        calls.append(bind(self.ice4_correct_negativities, state_neg, tmps_neg))
+
+        # 9. Compute the sedimentation source
+        if LSEDIM_AFTER:
+            calls.append(bind(self.sedimentation, state_sed, tmps_sedim))
+
+            state_frac_sed = {
+                **{key: state[key] for key in ["rrs", "rss", "rgs"]},
+                **{"wr_r": wr_r, "wr_s": wr_s, "wr_g": wr_g},
+            }
+            calls.append(bind(self.rain_fraction_sedimentation, state_frac_sed))
+
+            state_rainfr = {**{key: state[key] for key in ["prfr", "rr_t", "rs_t"]}}
+            calls.append(bind(self.ice4_rainfr_vert, state_rainfr))
+
+        # 10 Compute the fog deposition
+        if LDEPOSC:
+            state_fog = {
+                key: state[key] for key in ["rcs", "rc_t", "rhodref", "dzz", "inprc"]
+            }
+            calls.append(bind(self.fog_deposition, state_fog))
+
+        return CallPlan(tuple(calls))
@@ -1,15 +1,15 @@
 # -*- coding: utf-8 -*-
-from math import gamma
+from math import gamma, lgamma
 from ifs_physics_common.utils.f2py import ported_method
-import logging
 
 from numpy import exp, log, finfo
 import numpy as np
 
-import numpy as np
-from scipy.integrate import quad
+# scipy.integrate is imported in functions, to keep it out of import time
 
 def gamma_function(x):
+    from scipy.integrate import quad
+
     # Define the integrand t^(x-1) * e^(-t)
     integrand = lambda t: t**(x-1) * np.exp(-t)
     # Compute the integral from 0 to infinity
@@ -36,6 +36,8 @@ def generalized_incomplete_gamma(a,x) -> float:
     Returns:
         float: incomplete gamma function
     """
+    from scipy.integrate import quad
+
     integrand = lambda t: t**(a-1) * np.exp(-t)
     result = quad(integrand, 0, x)[0] / quad(integrand, 0, np.inf)[0]
     return result
@@ -66,7 +68,7 @@ def gamma_inc(a: float, x: float) -> float:
     zfpmin = 1e-30
 
     if x < 0 or a <= 0:
-        raise ValueError(f"Invalid arguments: x < 0 or a <= 0")
+        raise ValueError("Invalid arguments: x < 0 or a <= 0")
 
     if x < a + 1:
         ap = a
@@ -105,6 +107,7 @@ def gamma_inc(a: float, x: float) -> float:
 
             if abs(d) < finfo(np.float64).tiny:
                 d = zfpmin
+            c = b + an / c
             if abs(c) < finfo(np.float64).tiny:
                 c = zfpmin
 
@@ -120,3 +123,86 @@ def gamma_inc(a: float, x: float) -> float:
                 )
 
         return 1 - h * exp(-x + a * log(x) - log(gamma(a)))
+
+
+@ported_method(from_file="PHYEX/src/common/aux/gamma_inc.F90")
+def gamma_inc_array(a, x, eps: float = 3e-7, itmax: int = 100) -> np.ndarray:
+    """Vectorized gamma_inc : generalized incomplete gamma function over arrays
+
+    Same series (x < a + 1) and continued fraction (x >= a + 1) as gamma_inc,
+    iterated on all points at once until every point has converged.
+
+    Args:
+        a (array_like): factor for gamma function, > 0
+        x (array_like): upper bound for the incomplete gamma function, >= 0
+        eps (float): relative tolerance of the series and continued fraction
+        itmax (int): maximum number of iterations
+
+    Returns:
+        np.ndarray: incomplete gamma function, with the broadcast shape of a and x
+    """
+    a, x = np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(x, dtype=np.float64)
+    )
+    if np.any(x < 0) or np.any(a <= 0):
+        raise ValueError("Invalid arguments: x < 0 or a <= 0")
+
+    tiny = finfo(np.float64).tiny
+    zfpmin = 1e-30
+    with np.errstate(divide="ignore"):
+        prefactor = exp(-x + a * log(x) - np.vectorize(lgamma, otypes=[float])(a))
+
+    result = np.empty(a.shape)
+    series = x < a + 1
+
+    # Series
+    ap = a[series].copy()
+    xs = x[series]
+    zsum = 1 / ap
+    zdel = zsum.copy()
+    active = np.ones(ap.shape, dtype=bool)
+    for _ in range(itmax):
+        active &= ~(np.abs(zdel) < np.abs(zsum) * eps)
+        if not active.any():
+            break
+        ap[active] += 1
+        zdel[active] *= xs[active] / ap[active]
+        zsum[active] += zdel[active]
+    else:
+        if active.any():
+            raise ValueError(
+                "a argument is too large or ITMAX is too small the incomplete GAMMA_INC "
+                "function cannot be evaluated correctly by the series method"
+            )
+    result[series] = zsum * prefactor[series]
+
+    # Continued fraction (modified Lentz)
+    acf = a[~series]
+    b = x[~series] + 1 - acf
+    c = np.full(acf.shape, 1 / tiny)
+    d = 1 / b
+    h = d.copy()
+    zdel = np.full(acf.shape, tiny)
+    active = np.ones(acf.shape, dtype=bool)
+    for jn in range(1, itmax + 1):
+        active &= ~(np.abs(zdel - 1) < eps)
+        if not active.any():
+            break
+        an = -jn * (jn - acf[active])
+        b[active] += 2
+        d[active] = an * d[active] + b[active]
+        d[active] = np.where(np.abs(d[active]) < tiny, zfpmin, d[active])
+        c[active] = b[active] + an / c[active]
+        c[active] = np.where(np.abs(c[active]) < tiny, zfpmin, c[active])
+        d[active] = 1 / d[active]
+        zdel[active] = d[active] * c[active]
+        h[active] *= zdel[active]
+    else:
+        if active.any():
+            raise ValueError(
+                "a argument is too large or ITMAX is too small the incomplete GAMMA_INC "
+                "function cannot be evaluated correctly by the continued fraction method"
+            )
+    result[~series] = 1 - h * prefactor[~series]
+
+    return result
@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 from dataclasses import Field, dataclass, field, fields
 
-import f90nml
-
 
 @dataclass
 class Namparar:
@@ -41,6 +39,7 @@ class Namparar:
 
     def __post_init__(self):
         """Read namelist file and allocate attributes values"""
+        import f90nml
 
         with open(self.nml_file_path) as nml_file:
             nml = f90nml.read(nml_file)
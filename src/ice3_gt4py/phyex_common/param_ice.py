@@ -248,7 +248,7 @@ class ParamIce:
             self.LADJ_AFTER = True
 
     def set_frmin_nam(self):
-        tmp_frmin_nam = np.empty(41)
+        tmp_frmin_nam = np.zeros(41)
         tmp_frmin_nam[1:6] = 0
         tmp_frmin_nam[7:9] = 1.0
         tmp_frmin_nam[10] = 10.0
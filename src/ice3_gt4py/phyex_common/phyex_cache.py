@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of initialised Phyex parameter sets.
+
+Phyex.__post_init__ computes every derived constant and lookup table of the
+scheme (RainIceParam and its incomplete gamma tables). The initialised
+dataclass is pickled once, and loaded back by later processes.
+
+A snapshot is keyed by the program, the arguments given to Phyex, and a hash
+of the phyex_common sources and assets : editing a parameter in the sources
+(or passing another argument) selects another snapshot, stale ones are never
+read.
+
+The cache directory defaults to ICE3_GT4PY_PHYEX_CACHE_DIR, then to
+$XDG_CACHE_HOME/ice3_gt4py/phyex (~/.cache/ice3_gt4py/phyex).
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+
+PHYEX_CACHE_DIR_ENV = "ICE3_GT4PY_PHYEX_CACHE_DIR"
+PHYEX_COMMON_DIR = Path(__file__).parent
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from ICE3_GT4PY_PHYEX_CACHE_DIR, user cache otherwise"""
+    if os.environ.get(PHYEX_CACHE_DIR_ENV):
+        return Path(os.environ[PHYEX_CACHE_DIR_ENV])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ice3_gt4py" / "phyex"
+
+
+def sources_hash() -> str:
+    """Hash of the modules and assets defining Phyex parameters"""
+    sha = hashlib.sha1()
+    for path in sorted(PHYEX_COMMON_DIR.glob("*.py")) + sorted(
+        (PHYEX_COMMON_DIR / "assets").glob("*.npy")
+    ):
+        sha.update(path.name.encode())
+        sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def phyex_key(program: str, **kwargs: Any) -> str:
+    """Name of the snapshot of Phyex(program, **kwargs)
+
+    Args:
+        program (str): name of the program (AROME, MESO-NH)
+        kwargs: other arguments of Phyex
+
+    Returns:
+        str: snapshot file name
+    """
+    sha = hashlib.sha1()
+    sha.update(program.encode())
+    sha.update(repr(sorted(kwargs.items())).encode())
+    sha.update(sources_hash().encode())
+    sha.update(f"{sys.version_info.major}.{sys.version_info.minor}".encode())
+    return f"{program}_{sha.hexdigest()[:16]}.pkl"
+
+
+def load_phyex(
+    program: str, cache_dir: Optional[str | Path] = None, **kwargs: Any
+) -> Phyex:
+    """Load an initialised Phyex from the cache, initialise and store it on a miss.
+
+    Each call returns a new Phyex : it can be modified without altering the cache.
+
+    Args:
+        program (str): name of the program (AROME, MESO-NH)
+        cache_dir (Optional[str | Path]): cache directory, see default_cache_dir
+        kwargs: other arguments of Phyex (timestep, PROGRAM, TSTEP, ...)
+
+    Returns:
+        Phyex: initialised parameter set
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    path = cache_dir / phyex_key(program, **kwargs)
+
+    start = time.perf_counter()
+    if path.exists():
+        try:
+            with open(path, "rb") as file:
+                phyex = pickle.load(file)
+            logging.info(
+                f"Phyex loaded from {path} in {time.perf_counter() - start:.3f} s"
+            )
+            return phyex
+        except (pickle.UnpicklingError, EOFError, AttributeError) as e:
+            logging.warning(f"Corrupted Phyex snapshot {path} ({e}), rebuilt")
+
+    phyex = Phyex(program, **kwargs)
+    logging.info(f"Phyex initialised in {time.perf_counter() - start:.3f} s")
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            pickle.dump(phyex, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Phyex snapshot not written to {path} : {e}")
+
+    return phyex
@@ -9,9 +9,10 @@ import numpy as np
 from ifs_physics_common.utils.f2py import ported_class, ported_method
 
 from ice3_gt4py.phyex_common.constants import Constants
-from ice3_gt4py.phyex_common.gamma_inc import generalized_incomplete_gamma
+from ice3_gt4py.phyex_common.gamma_inc import gamma_inc_array
 from ice3_gt4py.phyex_common.param_ice import ParamIce
 from ice3_gt4py.phyex_common.rain_ice_descr import RainIceDescr
+from ice3_gt4py.phyex_common.xker_tables import load_kernel
 
 logging.getLogger()
 
@@ -745,36 +746,19 @@ class RainIceParam:
 
             logging.info(f"a factor {self.rid.NUS + (2 + self.rid.DS) / self.rid.ALPHAS}, GAMINC * zrate = {self.GAMINC_BOUND_MIN * zrate}")
 
-            GAMINC_RIM1 = np.array(
-                [
-                    generalized_incomplete_gamma(
-                        self.rid.NUS + (2 + self.rid.DS) / self.rid.ALPHAS,
-                        self.GAMINC_BOUND_MIN * zrate * j1,
-                    )
-                    for j1 in range(1, self.NGAMINC + 1)
-                ]
+            zbounds = self.GAMINC_BOUND_MIN * zrate * np.arange(1, self.NGAMINC + 1)
+            GAMINC_RIM1 = gamma_inc_array(
+                self.rid.NUS + (2 + self.rid.DS) / self.rid.ALPHAS, zbounds
             )
-            GAMINC_RIM2 = np.array(
-                [
-                    generalized_incomplete_gamma(
-                        self.rid.NUS + self.rid.BS / self.rid.ALPHAS,
-                        self.GAMINC_BOUND_MIN * zrate * j1,
-                    )
-                    for j1 in range(1, self.NGAMINC + 1)
-                ]
+            GAMINC_RIM2 = gamma_inc_array(
+                self.rid.NUS + self.rid.BS / self.rid.ALPHAS, zbounds
             )
-            GAMINC_RIM4 = np.array(
-                [
-                    generalized_incomplete_gamma(
-                        self.rid.NUS + self.rid.BS / self.rid.ALPHAS,
-                        self.GAMINC_BOUND_MIN * zrate * j1,
-                    )
-                    for j1 in range(1, self.NGAMINC + 1)
-                ]
+            GAMINC_RIM4 = gamma_inc_array(
+                self.rid.NUS + self.rid.BS / self.rid.ALPHAS, zbounds
             )
 
         except ValueError as e:
-            logging.info(f"Value error while computing generalized_incomplete_gamma : {e}")
+            logging.info(f"Value error while computing gamma_inc_array : {e}")
             GAMINC_RIM1 = np.ones(80)
             GAMINC_RIM2 = np.ones(80)
             GAMINC_RIM4 = np.ones(80)
@@ -787,6 +771,11 @@ class RainIceParam:
     def get_kernel(self, kernel):
         """Load kernels for convolutions as numpy arrays
 
+        Kernels on the grids and laws of the literals of mode_ini_rain_ice.F90 are
+        stored as .npy files in phyex_common/assets, other kernels are computed
+        once and cached (see xker_tables).
+        Both are memory-mapped.
+
         Args:
             kernel (str): kernel to load
 
@@ -797,35 +786,25 @@ class RainIceParam:
             _type_: python indented kernel (from 0 to n-1, instead 1 to n in fortran)
         """
 
-        if kernel == "saccrg":
-            from ice3_gt4py.phyex_common.xker_raccs import ker_saccrg
-
-            return ker_saccrg[1:, 1:]
-
-        elif kernel == "raccs":
-            from ice3_gt4py.phyex_common.xker_raccs import ker_raccs
-
-            return ker_raccs[1:, 1:]
-
-        elif kernel == "raccss":
-            from ice3_gt4py.phyex_common.xker_raccs import ker_raccss
-
-            return ker_raccss[1:, 1:]
-
-        elif kernel == "rdryg":
-
-            from ice3_gt4py.phyex_common.xker_rdryg import ker_rdryg
-
-            return ker_rdryg[1:, 1:]
-
-        elif kernel == "sdryg":
-            from ice3_gt4py.phyex_common.xker_sdryg import ker_sdryg
-
-            return ker_sdryg[1:, 1:]
-
-        else:
+        # Translation note : shapes of XKER_* in modd_rain_ice_paramn.F90
+        acclbdas = (self.ACCLBDAS_MIN, self.ACCLBDAS_MAX, self.NACCLBDAS)
+        acclbdar = (self.ACCLBDAR_MIN, self.ACCLBDAR_MAX, self.NACCLBDAR)
+        drylbdar = (self.DRYLBDAR_MIN, self.DRYLBDAR_MAX, self.NDRYLBDAR)
+        drylbdas = (self.DRYLBDAS_MIN, self.DRYLBDAS_MAX, self.NDRYLBDAS)
+        drylbdag = (self.DRYLBDAG_MIN, self.DRYLBDAG_MAX, self.NDRYLBDAG)
+        grids = {
+            "saccrg": (acclbdar, acclbdas),
+            "raccs": (acclbdas, acclbdar),
+            "raccss": (acclbdas, acclbdar),
+            "rdryg": (drylbdag, drylbdar),
+            "sdryg": (drylbdag, drylbdas),
+        }
+
+        if kernel not in grids:
             raise KeyError(f"{kernel} not found in GlobalTables")
 
+        return load_kernel(kernel, self.rid, *grids[kernel])
+
 
 @dataclass
 class CloudPar:
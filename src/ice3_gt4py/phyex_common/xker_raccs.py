@@ -1,4810 +0,0 @@
-# -*- coding: utf-8 -*-
-import numpy as np
-
-ker_raccss = np.empty((41, 41))
-ker_raccs = np.empty((41, 41))
-ker_saccrg = np.empty((41, 41))
-
-ker_raccss[1, 1] = 0.778513e01
-ker_raccss[1, 2] = 0.611693e01
-ker_raccss[1, 3] = 0.469673e01
-ker_raccss[1, 4] = 0.351291e01
-ker_raccss[1, 5] = 0.255165e01
-ker_raccss[1, 6] = 0.180370e01
-ker_raccss[1, 7] = 0.126294e01
-ker_raccss[1, 8] = 0.924202e00
-ker_raccss[1, 9] = 0.775231e00
-ker_raccss[1, 10] = 0.787292e00
-ker_raccss[1, 11] = 0.911536e00
-ker_raccss[1, 12] = 0.109094e01
-ker_raccss[1, 13] = 0.127926e01
-ker_raccss[1, 14] = 0.145083e01
-ker_raccss[1, 15] = 0.159745e01
-ker_raccss[1, 16] = 0.171978e01
-ker_raccss[1, 17] = 0.182114e01
-ker_raccss[1, 18] = 0.190501e01
-ker_raccss[1, 19] = 0.197441e01
-ker_raccss[1, 20] = 0.203184e01
-ker_raccss[1, 21] = 0.207937e01
-ker_raccss[1, 22] = 0.211870e01
-ker_raccss[1, 23] = 0.215125e01
-ker_raccss[1, 24] = 0.217819e01
-ker_raccss[1, 25] = 0.220049e01
-ker_raccss[1, 26] = 0.221895e01
-ker_raccss[1, 27] = 0.223423e01
-ker_raccss[1, 28] = 0.224687e01
-ker_raccss[1, 29] = 0.225734e01
-ker_raccss[1, 30] = 0.226601e01
-ker_raccss[1, 31] = 0.227318e01
-ker_raccss[1, 32] = 0.227911e01
-ker_raccss[1, 33] = 0.228403e01
-ker_raccss[1, 34] = 0.228810e01
-ker_raccss[1, 35] = 0.229146e01
-ker_raccss[1, 36] = 0.229425e01
-ker_raccss[1, 37] = 0.229656e01
-ker_raccss[1, 38] = 0.229847e01
-ker_raccss[1, 39] = 0.230005e01
-ker_raccss[1, 40] = 0.230136e01
-ker_raccss[2, 1] = 0.777519e01
-ker_raccss[2, 2] = 0.620120e01
-ker_raccss[2, 3] = 0.482130e01
-ker_raccss[2, 4] = 0.365151e01
-ker_raccss[2, 5] = 0.268556e01
-ker_raccss[2, 6] = 0.191605e01
-ker_raccss[2, 7] = 0.134047e01
-ker_raccss[2, 8] = 0.956677e00
-ker_raccss[2, 9] = 0.757265e00
-ker_raccss[2, 10] = 0.720633e00
-ker_raccss[2, 11] = 0.806882e00
-ker_raccss[2, 12] = 0.963181e00
-ker_raccss[2, 13] = 0.114076e01
-ker_raccss[2, 14] = 0.130870e01
-ker_raccss[2, 15] = 0.145451e01
-ker_raccss[2, 16] = 0.157680e01
-ker_raccss[2, 17] = 0.167825e01
-ker_raccss[2, 18] = 0.176221e01
-ker_raccss[2, 19] = 0.183168e01
-ker_raccss[2, 20] = 0.188915e01
-ker_raccss[2, 21] = 0.193671e01
-ker_raccss[2, 22] = 0.197607e01
-ker_raccss[2, 23] = 0.200864e01
-ker_raccss[2, 24] = 0.203559e01
-ker_raccss[2, 25] = 0.205790e01
-ker_raccss[2, 26] = 0.207637e01
-ker_raccss[2, 27] = 0.209165e01
-ker_raccss[2, 28] = 0.210430e01
-ker_raccss[2, 29] = 0.211478e01
-ker_raccss[2, 30] = 0.212344e01
-ker_raccss[2, 31] = 0.213062e01
-ker_raccss[2, 32] = 0.213656e01
-ker_raccss[2, 33] = 0.214147e01
-ker_raccss[2, 34] = 0.214554e01
-ker_raccss[2, 35] = 0.214891e01
-ker_raccss[2, 36] = 0.215170e01
-ker_raccss[2, 37] = 0.215401e01
-ker_raccss[2, 38] = 0.215592e01
-ker_raccss[2, 39] = 0.215750e01
-ker_raccss[2, 40] = 0.215881e01
-ker_raccss[3, 1] = 0.762215e01
-ker_raccss[3, 2] = 0.621106e01
-ker_raccss[3, 3] = 0.490698e01
-ker_raccss[3, 4] = 0.376761e01
-ker_raccss[3, 5] = 0.280896e01
-ker_raccss[3, 6] = 0.202903e01
-ker_raccss[3, 7] = 0.142689e01
-ker_raccss[3, 8] = 0.100388e01
-ker_raccss[3, 9] = 0.757013e00
-ker_raccss[3, 10] = 0.673206e00
-ker_raccss[3, 11] = 0.719335e00
-ker_raccss[3, 12] = 0.849040e00
-ker_raccss[3, 13] = 0.101307e01
-ker_raccss[3, 14] = 0.117592e01
-ker_raccss[3, 15] = 0.132041e01
-ker_raccss[3, 16] = 0.144256e01
-ker_raccss[3, 17] = 0.154410e01
-ker_raccss[3, 18] = 0.162816e01
-ker_raccss[3, 19] = 0.169770e01
-ker_raccss[3, 20] = 0.175523e01
-ker_raccss[3, 21] = 0.180284e01
-ker_raccss[3, 22] = 0.184222e01
-ker_raccss[3, 23] = 0.187482e01
-ker_raccss[3, 24] = 0.190179e01
-ker_raccss[3, 25] = 0.192411e01
-ker_raccss[3, 26] = 0.194259e01
-ker_raccss[3, 27] = 0.195788e01
-ker_raccss[3, 28] = 0.197054e01
-ker_raccss[3, 29] = 0.198101e01
-ker_raccss[3, 30] = 0.198968e01
-ker_raccss[3, 31] = 0.199686e01
-ker_raccss[3, 32] = 0.200280e01
-ker_raccss[3, 33] = 0.200772e01
-ker_raccss[3, 34] = 0.201179e01
-ker_raccss[3, 35] = 0.201516e01
-ker_raccss[3, 36] = 0.201795e01
-ker_raccss[3, 37] = 0.202026e01
-ker_raccss[3, 38] = 0.202217e01
-ker_raccss[3, 39] = 0.202375e01
-ker_raccss[3, 40] = 0.202506e01
-ker_raccss[4, 1] = 0.726688e01
-ker_raccss[4, 2] = 0.610352e01
-ker_raccss[4, 3] = 0.493154e01
-ker_raccss[4, 4] = 0.385226e01
-ker_raccss[4, 5] = 0.291497e01
-ker_raccss[4, 6] = 0.213576e01
-ker_raccss[4, 7] = 0.151726e01
-ker_raccss[4, 8] = 0.106239e01
-ker_raccss[4, 9] = 0.773458e00
-ker_raccss[4, 10] = 0.643197e00
-ker_raccss[4, 11] = 0.648455e00
-ker_raccss[4, 12] = 0.748702e00
-ker_raccss[4, 13] = 0.896286e00
-ker_raccss[4, 14] = 0.105225e01
-ker_raccss[4, 15] = 0.119469e01
-ker_raccss[4, 16] = 0.131651e01
-ker_raccss[4, 17] = 0.141813e01
-ker_raccss[4, 18] = 0.150231e01
-ker_raccss[4, 19] = 0.157195e01
-ker_raccss[4, 20] = 0.162955e01
-ker_raccss[4, 21] = 0.167720e01
-ker_raccss[4, 22] = 0.171662e01
-ker_raccss[4, 23] = 0.174924e01
-ker_raccss[4, 24] = 0.177624e01
-ker_raccss[4, 25] = 0.179858e01
-ker_raccss[4, 26] = 0.181706e01
-ker_raccss[4, 27] = 0.183237e01
-ker_raccss[4, 28] = 0.184503e01
-ker_raccss[4, 29] = 0.185551e01
-ker_raccss[4, 30] = 0.186419e01
-ker_raccss[4, 31] = 0.187137e01
-ker_raccss[4, 32] = 0.187731e01
-ker_raccss[4, 33] = 0.188223e01
-ker_raccss[4, 34] = 0.188630e01
-ker_raccss[4, 35] = 0.188967e01
-ker_raccss[4, 36] = 0.189246e01
-ker_raccss[4, 37] = 0.189477e01
-ker_raccss[4, 38] = 0.189668e01
-ker_raccss[4, 39] = 0.189826e01
-ker_raccss[4, 40] = 0.189957e01
-ker_raccss[5, 1] = 0.666156e01
-ker_raccss[5, 2] = 0.583010e01
-ker_raccss[5, 3] = 0.485991e01
-ker_raccss[5, 4] = 0.388726e01
-ker_raccss[5, 5] = 0.299622e01
-ker_raccss[5, 6] = 0.223002e01
-ker_raccss[5, 7] = 0.160523e01
-ker_raccss[5, 8] = 0.112806e01
-ker_raccss[5, 9] = 0.803444e00
-ker_raccss[5, 10] = 0.630781e00
-ker_raccss[5, 11] = 0.594728e00
-ker_raccss[5, 12] = 0.662791e00
-ker_raccss[5, 13] = 0.790719e00
-ker_raccss[5, 14] = 0.937530e00
-ker_raccss[5, 15] = 0.107695e01
-ker_raccss[5, 16] = 0.119816e01
-ker_raccss[5, 17] = 0.129982e01
-ker_raccss[5, 18] = 0.138414e01
-ker_raccss[5, 19] = 0.145388e01
-ker_raccss[5, 20] = 0.151157e01
-ker_raccss[5, 21] = 0.155928e01
-ker_raccss[5, 22] = 0.159875e01
-ker_raccss[5, 23] = 0.163140e01
-ker_raccss[5, 24] = 0.165842e01
-ker_raccss[5, 25] = 0.168078e01
-ker_raccss[5, 26] = 0.169928e01
-ker_raccss[5, 27] = 0.171459e01
-ker_raccss[5, 28] = 0.172727e01
-ker_raccss[5, 29] = 0.173775e01
-ker_raccss[5, 30] = 0.174643e01
-ker_raccss[5, 31] = 0.175362e01
-ker_raccss[5, 32] = 0.175957e01
-ker_raccss[5, 33] = 0.176449e01
-ker_raccss[5, 34] = 0.176856e01
-ker_raccss[5, 35] = 0.177193e01
-ker_raccss[5, 36] = 0.177472e01
-ker_raccss[5, 37] = 0.177703e01
-ker_raccss[5, 38] = 0.177895e01
-ker_raccss[5, 39] = 0.178053e01
-ker_raccss[5, 40] = 0.178184e01
-ker_raccss[6, 1] = 0.579411e01
-ker_raccss[6, 2] = 0.535171e01
-ker_raccss[6, 3] = 0.465234e01
-ker_raccss[6, 4] = 0.384358e01
-ker_raccss[6, 5] = 0.303756e01
-ker_raccss[6, 6] = 0.230559e01
-ker_raccss[6, 7] = 0.168583e01
-ker_raccss[6, 8] = 0.119580e01
-ker_raccss[6, 9] = 0.843934e00
-ker_raccss[6, 10] = 0.633155e00
-ker_raccss[6, 11] = 0.557339e00
-ker_raccss[6, 12] = 0.591240e00
-ker_raccss[6, 13] = 0.696457e00
-ker_raccss[6, 14] = 0.831746e00
-ker_raccss[6, 15] = 0.966879e00
-ker_raccss[6, 16] = 0.108705e01
-ker_raccss[6, 17] = 0.118868e01
-ker_raccss[6, 18] = 0.127314e01
-ker_raccss[6, 19] = 0.134302e01
-ker_raccss[6, 20] = 0.140081e01
-ker_raccss[6, 21] = 0.144859e01
-ker_raccss[6, 22] = 0.148812e01
-ker_raccss[6, 23] = 0.152081e01
-ker_raccss[6, 24] = 0.154786e01
-ker_raccss[6, 25] = 0.157025e01
-ker_raccss[6, 26] = 0.158876e01
-ker_raccss[6, 27] = 0.160409e01
-ker_raccss[6, 28] = 0.161677e01
-ker_raccss[6, 29] = 0.162727e01
-ker_raccss[6, 30] = 0.163595e01
-ker_raccss[6, 31] = 0.164314e01
-ker_raccss[6, 32] = 0.164909e01
-ker_raccss[6, 33] = 0.165402e01
-ker_raccss[6, 34] = 0.165809e01
-ker_raccss[6, 35] = 0.166147e01
-ker_raccss[6, 36] = 0.166426e01
-ker_raccss[6, 37] = 0.166657e01
-ker_raccss[6, 38] = 0.166848e01
-ker_raccss[6, 39] = 0.167007e01
-ker_raccss[6, 40] = 0.167138e01
-ker_raccss[7, 1] = 0.471256e01
-ker_raccss[7, 2] = 0.465839e01
-ker_raccss[7, 3] = 0.427722e01
-ker_raccss[7, 4] = 0.368892e01
-ker_raccss[7, 5] = 0.301520e01
-ker_raccss[7, 6] = 0.234970e01
-ker_raccss[7, 7] = 0.175327e01
-ker_raccss[7, 8] = 0.126056e01
-ker_raccss[7, 9] = 0.889610e00
-ker_raccss[7, 10] = 0.648011e00
-ker_raccss[7, 11] = 0.534534e00
-ker_raccss[7, 12] = 0.533743e00
-ker_raccss[7, 13] = 0.613806e00
-ker_raccss[7, 14] = 0.735010e00
-ker_raccss[7, 15] = 0.864301e00
-ker_raccss[7, 16] = 0.982807e00
-ker_raccss[7, 17] = 0.108425e01
-ker_raccss[7, 18] = 0.116886e01
-ker_raccss[7, 19] = 0.123890e01
-ker_raccss[7, 20] = 0.129681e01
-ker_raccss[7, 21] = 0.134469e01
-ker_raccss[7, 22] = 0.138428e01
-ker_raccss[7, 23] = 0.141702e01
-ker_raccss[7, 24] = 0.144411e01
-ker_raccss[7, 25] = 0.146652e01
-ker_raccss[7, 26] = 0.148506e01
-ker_raccss[7, 27] = 0.150040e01
-ker_raccss[7, 28] = 0.151309e01
-ker_raccss[7, 29] = 0.152360e01
-ker_raccss[7, 30] = 0.153229e01
-ker_raccss[7, 31] = 0.153949e01
-ker_raccss[7, 32] = 0.154544e01
-ker_raccss[7, 33] = 0.155037e01
-ker_raccss[7, 34] = 0.155445e01
-ker_raccss[7, 35] = 0.155782e01
-ker_raccss[7, 36] = 0.156062e01
-ker_raccss[7, 37] = 0.156293e01
-ker_raccss[7, 38] = 0.156484e01
-ker_raccss[7, 39] = 0.156643e01
-ker_raccss[7, 40] = 0.156774e01
-ker_raccss[8, 1] = 0.353255e01
-ker_raccss[8, 2] = 0.378953e01
-ker_raccss[8, 3] = 0.372636e01
-ker_raccss[8, 4] = 0.339746e01
-ker_raccss[8, 5] = 0.290255e01
-ker_raccss[8, 6] = 0.234259e01
-ker_raccss[8, 7] = 0.179670e01
-ker_raccss[8, 8] = 0.131725e01
-ker_raccss[8, 9] = 0.936217e00
-ker_raccss[8, 10] = 0.670685e00
-ker_raccss[8, 11] = 0.525055e00
-ker_raccss[8, 12] = 0.490553e00
-ker_raccss[8, 13] = 0.543364e00
-ker_raccss[8, 14] = 0.647682e00
-ker_raccss[8, 15] = 0.769109e00
-ker_raccss[8, 16] = 0.885089e00
-ker_raccss[8, 17] = 0.986107e00
-ker_raccss[8, 18] = 0.107085e01
-ker_raccss[8, 19] = 0.114108e01
-ker_raccss[8, 20] = 0.119914e01
-ker_raccss[8, 21] = 0.124712e01
-ker_raccss[8, 22] = 0.128680e01
-ker_raccss[8, 23] = 0.131960e01
-ker_raccss[8, 24] = 0.134673e01
-ker_raccss[8, 25] = 0.136917e01
-ker_raccss[8, 26] = 0.138774e01
-ker_raccss[8, 27] = 0.140310e01
-ker_raccss[8, 28] = 0.141581e01
-ker_raccss[8, 29] = 0.142633e01
-ker_raccss[8, 30] = 0.143503e01
-ker_raccss[8, 31] = 0.144223e01
-ker_raccss[8, 32] = 0.144819e01
-ker_raccss[8, 33] = 0.145312e01
-ker_raccss[8, 34] = 0.145720e01
-ker_raccss[8, 35] = 0.146058e01
-ker_raccss[8, 36] = 0.146338e01
-ker_raccss[8, 37] = 0.146569e01
-ker_raccss[8, 38] = 0.146761e01
-ker_raccss[8, 39] = 0.146919e01
-ker_raccss[8, 40] = 0.147050e01
-ker_raccss[9, 1] = 0.240807e01
-ker_raccss[9, 2] = 0.283932e01
-ker_raccss[9, 3] = 0.303178e01
-ker_raccss[9, 4] = 0.296265e01
-ker_raccss[9, 5] = 0.267871e01
-ker_raccss[9, 6] = 0.226276e01
-ker_raccss[9, 7] = 0.179979e01
-ker_raccss[9, 8] = 0.135674e01
-ker_raccss[9, 9] = 0.979933e00
-ker_raccss[9, 10] = 0.698320e00
-ker_raccss[9, 11] = 0.525242e00
-ker_raccss[9, 12] = 0.460033e00
-ker_raccss[9, 13] = 0.484763e00
-ker_raccss[9, 14] = 0.569735e00
-ker_raccss[9, 15] = 0.681283e00
-ker_raccss[9, 16] = 0.793641e00
-ker_raccss[9, 17] = 0.893878e00
-ker_raccss[9, 18] = 0.978690e00
-ker_raccss[9, 19] = 0.104914e01
-ker_raccss[9, 20] = 0.110738e01
-ker_raccss[9, 21] = 0.115550e01
-ker_raccss[9, 22] = 0.119527e01
-ker_raccss[9, 23] = 0.122815e01
-ker_raccss[9, 24] = 0.125533e01
-ker_raccss[9, 25] = 0.127782e01
-ker_raccss[9, 26] = 0.129641e01
-ker_raccss[9, 27] = 0.131179e01
-ker_raccss[9, 28] = 0.132452e01
-ker_raccss[9, 29] = 0.133505e01
-ker_raccss[9, 30] = 0.134376e01
-ker_raccss[9, 31] = 0.135097e01
-ker_raccss[9, 32] = 0.135694e01
-ker_raccss[9, 33] = 0.136188e01
-ker_raccss[9, 34] = 0.136596e01
-ker_raccss[9, 35] = 0.136934e01
-ker_raccss[9, 36] = 0.137214e01
-ker_raccss[9, 37] = 0.137446e01
-ker_raccss[9, 38] = 0.137637e01
-ker_raccss[9, 39] = 0.137796e01
-ker_raccss[9, 40] = 0.137927e01
-ker_raccss[10, 1] = 0.147671e01
-ker_raccss[10, 2] = 0.193328e01
-ker_raccss[10, 3] = 0.227014e01
-ker_raccss[10, 4] = 0.241054e01
-ker_raccss[10, 5] = 0.233821e01
-ker_raccss[10, 6] = 0.209295e01
-ker_raccss[10, 7] = 0.174482e01
-ker_raccss[10, 8] = 0.136525e01
-ker_raccss[10, 9] = 0.101239e01
-ker_raccss[10, 10] = 0.726741e00
-ker_raccss[10, 11] = 0.533079e00
-ker_raccss[10, 12] = 0.439515e00
-ker_raccss[10, 13] = 0.437071e00
-ker_raccss[10, 14] = 0.501385e00
-ker_raccss[10, 15] = 0.600980e00
-ker_raccss[10, 16] = 0.708337e00
-ker_raccss[10, 17] = 0.807233e00
-ker_raccss[10, 18] = 0.892004e00
-ker_raccss[10, 19] = 0.962681e00
-ker_raccss[10, 20] = 0.102114e01
-ker_raccss[10, 21] = 0.106943e01
-ker_raccss[10, 22] = 0.110932e01
-ker_raccss[10, 23] = 0.114228e01
-ker_raccss[10, 24] = 0.116953e01
-ker_raccss[10, 25] = 0.119207e01
-ker_raccss[10, 26] = 0.121070e01
-ker_raccss[10, 27] = 0.122611e01
-ker_raccss[10, 28] = 0.123886e01
-ker_raccss[10, 29] = 0.124940e01
-ker_raccss[10, 30] = 0.125813e01
-ker_raccss[10, 31] = 0.126535e01
-ker_raccss[10, 32] = 0.127132e01
-ker_raccss[10, 33] = 0.127626e01
-ker_raccss[10, 34] = 0.128035e01
-ker_raccss[10, 35] = 0.128374e01
-ker_raccss[10, 36] = 0.128654e01
-ker_raccss[10, 37] = 0.128886e01
-ker_raccss[10, 38] = 0.129077e01
-ker_raccss[10, 39] = 0.129236e01
-ker_raccss[10, 40] = 0.129368e01
-ker_raccss[11, 1] = 0.808661e00
-ker_raccss[11, 2] = 0.118349e01
-ker_raccss[11, 3] = 0.154344e01
-ker_raccss[11, 4] = 0.180338e01
-ker_raccss[11, 5] = 0.190224e01
-ker_raccss[11, 6] = 0.182880e01
-ker_raccss[11, 7] = 0.161765e01
-ker_raccss[11, 8] = 0.132833e01
-ker_raccss[11, 9] = 0.102209e01
-ker_raccss[11, 10] = 0.749176e00
-ker_raccss[11, 11] = 0.544780e00
-ker_raccss[11, 12] = 0.428018e00
-ker_raccss[11, 13] = 0.399615e00
-ker_raccss[11, 14] = 0.442486e00
-ker_raccss[11, 15] = 0.528291e00
-ker_raccss[11, 16] = 0.629068e00
-ker_raccss[11, 17] = 0.725892e00
-ker_raccss[11, 18] = 0.810425e00
-ker_raccss[11, 19] = 0.881336e00
-ker_raccss[11, 20] = 0.940053e00
-ker_raccss[11, 21] = 0.988540e00
-ker_raccss[11, 22] = 0.102858e01
-ker_raccss[11, 23] = 0.106165e01
-ker_raccss[11, 24] = 0.108898e01
-ker_raccss[11, 25] = 0.111157e01
-ker_raccss[11, 26] = 0.113025e01
-ker_raccss[11, 27] = 0.114569e01
-ker_raccss[11, 28] = 0.115847e01
-ker_raccss[11, 29] = 0.116903e01
-ker_raccss[11, 30] = 0.117777e01
-ker_raccss[11, 31] = 0.118500e01
-ker_raccss[11, 32] = 0.119098e01
-ker_raccss[11, 33] = 0.119593e01
-ker_raccss[11, 34] = 0.120003e01
-ker_raccss[11, 35] = 0.120342e01
-ker_raccss[11, 36] = 0.120622e01
-ker_raccss[11, 37] = 0.120854e01
-ker_raccss[11, 38] = 0.121046e01
-ker_raccss[11, 39] = 0.121205e01
-ker_raccss[11, 40] = 0.121337e01
-ker_raccss[12, 1] = 0.394253e00
-ker_raccss[12, 2] = 0.646179e00
-ker_raccss[12, 3] = 0.942558e00
-ker_raccss[12, 4] = 0.122389e01
-ker_raccss[12, 5] = 0.142127e01
-ker_raccss[12, 6] = 0.148735e01
-ker_raccss[12, 7] = 0.141473e01
-ker_raccss[12, 8] = 0.123412e01
-ker_raccss[12, 9] = 0.996999e00
-ker_raccss[12, 10] = 0.756208e00
-ker_raccss[12, 11] = 0.555253e00
-ker_raccss[12, 12] = 0.422862e00
-ker_raccss[12, 13] = 0.371247e00
-ker_raccss[12, 14] = 0.392052e00
-ker_raccss[12, 15] = 0.462634e00
-ker_raccss[12, 16] = 0.555651e00
-ker_raccss[12, 17] = 0.649618e00
-ker_raccss[12, 18] = 0.733630e00
-ker_raccss[12, 19] = 0.804744e00
-ker_raccss[12, 20] = 0.863761e00
-ker_raccss[12, 21] = 0.912491e00
-ker_raccss[12, 22] = 0.952708e00
-ker_raccss[12, 23] = 0.985912e00
-ker_raccss[12, 24] = 0.101334e01
-ker_raccss[12, 25] = 0.103600e01
-ker_raccss[12, 26] = 0.105473e01
-ker_raccss[12, 27] = 0.107022e01
-ker_raccss[12, 28] = 0.108302e01
-ker_raccss[12, 29] = 0.109361e01
-ker_raccss[12, 30] = 0.110236e01
-ker_raccss[12, 31] = 0.110961e01
-ker_raccss[12, 32] = 0.111560e01
-ker_raccss[12, 33] = 0.112056e01
-ker_raccss[12, 34] = 0.112466e01
-ker_raccss[12, 35] = 0.112805e01
-ker_raccss[12, 36] = 0.113086e01
-ker_raccss[12, 37] = 0.113319e01
-ker_raccss[12, 38] = 0.113511e01
-ker_raccss[12, 39] = 0.113670e01
-ker_raccss[12, 40] = 0.113802e01
-ker_raccss[13, 1] = 0.171360e00
-ker_raccss[13, 2] = 0.313975e00
-ker_raccss[13, 3] = 0.512870e00
-ker_raccss[13, 4] = 0.744995e00
-ker_raccss[13, 5] = 0.962081e00
-ker_raccss[13, 6] = 0.110931e01
-ker_raccss[13, 7] = 0.114976e01
-ker_raccss[13, 8] = 0.107985e01
-ker_raccss[13, 9] = 0.927521e00
-ker_raccss[13, 10] = 0.737617e00
-ker_raccss[13, 11] = 0.556237e00
-ker_raccss[13, 12] = 0.420066e00
-ker_raccss[13, 13] = 0.350230e00
-ker_raccss[13, 14] = 0.349906e00
-ker_raccss[13, 15] = 0.404063e00
-ker_raccss[13, 16] = 0.487780e00
-ker_raccss[13, 17] = 0.578111e00
-ker_raccss[13, 18] = 0.661299e00
-ker_raccss[13, 19] = 0.732568e00
-ker_raccss[13, 20] = 0.791923e00
-ker_raccss[13, 21] = 0.840945e00
-ker_raccss[13, 22] = 0.881381e00
-ker_raccss[13, 23] = 0.914745e00
-ker_raccss[13, 24] = 0.942288e00
-ker_raccss[13, 25] = 0.965037e00
-ker_raccss[13, 26] = 0.983832e00
-ker_raccss[13, 27] = 0.999365e00
-ker_raccss[13, 28] = 0.101221e01
-ker_raccss[13, 29] = 0.102282e01
-ker_raccss[13, 30] = 0.103160e01
-ker_raccss[13, 31] = 0.103886e01
-ker_raccss[13, 32] = 0.104487e01
-ker_raccss[13, 33] = 0.104983e01
-ker_raccss[13, 34] = 0.105394e01
-ker_raccss[13, 35] = 0.105734e01
-ker_raccss[13, 36] = 0.106016e01
-ker_raccss[13, 37] = 0.106248e01
-ker_raccss[13, 38] = 0.106441e01
-ker_raccss[13, 39] = 0.106600e01
-ker_raccss[13, 40] = 0.106732e01
-ker_raccss[14, 1] = 0.880495e-01
-ker_raccss[14, 2] = 0.175611e00
-ker_raccss[14, 3] = 0.247975e00
-ker_raccss[14, 4] = 0.403566e00
-ker_raccss[14, 5] = 0.583307e00
-ker_raccss[14, 6] = 0.748280e00
-ker_raccss[14, 7] = 0.855344e00
-ker_raccss[14, 8] = 0.876333e00
-ker_raccss[14, 9] = 0.811263e00
-ker_raccss[14, 10] = 0.685718e00
-ker_raccss[14, 11] = 0.539707e00
-ker_raccss[14, 12] = 0.412364e00
-ker_raccss[14, 13] = 0.333785e00
-ker_raccss[14, 14] = 0.315877e00
-ker_raccss[14, 15] = 0.352939e00
-ker_raccss[14, 16] = 0.425537e00
-ker_raccss[14, 17] = 0.511002e00
-ker_raccss[14, 18] = 0.593027e00
-ker_raccss[14, 19] = 0.664451e00
-ker_raccss[14, 20] = 0.724208e00
-ker_raccss[14, 21] = 0.773584e00
-ker_raccss[14, 22] = 0.814286e00
-ker_raccss[14, 23] = 0.847845e00
-ker_raccss[14, 24] = 0.875531e00
-ker_raccss[14, 25] = 0.898385e00
-ker_raccss[14, 26] = 0.917258e00
-ker_raccss[14, 27] = 0.932850e00
-ker_raccss[14, 28] = 0.945734e00
-ker_raccss[14, 29] = 0.956384e00
-ker_raccss[14, 30] = 0.965189e00
-ker_raccss[14, 31] = 0.972469e00
-ker_raccss[14, 32] = 0.978490e00
-ker_raccss[14, 33] = 0.983469e00
-ker_raccss[14, 34] = 0.987588e00
-ker_raccss[14, 35] = 0.990995e00
-ker_raccss[14, 36] = 0.993813e00
-ker_raccss[14, 37] = 0.996145e00
-ker_raccss[14, 38] = 0.998074e00
-ker_raccss[14, 39] = 0.999670e00
-ker_raccss[14, 40] = 0.100099e01
-ker_raccss[15, 1] = 0.315291e-01
-ker_raccss[15, 2] = 0.693241e-01
-ker_raccss[15, 3] = 0.137798e00
-ker_raccss[15, 4] = 0.193925e00
-ker_raccss[15, 5] = 0.314161e00
-ker_raccss[15, 6] = 0.451226e00
-ker_raccss[15, 7] = 0.574319e00
-ker_raccss[15, 8] = 0.649498e00
-ker_raccss[15, 9] = 0.656529e00
-ker_raccss[15, 10] = 0.598237e00
-ker_raccss[15, 11] = 0.499202e00
-ker_raccss[15, 12] = 0.394122e00
-ker_raccss[15, 13] = 0.316374e00
-ker_raccss[15, 14] = 0.287121e00
-ker_raccss[15, 15] = 0.308960e00
-ker_raccss[15, 16] = 0.369539e00
-ker_raccss[15, 17] = 0.448627e00
-ker_raccss[15, 18] = 0.528619e00
-ker_raccss[15, 19] = 0.600043e00
-ker_raccss[15, 20] = 0.660278e00
-ker_raccss[15, 21] = 0.710095e00
-ker_raccss[15, 22] = 0.751124e00
-ker_raccss[15, 23] = 0.784920e00
-ker_raccss[15, 24] = 0.812780e00
-ker_raccss[15, 25] = 0.835762e00
-ker_raccss[15, 26] = 0.854730e00
-ker_raccss[15, 27] = 0.870393e00
-ker_raccss[15, 28] = 0.883331e00
-ker_raccss[15, 29] = 0.894022e00
-ker_raccss[15, 30] = 0.902857e00
-ker_raccss[15, 31] = 0.910161e00
-ker_raccss[15, 32] = 0.916200e00
-ker_raccss[15, 33] = 0.921193e00
-ker_raccss[15, 34] = 0.925323e00
-ker_raccss[15, 35] = 0.928738e00
-ker_raccss[15, 36] = 0.931563e00
-ker_raccss[15, 37] = 0.933900e00
-ker_raccss[15, 38] = 0.935833e00
-ker_raccss[15, 39] = 0.937432e00
-ker_raccss[15, 40] = 0.938755e00
-ker_raccss[16, 1] = 0.360358e01
-ker_raccss[16, 2] = 0.281969e01
-ker_raccss[16, 3] = 0.219170e01
-ker_raccss[16, 4] = 0.170588e01
-ker_raccss[16, 5] = 0.135069e01
-ker_raccss[16, 6] = 0.110996e01
-ker_raccss[16, 7] = 0.957328e00
-ker_raccss[16, 8] = 0.855867e00
-ker_raccss[16, 9] = 0.767727e00
-ker_raccss[16, 10] = 0.667811e00
-ker_raccss[16, 11] = 0.551774e00
-ker_raccss[16, 12] = 0.434001e00
-ker_raccss[16, 13] = 0.338225e00
-ker_raccss[16, 14] = 0.285601e00
-ker_raccss[16, 15] = 0.284136e00
-ker_raccss[16, 16] = 0.326430e00
-ker_raccss[16, 17] = 0.394397e00
-ker_raccss[16, 18] = 0.469502e00
-ker_raccss[16, 19] = 0.539605e00
-ker_raccss[16, 20] = 0.599949e00
-ker_raccss[16, 21] = 0.650193e00
-ker_raccss[16, 22] = 0.691608e00
-ker_raccss[16, 23] = 0.725693e00
-ker_raccss[16, 24] = 0.753765e00
-ker_raccss[16, 25] = 0.776902e00
-ker_raccss[16, 26] = 0.795985e00
-ker_raccss[16, 27] = 0.811734e00
-ker_raccss[16, 28] = 0.824737e00
-ker_raccss[16, 29] = 0.835476e00
-ker_raccss[16, 30] = 0.844348e00
-ker_raccss[16, 31] = 0.851681e00
-ker_raccss[16, 32] = 0.857741e00
-ker_raccss[16, 33] = 0.862751e00
-ker_raccss[16, 34] = 0.866894e00
-ker_raccss[16, 35] = 0.870319e00
-ker_raccss[16, 36] = 0.873152e00
-ker_raccss[16, 37] = 0.875495e00
-ker_raccss[16, 38] = 0.877433e00
-ker_raccss[16, 39] = 0.879036e00
-ker_raccss[16, 40] = 0.880362e00
-ker_raccss[17, 1] = 0.472676e01
-ker_raccss[17, 2] = 0.370797e01
-ker_raccss[17, 3] = 0.231793e01
-ker_raccss[17, 4] = 0.179758e01
-ker_raccss[17, 5] = 0.139358e01
-ker_raccss[17, 6] = 0.109574e01
-ker_raccss[17, 7] = 0.890250e00
-ker_raccss[17, 8] = 0.755210e00
-ker_raccss[17, 9] = 0.661386e00
-ker_raccss[17, 10] = 0.579824e00
-ker_raccss[17, 11] = 0.493157e00
-ker_raccss[17, 12] = 0.401316e00
-ker_raccss[17, 13] = 0.318099e00
-ker_raccss[17, 14] = 0.264075e00
-ker_raccss[17, 15] = 0.252206e00
-ker_raccss[17, 16] = 0.282309e00
-ker_raccss[17, 17] = 0.341880e00
-ker_raccss[17, 18] = 0.413082e00
-ker_raccss[17, 19] = 0.482222e00
-ker_raccss[17, 20] = 0.542813e00
-ker_raccss[17, 21] = 0.593576e00
-ker_raccss[17, 22] = 0.635456e00
-ker_raccss[17, 23] = 0.669894e00
-ker_raccss[17, 24] = 0.698224e00
-ker_raccss[17, 25] = 0.721550e00
-ker_raccss[17, 26] = 0.740773e00
-ker_raccss[17, 27] = 0.756626e00
-ker_raccss[17, 28] = 0.769706e00
-ker_raccss[17, 29] = 0.780504e00
-ker_raccss[17, 30] = 0.789421e00
-ker_raccss[17, 31] = 0.796788e00
-ker_raccss[17, 32] = 0.802874e00
-ker_raccss[17, 33] = 0.807905e00
-ker_raccss[17, 34] = 0.812063e00
-ker_raccss[17, 35] = 0.815500e00
-ker_raccss[17, 36] = 0.818342e00
-ker_raccss[17, 37] = 0.820693e00
-ker_raccss[17, 38] = 0.822636e00
-ker_raccss[17, 39] = 0.824244e00
-ker_raccss[17, 40] = 0.825573e00
-ker_raccss[18, 1] = 0.603863e01
-ker_raccss[18, 2] = 0.389316e01
-ker_raccss[18, 3] = 0.305031e01
-ker_raccss[18, 4] = 0.236338e01
-ker_raccss[18, 5] = 0.147231e01
-ker_raccss[18, 6] = 0.113620e01
-ker_raccss[18, 7] = 0.886115e00
-ker_raccss[18, 8] = 0.710209e00
-ker_raccss[18, 9] = 0.590674e00
-ker_raccss[18, 10] = 0.504703e00
-ker_raccss[18, 11] = 0.431038e00
-ker_raccss[18, 12] = 0.358809e00
-ker_raccss[18, 13] = 0.290844e00
-ker_raccss[18, 14] = 0.240768e00
-ker_raccss[18, 15] = 0.223220e00
-ker_raccss[18, 16] = 0.243218e00
-ker_raccss[18, 17] = 0.293836e00
-ker_raccss[18, 18] = 0.360151e00
-ker_raccss[18, 19] = 0.427795e00
-ker_raccss[18, 20] = 0.488580e00
-ker_raccss[18, 21] = 0.539954e00
-ker_raccss[18, 22] = 0.582396e00
-ker_raccss[18, 23] = 0.617263e00
-ker_raccss[18, 24] = 0.645906e00
-ker_raccss[18, 25] = 0.669463e00
-ker_raccss[18, 26] = 0.688855e00
-ker_raccss[18, 27] = 0.704834e00
-ker_raccss[18, 28] = 0.718008e00
-ker_raccss[18, 29] = 0.728877e00
-ker_raccss[18, 30] = 0.737848e00
-ker_raccss[18, 31] = 0.745255e00
-ker_raccss[18, 32] = 0.751373e00
-ker_raccss[18, 33] = 0.756428e00
-ker_raccss[18, 34] = 0.760604e00
-ker_raccss[18, 35] = 0.764056e00
-ker_raccss[18, 36] = 0.766910e00
-ker_raccss[18, 37] = 0.769269e00
-ker_raccss[18, 38] = 0.771219e00
-ker_raccss[18, 39] = 0.772832e00
-ker_raccss[18, 40] = 0.774166e00
-ker_raccss[19, 1] = 0.795385e01
-ker_raccss[19, 2] = 0.638846e01
-ker_raccss[19, 3] = 0.434595e01
-ker_raccss[19, 4] = 0.343549e01
-ker_raccss[19, 5] = 0.268818e01
-ker_raccss[19, 6] = 0.208133e01
-ker_raccss[19, 7] = 0.159740e01
-ker_raccss[19, 8] = 0.122163e01
-ker_raccss[19, 9] = 0.938335e00
-ker_raccss[19, 10] = 0.728285e00
-ker_raccss[19, 11] = 0.570145e00
-ker_raccss[19, 12] = 0.445027e00
-ker_raccss[19, 13] = 0.343893e00
-ker_raccss[19, 14] = 0.268248e00
-ker_raccss[19, 15] = 0.226350e00
-ker_raccss[19, 16] = 0.224325e00
-ker_raccss[19, 17] = 0.257856e00
-ker_raccss[19, 18] = 0.313989e00
-ker_raccss[19, 19] = 0.377472e00
-ker_raccss[19, 20] = 0.437368e00
-ker_raccss[19, 21] = 0.489118e00
-ker_raccss[19, 22] = 0.532165e00
-ker_raccss[19, 23] = 0.567544e00
-ker_raccss[19, 24] = 0.596569e00
-ker_raccss[19, 25] = 0.620406e00
-ker_raccss[19, 26] = 0.640004e00
-ker_raccss[19, 27] = 0.656135e00
-ker_raccss[19, 28] = 0.669424e00
-ker_raccss[19, 29] = 0.680378e00
-ker_raccss[19, 30] = 0.689414e00
-ker_raccss[19, 31] = 0.696870e00
-ker_raccss[19, 32] = 0.703026e00
-ker_raccss[19, 33] = 0.708109e00
-ker_raccss[19, 34] = 0.712308e00
-ker_raccss[19, 35] = 0.715777e00
-ker_raccss[19, 36] = 0.718644e00
-ker_raccss[19, 37] = 0.721014e00
-ker_raccss[19, 38] = 0.722972e00
-ker_raccss[19, 39] = 0.724592e00
-ker_raccss[19, 40] = 0.725930e00
-ker_raccss[20, 1] = 0.634781e01
-ker_raccss[20, 2] = 0.508413e01
-ker_raccss[20, 3] = 0.328893e01
-ker_raccss[20, 4] = 0.259197e01
-ker_raccss[20, 5] = 0.161527e01
-ker_raccss[20, 6] = 0.125279e01
-ker_raccss[20, 7] = 0.963381e00
-ker_raccss[20, 8] = 0.738949e00
-ker_raccss[20, 9] = 0.571583e00
-ker_raccss[20, 10] = 0.451257e00
-ker_raccss[20, 11] = 0.365125e00
-ker_raccss[20, 12] = 0.299475e00
-ker_raccss[20, 13] = 0.245596e00
-ker_raccss[20, 14] = 0.203304e00
-ker_raccss[20, 15] = 0.180537e00
-ker_raccss[20, 16] = 0.185574e00
-ker_raccss[20, 17] = 0.220030e00
-ker_raccss[20, 18] = 0.275495e00
-ker_raccss[20, 19] = 0.338734e00
-ker_raccss[20, 20] = 0.398970e00
-ker_raccss[20, 21] = 0.450959e00
-ker_raccss[20, 22] = 0.493976e00
-ker_raccss[20, 23] = 0.529200e00
-ker_raccss[20, 24] = 0.558067e00
-ker_raccss[20, 25] = 0.581769e00
-ker_raccss[20, 26] = 0.601256e00
-ker_raccss[20, 27] = 0.617297e00
-ker_raccss[20, 28] = 0.630511e00
-ker_raccss[20, 29] = 0.641405e00
-ker_raccss[20, 30] = 0.650392e00
-ker_raccss[20, 31] = 0.657810e00
-ker_raccss[20, 32] = 0.663934e00
-ker_raccss[20, 33] = 0.668992e00
-ker_raccss[20, 34] = 0.673171e00
-ker_raccss[20, 35] = 0.676624e00
-ker_raccss[20, 36] = 0.679478e00
-ker_raccss[20, 37] = 0.681837e00
-ker_raccss[20, 38] = 0.683788e00
-ker_raccss[20, 39] = 0.685401e00
-ker_raccss[20, 40] = 0.686734e00
-ker_raccss[21, 1] = 0.102443e02
-ker_raccss[21, 2] = 0.752283e01
-ker_raccss[21, 3] = 0.532770e01
-ker_raccss[21, 4] = 0.425873e01
-ker_raccss[21, 5] = 0.288056e01
-ker_raccss[21, 6] = 0.226207e01
-ker_raccss[21, 7] = 0.175652e01
-ker_raccss[21, 8] = 0.134803e01
-ker_raccss[21, 9] = 0.102375e01
-ker_raccss[21, 10] = 0.771986e00
-ker_raccss[21, 11] = 0.580680e00
-ker_raccss[21, 12] = 0.436943e00
-ker_raccss[21, 13] = 0.328804e00
-ker_raccss[21, 14] = 0.249300e00
-ker_raccss[21, 15] = 0.198560e00
-ker_raccss[21, 16] = 0.180676e00
-ker_raccss[21, 17] = 0.196350e00
-ker_raccss[21, 18] = 0.238922e00
-ker_raccss[21, 19] = 0.295536e00
-ker_raccss[21, 20] = 0.353574e00
-ker_raccss[21, 21] = 0.405455e00
-ker_raccss[21, 22] = 0.448988e00
-ker_raccss[21, 23] = 0.484753e00
-ker_raccss[21, 24] = 0.514042e00
-ker_raccss[21, 25] = 0.538053e00
-ker_raccss[21, 26] = 0.557767e00
-ker_raccss[21, 27] = 0.573974e00
-ker_raccss[21, 28] = 0.587311e00
-ker_raccss[21, 29] = 0.598297e00
-ker_raccss[21, 30] = 0.607353e00
-ker_raccss[21, 31] = 0.614822e00
-ker_raccss[21, 32] = 0.620985e00
-ker_raccss[21, 33] = 0.626073e00
-ker_raccss[21, 34] = 0.630275e00
-ker_raccss[21, 35] = 0.633746e00
-ker_raccss[21, 36] = 0.636613e00
-ker_raccss[21, 37] = 0.638983e00
-ker_raccss[21, 38] = 0.640942e00
-ker_raccss[21, 39] = 0.642561e00
-ker_raccss[21, 40] = 0.643900e00
-ker_raccss[22, 1] = 0.115320e02
-ker_raccss[22, 2] = 0.885714e01
-ker_raccss[22, 3] = 0.661944e01
-ker_raccss[22, 4] = 0.533800e01
-ker_raccss[22, 5] = 0.383246e01
-ker_raccss[22, 6] = 0.304296e01
-ker_raccss[22, 7] = 0.239235e01
-ker_raccss[22, 8] = 0.185899e01
-ker_raccss[22, 9] = 0.142556e01
-ker_raccss[22, 10] = 0.107781e01
-ker_raccss[22, 11] = 0.803526e00
-ker_raccss[22, 12] = 0.590905e00
-ker_raccss[22, 13] = 0.429091e00
-ker_raccss[22, 14] = 0.309341e00
-ker_raccss[22, 15] = 0.227914e00
-ker_raccss[22, 16] = 0.184487e00
-ker_raccss[22, 17] = 0.179339e00
-ker_raccss[22, 18] = 0.207043e00
-ker_raccss[22, 19] = 0.255369e00
-ker_raccss[22, 20] = 0.310362e00
-ker_raccss[22, 21] = 0.362024e00
-ker_raccss[22, 22] = 0.406192e00
-ker_raccss[22, 23] = 0.442617e00
-ker_raccss[22, 24] = 0.472415e00
-ker_raccss[22, 25] = 0.496799e00
-ker_raccss[22, 26] = 0.516786e00
-ker_raccss[22, 27] = 0.533194e00
-ker_raccss[22, 28] = 0.546679e00
-ker_raccss[22, 29] = 0.557776e00
-ker_raccss[22, 30] = 0.566914e00
-ker_raccss[22, 31] = 0.574445e00
-ker_raccss[22, 32] = 0.580656e00
-ker_raccss[22, 33] = 0.585779e00
-ker_raccss[22, 34] = 0.590009e00
-ker_raccss[22, 35] = 0.593501e00
-ker_raccss[22, 36] = 0.596384e00
-ker_raccss[22, 37] = 0.598767e00
-ker_raccss[22, 38] = 0.600735e00
-ker_raccss[22, 39] = 0.602362e00
-ker_raccss[22, 40] = 0.603707e00
-ker_raccss[23, 1] = 0.120552e02
-ker_raccss[23, 2] = 0.943853e01
-ker_raccss[23, 3] = 0.723099e01
-ker_raccss[23, 4] = 0.538764e01
-ker_raccss[23, 5] = 0.432828e01
-ker_raccss[23, 6] = 0.309359e01
-ker_raccss[23, 7] = 0.244279e01
-ker_raccss[23, 8] = 0.190778e01
-ker_raccss[23, 9] = 0.147059e01
-ker_raccss[23, 10] = 0.111661e01
-ker_raccss[23, 11] = 0.833900e00
-ker_raccss[23, 12] = 0.611721e00
-ker_raccss[23, 13] = 0.440899e00
-ker_raccss[23, 14] = 0.313483e00
-ker_raccss[23, 15] = 0.225201e00
-ker_raccss[23, 16] = 0.175156e00
-ker_raccss[23, 17] = 0.163153e00
-ker_raccss[23, 18] = 0.185306e00
-ker_raccss[23, 19] = 0.230283e00
-ker_raccss[23, 20] = 0.284175e00
-ker_raccss[23, 21] = 0.335712e00
-ker_raccss[23, 22] = 0.379840e00
-ker_raccss[23, 23] = 0.416119e00
-ker_raccss[23, 24] = 0.445741e00
-ker_raccss[23, 25] = 0.469966e00
-ker_raccss[23, 26] = 0.489818e00
-ker_raccss[23, 27] = 0.506111e00
-ker_raccss[23, 28] = 0.519502e00
-ker_raccss[23, 29] = 0.530519e00
-ker_raccss[23, 30] = 0.539593e00
-ker_raccss[23, 31] = 0.547072e00
-ker_raccss[23, 32] = 0.553240e00
-ker_raccss[23, 33] = 0.558330e00
-ker_raccss[23, 34] = 0.562532e00
-ker_raccss[23, 35] = 0.566002e00
-ker_raccss[23, 36] = 0.568868e00
-ker_raccss[23, 37] = 0.571236e00
-ker_raccss[23, 38] = 0.573194e00
-ker_raccss[23, 39] = 0.574812e00
-ker_raccss[23, 40] = 0.576149e00
-ker_raccss[24, 1] = 0.129576e02
-ker_raccss[24, 2] = 0.102975e02
-ker_raccss[24, 3] = 0.818920e01
-ker_raccss[24, 4] = 0.640995e01
-ker_raccss[24, 5] = 0.491149e01
-ker_raccss[24, 6] = 0.394577e01
-ker_raccss[24, 7] = 0.291637e01
-ker_raccss[24, 8] = 0.230081e01
-ker_raccss[24, 9] = 0.179410e01
-ker_raccss[24, 10] = 0.137900e01
-ker_raccss[24, 11] = 0.104163e01
-ker_raccss[24, 12] = 0.770431e00
-ker_raccss[24, 13] = 0.556107e00
-ker_raccss[24, 14] = 0.391190e00
-ker_raccss[24, 15] = 0.270786e00
-ker_raccss[24, 16] = 0.192864e00
-ker_raccss[24, 17] = 0.156677e00
-ker_raccss[24, 18] = 0.159396e00
-ker_raccss[24, 19] = 0.191937e00
-ker_raccss[24, 20] = 0.240898e00
-ker_raccss[24, 21] = 0.292797e00
-ker_raccss[24, 22] = 0.339207e00
-ker_raccss[24, 23] = 0.377404e00
-ker_raccss[24, 24] = 0.408063e00
-ker_raccss[24, 25] = 0.432806e00
-ker_raccss[24, 26] = 0.452971e00
-ker_raccss[24, 27] = 0.469485e00
-ker_raccss[24, 28] = 0.483037e00
-ker_raccss[24, 29] = 0.494174e00
-ker_raccss[24, 30] = 0.503336e00
-ker_raccss[24, 31] = 0.510880e00
-ker_raccss[24, 32] = 0.517096e00
-ker_raccss[24, 33] = 0.522223e00
-ker_raccss[24, 34] = 0.526452e00
-ker_raccss[24, 35] = 0.529943e00
-ker_raccss[24, 36] = 0.532826e00
-ker_raccss[24, 37] = 0.535207e00
-ker_raccss[24, 38] = 0.537174e00
-ker_raccss[24, 39] = 0.538799e00
-ker_raccss[24, 40] = 0.540142e00
-ker_raccss[25, 1] = 0.131514e02
-ker_raccss[25, 2] = 0.106419e02
-ker_raccss[25, 3] = 0.845868e01
-ker_raccss[25, 4] = 0.672282e01
-ker_raccss[25, 5] = 0.526076e01
-ker_raccss[25, 6] = 0.423970e01
-ker_raccss[25, 7] = 0.322433e01
-ker_raccss[25, 8] = 0.255677e01
-ker_raccss[25, 9] = 0.200589e01
-ker_raccss[25, 10] = 0.155266e01
-ker_raccss[25, 11] = 0.118171e01
-ker_raccss[25, 12] = 0.880334e00
-ker_raccss[25, 13] = 0.638726e00
-ker_raccss[25, 14] = 0.449351e00
-ker_raccss[25, 15] = 0.307558e00
-ker_raccss[25, 16] = 0.211438e00
-ker_raccss[25, 17] = 0.160608e00
-ker_raccss[25, 18] = 0.152419e00
-ker_raccss[25, 19] = 0.178285e00
-ker_raccss[25, 20] = 0.223628e00
-ker_raccss[25, 21] = 0.273609e00
-ker_raccss[25, 22] = 0.318759e00
-ker_raccss[25, 23] = 0.356134e00
-ker_raccss[25, 24] = 0.386398e00
-ker_raccss[25, 25] = 0.410983e00
-ker_raccss[25, 26] = 0.431059e00
-ker_raccss[25, 27] = 0.447500e00
-ker_raccss[25, 28] = 0.460986e00
-ker_raccss[25, 29] = 0.472065e00
-ker_raccss[25, 30] = 0.481178e00
-ker_raccss[25, 31] = 0.488681e00
-ker_raccss[25, 32] = 0.494864e00
-ker_raccss[25, 33] = 0.499963e00
-ker_raccss[25, 34] = 0.504169e00
-ker_raccss[25, 35] = 0.507642e00
-ker_raccss[25, 36] = 0.510510e00
-ker_raccss[25, 37] = 0.512879e00
-ker_raccss[25, 38] = 0.514836e00
-ker_raccss[25, 39] = 0.516454e00
-ker_raccss[25, 40] = 0.517791e00
-ker_raccss[26, 1] = 0.132742e02
-ker_raccss[26, 2] = 0.108337e02
-ker_raccss[26, 3] = 0.872586e01
-ker_raccss[26, 4] = 0.703900e01
-ker_raccss[26, 5] = 0.562634e01
-ker_raccss[26, 6] = 0.444059e01
-ker_raccss[26, 7] = 0.356562e01
-ker_raccss[26, 8] = 0.274250e01
-ker_raccss[26, 9] = 0.216207e01
-ker_raccss[26, 10] = 0.168328e01
-ker_raccss[26, 11] = 0.128971e01
-ker_raccss[26, 12] = 0.967844e00
-ker_raccss[26, 13] = 0.707228e00
-ker_raccss[26, 14] = 0.499963e00
-ker_raccss[26, 15] = 0.341292e00
-ker_raccss[26, 16] = 0.229353e00
-ker_raccss[26, 17] = 0.164063e00
-ker_raccss[26, 18] = 0.143754e00
-ker_raccss[26, 19] = 0.160834e00
-ker_raccss[26, 20] = 0.201345e00
-ker_raccss[26, 21] = 0.249884e00
-ker_raccss[26, 22] = 0.295670e00
-ker_raccss[26, 23] = 0.334320e00
-ker_raccss[26, 24] = 0.365515e00
-ker_raccss[26, 25] = 0.390474e00
-ker_raccss[26, 26] = 0.410622e00
-ker_raccss[26, 27] = 0.427051e00
-ker_raccss[26, 28] = 0.440513e00
-ker_raccss[26, 29] = 0.451566e00
-ker_raccss[26, 30] = 0.460654e00
-ker_raccss[26, 31] = 0.468135e00
-ker_raccss[26, 32] = 0.474298e00
-ker_raccss[26, 33] = 0.479380e00
-ker_raccss[26, 34] = 0.483572e00
-ker_raccss[26, 35] = 0.487033e00
-ker_raccss[26, 36] = 0.489891e00
-ker_raccss[26, 37] = 0.492252e00
-ker_raccss[26, 38] = 0.494203e00
-ker_raccss[26, 39] = 0.495815e00
-ker_raccss[26, 40] = 0.497148e00
-ker_raccss[27, 1] = 0.133097e02
-ker_raccss[27, 2] = 0.109011e02
-ker_raccss[27, 3] = 0.888269e01
-ker_raccss[27, 4] = 0.719362e01
-ker_raccss[27, 5] = 0.580985e01
-ker_raccss[27, 6] = 0.465501e01
-ker_raccss[27, 7] = 0.374781e01
-ker_raccss[27, 8] = 0.294825e01
-ker_raccss[27, 9] = 0.233507e01
-ker_raccss[27, 10] = 0.182826e01
-ker_raccss[27, 11] = 0.141027e01
-ker_raccss[27, 12] = 0.106668e01
-ker_raccss[27, 13] = 0.786260e00
-ker_raccss[27, 14] = 0.560532e00
-ker_raccss[27, 15] = 0.384455e00
-ker_raccss[27, 16] = 0.256127e00
-ker_raccss[27, 17] = 0.176040e00
-ker_raccss[27, 18] = 0.143310e00
-ker_raccss[27, 19] = 0.151524e00
-ker_raccss[27, 20] = 0.186916e00
-ker_raccss[27, 21] = 0.233004e00
-ker_raccss[27, 22] = 0.277474e00
-ker_raccss[27, 23] = 0.315252e00
-ker_raccss[27, 24] = 0.345942e00
-ker_raccss[27, 25] = 0.370729e00
-ker_raccss[27, 26] = 0.390865e00
-ker_raccss[27, 27] = 0.407311e00
-ker_raccss[27, 28] = 0.420780e00
-ker_raccss[27, 29] = 0.431832e00
-ker_raccss[27, 30] = 0.440914e00
-ker_raccss[27, 31] = 0.448386e00
-ker_raccss[27, 32] = 0.454540e00
-ker_raccss[27, 33] = 0.459613e00
-ker_raccss[27, 34] = 0.463798e00
-ker_raccss[27, 35] = 0.467251e00
-ker_raccss[27, 36] = 0.470104e00
-ker_raccss[27, 37] = 0.472459e00
-ker_raccss[27, 38] = 0.474406e00
-ker_raccss[27, 39] = 0.476015e00
-ker_raccss[27, 40] = 0.477346e00
-ker_raccss[28, 1] = 0.133115e02
-ker_raccss[28, 2] = 0.109156e02
-ker_raccss[28, 3] = 0.892137e01
-ker_raccss[28, 4] = 0.726595e01
-ker_raccss[28, 5] = 0.588073e01
-ker_raccss[28, 6] = 0.474162e01
-ker_raccss[28, 7] = 0.379341e01
-ker_raccss[28, 8] = 0.303518e01
-ker_raccss[28, 9] = 0.240761e01
-ker_raccss[28, 10] = 0.188860e01
-ker_raccss[28, 11] = 0.146011e01
-ker_raccss[28, 12] = 0.110727e01
-ker_raccss[28, 13] = 0.818541e00
-ker_raccss[28, 14] = 0.585150e00
-ker_raccss[28, 15] = 0.401892e00
-ker_raccss[28, 16] = 0.266865e00
-ker_raccss[28, 17] = 0.180994e00
-ker_raccss[28, 18] = 0.143621e00
-ker_raccss[28, 19] = 0.148709e00
-ker_raccss[28, 20] = 0.182192e00
-ker_raccss[28, 21] = 0.227050e00
-ker_raccss[28, 22] = 0.270562e00
-ker_raccss[28, 23] = 0.307571e00
-ker_raccss[28, 24] = 0.337783e00
-ker_raccss[28, 25] = 0.362333e00
-ker_raccss[28, 26] = 0.382340e00
-ker_raccss[28, 27] = 0.398692e00
-ker_raccss[28, 28] = 0.412083e00
-ker_raccss[28, 29] = 0.423069e00
-ker_raccss[28, 30] = 0.432097e00
-ker_raccss[28, 31] = 0.439525e00
-ker_raccss[28, 32] = 0.445643e00
-ker_raccss[28, 33] = 0.450687e00
-ker_raccss[28, 34] = 0.454848e00
-ker_raccss[28, 35] = 0.458283e00
-ker_raccss[28, 36] = 0.461119e00
-ker_raccss[28, 37] = 0.463463e00
-ker_raccss[28, 38] = 0.465400e00
-ker_raccss[28, 39] = 0.467002e00
-ker_raccss[28, 40] = 0.468326e00
-ker_raccss[29, 1] = 0.133215e02
-ker_raccss[29, 2] = 0.109289e02
-ker_raccss[29, 3] = 0.894604e01
-ker_raccss[29, 4] = 0.730119e01
-ker_raccss[29, 5] = 0.593124e01
-ker_raccss[29, 6] = 0.480144e01
-ker_raccss[29, 7] = 0.386406e01
-ker_raccss[29, 8] = 0.309611e01
-ker_raccss[29, 9] = 0.246034e01
-ker_raccss[29, 10] = 0.193432e01
-ker_raccss[29, 11] = 0.149394e01
-ker_raccss[29, 12] = 0.113665e01
-ker_raccss[29, 13] = 0.843665e00
-ker_raccss[29, 14] = 0.605916e00
-ker_raccss[29, 15] = 0.417943e00
-ker_raccss[29, 16] = 0.277581e00
-ker_raccss[29, 17] = 0.185747e00
-ker_raccss[29, 18] = 0.142370e00
-ker_raccss[29, 19] = 0.142343e00
-ker_raccss[29, 20] = 0.172458e00
-ker_raccss[29, 21] = 0.215669e00
-ker_raccss[29, 22] = 0.258726e00
-ker_raccss[29, 23] = 0.295879e00
-ker_raccss[29, 24] = 0.326452e00
-ker_raccss[29, 25] = 0.351334e00
-ker_raccss[29, 26] = 0.371529e00
-ker_raccss[29, 27] = 0.387939e00
-ker_raccss[29, 28] = 0.401329e00
-ker_raccss[29, 29] = 0.412300e00
-ker_raccss[29, 30] = 0.421310e00
-ker_raccss[29, 31] = 0.428722e00
-ker_raccss[29, 32] = 0.434825e00
-ker_raccss[29, 33] = 0.439856e00
-ker_raccss[29, 34] = 0.444007e00
-ker_raccss[29, 35] = 0.447433e00
-ker_raccss[29, 36] = 0.450262e00
-ker_raccss[29, 37] = 0.452600e00
-ker_raccss[29, 38] = 0.454532e00
-ker_raccss[29, 39] = 0.456130e00
-ker_raccss[29, 40] = 0.457451e00
-ker_raccss[30, 1] = 0.133375e02
-ker_raccss[30, 2] = 0.109457e02
-ker_raccss[30, 3] = 0.896468e01
-ker_raccss[30, 4] = 0.732350e01
-ker_raccss[30, 5] = 0.596323e01
-ker_raccss[30, 6] = 0.483579e01
-ker_raccss[30, 7] = 0.390254e01
-ker_raccss[30, 8] = 0.313132e01
-ker_raccss[30, 9] = 0.249276e01
-ker_raccss[30, 10] = 0.196278e01
-ker_raccss[30, 11] = 0.152606e01
-ker_raccss[30, 12] = 0.116570e01
-ker_raccss[30, 13] = 0.869566e00
-ker_raccss[30, 14] = 0.628357e00
-ker_raccss[30, 15] = 0.436329e00
-ker_raccss[30, 16] = 0.290939e00
-ker_raccss[30, 17] = 0.192920e00
-ker_raccss[30, 18] = 0.142864e00
-ker_raccss[30, 19] = 0.136857e00
-ker_raccss[30, 20] = 0.162977e00
-ker_raccss[30, 21] = 0.204357e00
-ker_raccss[30, 22] = 0.246873e00
-ker_raccss[30, 23] = 0.283849e00
-ker_raccss[30, 24] = 0.314229e00
-ker_raccss[30, 25] = 0.338918e00
-ker_raccss[30, 26] = 0.359002e00
-ker_raccss[30, 27] = 0.375384e00
-ker_raccss[30, 28] = 0.388781e00
-ker_raccss[30, 29] = 0.399761e00
-ker_raccss[30, 30] = 0.408775e00
-ker_raccss[30, 31] = 0.416186e00
-ker_raccss[30, 32] = 0.422287e00
-ker_raccss[30, 33] = 0.427315e00
-ker_raccss[30, 34] = 0.431462e00
-ker_raccss[30, 35] = 0.434884e00
-ker_raccss[30, 36] = 0.437711e00
-ker_raccss[30, 37] = 0.440046e00
-ker_raccss[30, 38] = 0.441975e00
-ker_raccss[30, 39] = 0.443571e00
-ker_raccss[30, 40] = 0.444890e00
-ker_raccss[31, 1] = 0.133457e02
-ker_raccss[31, 2] = 0.109540e02
-ker_raccss[31, 3] = 0.897333e01
-ker_raccss[31, 4] = 0.733289e01
-ker_raccss[31, 5] = 0.597403e01
-ker_raccss[31, 6] = 0.484844e01
-ker_raccss[31, 7] = 0.391622e01
-ker_raccss[31, 8] = 0.314409e01
-ker_raccss[31, 9] = 0.250503e01
-ker_raccss[31, 10] = 0.197608e01
-ker_raccss[31, 11] = 0.153866e01
-ker_raccss[31, 12] = 0.117759e01
-ker_raccss[31, 13] = 0.880647e00
-ker_raccss[31, 14] = 0.638378e00
-ker_raccss[31, 15] = 0.444889e00
-ker_raccss[31, 16] = 0.297371e00
-ker_raccss[31, 17] = 0.196420e00
-ker_raccss[31, 18] = 0.142908e00
-ker_raccss[31, 19] = 0.133631e00
-ker_raccss[31, 20] = 0.157422e00
-ker_raccss[31, 21] = 0.197662e00
-ker_raccss[31, 22] = 0.239819e00
-ker_raccss[31, 23] = 0.276723e00
-ker_raccss[31, 24] = 0.307082e00
-ker_raccss[31, 25] = 0.331764e00
-ker_raccss[31, 26] = 0.351849e00
-ker_raccss[31, 27] = 0.368231e00
-ker_raccss[31, 28] = 0.381625e00
-ker_raccss[31, 29] = 0.392598e00
-ker_raccss[31, 30] = 0.401604e00
-ker_raccss[31, 31] = 0.409008e00
-ker_raccss[31, 32] = 0.415101e00
-ker_raccss[31, 33] = 0.420122e00
-ker_raccss[31, 34] = 0.424262e00
-ker_raccss[31, 35] = 0.427680e00
-ker_raccss[31, 36] = 0.430501e00
-ker_raccss[31, 37] = 0.432833e00
-ker_raccss[31, 38] = 0.434760e00
-ker_raccss[31, 39] = 0.436352e00
-ker_raccss[31, 40] = 0.437670e00
-ker_raccss[32, 1] = 0.133505e02
-ker_raccss[32, 2] = 0.109589e02
-ker_raccss[32, 3] = 0.897836e01
-ker_raccss[32, 4] = 0.733809e01
-ker_raccss[32, 5] = 0.597956e01
-ker_raccss[32, 6] = 0.485431e01
-ker_raccss[32, 7] = 0.392231e01
-ker_raccss[32, 8] = 0.315042e01
-ker_raccss[32, 9] = 0.251126e01
-ker_raccss[32, 10] = 0.198225e01
-ker_raccss[32, 11] = 0.154473e01
-ker_raccss[32, 12] = 0.118355e01
-ker_raccss[32, 13] = 0.886389e00
-ker_raccss[32, 14] = 0.643737e00
-ker_raccss[32, 15] = 0.449607e00
-ker_raccss[32, 16] = 0.300995e00
-ker_raccss[32, 17] = 0.198415e00
-ker_raccss[32, 18] = 0.142843e00
-ker_raccss[32, 19] = 0.131565e00
-ker_raccss[32, 20] = 0.153886e00
-ker_raccss[32, 21] = 0.193406e00
-ker_raccss[32, 22] = 0.235356e00
-ker_raccss[32, 23] = 0.272245e00
-ker_raccss[32, 24] = 0.302622e00
-ker_raccss[32, 25] = 0.327315e00
-ker_raccss[32, 26] = 0.347401e00
-ker_raccss[32, 27] = 0.363781e00
-ker_raccss[32, 28] = 0.377168e00
-ker_raccss[32, 29] = 0.388134e00
-ker_raccss[32, 30] = 0.397132e00
-ker_raccss[32, 31] = 0.404527e00
-ker_raccss[32, 32] = 0.410614e00
-ker_raccss[32, 33] = 0.415629e00
-ker_raccss[32, 34] = 0.419764e00
-ker_raccss[32, 35] = 0.423177e00
-ker_raccss[32, 36] = 0.425995e00
-ker_raccss[32, 37] = 0.428323e00
-ker_raccss[32, 38] = 0.430248e00
-ker_raccss[32, 39] = 0.431839e00
-ker_raccss[32, 40] = 0.433154e00
-ker_raccss[33, 1] = 0.133549e02
-ker_raccss[33, 2] = 0.109634e02
-ker_raccss[33, 3] = 0.898293e01
-ker_raccss[33, 4] = 0.734275e01
-ker_raccss[33, 5] = 0.598430e01
-ker_raccss[33, 6] = 0.485916e01
-ker_raccss[33, 7] = 0.392725e01
-ker_raccss[33, 8] = 0.315543e01
-ker_raccss[33, 9] = 0.251634e01
-ker_raccss[33, 10] = 0.198734e01
-ker_raccss[33, 11] = 0.154980e01
-ker_raccss[33, 12] = 0.118857e01
-ker_raccss[33, 13] = 0.891252e00
-ker_raccss[33, 14] = 0.648304e00
-ker_raccss[33, 15] = 0.453668e00
-ker_raccss[33, 16] = 0.304190e00
-ker_raccss[33, 17] = 0.200247e00
-ker_raccss[33, 18] = 0.142958e00
-ker_raccss[33, 19] = 0.129943e00
-ker_raccss[33, 20] = 0.150972e00
-ker_raccss[33, 21] = 0.189862e00
-ker_raccss[33, 22] = 0.231629e00
-ker_raccss[33, 23] = 0.268519e00
-ker_raccss[33, 24] = 0.298923e00
-ker_raccss[33, 25] = 0.323635e00
-ker_raccss[33, 26] = 0.343732e00
-ker_raccss[33, 27] = 0.360115e00
-ker_raccss[33, 28] = 0.373503e00
-ker_raccss[33, 29] = 0.384466e00
-ker_raccss[33, 30] = 0.393460e00
-ker_raccss[33, 31] = 0.400852e00
-ker_raccss[33, 32] = 0.406935e00
-ker_raccss[33, 33] = 0.411946e00
-ker_raccss[33, 34] = 0.416078e00
-ker_raccss[33, 35] = 0.419488e00
-ker_raccss[33, 36] = 0.422304e00
-ker_raccss[33, 37] = 0.424631e00
-ker_raccss[33, 38] = 0.426553e00
-ker_raccss[33, 39] = 0.428143e00
-ker_raccss[33, 40] = 0.429458e00
-ker_raccss[34, 1] = 0.133545e02
-ker_raccss[34, 2] = 0.109630e02
-ker_raccss[34, 3] = 0.898249e01
-ker_raccss[34, 4] = 0.734231e01
-ker_raccss[34, 5] = 0.598387e01
-ker_raccss[34, 6] = 0.485874e01
-ker_raccss[34, 7] = 0.392685e01
-ker_raccss[34, 8] = 0.315505e01
-ker_raccss[34, 9] = 0.251599e01
-ker_raccss[34, 10] = 0.198703e01
-ker_raccss[34, 11] = 0.154953e01
-ker_raccss[34, 12] = 0.118835e01
-ker_raccss[34, 13] = 0.891084e00
-ker_raccss[34, 14] = 0.648191e00
-ker_raccss[34, 15] = 0.453598e00
-ker_raccss[34, 16] = 0.304088e00
-ker_raccss[34, 17] = 0.200150e00
-ker_raccss[34, 18] = 0.142751e00
-ker_raccss[34, 19] = 0.129699e00
-ker_raccss[34, 20] = 0.150660e00
-ker_raccss[34, 21] = 0.189538e00
-ker_raccss[34, 22] = 0.231282e00
-ker_raccss[34, 23] = 0.268145e00
-ker_raccss[34, 24] = 0.298523e00
-ker_raccss[34, 25] = 0.323213e00
-ker_raccss[34, 26] = 0.343290e00
-ker_raccss[34, 27] = 0.359658e00
-ker_raccss[34, 28] = 0.373032e00
-ker_raccss[34, 29] = 0.383985e00
-ker_raccss[34, 30] = 0.392971e00
-ker_raccss[34, 31] = 0.400356e00
-ker_raccss[34, 32] = 0.406433e00
-ker_raccss[34, 33] = 0.411440e00
-ker_raccss[34, 34] = 0.415568e00
-ker_raccss[34, 35] = 0.418976e00
-ker_raccss[34, 36] = 0.421789e00
-ker_raccss[34, 37] = 0.424114e00
-ker_raccss[34, 38] = 0.426035e00
-ker_raccss[34, 39] = 0.427624e00
-ker_raccss[34, 40] = 0.428937e00
-ker_raccss[35, 1] = 0.133588e02
-ker_raccss[35, 2] = 0.109673e02
-ker_raccss[35, 3] = 0.898695e01
-ker_raccss[35, 4] = 0.734684e01
-ker_raccss[35, 5] = 0.598848e01
-ker_raccss[35, 6] = 0.486341e01
-ker_raccss[35, 7] = 0.393158e01
-ker_raccss[35, 8] = 0.315983e01
-ker_raccss[35, 9] = 0.252079e01
-ker_raccss[35, 10] = 0.199184e01
-ker_raccss[35, 11] = 0.155430e01
-ker_raccss[35, 12] = 0.119306e01
-ker_raccss[35, 13] = 0.895641e00
-ker_raccss[35, 14] = 0.652461e00
-ker_raccss[35, 15] = 0.457402e00
-ker_raccss[35, 16] = 0.307153e00
-ker_raccss[35, 17] = 0.201981e00
-ker_raccss[35, 18] = 0.143041e00
-ker_raccss[35, 19] = 0.128393e00
-ker_raccss[35, 20] = 0.148145e00
-ker_raccss[35, 21] = 0.186428e00
-ker_raccss[35, 22] = 0.228006e00
-ker_raccss[35, 23] = 0.264882e00
-ker_raccss[35, 24] = 0.295301e00
-ker_raccss[35, 25] = 0.320021e00
-ker_raccss[35, 26] = 0.340118e00
-ker_raccss[35, 27] = 0.356498e00
-ker_raccss[35, 28] = 0.369879e00
-ker_raccss[35, 29] = 0.380835e00
-ker_raccss[35, 30] = 0.389822e00
-ker_raccss[35, 31] = 0.397206e00
-ker_raccss[35, 32] = 0.403283e00
-ker_raccss[35, 33] = 0.408288e00
-ker_raccss[35, 34] = 0.412416e00
-ker_raccss[35, 35] = 0.415822e00
-ker_raccss[35, 36] = 0.418634e00
-ker_raccss[35, 37] = 0.420958e00
-ker_raccss[35, 38] = 0.422879e00
-ker_raccss[35, 39] = 0.424467e00
-ker_raccss[35, 40] = 0.425780e00
-ker_raccss[36, 1] = 0.133693e02
-ker_raccss[36, 2] = 0.109781e02
-ker_raccss[36, 3] = 0.899787e01
-ker_raccss[36, 4] = 0.735793e01
-ker_raccss[36, 5] = 0.599972e01
-ker_raccss[36, 6] = 0.487480e01
-ker_raccss[36, 7] = 0.394309e01
-ker_raccss[36, 8] = 0.317142e01
-ker_raccss[36, 9] = 0.253243e01
-ker_raccss[36, 10] = 0.200346e01
-ker_raccss[36, 11] = 0.156582e01
-ker_raccss[36, 12] = 0.120440e01
-ker_raccss[36, 13] = 0.906578e00
-ker_raccss[36, 14] = 0.662698e00
-ker_raccss[36, 15] = 0.466524e00
-ker_raccss[36, 16] = 0.314682e00
-ker_raccss[36, 17] = 0.206574e00
-ker_raccss[36, 18] = 0.144245e00
-ker_raccss[36, 19] = 0.125763e00
-ker_raccss[36, 20] = 0.142684e00
-ker_raccss[36, 21] = 0.179440e00
-ker_raccss[36, 22] = 0.220596e00
-ker_raccss[36, 23] = 0.257524e00
-ker_raccss[36, 24] = 0.288068e00
-ker_raccss[36, 25] = 0.312888e00
-ker_raccss[36, 26] = 0.333055e00
-ker_raccss[36, 27] = 0.349481e00
-ker_raccss[36, 28] = 0.362892e00
-ker_raccss[36, 29] = 0.373867e00
-ker_raccss[36, 30] = 0.382866e00
-ker_raccss[36, 31] = 0.390258e00
-ker_raccss[36, 32] = 0.396339e00
-ker_raccss[36, 33] = 0.401346e00
-ker_raccss[36, 34] = 0.405475e00
-ker_raccss[36, 35] = 0.408881e00
-ker_raccss[36, 36] = 0.411694e00
-ker_raccss[36, 37] = 0.414017e00
-ker_raccss[36, 38] = 0.415937e00
-ker_raccss[36, 39] = 0.417525e00
-ker_raccss[36, 40] = 0.418837e00
-ker_raccss[37, 1] = 0.000000e00
-ker_raccss[37, 2] = 0.000000e00
-ker_raccss[37, 3] = 0.000000e00
-ker_raccss[37, 4] = 0.000000e00
-ker_raccss[37, 5] = 0.000000e00
-ker_raccss[37, 6] = 0.000000e00
-ker_raccss[37, 7] = 0.000000e00
-ker_raccss[37, 8] = 0.000000e00
-ker_raccss[37, 9] = 0.000000e00
-ker_raccss[37, 10] = 0.000000e00
-ker_raccss[37, 11] = 0.000000e00
-ker_raccss[37, 12] = 0.000000e00
-ker_raccss[37, 13] = 0.000000e00
-ker_raccss[37, 14] = 0.000000e00
-ker_raccss[37, 15] = 0.000000e00
-ker_raccss[37, 16] = 0.000000e00
-ker_raccss[37, 17] = 0.000000e00
-ker_raccss[37, 18] = 0.000000e00
-ker_raccss[37, 19] = 0.000000e00
-ker_raccss[37, 20] = 0.000000e00
-ker_raccss[37, 21] = 0.000000e00
-ker_raccss[37, 22] = 0.000000e00
-ker_raccss[37, 23] = 0.000000e00
-ker_raccss[37, 24] = 0.000000e00
-ker_raccss[37, 25] = 0.000000e00
-ker_raccss[37, 26] = 0.000000e00
-ker_raccss[37, 27] = 0.000000e00
-ker_raccss[37, 28] = 0.000000e00
-ker_raccss[37, 29] = 0.000000e00
-ker_raccss[37, 30] = 0.000000e00
-ker_raccss[37, 31] = 0.000000e00
-ker_raccss[37, 32] = 0.000000e00
-ker_raccss[37, 33] = 0.000000e00
-ker_raccss[37, 34] = 0.000000e00
-ker_raccss[37, 35] = 0.000000e00
-ker_raccss[37, 36] = 0.000000e00
-ker_raccss[37, 37] = 0.000000e00
-ker_raccss[37, 38] = 0.000000e00
-ker_raccss[37, 39] = 0.000000e00
-ker_raccss[37, 40] = 0.000000e00
-ker_raccss[38, 1] = 0.000000e00
-ker_raccss[38, 2] = 0.000000e00
-ker_raccss[38, 3] = 0.000000e00
-ker_raccss[38, 4] = 0.000000e00
-ker_raccss[38, 5] = 0.000000e00
-ker_raccss[38, 6] = 0.000000e00
-ker_raccss[38, 7] = 0.000000e00
-ker_raccss[38, 8] = 0.000000e00
-ker_raccss[38, 9] = 0.000000e00
-ker_raccss[38, 10] = 0.000000e00
-ker_raccss[38, 11] = 0.000000e00
-ker_raccss[38, 12] = 0.000000e00
-ker_raccss[38, 13] = 0.000000e00
-ker_raccss[38, 14] = 0.000000e00
-ker_raccss[38, 15] = 0.000000e00
-ker_raccss[38, 16] = 0.000000e00
-ker_raccss[38, 17] = 0.000000e00
-ker_raccss[38, 18] = 0.000000e00
-ker_raccss[38, 19] = 0.000000e00
-ker_raccss[38, 20] = 0.000000e00
-ker_raccss[38, 21] = 0.000000e00
-ker_raccss[38, 22] = 0.000000e00
-ker_raccss[38, 23] = 0.000000e00
-ker_raccss[38, 24] = 0.000000e00
-ker_raccss[38, 25] = 0.000000e00
-ker_raccss[38, 26] = 0.000000e00
-ker_raccss[38, 27] = 0.000000e00
-ker_raccss[38, 28] = 0.000000e00
-ker_raccss[38, 29] = 0.000000e00
-ker_raccss[38, 30] = 0.000000e00
-ker_raccss[38, 31] = 0.000000e00
-ker_raccss[38, 32] = 0.000000e00
-ker_raccss[38, 33] = 0.000000e00
-ker_raccss[38, 34] = 0.000000e00
-ker_raccss[38, 35] = 0.000000e00
-ker_raccss[38, 36] = 0.000000e00
-ker_raccss[38, 37] = 0.000000e00
-ker_raccss[38, 38] = 0.000000e00
-ker_raccss[38, 39] = 0.000000e00
-ker_raccss[38, 40] = 0.000000e00
-ker_raccss[39, 1] = 0.000000e00
-ker_raccss[39, 2] = 0.000000e00
-ker_raccss[39, 3] = 0.000000e00
-ker_raccss[39, 4] = 0.000000e00
-ker_raccss[39, 5] = 0.000000e00
-ker_raccss[39, 6] = 0.000000e00
-ker_raccss[39, 7] = 0.000000e00
-ker_raccss[39, 8] = 0.000000e00
-ker_raccss[39, 9] = 0.000000e00
-ker_raccss[39, 10] = 0.000000e00
-ker_raccss[39, 11] = 0.000000e00
-ker_raccss[39, 12] = 0.000000e00
-ker_raccss[39, 13] = 0.000000e00
-ker_raccss[39, 14] = 0.000000e00
-ker_raccss[39, 15] = 0.000000e00
-ker_raccss[39, 16] = 0.000000e00
-ker_raccss[39, 17] = 0.000000e00
-ker_raccss[39, 18] = 0.000000e00
-ker_raccss[39, 19] = 0.000000e00
-ker_raccss[39, 20] = 0.000000e00
-ker_raccss[39, 21] = 0.000000e00
-ker_raccss[39, 22] = 0.000000e00
-ker_raccss[39, 23] = 0.000000e00
-ker_raccss[39, 24] = 0.000000e00
-ker_raccss[39, 25] = 0.000000e00
-ker_raccss[39, 26] = 0.000000e00
-ker_raccss[39, 27] = 0.000000e00
-ker_raccss[39, 28] = 0.000000e00
-ker_raccss[39, 29] = 0.000000e00
-ker_raccss[39, 30] = 0.000000e00
-ker_raccss[39, 31] = 0.000000e00
-ker_raccss[39, 32] = 0.000000e00
-ker_raccss[39, 33] = 0.000000e00
-ker_raccss[39, 34] = 0.000000e00
-ker_raccss[39, 35] = 0.000000e00
-ker_raccss[39, 36] = 0.000000e00
-ker_raccss[39, 37] = 0.000000e00
-ker_raccss[39, 38] = 0.000000e00
-ker_raccss[39, 39] = 0.000000e00
-ker_raccss[39, 40] = 0.000000e00
-ker_raccss[40, 1] = 0.000000e00
-ker_raccss[40, 2] = 0.000000e00
-ker_raccss[40, 3] = 0.000000e00
-ker_raccss[40, 4] = 0.000000e00
-ker_raccss[40, 5] = 0.000000e00
-ker_raccss[40, 6] = 0.000000e00
-ker_raccss[40, 7] = 0.000000e00
-ker_raccss[40, 8] = 0.000000e00
-ker_raccss[40, 9] = 0.000000e00
-ker_raccss[40, 10] = 0.000000e00
-ker_raccss[40, 11] = 0.000000e00
-ker_raccss[40, 12] = 0.000000e00
-ker_raccss[40, 13] = 0.000000e00
-ker_raccss[40, 14] = 0.000000e00
-ker_raccss[40, 15] = 0.000000e00
-ker_raccss[40, 16] = 0.000000e00
-ker_raccss[40, 17] = 0.000000e00
-ker_raccss[40, 18] = 0.000000e00
-ker_raccss[40, 19] = 0.000000e00
-ker_raccss[40, 20] = 0.000000e00
-ker_raccss[40, 21] = 0.000000e00
-ker_raccss[40, 22] = 0.000000e00
-ker_raccss[40, 23] = 0.000000e00
-ker_raccss[40, 24] = 0.000000e00
-ker_raccss[40, 25] = 0.000000e00
-ker_raccss[40, 26] = 0.000000e00
-ker_raccss[40, 27] = 0.000000e00
-ker_raccss[40, 28] = 0.000000e00
-ker_raccss[40, 29] = 0.000000e00
-ker_raccss[40, 30] = 0.000000e00
-ker_raccss[40, 31] = 0.000000e00
-ker_raccss[40, 32] = 0.000000e00
-ker_raccss[40, 33] = 0.000000e00
-ker_raccss[40, 34] = 0.000000e00
-ker_raccss[40, 35] = 0.000000e00
-ker_raccss[40, 36] = 0.000000e00
-ker_raccss[40, 37] = 0.000000e00
-ker_raccss[40, 38] = 0.000000e00
-ker_raccss[40, 39] = 0.000000e00
-ker_raccss[40, 40] = 0.000000e00
-
-
-ker_raccs[1, 1] = 0.810035e01
-ker_raccs[1, 2] = 0.624606e01
-ker_raccs[1, 3] = 0.474070e01
-ker_raccs[1, 4] = 0.352376e01
-ker_raccs[1, 5] = 0.255333e01
-ker_raccs[1, 6] = 0.180384e01
-ker_raccs[1, 7] = 0.126294e01
-ker_raccs[1, 8] = 0.924202e00
-ker_raccs[1, 9] = 0.775231e00
-ker_raccs[1, 10] = 0.787292e00
-ker_raccs[1, 11] = 0.911536e00
-ker_raccs[1, 12] = 0.109094e01
-ker_raccs[1, 13] = 0.127926e01
-ker_raccs[1, 14] = 0.145083e01
-ker_raccs[1, 15] = 0.159745e01
-ker_raccs[1, 16] = 0.171978e01
-ker_raccs[1, 17] = 0.182114e01
-ker_raccs[1, 18] = 0.190501e01
-ker_raccs[1, 19] = 0.197441e01
-ker_raccs[1, 20] = 0.203184e01
-ker_raccs[1, 21] = 0.207937e01
-ker_raccs[1, 22] = 0.211870e01
-ker_raccs[1, 23] = 0.215125e01
-ker_raccs[1, 24] = 0.217819e01
-ker_raccs[1, 25] = 0.220049e01
-ker_raccs[1, 26] = 0.221895e01
-ker_raccs[1, 27] = 0.223423e01
-ker_raccs[1, 28] = 0.224687e01
-ker_raccs[1, 29] = 0.225734e01
-ker_raccs[1, 30] = 0.226601e01
-ker_raccs[1, 31] = 0.227318e01
-ker_raccs[1, 32] = 0.227911e01
-ker_raccs[1, 33] = 0.228403e01
-ker_raccs[1, 34] = 0.228810e01
-ker_raccs[1, 35] = 0.229146e01
-ker_raccs[1, 36] = 0.229425e01
-ker_raccs[1, 37] = 0.229656e01
-ker_raccs[1, 38] = 0.229847e01
-ker_raccs[1, 39] = 0.230005e01
-ker_raccs[1, 40] = 0.230136e01
-ker_raccs[2, 1] = 0.835048e01
-ker_raccs[2, 2] = 0.645953e01
-ker_raccs[2, 3] = 0.492716e01
-ker_raccs[2, 4] = 0.368761e01
-ker_raccs[2, 5] = 0.269450e01
-ker_raccs[2, 6] = 0.191744e01
-ker_raccs[2, 7] = 0.134059e01
-ker_raccs[2, 8] = 0.956675e00
-ker_raccs[2, 9] = 0.757265e00
-ker_raccs[2, 10] = 0.720633e00
-ker_raccs[2, 11] = 0.806882e00
-ker_raccs[2, 12] = 0.963181e00
-ker_raccs[2, 13] = 0.114076e01
-ker_raccs[2, 14] = 0.130870e01
-ker_raccs[2, 15] = 0.145451e01
-ker_raccs[2, 16] = 0.157680e01
-ker_raccs[2, 17] = 0.167825e01
-ker_raccs[2, 18] = 0.176221e01
-ker_raccs[2, 19] = 0.183168e01
-ker_raccs[2, 20] = 0.188915e01
-ker_raccs[2, 21] = 0.193671e01
-ker_raccs[2, 22] = 0.197607e01
-ker_raccs[2, 23] = 0.200864e01
-ker_raccs[2, 24] = 0.203559e01
-ker_raccs[2, 25] = 0.205790e01
-ker_raccs[2, 26] = 0.207637e01
-ker_raccs[2, 27] = 0.209165e01
-ker_raccs[2, 28] = 0.210430e01
-ker_raccs[2, 29] = 0.211478e01
-ker_raccs[2, 30] = 0.212344e01
-ker_raccs[2, 31] = 0.213062e01
-ker_raccs[2, 32] = 0.213656e01
-ker_raccs[2, 33] = 0.214147e01
-ker_raccs[2, 34] = 0.214554e01
-ker_raccs[2, 35] = 0.214891e01
-ker_raccs[2, 36] = 0.215170e01
-ker_raccs[2, 37] = 0.215401e01
-ker_raccs[2, 38] = 0.215592e01
-ker_raccs[2, 39] = 0.215750e01
-ker_raccs[2, 40] = 0.215881e01
-ker_raccs[3, 1] = 0.861642e01
-ker_raccs[3, 2] = 0.668233e01
-ker_raccs[3, 3] = 0.511848e01
-ker_raccs[3, 4] = 0.385427e01
-ker_raccs[3, 5] = 0.283858e01
-ker_raccs[3, 6] = 0.203643e01
-ker_raccs[3, 7] = 0.142806e01
-ker_raccs[3, 8] = 0.100397e01
-ker_raccs[3, 9] = 0.757020e00
-ker_raccs[3, 10] = 0.673206e00
-ker_raccs[3, 11] = 0.719335e00
-ker_raccs[3, 12] = 0.849040e00
-ker_raccs[3, 13] = 0.101307e01
-ker_raccs[3, 14] = 0.117592e01
-ker_raccs[3, 15] = 0.132041e01
-ker_raccs[3, 16] = 0.144256e01
-ker_raccs[3, 17] = 0.154410e01
-ker_raccs[3, 18] = 0.162816e01
-ker_raccs[3, 19] = 0.169770e01
-ker_raccs[3, 20] = 0.175523e01
-ker_raccs[3, 21] = 0.180284e01
-ker_raccs[3, 22] = 0.184222e01
-ker_raccs[3, 23] = 0.187482e01
-ker_raccs[3, 24] = 0.190179e01
-ker_raccs[3, 25] = 0.192411e01
-ker_raccs[3, 26] = 0.194259e01
-ker_raccs[3, 27] = 0.195788e01
-ker_raccs[3, 28] = 0.197054e01
-ker_raccs[3, 29] = 0.198101e01
-ker_raccs[3, 30] = 0.198968e01
-ker_raccs[3, 31] = 0.199686e01
-ker_raccs[3, 32] = 0.200280e01
-ker_raccs[3, 33] = 0.200772e01
-ker_raccs[3, 34] = 0.201179e01
-ker_raccs[3, 35] = 0.201516e01
-ker_raccs[3, 36] = 0.201795e01
-ker_raccs[3, 37] = 0.202026e01
-ker_raccs[3, 38] = 0.202217e01
-ker_raccs[3, 39] = 0.202375e01
-ker_raccs[3, 40] = 0.202506e01
-ker_raccs[4, 1] = 0.890193e01
-ker_raccs[4, 2] = 0.691781e01
-ker_raccs[4, 3] = 0.531713e01
-ker_raccs[4, 4] = 0.402519e01
-ker_raccs[4, 5] = 0.298590e01
-ker_raccs[4, 6] = 0.216006e01
-ker_raccs[4, 7] = 0.152334e01
-ker_raccs[4, 8] = 0.106334e01
-ker_raccs[4, 9] = 0.773535e00
-ker_raccs[4, 10] = 0.643200e00
-ker_raccs[4, 11] = 0.648455e00
-ker_raccs[4, 12] = 0.748702e00
-ker_raccs[4, 13] = 0.896286e00
-ker_raccs[4, 14] = 0.105225e01
-ker_raccs[4, 15] = 0.119469e01
-ker_raccs[4, 16] = 0.131651e01
-ker_raccs[4, 17] = 0.141813e01
-ker_raccs[4, 18] = 0.150231e01
-ker_raccs[4, 19] = 0.157195e01
-ker_raccs[4, 20] = 0.162955e01
-ker_raccs[4, 21] = 0.167720e01
-ker_raccs[4, 22] = 0.171662e01
-ker_raccs[4, 23] = 0.174924e01
-ker_raccs[4, 24] = 0.177624e01
-ker_raccs[4, 25] = 0.179858e01
-ker_raccs[4, 26] = 0.181706e01
-ker_raccs[4, 27] = 0.183237e01
-ker_raccs[4, 28] = 0.184503e01
-ker_raccs[4, 29] = 0.185551e01
-ker_raccs[4, 30] = 0.186419e01
-ker_raccs[4, 31] = 0.187137e01
-ker_raccs[4, 32] = 0.187731e01
-ker_raccs[4, 33] = 0.188223e01
-ker_raccs[4, 34] = 0.188630e01
-ker_raccs[4, 35] = 0.188967e01
-ker_raccs[4, 36] = 0.189246e01
-ker_raccs[4, 37] = 0.189477e01
-ker_raccs[4, 38] = 0.189668e01
-ker_raccs[4, 39] = 0.189826e01
-ker_raccs[4, 40] = 0.189957e01
-ker_raccs[5, 1] = 0.920977e01
-ker_raccs[5, 2] = 0.716900e01
-ker_raccs[5, 3] = 0.552588e01
-ker_raccs[5, 4] = 0.420224e01
-ker_raccs[5, 5] = 0.313744e01
-ker_raccs[5, 6] = 0.228804e01
-ker_raccs[5, 7] = 0.162515e01
-ker_raccs[5, 8] = 0.113305e01
-ker_raccs[5, 9] = 0.804245e00
-ker_raccs[5, 10] = 0.630831e00
-ker_raccs[5, 11] = 0.594727e00
-ker_raccs[5, 12] = 0.662791e00
-ker_raccs[5, 13] = 0.790719e00
-ker_raccs[5, 14] = 0.937530e00
-ker_raccs[5, 15] = 0.107695e01
-ker_raccs[5, 16] = 0.119816e01
-ker_raccs[5, 17] = 0.129982e01
-ker_raccs[5, 18] = 0.138414e01
-ker_raccs[5, 19] = 0.145388e01
-ker_raccs[5, 20] = 0.151157e01
-ker_raccs[5, 21] = 0.155928e01
-ker_raccs[5, 22] = 0.159875e01
-ker_raccs[5, 23] = 0.163140e01
-ker_raccs[5, 24] = 0.165842e01
-ker_raccs[5, 25] = 0.168078e01
-ker_raccs[5, 26] = 0.169928e01
-ker_raccs[5, 27] = 0.171459e01
-ker_raccs[5, 28] = 0.172727e01
-ker_raccs[5, 29] = 0.173775e01
-ker_raccs[5, 30] = 0.174643e01
-ker_raccs[5, 31] = 0.175362e01
-ker_raccs[5, 32] = 0.175957e01
-ker_raccs[5, 33] = 0.176449e01
-ker_raccs[5, 34] = 0.176856e01
-ker_raccs[5, 35] = 0.177193e01
-ker_raccs[5, 36] = 0.177472e01
-ker_raccs[5, 37] = 0.177703e01
-ker_raccs[5, 38] = 0.177895e01
-ker_raccs[5, 39] = 0.178053e01
-ker_raccs[5, 40] = 0.178184e01
-ker_raccs[6, 1] = 0.954082e01
-ker_raccs[6, 2] = 0.743810e01
-ker_raccs[6, 3] = 0.574728e01
-ker_raccs[6, 4] = 0.438753e01
-ker_raccs[6, 5] = 0.329456e01
-ker_raccs[6, 6] = 0.242082e01
-ker_raccs[6, 7] = 0.173320e01
-ker_raccs[6, 8] = 0.121220e01
-ker_raccs[6, 9] = 0.848100e00
-ker_raccs[6, 10] = 0.633831e00
-ker_raccs[6, 11] = 0.557416e00
-ker_raccs[6, 12] = 0.591242e00
-ker_raccs[6, 13] = 0.696457e00
-ker_raccs[6, 14] = 0.831746e00
-ker_raccs[6, 15] = 0.966879e00
-ker_raccs[6, 16] = 0.108705e01
-ker_raccs[6, 17] = 0.118868e01
-ker_raccs[6, 18] = 0.127314e01
-ker_raccs[6, 19] = 0.134302e01
-ker_raccs[6, 20] = 0.140081e01
-ker_raccs[6, 21] = 0.144859e01
-ker_raccs[6, 22] = 0.148812e01
-ker_raccs[6, 23] = 0.152081e01
-ker_raccs[6, 24] = 0.154786e01
-ker_raccs[6, 25] = 0.157025e01
-ker_raccs[6, 26] = 0.158876e01
-ker_raccs[6, 27] = 0.160409e01
-ker_raccs[6, 28] = 0.161677e01
-ker_raccs[6, 29] = 0.162727e01
-ker_raccs[6, 30] = 0.163595e01
-ker_raccs[6, 31] = 0.164314e01
-ker_raccs[6, 32] = 0.164909e01
-ker_raccs[6, 33] = 0.165402e01
-ker_raccs[6, 34] = 0.165809e01
-ker_raccs[6, 35] = 0.166147e01
-ker_raccs[6, 36] = 0.166426e01
-ker_raccs[6, 37] = 0.166657e01
-ker_raccs[6, 38] = 0.166848e01
-ker_raccs[6, 39] = 0.167007e01
-ker_raccs[6, 40] = 0.167138e01
-ker_raccs[7, 1] = 0.989299e01
-ker_raccs[7, 2] = 0.772578e01
-ker_raccs[7, 3] = 0.598316e01
-ker_raccs[7, 4] = 0.458298e01
-ker_raccs[7, 5] = 0.345874e01
-ker_raccs[7, 6] = 0.255904e01
-ker_raccs[7, 7] = 0.184707e01
-ker_raccs[7, 8] = 0.129931e01
-ker_raccs[7, 9] = 0.903048e00
-ker_raccs[7, 10] = 0.651461e00
-ker_raccs[7, 11] = 0.535102e00
-ker_raccs[7, 12] = 0.533793e00
-ker_raccs[7, 13] = 0.613816e00
-ker_raccs[7, 14] = 0.735010e00
-ker_raccs[7, 15] = 0.864301e00
-ker_raccs[7, 16] = 0.982807e00
-ker_raccs[7, 17] = 0.108425e01
-ker_raccs[7, 18] = 0.116886e01
-ker_raccs[7, 19] = 0.123890e01
-ker_raccs[7, 20] = 0.129681e01
-ker_raccs[7, 21] = 0.134469e01
-ker_raccs[7, 22] = 0.138428e01
-ker_raccs[7, 23] = 0.141702e01
-ker_raccs[7, 24] = 0.144411e01
-ker_raccs[7, 25] = 0.146652e01
-ker_raccs[7, 26] = 0.148506e01
-ker_raccs[7, 27] = 0.150040e01
-ker_raccs[7, 28] = 0.151309e01
-ker_raccs[7, 29] = 0.152360e01
-ker_raccs[7, 30] = 0.153229e01
-ker_raccs[7, 31] = 0.153949e01
-ker_raccs[7, 32] = 0.154544e01
-ker_raccs[7, 33] = 0.155037e01
-ker_raccs[7, 34] = 0.155445e01
-ker_raccs[7, 35] = 0.155782e01
-ker_raccs[7, 36] = 0.156062e01
-ker_raccs[7, 37] = 0.156293e01
-ker_raccs[7, 38] = 0.156484e01
-ker_raccs[7, 39] = 0.156643e01
-ker_raccs[7, 40] = 0.156774e01
-ker_raccs[8, 1] = 0.102606e02
-ker_raccs[8, 2] = 0.803025e01
-ker_raccs[8, 3] = 0.623398e01
-ker_raccs[8, 4] = 0.479013e01
-ker_raccs[8, 5] = 0.363141e01
-ker_raccs[8, 6] = 0.270370e01
-ker_raccs[8, 7] = 0.196690e01
-ker_raccs[8, 8] = 0.139353e01
-ker_raccs[8, 9] = 0.967762e00
-ker_raccs[8, 10] = 0.681746e00
-ker_raccs[8, 11] = 0.527901e00
-ker_raccs[8, 12] = 0.491036e00
-ker_raccs[8, 13] = 0.543394e00
-ker_raccs[8, 14] = 0.647673e00
-ker_raccs[8, 15] = 0.769109e00
-ker_raccs[8, 16] = 0.885089e00
-ker_raccs[8, 17] = 0.986107e00
-ker_raccs[8, 18] = 0.107085e01
-ker_raccs[8, 19] = 0.114108e01
-ker_raccs[8, 20] = 0.119914e01
-ker_raccs[8, 21] = 0.124712e01
-ker_raccs[8, 22] = 0.128680e01
-ker_raccs[8, 23] = 0.131960e01
-ker_raccs[8, 24] = 0.134673e01
-ker_raccs[8, 25] = 0.136917e01
-ker_raccs[8, 26] = 0.138774e01
-ker_raccs[8, 27] = 0.140310e01
-ker_raccs[8, 28] = 0.141581e01
-ker_raccs[8, 29] = 0.142633e01
-ker_raccs[8, 30] = 0.143503e01
-ker_raccs[8, 31] = 0.144223e01
-ker_raccs[8, 32] = 0.144819e01
-ker_raccs[8, 33] = 0.145312e01
-ker_raccs[8, 34] = 0.145720e01
-ker_raccs[8, 35] = 0.146058e01
-ker_raccs[8, 36] = 0.146338e01
-ker_raccs[8, 37] = 0.146569e01
-ker_raccs[8, 38] = 0.146761e01
-ker_raccs[8, 39] = 0.146919e01
-ker_raccs[8, 40] = 0.147050e01
-ker_raccs[9, 1] = 0.106345e02
-ker_raccs[9, 2] = 0.834678e01
-ker_raccs[9, 3] = 0.649814e01
-ker_raccs[9, 4] = 0.500932e01
-ker_raccs[9, 5] = 0.381363e01
-ker_raccs[9, 6] = 0.285581e01
-ker_raccs[9, 7] = 0.209316e01
-ker_raccs[9, 8] = 0.149490e01
-ker_raccs[9, 9] = 0.104191e01
-ker_raccs[9, 10] = 0.724098e00
-ker_raccs[9, 11] = 0.534431e00
-ker_raccs[9, 12] = 0.462476e00
-ker_raccs[9, 13] = 0.485184e00
-ker_raccs[9, 14] = 0.569779e00
-ker_raccs[9, 15] = 0.681282e00
-ker_raccs[9, 16] = 0.793641e00
-ker_raccs[9, 17] = 0.893878e00
-ker_raccs[9, 18] = 0.978690e00
-ker_raccs[9, 19] = 0.104914e01
-ker_raccs[9, 20] = 0.110738e01
-ker_raccs[9, 21] = 0.115550e01
-ker_raccs[9, 22] = 0.119527e01
-ker_raccs[9, 23] = 0.122815e01
-ker_raccs[9, 24] = 0.125533e01
-ker_raccs[9, 25] = 0.127782e01
-ker_raccs[9, 26] = 0.129641e01
-ker_raccs[9, 27] = 0.131179e01
-ker_raccs[9, 28] = 0.132452e01
-ker_raccs[9, 29] = 0.133505e01
-ker_raccs[9, 30] = 0.134376e01
-ker_raccs[9, 31] = 0.135097e01
-ker_raccs[9, 32] = 0.135694e01
-ker_raccs[9, 33] = 0.136188e01
-ker_raccs[9, 34] = 0.136596e01
-ker_raccs[9, 35] = 0.136934e01
-ker_raccs[9, 36] = 0.137214e01
-ker_raccs[9, 37] = 0.137446e01
-ker_raccs[9, 38] = 0.137637e01
-ker_raccs[9, 39] = 0.137796e01
-ker_raccs[9, 40] = 0.137927e01
-ker_raccs[10, 1] = 0.110031e02
-ker_raccs[10, 2] = 0.866775e01
-ker_raccs[10, 3] = 0.677164e01
-ker_raccs[10, 4] = 0.523918e01
-ker_raccs[10, 5] = 0.400557e01
-ker_raccs[10, 6] = 0.301605e01
-ker_raccs[10, 7] = 0.222631e01
-ker_raccs[10, 8] = 0.160312e01
-ker_raccs[10, 9] = 0.112426e01
-ker_raccs[10, 10] = 0.776925e00
-ker_raccs[10, 11] = 0.554023e00
-ker_raccs[10, 12] = 0.447142e00
-ker_raccs[10, 13] = 0.439159e00
-ker_raccs[10, 14] = 0.501788e00
-ker_raccs[10, 15] = 0.601002e00
-ker_raccs[10, 16] = 0.708335e00
-ker_raccs[10, 17] = 0.807233e00
-ker_raccs[10, 18] = 0.892004e00
-ker_raccs[10, 19] = 0.962681e00
-ker_raccs[10, 20] = 0.102114e01
-ker_raccs[10, 21] = 0.106943e01
-ker_raccs[10, 22] = 0.110932e01
-ker_raccs[10, 23] = 0.114228e01
-ker_raccs[10, 24] = 0.116953e01
-ker_raccs[10, 25] = 0.119207e01
-ker_raccs[10, 26] = 0.121070e01
-ker_raccs[10, 27] = 0.122611e01
-ker_raccs[10, 28] = 0.123886e01
-ker_raccs[10, 29] = 0.124940e01
-ker_raccs[10, 30] = 0.125813e01
-ker_raccs[10, 31] = 0.126535e01
-ker_raccs[10, 32] = 0.127132e01
-ker_raccs[10, 33] = 0.127626e01
-ker_raccs[10, 34] = 0.128035e01
-ker_raccs[10, 35] = 0.128374e01
-ker_raccs[10, 36] = 0.128654e01
-ker_raccs[10, 37] = 0.128886e01
-ker_raccs[10, 38] = 0.129077e01
-ker_raccs[10, 39] = 0.129236e01
-ker_raccs[10, 40] = 0.129368e01
-ker_raccs[11, 1] = 0.113549e02
-ker_raccs[11, 2] = 0.898364e01
-ker_raccs[11, 3] = 0.704811e01
-ker_raccs[11, 4] = 0.547629e01
-ker_raccs[11, 5] = 0.420604e01
-ker_raccs[11, 6] = 0.318436e01
-ker_raccs[11, 7] = 0.236670e01
-ker_raccs[11, 8] = 0.171835e01
-ker_raccs[11, 9] = 0.121434e01
-ker_raccs[11, 10] = 0.839328e00
-ker_raccs[11, 11] = 0.585308e00
-ker_raccs[11, 12] = 0.445062e00
-ker_raccs[11, 13] = 0.405828e00
-ker_raccs[11, 14] = 0.444237e00
-ker_raccs[11, 15] = 0.528618e00
-ker_raccs[11, 16] = 0.629105e00
-ker_raccs[11, 17] = 0.725893e00
-ker_raccs[11, 18] = 0.810425e00
-ker_raccs[11, 19] = 0.881336e00
-ker_raccs[11, 20] = 0.940053e00
-ker_raccs[11, 21] = 0.988540e00
-ker_raccs[11, 22] = 0.102858e01
-ker_raccs[11, 23] = 0.106165e01
-ker_raccs[11, 24] = 0.108898e01
-ker_raccs[11, 25] = 0.111157e01
-ker_raccs[11, 26] = 0.113025e01
-ker_raccs[11, 27] = 0.114569e01
-ker_raccs[11, 28] = 0.115847e01
-ker_raccs[11, 29] = 0.116903e01
-ker_raccs[11, 30] = 0.117777e01
-ker_raccs[11, 31] = 0.118500e01
-ker_raccs[11, 32] = 0.119098e01
-ker_raccs[11, 33] = 0.119593e01
-ker_raccs[11, 34] = 0.120003e01
-ker_raccs[11, 35] = 0.120342e01
-ker_raccs[11, 36] = 0.120622e01
-ker_raccs[11, 37] = 0.120854e01
-ker_raccs[11, 38] = 0.121046e01
-ker_raccs[11, 39] = 0.121205e01
-ker_raccs[11, 40] = 0.121337e01
-ker_raccs[12, 1] = 0.116799e02
-ker_raccs[12, 2] = 0.928469e01
-ker_raccs[12, 3] = 0.731960e01
-ker_raccs[12, 4] = 0.571522e01
-ker_raccs[12, 5] = 0.441213e01
-ker_raccs[12, 6] = 0.335956e01
-ker_raccs[12, 7] = 0.251408e01
-ker_raccs[12, 8] = 0.184047e01
-ker_raccs[12, 9] = 0.131203e01
-ker_raccs[12, 10] = 0.911145e00
-ker_raccs[12, 11] = 0.627927e00
-ker_raccs[12, 12] = 0.455629e00
-ker_raccs[12, 13] = 0.385139e00
-ker_raccs[12, 14] = 0.397299e00
-ker_raccs[12, 15] = 0.464231e00
-ker_raccs[12, 16] = 0.555964e00
-ker_raccs[12, 17] = 0.649649e00
-ker_raccs[12, 18] = 0.733631e00
-ker_raccs[12, 19] = 0.804744e00
-ker_raccs[12, 20] = 0.863761e00
-ker_raccs[12, 21] = 0.912491e00
-ker_raccs[12, 22] = 0.952708e00
-ker_raccs[12, 23] = 0.985912e00
-ker_raccs[12, 24] = 0.101334e01
-ker_raccs[12, 25] = 0.103600e01
-ker_raccs[12, 26] = 0.105473e01
-ker_raccs[12, 27] = 0.107022e01
-ker_raccs[12, 28] = 0.108302e01
-ker_raccs[12, 29] = 0.109361e01
-ker_raccs[12, 30] = 0.110236e01
-ker_raccs[12, 31] = 0.110961e01
-ker_raccs[12, 32] = 0.111560e01
-ker_raccs[12, 33] = 0.112056e01
-ker_raccs[12, 34] = 0.112466e01
-ker_raccs[12, 35] = 0.112805e01
-ker_raccs[12, 36] = 0.113086e01
-ker_raccs[12, 37] = 0.113319e01
-ker_raccs[12, 38] = 0.113511e01
-ker_raccs[12, 39] = 0.113670e01
-ker_raccs[12, 40] = 0.113802e01
-ker_raccs[13, 1] = 0.119715e02
-ker_raccs[13, 2] = 0.956269e01
-ker_raccs[13, 3] = 0.757802e01
-ker_raccs[13, 4] = 0.594935e01
-ker_raccs[13, 5] = 0.461927e01
-ker_raccs[13, 6] = 0.353911e01
-ker_raccs[13, 7] = 0.266730e01
-ker_raccs[13, 8] = 0.196897e01
-ker_raccs[13, 9] = 0.141674e01
-ker_raccs[13, 10] = 0.991267e00
-ker_raccs[13, 11] = 0.680645e00
-ker_raccs[13, 12] = 0.478159e00
-ker_raccs[13, 13] = 0.376423e00
-ker_raccs[13, 14] = 0.361128e00
-ker_raccs[13, 15] = 0.408438e00
-ker_raccs[13, 16] = 0.489166e00
-ker_raccs[13, 17] = 0.578426e00
-ker_raccs[13, 18] = 0.661345e00
-ker_raccs[13, 19] = 0.732571e00
-ker_raccs[13, 20] = 0.791923e00
-ker_raccs[13, 21] = 0.840945e00
-ker_raccs[13, 22] = 0.881381e00
-ker_raccs[13, 23] = 0.914745e00
-ker_raccs[13, 24] = 0.942288e00
-ker_raccs[13, 25] = 0.965037e00
-ker_raccs[13, 26] = 0.983832e00
-ker_raccs[13, 27] = 0.999365e00
-ker_raccs[13, 28] = 0.101221e01
-ker_raccs[13, 29] = 0.102282e01
-ker_raccs[13, 30] = 0.103160e01
-ker_raccs[13, 31] = 0.103886e01
-ker_raccs[13, 32] = 0.104487e01
-ker_raccs[13, 33] = 0.104983e01
-ker_raccs[13, 34] = 0.105394e01
-ker_raccs[13, 35] = 0.105734e01
-ker_raccs[13, 36] = 0.106016e01
-ker_raccs[13, 37] = 0.106248e01
-ker_raccs[13, 38] = 0.106441e01
-ker_raccs[13, 39] = 0.106600e01
-ker_raccs[13, 40] = 0.106732e01
-ker_raccs[14, 1] = 0.122269e02
-ker_raccs[14, 2] = 0.981222e01
-ker_raccs[14, 3] = 0.781657e01
-ker_raccs[14, 4] = 0.617190e01
-ker_raccs[14, 5] = 0.482183e01
-ker_raccs[14, 6] = 0.371915e01
-ker_raccs[14, 7] = 0.282402e01
-ker_raccs[14, 8] = 0.210269e01
-ker_raccs[14, 9] = 0.152785e01
-ker_raccs[14, 10] = 0.107897e01
-ker_raccs[14, 11] = 0.742682e00
-ker_raccs[14, 12] = 0.511717e00
-ker_raccs[14, 13] = 0.379723e00
-ker_raccs[14, 14] = 0.336223e00
-ker_raccs[14, 15] = 0.361708e00
-ker_raccs[14, 16] = 0.429063e00
-ker_raccs[14, 17] = 0.512196e00
-ker_raccs[14, 18] = 0.593334e00
-ker_raccs[14, 19] = 0.664504e00
-ker_raccs[14, 20] = 0.724213e00
-ker_raccs[14, 21] = 0.773584e00
-ker_raccs[14, 22] = 0.814286e00
-ker_raccs[14, 23] = 0.847845e00
-ker_raccs[14, 24] = 0.875531e00
-ker_raccs[14, 25] = 0.898385e00
-ker_raccs[14, 26] = 0.917258e00
-ker_raccs[14, 27] = 0.932850e00
-ker_raccs[14, 28] = 0.945734e00
-ker_raccs[14, 29] = 0.956384e00
-ker_raccs[14, 30] = 0.965189e00
-ker_raccs[14, 31] = 0.972469e00
-ker_raccs[14, 32] = 0.978490e00
-ker_raccs[14, 33] = 0.983469e00
-ker_raccs[14, 34] = 0.987588e00
-ker_raccs[14, 35] = 0.990995e00
-ker_raccs[14, 36] = 0.993813e00
-ker_raccs[14, 37] = 0.996145e00
-ker_raccs[14, 38] = 0.998074e00
-ker_raccs[14, 39] = 0.999670e00
-ker_raccs[14, 40] = 0.100099e01
-ker_raccs[15, 1] = 0.124464e02
-ker_raccs[15, 2] = 0.100310e02
-ker_raccs[15, 3] = 0.803077e01
-ker_raccs[15, 4] = 0.637725e01
-ker_raccs[15, 5] = 0.501415e01
-ker_raccs[15, 6] = 0.389492e01
-ker_raccs[15, 7] = 0.298087e01
-ker_raccs[15, 8] = 0.223947e01
-ker_raccs[15, 9] = 0.164395e01
-ker_raccs[15, 10] = 0.117348e01
-ker_raccs[15, 11] = 0.813603e00
-ker_raccs[15, 12] = 0.555940e00
-ker_raccs[15, 13] = 0.394860e00
-ker_raccs[15, 14] = 0.322907e00
-ker_raccs[15, 15] = 0.324503e00
-ker_raccs[15, 16] = 0.375896e00
-ker_raccs[15, 17] = 0.451039e00
-ker_raccs[15, 18] = 0.529435e00
-ker_raccs[15, 19] = 0.600261e00
-ker_raccs[15, 20] = 0.660320e00
-ker_raccs[15, 21] = 0.710100e00
-ker_raccs[15, 22] = 0.751124e00
-ker_raccs[15, 23] = 0.784920e00
-ker_raccs[15, 24] = 0.812780e00
-ker_raccs[15, 25] = 0.835762e00
-ker_raccs[15, 26] = 0.854730e00
-ker_raccs[15, 27] = 0.870393e00
-ker_raccs[15, 28] = 0.883331e00
-ker_raccs[15, 29] = 0.894022e00
-ker_raccs[15, 30] = 0.902857e00
-ker_raccs[15, 31] = 0.910161e00
-ker_raccs[15, 32] = 0.916200e00
-ker_raccs[15, 33] = 0.921193e00
-ker_raccs[15, 34] = 0.925323e00
-ker_raccs[15, 35] = 0.928738e00
-ker_raccs[15, 36] = 0.931563e00
-ker_raccs[15, 37] = 0.933900e00
-ker_raccs[15, 38] = 0.935833e00
-ker_raccs[15, 39] = 0.937432e00
-ker_raccs[15, 40] = 0.938755e00
-ker_raccs[16, 1] = 0.126327e02
-ker_raccs[16, 2] = 0.102194e02
-ker_raccs[16, 3] = 0.821876e01
-ker_raccs[16, 4] = 0.656171e01
-ker_raccs[16, 5] = 0.519153e01
-ker_raccs[16, 6] = 0.406164e01
-ker_raccs[16, 7] = 0.313379e01
-ker_raccs[16, 8] = 0.237630e01
-ker_raccs[16, 9] = 0.176301e01
-ker_raccs[16, 10] = 0.127321e01
-ker_raccs[16, 11] = 0.891908e00
-ker_raccs[16, 12] = 0.609619e00
-ker_raccs[16, 13] = 0.421108e00
-ker_raccs[16, 14] = 0.320728e00
-ker_raccs[16, 15] = 0.297097e00
-ker_raccs[16, 16] = 0.330361e00
-ker_raccs[16, 17] = 0.395280e00
-ker_raccs[16, 18] = 0.469630e00
-ker_raccs[16, 19] = 0.539613e00
-ker_raccs[16, 20] = 0.599949e00
-ker_raccs[16, 21] = 0.650193e00
-ker_raccs[16, 22] = 0.691608e00
-ker_raccs[16, 23] = 0.725693e00
-ker_raccs[16, 24] = 0.753765e00
-ker_raccs[16, 25] = 0.776902e00
-ker_raccs[16, 26] = 0.795985e00
-ker_raccs[16, 27] = 0.811734e00
-ker_raccs[16, 28] = 0.824737e00
-ker_raccs[16, 29] = 0.835476e00
-ker_raccs[16, 30] = 0.844348e00
-ker_raccs[16, 31] = 0.851681e00
-ker_raccs[16, 32] = 0.857741e00
-ker_raccs[16, 33] = 0.862751e00
-ker_raccs[16, 34] = 0.866894e00
-ker_raccs[16, 35] = 0.870319e00
-ker_raccs[16, 36] = 0.873152e00
-ker_raccs[16, 37] = 0.875495e00
-ker_raccs[16, 38] = 0.877433e00
-ker_raccs[16, 39] = 0.879036e00
-ker_raccs[16, 40] = 0.880362e00
-ker_raccs[17, 1] = 0.127896e02
-ker_raccs[17, 2] = 0.103796e02
-ker_raccs[17, 3] = 0.838093e01
-ker_raccs[17, 4] = 0.672380e01
-ker_raccs[17, 5] = 0.535093e01
-ker_raccs[17, 6] = 0.421538e01
-ker_raccs[17, 7] = 0.327875e01
-ker_raccs[17, 8] = 0.250965e01
-ker_raccs[17, 9] = 0.188231e01
-ker_raccs[17, 10] = 0.137624e01
-ker_raccs[17, 11] = 0.976041e00
-ker_raccs[17, 12] = 0.671601e00
-ker_raccs[17, 13] = 0.457610e00
-ker_raccs[17, 14] = 0.329677e00
-ker_raccs[17, 15] = 0.280046e00
-ker_raccs[17, 16] = 0.292981e00
-ker_raccs[17, 17] = 0.345338e00
-ker_raccs[17, 18] = 0.413953e00
-ker_raccs[17, 19] = 0.482373e00
-ker_raccs[17, 20] = 0.542827e00
-ker_raccs[17, 21] = 0.593577e00
-ker_raccs[17, 22] = 0.635456e00
-ker_raccs[17, 23] = 0.669894e00
-ker_raccs[17, 24] = 0.698224e00
-ker_raccs[17, 25] = 0.721550e00
-ker_raccs[17, 26] = 0.740773e00
-ker_raccs[17, 27] = 0.756626e00
-ker_raccs[17, 28] = 0.769706e00
-ker_raccs[17, 29] = 0.780504e00
-ker_raccs[17, 30] = 0.789421e00
-ker_raccs[17, 31] = 0.796788e00
-ker_raccs[17, 32] = 0.802874e00
-ker_raccs[17, 33] = 0.807905e00
-ker_raccs[17, 34] = 0.812063e00
-ker_raccs[17, 35] = 0.815500e00
-ker_raccs[17, 36] = 0.818342e00
-ker_raccs[17, 37] = 0.820693e00
-ker_raccs[17, 38] = 0.822636e00
-ker_raccs[17, 39] = 0.824244e00
-ker_raccs[17, 40] = 0.825573e00
-ker_raccs[18, 1] = 0.129213e02
-ker_raccs[18, 2] = 0.105149e02
-ker_raccs[18, 3] = 0.851921e01
-ker_raccs[18, 4] = 0.686389e01
-ker_raccs[18, 5] = 0.549117e01
-ker_raccs[18, 6] = 0.435362e01
-ker_raccs[18, 7] = 0.341243e01
-ker_raccs[18, 8] = 0.263602e01
-ker_raccs[18, 9] = 0.199868e01
-ker_raccs[18, 10] = 0.147991e01
-ker_raccs[18, 11] = 0.106410e01
-ker_raccs[18, 12] = 0.740604e00
-ker_raccs[18, 13] = 0.503591e00
-ker_raccs[18, 14] = 0.349646e00
-ker_raccs[18, 15] = 0.273846e00
-ker_raccs[18, 16] = 0.264450e00
-ker_raccs[18, 17] = 0.301632e00
-ker_raccs[18, 18] = 0.362584e00
-ker_raccs[18, 19] = 0.428436e00
-ker_raccs[18, 20] = 0.488711e00
-ker_raccs[18, 21] = 0.539973e00
-ker_raccs[18, 22] = 0.582398e00
-ker_raccs[18, 23] = 0.617263e00
-ker_raccs[18, 24] = 0.645906e00
-ker_raccs[18, 25] = 0.669463e00
-ker_raccs[18, 26] = 0.688855e00
-ker_raccs[18, 27] = 0.704834e00
-ker_raccs[18, 28] = 0.718008e00
-ker_raccs[18, 29] = 0.728877e00
-ker_raccs[18, 30] = 0.737848e00
-ker_raccs[18, 31] = 0.745255e00
-ker_raccs[18, 32] = 0.751373e00
-ker_raccs[18, 33] = 0.756428e00
-ker_raccs[18, 34] = 0.760604e00
-ker_raccs[18, 35] = 0.764056e00
-ker_raccs[18, 36] = 0.766910e00
-ker_raccs[18, 37] = 0.769269e00
-ker_raccs[18, 38] = 0.771219e00
-ker_raccs[18, 39] = 0.772832e00
-ker_raccs[18, 40] = 0.774166e00
-ker_raccs[19, 1] = 0.130318e02
-ker_raccs[19, 2] = 0.106289e02
-ker_raccs[19, 3] = 0.863636e01
-ker_raccs[19, 4] = 0.698365e01
-ker_raccs[19, 5] = 0.561261e01
-ker_raccs[19, 6] = 0.447539e01
-ker_raccs[19, 7] = 0.353272e01
-ker_raccs[19, 8] = 0.275260e01
-ker_raccs[19, 9] = 0.210907e01
-ker_raccs[19, 10] = 0.158135e01
-ker_raccs[19, 11] = 0.115350e01
-ker_raccs[19, 12] = 0.814363e00
-ker_raccs[19, 13] = 0.557360e00
-ker_raccs[19, 14] = 0.379586e00
-ker_raccs[19, 15] = 0.278114e00
-ker_raccs[19, 16] = 0.245146e00
-ker_raccs[19, 17] = 0.264975e00
-ker_raccs[19, 18] = 0.315944e00
-ker_raccs[19, 19] = 0.377850e00
-ker_raccs[19, 20] = 0.437417e00
-ker_raccs[19, 21] = 0.489121e00
-ker_raccs[19, 22] = 0.532165e00
-ker_raccs[19, 23] = 0.567544e00
-ker_raccs[19, 24] = 0.596569e00
-ker_raccs[19, 25] = 0.620406e00
-ker_raccs[19, 26] = 0.640004e00
-ker_raccs[19, 27] = 0.656135e00
-ker_raccs[19, 28] = 0.669424e00
-ker_raccs[19, 29] = 0.680378e00
-ker_raccs[19, 30] = 0.689414e00
-ker_raccs[19, 31] = 0.696870e00
-ker_raccs[19, 32] = 0.703026e00
-ker_raccs[19, 33] = 0.708109e00
-ker_raccs[19, 34] = 0.712308e00
-ker_raccs[19, 35] = 0.715777e00
-ker_raccs[19, 36] = 0.718644e00
-ker_raccs[19, 37] = 0.721014e00
-ker_raccs[19, 38] = 0.722972e00
-ker_raccs[19, 39] = 0.724592e00
-ker_raccs[19, 40] = 0.725930e00
-ker_raccs[20, 1] = 0.131249e02
-ker_raccs[20, 2] = 0.107250e02
-ker_raccs[20, 3] = 0.873538e01
-ker_raccs[20, 4] = 0.708543e01
-ker_raccs[20, 5] = 0.571670e01
-ker_raccs[20, 6] = 0.458105e01
-ker_raccs[20, 7] = 0.363884e01
-ker_raccs[20, 8] = 0.285761e01
-ker_raccs[20, 9] = 0.221101e01
-ker_raccs[20, 10] = 0.167782e01
-ker_raccs[20, 11] = 0.124159e01
-ker_raccs[20, 12] = 0.890407e00
-ker_raccs[20, 13] = 0.616977e00
-ker_raccs[20, 14] = 0.418242e00
-ker_raccs[20, 15] = 0.292524e00
-ker_raccs[20, 16] = 0.235581e00
-ker_raccs[20, 17] = 0.235983e00
-ker_raccs[20, 18] = 0.274591e00
-ker_raccs[20, 19] = 0.330763e00
-ker_raccs[20, 20] = 0.388819e00
-ker_raccs[20, 21] = 0.440784e00
-ker_raccs[20, 22] = 0.484500e00
-ker_raccs[20, 23] = 0.520487e00
-ker_raccs[20, 24] = 0.549976e00
-ker_raccs[20, 25] = 0.574153e00
-ker_raccs[20, 26] = 0.594001e00
-ker_raccs[20, 27] = 0.610317e00
-ker_raccs[20, 28] = 0.623744e00
-ker_raccs[20, 29] = 0.634801e00
-ker_raccs[20, 30] = 0.643915e00
-ker_raccs[20, 31] = 0.651431e00
-ker_raccs[20, 32] = 0.657631e00
-ker_raccs[20, 33] = 0.662749e00
-ker_raccs[20, 34] = 0.666975e00
-ker_raccs[20, 35] = 0.670465e00
-ker_raccs[20, 36] = 0.673348e00
-ker_raccs[20, 37] = 0.675730e00
-ker_raccs[20, 38] = 0.677698e00
-ker_raccs[20, 39] = 0.679325e00
-ker_raccs[20, 40] = 0.680670e00
-ker_raccs[21, 1] = 0.132036e02
-ker_raccs[21, 2] = 0.108062e02
-ker_raccs[21, 3] = 0.881918e01
-ker_raccs[21, 4] = 0.717177e01
-ker_raccs[21, 5] = 0.580546e01
-ker_raccs[21, 6] = 0.467187e01
-ker_raccs[21, 7] = 0.373113e01
-ker_raccs[21, 8] = 0.295042e01
-ker_raccs[21, 9] = 0.230297e01
-ker_raccs[21, 10] = 0.176711e01
-ker_raccs[21, 11] = 0.132575e01
-ker_raccs[21, 12] = 0.966211e00
-ker_raccs[21, 13] = 0.680246e00
-ker_raccs[21, 14] = 0.464064e00
-ker_raccs[21, 15] = 0.316605e00
-ker_raccs[21, 16] = 0.236157e00
-ker_raccs[21, 17] = 0.215485e00
-ker_raccs[21, 18] = 0.239150e00
-ker_raccs[21, 19] = 0.287499e00
-ker_raccs[21, 20] = 0.342900e00
-ker_raccs[21, 21] = 0.394764e00
-ker_raccs[21, 22] = 0.439154e00
-ker_raccs[21, 23] = 0.475848e00
-ker_raccs[21, 24] = 0.505894e00
-ker_raccs[21, 25] = 0.530484e00
-ker_raccs[21, 26] = 0.550636e00
-ker_raccs[21, 27] = 0.567176e00
-ker_raccs[21, 28] = 0.580769e00
-ker_raccs[21, 29] = 0.591952e00
-ker_raccs[21, 30] = 0.601159e00
-ker_raccs[21, 31] = 0.608746e00
-ker_raccs[21, 32] = 0.615001e00
-ker_raccs[21, 33] = 0.620161e00
-ker_raccs[21, 34] = 0.624418e00
-ker_raccs[21, 35] = 0.627933e00
-ker_raccs[21, 36] = 0.630835e00
-ker_raccs[21, 37] = 0.633232e00
-ker_raccs[21, 38] = 0.635212e00
-ker_raccs[21, 39] = 0.636848e00
-ker_raccs[21, 40] = 0.638199e00
-ker_raccs[22, 1] = 0.132706e02
-ker_raccs[22, 2] = 0.108752e02
-ker_raccs[22, 3] = 0.889034e01
-ker_raccs[22, 4] = 0.724514e01
-ker_raccs[22, 5] = 0.588103e01
-ker_raccs[22, 6] = 0.474956e01
-ker_raccs[22, 7] = 0.381066e01
-ker_raccs[22, 8] = 0.303131e01
-ker_raccs[22, 9] = 0.238440e01
-ker_raccs[22, 10] = 0.184783e01
-ker_raccs[22, 11] = 0.140395e01
-ker_raccs[22, 12] = 0.103925e01
-ker_raccs[22, 13] = 0.744489e00
-ker_raccs[22, 14] = 0.514665e00
-ker_raccs[22, 15] = 0.348618e00
-ker_raccs[22, 16] = 0.246213e00
-ker_raccs[22, 17] = 0.203810e00
-ker_raccs[22, 18] = 0.210527e00
-ker_raccs[22, 19] = 0.248639e00
-ker_raccs[22, 20] = 0.299821e00
-ker_raccs[22, 21] = 0.350944e00
-ker_raccs[22, 22] = 0.395903e00
-ker_raccs[22, 23] = 0.433386e00
-ker_raccs[22, 24] = 0.464095e00
-ker_raccs[22, 25] = 0.489182e00
-ker_raccs[22, 26] = 0.509702e00
-ker_raccs[22, 27] = 0.526514e00
-ker_raccs[22, 28] = 0.540309e00
-ker_raccs[22, 29] = 0.551642e00
-ker_raccs[22, 30] = 0.560963e00
-ker_raccs[22, 31] = 0.568636e00
-ker_raccs[22, 32] = 0.574956e00
-ker_raccs[22, 33] = 0.580166e00
-ker_raccs[22, 34] = 0.584462e00
-ker_raccs[22, 35] = 0.588006e00
-ker_raccs[22, 36] = 0.590931e00
-ker_raccs[22, 37] = 0.593346e00
-ker_raccs[22, 38] = 0.595339e00
-ker_raccs[22, 39] = 0.596986e00
-ker_raccs[22, 40] = 0.598346e00
-ker_raccs[23, 1] = 0.133280e02
-ker_raccs[23, 2] = 0.109343e02
-ker_raccs[23, 3] = 0.895109e01
-ker_raccs[23, 4] = 0.730772e01
-ker_raccs[23, 5] = 0.594552e01
-ker_raccs[23, 6] = 0.481597e01
-ker_raccs[23, 7] = 0.387893e01
-ker_raccs[23, 8] = 0.310124e01
-ker_raccs[23, 9] = 0.245555e01
-ker_raccs[23, 10] = 0.191949e01
-ker_raccs[23, 11] = 0.147491e01
-ker_raccs[23, 12] = 0.110760e01
-ker_raccs[23, 13] = 0.807248e00
-ker_raccs[23, 14] = 0.567629e00
-ker_raccs[23, 15] = 0.386696e00
-ker_raccs[23, 16] = 0.264772e00
-ker_raccs[23, 17] = 0.201168e00
-ker_raccs[23, 18] = 0.189359e00
-ker_raccs[23, 19] = 0.214892e00
-ker_raccs[23, 20] = 0.259902e00
-ker_raccs[23, 21] = 0.309296e00
-ker_raccs[23, 22] = 0.354562e00
-ker_raccs[23, 23] = 0.392871e00
-ker_raccs[23, 24] = 0.424352e00
-ker_raccs[23, 25] = 0.450037e00
-ker_raccs[23, 26] = 0.471000e00
-ker_raccs[23, 27] = 0.488140e00
-ker_raccs[23, 28] = 0.502179e00
-ker_raccs[23, 29] = 0.513695e00
-ker_raccs[23, 30] = 0.523153e00
-ker_raccs[23, 31] = 0.530929e00
-ker_raccs[23, 32] = 0.537328e00
-ker_raccs[23, 33] = 0.542597e00
-ker_raccs[23, 34] = 0.546939e00
-ker_raccs[23, 35] = 0.550519e00
-ker_raccs[23, 36] = 0.553471e00
-ker_raccs[23, 37] = 0.555907e00
-ker_raccs[23, 38] = 0.557917e00
-ker_raccs[23, 39] = 0.559577e00
-ker_raccs[23, 40] = 0.560947e00
-ker_raccs[24, 1] = 0.133776e02
-ker_raccs[24, 2] = 0.109851e02
-ker_raccs[24, 3] = 0.900330e01
-ker_raccs[24, 4] = 0.736141e01
-ker_raccs[24, 5] = 0.600078e01
-ker_raccs[24, 6] = 0.487288e01
-ker_raccs[24, 7] = 0.393752e01
-ker_raccs[24, 8] = 0.316146e01
-ker_raccs[24, 9] = 0.251726e01
-ker_raccs[24, 10] = 0.198229e01
-ker_raccs[24, 11] = 0.153812e01
-ker_raccs[24, 12] = 0.116995e01
-ker_raccs[24, 13] = 0.866612e00
-ker_raccs[24, 14] = 0.620643e00
-ker_raccs[24, 15] = 0.428690e00
-ker_raccs[24, 16] = 0.290707e00
-ker_raccs[24, 17] = 0.207519e00
-ker_raccs[24, 18] = 0.176401e00
-ker_raccs[24, 19] = 0.187072e00
-ker_raccs[24, 20] = 0.223666e00
-ker_raccs[24, 21] = 0.269955e00
-ker_raccs[24, 22] = 0.315007e00
-ker_raccs[24, 23] = 0.354096e00
-ker_raccs[24, 24] = 0.386445e00
-ker_raccs[24, 25] = 0.412837e00
-ker_raccs[24, 26] = 0.434333e00
-ker_raccs[24, 27] = 0.451869e00
-ker_raccs[24, 28] = 0.466202e00
-ker_raccs[24, 29] = 0.477938e00
-ker_raccs[24, 30] = 0.487561e00
-ker_raccs[24, 31] = 0.495462e00
-ker_raccs[24, 32] = 0.501955e00
-ker_raccs[24, 33] = 0.507296e00
-ker_raccs[24, 34] = 0.511693e00
-ker_raccs[24, 35] = 0.515315e00
-ker_raccs[24, 36] = 0.518300e00
-ker_raccs[24, 37] = 0.520762e00
-ker_raccs[24, 38] = 0.522792e00
-ker_raccs[24, 39] = 0.524467e00
-ker_raccs[24, 40] = 0.525849e00
-ker_raccs[25, 1] = 0.134206e02
-ker_raccs[25, 2] = 0.110292e02
-ker_raccs[25, 3] = 0.904847e01
-ker_raccs[25, 4] = 0.740776e01
-ker_raccs[25, 5] = 0.604841e01
-ker_raccs[25, 6] = 0.492186e01
-ker_raccs[25, 7] = 0.398793e01
-ker_raccs[25, 8] = 0.321335e01
-ker_raccs[25, 9] = 0.257059e01
-ker_raccs[25, 10] = 0.203693e01
-ker_raccs[25, 11] = 0.159370e01
-ker_raccs[25, 12] = 0.122575e01
-ker_raccs[25, 13] = 0.921214e00
-ker_raccs[25, 14] = 0.671617e00
-ker_raccs[25, 15] = 0.472110e00
-ker_raccs[25, 16] = 0.321676e00
-ker_raccs[25, 17] = 0.221561e00
-ker_raccs[25, 18] = 0.171605e00
-ker_raccs[25, 19] = 0.166038e00
-ker_raccs[25, 20] = 0.191877e00
-ker_raccs[25, 21] = 0.233259e00
-ker_raccs[25, 22] = 0.277238e00
-ker_raccs[25, 23] = 0.316894e00
-ker_raccs[25, 24] = 0.350169e00
-ker_raccs[25, 25] = 0.377379e00
-ker_raccs[25, 26] = 0.399506e00
-ker_raccs[25, 27] = 0.417517e00
-ker_raccs[25, 28] = 0.432204e00
-ker_raccs[25, 29] = 0.444205e00
-ker_raccs[25, 30] = 0.454027e00
-ker_raccs[25, 31] = 0.462077e00
-ker_raccs[25, 32] = 0.468684e00
-ker_raccs[25, 33] = 0.474112e00
-ker_raccs[25, 34] = 0.478576e00
-ker_raccs[25, 35] = 0.482249e00
-ker_raccs[25, 36] = 0.485273e00
-ker_raccs[25, 37] = 0.487764e00
-ker_raccs[25, 38] = 0.489818e00
-ker_raccs[25, 39] = 0.491511e00
-ker_raccs[25, 40] = 0.492908e00
-ker_raccs[26, 1] = 0.134583e02
-ker_raccs[26, 2] = 0.110677e02
-ker_raccs[26, 3] = 0.908784e01
-ker_raccs[26, 4] = 0.744807e01
-ker_raccs[26, 5] = 0.608972e01
-ker_raccs[26, 6] = 0.496427e01
-ker_raccs[26, 7] = 0.403151e01
-ker_raccs[26, 8] = 0.325817e01
-ker_raccs[26, 9] = 0.261671e01
-ker_raccs[26, 10] = 0.208432e01
-ker_raccs[26, 11] = 0.164223e01
-ker_raccs[26, 12] = 0.127505e01
-ker_raccs[26, 13] = 0.970445e00
-ker_raccs[26, 14] = 0.719103e00
-ker_raccs[26, 15] = 0.514960e00
-ker_raccs[26, 16] = 0.355619e00
-ker_raccs[26, 17] = 0.241696e00
-ker_raccs[26, 18] = 0.174597e00
-ker_raccs[26, 19] = 0.152207e00
-ker_raccs[26, 20] = 0.165325e00
-ker_raccs[26, 21] = 0.199742e00
-ker_raccs[26, 22] = 0.241398e00
-ker_raccs[26, 23] = 0.281177e00
-ker_raccs[26, 24] = 0.315343e00
-ker_raccs[26, 25] = 0.343466e00
-ker_raccs[26, 26] = 0.366332e00
-ker_raccs[26, 27] = 0.384904e00
-ker_raccs[26, 28] = 0.400015e00
-ker_raccs[26, 29] = 0.412334e00
-ker_raccs[26, 30] = 0.422395e00
-ker_raccs[26, 31] = 0.430626e00
-ker_raccs[26, 32] = 0.437370e00
-ker_raccs[26, 33] = 0.442902e00
-ker_raccs[26, 34] = 0.447445e00
-ker_raccs[26, 35] = 0.451179e00
-ker_raccs[26, 36] = 0.454250e00
-ker_raccs[26, 37] = 0.456778e00
-ker_raccs[26, 38] = 0.458860e00
-ker_raccs[26, 39] = 0.460575e00
-ker_raccs[26, 40] = 0.461988e00
-ker_raccs[27, 1] = 0.134916e02
-ker_raccs[27, 2] = 0.111016e02
-ker_raccs[27, 3] = 0.912241e01
-ker_raccs[27, 4] = 0.748337e01
-ker_raccs[27, 5] = 0.612582e01
-ker_raccs[27, 6] = 0.500123e01
-ker_raccs[27, 7] = 0.406942e01
-ker_raccs[27, 8] = 0.329710e01
-ker_raccs[27, 9] = 0.265672e01
-ker_raccs[27, 10] = 0.212547e01
-ker_raccs[27, 11] = 0.168449e01
-ker_raccs[27, 12] = 0.131827e01
-ker_raccs[27, 13] = 0.101419e01
-ker_raccs[27, 14] = 0.762350e00
-ker_raccs[27, 15] = 0.555726e00
-ker_raccs[27, 16] = 0.390561e00
-ker_raccs[27, 17] = 0.266359e00
-ker_raccs[27, 18] = 0.184682e00
-ker_raccs[27, 19] = 0.145925e00
-ker_raccs[27, 20] = 0.144842e00
-ker_raccs[27, 21] = 0.170126e00
-ker_raccs[27, 22] = 0.207837e00
-ker_raccs[27, 23] = 0.246960e00
-ker_raccs[27, 24] = 0.281834e00
-ker_raccs[27, 25] = 0.310921e00
-ker_raccs[27, 26] = 0.334627e00
-ker_raccs[27, 27] = 0.353857e00
-ker_raccs[27, 28] = 0.369470e00
-ker_raccs[27, 29] = 0.382168e00
-ker_raccs[27, 30] = 0.392516e00
-ker_raccs[27, 31] = 0.400964e00
-ker_raccs[27, 32] = 0.407872e00
-ker_raccs[27, 33] = 0.413529e00
-ker_raccs[27, 34] = 0.418167e00
-ker_raccs[27, 35] = 0.421974e00
-ker_raccs[27, 36] = 0.425101e00
-ker_raccs[27, 37] = 0.427673e00
-ker_raccs[27, 38] = 0.429788e00
-ker_raccs[27, 39] = 0.431529e00
-ker_raccs[27, 40] = 0.432963e00
-ker_raccs[28, 1] = 0.135212e02
-ker_raccs[28, 2] = 0.111316e02
-ker_raccs[28, 3] = 0.915297e01
-ker_raccs[28, 4] = 0.751450e01
-ker_raccs[28, 5] = 0.615758e01
-ker_raccs[28, 6] = 0.503368e01
-ker_raccs[28, 7] = 0.410261e01
-ker_raccs[28, 8] = 0.333111e01
-ker_raccs[28, 9] = 0.269162e01
-ker_raccs[28, 10] = 0.216132e01
-ker_raccs[28, 11] = 0.172133e01
-ker_raccs[28, 12] = 0.135607e01
-ker_raccs[28, 13] = 0.105274e01
-ker_raccs[28, 14] = 0.801085e00
-ker_raccs[28, 15] = 0.593401e00
-ker_raccs[28, 16] = 0.424717e00
-ker_raccs[28, 17] = 0.293277e00
-ker_raccs[28, 18] = 0.200068e00
-ker_raccs[28, 19] = 0.146527e00
-ker_raccs[28, 20] = 0.130912e00
-ker_raccs[28, 21] = 0.145240e00
-ker_raccs[28, 22] = 0.177100e00
-ker_raccs[28, 23] = 0.214430e00
-ker_raccs[28, 24] = 0.249591e00
-ker_raccs[28, 25] = 0.279602e00
-ker_raccs[28, 26] = 0.304226e00
-ker_raccs[28, 27] = 0.324208e00
-ker_raccs[28, 28] = 0.340405e00
-ker_raccs[28, 29] = 0.353552e00
-ker_raccs[28, 30] = 0.364242e00
-ker_raccs[28, 31] = 0.372949e00
-ker_raccs[28, 32] = 0.380054e00
-ker_raccs[28, 33] = 0.385860e00
-ker_raccs[28, 34] = 0.390613e00
-ker_raccs[28, 35] = 0.394508e00
-ker_raccs[28, 36] = 0.397703e00
-ker_raccs[28, 37] = 0.400326e00
-ker_raccs[28, 38] = 0.402482e00
-ker_raccs[28, 39] = 0.404254e00
-ker_raccs[28, 40] = 0.405713e00
-ker_raccs[29, 1] = 0.135476e02
-ker_raccs[29, 2] = 0.111584e02
-ker_raccs[29, 3] = 0.918018e01
-ker_raccs[29, 4] = 0.754216e01
-ker_raccs[29, 5] = 0.618572e01
-ker_raccs[29, 6] = 0.506235e01
-ker_raccs[29, 7] = 0.413187e01
-ker_raccs[29, 8] = 0.336101e01
-ker_raccs[29, 9] = 0.272223e01
-ker_raccs[29, 10] = 0.219271e01
-ker_raccs[29, 11] = 0.175356e01
-ker_raccs[29, 12] = 0.138915e01
-ker_raccs[29, 13] = 0.108662e01
-ker_raccs[29, 14] = 0.835482e00
-ker_raccs[29, 15] = 0.627544e00
-ker_raccs[29, 16] = 0.457003e00
-ker_raccs[29, 17] = 0.320871e00
-ker_raccs[29, 18] = 0.218993e00
-ker_raccs[29, 19] = 0.153040e00
-ker_raccs[29, 20] = 0.123480e00
-ker_raccs[29, 21] = 0.125714e00
-ker_raccs[29, 22] = 0.149873e00
-ker_raccs[29, 23] = 0.183944e00
-ker_raccs[29, 24] = 0.218688e00
-ker_raccs[29, 25] = 0.249424e00
-ker_raccs[29, 26] = 0.274989e00
-ker_raccs[29, 27] = 0.295803e00
-ker_raccs[29, 28] = 0.312668e00
-ker_raccs[29, 29] = 0.326337e00
-ker_raccs[29, 30] = 0.337429e00
-ker_raccs[29, 31] = 0.346444e00
-ker_raccs[29, 32] = 0.353785e00
-ker_raccs[29, 33] = 0.359771e00
-ker_raccs[29, 34] = 0.364661e00
-ker_raccs[29, 35] = 0.368660e00
-ker_raccs[29, 36] = 0.371936e00
-ker_raccs[29, 37] = 0.374622e00
-ker_raccs[29, 38] = 0.376826e00
-ker_raccs[29, 39] = 0.378635e00
-ker_raccs[29, 40] = 0.380123e00
-ker_raccs[30, 1] = 0.135713e02
-ker_raccs[30, 2] = 0.111824e02
-ker_raccs[30, 3] = 0.920455e01
-ker_raccs[30, 4] = 0.756688e01
-ker_raccs[30, 5] = 0.621082e01
-ker_raccs[30, 6] = 0.508787e01
-ker_raccs[30, 7] = 0.415784e01
-ker_raccs[30, 8] = 0.338749e01
-ker_raccs[30, 9] = 0.274927e01
-ker_raccs[30, 10] = 0.222037e01
-ker_raccs[30, 11] = 0.178189e01
-ker_raccs[30, 12] = 0.141821e01
-ker_raccs[30, 13] = 0.111641e01
-ker_raccs[30, 14] = 0.865882e00
-ker_raccs[30, 15] = 0.658144e00
-ker_raccs[30, 16] = 0.486803e00
-ker_raccs[30, 17] = 0.347889e00
-ker_raccs[30, 18] = 0.240079e00
-ker_raccs[30, 19] = 0.164371e00
-ker_raccs[30, 20] = 0.122278e00
-ker_raccs[30, 21] = 0.112067e00
-ker_raccs[30, 22] = 0.126909e00
-ker_raccs[30, 23] = 0.156066e00
-ker_raccs[30, 24] = 0.189340e00
-ker_raccs[30, 25] = 0.220392e00
-ker_raccs[30, 26] = 0.246822e00
-ker_raccs[30, 27] = 0.268510e00
-ker_raccs[30, 28] = 0.286117e00
-ker_raccs[30, 29] = 0.300380e00
-ker_raccs[30, 30] = 0.311940e00
-ker_raccs[30, 31] = 0.321318e00
-ker_raccs[30, 32] = 0.328937e00
-ker_raccs[30, 33] = 0.335137e00
-ker_raccs[30, 34] = 0.340191e00
-ker_raccs[30, 35] = 0.344317e00
-ker_raccs[30, 36] = 0.347689e00
-ker_raccs[30, 37] = 0.350449e00
-ker_raccs[30, 38] = 0.352711e00
-ker_raccs[30, 39] = 0.354565e00
-ker_raccs[30, 40] = 0.356087e00
-ker_raccs[31, 1] = 0.135928e02
-ker_raccs[31, 2] = 0.112041e02
-ker_raccs[31, 3] = 0.922651e01
-ker_raccs[31, 4] = 0.758911e01
-ker_raccs[31, 5] = 0.623334e01
-ker_raccs[31, 6] = 0.511071e01
-ker_raccs[31, 7] = 0.418105e01
-ker_raccs[31, 8] = 0.341109e01
-ker_raccs[31, 9] = 0.277330e01
-ker_raccs[31, 10] = 0.224489e01
-ker_raccs[31, 11] = 0.180695e01
-ker_raccs[31, 12] = 0.144386e01
-ker_raccs[31, 13] = 0.114268e01
-ker_raccs[31, 14] = 0.892748e00
-ker_raccs[31, 15] = 0.685391e00
-ker_raccs[31, 16] = 0.513859e00
-ker_raccs[31, 17] = 0.373398e00
-ker_raccs[31, 18] = 0.261665e00
-ker_raccs[31, 19] = 0.178785e00
-ker_raccs[31, 20] = 0.126188e00
-ker_raccs[31, 21] = 0.104190e00
-ker_raccs[31, 22] = 0.108781e00
-ker_raccs[31, 23] = 0.131410e00
-ker_raccs[31, 24] = 0.161929e00
-ker_raccs[31, 25] = 0.192628e00
-ker_raccs[31, 26] = 0.219702e00
-ker_raccs[31, 27] = 0.242240e00
-ker_raccs[31, 28] = 0.260630e00
-ker_raccs[31, 29] = 0.275551e00
-ker_raccs[31, 30] = 0.287642e00
-ker_raccs[31, 31] = 0.297440e00
-ker_raccs[31, 32] = 0.305387e00
-ker_raccs[31, 33] = 0.311841e00
-ker_raccs[31, 34] = 0.317090e00
-ker_raccs[31, 35] = 0.321366e00
-ker_raccs[31, 36] = 0.324854e00
-ker_raccs[31, 37] = 0.327703e00
-ker_raccs[31, 38] = 0.330033e00
-ker_raccs[31, 39] = 0.331941e00
-ker_raccs[31, 40] = 0.333505e00
-ker_raccs[32, 1] = 0.136123e02
-ker_raccs[32, 2] = 0.112238e02
-ker_raccs[32, 3] = 0.924639e01
-ker_raccs[32, 4] = 0.760920e01
-ker_raccs[32, 5] = 0.625367e01
-ker_raccs[32, 6] = 0.513129e01
-ker_raccs[32, 7] = 0.420190e01
-ker_raccs[32, 8] = 0.343225e01
-ker_raccs[32, 9] = 0.279481e01
-ker_raccs[32, 10] = 0.226677e01
-ker_raccs[32, 11] = 0.182926e01
-ker_raccs[32, 12] = 0.146664e01
-ker_raccs[32, 13] = 0.116597e01
-ker_raccs[32, 14] = 0.916557e00
-ker_raccs[32, 15] = 0.709637e00
-ker_raccs[32, 16] = 0.538201e00
-ker_raccs[32, 17] = 0.397009e00
-ker_raccs[32, 18] = 0.282874e00
-ker_raccs[32, 19] = 0.194862e00
-ker_raccs[32, 20] = 0.133999e00
-ker_raccs[32, 21] = 0.101519e00
-ker_raccs[32, 22] = 0.957088e-01
-ker_raccs[32, 23] = 0.110579e00
-ker_raccs[32, 24] = 0.136947e00
-ker_raccs[32, 25] = 0.166392e00
-ker_raccs[32, 26] = 0.193693e00
-ker_raccs[32, 27] = 0.216957e00
-ker_raccs[32, 28] = 0.236123e00
-ker_raccs[32, 29] = 0.251739e00
-ker_raccs[32, 30] = 0.264414e00
-ker_raccs[32, 31] = 0.274689e00
-ker_raccs[32, 32] = 0.283015e00
-ker_raccs[32, 33] = 0.289766e00
-ker_raccs[32, 34] = 0.295246e00
-ker_raccs[32, 35] = 0.299700e00
-ker_raccs[32, 36] = 0.303326e00
-ker_raccs[32, 37] = 0.306282e00
-ker_raccs[32, 38] = 0.308695e00
-ker_raccs[32, 39] = 0.310666e00
-ker_raccs[32, 40] = 0.312279e00
-ker_raccs[33, 1] = 0.136301e02
-ker_raccs[33, 2] = 0.112418e02
-ker_raccs[33, 3] = 0.926449e01
-ker_raccs[33, 4] = 0.762746e01
-ker_raccs[33, 5] = 0.627211e01
-ker_raccs[33, 6] = 0.514993e01
-ker_raccs[33, 7] = 0.422075e01
-ker_raccs[33, 8] = 0.345134e01
-ker_raccs[33, 9] = 0.281416e01
-ker_raccs[33, 10] = 0.228641e01
-ker_raccs[33, 11] = 0.184923e01
-ker_raccs[33, 12] = 0.148699e01
-ker_raccs[33, 13] = 0.118672e01
-ker_raccs[33, 14] = 0.937747e00
-ker_raccs[33, 15] = 0.731237e00
-ker_raccs[33, 16] = 0.560038e00
-ker_raccs[33, 17] = 0.418590e00
-ker_raccs[33, 18] = 0.303093e00
-ker_raccs[33, 19] = 0.211735e00
-ker_raccs[33, 20] = 0.144709e00
-ker_raccs[33, 21] = 0.103389e00
-ker_raccs[33, 22] = 0.876948e-01
-ker_raccs[33, 23] = 0.940326e-01
-ker_raccs[33, 24] = 0.114972e00
-ker_raccs[33, 25] = 0.142046e00
-ker_raccs[33, 26] = 0.168966e00
-ker_raccs[33, 27] = 0.192699e00
-ker_raccs[33, 28] = 0.212559e00
-ker_raccs[33, 29] = 0.228864e00
-ker_raccs[33, 30] = 0.242156e00
-ker_raccs[33, 31] = 0.252953e00
-ker_raccs[33, 32] = 0.261707e00
-ker_raccs[33, 33] = 0.268801e00
-ker_raccs[33, 34] = 0.274551e00
-ker_raccs[33, 35] = 0.279216e00
-ker_raccs[33, 36] = 0.283006e00
-ker_raccs[33, 37] = 0.286089e00
-ker_raccs[33, 38] = 0.288600e00
-ker_raccs[33, 39] = 0.290648e00
-ker_raccs[33, 40] = 0.292320e00
-ker_raccs[34, 1] = 0.136464e02
-ker_raccs[34, 2] = 0.112582e02
-ker_raccs[34, 3] = 0.928102e01
-ker_raccs[34, 4] = 0.764412e01
-ker_raccs[34, 5] = 0.628891e01
-ker_raccs[34, 6] = 0.516688e01
-ker_raccs[34, 7] = 0.423787e01
-ker_raccs[34, 8] = 0.346865e01
-ker_raccs[34, 9] = 0.283167e01
-ker_raccs[34, 10] = 0.230415e01
-ker_raccs[34, 11] = 0.186723e01
-ker_raccs[34, 12] = 0.150527e01
-ker_raccs[34, 13] = 0.120533e01
-ker_raccs[34, 14] = 0.956703e00
-ker_raccs[34, 15] = 0.750546e00
-ker_raccs[34, 16] = 0.579618e00
-ker_raccs[34, 17] = 0.438164e00
-ker_raccs[34, 18] = 0.321920e00
-ker_raccs[34, 19] = 0.228381e00
-ker_raccs[34, 20] = 0.157004e00
-ker_raccs[34, 21] = 0.108653e00
-ker_raccs[34, 22] = 0.841812e-01
-ker_raccs[34, 23] = 0.818931e-01
-ker_raccs[34, 24] = 0.964120e-01
-ker_raccs[34, 25] = 0.120012e00
-ker_raccs[34, 26] = 0.145780e00
-ker_raccs[34, 27] = 0.169586e00
-ker_raccs[34, 28] = 0.189966e00
-ker_raccs[34, 29] = 0.206893e00
-ker_raccs[34, 30] = 0.220793e00
-ker_raccs[34, 31] = 0.232137e00
-ker_raccs[34, 32] = 0.241360e00
-ker_raccs[34, 33] = 0.248841e00
-ker_raccs[34, 34] = 0.254902e00
-ker_raccs[34, 35] = 0.259814e00
-ker_raccs[34, 36] = 0.263797e00
-ker_raccs[34, 37] = 0.267030e00
-ker_raccs[34, 38] = 0.269658e00
-ker_raccs[34, 39] = 0.271797e00
-ker_raccs[34, 40] = 0.273540e00
-ker_raccs[35, 1] = 0.136614e02
-ker_raccs[35, 2] = 0.112733e02
-ker_raccs[35, 3] = 0.929618e01
-ker_raccs[35, 4] = 0.765939e01
-ker_raccs[35, 5] = 0.630429e01
-ker_raccs[35, 6] = 0.518237e01
-ker_raccs[35, 7] = 0.425350e01
-ker_raccs[35, 8] = 0.348441e01
-ker_raccs[35, 9] = 0.284759e01
-ker_raccs[35, 10] = 0.232025e01
-ker_raccs[35, 11] = 0.188353e01
-ker_raccs[35, 12] = 0.152179e01
-ker_raccs[35, 13] = 0.122210e01
-ker_raccs[35, 14] = 0.973753e00
-ker_raccs[35, 15] = 0.767890e00
-ker_raccs[35, 16] = 0.597225e00
-ker_raccs[35, 17] = 0.455867e00
-ker_raccs[35, 18] = 0.339275e00
-ker_raccs[35, 19] = 0.244416e00
-ker_raccs[35, 20] = 0.169957e00
-ker_raccs[35, 21] = 0.116255e00
-ker_raccs[35, 22] = 0.843838e-01
-ker_raccs[35, 23] = 0.739429e-01
-ker_raccs[35, 24] = 0.815390e-01
-ker_raccs[35, 25] = 0.100685e00
-ker_raccs[35, 26] = 0.124455e00
-ker_raccs[35, 27] = 0.147808e00
-ker_raccs[35, 28] = 0.168434e00
-ker_raccs[35, 29] = 0.185847e00
-ker_raccs[35, 30] = 0.200294e00
-ker_raccs[35, 31] = 0.212176e00
-ker_raccs[35, 32] = 0.221887e00
-ker_raccs[35, 33] = 0.229789e00
-ker_raccs[35, 34] = 0.236201e00
-ker_raccs[35, 35] = 0.241396e00
-ker_raccs[35, 36] = 0.245605e00
-ker_raccs[35, 37] = 0.249015e00
-ker_raccs[35, 38] = 0.251782e00
-ker_raccs[35, 39] = 0.254029e00
-ker_raccs[35, 40] = 0.255856e00
-ker_raccs[36, 1] = 0.136752e02
-ker_raccs[36, 2] = 0.112871e02
-ker_raccs[36, 3] = 0.931013e01
-ker_raccs[36, 4] = 0.767342e01
-ker_raccs[36, 5] = 0.631840e01
-ker_raccs[36, 6] = 0.519658e01
-ker_raccs[36, 7] = 0.426781e01
-ker_raccs[36, 8] = 0.349883e01
-ker_raccs[36, 9] = 0.286213e01
-ker_raccs[36, 10] = 0.233493e01
-ker_raccs[36, 11] = 0.189836e01
-ker_raccs[36, 12] = 0.153679e01
-ker_raccs[36, 13] = 0.123730e01
-ker_raccs[36, 14] = 0.989170e00
-ker_raccs[36, 15] = 0.783542e00
-ker_raccs[36, 16] = 0.613107e00
-ker_raccs[36, 17] = 0.471895e00
-ker_raccs[36, 18] = 0.355181e00
-ker_raccs[36, 19] = 0.259564e00
-ker_raccs[36, 20] = 0.183119e00
-ker_raccs[36, 21] = 0.125501e00
-ker_raccs[36, 22] = 0.876130e-01
-ker_raccs[36, 23] = 0.698509e-01
-ker_raccs[36, 24] = 0.704131e-01
-ker_raccs[36, 25] = 0.843947e-01
-ker_raccs[36, 26] = 0.105303e00
-ker_raccs[36, 27] = 0.127595e00
-ker_raccs[36, 28] = 0.148112e00
-ker_raccs[36, 29] = 0.165804e00
-ker_raccs[36, 30] = 0.180678e00
-ker_raccs[36, 31] = 0.193038e00
-ker_raccs[36, 32] = 0.203226e00
-ker_raccs[36, 33] = 0.211566e00
-ker_raccs[36, 34] = 0.218358e00
-ker_raccs[36, 35] = 0.223872e00
-ker_raccs[36, 36] = 0.228339e00
-ker_raccs[36, 37] = 0.231956e00
-ker_raccs[36, 38] = 0.234886e00
-ker_raccs[36, 39] = 0.237261e00
-ker_raccs[36, 40] = 0.239188e00
-ker_raccs[37, 1] = 0.136880e02
-ker_raccs[37, 2] = 0.113000e02
-ker_raccs[37, 3] = 0.932301e01
-ker_raccs[37, 4] = 0.768635e01
-ker_raccs[37, 5] = 0.633140e01
-ker_raccs[37, 6] = 0.520966e01
-ker_raccs[37, 7] = 0.428096e01
-ker_raccs[37, 8] = 0.351207e01
-ker_raccs[37, 9] = 0.287547e01
-ker_raccs[37, 10] = 0.234837e01
-ker_raccs[37, 11] = 0.191192e01
-ker_raccs[37, 12] = 0.155048e01
-ker_raccs[37, 13] = 0.125114e01
-ker_raccs[37, 14] = 0.100318e01
-ker_raccs[37, 15] = 0.797739e00
-ker_raccs[37, 16] = 0.627493e00
-ker_raccs[37, 17] = 0.486429e00
-ker_raccs[37, 18] = 0.369711e00
-ker_raccs[37, 19] = 0.273656e00
-ker_raccs[37, 20] = 0.195887e00
-ker_raccs[37, 21] = 0.135541e00
-ker_raccs[37, 22] = 0.929713e-01
-ker_raccs[37, 23] = 0.689449e-01
-ker_raccs[37, 24] = 0.628067e-01
-ker_raccs[37, 25] = 0.712146e-01
-ker_raccs[37, 26] = 0.885642e-01
-ker_raccs[37, 27] = 0.109176e00
-ker_raccs[37, 28] = 0.129175e00
-ker_raccs[37, 29] = 0.146887e00
-ker_raccs[37, 30] = 0.162013e00
-ker_raccs[37, 31] = 0.174742e00
-ker_raccs[37, 32] = 0.185350e00
-ker_raccs[37, 33] = 0.194114e00
-ker_raccs[37, 34] = 0.201300e00
-ker_raccs[37, 35] = 0.207158e00
-ker_raccs[37, 36] = 0.211915e00
-ker_raccs[37, 37] = 0.215769e00
-ker_raccs[37, 38] = 0.218888e00
-ker_raccs[37, 39] = 0.221414e00
-ker_raccs[37, 40] = 0.223459e00
-ker_raccs[38, 1] = 0.136998e02
-ker_raccs[38, 2] = 0.113118e02
-ker_raccs[38, 3] = 0.933491e01
-ker_raccs[38, 4] = 0.769831e01
-ker_raccs[38, 5] = 0.634341e01
-ker_raccs[38, 6] = 0.522172e01
-ker_raccs[38, 7] = 0.429308e01
-ker_raccs[38, 8] = 0.352426e01
-ker_raccs[38, 9] = 0.288774e01
-ker_raccs[38, 10] = 0.236072e01
-ker_raccs[38, 11] = 0.192436e01
-ker_raccs[38, 12] = 0.156302e01
-ker_raccs[38, 13] = 0.126380e01
-ker_raccs[38, 14] = 0.101597e01
-ker_raccs[38, 15] = 0.810672e00
-ker_raccs[38, 16] = 0.640582e00
-ker_raccs[38, 17] = 0.499655e00
-ker_raccs[38, 18] = 0.382979e00
-ker_raccs[38, 19] = 0.286703e00
-ker_raccs[38, 20] = 0.208118e00
-ker_raccs[38, 21] = 0.145802e00
-ker_raccs[38, 22] = 0.996958e-01
-ker_raccs[38, 23] = 0.705180e-01
-ker_raccs[38, 24] = 0.583121e-01
-ker_raccs[38, 25] = 0.611067e-01
-ker_raccs[38, 26] = 0.743784e-01
-ker_raccs[38, 27] = 0.927345e-01
-ker_raccs[38, 28] = 0.111788e00
-ker_raccs[38, 29] = 0.129236e00
-ker_raccs[38, 30] = 0.144407e00
-ker_raccs[38, 31] = 0.157347e00
-ker_raccs[38, 32] = 0.168273e00
-ker_raccs[38, 33] = 0.177407e00
-ker_raccs[38, 34] = 0.184972e00
-ker_raccs[38, 35] = 0.191185e00
-ker_raccs[38, 36] = 0.196255e00
-ker_raccs[38, 37] = 0.200374e00
-ker_raccs[38, 38] = 0.203711e00
-ker_raccs[38, 39] = 0.206411e00
-ker_raccs[38, 40] = 0.208595e00
-ker_raccs[39, 1] = 0.137108e02
-ker_raccs[39, 2] = 0.113228e02
-ker_raccs[39, 3] = 0.934595e01
-ker_raccs[39, 4] = 0.770939e01
-ker_raccs[39, 5] = 0.635453e01
-ker_raccs[39, 6] = 0.523288e01
-ker_raccs[39, 7] = 0.430429e01
-ker_raccs[39, 8] = 0.353552e01
-ker_raccs[39, 9] = 0.289905e01
-ker_raccs[39, 10] = 0.237210e01
-ker_raccs[39, 11] = 0.193581e01
-ker_raccs[39, 12] = 0.157455e01
-ker_raccs[39, 13] = 0.127542e01
-ker_raccs[39, 14] = 0.102769e01
-ker_raccs[39, 15] = 0.822505e00
-ker_raccs[39, 16] = 0.652537e00
-ker_raccs[39, 17] = 0.511728e00
-ker_raccs[39, 18] = 0.395120e00
-ker_raccs[39, 19] = 0.298748e00
-ker_raccs[39, 20] = 0.219673e00
-ker_raccs[39, 21] = 0.156076e00
-ker_raccs[39, 22] = 0.107363e00
-ker_raccs[39, 23] = 0.740476e-01
-ker_raccs[39, 24] = 0.565449e-01
-ker_raccs[39, 25] = 0.539031e-01
-ker_raccs[39, 26] = 0.628068e-01
-ker_raccs[39, 27] = 0.783909e-01
-ker_raccs[39, 28] = 0.960758e-01
-ker_raccs[39, 29] = 0.112978e00
-ker_raccs[39, 30] = 0.127980e00
-ker_raccs[39, 31] = 0.140952e00
-ker_raccs[39, 32] = 0.152050e00
-ker_raccs[39, 33] = 0.161459e00
-ker_raccs[39, 34] = 0.169352e00
-ker_raccs[39, 35] = 0.175905e00
-ker_raccs[39, 36] = 0.181296e00
-ker_raccs[39, 37] = 0.185700e00
-ker_raccs[39, 38] = 0.189279e00
-ker_raccs[39, 39] = 0.192179e00
-ker_raccs[39, 40] = 0.194525e00
-ker_raccs[40, 1] = 0.137209e02
-ker_raccs[40, 2] = 0.113330e02
-ker_raccs[40, 3] = 0.935620e01
-ker_raccs[40, 4] = 0.771967e01
-ker_raccs[40, 5] = 0.636484e01
-ker_raccs[40, 6] = 0.524323e01
-ker_raccs[40, 7] = 0.431468e01
-ker_raccs[40, 8] = 0.354595e01
-ker_raccs[40, 9] = 0.290952e01
-ker_raccs[40, 10] = 0.238262e01
-ker_raccs[40, 11] = 0.194638e01
-ker_raccs[40, 12] = 0.158519e01
-ker_raccs[40, 13] = 0.128612e01
-ker_raccs[40, 14] = 0.103847e01
-ker_raccs[40, 15] = 0.833372e00
-ker_raccs[40, 16] = 0.663500e00
-ker_raccs[40, 17] = 0.522788e00
-ker_raccs[40, 18] = 0.406248e00
-ker_raccs[40, 19] = 0.309849e00
-ker_raccs[40, 20] = 0.230469e00
-ker_raccs[40, 21] = 0.165985e00
-ker_raccs[40, 22] = 0.115455e00
-ker_raccs[40, 23] = 0.789238e-01
-ker_raccs[40, 24] = 0.569440e-01
-ker_raccs[40, 25] = 0.492680e-01
-ker_raccs[40, 26] = 0.537042e-01
-ker_raccs[40, 27] = 0.661559e-01
-ker_raccs[40, 28] = 0.821048e-01
-ker_raccs[40, 29] = 0.981944e-01
-ker_raccs[40, 30] = 0.112835e00
-ker_raccs[40, 31] = 0.125662e00
-ker_raccs[40, 32] = 0.136771e00
-ker_raccs[40, 33] = 0.146319e00
-ker_raccs[40, 34] = 0.154449e00
-ker_raccs[40, 35] = 0.161294e00
-ker_raccs[40, 36] = 0.166991e00
-ker_raccs[40, 37] = 0.171687e00
-ker_raccs[40, 38] = 0.175527e00
-ker_raccs[40, 39] = 0.178649e00
-ker_raccs[40, 40] = 0.181179e00
-
-ker_saccrg[1, 1] = 0.438311e-02
-ker_saccrg[1, 2] = 0.641932e-02
-ker_saccrg[1, 3] = 0.104323e-01
-ker_saccrg[1, 4] = 0.135168e-01
-ker_saccrg[1, 5] = 0.186190e-01
-ker_saccrg[1, 6] = 0.326141e-01
-ker_saccrg[1, 7] = 0.629897e-01
-ker_saccrg[1, 8] = 0.120410e00
-ker_saccrg[1, 9] = 0.232733e00
-ker_saccrg[1, 10] = 0.430353e00
-ker_saccrg[1, 11] = 0.742288e00
-ker_saccrg[1, 12] = 0.118527e01
-ker_saccrg[1, 13] = 0.175377e01
-ker_saccrg[1, 14] = 0.241509e01
-ker_saccrg[1, 15] = 0.311676e01
-ker_saccrg[1, 16] = 0.380271e01
-ker_saccrg[1, 17] = 0.442968e01
-ker_saccrg[1, 18] = 0.497509e01
-ker_saccrg[1, 19] = 0.543503e01
-ker_saccrg[1, 20] = 0.579503e01
-ker_saccrg[1, 21] = 0.611243e01
-ker_saccrg[1, 22] = 0.637529e01
-ker_saccrg[1, 23] = 0.655579e01
-ker_saccrg[1, 24] = 0.674119e01
-ker_saccrg[1, 25] = 0.685610e01
-ker_saccrg[1, 26] = 0.695045e01
-ker_saccrg[1, 27] = 0.703114e01
-ker_saccrg[1, 28] = 0.706922e01
-ker_saccrg[1, 29] = 0.710917e01
-ker_saccrg[1, 30] = 0.715122e01
-ker_saccrg[1, 31] = 0.717481e01
-ker_saccrg[1, 32] = 0.718927e01
-ker_saccrg[1, 33] = 0.720073e01
-ker_saccrg[1, 34] = 0.720264e01
-ker_saccrg[1, 35] = 0.721205e01
-ker_saccrg[1, 36] = 0.723197e01
-ker_saccrg[1, 37] = 0.000000e00
-ker_saccrg[1, 38] = 0.000000e00
-ker_saccrg[1, 39] = 0.000000e00
-ker_saccrg[1, 40] = 0.000000e00
-ker_saccrg[2, 1] = 0.277360e-02
-ker_saccrg[2, 2] = 0.359904e-02
-ker_saccrg[2, 3] = 0.526623e-02
-ker_saccrg[2, 4] = 0.855403e-02
-ker_saccrg[2, 5] = 0.110798e-01
-ker_saccrg[2, 6] = 0.152575e-01
-ker_saccrg[2, 7] = 0.267157e-01
-ker_saccrg[2, 8] = 0.515725e-01
-ker_saccrg[2, 9] = 0.985371e-01
-ker_saccrg[2, 10] = 0.190336e00
-ker_saccrg[2, 11] = 0.351702e00
-ker_saccrg[2, 12] = 0.606144e00
-ker_saccrg[2, 13] = 0.967078e00
-ker_saccrg[2, 14] = 0.142977e01
-ker_saccrg[2, 15] = 0.196754e01
-ker_saccrg[2, 16] = 0.253781e01
-ker_saccrg[2, 17] = 0.309551e01
-ker_saccrg[2, 18] = 0.360619e01
-ker_saccrg[2, 19] = 0.405195e01
-ker_saccrg[2, 20] = 0.441025e01
-ker_saccrg[2, 21] = 0.472710e01
-ker_saccrg[2, 22] = 0.499143e01
-ker_saccrg[2, 23] = 0.517586e01
-ker_saccrg[2, 24] = 0.536386e01
-ker_saccrg[2, 25] = 0.548206e01
-ker_saccrg[2, 26] = 0.557912e01
-ker_saccrg[2, 27] = 0.566202e01
-ker_saccrg[2, 28] = 0.570152e01
-ker_saccrg[2, 29] = 0.574264e01
-ker_saccrg[2, 30] = 0.578573e01
-ker_saccrg[2, 31] = 0.580997e01
-ker_saccrg[2, 32] = 0.582483e01
-ker_saccrg[2, 33] = 0.583658e01
-ker_saccrg[2, 34] = 0.583857e01
-ker_saccrg[2, 35] = 0.584821e01
-ker_saccrg[2, 36] = 0.586858e01
-ker_saccrg[2, 37] = 0.000000e00
-ker_saccrg[2, 38] = 0.000000e00
-ker_saccrg[2, 39] = 0.000000e00
-ker_saccrg[2, 40] = 0.000000e00
-ker_saccrg[3, 1] = 0.213410e-02
-ker_saccrg[3, 2] = 0.228042e-02
-ker_saccrg[3, 3] = 0.295439e-02
-ker_saccrg[3, 4] = 0.431810e-02
-ker_saccrg[3, 5] = 0.700935e-02
-ker_saccrg[3, 6] = 0.907613e-02
-ker_saccrg[3, 7] = 0.124938e-01
-ker_saccrg[3, 8] = 0.218668e-01
-ker_saccrg[3, 9] = 0.421887e-01
-ker_saccrg[3, 10] = 0.805544e-01
-ker_saccrg[3, 11] = 0.155474e00
-ker_saccrg[3, 12] = 0.287036e00
-ker_saccrg[3, 13] = 0.494206e00
-ker_saccrg[3, 14] = 0.787675e00
-ker_saccrg[3, 15] = 0.116334e01
-ker_saccrg[3, 16] = 0.159943e01
-ker_saccrg[3, 17] = 0.206153e01
-ker_saccrg[3, 18] = 0.251365e01
-ker_saccrg[3, 19] = 0.292842e01
-ker_saccrg[3, 20] = 0.327509e01
-ker_saccrg[3, 21] = 0.358546e01
-ker_saccrg[3, 22] = 0.384740e01
-ker_saccrg[3, 23] = 0.403374e01
-ker_saccrg[3, 24] = 0.422232e01
-ker_saccrg[3, 25] = 0.434292e01
-ker_saccrg[3, 26] = 0.444208e01
-ker_saccrg[3, 27] = 0.452673e01
-ker_saccrg[3, 28] = 0.456755e01
-ker_saccrg[3, 29] = 0.460968e01
-ker_saccrg[3, 30] = 0.465368e01
-ker_saccrg[3, 31] = 0.467850e01
-ker_saccrg[3, 32] = 0.469374e01
-ker_saccrg[3, 33] = 0.470577e01
-ker_saccrg[3, 34] = 0.470785e01
-ker_saccrg[3, 35] = 0.471769e01
-ker_saccrg[3, 36] = 0.473846e01
-ker_saccrg[3, 37] = 0.000000e00
-ker_saccrg[3, 38] = 0.000000e00
-ker_saccrg[3, 39] = 0.000000e00
-ker_saccrg[3, 40] = 0.000000e00
-ker_saccrg[4, 1] = 0.295930e-03
-ker_saccrg[4, 2] = 0.175883e-02
-ker_saccrg[4, 3] = 0.187537e-02
-ker_saccrg[4, 4] = 0.242497e-02
-ker_saccrg[4, 5] = 0.353954e-02
-ker_saccrg[4, 6] = 0.574121e-02
-ker_saccrg[4, 7] = 0.743054e-02
-ker_saccrg[4, 8] = 0.102239e-01
-ker_saccrg[4, 9] = 0.178843e-01
-ker_saccrg[4, 10] = 0.344817e-01
-ker_saccrg[4, 11] = 0.657827e-01
-ker_saccrg[4, 12] = 0.126844e00
-ker_saccrg[4, 13] = 0.233919e00
-ker_saccrg[4, 14] = 0.402255e00
-ker_saccrg[4, 15] = 0.640286e00
-ker_saccrg[4, 16] = 0.944426e00
-ker_saccrg[4, 17] = 0.129689e01
-ker_saccrg[4, 18] = 0.167004e01
-ker_saccrg[4, 19] = 0.203514e01
-ker_saccrg[4, 20] = 0.235706e01
-ker_saccrg[4, 21] = 0.265244e01
-ker_saccrg[4, 22] = 0.290663e01
-ker_saccrg[4, 23] = 0.309194e01
-ker_saccrg[4, 24] = 0.327835e01
-ker_saccrg[4, 25] = 0.339993e01
-ker_saccrg[4, 26] = 0.350021e01
-ker_saccrg[4, 27] = 0.358586e01
-ker_saccrg[4, 28] = 0.362775e01
-ker_saccrg[4, 29] = 0.367067e01
-ker_saccrg[4, 30] = 0.371533e01
-ker_saccrg[4, 31] = 0.374064e01
-ker_saccrg[4, 32] = 0.375621e01
-ker_saccrg[4, 33] = 0.376848e01
-ker_saccrg[4, 34] = 0.377064e01
-ker_saccrg[4, 35] = 0.378066e01
-ker_saccrg[4, 36] = 0.380174e01
-ker_saccrg[4, 37] = 0.000000e00
-ker_saccrg[4, 38] = 0.000000e00
-ker_saccrg[4, 39] = 0.000000e00
-ker_saccrg[4, 40] = 0.000000e00
-ker_saccrg[5, 1] = 0.258805e-03
-ker_saccrg[5, 2] = 0.244750e-03
-ker_saccrg[5, 3] = 0.145106e-02
-ker_saccrg[5, 4] = 0.154319e-02
-ker_saccrg[5, 5] = 0.199078e-02
-ker_saccrg[5, 6] = 0.290099e-02
-ker_saccrg[5, 7] = 0.470103e-02
-ker_saccrg[5, 8] = 0.608063e-02
-ker_saccrg[5, 9] = 0.836193e-02
-ker_saccrg[5, 10] = 0.146173e-01
-ker_saccrg[5, 11] = 0.281586e-01
-ker_saccrg[5, 12] = 0.536650e-01
-ker_saccrg[5, 13] = 0.103352e00
-ker_saccrg[5, 14] = 0.190326e00
-ker_saccrg[5, 15] = 0.326791e00
-ker_saccrg[5, 16] = 0.519290e00
-ker_saccrg[5, 17] = 0.764650e00
-ker_saccrg[5, 18] = 0.104842e01
-ker_saccrg[5, 19] = 0.134831e01
-ker_saccrg[5, 20] = 0.163103e01
-ker_saccrg[5, 21] = 0.190095e01
-ker_saccrg[5, 22] = 0.214036e01
-ker_saccrg[5, 23] = 0.232046e01
-ker_saccrg[5, 24] = 0.250112e01
-ker_saccrg[5, 25] = 0.262167e01
-ker_saccrg[5, 26] = 0.272160e01
-ker_saccrg[5, 27] = 0.280712e01
-ker_saccrg[5, 28] = 0.284966e01
-ker_saccrg[5, 29] = 0.289298e01
-ker_saccrg[5, 30] = 0.293794e01
-ker_saccrg[5, 31] = 0.296358e01
-ker_saccrg[5, 32] = 0.297938e01
-ker_saccrg[5, 33] = 0.299183e01
-ker_saccrg[5, 34] = 0.299407e01
-ker_saccrg[5, 35] = 0.300421e01
-ker_saccrg[5, 36] = 0.302549e01
-ker_saccrg[5, 37] = 0.000000e00
-ker_saccrg[5, 38] = 0.000000e00
-ker_saccrg[5, 39] = 0.000000e00
-ker_saccrg[5, 40] = 0.000000e00
-ker_saccrg[6, 1] = 0.113399e-04
-ker_saccrg[6, 2] = 0.215064e-03
-ker_saccrg[6, 3] = 0.202732e-03
-ker_saccrg[6, 4] = 0.119915e-02
-ker_saccrg[6, 5] = 0.127127e-02
-ker_saccrg[6, 6] = 0.163527e-02
-ker_saccrg[6, 7] = 0.237805e-02
-ker_saccrg[6, 8] = 0.384847e-02
-ker_saccrg[6, 9] = 0.497431e-02
-ker_saccrg[6, 10] = 0.683637e-02
-ker_saccrg[6, 11] = 0.119405e-01
-ker_saccrg[6, 12] = 0.229776e-01
-ker_saccrg[6, 13] = 0.437340e-01
-ker_saccrg[6, 14] = 0.840961e-01
-ker_saccrg[6, 15] = 0.154590e00
-ker_saccrg[6, 16] = 0.264896e00
-ker_saccrg[6, 17] = 0.420012e00
-ker_saccrg[6, 18] = 0.617142e00
-ker_saccrg[6, 19] = 0.844302e00
-ker_saccrg[6, 20] = 0.107600e01
-ker_saccrg[6, 21] = 0.130965e01
-ker_saccrg[6, 22] = 0.152596e01
-ker_saccrg[6, 23] = 0.169541e01
-ker_saccrg[6, 24] = 0.186600e01
-ker_saccrg[6, 25] = 0.198276e01
-ker_saccrg[6, 26] = 0.208029e01
-ker_saccrg[6, 27] = 0.216408e01
-ker_saccrg[6, 28] = 0.220656e01
-ker_saccrg[6, 29] = 0.224971e01
-ker_saccrg[6, 30] = 0.229446e01
-ker_saccrg[6, 31] = 0.232020e01
-ker_saccrg[6, 32] = 0.233613e01
-ker_saccrg[6, 33] = 0.234866e01
-ker_saccrg[6, 34] = 0.235098e01
-ker_saccrg[6, 35] = 0.236115e01
-ker_saccrg[6, 36] = 0.238249e01
-ker_saccrg[6, 37] = 0.000000e00
-ker_saccrg[6, 38] = 0.000000e00
-ker_saccrg[6, 39] = 0.000000e00
-ker_saccrg[6, 40] = 0.000000e00
-ker_saccrg[7, 1] = 0.140987e-06
-ker_saccrg[7, 2] = 0.947184e-05
-ker_saccrg[7, 3] = 0.179369e-03
-ker_saccrg[7, 4] = 0.168563e-03
-ker_saccrg[7, 5] = 0.993006e-03
-ker_saccrg[7, 6] = 0.104915e-02
-ker_saccrg[7, 7] = 0.134474e-02
-ker_saccrg[7, 8] = 0.195051e-02
-ker_saccrg[7, 9] = 0.315182e-02
-ker_saccrg[7, 10] = 0.406997e-02
-ker_saccrg[7, 11] = 0.558802e-02
-ker_saccrg[7, 12] = 0.975020e-02
-ker_saccrg[7, 13] = 0.187363e-01
-ker_saccrg[7, 14] = 0.356024e-01
-ker_saccrg[7, 15] = 0.683270e-01
-ker_saccrg[7, 16] = 0.125305e00
-ker_saccrg[7, 17] = 0.214147e00
-ker_saccrg[7, 18] = 0.338617e00
-ker_saccrg[7, 19] = 0.495951e00
-ker_saccrg[7, 20] = 0.671057e00
-ker_saccrg[7, 21] = 0.860119e00
-ker_saccrg[7, 22] = 0.104532e01
-ker_saccrg[7, 23] = 0.119790e01
-ker_saccrg[7, 24] = 0.135335e01
-ker_saccrg[7, 25] = 0.146305e01
-ker_saccrg[7, 26] = 0.155556e01
-ker_saccrg[7, 27] = 0.163553e01
-ker_saccrg[7, 28] = 0.167695e01
-ker_saccrg[7, 29] = 0.171904e01
-ker_saccrg[7, 30] = 0.176289e01
-ker_saccrg[7, 31] = 0.178841e01
-ker_saccrg[7, 32] = 0.180429e01
-ker_saccrg[7, 33] = 0.181678e01
-ker_saccrg[7, 34] = 0.181916e01
-ker_saccrg[7, 35] = 0.182927e01
-ker_saccrg[7, 36] = 0.185045e01
-ker_saccrg[7, 37] = 0.000000e00
-ker_saccrg[7, 38] = 0.000000e00
-ker_saccrg[7, 39] = 0.000000e00
-ker_saccrg[7, 40] = 0.000000e00
-ker_saccrg[8, 1] = 0.000000e00
-ker_saccrg[8, 2] = 0.120931e-06
-ker_saccrg[8, 3] = 0.796677e-05
-ker_saccrg[8, 4] = 0.150232e-03
-ker_saccrg[8, 5] = 0.140781e-03
-ker_saccrg[8, 6] = 0.825725e-03
-ker_saccrg[8, 7] = 0.867958e-03
-ker_saccrg[8, 8] = 0.110764e-02
-ker_saccrg[8, 9] = 0.160165e-02
-ker_saccrg[8, 10] = 0.258288e-02
-ker_saccrg[8, 11] = 0.333132e-02
-ker_saccrg[8, 12] = 0.456846e-02
-ker_saccrg[8, 13] = 0.795989e-02
-ker_saccrg[8, 14] = 0.152680e-01
-ker_saccrg[8, 15] = 0.289527e-01
-ker_saccrg[8, 16] = 0.554343e-01
-ker_saccrg[8, 17] = 0.101328e00
-ker_saccrg[8, 18] = 0.172576e00
-ker_saccrg[8, 19] = 0.271870e00
-ker_saccrg[8, 20] = 0.392855e00
-ker_saccrg[8, 21] = 0.534703e00
-ker_saccrg[8, 22] = 0.683665e00
-ker_saccrg[8, 23] = 0.814385e00
-ker_saccrg[8, 24] = 0.950462e00
-ker_saccrg[8, 25] = 0.105116e01
-ker_saccrg[8, 26] = 0.113664e01
-ker_saccrg[8, 27] = 0.121103e01
-ker_saccrg[8, 28] = 0.125059e01
-ker_saccrg[8, 29] = 0.128945e01
-ker_saccrg[8, 30] = 0.132965e01
-ker_saccrg[8, 31] = 0.135316e01
-ker_saccrg[8, 32] = 0.136781e01
-ker_saccrg[8, 33] = 0.137937e01
-ker_saccrg[8, 34] = 0.138153e01
-ker_saccrg[8, 35] = 0.139094e01
-ker_saccrg[8, 36] = 0.141107e01
-ker_saccrg[8, 37] = 0.000000e00
-ker_saccrg[8, 38] = 0.000000e00
-ker_saccrg[8, 39] = 0.000000e00
-ker_saccrg[8, 40] = 0.000000e00
-ker_saccrg[9, 1] = 0.000000e00
-ker_saccrg[9, 2] = 0.000000e00
-ker_saccrg[9, 3] = 0.104997e-06
-ker_saccrg[9, 4] = 0.675258e-05
-ker_saccrg[9, 5] = 0.126824e-03
-ker_saccrg[9, 6] = 0.118316e-03
-ker_saccrg[9, 7] = 0.690238e-03
-ker_saccrg[9, 8] = 0.721206e-03
-ker_saccrg[9, 9] = 0.915100e-03
-ker_saccrg[9, 10] = 0.131754e-02
-ker_saccrg[9, 11] = 0.143784e-02
-ker_saccrg[9, 12] = 0.272855e-02
-ker_saccrg[9, 13] = 0.373587e-02
-ker_saccrg[9, 14] = 0.649562e-02
-ker_saccrg[9, 15] = 0.120098e-01
-ker_saccrg[9, 16] = 0.235379e-01
-ker_saccrg[9, 17] = 0.448605e-01
-ker_saccrg[9, 18] = 0.816757e-01
-ker_saccrg[9, 19] = 0.138586e00
-ker_saccrg[9, 20] = 0.214609e00
-ker_saccrg[9, 21] = 0.312274e00
-ker_saccrg[9, 22] = 0.423436e00
-ker_saccrg[9, 23] = 0.528300e00
-ker_saccrg[9, 24] = 0.641806e00
-ker_saccrg[9, 25] = 0.730809e00
-ker_saccrg[9, 26] = 0.808021e00
-ker_saccrg[9, 27] = 0.875899e00
-ker_saccrg[9, 28] = 0.913416e00
-ker_saccrg[9, 29] = 0.949497e00
-ker_saccrg[9, 30] = 0.986085e00
-ker_saccrg[9, 31] = 0.100768e01
-ker_saccrg[9, 32] = 0.102123e01
-ker_saccrg[9, 33] = 0.103190e01
-ker_saccrg[9, 34] = 0.103403e01
-ker_saccrg[9, 35] = 0.104270e01
-ker_saccrg[9, 36] = 0.106096e01
-ker_saccrg[9, 37] = 0.000000e00
-ker_saccrg[9, 38] = 0.000000e00
-ker_saccrg[9, 39] = 0.000000e00
-ker_saccrg[9, 40] = 0.000000e00
-ker_saccrg[10, 1] = 0.000000e00
-ker_saccrg[10, 2] = 0.000000e00
-ker_saccrg[10, 3] = 0.000000e00
-ker_saccrg[10, 4] = 0.925928e-07
-ker_saccrg[10, 5] = 0.578353e-05
-ker_saccrg[10, 6] = 0.108100e-03
-ker_saccrg[10, 7] = 0.100301e-03
-ker_saccrg[10, 8] = 0.581236e-03
-ker_saccrg[10, 9] = 0.602709e-03
-ker_saccrg[10, 10] = 0.759037e-03
-ker_saccrg[10, 11] = 0.108651e-02
-ker_saccrg[10, 12] = 0.118139e-02
-ker_saccrg[10, 13] = 0.223637e-02
-ker_saccrg[10, 14] = 0.305413e-02
-ker_saccrg[10, 15] = 0.529953e-02
-ker_saccrg[10, 16] = 0.980986e-02
-ker_saccrg[10, 17] = 0.190727e-01
-ker_saccrg[10, 18] = 0.361040e-01
-ker_saccrg[10, 19] = 0.657489e-01
-ker_saccrg[10, 20] = 0.108973e00
-ker_saccrg[10, 21] = 0.170419e00
-ker_saccrg[10, 22] = 0.246769e00
-ker_saccrg[10, 23] = 0.324574e00
-ker_saccrg[10, 24] = 0.413749e00
-ker_saccrg[10, 25] = 0.487749e00
-ker_saccrg[10, 26] = 0.555040e00
-ker_saccrg[10, 27] = 0.614174e00
-ker_saccrg[10, 28] = 0.647730e00
-ker_saccrg[10, 29] = 0.679592e00
-ker_saccrg[10, 30] = 0.711627e00
-ker_saccrg[10, 31] = 0.730757e00
-ker_saccrg[10, 32] = 0.742853e00
-ker_saccrg[10, 33] = 0.752426e00
-ker_saccrg[10, 34] = 0.754388e00
-ker_saccrg[10, 35] = 0.762180e00
-ker_saccrg[10, 36] = 0.778605e00
-ker_saccrg[10, 37] = 0.000000e00
-ker_saccrg[10, 38] = 0.000000e00
-ker_saccrg[10, 39] = 0.000000e00
-ker_saccrg[10, 40] = 0.000000e00
-ker_saccrg[11, 1] = 0.000000e00
-ker_saccrg[11, 2] = 0.000000e00
-ker_saccrg[11, 3] = 0.000000e00
-ker_saccrg[11, 4] = 0.000000e00
-ker_saccrg[11, 5] = 0.832906e-07
-ker_saccrg[11, 6] = 0.502409e-05
-ker_saccrg[11, 7] = 0.933604e-04
-ker_saccrg[11, 8] = 0.860483e-04
-ker_saccrg[11, 9] = 0.494464e-03
-ker_saccrg[11, 10] = 0.507648e-03
-ker_saccrg[11, 11] = 0.632846e-03
-ker_saccrg[11, 12] = 0.898351e-03
-ker_saccrg[11, 13] = 0.971535e-03
-ker_saccrg[11, 14] = 0.183107e-02
-ker_saccrg[11, 15] = 0.249471e-02
-ker_saccrg[11, 16] = 0.439233e-02
-ker_saccrg[11, 17] = 0.797693e-02
-ker_saccrg[11, 18] = 0.152441e-01
-ker_saccrg[11, 19] = 0.293789e-01
-ker_saccrg[11, 20] = 0.515725e-01
-ker_saccrg[11, 21] = 0.871846e-01
-ker_saccrg[11, 22] = 0.135867e00
-ker_saccrg[11, 23] = 0.189869e00
-ker_saccrg[11, 24] = 0.256544e00
-ker_saccrg[11, 25] = 0.317064e00
-ker_saccrg[11, 26] = 0.373502e00
-ker_saccrg[11, 27] = 0.424161e00
-ker_saccrg[11, 28] = 0.454262e00
-ker_saccrg[11, 29] = 0.480107e00
-ker_saccrg[11, 30] = 0.504244e00
-ker_saccrg[11, 31] = 0.518345e00
-ker_saccrg[11, 32] = 0.527147e00
-ker_saccrg[11, 33] = 0.534136e00
-ker_saccrg[11, 34] = 0.535557e00
-ker_saccrg[11, 35] = 0.541319e00
-ker_saccrg[11, 36] = 0.553653e00
-ker_saccrg[11, 37] = 0.000000e00
-ker_saccrg[11, 38] = 0.000000e00
-ker_saccrg[11, 39] = 0.000000e00
-ker_saccrg[11, 40] = 0.000000e00
-ker_saccrg[12, 1] = 0.000000e00
-ker_saccrg[12, 2] = 0.000000e00
-ker_saccrg[12, 3] = 0.000000e00
-ker_saccrg[12, 4] = 0.000000e00
-ker_saccrg[12, 5] = 0.000000e00
-ker_saccrg[12, 6] = 0.773960e-07
-ker_saccrg[12, 7] = 0.444316e-05
-ker_saccrg[12, 8] = 0.820904e-04
-ker_saccrg[12, 9] = 0.749946e-04
-ker_saccrg[12, 10] = 0.426372e-03
-ker_saccrg[12, 11] = 0.431983e-03
-ker_saccrg[12, 12] = 0.530818e-03
-ker_saccrg[12, 13] = 0.743872e-03
-ker_saccrg[12, 14] = 0.796002e-03
-ker_saccrg[12, 15] = 0.116910e-02
-ker_saccrg[12, 16] = 0.216714e-02
-ker_saccrg[12, 17] = 0.358946e-02
-ker_saccrg[12, 18] = 0.644847e-02
-ker_saccrg[12, 19] = 0.128412e-01
-ker_saccrg[12, 20] = 0.229402e-01
-ker_saccrg[12, 21] = 0.422368e-01
-ker_saccrg[12, 22] = 0.714492e-01
-ker_saccrg[12, 23] = 0.106564e00
-ker_saccrg[12, 24] = 0.153890e00
-ker_saccrg[12, 25] = 0.202266e00
-ker_saccrg[12, 26] = 0.249410e00
-ker_saccrg[12, 27] = 0.293259e00
-ker_saccrg[12, 28] = 0.320617e00
-ker_saccrg[12, 29] = 0.341855e00
-ker_saccrg[12, 30] = 0.359983e00
-ker_saccrg[12, 31] = 0.370284e00
-ker_saccrg[12, 32] = 0.376667e00
-ker_saccrg[12, 33] = 0.381816e00
-ker_saccrg[12, 34] = 0.382869e00
-ker_saccrg[12, 35] = 0.387206e00
-ker_saccrg[12, 36] = 0.396588e00
-ker_saccrg[12, 37] = 0.000000e00
-ker_saccrg[12, 38] = 0.000000e00
-ker_saccrg[12, 39] = 0.000000e00
-ker_saccrg[12, 40] = 0.000000e00
-ker_saccrg[13, 1] = 0.000000e00
-ker_saccrg[13, 2] = 0.000000e00
-ker_saccrg[13, 3] = 0.000000e00
-ker_saccrg[13, 4] = 0.000000e00
-ker_saccrg[13, 5] = 0.000000e00
-ker_saccrg[13, 6] = 0.000000e00
-ker_saccrg[13, 7] = 0.735833e-07
-ker_saccrg[13, 8] = 0.403716e-05
-ker_saccrg[13, 9] = 0.739090e-04
-ker_saccrg[13, 10] = 0.668732e-04
-ker_saccrg[13, 11] = 0.374752e-03
-ker_saccrg[13, 12] = 0.372451e-03
-ker_saccrg[13, 13] = 0.447074e-03
-ker_saccrg[13, 14] = 0.610717e-03
-ker_saccrg[13, 15] = 0.641614e-03
-ker_saccrg[13, 16] = 0.119058e-02
-ker_saccrg[13, 17] = 0.179867e-02
-ker_saccrg[13, 18] = 0.291204e-02
-ker_saccrg[13, 19] = 0.606676e-02
-ker_saccrg[13, 20] = 0.100429e-01
-ker_saccrg[13, 21] = 0.203541e-01
-ker_saccrg[13, 22] = 0.377872e-01
-ker_saccrg[13, 23] = 0.606389e-01
-ker_saccrg[13, 24] = 0.937549e-01
-ker_saccrg[13, 25] = 0.133605e00
-ker_saccrg[13, 26] = 0.174990e00
-ker_saccrg[13, 27] = 0.214629e00
-ker_saccrg[13, 28] = 0.241011e00
-ker_saccrg[13, 29] = 0.258073e00
-ker_saccrg[13, 30] = 0.269310e00
-ker_saccrg[13, 31] = 0.274592e00
-ker_saccrg[13, 32] = 0.277413e00
-ker_saccrg[13, 33] = 0.279664e00
-ker_saccrg[13, 34] = 0.280055e00
-ker_saccrg[13, 35] = 0.282059e00
-ker_saccrg[13, 36] = 0.286665e00
-ker_saccrg[13, 37] = 0.000000e00
-ker_saccrg[13, 38] = 0.000000e00
-ker_saccrg[13, 39] = 0.000000e00
-ker_saccrg[13, 40] = 0.000000e00
-ker_saccrg[14, 1] = 0.000000e00
-ker_saccrg[14, 2] = 0.000000e00
-ker_saccrg[14, 3] = 0.000000e00
-ker_saccrg[14, 4] = 0.000000e00
-ker_saccrg[14, 5] = 0.000000e00
-ker_saccrg[14, 6] = 0.000000e00
-ker_saccrg[14, 7] = 0.000000e00
-ker_saccrg[14, 8] = 0.728176e-07
-ker_saccrg[14, 9] = 0.379948e-05
-ker_saccrg[14, 10] = 0.688582e-04
-ker_saccrg[14, 11] = 0.614350e-04
-ker_saccrg[14, 12] = 0.337324e-03
-ker_saccrg[14, 13] = 0.324899e-03
-ker_saccrg[14, 14] = 0.371520e-03
-ker_saccrg[14, 15] = 0.478804e-03
-ker_saccrg[14, 16] = 0.101697e-02
-ker_saccrg[14, 17] = 0.102728e-02
-ker_saccrg[14, 18] = 0.147349e-02
-ker_saccrg[14, 19] = 0.368922e-02
-ker_saccrg[14, 20] = 0.484994e-02
-ker_saccrg[14, 21] = 0.109319e-01
-ker_saccrg[14, 22] = 0.222066e-01
-ker_saccrg[14, 23] = 0.380174e-01
-ker_saccrg[14, 24] = 0.622359e-01
-ker_saccrg[14, 25] = 0.978747e-01
-ker_saccrg[14, 26] = 0.135839e00
-ker_saccrg[14, 27] = 0.174342e00
-ker_saccrg[14, 28] = 0.201882e00
-ker_saccrg[14, 29] = 0.216326e00
-ker_saccrg[14, 30] = 0.222044e00
-ker_saccrg[14, 31] = 0.222867e00
-ker_saccrg[14, 32] = 0.222379e00
-ker_saccrg[14, 33] = 0.221925e00
-ker_saccrg[14, 34] = 0.221667e00
-ker_saccrg[14, 35] = 0.221502e00
-ker_saccrg[14, 36] = 0.221629e00
-ker_saccrg[14, 37] = 0.000000e00
-ker_saccrg[14, 38] = 0.000000e00
-ker_saccrg[14, 39] = 0.000000e00
-ker_saccrg[14, 40] = 0.000000e00
-ker_saccrg[15, 1] = 0.000000e00
-ker_saccrg[15, 2] = 0.000000e00
-ker_saccrg[15, 3] = 0.000000e00
-ker_saccrg[15, 4] = 0.000000e00
-ker_saccrg[15, 5] = 0.000000e00
-ker_saccrg[15, 6] = 0.000000e00
-ker_saccrg[15, 7] = 0.000000e00
-ker_saccrg[15, 8] = 0.000000e00
-ker_saccrg[15, 9] = 0.759585e-07
-ker_saccrg[15, 10] = 0.374710e-05
-ker_saccrg[15, 11] = 0.671091e-04
-ker_saccrg[15, 12] = 0.588014e-04
-ker_saccrg[15, 13] = 0.311989e-03
-ker_saccrg[15, 14] = 0.280346e-03
-ker_saccrg[15, 15] = 0.278888e-03
-ker_saccrg[15, 16] = 0.181122e-02
-ker_saccrg[15, 17] = 0.951550e-03
-ker_saccrg[15, 18] = 0.874685e-03
-ker_saccrg[15, 19] = 0.341647e-02
-ker_saccrg[15, 20] = 0.313074e-02
-ker_saccrg[15, 21] = 0.790628e-02
-ker_saccrg[15, 22] = 0.167408e-01
-ker_saccrg[15, 23] = 0.292368e-01
-ker_saccrg[15, 24] = 0.493019e-01
-ker_saccrg[15, 25] = 0.846089e-01
-ker_saccrg[15, 26] = 0.122848e00
-ker_saccrg[15, 27] = 0.164348e00
-ker_saccrg[15, 28] = 0.195653e00
-ker_saccrg[15, 29] = 0.209699e00
-ker_saccrg[15, 30] = 0.212297e00
-ker_saccrg[15, 31] = 0.209959e00
-ker_saccrg[15, 32] = 0.206919e00
-ker_saccrg[15, 33] = 0.204381e00
-ker_saccrg[15, 34] = 0.203587e00
-ker_saccrg[15, 35] = 0.201798e00
-ker_saccrg[15, 36] = 0.198561e00
-ker_saccrg[15, 37] = 0.000000e00
-ker_saccrg[15, 38] = 0.000000e00
-ker_saccrg[15, 39] = 0.000000e00
-ker_saccrg[15, 40] = 0.000000e00
-ker_saccrg[16, 1] = 0.000000e00
-ker_saccrg[16, 2] = 0.000000e00
-ker_saccrg[16, 3] = 0.000000e00
-ker_saccrg[16, 4] = 0.000000e00
-ker_saccrg[16, 5] = 0.000000e00
-ker_saccrg[16, 6] = 0.000000e00
-ker_saccrg[16, 7] = 0.000000e00
-ker_saccrg[16, 8] = 0.000000e00
-ker_saccrg[16, 9] = 0.000000e00
-ker_saccrg[16, 10] = 0.844481e-07
-ker_saccrg[16, 11] = 0.394811e-05
-ker_saccrg[16, 12] = 0.696323e-04
-ker_saccrg[16, 13] = 0.591332e-04
-ker_saccrg[16, 14] = 0.289674e-03
-ker_saccrg[16, 15] = 0.202537e-03
-ker_saccrg[16, 16] = 0.336844e-02
-ker_saccrg[16, 17] = 0.178312e-02
-ker_saccrg[16, 18] = 0.868492e-03
-ker_saccrg[16, 19] = 0.435445e-02
-ker_saccrg[16, 20] = 0.306476e-02
-ker_saccrg[16, 21] = 0.776119e-02
-ker_saccrg[16, 22] = 0.161954e-01
-ker_saccrg[16, 23] = 0.276331e-01
-ker_saccrg[16, 24] = 0.458394e-01
-ker_saccrg[16, 25] = 0.831396e-01
-ker_saccrg[16, 26] = 0.123760e00
-ker_saccrg[16, 27] = 0.170508e00
-ker_saccrg[16, 28] = 0.207373e00
-ker_saccrg[16, 29] = 0.222851e00
-ker_saccrg[16, 30] = 0.224550e00
-ker_saccrg[16, 31] = 0.220359e00
-ker_saccrg[16, 32] = 0.215498e00
-ker_saccrg[16, 33] = 0.211386e00
-ker_saccrg[16, 34] = 0.210132e00
-ker_saccrg[16, 35] = 0.207094e00
-ker_saccrg[16, 36] = 0.201428e00
-ker_saccrg[16, 37] = 0.000000e00
-ker_saccrg[16, 38] = 0.000000e00
-ker_saccrg[16, 39] = 0.000000e00
-ker_saccrg[16, 40] = 0.000000e00
-ker_saccrg[17, 1] = 0.000000e00
-ker_saccrg[17, 2] = 0.000000e00
-ker_saccrg[17, 3] = 0.000000e00
-ker_saccrg[17, 4] = 0.000000e00
-ker_saccrg[17, 5] = 0.000000e00
-ker_saccrg[17, 6] = 0.000000e00
-ker_saccrg[17, 7] = 0.000000e00
-ker_saccrg[17, 8] = 0.000000e00
-ker_saccrg[17, 9] = 0.000000e00
-ker_saccrg[17, 10] = 0.000000e00
-ker_saccrg[17, 11] = 0.102418e-06
-ker_saccrg[17, 12] = 0.455940e-05
-ker_saccrg[17, 13] = 0.784312e-04
-ker_saccrg[17, 14] = 0.614879e-04
-ker_saccrg[17, 15] = 0.207160e-03
-ker_saccrg[17, 16] = 0.889438e-02
-ker_saccrg[17, 17] = 0.339624e-02
-ker_saccrg[17, 18] = 0.106437e-02
-ker_saccrg[17, 19] = 0.779689e-02
-ker_saccrg[17, 20] = 0.404959e-02
-ker_saccrg[17, 21] = 0.101250e-01
-ker_saccrg[17, 22] = 0.196042e-01
-ker_saccrg[17, 23] = 0.307730e-01
-ker_saccrg[17, 24] = 0.480533e-01
-ker_saccrg[17, 25] = 0.885797e-01
-ker_saccrg[17, 26] = 0.132905e00
-ker_saccrg[17, 27] = 0.187039e00
-ker_saccrg[17, 28] = 0.231099e00
-ker_saccrg[17, 29] = 0.249500e00
-ker_saccrg[17, 30] = 0.252291e00
-ker_saccrg[17, 31] = 0.247487e00
-ker_saccrg[17, 32] = 0.241587e00
-ker_saccrg[17, 33] = 0.236485e00
-ker_saccrg[17, 34] = 0.234962e00
-ker_saccrg[17, 35] = 0.231075e00
-ker_saccrg[17, 36] = 0.223581e00
-ker_saccrg[17, 37] = 0.000000e00
-ker_saccrg[17, 38] = 0.000000e00
-ker_saccrg[17, 39] = 0.000000e00
-ker_saccrg[17, 40] = 0.000000e00
-ker_saccrg[18, 1] = 0.000000e00
-ker_saccrg[18, 2] = 0.000000e00
-ker_saccrg[18, 3] = 0.000000e00
-ker_saccrg[18, 4] = 0.000000e00
-ker_saccrg[18, 5] = 0.000000e00
-ker_saccrg[18, 6] = 0.000000e00
-ker_saccrg[18, 7] = 0.000000e00
-ker_saccrg[18, 8] = 0.000000e00
-ker_saccrg[18, 9] = 0.000000e00
-ker_saccrg[18, 10] = 0.000000e00
-ker_saccrg[18, 11] = 0.000000e00
-ker_saccrg[18, 12] = 0.140103e-06
-ker_saccrg[18, 13] = 0.596643e-05
-ker_saccrg[18, 14] = 0.955662e-04
-ker_saccrg[18, 15] = 0.467666e-04
-ker_saccrg[18, 16] = 0.950209e-02
-ker_saccrg[18, 17] = 0.886291e-02
-ker_saccrg[18, 18] = 0.338287e-02
-ker_saccrg[18, 19] = 0.122056e-01
-ker_saccrg[18, 20] = 0.719648e-02
-ker_saccrg[18, 21] = 0.173349e-01
-ker_saccrg[18, 22] = 0.268718e-01
-ker_saccrg[18, 23] = 0.384549e-01
-ker_saccrg[18, 24] = 0.531665e-01
-ker_saccrg[18, 25] = 0.967650e-01
-ker_saccrg[18, 26] = 0.143690e00
-ker_saccrg[18, 27] = 0.205036e00
-ker_saccrg[18, 28] = 0.256245e00
-ker_saccrg[18, 29] = 0.278068e00
-ker_saccrg[18, 30] = 0.283239e00
-ker_saccrg[18, 31] = 0.278809e00
-ker_saccrg[18, 32] = 0.272567e00
-ker_saccrg[18, 33] = 0.267046e00
-ker_saccrg[18, 34] = 0.265383e00
-ker_saccrg[18, 35] = 0.261124e00
-ker_saccrg[18, 36] = 0.252857e00
-ker_saccrg[18, 37] = 0.000000e00
-ker_saccrg[18, 38] = 0.000000e00
-ker_saccrg[18, 39] = 0.000000e00
-ker_saccrg[18, 40] = 0.000000e00
-ker_saccrg[19, 1] = 0.000000e00
-ker_saccrg[19, 2] = 0.000000e00
-ker_saccrg[19, 3] = 0.000000e00
-ker_saccrg[19, 4] = 0.000000e00
-ker_saccrg[19, 5] = 0.000000e00
-ker_saccrg[19, 6] = 0.000000e00
-ker_saccrg[19, 7] = 0.000000e00
-ker_saccrg[19, 8] = 0.000000e00
-ker_saccrg[19, 9] = 0.000000e00
-ker_saccrg[19, 10] = 0.000000e00
-ker_saccrg[19, 11] = 0.000000e00
-ker_saccrg[19, 12] = 0.000000e00
-ker_saccrg[19, 13] = 0.227778e-06
-ker_saccrg[19, 14] = 0.900623e-05
-ker_saccrg[19, 15] = 0.841460e-04
-ker_saccrg[19, 16] = 0.386383e-01
-ker_saccrg[19, 17] = 0.931861e-02
-ker_saccrg[19, 18] = 0.873078e-02
-ker_saccrg[19, 19] = 0.212263e-01
-ker_saccrg[19, 20] = 0.110801e-01
-ker_saccrg[19, 21] = 0.233312e-01
-ker_saccrg[19, 22] = 0.377998e-01
-ker_saccrg[19, 23] = 0.473076e-01
-ker_saccrg[19, 24] = 0.634436e-01
-ker_saccrg[19, 25] = 0.108864e00
-ker_saccrg[19, 26] = 0.154870e00
-ker_saccrg[19, 27] = 0.221137e00
-ker_saccrg[19, 28] = 0.278289e00
-ker_saccrg[19, 29] = 0.303277e00
-ker_saccrg[19, 30] = 0.311313e00
-ker_saccrg[19, 31] = 0.307763e00
-ker_saccrg[19, 32] = 0.301613e00
-ker_saccrg[19, 33] = 0.296055e00
-ker_saccrg[19, 34] = 0.294365e00
-ker_saccrg[19, 35] = 0.290056e00
-ker_saccrg[19, 36] = 0.281642e00
-ker_saccrg[19, 37] = 0.000000e00
-ker_saccrg[19, 38] = 0.000000e00
-ker_saccrg[19, 39] = 0.000000e00
-ker_saccrg[19, 40] = 0.000000e00
-ker_saccrg[20, 1] = 0.000000e00
-ker_saccrg[20, 2] = 0.000000e00
-ker_saccrg[20, 3] = 0.000000e00
-ker_saccrg[20, 4] = 0.000000e00
-ker_saccrg[20, 5] = 0.000000e00
-ker_saccrg[20, 6] = 0.000000e00
-ker_saccrg[20, 7] = 0.000000e00
-ker_saccrg[20, 8] = 0.000000e00
-ker_saccrg[20, 9] = 0.000000e00
-ker_saccrg[20, 10] = 0.000000e00
-ker_saccrg[20, 11] = 0.000000e00
-ker_saccrg[20, 12] = 0.000000e00
-ker_saccrg[20, 13] = 0.129560e-08
-ker_saccrg[20, 14] = 0.461750e-06
-ker_saccrg[20, 15] = 0.991868e-05
-ker_saccrg[20, 16] = 0.404619e-01
-ker_saccrg[20, 17] = 0.376740e-01
-ker_saccrg[20, 18] = 0.912299e-02
-ker_saccrg[20, 19] = 0.431984e-01
-ker_saccrg[20, 20] = 0.191703e-01
-ker_saccrg[20, 21] = 0.492406e-01
-ker_saccrg[20, 22] = 0.618254e-01
-ker_saccrg[20, 23] = 0.738280e-01
-ker_saccrg[20, 24] = 0.817314e-01
-ker_saccrg[20, 25] = 0.125224e00
-ker_saccrg[20, 26] = 0.171144e00
-ker_saccrg[20, 27] = 0.237848e00
-ker_saccrg[20, 28] = 0.298348e00
-ker_saccrg[20, 29] = 0.325776e00
-ker_saccrg[20, 30] = 0.336589e00
-ker_saccrg[20, 31] = 0.333991e00
-ker_saccrg[20, 32] = 0.328042e00
-ker_saccrg[20, 33] = 0.322558e00
-ker_saccrg[20, 34] = 0.320859e00
-ker_saccrg[20, 35] = 0.316600e00
-ker_saccrg[20, 36] = 0.308313e00
-ker_saccrg[20, 37] = 0.000000e00
-ker_saccrg[20, 38] = 0.000000e00
-ker_saccrg[20, 39] = 0.000000e00
-ker_saccrg[20, 40] = 0.000000e00
-ker_saccrg[21, 1] = 0.000000e00
-ker_saccrg[21, 2] = 0.000000e00
-ker_saccrg[21, 3] = 0.000000e00
-ker_saccrg[21, 4] = 0.000000e00
-ker_saccrg[21, 5] = 0.000000e00
-ker_saccrg[21, 6] = 0.000000e00
-ker_saccrg[21, 7] = 0.000000e00
-ker_saccrg[21, 8] = 0.000000e00
-ker_saccrg[21, 9] = 0.000000e00
-ker_saccrg[21, 10] = 0.000000e00
-ker_saccrg[21, 11] = 0.000000e00
-ker_saccrg[21, 12] = 0.000000e00
-ker_saccrg[21, 13] = 0.000000e00
-ker_saccrg[21, 14] = 0.944456e-08
-ker_saccrg[21, 15] = 0.743621e-06
-ker_saccrg[21, 16] = 0.442453e00
-ker_saccrg[21, 17] = 0.391188e-01
-ker_saccrg[21, 18] = 0.365342e-01
-ker_saccrg[21, 19] = 0.111999e00
-ker_saccrg[21, 20] = 0.388643e-01
-ker_saccrg[21, 21] = 0.848382e-01
-ker_saccrg[21, 22] = 0.875713e-01
-ker_saccrg[21, 23] = 0.938496e-01
-ker_saccrg[21, 24] = 0.107423e00
-ker_saccrg[21, 25] = 0.155062e00
-ker_saccrg[21, 26] = 0.191831e00
-ker_saccrg[21, 27] = 0.256278e00
-ker_saccrg[21, 28] = 0.316744e00
-ker_saccrg[21, 29] = 0.344380e00
-ker_saccrg[21, 30] = 0.357297e00
-ker_saccrg[21, 31] = 0.355528e00
-ker_saccrg[21, 32] = 0.349787e00
-ker_saccrg[21, 33] = 0.344401e00
-ker_saccrg[21, 34] = 0.342705e00
-ker_saccrg[21, 35] = 0.338523e00
-ker_saccrg[21, 36] = 0.330421e00
-ker_saccrg[21, 37] = 0.000000e00
-ker_saccrg[21, 38] = 0.000000e00
-ker_saccrg[21, 39] = 0.000000e00
-ker_saccrg[21, 40] = 0.000000e00
-ker_saccrg[22, 1] = 0.000000e00
-ker_saccrg[22, 2] = 0.000000e00
-ker_saccrg[22, 3] = 0.000000e00
-ker_saccrg[22, 4] = 0.000000e00
-ker_saccrg[22, 5] = 0.000000e00
-ker_saccrg[22, 6] = 0.000000e00
-ker_saccrg[22, 7] = 0.000000e00
-ker_saccrg[22, 8] = 0.000000e00
-ker_saccrg[22, 9] = 0.000000e00
-ker_saccrg[22, 10] = 0.000000e00
-ker_saccrg[22, 11] = 0.000000e00
-ker_saccrg[22, 12] = 0.000000e00
-ker_saccrg[22, 13] = 0.000000e00
-ker_saccrg[22, 14] = 0.000000e00
-ker_saccrg[22, 15] = 0.301594e-07
-ker_saccrg[22, 16] = 0.458593e00
-ker_saccrg[22, 17] = 0.425018e00
-ker_saccrg[22, 18] = 0.376611e-01
-ker_saccrg[22, 19] = 0.115562e00
-ker_saccrg[22, 20] = 0.101686e00
-ker_saccrg[22, 21] = 0.171258e00
-ker_saccrg[22, 22] = 0.133854e00
-ker_saccrg[22, 23] = 0.170618e00
-ker_saccrg[22, 24] = 0.159301e00
-ker_saccrg[22, 25] = 0.195009e00
-ker_saccrg[22, 26] = 0.229057e00
-ker_saccrg[22, 27] = 0.279005e00
-ker_saccrg[22, 28] = 0.335986e00
-ker_saccrg[22, 29] = 0.360465e00
-ker_saccrg[22, 30] = 0.374161e00
-ker_saccrg[22, 31] = 0.372873e00
-ker_saccrg[22, 32] = 0.367297e00
-ker_saccrg[22, 33] = 0.361988e00
-ker_saccrg[22, 34] = 0.360293e00
-ker_saccrg[22, 35] = 0.356173e00
-ker_saccrg[22, 36] = 0.348226e00
-ker_saccrg[22, 37] = 0.000000e00
-ker_saccrg[22, 38] = 0.000000e00
-ker_saccrg[22, 39] = 0.000000e00
-ker_saccrg[22, 40] = 0.000000e00
-ker_saccrg[23, 1] = 0.000000e00
-ker_saccrg[23, 2] = 0.000000e00
-ker_saccrg[23, 3] = 0.000000e00
-ker_saccrg[23, 4] = 0.000000e00
-ker_saccrg[23, 5] = 0.000000e00
-ker_saccrg[23, 6] = 0.000000e00
-ker_saccrg[23, 7] = 0.000000e00
-ker_saccrg[23, 8] = 0.000000e00
-ker_saccrg[23, 9] = 0.000000e00
-ker_saccrg[23, 10] = 0.000000e00
-ker_saccrg[23, 11] = 0.000000e00
-ker_saccrg[23, 12] = 0.000000e00
-ker_saccrg[23, 13] = 0.000000e00
-ker_saccrg[23, 14] = 0.000000e00
-ker_saccrg[23, 15] = 0.474816e-09
-ker_saccrg[23, 16] = 0.471716e00
-ker_saccrg[23, 17] = 0.438382e00
-ker_saccrg[23, 18] = 0.385478e-01
-ker_saccrg[23, 19] = 0.460661e00
-ker_saccrg[23, 20] = 0.104389e00
-ker_saccrg[23, 21] = 0.175908e00
-ker_saccrg[23, 22] = 0.228218e00
-ker_saccrg[23, 23] = 0.262318e00
-ker_saccrg[23, 24] = 0.210313e00
-ker_saccrg[23, 25] = 0.229302e00
-ker_saccrg[23, 26] = 0.277715e00
-ker_saccrg[23, 27] = 0.316637e00
-ker_saccrg[23, 28] = 0.358767e00
-ker_saccrg[23, 29] = 0.376353e00
-ker_saccrg[23, 30] = 0.388397e00
-ker_saccrg[23, 31] = 0.386871e00
-ker_saccrg[23, 32] = 0.381361e00
-ker_saccrg[23, 33] = 0.376104e00
-ker_saccrg[23, 34] = 0.374406e00
-ker_saccrg[23, 35] = 0.370329e00
-ker_saccrg[23, 36] = 0.362490e00
-ker_saccrg[23, 37] = 0.000000e00
-ker_saccrg[23, 38] = 0.000000e00
-ker_saccrg[23, 39] = 0.000000e00
-ker_saccrg[23, 40] = 0.000000e00
-ker_saccrg[24, 1] = 0.000000e00
-ker_saccrg[24, 2] = 0.000000e00
-ker_saccrg[24, 3] = 0.000000e00
-ker_saccrg[24, 4] = 0.000000e00
-ker_saccrg[24, 5] = 0.000000e00
-ker_saccrg[24, 6] = 0.000000e00
-ker_saccrg[24, 7] = 0.000000e00
-ker_saccrg[24, 8] = 0.000000e00
-ker_saccrg[24, 9] = 0.000000e00
-ker_saccrg[24, 10] = 0.000000e00
-ker_saccrg[24, 11] = 0.000000e00
-ker_saccrg[24, 12] = 0.000000e00
-ker_saccrg[24, 13] = 0.000000e00
-ker_saccrg[24, 14] = 0.000000e00
-ker_saccrg[24, 15] = 0.000000e00
-ker_saccrg[24, 16] = 0.482421e00
-ker_saccrg[24, 17] = 0.449246e00
-ker_saccrg[24, 18] = 0.418021e00
-ker_saccrg[24, 19] = 0.471528e00
-ker_saccrg[24, 20] = 0.106574e00
-ker_saccrg[24, 21] = 0.457583e00
-ker_saccrg[24, 22] = 0.457441e00
-ker_saccrg[24, 23] = 0.268282e00
-ker_saccrg[24, 24] = 0.295154e00
-ker_saccrg[24, 25] = 0.277246e00
-ker_saccrg[24, 26] = 0.318509e00
-ker_saccrg[24, 27] = 0.341083e00
-ker_saccrg[24, 28] = 0.383566e00
-ker_saccrg[24, 29] = 0.393965e00
-ker_saccrg[24, 30] = 0.400814e00
-ker_saccrg[24, 31] = 0.398325e00
-ker_saccrg[24, 32] = 0.392699e00
-ker_saccrg[24, 33] = 0.387475e00
-ker_saccrg[24, 34] = 0.385773e00
-ker_saccrg[24, 35] = 0.381723e00
-ker_saccrg[24, 36] = 0.373956e00
-ker_saccrg[24, 37] = 0.000000e00
-ker_saccrg[24, 38] = 0.000000e00
-ker_saccrg[24, 39] = 0.000000e00
-ker_saccrg[24, 40] = 0.000000e00
-ker_saccrg[25, 1] = 0.000000e00
-ker_saccrg[25, 2] = 0.000000e00
-ker_saccrg[25, 3] = 0.000000e00
-ker_saccrg[25, 4] = 0.000000e00
-ker_saccrg[25, 5] = 0.000000e00
-ker_saccrg[25, 6] = 0.000000e00
-ker_saccrg[25, 7] = 0.000000e00
-ker_saccrg[25, 8] = 0.000000e00
-ker_saccrg[25, 9] = 0.000000e00
-ker_saccrg[25, 10] = 0.000000e00
-ker_saccrg[25, 11] = 0.000000e00
-ker_saccrg[25, 12] = 0.000000e00
-ker_saccrg[25, 13] = 0.000000e00
-ker_saccrg[25, 14] = 0.000000e00
-ker_saccrg[25, 15] = 0.000000e00
-ker_saccrg[25, 16] = 0.493305e00
-ker_saccrg[25, 17] = 0.460084e00
-ker_saccrg[25, 18] = 0.428847e00
-ker_saccrg[25, 19] = 0.482480e00
-ker_saccrg[25, 20] = 0.457996e00
-ker_saccrg[25, 21] = 0.468489e00
-ker_saccrg[25, 22] = 0.468385e00
-ker_saccrg[25, 23] = 0.465913e00
-ker_saccrg[25, 24] = 0.302045e00
-ker_saccrg[25, 25] = 0.349681e00
-ker_saccrg[25, 26] = 0.375849e00
-ker_saccrg[25, 27] = 0.372009e00
-ker_saccrg[25, 28] = 0.404973e00
-ker_saccrg[25, 29] = 0.408427e00
-ker_saccrg[25, 30] = 0.413563e00
-ker_saccrg[25, 31] = 0.409638e00
-ker_saccrg[25, 32] = 0.403614e00
-ker_saccrg[25, 33] = 0.398367e00
-ker_saccrg[25, 34] = 0.396652e00
-ker_saccrg[25, 35] = 0.392598e00
-ker_saccrg[25, 36] = 0.384841e00
-ker_saccrg[25, 37] = 0.000000e00
-ker_saccrg[25, 38] = 0.000000e00
-ker_saccrg[25, 39] = 0.000000e00
-ker_saccrg[25, 40] = 0.000000e00
-ker_saccrg[26, 1] = 0.000000e00
-ker_saccrg[26, 2] = 0.000000e00
-ker_saccrg[26, 3] = 0.000000e00
-ker_saccrg[26, 4] = 0.000000e00
-ker_saccrg[26, 5] = 0.000000e00
-ker_saccrg[26, 6] = 0.000000e00
-ker_saccrg[26, 7] = 0.000000e00
-ker_saccrg[26, 8] = 0.000000e00
-ker_saccrg[26, 9] = 0.000000e00
-ker_saccrg[26, 10] = 0.000000e00
-ker_saccrg[26, 11] = 0.000000e00
-ker_saccrg[26, 12] = 0.000000e00
-ker_saccrg[26, 13] = 0.000000e00
-ker_saccrg[26, 14] = 0.000000e00
-ker_saccrg[26, 15] = 0.000000e00
-ker_saccrg[26, 16] = 0.498360e00
-ker_saccrg[26, 17] = 0.465358e00
-ker_saccrg[26, 18] = 0.434351e00
-ker_saccrg[26, 19] = 0.487671e00
-ker_saccrg[26, 20] = 0.463284e00
-ker_saccrg[26, 21] = 0.473752e00
-ker_saccrg[26, 22] = 0.473679e00
-ker_saccrg[26, 23] = 0.471200e00
-ker_saccrg[26, 24] = 0.305321e00
-ker_saccrg[26, 25] = 0.460272e00
-ker_saccrg[26, 26] = 0.380186e00
-ker_saccrg[26, 27] = 0.407235e00
-ker_saccrg[26, 28] = 0.425703e00
-ker_saccrg[26, 29] = 0.419464e00
-ker_saccrg[26, 30] = 0.420713e00
-ker_saccrg[26, 31] = 0.415965e00
-ker_saccrg[26, 32] = 0.409433e00
-ker_saccrg[26, 33] = 0.404156e00
-ker_saccrg[26, 34] = 0.402444e00
-ker_saccrg[26, 35] = 0.398420e00
-ker_saccrg[26, 36] = 0.390729e00
-ker_saccrg[26, 37] = 0.000000e00
-ker_saccrg[26, 38] = 0.000000e00
-ker_saccrg[26, 39] = 0.000000e00
-ker_saccrg[26, 40] = 0.000000e00
-ker_saccrg[27, 1] = 0.000000e00
-ker_saccrg[27, 2] = 0.000000e00
-ker_saccrg[27, 3] = 0.000000e00
-ker_saccrg[27, 4] = 0.000000e00
-ker_saccrg[27, 5] = 0.000000e00
-ker_saccrg[27, 6] = 0.000000e00
-ker_saccrg[27, 7] = 0.000000e00
-ker_saccrg[27, 8] = 0.000000e00
-ker_saccrg[27, 9] = 0.000000e00
-ker_saccrg[27, 10] = 0.000000e00
-ker_saccrg[27, 11] = 0.000000e00
-ker_saccrg[27, 12] = 0.000000e00
-ker_saccrg[27, 13] = 0.000000e00
-ker_saccrg[27, 14] = 0.000000e00
-ker_saccrg[27, 15] = 0.000000e00
-ker_saccrg[27, 16] = 0.504260e00
-ker_saccrg[27, 17] = 0.471302e00
-ker_saccrg[27, 18] = 0.440353e00
-ker_saccrg[27, 19] = 0.493636e00
-ker_saccrg[27, 20] = 0.469232e00
-ker_saccrg[27, 21] = 0.479719e00
-ker_saccrg[27, 22] = 0.479669e00
-ker_saccrg[27, 23] = 0.477177e00
-ker_saccrg[27, 24] = 0.464189e00
-ker_saccrg[27, 25] = 0.466286e00
-ker_saccrg[27, 26] = 0.385058e00
-ker_saccrg[27, 27] = 0.412596e00
-ker_saccrg[27, 28] = 0.452611e00
-ker_saccrg[27, 29] = 0.433046e00
-ker_saccrg[27, 30] = 0.428880e00
-ker_saccrg[27, 31] = 0.422050e00
-ker_saccrg[27, 32] = 0.415579e00
-ker_saccrg[27, 33] = 0.410255e00
-ker_saccrg[27, 34] = 0.408538e00
-ker_saccrg[27, 35] = 0.404518e00
-ker_saccrg[27, 36] = 0.396847e00
-ker_saccrg[27, 37] = 0.000000e00
-ker_saccrg[27, 38] = 0.000000e00
-ker_saccrg[27, 39] = 0.000000e00
-ker_saccrg[27, 40] = 0.000000e00
-ker_saccrg[28, 1] = 0.000000e00
-ker_saccrg[28, 2] = 0.000000e00
-ker_saccrg[28, 3] = 0.000000e00
-ker_saccrg[28, 4] = 0.000000e00
-ker_saccrg[28, 5] = 0.000000e00
-ker_saccrg[28, 6] = 0.000000e00
-ker_saccrg[28, 7] = 0.000000e00
-ker_saccrg[28, 8] = 0.000000e00
-ker_saccrg[28, 9] = 0.000000e00
-ker_saccrg[28, 10] = 0.000000e00
-ker_saccrg[28, 11] = 0.000000e00
-ker_saccrg[28, 12] = 0.000000e00
-ker_saccrg[28, 13] = 0.000000e00
-ker_saccrg[28, 14] = 0.000000e00
-ker_saccrg[28, 15] = 0.000000e00
-ker_saccrg[28, 16] = 0.511289e00
-ker_saccrg[28, 17] = 0.478218e00
-ker_saccrg[28, 18] = 0.447169e00
-ker_saccrg[28, 19] = 0.500667e00
-ker_saccrg[28, 20] = 0.476141e00
-ker_saccrg[28, 21] = 0.486690e00
-ker_saccrg[28, 22] = 0.486657e00
-ker_saccrg[28, 23] = 0.484143e00
-ker_saccrg[28, 24] = 0.471128e00
-ker_saccrg[28, 25] = 0.473232e00
-ker_saccrg[28, 26] = 0.467330e00
-ker_saccrg[28, 27] = 0.462303e00
-ker_saccrg[28, 28] = 0.459518e00
-ker_saccrg[28, 29] = 0.439730e00
-ker_saccrg[28, 30] = 0.435663e00
-ker_saccrg[28, 31] = 0.429350e00
-ker_saccrg[28, 32] = 0.422348e00
-ker_saccrg[28, 33] = 0.417002e00
-ker_saccrg[28, 34] = 0.415273e00
-ker_saccrg[28, 35] = 0.411238e00
-ker_saccrg[28, 36] = 0.403544e00
-ker_saccrg[28, 37] = 0.000000e00
-ker_saccrg[28, 38] = 0.000000e00
-ker_saccrg[28, 39] = 0.000000e00
-ker_saccrg[28, 40] = 0.000000e00
-ker_saccrg[29, 1] = 0.000000e00
-ker_saccrg[29, 2] = 0.000000e00
-ker_saccrg[29, 3] = 0.000000e00
-ker_saccrg[29, 4] = 0.000000e00
-ker_saccrg[29, 5] = 0.000000e00
-ker_saccrg[29, 6] = 0.000000e00
-ker_saccrg[29, 7] = 0.000000e00
-ker_saccrg[29, 8] = 0.000000e00
-ker_saccrg[29, 9] = 0.000000e00
-ker_saccrg[29, 10] = 0.000000e00
-ker_saccrg[29, 11] = 0.000000e00
-ker_saccrg[29, 12] = 0.000000e00
-ker_saccrg[29, 13] = 0.000000e00
-ker_saccrg[29, 14] = 0.000000e00
-ker_saccrg[29, 15] = 0.000000e00
-ker_saccrg[29, 16] = 0.515299e00
-ker_saccrg[29, 17] = 0.482248e00
-ker_saccrg[29, 18] = 0.451226e00
-ker_saccrg[29, 19] = 0.504714e00
-ker_saccrg[29, 20] = 0.480173e00
-ker_saccrg[29, 21] = 0.490737e00
-ker_saccrg[29, 22] = 0.490717e00
-ker_saccrg[29, 23] = 0.488194e00
-ker_saccrg[29, 24] = 0.475202e00
-ker_saccrg[29, 25] = 0.477303e00
-ker_saccrg[29, 26] = 0.471406e00
-ker_saccrg[29, 27] = 0.466391e00
-ker_saccrg[29, 28] = 0.463606e00
-ker_saccrg[29, 29] = 0.443703e00
-ker_saccrg[29, 30] = 0.442690e00
-ker_saccrg[29, 31] = 0.433456e00
-ker_saccrg[29, 32] = 0.426527e00
-ker_saccrg[29, 33] = 0.421106e00
-ker_saccrg[29, 34] = 0.419373e00
-ker_saccrg[29, 35] = 0.415340e00
-ker_saccrg[29, 36] = 0.407653e00
-ker_saccrg[29, 37] = 0.000000e00
-ker_saccrg[29, 38] = 0.000000e00
-ker_saccrg[29, 39] = 0.000000e00
-ker_saccrg[29, 40] = 0.000000e00
-ker_saccrg[30, 1] = 0.000000e00
-ker_saccrg[30, 2] = 0.000000e00
-ker_saccrg[30, 3] = 0.000000e00
-ker_saccrg[30, 4] = 0.000000e00
-ker_saccrg[30, 5] = 0.000000e00
-ker_saccrg[30, 6] = 0.000000e00
-ker_saccrg[30, 7] = 0.000000e00
-ker_saccrg[30, 8] = 0.000000e00
-ker_saccrg[30, 9] = 0.000000e00
-ker_saccrg[30, 10] = 0.000000e00
-ker_saccrg[30, 11] = 0.000000e00
-ker_saccrg[30, 12] = 0.000000e00
-ker_saccrg[30, 13] = 0.000000e00
-ker_saccrg[30, 14] = 0.000000e00
-ker_saccrg[30, 15] = 0.000000e00
-ker_saccrg[30, 16] = 0.518606e00
-ker_saccrg[30, 17] = 0.485568e00
-ker_saccrg[30, 18] = 0.454563e00
-ker_saccrg[30, 19] = 0.508049e00
-ker_saccrg[30, 20] = 0.483494e00
-ker_saccrg[30, 21] = 0.494070e00
-ker_saccrg[30, 22] = 0.494061e00
-ker_saccrg[30, 23] = 0.491531e00
-ker_saccrg[30, 24] = 0.478555e00
-ker_saccrg[30, 25] = 0.480655e00
-ker_saccrg[30, 26] = 0.474762e00
-ker_saccrg[30, 27] = 0.469755e00
-ker_saccrg[30, 28] = 0.466968e00
-ker_saccrg[30, 29] = 0.457637e00
-ker_saccrg[30, 30] = 0.446063e00
-ker_saccrg[30, 31] = 0.436830e00
-ker_saccrg[30, 32] = 0.429899e00
-ker_saccrg[30, 33] = 0.424476e00
-ker_saccrg[30, 34] = 0.422741e00
-ker_saccrg[30, 35] = 0.418708e00
-ker_saccrg[30, 36] = 0.411026e00
-ker_saccrg[30, 37] = 0.000000e00
-ker_saccrg[30, 38] = 0.000000e00
-ker_saccrg[30, 39] = 0.000000e00
-ker_saccrg[30, 40] = 0.000000e00
-ker_saccrg[31, 1] = 0.000000e00
-ker_saccrg[31, 2] = 0.000000e00
-ker_saccrg[31, 3] = 0.000000e00
-ker_saccrg[31, 4] = 0.000000e00
-ker_saccrg[31, 5] = 0.000000e00
-ker_saccrg[31, 6] = 0.000000e00
-ker_saccrg[31, 7] = 0.000000e00
-ker_saccrg[31, 8] = 0.000000e00
-ker_saccrg[31, 9] = 0.000000e00
-ker_saccrg[31, 10] = 0.000000e00
-ker_saccrg[31, 11] = 0.000000e00
-ker_saccrg[31, 12] = 0.000000e00
-ker_saccrg[31, 13] = 0.000000e00
-ker_saccrg[31, 14] = 0.000000e00
-ker_saccrg[31, 15] = 0.000000e00
-ker_saccrg[31, 16] = 0.521335e00
-ker_saccrg[31, 17] = 0.488306e00
-ker_saccrg[31, 18] = 0.457313e00
-ker_saccrg[31, 19] = 0.510799e00
-ker_saccrg[31, 20] = 0.486233e00
-ker_saccrg[31, 21] = 0.496818e00
-ker_saccrg[31, 22] = 0.496818e00
-ker_saccrg[31, 23] = 0.494282e00
-ker_saccrg[31, 24] = 0.481318e00
-ker_saccrg[31, 25] = 0.483417e00
-ker_saccrg[31, 26] = 0.477526e00
-ker_saccrg[31, 27] = 0.472527e00
-ker_saccrg[31, 28] = 0.469738e00
-ker_saccrg[31, 29] = 0.460409e00
-ker_saccrg[31, 30] = 0.448841e00
-ker_saccrg[31, 31] = 0.439607e00
-ker_saccrg[31, 32] = 0.432673e00
-ker_saccrg[31, 33] = 0.427249e00
-ker_saccrg[31, 34] = 0.425511e00
-ker_saccrg[31, 35] = 0.421478e00
-ker_saccrg[31, 36] = 0.413798e00
-ker_saccrg[31, 37] = 0.000000e00
-ker_saccrg[31, 38] = 0.000000e00
-ker_saccrg[31, 39] = 0.000000e00
-ker_saccrg[31, 40] = 0.000000e00
-ker_saccrg[32, 1] = 0.000000e00
-ker_saccrg[32, 2] = 0.000000e00
-ker_saccrg[32, 3] = 0.000000e00
-ker_saccrg[32, 4] = 0.000000e00
-ker_saccrg[32, 5] = 0.000000e00
-ker_saccrg[32, 6] = 0.000000e00
-ker_saccrg[32, 7] = 0.000000e00
-ker_saccrg[32, 8] = 0.000000e00
-ker_saccrg[32, 9] = 0.000000e00
-ker_saccrg[32, 10] = 0.000000e00
-ker_saccrg[32, 11] = 0.000000e00
-ker_saccrg[32, 12] = 0.000000e00
-ker_saccrg[32, 13] = 0.000000e00
-ker_saccrg[32, 14] = 0.000000e00
-ker_saccrg[32, 15] = 0.000000e00
-ker_saccrg[32, 16] = 0.521382e00
-ker_saccrg[32, 17] = 0.488500e00
-ker_saccrg[32, 18] = 0.457646e00
-ker_saccrg[32, 19] = 0.510908e00
-ker_saccrg[32, 20] = 0.486436e00
-ker_saccrg[32, 21] = 0.496984e00
-ker_saccrg[32, 22] = 0.496990e00
-ker_saccrg[32, 23] = 0.494461e00
-ker_saccrg[32, 24] = 0.481561e00
-ker_saccrg[32, 25] = 0.483650e00
-ker_saccrg[32, 26] = 0.477787e00
-ker_saccrg[32, 27] = 0.472813e00
-ker_saccrg[32, 28] = 0.470036e00
-ker_saccrg[32, 29] = 0.460747e00
-ker_saccrg[32, 30] = 0.449232e00
-ker_saccrg[32, 31] = 0.440036e00
-ker_saccrg[32, 32] = 0.433130e00
-ker_saccrg[32, 33] = 0.427727e00
-ker_saccrg[32, 34] = 0.425995e00
-ker_saccrg[32, 35] = 0.421979e00
-ker_saccrg[32, 36] = 0.414334e00
-ker_saccrg[32, 37] = 0.000000e00
-ker_saccrg[32, 38] = 0.000000e00
-ker_saccrg[32, 39] = 0.000000e00
-ker_saccrg[32, 40] = 0.000000e00
-ker_saccrg[33, 1] = 0.000000e00
-ker_saccrg[33, 2] = 0.000000e00
-ker_saccrg[33, 3] = 0.000000e00
-ker_saccrg[33, 4] = 0.000000e00
-ker_saccrg[33, 5] = 0.000000e00
-ker_saccrg[33, 6] = 0.000000e00
-ker_saccrg[33, 7] = 0.000000e00
-ker_saccrg[33, 8] = 0.000000e00
-ker_saccrg[33, 9] = 0.000000e00
-ker_saccrg[33, 10] = 0.000000e00
-ker_saccrg[33, 11] = 0.000000e00
-ker_saccrg[33, 12] = 0.000000e00
-ker_saccrg[33, 13] = 0.000000e00
-ker_saccrg[33, 14] = 0.000000e00
-ker_saccrg[33, 15] = 0.000000e00
-ker_saccrg[33, 16] = 0.523239e00
-ker_saccrg[33, 17] = 0.490361e00
-ker_saccrg[33, 18] = 0.459511e00
-ker_saccrg[33, 19] = 0.512778e00
-ker_saccrg[33, 20] = 0.488297e00
-ker_saccrg[33, 21] = 0.498852e00
-ker_saccrg[33, 22] = 0.498864e00
-ker_saccrg[33, 23] = 0.496331e00
-ker_saccrg[33, 24] = 0.483437e00
-ker_saccrg[33, 25] = 0.485525e00
-ker_saccrg[33, 26] = 0.479663e00
-ker_saccrg[33, 27] = 0.474693e00
-ker_saccrg[33, 28] = 0.471915e00
-ker_saccrg[33, 29] = 0.462627e00
-ker_saccrg[33, 30] = 0.451113e00
-ker_saccrg[33, 31] = 0.441917e00
-ker_saccrg[33, 32] = 0.435008e00
-ker_saccrg[33, 33] = 0.429604e00
-ker_saccrg[33, 34] = 0.427870e00
-ker_saccrg[33, 35] = 0.423853e00
-ker_saccrg[33, 36] = 0.416209e00
-ker_saccrg[33, 37] = 0.000000e00
-ker_saccrg[33, 38] = 0.000000e00
-ker_saccrg[33, 39] = 0.000000e00
-ker_saccrg[33, 40] = 0.000000e00
-ker_saccrg[34, 1] = 0.000000e00
-ker_saccrg[34, 2] = 0.000000e00
-ker_saccrg[34, 3] = 0.000000e00
-ker_saccrg[34, 4] = 0.000000e00
-ker_saccrg[34, 5] = 0.000000e00
-ker_saccrg[34, 6] = 0.000000e00
-ker_saccrg[34, 7] = 0.000000e00
-ker_saccrg[34, 8] = 0.000000e00
-ker_saccrg[34, 9] = 0.000000e00
-ker_saccrg[34, 10] = 0.000000e00
-ker_saccrg[34, 11] = 0.000000e00
-ker_saccrg[34, 12] = 0.000000e00
-ker_saccrg[34, 13] = 0.000000e00
-ker_saccrg[34, 14] = 0.000000e00
-ker_saccrg[34, 15] = 0.000000e00
-ker_saccrg[34, 16] = 0.526989e00
-ker_saccrg[34, 17] = 0.493974e00
-ker_saccrg[34, 18] = 0.462996e00
-ker_saccrg[34, 19] = 0.516493e00
-ker_saccrg[34, 20] = 0.491901e00
-ker_saccrg[34, 21] = 0.502507e00
-ker_saccrg[34, 22] = 0.502522e00
-ker_saccrg[34, 23] = 0.499975e00
-ker_saccrg[34, 24] = 0.487032e00
-ker_saccrg[34, 25] = 0.489128e00
-ker_saccrg[34, 26] = 0.483242e00
-ker_saccrg[34, 27] = 0.478253e00
-ker_saccrg[34, 28] = 0.475463e00
-ker_saccrg[34, 29] = 0.466135e00
-ker_saccrg[34, 30] = 0.454574e00
-ker_saccrg[34, 31] = 0.445337e00
-ker_saccrg[34, 32] = 0.438397e00
-ker_saccrg[34, 33] = 0.432968e00
-ker_saccrg[34, 34] = 0.431225e00
-ker_saccrg[34, 35] = 0.427191e00
-ker_saccrg[34, 36] = 0.419515e00
-ker_saccrg[34, 37] = 0.000000e00
-ker_saccrg[34, 38] = 0.000000e00
-ker_saccrg[34, 39] = 0.000000e00
-ker_saccrg[34, 40] = 0.000000e00
-ker_saccrg[35, 1] = 0.000000e00
-ker_saccrg[35, 2] = 0.000000e00
-ker_saccrg[35, 3] = 0.000000e00
-ker_saccrg[35, 4] = 0.000000e00
-ker_saccrg[35, 5] = 0.000000e00
-ker_saccrg[35, 6] = 0.000000e00
-ker_saccrg[35, 7] = 0.000000e00
-ker_saccrg[35, 8] = 0.000000e00
-ker_saccrg[35, 9] = 0.000000e00
-ker_saccrg[35, 10] = 0.000000e00
-ker_saccrg[35, 11] = 0.000000e00
-ker_saccrg[35, 12] = 0.000000e00
-ker_saccrg[35, 13] = 0.000000e00
-ker_saccrg[35, 14] = 0.000000e00
-ker_saccrg[35, 15] = 0.000000e00
-ker_saccrg[35, 16] = 0.526044e00
-ker_saccrg[35, 17] = 0.493170e00
-ker_saccrg[35, 18] = 0.462325e00
-ker_saccrg[35, 19] = 0.515600e00
-ker_saccrg[35, 20] = 0.491106e00
-ker_saccrg[35, 21] = 0.501671e00
-ker_saccrg[35, 22] = 0.501689e00
-ker_saccrg[35, 23] = 0.499151e00
-ker_saccrg[35, 24] = 0.486266e00
-ker_saccrg[35, 25] = 0.488354e00
-ker_saccrg[35, 26] = 0.482493e00
-ker_saccrg[35, 27] = 0.477528e00
-ker_saccrg[35, 28] = 0.474748e00
-ker_saccrg[35, 29] = 0.465460e00
-ker_saccrg[35, 30] = 0.453949e00
-ker_saccrg[35, 31] = 0.444750e00
-ker_saccrg[35, 32] = 0.437837e00
-ker_saccrg[35, 33] = 0.432431e00
-ker_saccrg[35, 34] = 0.430694e00
-ker_saccrg[35, 35] = 0.426676e00
-ker_saccrg[35, 36] = 0.419033e00
-ker_saccrg[35, 37] = 0.000000e00
-ker_saccrg[35, 38] = 0.000000e00
-ker_saccrg[35, 39] = 0.000000e00
-ker_saccrg[35, 40] = 0.000000e00
-ker_saccrg[36, 1] = 0.000000e00
-ker_saccrg[36, 2] = 0.000000e00
-ker_saccrg[36, 3] = 0.000000e00
-ker_saccrg[36, 4] = 0.000000e00
-ker_saccrg[36, 5] = 0.000000e00
-ker_saccrg[36, 6] = 0.000000e00
-ker_saccrg[36, 7] = 0.000000e00
-ker_saccrg[36, 8] = 0.000000e00
-ker_saccrg[36, 9] = 0.000000e00
-ker_saccrg[36, 10] = 0.000000e00
-ker_saccrg[36, 11] = 0.000000e00
-ker_saccrg[36, 12] = 0.000000e00
-ker_saccrg[36, 13] = 0.000000e00
-ker_saccrg[36, 14] = 0.000000e00
-ker_saccrg[36, 15] = 0.000000e00
-ker_saccrg[36, 16] = 0.527094e00
-ker_saccrg[36, 17] = 0.494221e00
-ker_saccrg[36, 18] = 0.463377e00
-ker_saccrg[36, 19] = 0.516656e00
-ker_saccrg[36, 20] = 0.492157e00
-ker_saccrg[36, 21] = 0.502726e00
-ker_saccrg[36, 22] = 0.502746e00
-ker_saccrg[36, 23] = 0.500207e00
-ker_saccrg[36, 24] = 0.487324e00
-ker_saccrg[36, 25] = 0.489412e00
-ker_saccrg[36, 26] = 0.483551e00
-ker_saccrg[36, 27] = 0.478587e00
-ker_saccrg[36, 28] = 0.475807e00
-ker_saccrg[36, 29] = 0.466519e00
-ker_saccrg[36, 30] = 0.455008e00
-ker_saccrg[36, 31] = 0.445809e00
-ker_saccrg[36, 32] = 0.438895e00
-ker_saccrg[36, 33] = 0.433487e00
-ker_saccrg[36, 34] = 0.431749e00
-ker_saccrg[36, 35] = 0.427731e00
-ker_saccrg[36, 36] = 0.420087e00
-ker_saccrg[36, 37] = 0.000000e00
-ker_saccrg[36, 38] = 0.000000e00
-ker_saccrg[36, 39] = 0.000000e00
-ker_saccrg[36, 40] = 0.000000e00
-ker_saccrg[37, 1] = 0.000000e00
-ker_saccrg[37, 2] = 0.000000e00
-ker_saccrg[37, 3] = 0.000000e00
-ker_saccrg[37, 4] = 0.000000e00
-ker_saccrg[37, 5] = 0.000000e00
-ker_saccrg[37, 6] = 0.000000e00
-ker_saccrg[37, 7] = 0.000000e00
-ker_saccrg[37, 8] = 0.000000e00
-ker_saccrg[37, 9] = 0.000000e00
-ker_saccrg[37, 10] = 0.000000e00
-ker_saccrg[37, 11] = 0.000000e00
-ker_saccrg[37, 12] = 0.000000e00
-ker_saccrg[37, 13] = 0.000000e00
-ker_saccrg[37, 14] = 0.000000e00
-ker_saccrg[37, 15] = 0.000000e00
-ker_saccrg[37, 16] = 0.527963e00
-ker_saccrg[37, 17] = 0.495090e00
-ker_saccrg[37, 18] = 0.464247e00
-ker_saccrg[37, 19] = 0.517529e00
-ker_saccrg[37, 20] = 0.493026e00
-ker_saccrg[37, 21] = 0.503598e00
-ker_saccrg[37, 22] = 0.503620e00
-ker_saccrg[37, 23] = 0.501079e00
-ker_saccrg[37, 24] = 0.488199e00
-ker_saccrg[37, 25] = 0.490286e00
-ker_saccrg[37, 26] = 0.484426e00
-ker_saccrg[37, 27] = 0.479463e00
-ker_saccrg[37, 28] = 0.476683e00
-ker_saccrg[37, 29] = 0.467394e00
-ker_saccrg[37, 30] = 0.455884e00
-ker_saccrg[37, 31] = 0.446684e00
-ker_saccrg[37, 32] = 0.439768e00
-ker_saccrg[37, 33] = 0.434360e00
-ker_saccrg[37, 34] = 0.432621e00
-ker_saccrg[37, 35] = 0.428603e00
-ker_saccrg[37, 36] = 0.420959e00
-ker_saccrg[37, 37] = 0.000000e00
-ker_saccrg[37, 38] = 0.000000e00
-ker_saccrg[37, 39] = 0.000000e00
-ker_saccrg[37, 40] = 0.000000e00
-ker_saccrg[38, 1] = 0.000000e00
-ker_saccrg[38, 2] = 0.000000e00
-ker_saccrg[38, 3] = 0.000000e00
-ker_saccrg[38, 4] = 0.000000e00
-ker_saccrg[38, 5] = 0.000000e00
-ker_saccrg[38, 6] = 0.000000e00
-ker_saccrg[38, 7] = 0.000000e00
-ker_saccrg[38, 8] = 0.000000e00
-ker_saccrg[38, 9] = 0.000000e00
-ker_saccrg[38, 10] = 0.000000e00
-ker_saccrg[38, 11] = 0.000000e00
-ker_saccrg[38, 12] = 0.000000e00
-ker_saccrg[38, 13] = 0.000000e00
-ker_saccrg[38, 14] = 0.000000e00
-ker_saccrg[38, 15] = 0.000000e00
-ker_saccrg[38, 16] = 0.530904e00
-ker_saccrg[38, 17] = 0.497893e00
-ker_saccrg[38, 18] = 0.466921e00
-ker_saccrg[38, 19] = 0.520430e00
-ker_saccrg[38, 20] = 0.495821e00
-ker_saccrg[38, 21] = 0.506439e00
-ker_saccrg[38, 22] = 0.506463e00
-ker_saccrg[38, 23] = 0.503910e00
-ker_saccrg[38, 24] = 0.490978e00
-ker_saccrg[38, 25] = 0.493073e00
-ker_saccrg[38, 26] = 0.487189e00
-ker_saccrg[38, 27] = 0.482206e00
-ker_saccrg[38, 28] = 0.479414e00
-ker_saccrg[38, 29] = 0.470086e00
-ker_saccrg[38, 30] = 0.458527e00
-ker_saccrg[38, 31] = 0.449287e00
-ker_saccrg[38, 32] = 0.442342e00
-ker_saccrg[38, 33] = 0.436910e00
-ker_saccrg[38, 34] = 0.435164e00
-ker_saccrg[38, 35] = 0.431128e00
-ker_saccrg[38, 36] = 0.423452e00
-ker_saccrg[38, 37] = 0.000000e00
-ker_saccrg[38, 38] = 0.000000e00
-ker_saccrg[38, 39] = 0.000000e00
-ker_saccrg[38, 40] = 0.000000e00
-ker_saccrg[39, 1] = 0.000000e00
-ker_saccrg[39, 2] = 0.000000e00
-ker_saccrg[39, 3] = 0.000000e00
-ker_saccrg[39, 4] = 0.000000e00
-ker_saccrg[39, 5] = 0.000000e00
-ker_saccrg[39, 6] = 0.000000e00
-ker_saccrg[39, 7] = 0.000000e00
-ker_saccrg[39, 8] = 0.000000e00
-ker_saccrg[39, 9] = 0.000000e00
-ker_saccrg[39, 10] = 0.000000e00
-ker_saccrg[39, 11] = 0.000000e00
-ker_saccrg[39, 12] = 0.000000e00
-ker_saccrg[39, 13] = 0.000000e00
-ker_saccrg[39, 14] = 0.000000e00
-ker_saccrg[39, 15] = 0.000000e00
-ker_saccrg[39, 16] = 0.531500e00
-ker_saccrg[39, 17] = 0.498490e00
-ker_saccrg[39, 18] = 0.467518e00
-ker_saccrg[39, 19] = 0.521029e00
-ker_saccrg[39, 20] = 0.496417e00
-ker_saccrg[39, 21] = 0.507037e00
-ker_saccrg[39, 22] = 0.507063e00
-ker_saccrg[39, 23] = 0.504509e00
-ker_saccrg[39, 24] = 0.491577e00
-ker_saccrg[39, 25] = 0.493673e00
-ker_saccrg[39, 26] = 0.487788e00
-ker_saccrg[39, 27] = 0.482807e00
-ker_saccrg[39, 28] = 0.480014e00
-ker_saccrg[39, 29] = 0.470686e00
-ker_saccrg[39, 30] = 0.459128e00
-ker_saccrg[39, 31] = 0.449887e00
-ker_saccrg[39, 32] = 0.442941e00
-ker_saccrg[39, 33] = 0.437508e00
-ker_saccrg[39, 34] = 0.435762e00
-ker_saccrg[39, 35] = 0.431726e00
-ker_saccrg[39, 36] = 0.424049e00
-ker_saccrg[39, 37] = 0.000000e00
-ker_saccrg[39, 38] = 0.000000e00
-ker_saccrg[39, 39] = 0.000000e00
-ker_saccrg[39, 40] = 0.000000e00
-ker_saccrg[40, 1] = 0.000000e00
-ker_saccrg[40, 2] = 0.000000e00
-ker_saccrg[40, 3] = 0.000000e00
-ker_saccrg[40, 4] = 0.000000e00
-ker_saccrg[40, 5] = 0.000000e00
-ker_saccrg[40, 6] = 0.000000e00
-ker_saccrg[40, 7] = 0.000000e00
-ker_saccrg[40, 8] = 0.000000e00
-ker_saccrg[40, 9] = 0.000000e00
-ker_saccrg[40, 10] = 0.000000e00
-ker_saccrg[40, 11] = 0.000000e00
-ker_saccrg[40, 12] = 0.000000e00
-ker_saccrg[40, 13] = 0.000000e00
-ker_saccrg[40, 14] = 0.000000e00
-ker_saccrg[40, 15] = 0.000000e00
-ker_saccrg[40, 16] = 0.531993e00
-ker_saccrg[40, 17] = 0.498983e00
-ker_saccrg[40, 18] = 0.468012e00
-ker_saccrg[40, 19] = 0.521524e00
-ker_saccrg[40, 20] = 0.496911e00
-ker_saccrg[40, 21] = 0.507532e00
-ker_saccrg[40, 22] = 0.507558e00
-ker_saccrg[40, 23] = 0.505004e00
-ker_saccrg[40, 24] = 0.492073e00
-ker_saccrg[40, 25] = 0.494169e00
-ker_saccrg[40, 26] = 0.488284e00
-ker_saccrg[40, 27] = 0.483303e00
-ker_saccrg[40, 28] = 0.480510e00
-ker_saccrg[40, 29] = 0.471182e00
-ker_saccrg[40, 30] = 0.459624e00
-ker_saccrg[40, 31] = 0.450383e00
-ker_saccrg[40, 32] = 0.443437e00
-ker_saccrg[40, 33] = 0.438004e00
-ker_saccrg[40, 34] = 0.436256e00
-ker_saccrg[40, 35] = 0.432220e00
-ker_saccrg[40, 36] = 0.424544e00
-ker_saccrg[40, 37] = 0.000000e00
-ker_saccrg[40, 38] = 0.000000e00
-ker_saccrg[40, 39] = 0.000000e00
-ker_saccrg[40, 40] = 0.000000e00
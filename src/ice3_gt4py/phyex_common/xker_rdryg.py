@@ -1,1605 +0,0 @@
-# -*- coding: utf-8 -*-
-import numpy as np
-
-ker_rdryg = np.empty((41, 41))
-
-ker_rdryg[1, 1] = 0.113429e02
-ker_rdryg[1, 2] = 0.888532e01
-ker_rdryg[1, 3] = 0.684777e01
-ker_rdryg[1, 4] = 0.517128e01
-ker_rdryg[1, 5] = 0.381554e01
-ker_rdryg[1, 6] = 0.275614e01
-ker_rdryg[1, 7] = 0.197831e01
-ker_rdryg[1, 8] = 0.146495e01
-ker_rdryg[1, 9] = 0.118865e01
-ker_rdryg[1, 10] = 0.110504e01
-ker_rdryg[1, 11] = 0.115718e01
-ker_rdryg[1, 12] = 0.128948e01
-ker_rdryg[1, 13] = 0.145623e01
-ker_rdryg[1, 14] = 0.162671e01
-ker_rdryg[1, 15] = 0.178400e01
-ker_rdryg[1, 16] = 0.192135e01
-ker_rdryg[1, 17] = 0.203766e01
-ker_rdryg[1, 18] = 0.213454e01
-ker_rdryg[1, 19] = 0.221453e01
-ker_rdryg[1, 20] = 0.228027e01
-ker_rdryg[1, 21] = 0.233424e01
-ker_rdryg[1, 22] = 0.237855e01
-ker_rdryg[1, 23] = 0.241497e01
-ker_rdryg[1, 24] = 0.244492e01
-ker_rdryg[1, 25] = 0.246956e01
-ker_rdryg[1, 26] = 0.248985e01
-ker_rdryg[1, 27] = 0.250656e01
-ker_rdryg[1, 28] = 0.252033e01
-ker_rdryg[1, 29] = 0.253168e01
-ker_rdryg[1, 30] = 0.254104e01
-ker_rdryg[1, 31] = 0.254875e01
-ker_rdryg[1, 32] = 0.255512e01
-ker_rdryg[1, 33] = 0.256037e01
-ker_rdryg[1, 34] = 0.256470e01
-ker_rdryg[1, 35] = 0.256828e01
-ker_rdryg[1, 36] = 0.257123e01
-ker_rdryg[1, 37] = 0.257367e01
-ker_rdryg[1, 38] = 0.257568e01
-ker_rdryg[1, 39] = 0.257735e01
-ker_rdryg[1, 40] = 0.257872e01
-ker_rdryg[2, 1] = 0.117927e02
-ker_rdryg[2, 2] = 0.934446e01
-ker_rdryg[2, 3] = 0.730889e01
-ker_rdryg[2, 4] = 0.562152e01
-ker_rdryg[2, 5] = 0.423473e01
-ker_rdryg[2, 6] = 0.311610e01
-ker_rdryg[2, 7] = 0.224696e01
-ker_rdryg[2, 8] = 0.161553e01
-ker_rdryg[2, 9] = 0.120734e01
-ker_rdryg[2, 10] = 0.997308e00
-ker_rdryg[2, 11] = 0.945330e00
-ker_rdryg[2, 12] = 0.100270e01
-ker_rdryg[2, 13] = 0.112265e01
-ker_rdryg[2, 14] = 0.126742e01
-ker_rdryg[2, 15] = 0.141245e01
-ker_rdryg[2, 16] = 0.154497e01
-ker_rdryg[2, 17] = 0.165998e01
-ker_rdryg[2, 18] = 0.175705e01
-ker_rdryg[2, 19] = 0.183773e01
-ker_rdryg[2, 20] = 0.190425e01
-ker_rdryg[2, 21] = 0.195889e01
-ker_rdryg[2, 22] = 0.200372e01
-ker_rdryg[2, 23] = 0.204054e01
-ker_rdryg[2, 24] = 0.207079e01
-ker_rdryg[2, 25] = 0.209566e01
-ker_rdryg[2, 26] = 0.211612e01
-ker_rdryg[2, 27] = 0.213297e01
-ker_rdryg[2, 28] = 0.214684e01
-ker_rdryg[2, 29] = 0.215827e01
-ker_rdryg[2, 30] = 0.216769e01
-ker_rdryg[2, 31] = 0.217545e01
-ker_rdryg[2, 32] = 0.218186e01
-ker_rdryg[2, 33] = 0.218714e01
-ker_rdryg[2, 34] = 0.219150e01
-ker_rdryg[2, 35] = 0.219509e01
-ker_rdryg[2, 36] = 0.219806e01
-ker_rdryg[2, 37] = 0.220051e01
-ker_rdryg[2, 38] = 0.220253e01
-ker_rdryg[2, 39] = 0.220420e01
-ker_rdryg[2, 40] = 0.220558e01
-ker_rdryg[3, 1] = 0.121617e02
-ker_rdryg[3, 2] = 0.972447e01
-ker_rdryg[3, 3] = 0.769669e01
-ker_rdryg[3, 4] = 0.601068e01
-ker_rdryg[3, 5] = 0.461358e01
-ker_rdryg[3, 6] = 0.346650e01
-ker_rdryg[3, 7] = 0.254421e01
-ker_rdryg[3, 8] = 0.183189e01
-ker_rdryg[3, 9] = 0.131969e01
-ker_rdryg[3, 10] = 0.997188e00
-ker_rdryg[3, 11] = 0.839117e00
-ker_rdryg[3, 12] = 0.810553e00
-ker_rdryg[3, 13] = 0.869949e00
-ker_rdryg[3, 14] = 0.977509e00
-ker_rdryg[3, 15] = 0.110267e01
-ker_rdryg[3, 16] = 0.122591e01
-ker_rdryg[3, 17] = 0.133742e01
-ker_rdryg[3, 18] = 0.143367e01
-ker_rdryg[3, 19] = 0.151464e01
-ker_rdryg[3, 20] = 0.158182e01
-ker_rdryg[3, 21] = 0.163714e01
-ker_rdryg[3, 22] = 0.168256e01
-ker_rdryg[3, 23] = 0.171982e01
-ker_rdryg[3, 24] = 0.175040e01
-ker_rdryg[3, 25] = 0.177553e01
-ker_rdryg[3, 26] = 0.179619e01
-ker_rdryg[3, 27] = 0.181318e01
-ker_rdryg[3, 28] = 0.182717e01
-ker_rdryg[3, 29] = 0.183869e01
-ker_rdryg[3, 30] = 0.184817e01
-ker_rdryg[3, 31] = 0.185599e01
-ker_rdryg[3, 32] = 0.186244e01
-ker_rdryg[3, 33] = 0.186775e01
-ker_rdryg[3, 34] = 0.187213e01
-ker_rdryg[3, 35] = 0.187575e01
-ker_rdryg[3, 36] = 0.187873e01
-ker_rdryg[3, 37] = 0.188119e01
-ker_rdryg[3, 38] = 0.188322e01
-ker_rdryg[3, 39] = 0.188490e01
-ker_rdryg[3, 40] = 0.188628e01
-ker_rdryg[4, 1] = 0.124632e02
-ker_rdryg[4, 2] = 0.100363e02
-ker_rdryg[4, 3] = 0.801781e01
-ker_rdryg[4, 4] = 0.633828e01
-ker_rdryg[4, 5] = 0.494183e01
-ker_rdryg[4, 6] = 0.378510e01
-ker_rdryg[4, 7] = 0.283672e01
-ker_rdryg[4, 8] = 0.207666e01
-ker_rdryg[4, 9] = 0.149363e01
-ker_rdryg[4, 10] = 0.108052e01
-ker_rdryg[4, 11] = 0.825432e00
-ker_rdryg[4, 12] = 0.708049e00
-ker_rdryg[4, 13] = 0.696559e00
-ker_rdryg[4, 14] = 0.755465e00
-ker_rdryg[4, 15] = 0.851164e00
-ker_rdryg[4, 16] = 0.958922e00
-ker_rdryg[4, 17] = 0.106351e01
-ker_rdryg[4, 18] = 0.115725e01
-ker_rdryg[4, 19] = 0.123777e01
-ker_rdryg[4, 20] = 0.130532e01
-ker_rdryg[4, 21] = 0.136125e01
-ker_rdryg[4, 22] = 0.140726e01
-ker_rdryg[4, 23] = 0.144501e01
-ker_rdryg[4, 24] = 0.147597e01
-ker_rdryg[4, 25] = 0.150139e01
-ker_rdryg[4, 26] = 0.152226e01
-ker_rdryg[4, 27] = 0.153942e01
-ker_rdryg[4, 28] = 0.155353e01
-ker_rdryg[4, 29] = 0.156515e01
-ker_rdryg[4, 30] = 0.157471e01
-ker_rdryg[4, 31] = 0.158259e01
-ker_rdryg[4, 32] = 0.158908e01
-ker_rdryg[4, 33] = 0.159443e01
-ker_rdryg[4, 34] = 0.159884e01
-ker_rdryg[4, 35] = 0.160248e01
-ker_rdryg[4, 36] = 0.160548e01
-ker_rdryg[4, 37] = 0.160795e01
-ker_rdryg[4, 38] = 0.160999e01
-ker_rdryg[4, 39] = 0.161168e01
-ker_rdryg[4, 40] = 0.161307e01
-ker_rdryg[5, 1] = 0.127090e02
-ker_rdryg[5, 2] = 0.102910e02
-ker_rdryg[5, 3] = 0.828132e01
-ker_rdryg[5, 4] = 0.660967e01
-ker_rdryg[5, 5] = 0.521858e01
-ker_rdryg[5, 6] = 0.406200e01
-ker_rdryg[5, 7] = 0.310443e01
-ker_rdryg[5, 8] = 0.232064e01
-ker_rdryg[5, 9] = 0.169464e01
-ker_rdryg[5, 10] = 0.121813e01
-ker_rdryg[5, 11] = 0.885289e00
-ker_rdryg[5, 12] = 0.684884e00
-ker_rdryg[5, 13] = 0.598972e00
-ker_rdryg[5, 14] = 0.599848e00
-ker_rdryg[5, 15] = 0.656194e00
-ker_rdryg[5, 16] = 0.740930e00
-ker_rdryg[5, 17] = 0.833644e00
-ker_rdryg[5, 18] = 0.922189e00
-ker_rdryg[5, 19] = 0.100097e01
-ker_rdryg[5, 20] = 0.106830e01
-ker_rdryg[5, 21] = 0.112462e01
-ker_rdryg[5, 22] = 0.117119e01
-ker_rdryg[5, 23] = 0.120946e01
-ker_rdryg[5, 24] = 0.124084e01
-ker_rdryg[5, 25] = 0.126657e01
-ker_rdryg[5, 26] = 0.128769e01
-ker_rdryg[5, 27] = 0.130503e01
-ker_rdryg[5, 28] = 0.131929e01
-ker_rdryg[5, 29] = 0.133101e01
-ker_rdryg[5, 30] = 0.134066e01
-ker_rdryg[5, 31] = 0.134860e01
-ker_rdryg[5, 32] = 0.135514e01
-ker_rdryg[5, 33] = 0.136053e01
-ker_rdryg[5, 34] = 0.136497e01
-ker_rdryg[5, 35] = 0.136863e01
-ker_rdryg[5, 36] = 0.137165e01
-ker_rdryg[5, 37] = 0.137413e01
-ker_rdryg[5, 38] = 0.137619e01
-ker_rdryg[5, 39] = 0.137788e01
-ker_rdryg[5, 40] = 0.137928e01
-ker_rdryg[6, 1] = 0.129097e02
-ker_rdryg[6, 2] = 0.104988e02
-ker_rdryg[6, 3] = 0.849661e01
-ker_rdryg[6, 4] = 0.683241e01
-ker_rdryg[6, 5] = 0.544798e01
-ker_rdryg[6, 6] = 0.429580e01
-ker_rdryg[6, 7] = 0.333794e01
-ker_rdryg[6, 8] = 0.254535e01
-ker_rdryg[6, 9] = 0.189760e01
-ker_rdryg[6, 10] = 0.138256e01
-ker_rdryg[6, 11] = 0.993749e00
-ker_rdryg[6, 12] = 0.725579e00
-ker_rdryg[6, 13] = 0.569771e00
-ker_rdryg[6, 14] = 0.508215e00
-ker_rdryg[6, 15] = 0.517364e00
-ker_rdryg[6, 16] = 0.570603e00
-ker_rdryg[6, 17] = 0.645018e00
-ker_rdryg[6, 18] = 0.724433e00
-ker_rdryg[6, 19] = 0.799323e00
-ker_rdryg[6, 20] = 0.865437e00
-ker_rdryg[6, 21] = 0.921727e00
-ker_rdryg[6, 22] = 0.968693e00
-ker_rdryg[6, 23] = 0.100746e01
-ker_rdryg[6, 24] = 0.103929e01
-ker_rdryg[6, 25] = 0.106538e01
-ker_rdryg[6, 26] = 0.108677e01
-ker_rdryg[6, 27] = 0.110432e01
-ker_rdryg[6, 28] = 0.111873e01
-ker_rdryg[6, 29] = 0.113057e01
-ker_rdryg[6, 30] = 0.114031e01
-ker_rdryg[6, 31] = 0.114832e01
-ker_rdryg[6, 32] = 0.115492e01
-ker_rdryg[6, 33] = 0.116035e01
-ker_rdryg[6, 34] = 0.116482e01
-ker_rdryg[6, 35] = 0.116851e01
-ker_rdryg[6, 36] = 0.117155e01
-ker_rdryg[6, 37] = 0.117405e01
-ker_rdryg[6, 38] = 0.117612e01
-ker_rdryg[6, 39] = 0.117782e01
-ker_rdryg[6, 40] = 0.117923e01
-ker_rdryg[7, 1] = 0.130737e02
-ker_rdryg[7, 2] = 0.106684e02
-ker_rdryg[7, 3] = 0.867226e01
-ker_rdryg[7, 4] = 0.701442e01
-ker_rdryg[7, 5] = 0.563630e01
-ker_rdryg[7, 6] = 0.448972e01
-ker_rdryg[7, 7] = 0.353543e01
-ker_rdryg[7, 8] = 0.274218e01
-ker_rdryg[7, 9] = 0.208626e01
-ker_rdryg[7, 10] = 0.155134e01
-ker_rdryg[7, 11] = 0.112782e01
-ker_rdryg[7, 12] = 0.810984e00
-ker_rdryg[7, 13] = 0.596204e00
-ker_rdryg[7, 14] = 0.475108e00
-ker_rdryg[7, 15] = 0.432596e00
-ker_rdryg[7, 16] = 0.446915e00
-ker_rdryg[7, 17] = 0.496175e00
-ker_rdryg[7, 18] = 0.561308e00
-ker_rdryg[7, 19] = 0.629230e00
-ker_rdryg[7, 20] = 0.692507e00
-ker_rdryg[7, 21] = 0.747991e00
-ker_rdryg[7, 22] = 0.795023e00
-ker_rdryg[7, 23] = 0.834178e00
-ker_rdryg[7, 24] = 0.866452e00
-ker_rdryg[7, 25] = 0.892928e00
-ker_rdryg[7, 26] = 0.914619e00
-ker_rdryg[7, 27] = 0.932399e00
-ker_rdryg[7, 28] = 0.946986e00
-ker_rdryg[7, 29] = 0.958962e00
-ker_rdryg[7, 30] = 0.968803e00
-ker_rdryg[7, 31] = 0.976894e00
-ker_rdryg[7, 32] = 0.983549e00
-ker_rdryg[7, 33] = 0.989027e00
-ker_rdryg[7, 34] = 0.993537e00
-ker_rdryg[7, 35] = 0.997252e00
-ker_rdryg[7, 36] = 0.100031e01
-ker_rdryg[7, 37] = 0.100283e01
-ker_rdryg[7, 38] = 0.100491e01
-ker_rdryg[7, 39] = 0.100663e01
-ker_rdryg[7, 40] = 0.100804e01
-ker_rdryg[8, 1] = 0.132082e02
-ker_rdryg[8, 2] = 0.108071e02
-ker_rdryg[8, 3] = 0.881568e01
-ker_rdryg[8, 4] = 0.716294e01
-ker_rdryg[8, 5] = 0.579021e01
-ker_rdryg[8, 6] = 0.464898e01
-ker_rdryg[8, 7] = 0.369939e01
-ker_rdryg[8, 8] = 0.290901e01
-ker_rdryg[8, 9] = 0.225210e01
-ker_rdryg[8, 10] = 0.170938e01
-ker_rdryg[8, 11] = 0.126773e01
-ker_rdryg[8, 12] = 0.919865e00
-ker_rdryg[8, 13] = 0.661937e00
-ker_rdryg[8, 14] = 0.490415e00
-ker_rdryg[8, 15] = 0.397339e00
-ker_rdryg[8, 16] = 0.368774e00
-ker_rdryg[8, 17] = 0.386541e00
-ker_rdryg[8, 18] = 0.431586e00
-ker_rdryg[8, 19] = 0.488388e00
-ker_rdryg[8, 20] = 0.546326e00
-ker_rdryg[8, 21] = 0.599722e00
-ker_rdryg[8, 22] = 0.646234e00
-ker_rdryg[8, 23] = 0.685535e00
-ker_rdryg[8, 24] = 0.718173e00
-ker_rdryg[8, 25] = 0.745040e00
-ker_rdryg[8, 26] = 0.767064e00
-ker_rdryg[8, 27] = 0.785101e00
-ker_rdryg[8, 28] = 0.799883e00
-ker_rdryg[8, 29] = 0.812008e00
-ker_rdryg[8, 30] = 0.821962e00
-ker_rdryg[8, 31] = 0.830140e00
-ker_rdryg[8, 32] = 0.836862e00
-ker_rdryg[8, 33] = 0.842391e00
-ker_rdryg[8, 34] = 0.846941e00
-ker_rdryg[8, 35] = 0.850687e00
-ker_rdryg[8, 36] = 0.853771e00
-ker_rdryg[8, 37] = 0.856313e00
-ker_rdryg[8, 38] = 0.858406e00
-ker_rdryg[8, 39] = 0.860132e00
-ker_rdryg[8, 40] = 0.861555e00
-ker_rdryg[9, 1] = 0.133186e02
-ker_rdryg[9, 2] = 0.109208e02
-ker_rdryg[9, 3] = 0.893300e01
-ker_rdryg[9, 4] = 0.728424e01
-ker_rdryg[9, 5] = 0.591582e01
-ker_rdryg[9, 6] = 0.477915e01
-ker_rdryg[9, 7] = 0.383409e01
-ker_rdryg[9, 8] = 0.304764e01
-ker_rdryg[9, 9] = 0.239303e01
-ker_rdryg[9, 10] = 0.184909e01
-ker_rdryg[9, 11] = 0.140008e01
-ker_rdryg[9, 12] = 0.103570e01
-ker_rdryg[9, 13] = 0.750184e00
-ker_rdryg[9, 14] = 0.540583e00
-ker_rdryg[9, 15] = 0.404171e00
-ker_rdryg[9, 16] = 0.333201e00
-ker_rdryg[9, 17] = 0.315421e00
-ker_rdryg[9, 18] = 0.334832e00
-ker_rdryg[9, 19] = 0.375550e00
-ker_rdryg[9, 20] = 0.424785e00
-ker_rdryg[9, 21] = 0.474129e00
-ker_rdryg[9, 22] = 0.519143e00
-ker_rdryg[9, 23] = 0.558133e00
-ker_rdryg[9, 24] = 0.590954e00
-ker_rdryg[9, 25] = 0.618160e00
-ker_rdryg[9, 26] = 0.640526e00
-ker_rdryg[9, 27] = 0.658847e00
-ker_rdryg[9, 28] = 0.673848e00
-ker_rdryg[9, 29] = 0.686139e00
-ker_rdryg[9, 30] = 0.696219e00
-ker_rdryg[9, 31] = 0.704493e00
-ker_rdryg[9, 32] = 0.711289e00
-ker_rdryg[9, 33] = 0.716875e00
-ker_rdryg[9, 34] = 0.721469e00
-ker_rdryg[9, 35] = 0.725249e00
-ker_rdryg[9, 36] = 0.728360e00
-ker_rdryg[9, 37] = 0.730922e00
-ker_rdryg[9, 38] = 0.733032e00
-ker_rdryg[9, 39] = 0.734770e00
-ker_rdryg[9, 40] = 0.736203e00
-ker_rdryg[10, 1] = 0.134097e02
-ker_rdryg[10, 2] = 0.110143e02
-ker_rdryg[10, 3] = 0.902922e01
-ker_rdryg[10, 4] = 0.738349e01
-ker_rdryg[10, 5] = 0.601843e01
-ker_rdryg[10, 6] = 0.488542e01
-ker_rdryg[10, 7] = 0.394421e01
-ker_rdryg[10, 8] = 0.316159e01
-ker_rdryg[10, 9] = 0.251025e01
-ker_rdryg[10, 10] = 0.196809e01
-ker_rdryg[10, 11] = 0.151773e01
-ker_rdryg[10, 12] = 0.114640e01
-ker_rdryg[10, 13] = 0.845862e00
-ker_rdryg[10, 14] = 0.611819e00
-ker_rdryg[10, 15] = 0.442230e00
-ker_rdryg[10, 16] = 0.333761e00
-ker_rdryg[10, 17] = 0.280176e00
-ker_rdryg[10, 18] = 0.270205e00
-ker_rdryg[10, 19] = 0.290267e00
-ker_rdryg[10, 20] = 0.326785e00
-ker_rdryg[10, 21] = 0.369349e00
-ker_rdryg[10, 22] = 0.411304e00
-ker_rdryg[10, 23] = 0.449213e00
-ker_rdryg[10, 24] = 0.481873e00
-ker_rdryg[10, 25] = 0.509282e00
-ker_rdryg[10, 26] = 0.531958e00
-ker_rdryg[10, 27] = 0.550577e00
-ker_rdryg[10, 28] = 0.565820e00
-ker_rdryg[10, 29] = 0.578297e00
-ker_rdryg[10, 30] = 0.588518e00
-ker_rdryg[10, 31] = 0.596899e00
-ker_rdryg[10, 32] = 0.603778e00
-ker_rdryg[10, 33] = 0.609427e00
-ker_rdryg[10, 34] = 0.614069e00
-ker_rdryg[10, 35] = 0.617886e00
-ker_rdryg[10, 36] = 0.621027e00
-ker_rdryg[10, 37] = 0.623611e00
-ker_rdryg[10, 38] = 0.625739e00
-ker_rdryg[10, 39] = 0.627491e00
-ker_rdryg[10, 40] = 0.628935e00
-ker_rdryg[11, 1] = 0.134850e02
-ker_rdryg[11, 2] = 0.110914e02
-ker_rdryg[11, 3] = 0.910837e01
-ker_rdryg[11, 4] = 0.746493e01
-ker_rdryg[11, 5] = 0.610242e01
-ker_rdryg[11, 6] = 0.497224e01
-ker_rdryg[11, 7] = 0.403413e01
-ker_rdryg[11, 8] = 0.325477e01
-ker_rdryg[11, 9] = 0.260666e01
-ker_rdryg[11, 10] = 0.206723e01
-ker_rdryg[11, 11] = 0.161821e01
-ker_rdryg[11, 12] = 0.124536e01
-ker_rdryg[11, 13] = 0.938357e00
-ker_rdryg[11, 14] = 0.690647e00
-ker_rdryg[11, 15] = 0.499022e00
-ker_rdryg[11, 16] = 0.361814e00
-ker_rdryg[11, 17] = 0.276145e00
-ker_rdryg[11, 18] = 0.236136e00
-ker_rdryg[11, 19] = 0.232058e00
-ker_rdryg[11, 20] = 0.251803e00
-ker_rdryg[11, 21] = 0.284322e00
-ker_rdryg[11, 22] = 0.321029e00
-ker_rdryg[11, 23] = 0.356649e00
-ker_rdryg[11, 24] = 0.388551e00
-ker_rdryg[11, 25] = 0.415898e00
-ker_rdryg[11, 26] = 0.438783e00
-ker_rdryg[11, 27] = 0.457681e00
-ker_rdryg[11, 28] = 0.473182e00
-ker_rdryg[11, 29] = 0.485865e00
-ker_rdryg[11, 30] = 0.496243e00
-ker_rdryg[11, 31] = 0.504744e00
-ker_rdryg[11, 32] = 0.511714e00
-ker_rdryg[11, 33] = 0.517433e00
-ker_rdryg[11, 34] = 0.522129e00
-ker_rdryg[11, 35] = 0.525987e00
-ker_rdryg[11, 36] = 0.529160e00
-ker_rdryg[11, 37] = 0.531769e00
-ker_rdryg[11, 38] = 0.533916e00
-ker_rdryg[11, 39] = 0.535683e00
-ker_rdryg[11, 40] = 0.537138e00
-ker_rdryg[12, 1] = 0.135474e02
-ker_rdryg[12, 2] = 0.111552e02
-ker_rdryg[12, 3] = 0.917366e01
-ker_rdryg[12, 4] = 0.753194e01
-ker_rdryg[12, 5] = 0.617136e01
-ker_rdryg[12, 6] = 0.504334e01
-ker_rdryg[12, 7] = 0.410762e01
-ker_rdryg[12, 8] = 0.333087e01
-ker_rdryg[12, 9] = 0.268553e01
-ker_rdryg[12, 10] = 0.214881e01
-ker_rdryg[12, 11] = 0.170205e01
-ker_rdryg[12, 12] = 0.133020e01
-ker_rdryg[12, 13] = 0.102155e01
-ker_rdryg[12, 14] = 0.767749e00
-ker_rdryg[12, 15] = 0.563744e00
-ker_rdryg[12, 16] = 0.407094e00
-ker_rdryg[12, 17] = 0.296271e00
-ker_rdryg[12, 18] = 0.229046e00
-ker_rdryg[12, 19] = 0.199698e00
-ker_rdryg[12, 20] = 0.199640e00
-ker_rdryg[12, 21] = 0.218639e00
-ker_rdryg[12, 22] = 0.247374e00
-ker_rdryg[12, 23] = 0.278945e00
-ker_rdryg[12, 24] = 0.309121e00
-ker_rdryg[12, 25] = 0.335948e00
-ker_rdryg[12, 26] = 0.358842e00
-ker_rdryg[12, 27] = 0.377946e00
-ker_rdryg[12, 28] = 0.393696e00
-ker_rdryg[12, 29] = 0.406601e00
-ker_rdryg[12, 30] = 0.417155e00
-ker_rdryg[12, 31] = 0.425790e00
-ker_rdryg[12, 32] = 0.432861e00
-ker_rdryg[12, 33] = 0.438657e00
-ker_rdryg[12, 34] = 0.443413e00
-ker_rdryg[12, 35] = 0.447317e00
-ker_rdryg[12, 36] = 0.450524e00
-ker_rdryg[12, 37] = 0.453161e00
-ker_rdryg[12, 38] = 0.455329e00
-ker_rdryg[12, 39] = 0.457113e00
-ker_rdryg[12, 40] = 0.458581e00
-ker_rdryg[13, 1] = 0.135992e02
-ker_rdryg[13, 2] = 0.112081e02
-ker_rdryg[13, 3] = 0.922768e01
-ker_rdryg[13, 4] = 0.758724e01
-ker_rdryg[13, 5] = 0.622811e01
-ker_rdryg[13, 6] = 0.510171e01
-ker_rdryg[13, 7] = 0.416780e01
-ker_rdryg[13, 8] = 0.339309e01
-ker_rdryg[13, 9] = 0.274995e01
-ker_rdryg[13, 10] = 0.221557e01
-ker_rdryg[13, 11] = 0.177110e01
-ker_rdryg[13, 12] = 0.140110e01
-ker_rdryg[13, 13] = 0.109315e01
-ker_rdryg[13, 14] = 0.837695e00
-ker_rdryg[13, 15] = 0.628007e00
-ker_rdryg[13, 16] = 0.460064e00
-ker_rdryg[13, 17] = 0.332147e00
-ker_rdryg[13, 18] = 0.242993e00
-ker_rdryg[13, 19] = 0.190382e00
-ker_rdryg[13, 20] = 0.169340e00
-ker_rdryg[13, 21] = 0.172021e00
-ker_rdryg[13, 22] = 0.189920e00
-ker_rdryg[13, 23] = 0.215196e00
-ker_rdryg[13, 24] = 0.242255e00
-ker_rdryg[13, 25] = 0.267812e00
-ker_rdryg[13, 26] = 0.290361e00
-ker_rdryg[13, 27] = 0.309517e00
-ker_rdryg[13, 28] = 0.325465e00
-ker_rdryg[13, 29] = 0.338590e00
-ker_rdryg[13, 30] = 0.349335e00
-ker_rdryg[13, 31] = 0.358118e00
-ker_rdryg[13, 32] = 0.365303e00
-ker_rdryg[13, 33] = 0.371186e00
-ker_rdryg[13, 34] = 0.376007e00
-ker_rdryg[13, 35] = 0.379962e00
-ker_rdryg[13, 36] = 0.383208e00
-ker_rdryg[13, 37] = 0.385875e00
-ker_rdryg[13, 38] = 0.388066e00
-ker_rdryg[13, 39] = 0.389868e00
-ker_rdryg[13, 40] = 0.391351e00
-ker_rdryg[14, 1] = 0.136424e02
-ker_rdryg[14, 2] = 0.112520e02
-ker_rdryg[14, 3] = 0.927249e01
-ker_rdryg[14, 4] = 0.763302e01
-ker_rdryg[14, 5] = 0.627497e01
-ker_rdryg[14, 6] = 0.514978e01
-ker_rdryg[14, 7] = 0.421724e01
-ker_rdryg[14, 8] = 0.344405e01
-ker_rdryg[14, 9] = 0.280263e01
-ker_rdryg[14, 10] = 0.227012e01
-ker_rdryg[14, 11] = 0.182762e01
-ker_rdryg[14, 12] = 0.145954e01
-ker_rdryg[14, 13] = 0.115311e01
-ker_rdryg[14, 14] = 0.898099e00
-ker_rdryg[14, 15] = 0.686697e00
-ker_rdryg[14, 16] = 0.513492e00
-ker_rdryg[14, 17] = 0.375385e00
-ker_rdryg[14, 18] = 0.270975e00
-ker_rdryg[14, 19] = 0.199521e00
-ker_rdryg[14, 20] = 0.158655e00
-ker_rdryg[14, 21] = 0.143819e00
-ker_rdryg[14, 22] = 0.148448e00
-ker_rdryg[14, 23] = 0.165031e00
-ker_rdryg[14, 24] = 0.187175e00
-ker_rdryg[14, 25] = 0.210331e00
-ker_rdryg[14, 26] = 0.231936e00
-ker_rdryg[14, 27] = 0.250868e00
-ker_rdryg[14, 28] = 0.266895e00
-ker_rdryg[14, 29] = 0.280204e00
-ker_rdryg[14, 30] = 0.291143e00
-ker_rdryg[14, 31] = 0.300090e00
-ker_rdryg[14, 32] = 0.307401e00
-ker_rdryg[14, 33] = 0.313380e00
-ker_rdryg[14, 34] = 0.318275e00
-ker_rdryg[14, 35] = 0.322286e00
-ker_rdryg[14, 36] = 0.325575e00
-ker_rdryg[14, 37] = 0.328275e00
-ker_rdryg[14, 38] = 0.330492e00
-ker_rdryg[14, 39] = 0.332314e00
-ker_rdryg[14, 40] = 0.333811e00
-ker_rdryg[15, 1] = 0.136784e02
-ker_rdryg[15, 2] = 0.112886e02
-ker_rdryg[15, 3] = 0.930976e01
-ker_rdryg[15, 4] = 0.767102e01
-ker_rdryg[15, 5] = 0.631377e01
-ker_rdryg[15, 6] = 0.518948e01
-ker_rdryg[15, 7] = 0.425797e01
-ker_rdryg[15, 8] = 0.348593e01
-ker_rdryg[15, 9] = 0.284580e01
-ker_rdryg[15, 10] = 0.231474e01
-ker_rdryg[15, 11] = 0.187382e01
-ker_rdryg[15, 12] = 0.150740e01
-ker_rdryg[15, 13] = 0.120258e01
-ker_rdryg[15, 14] = 0.948799e00
-ker_rdryg[15, 15] = 0.737641e00
-ker_rdryg[15, 16] = 0.562720e00
-ker_rdryg[15, 17] = 0.419730e00
-ker_rdryg[15, 18] = 0.306247e00
-ker_rdryg[15, 19] = 0.221265e00
-ker_rdryg[15, 20] = 0.164088e00
-ker_rdryg[15, 21] = 0.132562e00
-ker_rdryg[15, 22] = 0.122598e00
-ker_rdryg[15, 23] = 0.128315e00
-ker_rdryg[15, 24] = 0.143469e00
-ker_rdryg[15, 25] = 0.162742e00
-ker_rdryg[15, 26] = 0.182528e00
-ker_rdryg[15, 27] = 0.200775e00
-ker_rdryg[15, 28] = 0.216671e00
-ker_rdryg[15, 29] = 0.230077e00
-ker_rdryg[15, 30] = 0.241184e00
-ker_rdryg[15, 31] = 0.250299e00
-ker_rdryg[15, 32] = 0.257750e00
-ker_rdryg[15, 33] = 0.263837e00
-ker_rdryg[15, 34] = 0.268813e00
-ker_rdryg[15, 35] = 0.272887e00
-ker_rdryg[15, 36] = 0.276224e00
-ker_rdryg[15, 37] = 0.278960e00
-ker_rdryg[15, 38] = 0.281205e00
-ker_rdryg[15, 39] = 0.283049e00
-ker_rdryg[15, 40] = 0.284564e00
-ker_rdryg[16, 1] = 0.137085e02
-ker_rdryg[16, 2] = 0.113192e02
-ker_rdryg[16, 3] = 0.934083e01
-ker_rdryg[16, 4] = 0.770263e01
-ker_rdryg[16, 5] = 0.634599e01
-ker_rdryg[16, 6] = 0.522238e01
-ker_rdryg[16, 7] = 0.429162e01
-ker_rdryg[16, 8] = 0.352045e01
-ker_rdryg[16, 9] = 0.288129e01
-ker_rdryg[16, 10] = 0.235131e01
-ker_rdryg[16, 11] = 0.191162e01
-ker_rdryg[16, 12] = 0.154654e01
-ker_rdryg[16, 13] = 0.124312e01
-ker_rdryg[16, 14] = 0.990681e00
-ker_rdryg[16, 15] = 0.780510e00
-ker_rdryg[16, 16] = 0.605678e00
-ker_rdryg[16, 17] = 0.460987e00
-ker_rdryg[16, 18] = 0.342972e00
-ker_rdryg[16, 19] = 0.249819e00
-ker_rdryg[16, 20] = 0.180844e00
-ker_rdryg[16, 21] = 0.135165e00
-ker_rdryg[16, 22] = 0.111031e00
-ker_rdryg[16, 23] = 0.104672e00
-ker_rdryg[16, 24] = 0.110998e00
-ker_rdryg[16, 25] = 0.124724e00
-ker_rdryg[16, 26] = 0.141478e00
-ker_rdryg[16, 27] = 0.158331e00
-ker_rdryg[16, 28] = 0.173737e00
-ker_rdryg[16, 29] = 0.187074e00
-ker_rdryg[16, 30] = 0.198283e00
-ker_rdryg[16, 31] = 0.207552e00
-ker_rdryg[16, 32] = 0.215149e00
-ker_rdryg[16, 33] = 0.221354e00
-ker_rdryg[16, 34] = 0.226422e00
-ker_rdryg[16, 35] = 0.230565e00
-ker_rdryg[16, 36] = 0.233955e00
-ker_rdryg[16, 37] = 0.236732e00
-ker_rdryg[16, 38] = 0.239008e00
-ker_rdryg[16, 39] = 0.240876e00
-ker_rdryg[16, 40] = 0.242409e00
-ker_rdryg[17, 1] = 0.137338e02
-ker_rdryg[17, 2] = 0.113448e02
-ker_rdryg[17, 3] = 0.936679e01
-ker_rdryg[17, 4] = 0.772900e01
-ker_rdryg[17, 5] = 0.637281e01
-ker_rdryg[17, 6] = 0.524971e01
-ker_rdryg[17, 7] = 0.431952e01
-ker_rdryg[17, 8] = 0.354898e01
-ker_rdryg[17, 9] = 0.291054e01
-ker_rdryg[17, 10] = 0.238139e01
-ker_rdryg[17, 11] = 0.194261e01
-ker_rdryg[17, 12] = 0.157857e01
-ker_rdryg[17, 13] = 0.127628e01
-ker_rdryg[17, 14] = 0.102502e01
-ker_rdryg[17, 15] = 0.815970e00
-ker_rdryg[17, 16] = 0.641917e00
-ker_rdryg[17, 17] = 0.497171e00
-ker_rdryg[17, 18] = 0.377507e00
-ker_rdryg[17, 19] = 0.280172e00
-ker_rdryg[17, 20] = 0.203787e00
-ker_rdryg[17, 21] = 0.147769e00
-ker_rdryg[17, 22] = 0.111528e00
-ker_rdryg[17, 23] = 0.932152e-01
-ker_rdryg[17, 24] = 0.895799e-01
-ker_rdryg[17, 25] = 0.961438e-01
-ker_rdryg[17, 26] = 0.108454e00
-ker_rdryg[17, 27] = 0.122945e00
-ker_rdryg[17, 28] = 0.137295e00
-ker_rdryg[17, 29] = 0.150279e00
-ker_rdryg[17, 30] = 0.161465e00
-ker_rdryg[17, 31] = 0.170838e00
-ker_rdryg[17, 32] = 0.178572e00
-ker_rdryg[17, 33] = 0.184904e00
-ker_rdryg[17, 34] = 0.190073e00
-ker_rdryg[17, 35] = 0.194293e00
-ker_rdryg[17, 36] = 0.197742e00
-ker_rdryg[17, 37] = 0.200564e00
-ker_rdryg[17, 38] = 0.202875e00
-ker_rdryg[17, 39] = 0.204769e00
-ker_rdryg[17, 40] = 0.206323e00
-ker_rdryg[18, 1] = 0.137549e02
-ker_rdryg[18, 2] = 0.113662e02
-ker_rdryg[18, 3] = 0.938851e01
-ker_rdryg[18, 4] = 0.775103e01
-ker_rdryg[18, 5] = 0.639519e01
-ker_rdryg[18, 6] = 0.527247e01
-ker_rdryg[18, 7] = 0.434271e01
-ker_rdryg[18, 8] = 0.357264e01
-ker_rdryg[18, 9] = 0.293474e01
-ker_rdryg[18, 10] = 0.240619e01
-ker_rdryg[18, 11] = 0.196810e01
-ker_rdryg[18, 12] = 0.160484e01
-ker_rdryg[18, 13] = 0.130342e01
-ker_rdryg[18, 14] = 0.105312e01
-ker_rdryg[18, 15] = 0.845066e00
-ker_rdryg[18, 16] = 0.671939e00
-ker_rdryg[18, 17] = 0.527804e00
-ker_rdryg[18, 18] = 0.407977e00
-ker_rdryg[18, 19] = 0.309030e00
-ker_rdryg[18, 20] = 0.228800e00
-ker_rdryg[18, 21] = 0.166244e00
-ker_rdryg[18, 22] = 0.120903e00
-ker_rdryg[18, 23] = 0.922202e-01
-ker_rdryg[18, 24] = 0.785293e-01
-ker_rdryg[18, 25] = 0.768302e-01
-ker_rdryg[18, 26] = 0.833242e-01
-ker_rdryg[18, 27] = 0.942918e-01
-ker_rdryg[18, 28] = 0.106809e00
-ker_rdryg[18, 29] = 0.119000e00
-ker_rdryg[18, 30] = 0.129941e00
-ker_rdryg[18, 31] = 0.139320e00
-ker_rdryg[18, 32] = 0.147155e00
-ker_rdryg[18, 33] = 0.153608e00
-ker_rdryg[18, 34] = 0.158885e00
-ker_rdryg[18, 35] = 0.163191e00
-ker_rdryg[18, 36] = 0.166706e00
-ker_rdryg[18, 37] = 0.169578e00
-ker_rdryg[18, 38] = 0.171928e00
-ker_rdryg[18, 39] = 0.173851e00
-ker_rdryg[18, 40] = 0.175428e00
-ker_rdryg[19, 1] = 0.137727e02
-ker_rdryg[19, 2] = 0.113842e02
-ker_rdryg[19, 3] = 0.940672e01
-ker_rdryg[19, 4] = 0.776948e01
-ker_rdryg[19, 5] = 0.641390e01
-ker_rdryg[19, 6] = 0.529147e01
-ker_rdryg[19, 7] = 0.436202e01
-ker_rdryg[19, 8] = 0.359232e01
-ker_rdryg[19, 9] = 0.295481e01
-ker_rdryg[19, 10] = 0.242671e01
-ker_rdryg[19, 11] = 0.198914e01
-ker_rdryg[19, 12] = 0.162645e01
-ker_rdryg[19, 13] = 0.132569e01
-ker_rdryg[19, 14] = 0.107613e01
-ker_rdryg[19, 15] = 0.868883e00
-ker_rdryg[19, 16] = 0.696595e00
-ker_rdryg[19, 17] = 0.553222e00
-ker_rdryg[19, 18] = 0.433861e00
-ker_rdryg[19, 19] = 0.334680e00
-ker_rdryg[19, 20] = 0.252894e00
-ker_rdryg[19, 21] = 0.186794e00
-ker_rdryg[19, 22] = 0.135613e00
-ker_rdryg[19, 23] = 0.990001e-01
-ker_rdryg[19, 24] = 0.764111e-01
-ker_rdryg[19, 25] = 0.663036e-01
-ker_rdryg[19, 26] = 0.659987e-01
-ker_rdryg[19, 27] = 0.722775e-01
-ker_rdryg[19, 28] = 0.819918e-01
-ker_rdryg[19, 29] = 0.927520e-01
-ker_rdryg[19, 30] = 0.103099e00
-ker_rdryg[19, 31] = 0.112313e00
-ker_rdryg[19, 32] = 0.120174e00
-ker_rdryg[19, 33] = 0.126723e00
-ker_rdryg[19, 34] = 0.132108e00
-ker_rdryg[19, 35] = 0.136507e00
-ker_rdryg[19, 36] = 0.140095e00
-ker_rdryg[19, 37] = 0.143023e00
-ker_rdryg[19, 38] = 0.145415e00
-ker_rdryg[19, 39] = 0.147371e00
-ker_rdryg[19, 40] = 0.148972e00
-ker_rdryg[20, 1] = 0.137877e02
-ker_rdryg[20, 2] = 0.113993e02
-ker_rdryg[20, 3] = 0.942201e01
-ker_rdryg[20, 4] = 0.778496e01
-ker_rdryg[20, 5] = 0.642957e01
-ker_rdryg[20, 6] = 0.530736e01
-ker_rdryg[20, 7] = 0.437816e01
-ker_rdryg[20, 8] = 0.360871e01
-ker_rdryg[20, 9] = 0.297151e01
-ker_rdryg[20, 10] = 0.244375e01
-ker_rdryg[20, 11] = 0.200655e01
-ker_rdryg[20, 12] = 0.164429e01
-ker_rdryg[20, 13] = 0.134402e01
-ker_rdryg[20, 14] = 0.109502e01
-ker_rdryg[20, 15] = 0.888391e00
-ker_rdryg[20, 16] = 0.716785e00
-ker_rdryg[20, 17] = 0.574115e00
-ker_rdryg[20, 18] = 0.455384e00
-ker_rdryg[20, 19] = 0.356548e00
-ker_rdryg[20, 20] = 0.274459e00
-ker_rdryg[20, 21] = 0.206882e00
-ker_rdryg[20, 22] = 0.152466e00
-ker_rdryg[20, 23] = 0.110601e00
-ker_rdryg[20, 24] = 0.811506e-01
-ker_rdryg[20, 25] = 0.634503e-01
-ker_rdryg[20, 26] = 0.561009e-01
-ker_rdryg[20, 27] = 0.568033e-01
-ker_rdryg[20, 28] = 0.627284e-01
-ker_rdryg[20, 29] = 0.712830e-01
-ker_rdryg[20, 30] = 0.805234e-01
-ker_rdryg[20, 31] = 0.892920e-01
-ker_rdryg[20, 32] = 0.970435e-01
-ker_rdryg[20, 33] = 0.103629e00
-ker_rdryg[20, 34] = 0.109103e00
-ker_rdryg[20, 35] = 0.113596e00
-ker_rdryg[20, 36] = 0.117263e00
-ker_rdryg[20, 37] = 0.120253e00
-ker_rdryg[20, 38] = 0.122692e00
-ker_rdryg[20, 39] = 0.124685e00
-ker_rdryg[20, 40] = 0.126314e00
-ker_rdryg[21, 1] = 0.138003e02
-ker_rdryg[21, 2] = 0.114121e02
-ker_rdryg[21, 3] = 0.943487e01
-ker_rdryg[21, 4] = 0.779796e01
-ker_rdryg[21, 5] = 0.644273e01
-ker_rdryg[21, 6] = 0.532068e01
-ker_rdryg[21, 7] = 0.439166e01
-ker_rdryg[21, 8] = 0.362242e01
-ker_rdryg[21, 9] = 0.298543e01
-ker_rdryg[21, 10] = 0.245792e01
-ker_rdryg[21, 11] = 0.202101e01
-ker_rdryg[21, 12] = 0.165907e01
-ker_rdryg[21, 13] = 0.135916e01
-ker_rdryg[21, 14] = 0.111057e01
-ker_rdryg[21, 15] = 0.904409e00
-ker_rdryg[21, 16] = 0.733329e00
-ker_rdryg[21, 17] = 0.591235e00
-ker_rdryg[21, 18] = 0.473092e00
-ker_rdryg[21, 19] = 0.374768e00
-ker_rdryg[21, 20] = 0.292928e00
-ker_rdryg[21, 21] = 0.224999e00
-ker_rdryg[21, 22] = 0.169182e00
-ker_rdryg[21, 23] = 0.124421e00
-ker_rdryg[21, 24] = 0.902987e-01
-ker_rdryg[21, 25] = 0.666035e-01
-ker_rdryg[21, 26] = 0.528135e-01
-ker_rdryg[21, 27] = 0.476163e-01
-ker_rdryg[21, 28] = 0.489721e-01
-ker_rdryg[21, 29] = 0.544680e-01
-ker_rdryg[21, 30] = 0.619547e-01
-ker_rdryg[21, 31] = 0.698776e-01
-ker_rdryg[21, 32] = 0.772992e-01
-ker_rdryg[21, 33] = 0.838194e-01
-ker_rdryg[21, 34] = 0.893378e-01
-ker_rdryg[21, 35] = 0.939116e-01
-ker_rdryg[21, 36] = 0.976604e-01
-ker_rdryg[21, 37] = 0.100718e00
-ker_rdryg[21, 38] = 0.103210e00
-ker_rdryg[21, 39] = 0.105243e00
-ker_rdryg[21, 40] = 0.106903e00
-ker_rdryg[22, 1] = 0.138109e02
-ker_rdryg[22, 2] = 0.114228e02
-ker_rdryg[22, 3] = 0.944570e01
-ker_rdryg[22, 4] = 0.780889e01
-ker_rdryg[22, 5] = 0.645378e01
-ker_rdryg[22, 6] = 0.533186e01
-ker_rdryg[22, 7] = 0.440297e01
-ker_rdryg[22, 8] = 0.363389e01
-ker_rdryg[22, 9] = 0.299707e01
-ker_rdryg[22, 10] = 0.246974e01
-ker_rdryg[22, 11] = 0.203304e01
-ker_rdryg[22, 12] = 0.167134e01
-ker_rdryg[22, 13] = 0.137170e01
-ker_rdryg[22, 14] = 0.112341e01
-ker_rdryg[22, 15] = 0.917601e00
-ker_rdryg[22, 16] = 0.746917e00
-ker_rdryg[22, 17] = 0.605268e00
-ker_rdryg[22, 18] = 0.487610e00
-ker_rdryg[22, 19] = 0.389777e00
-ker_rdryg[22, 20] = 0.308353e00
-ker_rdryg[22, 21] = 0.240593e00
-ker_rdryg[22, 22] = 0.184395e00
-ker_rdryg[22, 23] = 0.138304e00
-ker_rdryg[22, 24] = 0.101518e00
-ker_rdryg[22, 25] = 0.737400e-01
-ker_rdryg[22, 26] = 0.547362e-01
-ker_rdryg[22, 27] = 0.440552e-01
-ker_rdryg[22, 28] = 0.405040e-01
-ker_rdryg[22, 29] = 0.422514e-01
-ker_rdryg[22, 30] = 0.472981e-01
-ker_rdryg[22, 31] = 0.538448e-01
-ker_rdryg[22, 32] = 0.606126e-01
-ker_rdryg[22, 33] = 0.668945e-01
-ker_rdryg[22, 34] = 0.723746e-01
-ker_rdryg[22, 35] = 0.769958e-01
-ker_rdryg[22, 36] = 0.808177e-01
-ker_rdryg[22, 37] = 0.839459e-01
-ker_rdryg[22, 38] = 0.864957e-01
-ker_rdryg[22, 39] = 0.885730e-01
-ker_rdryg[22, 40] = 0.902671e-01
-ker_rdryg[23, 1] = 0.138199e02
-ker_rdryg[23, 2] = 0.114318e02
-ker_rdryg[23, 3] = 0.945483e01
-ker_rdryg[23, 4] = 0.781810e01
-ker_rdryg[23, 5] = 0.646308e01
-ker_rdryg[23, 6] = 0.534126e01
-ker_rdryg[23, 7] = 0.441248e01
-ker_rdryg[23, 8] = 0.364351e01
-ker_rdryg[23, 9] = 0.300682e01
-ker_rdryg[23, 10] = 0.247963e01
-ker_rdryg[23, 11] = 0.204308e01
-ker_rdryg[23, 12] = 0.168156e01
-ker_rdryg[23, 13] = 0.138212e01
-ker_rdryg[23, 14] = 0.113405e01
-ker_rdryg[23, 15] = 0.928502e00
-ker_rdryg[23, 16] = 0.758112e00
-ker_rdryg[23, 17] = 0.616797e00
-ker_rdryg[23, 18] = 0.499515e00
-ker_rdryg[23, 19] = 0.402091e00
-ker_rdryg[23, 20] = 0.321077e00
-ker_rdryg[23, 21] = 0.253650e00
-ker_rdryg[23, 22] = 0.197550e00
-ker_rdryg[23, 23] = 0.151060e00
-ker_rdryg[23, 24] = 0.113025e00
-ker_rdryg[23, 25] = 0.828239e-01
-ker_rdryg[23, 26] = 0.601986e-01
-ker_rdryg[23, 27] = 0.450509e-01
-ker_rdryg[23, 28] = 0.368416e-01
-ker_rdryg[23, 29] = 0.345321e-01
-ker_rdryg[23, 30] = 0.365251e-01
-ker_rdryg[23, 31] = 0.410970e-01
-ker_rdryg[23, 32] = 0.467824e-01
-ker_rdryg[23, 33] = 0.525608e-01
-ker_rdryg[23, 34] = 0.578657e-01
-ker_rdryg[23, 35] = 0.624713e-01
-ker_rdryg[23, 36] = 0.663413e-01
-ker_rdryg[23, 37] = 0.695349e-01
-ker_rdryg[23, 38] = 0.721454e-01
-ker_rdryg[23, 39] = 0.742719e-01
-ker_rdryg[23, 40] = 0.760039e-01
-ker_rdryg[24, 1] = 0.138275e02
-ker_rdryg[24, 2] = 0.114395e02
-ker_rdryg[24, 3] = 0.946253e01
-ker_rdryg[24, 4] = 0.782587e01
-ker_rdryg[24, 5] = 0.647092e01
-ker_rdryg[24, 6] = 0.534917e01
-ker_rdryg[24, 7] = 0.442047e01
-ker_rdryg[24, 8] = 0.365159e01
-ker_rdryg[24, 9] = 0.301500e01
-ker_rdryg[24, 10] = 0.248792e01
-ker_rdryg[24, 11] = 0.205149e01
-ker_rdryg[24, 12] = 0.169009e01
-ker_rdryg[24, 13] = 0.139080e01
-ker_rdryg[24, 14] = 0.114290e01
-ker_rdryg[24, 15] = 0.937539e00
-ker_rdryg[24, 16] = 0.767365e00
-ker_rdryg[24, 17] = 0.626299e00
-ker_rdryg[24, 18] = 0.509299e00
-ker_rdryg[24, 19] = 0.412192e00
-ker_rdryg[24, 20] = 0.331522e00
-ker_rdryg[24, 21] = 0.264435e00
-ker_rdryg[24, 22] = 0.208600e00
-ker_rdryg[24, 23] = 0.162158e00
-ker_rdryg[24, 24] = 0.123712e00
-ker_rdryg[24, 25] = 0.923382e-01
-ker_rdryg[24, 26] = 0.675660e-01
-ker_rdryg[24, 27] = 0.492121e-01
-ker_rdryg[24, 28] = 0.371392e-01
-ker_rdryg[24, 29] = 0.309059e-01
-ker_rdryg[24, 30] = 0.295040e-01
-ker_rdryg[24, 31] = 0.315887e-01
-ker_rdryg[24, 32] = 0.357033e-01
-ker_rdryg[24, 33] = 0.406336e-01
-ker_rdryg[24, 34] = 0.455581e-01
-ker_rdryg[24, 35] = 0.500391e-01
-ker_rdryg[24, 36] = 0.539067e-01
-ker_rdryg[24, 37] = 0.571467e-01
-ker_rdryg[24, 38] = 0.598152e-01
-ker_rdryg[24, 39] = 0.619938e-01
-ker_rdryg[24, 40] = 0.637676e-01
-ker_rdryg[25, 1] = 0.138339e02
-ker_rdryg[25, 2] = 0.114460e02
-ker_rdryg[25, 3] = 0.946904e01
-ker_rdryg[25, 4] = 0.783243e01
-ker_rdryg[25, 5] = 0.647753e01
-ker_rdryg[25, 6] = 0.535584e01
-ker_rdryg[25, 7] = 0.442721e01
-ker_rdryg[25, 8] = 0.365839e01
-ker_rdryg[25, 9] = 0.302187e01
-ker_rdryg[25, 10] = 0.249487e01
-ker_rdryg[25, 11] = 0.205853e01
-ker_rdryg[25, 12] = 0.169723e01
-ker_rdryg[25, 13] = 0.139805e01
-ker_rdryg[25, 14] = 0.115028e01
-ker_rdryg[25, 15] = 0.945054e00
-ker_rdryg[25, 16] = 0.775040e00
-ker_rdryg[25, 17] = 0.634156e00
-ker_rdryg[25, 18] = 0.517365e00
-ker_rdryg[25, 19] = 0.420497e00
-ker_rdryg[25, 20] = 0.340095e00
-ker_rdryg[25, 21] = 0.273296e00
-ker_rdryg[25, 22] = 0.217743e00
-ker_rdryg[25, 23] = 0.171507e00
-ker_rdryg[25, 24] = 0.133065e00
-ker_rdryg[25, 25] = 0.101277e00
-ker_rdryg[25, 26] = 0.754131e-01
-ker_rdryg[25, 27] = 0.551078e-01
-ker_rdryg[25, 28] = 0.402423e-01
-ker_rdryg[25, 29] = 0.306784e-01
-ker_rdryg[25, 30] = 0.259723e-01
-ker_rdryg[25, 31] = 0.252571e-01
-ker_rdryg[25, 32] = 0.273487e-01
-ker_rdryg[25, 33] = 0.310247e-01
-ker_rdryg[25, 34] = 0.352825e-01
-ker_rdryg[25, 35] = 0.394738e-01
-ker_rdryg[25, 36] = 0.432539e-01
-ker_rdryg[25, 37] = 0.465023e-01
-ker_rdryg[25, 38] = 0.492145e-01
-ker_rdryg[25, 39] = 0.514441e-01
-ker_rdryg[25, 40] = 0.532625e-01
-ker_rdryg[26, 1] = 0.138394e02
-ker_rdryg[26, 2] = 0.114514e02
-ker_rdryg[26, 3] = 0.947455e01
-ker_rdryg[26, 4] = 0.783798e01
-ker_rdryg[26, 5] = 0.648312e01
-ker_rdryg[26, 6] = 0.536147e01
-ker_rdryg[26, 7] = 0.443289e01
-ker_rdryg[26, 8] = 0.366412e01
-ker_rdryg[26, 9] = 0.302766e01
-ker_rdryg[26, 10] = 0.250072e01
-ker_rdryg[26, 11] = 0.206444e01
-ker_rdryg[26, 12] = 0.170322e01
-ker_rdryg[26, 13] = 0.140412e01
-ker_rdryg[26, 14] = 0.115644e01
-ker_rdryg[26, 15] = 0.951320e00
-ker_rdryg[26, 16] = 0.781424e00
-ker_rdryg[26, 17] = 0.640674e00
-ker_rdryg[26, 18] = 0.524038e00
-ker_rdryg[26, 19] = 0.427346e00
-ker_rdryg[26, 20] = 0.347145e00
-ker_rdryg[26, 21] = 0.280573e00
-ker_rdryg[26, 22] = 0.225261e00
-ker_rdryg[26, 23] = 0.179259e00
-ker_rdryg[26, 24] = 0.140975e00
-ker_rdryg[26, 25] = 0.109155e00
-ker_rdryg[26, 26] = 0.828827e-01
-ker_rdryg[26, 27] = 0.615721e-01
-ker_rdryg[26, 28] = 0.449413e-01
-ker_rdryg[26, 29] = 0.329364e-01
-ker_rdryg[26, 30] = 0.253888e-01
-ker_rdryg[26, 31] = 0.218916e-01
-ker_rdryg[26, 32] = 0.216696e-01
-ker_rdryg[26, 33] = 0.236986e-01
-ker_rdryg[26, 34] = 0.269569e-01
-ker_rdryg[26, 35] = 0.306269e-01
-ker_rdryg[26, 36] = 0.341888e-01
-ker_rdryg[26, 37] = 0.373771e-01
-ker_rdryg[26, 38] = 0.401030e-01
-ker_rdryg[26, 39] = 0.423733e-01
-ker_rdryg[26, 40] = 0.442362e-01
-ker_rdryg[27, 1] = 0.138440e02
-ker_rdryg[27, 2] = 0.114560e02
-ker_rdryg[27, 3] = 0.947921e01
-ker_rdryg[27, 4] = 0.784267e01
-ker_rdryg[27, 5] = 0.648784e01
-ker_rdryg[27, 6] = 0.536623e01
-ker_rdryg[27, 7] = 0.443768e01
-ker_rdryg[27, 8] = 0.366895e01
-ker_rdryg[27, 9] = 0.303253e01
-ker_rdryg[27, 10] = 0.250564e01
-ker_rdryg[27, 11] = 0.206942e01
-ker_rdryg[27, 12] = 0.170825e01
-ker_rdryg[27, 13] = 0.140921e01
-ker_rdryg[27, 14] = 0.116160e01
-ker_rdryg[27, 15] = 0.956558e00
-ker_rdryg[27, 16] = 0.786749e00
-ker_rdryg[27, 17] = 0.646098e00
-ker_rdryg[27, 18] = 0.529575e00
-ker_rdryg[27, 19] = 0.433014e00
-ker_rdryg[27, 20] = 0.352962e00
-ker_rdryg[27, 21] = 0.286560e00
-ker_rdryg[27, 22] = 0.231439e00
-ker_rdryg[27, 23] = 0.185639e00
-ker_rdryg[27, 24] = 0.147545e00
-ker_rdryg[27, 25] = 0.115846e00
-ker_rdryg[27, 26] = 0.895139e-01
-ker_rdryg[27, 27] = 0.678043e-01
-ker_rdryg[27, 28] = 0.502589e-01
-ker_rdryg[27, 29] = 0.366803e-01
-ker_rdryg[27, 30] = 0.269840e-01
-ker_rdryg[27, 31] = 0.210536e-01
-ker_rdryg[27, 32] = 0.184920e-01
-ker_rdryg[27, 33] = 0.186221e-01
-ker_rdryg[27, 34] = 0.205486e-01
-ker_rdryg[27, 35] = 0.234200e-01
-ker_rdryg[27, 36] = 0.265772e-01
-ker_rdryg[27, 37] = 0.296001e-01
-ker_rdryg[27, 38] = 0.322869e-01
-ker_rdryg[27, 39] = 0.345747e-01
-ker_rdryg[27, 40] = 0.364748e-01
-ker_rdryg[28, 1] = 0.138479e02
-ker_rdryg[28, 2] = 0.114600e02
-ker_rdryg[28, 3] = 0.948316e01
-ker_rdryg[28, 4] = 0.784664e01
-ker_rdryg[28, 5] = 0.649184e01
-ker_rdryg[28, 6] = 0.537025e01
-ker_rdryg[28, 7] = 0.444173e01
-ker_rdryg[28, 8] = 0.367304e01
-ker_rdryg[28, 9] = 0.303665e01
-ker_rdryg[28, 10] = 0.250979e01
-ker_rdryg[28, 11] = 0.207361e01
-ker_rdryg[28, 12] = 0.171248e01
-ker_rdryg[28, 13] = 0.141349e01
-ker_rdryg[28, 14] = 0.116593e01
-ker_rdryg[28, 15] = 0.960947e00
-ker_rdryg[28, 16] = 0.791203e00
-ker_rdryg[28, 17] = 0.650625e00
-ker_rdryg[28, 18] = 0.534185e00
-ker_rdryg[28, 19] = 0.437719e00
-ker_rdryg[28, 20] = 0.357777e00
-ker_rdryg[28, 21] = 0.291501e00
-ker_rdryg[28, 22] = 0.236523e00
-ker_rdryg[28, 23] = 0.190884e00
-ker_rdryg[28, 24] = 0.152959e00
-ker_rdryg[28, 25] = 0.121415e00
-ker_rdryg[28, 26] = 0.951696e-01
-ker_rdryg[28, 27] = 0.733827e-01
-ker_rdryg[28, 28] = 0.554501e-01
-ker_rdryg[28, 29] = 0.410159e-01
-ker_rdryg[28, 30] = 0.299322e-01
-ker_rdryg[28, 31] = 0.221290e-01
-ker_rdryg[28, 32] = 0.174911e-01
-ker_rdryg[28, 33] = 0.156662e-01
-ker_rdryg[28, 34] = 0.160216e-01
-ker_rdryg[28, 35] = 0.178216e-01
-ker_rdryg[28, 36] = 0.203456e-01
-ker_rdryg[28, 37] = 0.230543e-01
-ker_rdryg[28, 38] = 0.256182e-01
-ker_rdryg[28, 39] = 0.278812e-01
-ker_rdryg[28, 40] = 0.298004e-01
-ker_rdryg[29, 1] = 0.138512e02
-ker_rdryg[29, 2] = 0.114633e02
-ker_rdryg[29, 3] = 0.948650e01
-ker_rdryg[29, 4] = 0.785000e01
-ker_rdryg[29, 5] = 0.649522e01
-ker_rdryg[29, 6] = 0.537366e01
-ker_rdryg[29, 7] = 0.444516e01
-ker_rdryg[29, 8] = 0.367649e01
-ker_rdryg[29, 9] = 0.304013e01
-ker_rdryg[29, 10] = 0.251330e01
-ker_rdryg[29, 11] = 0.207714e01
-ker_rdryg[29, 12] = 0.171605e01
-ker_rdryg[29, 13] = 0.141709e01
-ker_rdryg[29, 14] = 0.116957e01
-ker_rdryg[29, 15] = 0.964632e00
-ker_rdryg[29, 16] = 0.794935e00
-ker_rdryg[29, 17] = 0.654412e00
-ker_rdryg[29, 18] = 0.538034e00
-ker_rdryg[29, 19] = 0.441637e00
-ker_rdryg[29, 20] = 0.361775e00
-ker_rdryg[29, 21] = 0.295592e00
-ker_rdryg[29, 22] = 0.240721e00
-ker_rdryg[29, 23] = 0.195203e00
-ker_rdryg[29, 24] = 0.157413e00
-ker_rdryg[29, 25] = 0.126010e00
-ker_rdryg[29, 26] = 0.998897e-01
-ker_rdryg[29, 27] = 0.781613e-01
-ker_rdryg[29, 28] = 0.601349e-01
-ker_rdryg[29, 29] = 0.453296e-01
-ker_rdryg[29, 30] = 0.334668e-01
-ker_rdryg[29, 31] = 0.244241e-01
-ker_rdryg[29, 32] = 0.181733e-01
-ker_rdryg[29, 33] = 0.145718e-01
-ker_rdryg[29, 34] = 0.133001e-01
-ker_rdryg[29, 35] = 0.138127e-01
-ker_rdryg[29, 36] = 0.154662e-01
-ker_rdryg[29, 37] = 0.176729e-01
-ker_rdryg[29, 38] = 0.199915e-01
-ker_rdryg[29, 39] = 0.221631e-01
-ker_rdryg[29, 40] = 0.240688e-01
-ker_rdryg[30, 1] = 0.138540e02
-ker_rdryg[30, 2] = 0.114661e02
-ker_rdryg[30, 3] = 0.948934e01
-ker_rdryg[30, 4] = 0.785286e01
-ker_rdryg[30, 5] = 0.649809e01
-ker_rdryg[30, 6] = 0.537654e01
-ker_rdryg[30, 7] = 0.444806e01
-ker_rdryg[30, 8] = 0.367941e01
-ker_rdryg[30, 9] = 0.304307e01
-ker_rdryg[30, 10] = 0.251626e01
-ker_rdryg[30, 11] = 0.208013e01
-ker_rdryg[30, 12] = 0.171906e01
-ker_rdryg[30, 13] = 0.142013e01
-ker_rdryg[30, 14] = 0.117264e01
-ker_rdryg[30, 15] = 0.967730e00
-ker_rdryg[30, 16] = 0.798070e00
-ker_rdryg[30, 17] = 0.657587e00
-ker_rdryg[30, 18] = 0.541254e00
-ker_rdryg[30, 19] = 0.444909e00
-ker_rdryg[30, 20] = 0.365106e00
-ker_rdryg[30, 21] = 0.298991e00
-ker_rdryg[30, 22] = 0.244198e00
-ker_rdryg[30, 23] = 0.198769e00
-ker_rdryg[30, 24] = 0.161082e00
-ker_rdryg[30, 25] = 0.129793e00
-ker_rdryg[30, 26] = 0.103790e00
-ker_rdryg[30, 27] = 0.821610e-01
-ker_rdryg[30, 28] = 0.641734e-01
-ker_rdryg[30, 29] = 0.492644e-01
-ker_rdryg[30, 30] = 0.370449e-01
-ker_rdryg[30, 31] = 0.273020e-01
-ker_rdryg[30, 32] = 0.199464e-01
-ker_rdryg[30, 33] = 0.149418e-01
-ker_rdryg[30, 34] = 0.121711e-01
-ker_rdryg[30, 35] = 0.113170e-01
-ker_rdryg[30, 36] = 0.119183e-01
-ker_rdryg[30, 37] = 0.134237e-01
-ker_rdryg[30, 38] = 0.153458e-01
-ker_rdryg[30, 39] = 0.173290e-01
-ker_rdryg[30, 40] = 0.191677e-01
-ker_rdryg[31, 1] = 0.138564e02
-ker_rdryg[31, 2] = 0.114685e02
-ker_rdryg[31, 3] = 0.949175e01
-ker_rdryg[31, 4] = 0.785528e01
-ker_rdryg[31, 5] = 0.650052e01
-ker_rdryg[31, 6] = 0.537899e01
-ker_rdryg[31, 7] = 0.445052e01
-ker_rdryg[31, 8] = 0.368188e01
-ker_rdryg[31, 9] = 0.304556e01
-ker_rdryg[31, 10] = 0.251877e01
-ker_rdryg[31, 11] = 0.208265e01
-ker_rdryg[31, 12] = 0.172160e01
-ker_rdryg[31, 13] = 0.142269e01
-ker_rdryg[31, 14] = 0.117522e01
-ker_rdryg[31, 15] = 0.970340e00
-ker_rdryg[31, 16] = 0.800707e00
-ker_rdryg[31, 17] = 0.660255e00
-ker_rdryg[31, 18] = 0.543956e00
-ker_rdryg[31, 19] = 0.447649e00
-ker_rdryg[31, 20] = 0.367889e00
-ker_rdryg[31, 21] = 0.301823e00
-ker_rdryg[31, 22] = 0.247087e00
-ker_rdryg[31, 23] = 0.201725e00
-ker_rdryg[31, 24] = 0.164114e00
-ker_rdryg[31, 25] = 0.132910e00
-ker_rdryg[31, 26] = 0.107003e00
-ker_rdryg[31, 27] = 0.854709e-01
-ker_rdryg[31, 28] = 0.675620e-01
-ker_rdryg[31, 29] = 0.526723e-01
-ker_rdryg[31, 30] = 0.403428e-01
-ker_rdryg[31, 31] = 0.302637e-01
-ker_rdryg[31, 32] = 0.222653e-01
-ker_rdryg[31, 33] = 0.162939e-01
-ker_rdryg[31, 34] = 0.123058e-01
-ker_rdryg[31, 35] = 0.101795e-01
-ker_rdryg[31, 36] = 0.964983e-02
-ker_rdryg[31, 37] = 0.102948e-01
-ker_rdryg[31, 38] = 0.116552e-01
-ker_rdryg[31, 39] = 0.133239e-01
-ker_rdryg[31, 40] = 0.150165e-01
-ker_rdryg[32, 1] = 0.138584e02
-ker_rdryg[32, 2] = 0.114706e02
-ker_rdryg[32, 3] = 0.949379e01
-ker_rdryg[32, 4] = 0.785733e01
-ker_rdryg[32, 5] = 0.650259e01
-ker_rdryg[32, 6] = 0.538106e01
-ker_rdryg[32, 7] = 0.445260e01
-ker_rdryg[32, 8] = 0.368398e01
-ker_rdryg[32, 9] = 0.304766e01
-ker_rdryg[32, 10] = 0.252089e01
-ker_rdryg[32, 11] = 0.208479e01
-ker_rdryg[32, 12] = 0.172375e01
-ker_rdryg[32, 13] = 0.142486e01
-ker_rdryg[32, 14] = 0.117741e01
-ker_rdryg[32, 15] = 0.972542e00
-ker_rdryg[32, 16] = 0.802930e00
-ker_rdryg[32, 17] = 0.662499e00
-ker_rdryg[32, 18] = 0.546226e00
-ker_rdryg[32, 19] = 0.449948e00
-ker_rdryg[32, 20] = 0.370220e00
-ker_rdryg[32, 21] = 0.304190e00
-ker_rdryg[32, 22] = 0.249496e00
-ker_rdryg[32, 23] = 0.204181e00
-ker_rdryg[32, 24] = 0.166626e00
-ker_rdryg[32, 25] = 0.135487e00
-ker_rdryg[32, 26] = 0.109652e00
-ker_rdryg[32, 27] = 0.882004e-01
-ker_rdryg[32, 28] = 0.703714e-01
-ker_rdryg[32, 29] = 0.555429e-01
-ker_rdryg[32, 30] = 0.432184e-01
-ker_rdryg[32, 31] = 0.330257e-01
-ker_rdryg[32, 32] = 0.247158e-01
-ker_rdryg[32, 33] = 0.181591e-01
-ker_rdryg[32, 34] = 0.133191e-01
-ker_rdryg[32, 35] = 0.101524e-01
-ker_rdryg[32, 36] = 0.854593e-02
-ker_rdryg[32, 37] = 0.824929e-02
-ker_rdryg[32, 38] = 0.890385e-02
-ker_rdryg[32, 39] = 0.101193e-01
-ker_rdryg[32, 40] = 0.115645e-01
-ker_rdryg[33, 1] = 0.138601e02
-ker_rdryg[33, 2] = 0.114723e02
-ker_rdryg[33, 3] = 0.949553e01
-ker_rdryg[33, 4] = 0.785908e01
-ker_rdryg[33, 5] = 0.650434e01
-ker_rdryg[33, 6] = 0.538282e01
-ker_rdryg[33, 7] = 0.445437e01
-ker_rdryg[33, 8] = 0.368576e01
-ker_rdryg[33, 9] = 0.304945e01
-ker_rdryg[33, 10] = 0.252268e01
-ker_rdryg[33, 11] = 0.208659e01
-ker_rdryg[33, 12] = 0.172557e01
-ker_rdryg[33, 13] = 0.142669e01
-ker_rdryg[33, 14] = 0.117925e01
-ker_rdryg[33, 15] = 0.974401e00
-ker_rdryg[33, 16] = 0.804805e00
-ker_rdryg[33, 17] = 0.664392e00
-ker_rdryg[33, 18] = 0.548137e00
-ker_rdryg[33, 19] = 0.451880e00
-ker_rdryg[33, 20] = 0.372176e00
-ker_rdryg[33, 21] = 0.306173e00
-ker_rdryg[33, 22] = 0.251510e00
-ker_rdryg[33, 23] = 0.206230e00
-ker_rdryg[33, 24] = 0.168715e00
-ker_rdryg[33, 25] = 0.137623e00
-ker_rdryg[33, 26] = 0.111843e00
-ker_rdryg[33, 27] = 0.904523e-01
-ker_rdryg[33, 28] = 0.726902e-01
-ker_rdryg[33, 29] = 0.579273e-01
-ker_rdryg[33, 30] = 0.456499e-01
-ker_rdryg[33, 31] = 0.354504e-01
-ker_rdryg[33, 32] = 0.270255e-01
-ker_rdryg[33, 33] = 0.201789e-01
-ker_rdryg[33, 34] = 0.148159e-01
-ker_rdryg[33, 35] = 0.108951e-01
-ker_rdryg[33, 36] = 0.838982e-02
-ker_rdryg[33, 37] = 0.718623e-02
-ker_rdryg[33, 38] = 0.706271e-02
-ker_rdryg[33, 39] = 0.770543e-02
-ker_rdryg[33, 40] = 0.878717e-02
-ker_rdryg[34, 1] = 0.138616e02
-ker_rdryg[34, 2] = 0.114738e02
-ker_rdryg[34, 3] = 0.949701e01
-ker_rdryg[34, 4] = 0.786056e01
-ker_rdryg[34, 5] = 0.650583e01
-ker_rdryg[34, 6] = 0.538432e01
-ker_rdryg[34, 7] = 0.445588e01
-ker_rdryg[34, 8] = 0.368726e01
-ker_rdryg[34, 9] = 0.305097e01
-ker_rdryg[34, 10] = 0.252421e01
-ker_rdryg[34, 11] = 0.208813e01
-ker_rdryg[34, 12] = 0.172711e01
-ker_rdryg[34, 13] = 0.142824e01
-ker_rdryg[34, 14] = 0.118081e01
-ker_rdryg[34, 15] = 0.975973e00
-ker_rdryg[34, 16] = 0.806389e00
-ker_rdryg[34, 17] = 0.665989e00
-ker_rdryg[34, 18] = 0.549748e00
-ker_rdryg[34, 19] = 0.453507e00
-ker_rdryg[34, 20] = 0.373821e00
-ker_rdryg[34, 21] = 0.307838e00
-ker_rdryg[34, 22] = 0.253197e00
-ker_rdryg[34, 23] = 0.207944e00
-ker_rdryg[34, 24] = 0.170458e00
-ker_rdryg[34, 25] = 0.139400e00
-ker_rdryg[34, 26] = 0.113659e00
-ker_rdryg[34, 27] = 0.923147e-01
-ker_rdryg[34, 28] = 0.746045e-01
-ker_rdryg[34, 29] = 0.598974e-01
-ker_rdryg[34, 30] = 0.476733e-01
-ker_rdryg[34, 31] = 0.375085e-01
-ker_rdryg[34, 32] = 0.290687e-01
-ker_rdryg[34, 33] = 0.221077e-01
-ker_rdryg[34, 34] = 0.164706e-01
-ker_rdryg[34, 35] = 0.120829e-01
-ker_rdryg[34, 36] = 0.891924e-02
-ker_rdryg[34, 37] = 0.694498e-02
-ker_rdryg[34, 38] = 0.605978e-02
-ker_rdryg[34, 39] = 0.605815e-02
-ker_rdryg[34, 40] = 0.667329e-02
-ker_rdryg[35, 1] = 0.138628e02
-ker_rdryg[35, 2] = 0.114750e02
-ker_rdryg[35, 3] = 0.949827e01
-ker_rdryg[35, 4] = 0.786182e01
-ker_rdryg[35, 5] = 0.650709e01
-ker_rdryg[35, 6] = 0.538559e01
-ker_rdryg[35, 7] = 0.445715e01
-ker_rdryg[35, 8] = 0.368855e01
-ker_rdryg[35, 9] = 0.305226e01
-ker_rdryg[35, 10] = 0.252550e01
-ker_rdryg[35, 11] = 0.208943e01
-ker_rdryg[35, 12] = 0.172842e01
-ker_rdryg[35, 13] = 0.142955e01
-ker_rdryg[35, 14] = 0.118213e01
-ker_rdryg[35, 15] = 0.977304e00
-ker_rdryg[35, 16] = 0.807728e00
-ker_rdryg[35, 17] = 0.667338e00
-ker_rdryg[35, 18] = 0.551109e00
-ker_rdryg[35, 19] = 0.454880e00
-ker_rdryg[35, 20] = 0.375207e00
-ker_rdryg[35, 21] = 0.309239e00
-ker_rdryg[35, 22] = 0.254615e00
-ker_rdryg[35, 23] = 0.209380e00
-ker_rdryg[35, 24] = 0.171916e00
-ker_rdryg[35, 25] = 0.140883e00
-ker_rdryg[35, 26] = 0.115171e00
-ker_rdryg[35, 27] = 0.938600e-01
-ker_rdryg[35, 28] = 0.761883e-01
-ker_rdryg[35, 29] = 0.615248e-01
-ker_rdryg[35, 30] = 0.493472e-01
-ker_rdryg[35, 31] = 0.392256e-01
-ker_rdryg[35, 32] = 0.308103e-01
-ker_rdryg[35, 33] = 0.238270e-01
-ker_rdryg[35, 34] = 0.180779e-01
-ker_rdryg[35, 35] = 0.134407e-01
-ker_rdryg[35, 36] = 0.985642e-02
-ker_rdryg[35, 37] = 0.730986e-02
-ker_rdryg[35, 38] = 0.576437e-02
-ker_rdryg[35, 39] = 0.512255e-02
-ker_rdryg[35, 40] = 0.520497e-02
-ker_rdryg[36, 1] = 0.138639e02
-ker_rdryg[36, 2] = 0.114761e02
-ker_rdryg[36, 3] = 0.949934e01
-ker_rdryg[36, 4] = 0.786289e01
-ker_rdryg[36, 5] = 0.650817e01
-ker_rdryg[36, 6] = 0.538667e01
-ker_rdryg[36, 7] = 0.445824e01
-ker_rdryg[36, 8] = 0.368964e01
-ker_rdryg[36, 9] = 0.305335e01
-ker_rdryg[36, 10] = 0.252660e01
-ker_rdryg[36, 11] = 0.209053e01
-ker_rdryg[36, 12] = 0.172953e01
-ker_rdryg[36, 13] = 0.143067e01
-ker_rdryg[36, 14] = 0.118326e01
-ker_rdryg[36, 15] = 0.978431e00
-ker_rdryg[36, 16] = 0.808862e00
-ker_rdryg[36, 17] = 0.668480e00
-ker_rdryg[36, 18] = 0.552259e00
-ker_rdryg[36, 19] = 0.456039e00
-ker_rdryg[36, 20] = 0.376376e00
-ker_rdryg[36, 21] = 0.310419e00
-ker_rdryg[36, 22] = 0.255807e00
-ker_rdryg[36, 23] = 0.210587e00
-ker_rdryg[36, 24] = 0.173139e00
-ker_rdryg[36, 25] = 0.142124e00
-ker_rdryg[36, 26] = 0.116433e00
-ker_rdryg[36, 27] = 0.951462e-01
-ker_rdryg[36, 28] = 0.775028e-01
-ker_rdryg[36, 29] = 0.628718e-01
-ker_rdryg[36, 30] = 0.507309e-01
-ker_rdryg[36, 31] = 0.406479e-01
-ker_rdryg[36, 32] = 0.322672e-01
-ker_rdryg[36, 33] = 0.253008e-01
-ker_rdryg[36, 34] = 0.195243e-01
-ker_rdryg[36, 35] = 0.147772e-01
-ker_rdryg[36, 36] = 0.109648e-01
-ker_rdryg[36, 37] = 0.804278e-02
-ker_rdryg[36, 38] = 0.599708e-02
-ker_rdryg[36, 39] = 0.479430e-02
-ker_rdryg[36, 40] = 0.433950e-02
-ker_rdryg[37, 1] = 0.138648e02
-ker_rdryg[37, 2] = 0.114770e02
-ker_rdryg[37, 3] = 0.950025e01
-ker_rdryg[37, 4] = 0.786381e01
-ker_rdryg[37, 5] = 0.650909e01
-ker_rdryg[37, 6] = 0.538759e01
-ker_rdryg[37, 7] = 0.445916e01
-ker_rdryg[37, 8] = 0.369056e01
-ker_rdryg[37, 9] = 0.305428e01
-ker_rdryg[37, 10] = 0.252753e01
-ker_rdryg[37, 11] = 0.209147e01
-ker_rdryg[37, 12] = 0.173047e01
-ker_rdryg[37, 13] = 0.143161e01
-ker_rdryg[37, 14] = 0.118421e01
-ker_rdryg[37, 15] = 0.979386e00
-ker_rdryg[37, 16] = 0.809823e00
-ker_rdryg[37, 17] = 0.669447e00
-ker_rdryg[37, 18] = 0.553232e00
-ker_rdryg[37, 19] = 0.457019e00
-ker_rdryg[37, 20] = 0.377364e00
-ker_rdryg[37, 21] = 0.311415e00
-ker_rdryg[37, 22] = 0.256813e00
-ker_rdryg[37, 23] = 0.211602e00
-ker_rdryg[37, 24] = 0.174166e00
-ker_rdryg[37, 25] = 0.143165e00
-ker_rdryg[37, 26] = 0.117489e00
-ker_rdryg[37, 27] = 0.962203e-01
-ker_rdryg[37, 28] = 0.785973e-01
-ker_rdryg[37, 29] = 0.639902e-01
-ker_rdryg[37, 30] = 0.518768e-01
-ker_rdryg[37, 31] = 0.418245e-01
-ker_rdryg[37, 32] = 0.334758e-01
-ker_rdryg[37, 33] = 0.265367e-01
-ker_rdryg[37, 34] = 0.207701e-01
-ker_rdryg[37, 35] = 0.159926e-01
-ker_rdryg[37, 36] = 0.120751e-01
-ker_rdryg[37, 37] = 0.894122e-02
-ker_rdryg[37, 38] = 0.656445e-02
-ker_rdryg[37, 39] = 0.492634e-02
-ker_rdryg[37, 40] = 0.399357e-02
-ker_rdryg[38, 1] = 0.138656e02
-ker_rdryg[38, 2] = 0.114778e02
-ker_rdryg[38, 3] = 0.950102e01
-ker_rdryg[38, 4] = 0.786459e01
-ker_rdryg[38, 5] = 0.650987e01
-ker_rdryg[38, 6] = 0.538837e01
-ker_rdryg[38, 7] = 0.445994e01
-ker_rdryg[38, 8] = 0.369135e01
-ker_rdryg[38, 9] = 0.305507e01
-ker_rdryg[38, 10] = 0.252833e01
-ker_rdryg[38, 11] = 0.209226e01
-ker_rdryg[38, 12] = 0.173127e01
-ker_rdryg[38, 13] = 0.143242e01
-ker_rdryg[38, 14] = 0.118501e01
-ker_rdryg[38, 15] = 0.980197e00
-ker_rdryg[38, 16] = 0.810638e00
-ker_rdryg[38, 17] = 0.670266e00
-ker_rdryg[38, 18] = 0.554056e00
-ker_rdryg[38, 19] = 0.457849e00
-ker_rdryg[38, 20] = 0.378199e00
-ker_rdryg[38, 21] = 0.312257e00
-ker_rdryg[38, 22] = 0.257661e00
-ker_rdryg[38, 23] = 0.212459e00
-ker_rdryg[38, 24] = 0.175032e00
-ker_rdryg[38, 25] = 0.144040e00
-ker_rdryg[38, 26] = 0.118376e00
-ker_rdryg[38, 27] = 0.971196e-01
-ker_rdryg[38, 28] = 0.795116e-01
-ker_rdryg[38, 29] = 0.649218e-01
-ker_rdryg[38, 30] = 0.528285e-01
-ker_rdryg[38, 31] = 0.427994e-01
-ker_rdryg[38, 32] = 0.344764e-01
-ker_rdryg[38, 33] = 0.275637e-01
-ker_rdryg[38, 34] = 0.218184e-01
-ker_rdryg[38, 35] = 0.170452e-01
-ker_rdryg[38, 36] = 0.130949e-01
-ker_rdryg[38, 37] = 0.986356e-02
-ker_rdryg[38, 38] = 0.729306e-02
-ker_rdryg[38, 39] = 0.536046e-02
-ker_rdryg[38, 40] = 0.405286e-02
-ker_rdryg[39, 1] = 0.138662e02
-ker_rdryg[39, 2] = 0.114784e02
-ker_rdryg[39, 3] = 0.950168e01
-ker_rdryg[39, 4] = 0.786525e01
-ker_rdryg[39, 5] = 0.651053e01
-ker_rdryg[39, 6] = 0.538904e01
-ker_rdryg[39, 7] = 0.446061e01
-ker_rdryg[39, 8] = 0.369202e01
-ker_rdryg[39, 9] = 0.305574e01
-ker_rdryg[39, 10] = 0.252900e01
-ker_rdryg[39, 11] = 0.209294e01
-ker_rdryg[39, 12] = 0.173195e01
-ker_rdryg[39, 13] = 0.143310e01
-ker_rdryg[39, 14] = 0.118570e01
-ker_rdryg[39, 15] = 0.980885e00
-ker_rdryg[39, 16] = 0.811330e00
-ker_rdryg[39, 17] = 0.670961e00
-ker_rdryg[39, 18] = 0.554755e00
-ker_rdryg[39, 19] = 0.458552e00
-ker_rdryg[39, 20] = 0.378906e00
-ker_rdryg[39, 21] = 0.312969e00
-ker_rdryg[39, 22] = 0.258379e00
-ker_rdryg[39, 23] = 0.213182e00
-ker_rdryg[39, 24] = 0.175762e00
-ker_rdryg[39, 25] = 0.144777e00
-ker_rdryg[39, 26] = 0.119121e00
-ker_rdryg[39, 27] = 0.978744e-01
-ker_rdryg[39, 28] = 0.802773e-01
-ker_rdryg[39, 29] = 0.657001e-01
-ker_rdryg[39, 30] = 0.536215e-01
-ker_rdryg[39, 31] = 0.436093e-01
-ker_rdryg[39, 32] = 0.353058e-01
-ker_rdryg[39, 33] = 0.284146e-01
-ker_rdryg[39, 34] = 0.226909e-01
-ker_rdryg[39, 35] = 0.179343e-01
-ker_rdryg[39, 36] = 0.139841e-01
-ker_rdryg[39, 37] = 0.107183e-01
-ker_rdryg[39, 38] = 0.805446e-02
-ker_rdryg[39, 39] = 0.594845e-02
-ker_rdryg[39, 40] = 0.437943e-02
-ker_rdryg[40, 1] = 0.138668e02
-ker_rdryg[40, 2] = 0.114790e02
-ker_rdryg[40, 3] = 0.950225e01
-ker_rdryg[40, 4] = 0.786581e01
-ker_rdryg[40, 5] = 0.651110e01
-ker_rdryg[40, 6] = 0.538960e01
-ker_rdryg[40, 7] = 0.446118e01
-ker_rdryg[40, 8] = 0.369259e01
-ker_rdryg[40, 9] = 0.305631e01
-ker_rdryg[40, 10] = 0.252958e01
-ker_rdryg[40, 11] = 0.209352e01
-ker_rdryg[40, 12] = 0.173253e01
-ker_rdryg[40, 13] = 0.143368e01
-ker_rdryg[40, 14] = 0.118628e01
-ker_rdryg[40, 15] = 0.981470e00
-ker_rdryg[40, 16] = 0.811917e00
-ker_rdryg[40, 17] = 0.671551e00
-ker_rdryg[40, 18] = 0.555348e00
-ker_rdryg[40, 19] = 0.459148e00
-ker_rdryg[40, 20] = 0.379506e00
-ker_rdryg[40, 21] = 0.313572e00
-ker_rdryg[40, 22] = 0.258986e00
-ker_rdryg[40, 23] = 0.213794e00
-ker_rdryg[40, 24] = 0.176378e00
-ker_rdryg[40, 25] = 0.145399e00
-ker_rdryg[40, 26] = 0.119749e00
-ker_rdryg[40, 27] = 0.985094e-01
-ker_rdryg[40, 28] = 0.809202e-01
-ker_rdryg[40, 29] = 0.663522e-01
-ker_rdryg[40, 30] = 0.542842e-01
-ker_rdryg[40, 31] = 0.442844e-01
-ker_rdryg[40, 32] = 0.359952e-01
-ker_rdryg[40, 33] = 0.291205e-01
-ker_rdryg[40, 34] = 0.234148e-01
-ker_rdryg[40, 35] = 0.186756e-01
-ker_rdryg[40, 36] = 0.147376e-01
-ker_rdryg[40, 37] = 0.114686e-01
-ker_rdryg[40, 38] = 0.876977e-02
-ker_rdryg[40, 39] = 0.657521e-02
-ker_rdryg[40, 40] = 0.484891e-02
@@ -1,3205 +0,0 @@
-# -*- coding: utf-8 -*-
-import numpy as np
-
-ker_sdryg = np.empty((41, 481))
-
-ker_sdryg[1, 1] = 0.185306e01
-ker_sdryg[1, 2] = 0.166801e01
-ker_sdryg[1, 3] = 0.149854e01
-ker_sdryg[1, 4] = 0.134462e01
-ker_sdryg[1, 5] = 0.120619e01
-ker_sdryg[1, 6] = 0.108309e01
-ker_sdryg[1, 7] = 0.975739e00
-ker_sdryg[1, 8] = 0.883962e00
-ker_sdryg[1, 9] = 0.807898e00
-ker_sdryg[1, 10] = 0.748063e00
-ker_sdryg[1, 11] = 0.704887e00
-ker_sdryg[1, 12] = 0.678484e00
-ker_sdryg[1, 13] = 0.670243e00
-ker_sdryg[1, 14] = 0.680669e00
-ker_sdryg[1, 15] = 0.710449e00
-ker_sdryg[1, 16] = 0.760420e00
-ker_sdryg[1, 17] = 0.829980e00
-ker_sdryg[1, 18] = 0.918211e00
-ker_sdryg[1, 19] = 0.102260e01
-ker_sdryg[1, 20] = 0.113834e01
-ker_sdryg[1, 21] = 0.125954e01
-ker_sdryg[1, 22] = 0.138067e01
-ker_sdryg[1, 23] = 0.149733e01
-ker_sdryg[1, 24] = 0.160649e01
-ker_sdryg[1, 25] = 0.170617e01
-ker_sdryg[1, 26] = 0.179534e01
-ker_sdryg[1, 27] = 0.187393e01
-ker_sdryg[1, 28] = 0.194253e01
-ker_sdryg[1, 29] = 0.200219e01
-ker_sdryg[1, 30] = 0.205413e01
-ker_sdryg[1, 31] = 0.209956e01
-ker_sdryg[1, 32] = 0.213951e01
-ker_sdryg[1, 33] = 0.217487e01
-ker_sdryg[1, 34] = 0.220635e01
-ker_sdryg[1, 35] = 0.223455e01
-ker_sdryg[1, 36] = 0.225995e01
-ker_sdryg[1, 37] = 0.228296e01
-ker_sdryg[1, 38] = 0.230390e01
-ker_sdryg[1, 39] = 0.232304e01
-ker_sdryg[1, 40] = 0.234059e01
-ker_sdryg[1, 41] = 0.235674e01
-ker_sdryg[1, 42] = 0.237165e01
-ker_sdryg[1, 43] = 0.238545e01
-ker_sdryg[1, 44] = 0.239825e01
-ker_sdryg[1, 45] = 0.241013e01
-ker_sdryg[1, 46] = 0.242119e01
-ker_sdryg[1, 47] = 0.243150e01
-ker_sdryg[1, 48] = 0.244112e01
-ker_sdryg[1, 49] = 0.245010e01
-ker_sdryg[1, 50] = 0.245849e01
-ker_sdryg[1, 51] = 0.246634e01
-ker_sdryg[1, 52] = 0.247369e01
-ker_sdryg[1, 53] = 0.248057e01
-ker_sdryg[1, 54] = 0.248702e01
-ker_sdryg[1, 55] = 0.249305e01
-ker_sdryg[1, 56] = 0.249872e01
-ker_sdryg[1, 57] = 0.250402e01
-ker_sdryg[1, 58] = 0.250900e01
-ker_sdryg[1, 59] = 0.251367e01
-ker_sdryg[1, 60] = 0.251805e01
-ker_sdryg[1, 61] = 0.252217e01
-ker_sdryg[1, 62] = 0.252602e01
-ker_sdryg[1, 63] = 0.252964e01
-ker_sdryg[1, 64] = 0.253304e01
-ker_sdryg[1, 65] = 0.253623e01
-ker_sdryg[1, 66] = 0.253923e01
-ker_sdryg[1, 67] = 0.254204e01
-ker_sdryg[1, 68] = 0.254468e01
-ker_sdryg[1, 69] = 0.254715e01
-ker_sdryg[1, 70] = 0.254948e01
-ker_sdryg[1, 71] = 0.255166e01
-ker_sdryg[1, 72] = 0.255371e01
-ker_sdryg[1, 73] = 0.255564e01
-ker_sdryg[1, 74] = 0.255745e01
-ker_sdryg[1, 75] = 0.255914e01
-ker_sdryg[1, 76] = 0.256074e01
-ker_sdryg[1, 77] = 0.256223e01
-ker_sdryg[1, 78] = 0.256364e01
-ker_sdryg[1, 79] = 0.256496e01
-ker_sdryg[1, 80] = 0.256619e01
-ker_sdryg[2, 1] = 0.203397e01
-ker_sdryg[2, 2] = 0.184139e01
-ker_sdryg[2, 3] = 0.166253e01
-ker_sdryg[2, 4] = 0.149734e01
-ker_sdryg[2, 5] = 0.134545e01
-ker_sdryg[2, 6] = 0.120699e01
-ker_sdryg[2, 7] = 0.108196e01
-ker_sdryg[2, 8] = 0.970394e00
-ker_sdryg[2, 9] = 0.872467e00
-ker_sdryg[2, 10] = 0.788381e00
-ker_sdryg[2, 11] = 0.718584e00
-ker_sdryg[2, 12] = 0.663446e00
-ker_sdryg[2, 13] = 0.623736e00
-ker_sdryg[2, 14] = 0.600108e00
-ker_sdryg[2, 15] = 0.593535e00
-ker_sdryg[2, 16] = 0.605004e00
-ker_sdryg[2, 17] = 0.635005e00
-ker_sdryg[2, 18] = 0.683561e00
-ker_sdryg[2, 19] = 0.749784e00
-ker_sdryg[2, 20] = 0.831464e00
-ker_sdryg[2, 21] = 0.925362e00
-ker_sdryg[2, 22] = 0.102652e01
-ker_sdryg[2, 23] = 0.112960e01
-ker_sdryg[2, 24] = 0.122990e01
-ker_sdryg[2, 25] = 0.132422e01
-ker_sdryg[2, 26] = 0.141069e01
-ker_sdryg[2, 27] = 0.148870e01
-ker_sdryg[2, 28] = 0.155812e01
-ker_sdryg[2, 29] = 0.161933e01
-ker_sdryg[2, 30] = 0.167302e01
-ker_sdryg[2, 31] = 0.172003e01
-ker_sdryg[2, 32] = 0.176131e01
-ker_sdryg[2, 33] = 0.179774e01
-ker_sdryg[2, 34] = 0.183007e01
-ker_sdryg[2, 35] = 0.185895e01
-ker_sdryg[2, 36] = 0.188489e01
-ker_sdryg[2, 37] = 0.190831e01
-ker_sdryg[2, 38] = 0.192958e01
-ker_sdryg[2, 39] = 0.194897e01
-ker_sdryg[2, 40] = 0.196672e01
-ker_sdryg[2, 41] = 0.198304e01
-ker_sdryg[2, 42] = 0.199807e01
-ker_sdryg[2, 43] = 0.201197e01
-ker_sdryg[2, 44] = 0.202484e01
-ker_sdryg[2, 45] = 0.203679e01
-ker_sdryg[2, 46] = 0.204790e01
-ker_sdryg[2, 47] = 0.205824e01
-ker_sdryg[2, 48] = 0.206789e01
-ker_sdryg[2, 49] = 0.207689e01
-ker_sdryg[2, 50] = 0.208530e01
-ker_sdryg[2, 51] = 0.209317e01
-ker_sdryg[2, 52] = 0.210053e01
-ker_sdryg[2, 53] = 0.210741e01
-ker_sdryg[2, 54] = 0.211387e01
-ker_sdryg[2, 55] = 0.211991e01
-ker_sdryg[2, 56] = 0.212558e01
-ker_sdryg[2, 57] = 0.213089e01
-ker_sdryg[2, 58] = 0.213587e01
-ker_sdryg[2, 59] = 0.214054e01
-ker_sdryg[2, 60] = 0.214493e01
-ker_sdryg[2, 61] = 0.214904e01
-ker_sdryg[2, 62] = 0.215290e01
-ker_sdryg[2, 63] = 0.215652e01
-ker_sdryg[2, 64] = 0.215992e01
-ker_sdryg[2, 65] = 0.216311e01
-ker_sdryg[2, 66] = 0.216610e01
-ker_sdryg[2, 67] = 0.216891e01
-ker_sdryg[2, 68] = 0.217155e01
-ker_sdryg[2, 69] = 0.217403e01
-ker_sdryg[2, 70] = 0.217636e01
-ker_sdryg[2, 71] = 0.217854e01
-ker_sdryg[2, 72] = 0.218059e01
-ker_sdryg[2, 73] = 0.218252e01
-ker_sdryg[2, 74] = 0.218432e01
-ker_sdryg[2, 75] = 0.218602e01
-ker_sdryg[2, 76] = 0.218761e01
-ker_sdryg[2, 77] = 0.218911e01
-ker_sdryg[2, 78] = 0.219051e01
-ker_sdryg[2, 79] = 0.219183e01
-ker_sdryg[2, 80] = 0.219307e01
-ker_sdryg[3, 1] = 0.219960e01
-ker_sdryg[3, 2] = 0.200376e01
-ker_sdryg[3, 3] = 0.182057e01
-ker_sdryg[3, 4] = 0.164957e01
-ker_sdryg[3, 5] = 0.149045e01
-ker_sdryg[3, 6] = 0.134297e01
-ker_sdryg[3, 7] = 0.120706e01
-ker_sdryg[3, 8] = 0.108261e01
-ker_sdryg[3, 9] = 0.969749e00
-ker_sdryg[3, 10] = 0.868633e00
-ker_sdryg[3, 11] = 0.779309e00
-ker_sdryg[3, 12] = 0.702567e00
-ker_sdryg[3, 13] = 0.638634e00
-ker_sdryg[3, 14] = 0.588095e00
-ker_sdryg[3, 15] = 0.552053e00
-ker_sdryg[3, 16] = 0.531341e00
-ker_sdryg[3, 17] = 0.526715e00
-ker_sdryg[3, 18] = 0.539327e00
-ker_sdryg[3, 19] = 0.569229e00
-ker_sdryg[3, 20] = 0.615927e00
-ker_sdryg[3, 21] = 0.677810e00
-ker_sdryg[3, 22] = 0.751743e00
-ker_sdryg[3, 23] = 0.834002e00
-ker_sdryg[3, 24] = 0.920162e00
-ker_sdryg[3, 25] = 0.100577e01
-ker_sdryg[3, 26] = 0.108725e01
-ker_sdryg[3, 27] = 0.116248e01
-ker_sdryg[3, 28] = 0.123064e01
-ker_sdryg[3, 29] = 0.129168e01
-ker_sdryg[3, 30] = 0.134598e01
-ker_sdryg[3, 31] = 0.139406e01
-ker_sdryg[3, 32] = 0.143653e01
-ker_sdryg[3, 33] = 0.147406e01
-ker_sdryg[3, 34] = 0.150732e01
-ker_sdryg[3, 35] = 0.153694e01
-ker_sdryg[3, 36] = 0.156346e01
-ker_sdryg[3, 37] = 0.158735e01
-ker_sdryg[3, 38] = 0.160898e01
-ker_sdryg[3, 39] = 0.162866e01
-ker_sdryg[3, 40] = 0.164664e01
-ker_sdryg[3, 41] = 0.166312e01
-ker_sdryg[3, 42] = 0.167830e01
-ker_sdryg[3, 43] = 0.169230e01
-ker_sdryg[3, 44] = 0.170526e01
-ker_sdryg[3, 45] = 0.171727e01
-ker_sdryg[3, 46] = 0.172843e01
-ker_sdryg[3, 47] = 0.173882e01
-ker_sdryg[3, 48] = 0.174850e01
-ker_sdryg[3, 49] = 0.175753e01
-ker_sdryg[3, 50] = 0.176596e01
-ker_sdryg[3, 51] = 0.177384e01
-ker_sdryg[3, 52] = 0.178121e01
-ker_sdryg[3, 53] = 0.178811e01
-ker_sdryg[3, 54] = 0.179457e01
-ker_sdryg[3, 55] = 0.180062e01
-ker_sdryg[3, 56] = 0.180629e01
-ker_sdryg[3, 57] = 0.181160e01
-ker_sdryg[3, 58] = 0.181659e01
-ker_sdryg[3, 59] = 0.182126e01
-ker_sdryg[3, 60] = 0.182565e01
-ker_sdryg[3, 61] = 0.182976e01
-ker_sdryg[3, 62] = 0.183362e01
-ker_sdryg[3, 63] = 0.183725e01
-ker_sdryg[3, 64] = 0.184065e01
-ker_sdryg[3, 65] = 0.184384e01
-ker_sdryg[3, 66] = 0.184683e01
-ker_sdryg[3, 67] = 0.184964e01
-ker_sdryg[3, 68] = 0.185228e01
-ker_sdryg[3, 69] = 0.185476e01
-ker_sdryg[3, 70] = 0.185709e01
-ker_sdryg[3, 71] = 0.185927e01
-ker_sdryg[3, 72] = 0.186132e01
-ker_sdryg[3, 73] = 0.186325e01
-ker_sdryg[3, 74] = 0.186505e01
-ker_sdryg[3, 75] = 0.186675e01
-ker_sdryg[3, 76] = 0.186834e01
-ker_sdryg[3, 77] = 0.186984e01
-ker_sdryg[3, 78] = 0.187124e01
-ker_sdryg[3, 79] = 0.187256e01
-ker_sdryg[3, 80] = 0.187380e01
-ker_sdryg[4, 1] = 0.234554e01
-ker_sdryg[4, 2] = 0.214868e01
-ker_sdryg[4, 3] = 0.196393e01
-ker_sdryg[4, 4] = 0.179065e01
-ker_sdryg[4, 5] = 0.162831e01
-ker_sdryg[4, 6] = 0.147653e01
-ker_sdryg[4, 7] = 0.133498e01
-ker_sdryg[4, 8] = 0.120339e01
-ker_sdryg[4, 9] = 0.108174e01
-ker_sdryg[4, 10] = 0.969881e00
-ker_sdryg[4, 11] = 0.868067e00
-ker_sdryg[4, 12] = 0.776438e00
-ker_sdryg[4, 13] = 0.695367e00
-ker_sdryg[4, 14] = 0.625282e00
-ker_sdryg[4, 15] = 0.566838e00
-ker_sdryg[4, 16] = 0.521003e00
-ker_sdryg[4, 17] = 0.488550e00
-ker_sdryg[4, 18] = 0.470631e00
-ker_sdryg[4, 19] = 0.468163e00
-ker_sdryg[4, 20] = 0.481689e00
-ker_sdryg[4, 21] = 0.511098e00
-ker_sdryg[4, 22] = 0.555153e00
-ker_sdryg[4, 23] = 0.611456e00
-ker_sdryg[4, 24] = 0.676720e00
-ker_sdryg[4, 25] = 0.747017e00
-ker_sdryg[4, 26] = 0.818743e00
-ker_sdryg[4, 27] = 0.888470e00
-ker_sdryg[4, 28] = 0.953813e00
-ker_sdryg[4, 29] = 0.101352e01
-ker_sdryg[4, 30] = 0.106728e01
-ker_sdryg[4, 31] = 0.111531e01
-ker_sdryg[4, 32] = 0.115816e01
-ker_sdryg[4, 33] = 0.119634e01
-ker_sdryg[4, 34] = 0.123037e01
-ker_sdryg[4, 35] = 0.126073e01
-ker_sdryg[4, 36] = 0.128788e01
-ker_sdryg[4, 37] = 0.131229e01
-ker_sdryg[4, 38] = 0.133432e01
-ker_sdryg[4, 39] = 0.135431e01
-ker_sdryg[4, 40] = 0.137254e01
-ker_sdryg[4, 41] = 0.138922e01
-ker_sdryg[4, 42] = 0.140455e01
-ker_sdryg[4, 43] = 0.141867e01
-ker_sdryg[4, 44] = 0.143172e01
-ker_sdryg[4, 45] = 0.144381e01
-ker_sdryg[4, 46] = 0.145503e01
-ker_sdryg[4, 47] = 0.146546e01
-ker_sdryg[4, 48] = 0.147517e01
-ker_sdryg[4, 49] = 0.148423e01
-ker_sdryg[4, 50] = 0.149268e01
-ker_sdryg[4, 51] = 0.150058e01
-ker_sdryg[4, 52] = 0.150797e01
-ker_sdryg[4, 53] = 0.151488e01
-ker_sdryg[4, 54] = 0.152134e01
-ker_sdryg[4, 55] = 0.152740e01
-ker_sdryg[4, 56] = 0.153308e01
-ker_sdryg[4, 57] = 0.153840e01
-ker_sdryg[4, 58] = 0.154339e01
-ker_sdryg[4, 59] = 0.154806e01
-ker_sdryg[4, 60] = 0.155245e01
-ker_sdryg[4, 61] = 0.155657e01
-ker_sdryg[4, 62] = 0.156043e01
-ker_sdryg[4, 63] = 0.156405e01
-ker_sdryg[4, 64] = 0.156745e01
-ker_sdryg[4, 65] = 0.157064e01
-ker_sdryg[4, 66] = 0.157364e01
-ker_sdryg[4, 67] = 0.157645e01
-ker_sdryg[4, 68] = 0.157909e01
-ker_sdryg[4, 69] = 0.158157e01
-ker_sdryg[4, 70] = 0.158389e01
-ker_sdryg[4, 71] = 0.158608e01
-ker_sdryg[4, 72] = 0.158813e01
-ker_sdryg[4, 73] = 0.159005e01
-ker_sdryg[4, 74] = 0.159186e01
-ker_sdryg[4, 75] = 0.159356e01
-ker_sdryg[4, 76] = 0.159515e01
-ker_sdryg[4, 77] = 0.159665e01
-ker_sdryg[4, 78] = 0.159805e01
-ker_sdryg[4, 79] = 0.159937e01
-ker_sdryg[4, 80] = 0.160061e01
-ker_sdryg[5, 1] = 0.247163e01
-ker_sdryg[5, 2] = 0.227466e01
-ker_sdryg[5, 3] = 0.208958e01
-ker_sdryg[5, 4] = 0.191571e01
-ker_sdryg[5, 5] = 0.175239e01
-ker_sdryg[5, 6] = 0.159906e01
-ker_sdryg[5, 7] = 0.145522e01
-ker_sdryg[5, 8] = 0.132049e01
-ker_sdryg[5, 9] = 0.119453e01
-ker_sdryg[5, 10] = 0.107714e01
-ker_sdryg[5, 11] = 0.968196e00
-ker_sdryg[5, 12] = 0.867771e00
-ker_sdryg[5, 13] = 0.775878e00
-ker_sdryg[5, 14] = 0.692883e00
-ker_sdryg[5, 15] = 0.619198e00
-ker_sdryg[5, 16] = 0.555232e00
-ker_sdryg[5, 17] = 0.502129e00
-ker_sdryg[5, 18] = 0.460636e00
-ker_sdryg[5, 19] = 0.431732e00
-ker_sdryg[5, 20] = 0.416649e00
-ker_sdryg[5, 21] = 0.416143e00
-ker_sdryg[5, 22] = 0.430263e00
-ker_sdryg[5, 23] = 0.458530e00
-ker_sdryg[5, 24] = 0.499025e00
-ker_sdryg[5, 25] = 0.549068e00
-ker_sdryg[5, 26] = 0.605236e00
-ker_sdryg[5, 27] = 0.664063e00
-ker_sdryg[5, 28] = 0.722681e00
-ker_sdryg[5, 29] = 0.778798e00
-ker_sdryg[5, 30] = 0.830925e00
-ker_sdryg[5, 31] = 0.878310e00
-ker_sdryg[5, 32] = 0.920907e00
-ker_sdryg[5, 33] = 0.959072e00
-ker_sdryg[5, 34] = 0.993274e00
-ker_sdryg[5, 35] = 0.102398e01
-ker_sdryg[5, 36] = 0.105160e01
-ker_sdryg[5, 37] = 0.107647e01
-ker_sdryg[5, 38] = 0.109893e01
-ker_sdryg[5, 39] = 0.111927e01
-ker_sdryg[5, 40] = 0.113777e01
-ker_sdryg[5, 41] = 0.115467e01
-ker_sdryg[5, 42] = 0.117017e01
-ker_sdryg[5, 43] = 0.118442e01
-ker_sdryg[5, 44] = 0.119758e01
-ker_sdryg[5, 45] = 0.120975e01
-ker_sdryg[5, 46] = 0.122103e01
-ker_sdryg[5, 47] = 0.123151e01
-ker_sdryg[5, 48] = 0.124127e01
-ker_sdryg[5, 49] = 0.125035e01
-ker_sdryg[5, 50] = 0.125883e01
-ker_sdryg[5, 51] = 0.126675e01
-ker_sdryg[5, 52] = 0.127415e01
-ker_sdryg[5, 53] = 0.128107e01
-ker_sdryg[5, 54] = 0.128755e01
-ker_sdryg[5, 55] = 0.129361e01
-ker_sdryg[5, 56] = 0.129929e01
-ker_sdryg[5, 57] = 0.130462e01
-ker_sdryg[5, 58] = 0.130961e01
-ker_sdryg[5, 59] = 0.131429e01
-ker_sdryg[5, 60] = 0.131868e01
-ker_sdryg[5, 61] = 0.132280e01
-ker_sdryg[5, 62] = 0.132666e01
-ker_sdryg[5, 63] = 0.133028e01
-ker_sdryg[5, 64] = 0.133369e01
-ker_sdryg[5, 65] = 0.133688e01
-ker_sdryg[5, 66] = 0.133987e01
-ker_sdryg[5, 67] = 0.134269e01
-ker_sdryg[5, 68] = 0.134533e01
-ker_sdryg[5, 69] = 0.134781e01
-ker_sdryg[5, 70] = 0.135013e01
-ker_sdryg[5, 71] = 0.135232e01
-ker_sdryg[5, 72] = 0.135437e01
-ker_sdryg[5, 73] = 0.135629e01
-ker_sdryg[5, 74] = 0.135810e01
-ker_sdryg[5, 75] = 0.135980e01
-ker_sdryg[5, 76] = 0.136139e01
-ker_sdryg[5, 77] = 0.136289e01
-ker_sdryg[5, 78] = 0.136429e01
-ker_sdryg[5, 79] = 0.136561e01
-ker_sdryg[5, 80] = 0.136685e01
-ker_sdryg[6, 1] = 0.257972e01
-ker_sdryg[6, 2] = 0.238286e01
-ker_sdryg[6, 3] = 0.219787e01
-ker_sdryg[6, 4] = 0.202403e01
-ker_sdryg[6, 5] = 0.186062e01
-ker_sdryg[6, 6] = 0.170702e01
-ker_sdryg[6, 7] = 0.156262e01
-ker_sdryg[6, 8] = 0.142692e01
-ker_sdryg[6, 9] = 0.129944e01
-ker_sdryg[6, 10] = 0.117979e01
-ker_sdryg[6, 11] = 0.106768e01
-ker_sdryg[6, 12] = 0.962918e00
-ker_sdryg[6, 13] = 0.865347e00
-ker_sdryg[6, 14] = 0.775045e00
-ker_sdryg[6, 15] = 0.692083e00
-ker_sdryg[6, 16] = 0.616878e00
-ker_sdryg[6, 17] = 0.549875e00
-ker_sdryg[6, 18] = 0.491835e00
-ker_sdryg[6, 19] = 0.443555e00
-ker_sdryg[6, 20] = 0.406127e00
-ker_sdryg[6, 21] = 0.380824e00
-ker_sdryg[6, 22] = 0.368387e00
-ker_sdryg[6, 23] = 0.369445e00
-ker_sdryg[6, 24] = 0.383806e00
-ker_sdryg[6, 25] = 0.410216e00
-ker_sdryg[6, 26] = 0.446510e00
-ker_sdryg[6, 27] = 0.489828e00
-ker_sdryg[6, 28] = 0.537058e00
-ker_sdryg[6, 29] = 0.585473e00
-ker_sdryg[6, 30] = 0.632833e00
-ker_sdryg[6, 31] = 0.677778e00
-ker_sdryg[6, 32] = 0.719331e00
-ker_sdryg[6, 33] = 0.757120e00
-ker_sdryg[6, 34] = 0.791204e00
-ker_sdryg[6, 35] = 0.821879e00
-ker_sdryg[6, 36] = 0.849531e00
-ker_sdryg[6, 37] = 0.874550e00
-ker_sdryg[6, 38] = 0.897242e00
-ker_sdryg[6, 39] = 0.917866e00
-ker_sdryg[6, 40] = 0.936642e00
-ker_sdryg[6, 41] = 0.953775e00
-ker_sdryg[6, 42] = 0.969458e00
-ker_sdryg[6, 43] = 0.983861e00
-ker_sdryg[6, 44] = 0.997132e00
-ker_sdryg[6, 45] = 0.100939e01
-ker_sdryg[6, 46] = 0.102075e01
-ker_sdryg[6, 47] = 0.103128e01
-ker_sdryg[6, 48] = 0.104108e01
-ker_sdryg[6, 49] = 0.105020e01
-ker_sdryg[6, 50] = 0.105871e01
-ker_sdryg[6, 51] = 0.106665e01
-ker_sdryg[6, 52] = 0.107406e01
-ker_sdryg[6, 53] = 0.108100e01
-ker_sdryg[6, 54] = 0.108749e01
-ker_sdryg[6, 55] = 0.109356e01
-ker_sdryg[6, 56] = 0.109925e01
-ker_sdryg[6, 57] = 0.110458e01
-ker_sdryg[6, 58] = 0.110957e01
-ker_sdryg[6, 59] = 0.111425e01
-ker_sdryg[6, 60] = 0.111865e01
-ker_sdryg[6, 61] = 0.112277e01
-ker_sdryg[6, 62] = 0.112663e01
-ker_sdryg[6, 63] = 0.113026e01
-ker_sdryg[6, 64] = 0.113366e01
-ker_sdryg[6, 65] = 0.113685e01
-ker_sdryg[6, 66] = 0.113985e01
-ker_sdryg[6, 67] = 0.114266e01
-ker_sdryg[6, 68] = 0.114530e01
-ker_sdryg[6, 69] = 0.114778e01
-ker_sdryg[6, 70] = 0.115011e01
-ker_sdryg[6, 71] = 0.115229e01
-ker_sdryg[6, 72] = 0.115434e01
-ker_sdryg[6, 73] = 0.115627e01
-ker_sdryg[6, 74] = 0.115808e01
-ker_sdryg[6, 75] = 0.115977e01
-ker_sdryg[6, 76] = 0.116137e01
-ker_sdryg[6, 77] = 0.116286e01
-ker_sdryg[6, 78] = 0.116427e01
-ker_sdryg[6, 79] = 0.116559e01
-ker_sdryg[6, 80] = 0.116682e01
-ker_sdryg[7, 1] = 0.267216e01
-ker_sdryg[7, 2] = 0.247542e01
-ker_sdryg[7, 3] = 0.229059e01
-ker_sdryg[7, 4] = 0.211690e01
-ker_sdryg[7, 5] = 0.195366e01
-ker_sdryg[7, 6] = 0.180020e01
-ker_sdryg[7, 7] = 0.165590e01
-ker_sdryg[7, 8] = 0.152016e01
-ker_sdryg[7, 9] = 0.139247e01
-ker_sdryg[7, 10] = 0.127232e01
-ker_sdryg[7, 11] = 0.115928e01
-ker_sdryg[7, 12] = 0.105298e01
-ker_sdryg[7, 13] = 0.953147e00
-ker_sdryg[7, 14] = 0.859548e00
-ker_sdryg[7, 15] = 0.772080e00
-ker_sdryg[7, 16] = 0.690795e00
-ker_sdryg[7, 17] = 0.615899e00
-ker_sdryg[7, 18] = 0.547689e00
-ker_sdryg[7, 19] = 0.486803e00
-ker_sdryg[7, 20] = 0.434037e00
-ker_sdryg[7, 21] = 0.390298e00
-ker_sdryg[7, 22] = 0.356884e00
-ker_sdryg[7, 23] = 0.334845e00
-ker_sdryg[7, 24] = 0.324836e00
-ker_sdryg[7, 25] = 0.327158e00
-ker_sdryg[7, 26] = 0.341163e00
-ker_sdryg[7, 27] = 0.365112e00
-ker_sdryg[7, 28] = 0.396807e00
-ker_sdryg[7, 29] = 0.433487e00
-ker_sdryg[7, 30] = 0.472612e00
-ker_sdryg[7, 31] = 0.511994e00
-ker_sdryg[7, 32] = 0.550118e00
-ker_sdryg[7, 33] = 0.586089e00
-ker_sdryg[7, 34] = 0.619363e00
-ker_sdryg[7, 35] = 0.649769e00
-ker_sdryg[7, 36] = 0.677330e00
-ker_sdryg[7, 37] = 0.702279e00
-ker_sdryg[7, 38] = 0.724930e00
-ker_sdryg[7, 39] = 0.745565e00
-ker_sdryg[7, 40] = 0.764428e00
-ker_sdryg[7, 41] = 0.781707e00
-ker_sdryg[7, 42] = 0.797555e00
-ker_sdryg[7, 43] = 0.812112e00
-ker_sdryg[7, 44] = 0.825509e00
-ker_sdryg[7, 45] = 0.837870e00
-ker_sdryg[7, 46] = 0.849304e00
-ker_sdryg[7, 47] = 0.859904e00
-ker_sdryg[7, 48] = 0.869749e00
-ker_sdryg[7, 49] = 0.878910e00
-ker_sdryg[7, 50] = 0.887445e00
-ker_sdryg[7, 51] = 0.895407e00
-ker_sdryg[7, 52] = 0.902841e00
-ker_sdryg[7, 53] = 0.909790e00
-ker_sdryg[7, 54] = 0.916289e00
-ker_sdryg[7, 55] = 0.922371e00
-ker_sdryg[7, 56] = 0.928066e00
-ker_sdryg[7, 57] = 0.933401e00
-ker_sdryg[7, 58] = 0.938401e00
-ker_sdryg[7, 59] = 0.943087e00
-ker_sdryg[7, 60] = 0.947482e00
-ker_sdryg[7, 61] = 0.951603e00
-ker_sdryg[7, 62] = 0.955469e00
-ker_sdryg[7, 63] = 0.959096e00
-ker_sdryg[7, 64] = 0.962500e00
-ker_sdryg[7, 65] = 0.965694e00
-ker_sdryg[7, 66] = 0.968691e00
-ker_sdryg[7, 67] = 0.971504e00
-ker_sdryg[7, 68] = 0.974145e00
-ker_sdryg[7, 69] = 0.976624e00
-ker_sdryg[7, 70] = 0.978951e00
-ker_sdryg[7, 71] = 0.981136e00
-ker_sdryg[7, 72] = 0.983187e00
-ker_sdryg[7, 73] = 0.985112e00
-ker_sdryg[7, 74] = 0.986920e00
-ker_sdryg[7, 75] = 0.988617e00
-ker_sdryg[7, 76] = 0.990211e00
-ker_sdryg[7, 77] = 0.991707e00
-ker_sdryg[7, 78] = 0.993112e00
-ker_sdryg[7, 79] = 0.994431e00
-ker_sdryg[7, 80] = 0.995669e00
-ker_sdryg[8, 1] = 0.275117e01
-ker_sdryg[8, 2] = 0.255454e01
-ker_sdryg[8, 3] = 0.236983e01
-ker_sdryg[8, 4] = 0.219630e01
-ker_sdryg[8, 5] = 0.203323e01
-ker_sdryg[8, 6] = 0.187998e01
-ker_sdryg[8, 7] = 0.173590e01
-ker_sdryg[8, 8] = 0.160040e01
-ker_sdryg[8, 9] = 0.147293e01
-ker_sdryg[8, 10] = 0.135295e01
-ker_sdryg[8, 11] = 0.123996e01
-ker_sdryg[8, 12] = 0.113353e01
-ker_sdryg[8, 13] = 0.103324e01
-ker_sdryg[8, 14] = 0.938726e00
-ker_sdryg[8, 15] = 0.849707e00
-ker_sdryg[8, 16] = 0.765984e00
-ker_sdryg[8, 17] = 0.687490e00
-ker_sdryg[8, 18] = 0.614228e00
-ker_sdryg[8, 19] = 0.546445e00
-ker_sdryg[8, 20] = 0.484521e00
-ker_sdryg[8, 21] = 0.429191e00
-ker_sdryg[8, 22] = 0.381279e00
-ker_sdryg[8, 23] = 0.341954e00
-ker_sdryg[8, 24] = 0.312266e00
-ker_sdryg[8, 25] = 0.293197e00
-ker_sdryg[8, 26] = 0.285436e00
-ker_sdryg[8, 27] = 0.288590e00
-ker_sdryg[8, 28] = 0.301647e00
-ker_sdryg[8, 29] = 0.322883e00
-ker_sdryg[8, 30] = 0.349944e00
-ker_sdryg[8, 31] = 0.380489e00
-ker_sdryg[8, 32] = 0.412492e00
-ker_sdryg[8, 33] = 0.444350e00
-ker_sdryg[8, 34] = 0.475064e00
-ker_sdryg[8, 35] = 0.503980e00
-ker_sdryg[8, 36] = 0.530853e00
-ker_sdryg[8, 37] = 0.555542e00
-ker_sdryg[8, 38] = 0.578083e00
-ker_sdryg[8, 39] = 0.598637e00
-ker_sdryg[8, 40] = 0.617414e00
-ker_sdryg[8, 41] = 0.634627e00
-ker_sdryg[8, 42] = 0.650467e00
-ker_sdryg[8, 43] = 0.665074e00
-ker_sdryg[8, 44] = 0.678558e00
-ker_sdryg[8, 45] = 0.691015e00
-ker_sdryg[8, 46] = 0.702533e00
-ker_sdryg[8, 47] = 0.713201e00
-ker_sdryg[8, 48] = 0.723101e00
-ker_sdryg[8, 49] = 0.732303e00
-ker_sdryg[8, 50] = 0.740871e00
-ker_sdryg[8, 51] = 0.748859e00
-ker_sdryg[8, 52] = 0.756314e00
-ker_sdryg[8, 53] = 0.763279e00
-ker_sdryg[8, 54] = 0.769790e00
-ker_sdryg[8, 55] = 0.775882e00
-ker_sdryg[8, 56] = 0.781585e00
-ker_sdryg[8, 57] = 0.786926e00
-ker_sdryg[8, 58] = 0.791930e00
-ker_sdryg[8, 59] = 0.796621e00
-ker_sdryg[8, 60] = 0.801018e00
-ker_sdryg[8, 61] = 0.805142e00
-ker_sdryg[8, 62] = 0.809010e00
-ker_sdryg[8, 63] = 0.812638e00
-ker_sdryg[8, 64] = 0.816043e00
-ker_sdryg[8, 65] = 0.819238e00
-ker_sdryg[8, 66] = 0.822236e00
-ker_sdryg[8, 67] = 0.825050e00
-ker_sdryg[8, 68] = 0.827691e00
-ker_sdryg[8, 69] = 0.830170e00
-ker_sdryg[8, 70] = 0.832497e00
-ker_sdryg[8, 71] = 0.834682e00
-ker_sdryg[8, 72] = 0.836733e00
-ker_sdryg[8, 73] = 0.838659e00
-ker_sdryg[8, 74] = 0.840467e00
-ker_sdryg[8, 75] = 0.842164e00
-ker_sdryg[8, 76] = 0.843758e00
-ker_sdryg[8, 77] = 0.845254e00
-ker_sdryg[8, 78] = 0.846659e00
-ker_sdryg[8, 79] = 0.847978e00
-ker_sdryg[8, 80] = 0.849217e00
-ker_sdryg[9, 1] = 0.281873e01
-ker_sdryg[9, 2] = 0.262217e01
-ker_sdryg[9, 3] = 0.243755e01
-ker_sdryg[9, 4] = 0.226413e01
-ker_sdryg[9, 5] = 0.210120e01
-ker_sdryg[9, 6] = 0.194811e01
-ker_sdryg[9, 7] = 0.180423e01
-ker_sdryg[9, 8] = 0.166898e01
-ker_sdryg[9, 9] = 0.154178e01
-ker_sdryg[9, 10] = 0.142211e01
-ker_sdryg[9, 11] = 0.130946e01
-ker_sdryg[9, 12] = 0.120336e01
-ker_sdryg[9, 13] = 0.110334e01
-ker_sdryg[9, 14] = 0.100898e01
-ker_sdryg[9, 15] = 0.919904e00
-ker_sdryg[9, 16] = 0.835767e00
-ker_sdryg[9, 17] = 0.756296e00
-ker_sdryg[9, 18] = 0.681312e00
-ker_sdryg[9, 19] = 0.610704e00
-ker_sdryg[9, 20] = 0.544549e00
-ker_sdryg[9, 21] = 0.483126e00
-ker_sdryg[9, 22] = 0.426903e00
-ker_sdryg[9, 23] = 0.376623e00
-ker_sdryg[9, 24] = 0.333280e00
-ker_sdryg[9, 25] = 0.297980e00
-ker_sdryg[9, 26] = 0.271818e00
-ker_sdryg[9, 27] = 0.255645e00
-ker_sdryg[9, 28] = 0.249649e00
-ker_sdryg[9, 29] = 0.253211e00
-ker_sdryg[9, 30] = 0.265062e00
-ker_sdryg[9, 31] = 0.283396e00
-ker_sdryg[9, 32] = 0.306054e00
-ker_sdryg[9, 33] = 0.331204e00
-ker_sdryg[9, 34] = 0.357250e00
-ker_sdryg[9, 35] = 0.383076e00
-ker_sdryg[9, 36] = 0.407898e00
-ker_sdryg[9, 37] = 0.431335e00
-ker_sdryg[9, 38] = 0.453229e00
-ker_sdryg[9, 39] = 0.473481e00
-ker_sdryg[9, 40] = 0.492133e00
-ker_sdryg[9, 41] = 0.509252e00
-ker_sdryg[9, 42] = 0.524980e00
-ker_sdryg[9, 43] = 0.539487e00
-ker_sdryg[9, 44] = 0.552905e00
-ker_sdryg[9, 45] = 0.565346e00
-ker_sdryg[9, 46] = 0.576895e00
-ker_sdryg[9, 47] = 0.587615e00
-ker_sdryg[9, 48] = 0.597569e00
-ker_sdryg[9, 49] = 0.606817e00
-ker_sdryg[9, 50] = 0.615422e00
-ker_sdryg[9, 51] = 0.623439e00
-ker_sdryg[9, 52] = 0.630916e00
-ker_sdryg[9, 53] = 0.637899e00
-ker_sdryg[9, 54] = 0.644424e00
-ker_sdryg[9, 55] = 0.650527e00
-ker_sdryg[9, 56] = 0.656238e00
-ker_sdryg[9, 57] = 0.661586e00
-ker_sdryg[9, 58] = 0.666595e00
-ker_sdryg[9, 59] = 0.671290e00
-ker_sdryg[9, 60] = 0.675690e00
-ker_sdryg[9, 61] = 0.679817e00
-ker_sdryg[9, 62] = 0.683687e00
-ker_sdryg[9, 63] = 0.687317e00
-ker_sdryg[9, 64] = 0.690723e00
-ker_sdryg[9, 65] = 0.693918e00
-ker_sdryg[9, 66] = 0.696917e00
-ker_sdryg[9, 67] = 0.699732e00
-ker_sdryg[9, 68] = 0.702374e00
-ker_sdryg[9, 69] = 0.704853e00
-ker_sdryg[9, 70] = 0.707181e00
-ker_sdryg[9, 71] = 0.709366e00
-ker_sdryg[9, 72] = 0.711417e00
-ker_sdryg[9, 73] = 0.713343e00
-ker_sdryg[9, 74] = 0.715151e00
-ker_sdryg[9, 75] = 0.716848e00
-ker_sdryg[9, 76] = 0.718442e00
-ker_sdryg[9, 77] = 0.719938e00
-ker_sdryg[9, 78] = 0.721343e00
-ker_sdryg[9, 79] = 0.722663e00
-ker_sdryg[9, 80] = 0.723901e00
-ker_sdryg[10, 1] = 0.287649e01
-ker_sdryg[10, 2] = 0.267999e01
-ker_sdryg[10, 3] = 0.249543e01
-ker_sdryg[10, 4] = 0.232209e01
-ker_sdryg[10, 5] = 0.215926e01
-ker_sdryg[10, 6] = 0.200629e01
-ker_sdryg[10, 7] = 0.186256e01
-ker_sdryg[10, 8] = 0.172749e01
-ker_sdryg[10, 9] = 0.160052e01
-ker_sdryg[10, 10] = 0.148113e01
-ker_sdryg[10, 11] = 0.136880e01
-ker_sdryg[10, 12] = 0.126307e01
-ker_sdryg[10, 13] = 0.116348e01
-ker_sdryg[10, 14] = 0.106958e01
-ker_sdryg[10, 15] = 0.980970e00
-ker_sdryg[10, 16] = 0.897241e00
-ker_sdryg[10, 17] = 0.818035e00
-ker_sdryg[10, 18] = 0.743029e00
-ker_sdryg[10, 19] = 0.671957e00
-ker_sdryg[10, 20] = 0.604628e00
-ker_sdryg[10, 21] = 0.540973e00
-ker_sdryg[10, 22] = 0.481134e00
-ker_sdryg[10, 23] = 0.425371e00
-ker_sdryg[10, 24] = 0.374261e00
-ker_sdryg[10, 25] = 0.328628e00
-ker_sdryg[10, 26] = 0.289572e00
-ker_sdryg[10, 27] = 0.258117e00
-ker_sdryg[10, 28] = 0.235368e00
-ker_sdryg[10, 29] = 0.221755e00
-ker_sdryg[10, 30] = 0.217136e00
-ker_sdryg[10, 31] = 0.220856e00
-ker_sdryg[10, 32] = 0.231296e00
-ker_sdryg[10, 33] = 0.246745e00
-ker_sdryg[10, 34] = 0.265573e00
-ker_sdryg[10, 35] = 0.286164e00
-ker_sdryg[10, 36] = 0.307344e00
-ker_sdryg[10, 37] = 0.328309e00
-ker_sdryg[10, 38] = 0.348513e00
-ker_sdryg[10, 39] = 0.367687e00
-ker_sdryg[10, 40] = 0.385687e00
-ker_sdryg[10, 41] = 0.402481e00
-ker_sdryg[10, 42] = 0.418056e00
-ker_sdryg[10, 43] = 0.432452e00
-ker_sdryg[10, 44] = 0.445760e00
-ker_sdryg[10, 45] = 0.458086e00
-ker_sdryg[10, 46] = 0.469537e00
-ker_sdryg[10, 47] = 0.480201e00
-ker_sdryg[10, 48] = 0.490143e00
-ker_sdryg[10, 49] = 0.499411e00
-ker_sdryg[10, 50] = 0.508047e00
-ker_sdryg[10, 51] = 0.516093e00
-ker_sdryg[10, 52] = 0.523596e00
-ker_sdryg[10, 53] = 0.530598e00
-ker_sdryg[10, 54] = 0.537139e00
-ker_sdryg[10, 55] = 0.543253e00
-ker_sdryg[10, 56] = 0.548974e00
-ker_sdryg[10, 57] = 0.554329e00
-ker_sdryg[10, 58] = 0.559345e00
-ker_sdryg[10, 59] = 0.564044e00
-ker_sdryg[10, 60] = 0.568448e00
-ker_sdryg[10, 61] = 0.572577e00
-ker_sdryg[10, 62] = 0.576449e00
-ker_sdryg[10, 63] = 0.580081e00
-ker_sdryg[10, 64] = 0.583488e00
-ker_sdryg[10, 65] = 0.586685e00
-ker_sdryg[10, 66] = 0.589685e00
-ker_sdryg[10, 67] = 0.592500e00
-ker_sdryg[10, 68] = 0.595142e00
-ker_sdryg[10, 69] = 0.597623e00
-ker_sdryg[10, 70] = 0.599950e00
-ker_sdryg[10, 71] = 0.602136e00
-ker_sdryg[10, 72] = 0.604187e00
-ker_sdryg[10, 73] = 0.606113e00
-ker_sdryg[10, 74] = 0.607921e00
-ker_sdryg[10, 75] = 0.609619e00
-ker_sdryg[10, 76] = 0.611213e00
-ker_sdryg[10, 77] = 0.612709e00
-ker_sdryg[10, 78] = 0.614114e00
-ker_sdryg[10, 79] = 0.615433e00
-ker_sdryg[10, 80] = 0.616672e00
-ker_sdryg[11, 1] = 0.292588e01
-ker_sdryg[11, 2] = 0.272942e01
-ker_sdryg[11, 3] = 0.254491e01
-ker_sdryg[11, 4] = 0.237162e01
-ker_sdryg[11, 5] = 0.220887e01
-ker_sdryg[11, 6] = 0.205599e01
-ker_sdryg[11, 7] = 0.191237e01
-ker_sdryg[11, 8] = 0.177743e01
-ker_sdryg[11, 9] = 0.165062e01
-ker_sdryg[11, 10] = 0.153143e01
-ker_sdryg[11, 11] = 0.141936e01
-ker_sdryg[11, 12] = 0.131393e01
-ker_sdryg[11, 13] = 0.121471e01
-ker_sdryg[11, 14] = 0.112125e01
-ker_sdryg[11, 15] = 0.103314e01
-ker_sdryg[11, 16] = 0.949992e00
-ker_sdryg[11, 17] = 0.871403e00
-ker_sdryg[11, 18] = 0.797011e00
-ker_sdryg[11, 19] = 0.726472e00
-ker_sdryg[11, 20] = 0.659472e00
-ker_sdryg[11, 21] = 0.595759e00
-ker_sdryg[11, 22] = 0.535173e00
-ker_sdryg[11, 23] = 0.477686e00
-ker_sdryg[11, 24] = 0.423410e00
-ker_sdryg[11, 25] = 0.372735e00
-ker_sdryg[11, 26] = 0.326343e00
-ker_sdryg[11, 27] = 0.285079e00
-ker_sdryg[11, 28] = 0.250073e00
-ker_sdryg[11, 29] = 0.222370e00
-ker_sdryg[11, 30] = 0.202694e00
-ker_sdryg[11, 31] = 0.191356e00
-ker_sdryg[11, 32] = 0.187944e00
-ker_sdryg[11, 33] = 0.191428e00
-ker_sdryg[11, 34] = 0.200384e00
-ker_sdryg[11, 35] = 0.213284e00
-ker_sdryg[11, 36] = 0.228761e00
-ker_sdryg[11, 37] = 0.245555e00
-ker_sdryg[11, 38] = 0.262820e00
-ker_sdryg[11, 39] = 0.279947e00
-ker_sdryg[11, 40] = 0.296552e00
-ker_sdryg[11, 41] = 0.312363e00
-ker_sdryg[11, 42] = 0.327309e00
-ker_sdryg[11, 43] = 0.341353e00
-ker_sdryg[11, 44] = 0.354467e00
-ker_sdryg[11, 45] = 0.366682e00
-ker_sdryg[11, 46] = 0.378026e00
-ker_sdryg[11, 47] = 0.388571e00
-ker_sdryg[11, 48] = 0.398407e00
-ker_sdryg[11, 49] = 0.407595e00
-ker_sdryg[11, 50] = 0.416190e00
-ker_sdryg[11, 51] = 0.424231e00
-ker_sdryg[11, 52] = 0.431746e00
-ker_sdryg[11, 53] = 0.438766e00
-ker_sdryg[11, 54] = 0.445323e00
-ker_sdryg[11, 55] = 0.451452e00
-ker_sdryg[11, 56] = 0.457183e00
-ker_sdryg[11, 57] = 0.462546e00
-ker_sdryg[11, 58] = 0.467568e00
-ker_sdryg[11, 59] = 0.472272e00
-ker_sdryg[11, 60] = 0.476681e00
-ker_sdryg[11, 61] = 0.480813e00
-ker_sdryg[11, 62] = 0.484687e00
-ker_sdryg[11, 63] = 0.488321e00
-ker_sdryg[11, 64] = 0.491730e00
-ker_sdryg[11, 65] = 0.494928e00
-ker_sdryg[11, 66] = 0.497929e00
-ker_sdryg[11, 67] = 0.500745e00
-ker_sdryg[11, 68] = 0.503387e00
-ker_sdryg[11, 69] = 0.505868e00
-ker_sdryg[11, 70] = 0.508196e00
-ker_sdryg[11, 71] = 0.510382e00
-ker_sdryg[11, 72] = 0.512433e00
-ker_sdryg[11, 73] = 0.514360e00
-ker_sdryg[11, 74] = 0.516168e00
-ker_sdryg[11, 75] = 0.517866e00
-ker_sdryg[11, 76] = 0.519459e00
-ker_sdryg[11, 77] = 0.520956e00
-ker_sdryg[11, 78] = 0.522361e00
-ker_sdryg[11, 79] = 0.523680e00
-ker_sdryg[11, 80] = 0.524919e00
-ker_sdryg[12, 1] = 0.296813e01
-ker_sdryg[12, 2] = 0.277169e01
-ker_sdryg[12, 3] = 0.258722e01
-ker_sdryg[12, 4] = 0.241397e01
-ker_sdryg[12, 5] = 0.225126e01
-ker_sdryg[12, 6] = 0.209845e01
-ker_sdryg[12, 7] = 0.195490e01
-ker_sdryg[12, 8] = 0.182006e01
-ker_sdryg[12, 9] = 0.169337e01
-ker_sdryg[12, 10] = 0.157433e01
-ker_sdryg[12, 11] = 0.146243e01
-ker_sdryg[12, 12] = 0.135723e01
-ker_sdryg[12, 13] = 0.125828e01
-ker_sdryg[12, 14] = 0.116516e01
-ker_sdryg[12, 15] = 0.107747e01
-ker_sdryg[12, 16] = 0.994807e00
-ker_sdryg[12, 17] = 0.916807e00
-ker_sdryg[12, 18] = 0.843095e00
-ker_sdryg[12, 19] = 0.773314e00
-ker_sdryg[12, 20] = 0.707116e00
-ker_sdryg[12, 21] = 0.644174e00
-ker_sdryg[12, 22] = 0.584199e00
-ker_sdryg[12, 23] = 0.526949e00
-ker_sdryg[12, 24] = 0.472291e00
-ker_sdryg[12, 25] = 0.420211e00
-ker_sdryg[12, 26] = 0.370902e00
-ker_sdryg[12, 27] = 0.324892e00
-ker_sdryg[12, 28] = 0.282842e00
-ker_sdryg[12, 29] = 0.245728e00
-ker_sdryg[12, 30] = 0.214626e00
-ker_sdryg[12, 31] = 0.190466e00
-ker_sdryg[12, 32] = 0.173675e00
-ker_sdryg[12, 33] = 0.164353e00
-ker_sdryg[12, 34] = 0.161777e00
-ker_sdryg[12, 35] = 0.164848e00
-ker_sdryg[12, 36] = 0.172447e00
-ker_sdryg[12, 37] = 0.183108e00
-ker_sdryg[12, 38] = 0.195737e00
-ker_sdryg[12, 39] = 0.209501e00
-ker_sdryg[12, 40] = 0.223654e00
-ker_sdryg[12, 41] = 0.237731e00
-ker_sdryg[12, 42] = 0.251446e00
-ker_sdryg[12, 43] = 0.264605e00
-ker_sdryg[12, 44] = 0.277116e00
-ker_sdryg[12, 45] = 0.288946e00
-ker_sdryg[12, 46] = 0.300077e00
-ker_sdryg[12, 47] = 0.310498e00
-ker_sdryg[12, 48] = 0.320228e00
-ker_sdryg[12, 49] = 0.329310e00
-ker_sdryg[12, 50] = 0.337797e00
-ker_sdryg[12, 51] = 0.345746e00
-ker_sdryg[12, 52] = 0.353202e00
-ker_sdryg[12, 53] = 0.360196e00
-ker_sdryg[12, 54] = 0.366751e00
-ker_sdryg[12, 55] = 0.372888e00
-ker_sdryg[12, 56] = 0.378630e00
-ker_sdryg[12, 57] = 0.384002e00
-ker_sdryg[12, 58] = 0.389031e00
-ker_sdryg[12, 59] = 0.393741e00
-ker_sdryg[12, 60] = 0.398154e00
-ker_sdryg[12, 61] = 0.402290e00
-ker_sdryg[12, 62] = 0.406167e00
-ker_sdryg[12, 63] = 0.409803e00
-ker_sdryg[12, 64] = 0.413213e00
-ker_sdryg[12, 65] = 0.416413e00
-ker_sdryg[12, 66] = 0.419414e00
-ker_sdryg[12, 67] = 0.422231e00
-ker_sdryg[12, 68] = 0.424874e00
-ker_sdryg[12, 69] = 0.427355e00
-ker_sdryg[12, 70] = 0.429684e00
-ker_sdryg[12, 71] = 0.431870e00
-ker_sdryg[12, 72] = 0.433922e00
-ker_sdryg[12, 73] = 0.435848e00
-ker_sdryg[12, 74] = 0.437657e00
-ker_sdryg[12, 75] = 0.439355e00
-ker_sdryg[12, 76] = 0.440949e00
-ker_sdryg[12, 77] = 0.442445e00
-ker_sdryg[12, 78] = 0.443850e00
-ker_sdryg[12, 79] = 0.445170e00
-ker_sdryg[12, 80] = 0.446408e00
-ker_sdryg[13, 1] = 0.300426e01
-ker_sdryg[13, 2] = 0.280784e01
-ker_sdryg[13, 3] = 0.262339e01
-ker_sdryg[13, 4] = 0.245018e01
-ker_sdryg[13, 5] = 0.228751e01
-ker_sdryg[13, 6] = 0.213473e01
-ker_sdryg[13, 7] = 0.199125e01
-ker_sdryg[13, 8] = 0.185647e01
-ker_sdryg[13, 9] = 0.172987e01
-ker_sdryg[13, 10] = 0.161093e01
-ker_sdryg[13, 11] = 0.149916e01
-ker_sdryg[13, 12] = 0.139412e01
-ker_sdryg[13, 13] = 0.129536e01
-ker_sdryg[13, 14] = 0.120249e01
-ker_sdryg[13, 15] = 0.111509e01
-ker_sdryg[13, 16] = 0.103280e01
-ker_sdryg[13, 17] = 0.955258e00
-ker_sdryg[13, 18] = 0.882099e00
-ker_sdryg[13, 19] = 0.812980e00
-ker_sdryg[13, 20] = 0.747559e00
-ker_sdryg[13, 21] = 0.685504e00
-ker_sdryg[13, 22] = 0.626487e00
-ker_sdryg[13, 23] = 0.570200e00
-ker_sdryg[13, 24] = 0.516370e00
-ker_sdryg[13, 25] = 0.464781e00
-ker_sdryg[13, 26] = 0.415330e00
-ker_sdryg[13, 27] = 0.368082e00
-ker_sdryg[13, 28] = 0.323329e00
-ker_sdryg[13, 29] = 0.281592e00
-ker_sdryg[13, 30] = 0.243675e00
-ker_sdryg[13, 31] = 0.210623e00
-ker_sdryg[13, 32] = 0.183280e00
-ker_sdryg[13, 33] = 0.162430e00
-ker_sdryg[13, 34] = 0.148317e00
-ker_sdryg[13, 35] = 0.140602e00
-ker_sdryg[13, 36] = 0.138606e00
-ker_sdryg[13, 37] = 0.141294e00
-ker_sdryg[13, 38] = 0.147531e00
-ker_sdryg[13, 39] = 0.156269e00
-ker_sdryg[13, 40] = 0.166597e00
-ker_sdryg[13, 41] = 0.177865e00
-ker_sdryg[13, 42] = 0.189495e00
-ker_sdryg[13, 43] = 0.201132e00
-ker_sdryg[13, 44] = 0.212557e00
-ker_sdryg[13, 45] = 0.223599e00
-ker_sdryg[13, 46] = 0.234145e00
-ker_sdryg[13, 47] = 0.244174e00
-ker_sdryg[13, 48] = 0.253668e00
-ker_sdryg[13, 49] = 0.262605e00
-ker_sdryg[13, 50] = 0.270996e00
-ker_sdryg[13, 51] = 0.278849e00
-ker_sdryg[13, 52] = 0.286203e00
-ker_sdryg[13, 53] = 0.293107e00
-ker_sdryg[13, 54] = 0.299592e00
-ker_sdryg[13, 55] = 0.305689e00
-ker_sdryg[13, 56] = 0.311416e00
-ker_sdryg[13, 57] = 0.316789e00
-ker_sdryg[13, 58] = 0.321824e00
-ker_sdryg[13, 59] = 0.326539e00
-ker_sdryg[13, 60] = 0.330957e00
-ker_sdryg[13, 61] = 0.335096e00
-ker_sdryg[13, 62] = 0.338977e00
-ker_sdryg[13, 63] = 0.342615e00
-ker_sdryg[13, 64] = 0.346027e00
-ker_sdryg[13, 65] = 0.349228e00
-ker_sdryg[13, 66] = 0.352231e00
-ker_sdryg[13, 67] = 0.355048e00
-ker_sdryg[13, 68] = 0.357693e00
-ker_sdryg[13, 69] = 0.360174e00
-ker_sdryg[13, 70] = 0.362503e00
-ker_sdryg[13, 71] = 0.364689e00
-ker_sdryg[13, 72] = 0.366742e00
-ker_sdryg[13, 73] = 0.368668e00
-ker_sdryg[13, 74] = 0.370477e00
-ker_sdryg[13, 75] = 0.372175e00
-ker_sdryg[13, 76] = 0.373769e00
-ker_sdryg[13, 77] = 0.375266e00
-ker_sdryg[13, 78] = 0.376671e00
-ker_sdryg[13, 79] = 0.377990e00
-ker_sdryg[13, 80] = 0.379229e00
-ker_sdryg[14, 1] = 0.303517e01
-ker_sdryg[14, 2] = 0.283877e01
-ker_sdryg[14, 3] = 0.265433e01
-ker_sdryg[14, 4] = 0.248114e01
-ker_sdryg[14, 5] = 0.231850e01
-ker_sdryg[14, 6] = 0.216575e01
-ker_sdryg[14, 7] = 0.202231e01
-ker_sdryg[14, 8] = 0.188758e01
-ker_sdryg[14, 9] = 0.176104e01
-ker_sdryg[14, 10] = 0.164217e01
-ker_sdryg[14, 11] = 0.153050e01
-ker_sdryg[14, 12] = 0.142557e01
-ker_sdryg[14, 13] = 0.132695e01
-ker_sdryg[14, 14] = 0.123425e01
-ker_sdryg[14, 15] = 0.114707e01
-ker_sdryg[14, 16] = 0.106505e01
-ker_sdryg[14, 17] = 0.987829e00
-ker_sdryg[14, 18] = 0.915075e00
-ker_sdryg[14, 19] = 0.846455e00
-ker_sdryg[14, 20] = 0.781644e00
-ker_sdryg[14, 21] = 0.720325e00
-ker_sdryg[14, 22] = 0.662179e00
-ker_sdryg[14, 23] = 0.606894e00
-ker_sdryg[14, 24] = 0.554165e00
-ker_sdryg[14, 25] = 0.503702e00
-ker_sdryg[14, 26] = 0.455255e00
-ker_sdryg[14, 27] = 0.408655e00
-ker_sdryg[14, 28] = 0.363840e00
-ker_sdryg[14, 29] = 0.320957e00
-ker_sdryg[14, 30] = 0.280360e00
-ker_sdryg[14, 31] = 0.242663e00
-ker_sdryg[14, 32] = 0.208805e00
-ker_sdryg[14, 33] = 0.179611e00
-ker_sdryg[14, 34] = 0.155880e00
-ker_sdryg[14, 35] = 0.138098e00
-ker_sdryg[14, 36] = 0.126282e00
-ker_sdryg[14, 37] = 0.119901e00
-ker_sdryg[14, 38] = 0.118300e00
-ker_sdryg[14, 39] = 0.120505e00
-ker_sdryg[14, 40] = 0.125551e00
-ker_sdryg[14, 41] = 0.132700e00
-ker_sdryg[14, 42] = 0.141142e00
-ker_sdryg[14, 43] = 0.150371e00
-ker_sdryg[14, 44] = 0.159990e00
-ker_sdryg[14, 45] = 0.169685e00
-ker_sdryg[14, 46] = 0.179245e00
-ker_sdryg[14, 47] = 0.188540e00
-ker_sdryg[14, 48] = 0.197487e00
-ker_sdryg[14, 49] = 0.206035e00
-ker_sdryg[14, 50] = 0.214165e00
-ker_sdryg[14, 51] = 0.221865e00
-ker_sdryg[14, 52] = 0.229121e00
-ker_sdryg[14, 53] = 0.235935e00
-ker_sdryg[14, 54] = 0.242332e00
-ker_sdryg[14, 55] = 0.248340e00
-ker_sdryg[14, 56] = 0.253994e00
-ker_sdryg[14, 57] = 0.259317e00
-ker_sdryg[14, 58] = 0.264327e00
-ker_sdryg[14, 59] = 0.269036e00
-ker_sdryg[14, 60] = 0.273454e00
-ker_sdryg[14, 61] = 0.277597e00
-ker_sdryg[14, 62] = 0.281481e00
-ker_sdryg[14, 63] = 0.285122e00
-ker_sdryg[14, 64] = 0.288536e00
-ker_sdryg[14, 65] = 0.291738e00
-ker_sdryg[14, 66] = 0.294743e00
-ker_sdryg[14, 67] = 0.297561e00
-ker_sdryg[14, 68] = 0.300206e00
-ker_sdryg[14, 69] = 0.302688e00
-ker_sdryg[14, 70] = 0.305018e00
-ker_sdryg[14, 71] = 0.307205e00
-ker_sdryg[14, 72] = 0.309257e00
-ker_sdryg[14, 73] = 0.311184e00
-ker_sdryg[14, 74] = 0.312993e00
-ker_sdryg[14, 75] = 0.314691e00
-ker_sdryg[14, 76] = 0.316285e00
-ker_sdryg[14, 77] = 0.317782e00
-ker_sdryg[14, 78] = 0.319187e00
-ker_sdryg[14, 79] = 0.320506e00
-ker_sdryg[14, 80] = 0.321745e00
-ker_sdryg[15, 1] = 0.306161e01
-ker_sdryg[15, 2] = 0.286522e01
-ker_sdryg[15, 3] = 0.268080e01
-ker_sdryg[15, 4] = 0.250762e01
-ker_sdryg[15, 5] = 0.234499e01
-ker_sdryg[15, 6] = 0.219228e01
-ker_sdryg[15, 7] = 0.204886e01
-ker_sdryg[15, 8] = 0.191417e01
-ker_sdryg[15, 9] = 0.178767e01
-ker_sdryg[15, 10] = 0.166885e01
-ker_sdryg[15, 11] = 0.155725e01
-ker_sdryg[15, 12] = 0.145240e01
-ker_sdryg[15, 13] = 0.135388e01
-ker_sdryg[15, 14] = 0.126130e01
-ker_sdryg[15, 15] = 0.117427e01
-ker_sdryg[15, 16] = 0.109244e01
-ker_sdryg[15, 17] = 0.101546e01
-ker_sdryg[15, 18] = 0.942994e00
-ker_sdryg[15, 19] = 0.874732e00
-ker_sdryg[15, 20] = 0.810365e00
-ker_sdryg[15, 21] = 0.749592e00
-ker_sdryg[15, 22] = 0.692115e00
-ker_sdryg[15, 23] = 0.637639e00
-ker_sdryg[15, 24] = 0.585869e00
-ker_sdryg[15, 25] = 0.536512e00
-ker_sdryg[15, 26] = 0.489283e00
-ker_sdryg[15, 27] = 0.443919e00
-ker_sdryg[15, 28] = 0.400205e00
-ker_sdryg[15, 29] = 0.358017e00
-ker_sdryg[15, 30] = 0.317369e00
-ker_sdryg[15, 31] = 0.278488e00
-ker_sdryg[15, 32] = 0.241839e00
-ker_sdryg[15, 33] = 0.208131e00
-ker_sdryg[15, 34] = 0.178156e00
-ker_sdryg[15, 35] = 0.152678e00
-ker_sdryg[15, 36] = 0.132382e00
-ker_sdryg[15, 37] = 0.117317e00
-ker_sdryg[15, 38] = 0.107412e00
-ker_sdryg[15, 39] = 0.102138e00
-ker_sdryg[15, 40] = 0.100720e00
-ker_sdryg[15, 41] = 0.102430e00
-ker_sdryg[15, 42] = 0.106496e00
-ker_sdryg[15, 43] = 0.112243e00
-ker_sdryg[15, 44] = 0.119136e00
-ker_sdryg[15, 45] = 0.126711e00
-ker_sdryg[15, 46] = 0.134684e00
-ker_sdryg[15, 47] = 0.142774e00
-ker_sdryg[15, 48] = 0.150805e00
-ker_sdryg[15, 49] = 0.158681e00
-ker_sdryg[15, 50] = 0.166306e00
-ker_sdryg[15, 51] = 0.173620e00
-ker_sdryg[15, 52] = 0.180607e00
-ker_sdryg[15, 53] = 0.187254e00
-ker_sdryg[15, 54] = 0.193543e00
-ker_sdryg[15, 55] = 0.199475e00
-ker_sdryg[15, 56] = 0.205051e00
-ker_sdryg[15, 57] = 0.210294e00
-ker_sdryg[15, 58] = 0.215233e00
-ker_sdryg[15, 59] = 0.219886e00
-ker_sdryg[15, 60] = 0.224272e00
-ker_sdryg[15, 61] = 0.228402e00
-ker_sdryg[15, 62] = 0.232282e00
-ker_sdryg[15, 63] = 0.235924e00
-ker_sdryg[15, 64] = 0.239341e00
-ker_sdryg[15, 65] = 0.242545e00
-ker_sdryg[15, 66] = 0.245550e00
-ker_sdryg[15, 67] = 0.248370e00
-ker_sdryg[15, 68] = 0.251016e00
-ker_sdryg[15, 69] = 0.253499e00
-ker_sdryg[15, 70] = 0.255829e00
-ker_sdryg[15, 71] = 0.258016e00
-ker_sdryg[15, 72] = 0.260069e00
-ker_sdryg[15, 73] = 0.261996e00
-ker_sdryg[15, 74] = 0.263805e00
-ker_sdryg[15, 75] = 0.265503e00
-ker_sdryg[15, 76] = 0.267097e00
-ker_sdryg[15, 77] = 0.268594e00
-ker_sdryg[15, 78] = 0.270000e00
-ker_sdryg[15, 79] = 0.271319e00
-ker_sdryg[15, 80] = 0.272558e00
-ker_sdryg[16, 1] = 0.308423e01
-ker_sdryg[16, 2] = 0.288784e01
-ker_sdryg[16, 3] = 0.270343e01
-ker_sdryg[16, 4] = 0.253026e01
-ker_sdryg[16, 5] = 0.236765e01
-ker_sdryg[16, 6] = 0.221495e01
-ker_sdryg[16, 7] = 0.207156e01
-ker_sdryg[16, 8] = 0.193689e01
-ker_sdryg[16, 9] = 0.181043e01
-ker_sdryg[16, 10] = 0.169165e01
-ker_sdryg[16, 11] = 0.158009e01
-ker_sdryg[16, 12] = 0.147530e01
-ker_sdryg[16, 13] = 0.137686e01
-ker_sdryg[16, 14] = 0.128436e01
-ker_sdryg[16, 15] = 0.119745e01
-ker_sdryg[16, 16] = 0.111575e01
-ker_sdryg[16, 17] = 0.103893e01
-ker_sdryg[16, 18] = 0.966673e00
-ker_sdryg[16, 19] = 0.898666e00
-ker_sdryg[16, 20] = 0.834615e00
-ker_sdryg[16, 21] = 0.774233e00
-ker_sdryg[16, 22] = 0.717240e00
-ker_sdryg[16, 23] = 0.663360e00
-ker_sdryg[16, 24] = 0.612319e00
-ker_sdryg[16, 25] = 0.563842e00
-ker_sdryg[16, 26] = 0.517655e00
-ker_sdryg[16, 27] = 0.473486e00
-ker_sdryg[16, 28] = 0.431073e00
-ker_sdryg[16, 29] = 0.390189e00
-ker_sdryg[16, 30] = 0.350665e00
-ker_sdryg[16, 31] = 0.312442e00
-ker_sdryg[16, 32] = 0.275636e00
-ker_sdryg[16, 33] = 0.240542e00
-ker_sdryg[16, 34] = 0.207718e00
-ker_sdryg[16, 35] = 0.177836e00
-ker_sdryg[16, 36] = 0.151594e00
-ker_sdryg[16, 37] = 0.129702e00
-ker_sdryg[16, 38] = 0.112415e00
-ker_sdryg[16, 39] = 0.997384e-01
-ker_sdryg[16, 40] = 0.914126e-01
-ker_sdryg[16, 41] = 0.869384e-01
-ker_sdryg[16, 42] = 0.856034e-01
-ker_sdryg[16, 43] = 0.868406e-01
-ker_sdryg[16, 44] = 0.900395e-01
-ker_sdryg[16, 45] = 0.946372e-01
-ker_sdryg[16, 46] = 0.100254e00
-ker_sdryg[16, 47] = 0.106487e00
-ker_sdryg[16, 48] = 0.113101e00
-ker_sdryg[16, 49] = 0.119871e00
-ker_sdryg[16, 50] = 0.126659e00
-ker_sdryg[16, 51] = 0.133342e00
-ker_sdryg[16, 52] = 0.139846e00
-ker_sdryg[16, 53] = 0.146127e00
-ker_sdryg[16, 54] = 0.152147e00
-ker_sdryg[16, 55] = 0.157896e00
-ker_sdryg[16, 56] = 0.163360e00
-ker_sdryg[16, 57] = 0.168528e00
-ker_sdryg[16, 58] = 0.173397e00
-ker_sdryg[16, 59] = 0.177982e00
-ker_sdryg[16, 60] = 0.182299e00
-ker_sdryg[16, 61] = 0.186373e00
-ker_sdryg[16, 62] = 0.190215e00
-ker_sdryg[16, 63] = 0.193838e00
-ker_sdryg[16, 64] = 0.197247e00
-ker_sdryg[16, 65] = 0.200450e00
-ker_sdryg[16, 66] = 0.203457e00
-ker_sdryg[16, 67] = 0.206278e00
-ker_sdryg[16, 68] = 0.208924e00
-ker_sdryg[16, 69] = 0.211408e00
-ker_sdryg[16, 70] = 0.213739e00
-ker_sdryg[16, 71] = 0.215926e00
-ker_sdryg[16, 72] = 0.217979e00
-ker_sdryg[16, 73] = 0.219907e00
-ker_sdryg[16, 74] = 0.221716e00
-ker_sdryg[16, 75] = 0.223414e00
-ker_sdryg[16, 76] = 0.225009e00
-ker_sdryg[16, 77] = 0.226506e00
-ker_sdryg[16, 78] = 0.227911e00
-ker_sdryg[16, 79] = 0.229231e00
-ker_sdryg[16, 80] = 0.230470e00
-ker_sdryg[17, 1] = 0.310358e01
-ker_sdryg[17, 2] = 0.290720e01
-ker_sdryg[17, 3] = 0.272279e01
-ker_sdryg[17, 4] = 0.254964e01
-ker_sdryg[17, 5] = 0.238704e01
-ker_sdryg[17, 6] = 0.223435e01
-ker_sdryg[17, 7] = 0.209097e01
-ker_sdryg[17, 8] = 0.195632e01
-ker_sdryg[17, 9] = 0.182988e01
-ker_sdryg[17, 10] = 0.171113e01
-ker_sdryg[17, 11] = 0.159960e01
-ker_sdryg[17, 12] = 0.149486e01
-ker_sdryg[17, 13] = 0.139647e01
-ker_sdryg[17, 14] = 0.130404e01
-ker_sdryg[17, 15] = 0.121720e01
-ker_sdryg[17, 16] = 0.113560e01
-ker_sdryg[17, 17] = 0.105890e01
-ker_sdryg[17, 18] = 0.986787e00
-ker_sdryg[17, 19] = 0.918963e00
-ker_sdryg[17, 20] = 0.855137e00
-ker_sdryg[17, 21] = 0.795034e00
-ker_sdryg[17, 22] = 0.738385e00
-ker_sdryg[17, 23] = 0.684932e00
-ker_sdryg[17, 24] = 0.634417e00
-ker_sdryg[17, 25] = 0.586588e00
-ker_sdryg[17, 26] = 0.541190e00
-ker_sdryg[17, 27] = 0.497968e00
-ker_sdryg[17, 28] = 0.456667e00
-ker_sdryg[17, 29] = 0.417040e00
-ker_sdryg[17, 30] = 0.378858e00
-ker_sdryg[17, 31] = 0.341935e00
-ker_sdryg[17, 32] = 0.306167e00
-ker_sdryg[17, 33] = 0.271581e00
-ker_sdryg[17, 34] = 0.238370e00
-ker_sdryg[17, 35] = 0.206924e00
-ker_sdryg[17, 36] = 0.177806e00
-ker_sdryg[17, 37] = 0.151640e00
-ker_sdryg[17, 38] = 0.129035e00
-ker_sdryg[17, 39] = 0.110359e00
-ker_sdryg[17, 40] = 0.956972e-01
-ker_sdryg[17, 41] = 0.850722e-01
-ker_sdryg[17, 42] = 0.779682e-01
-ker_sdryg[17, 43] = 0.740481e-01
-ker_sdryg[17, 44] = 0.727646e-01
-ker_sdryg[17, 45] = 0.735553e-01
-ker_sdryg[17, 46] = 0.759991e-01
-ker_sdryg[17, 47] = 0.796568e-01
-ker_sdryg[17, 48] = 0.841822e-01
-ker_sdryg[17, 49] = 0.893114e-01
-ker_sdryg[17, 50] = 0.947876e-01
-ker_sdryg[17, 51] = 0.100463e00
-ker_sdryg[17, 52] = 0.106196e00
-ker_sdryg[17, 53] = 0.111874e00
-ker_sdryg[17, 54] = 0.117444e00
-ker_sdryg[17, 55] = 0.122848e00
-ker_sdryg[17, 56] = 0.128044e00
-ker_sdryg[17, 57] = 0.133022e00
-ker_sdryg[17, 58] = 0.137773e00
-ker_sdryg[17, 59] = 0.142278e00
-ker_sdryg[17, 60] = 0.146537e00
-ker_sdryg[17, 61] = 0.150550e00
-ker_sdryg[17, 62] = 0.154332e00
-ker_sdryg[17, 63] = 0.157901e00
-ker_sdryg[17, 64] = 0.161269e00
-ker_sdryg[17, 65] = 0.164447e00
-ker_sdryg[17, 66] = 0.167443e00
-ker_sdryg[17, 67] = 0.170260e00
-ker_sdryg[17, 68] = 0.172907e00
-ker_sdryg[17, 69] = 0.175391e00
-ker_sdryg[17, 70] = 0.177723e00
-ker_sdryg[17, 71] = 0.179911e00
-ker_sdryg[17, 72] = 0.181964e00
-ker_sdryg[17, 73] = 0.183892e00
-ker_sdryg[17, 74] = 0.185701e00
-ker_sdryg[17, 75] = 0.187400e00
-ker_sdryg[17, 76] = 0.188995e00
-ker_sdryg[17, 77] = 0.190492e00
-ker_sdryg[17, 78] = 0.191897e00
-ker_sdryg[17, 79] = 0.193217e00
-ker_sdryg[17, 80] = 0.194456e00
-ker_sdryg[18, 1] = 0.312013e01
-ker_sdryg[18, 2] = 0.292376e01
-ker_sdryg[18, 3] = 0.273936e01
-ker_sdryg[18, 4] = 0.256621e01
-ker_sdryg[18, 5] = 0.240361e01
-ker_sdryg[18, 6] = 0.225094e01
-ker_sdryg[18, 7] = 0.210757e01
-ker_sdryg[18, 8] = 0.197294e01
-ker_sdryg[18, 9] = 0.184651e01
-ker_sdryg[18, 10] = 0.172778e01
-ker_sdryg[18, 11] = 0.161628e01
-ker_sdryg[18, 12] = 0.151156e01
-ker_sdryg[18, 13] = 0.141321e01
-ker_sdryg[18, 14] = 0.132083e01
-ker_sdryg[18, 15] = 0.123405e01
-ker_sdryg[18, 16] = 0.115251e01
-ker_sdryg[18, 17] = 0.107590e01
-ker_sdryg[18, 18] = 0.100390e01
-ker_sdryg[18, 19] = 0.936202e00
-ker_sdryg[18, 20] = 0.872537e00
-ker_sdryg[18, 21] = 0.812633e00
-ker_sdryg[18, 22] = 0.756230e00
-ker_sdryg[18, 23] = 0.703080e00
-ker_sdryg[18, 24] = 0.652942e00
-ker_sdryg[18, 25] = 0.605576e00
-ker_sdryg[18, 26] = 0.560750e00
-ker_sdryg[18, 27] = 0.518227e00
-ker_sdryg[18, 28] = 0.477773e00
-ker_sdryg[18, 29] = 0.439152e00
-ker_sdryg[18, 30] = 0.402131e00
-ker_sdryg[18, 31] = 0.366493e00
-ker_sdryg[18, 32] = 0.332050e00
-ker_sdryg[18, 33] = 0.298676e00
-ker_sdryg[18, 34] = 0.266345e00
-ker_sdryg[18, 35] = 0.235168e00
-ker_sdryg[18, 36] = 0.205422e00
-ker_sdryg[18, 37] = 0.177545e00
-ker_sdryg[18, 38] = 0.152032e00
-ker_sdryg[18, 39] = 0.129423e00
-ker_sdryg[18, 40] = 0.110093e00
-ker_sdryg[18, 41] = 0.942133e-01
-ker_sdryg[18, 42] = 0.818749e-01
-ker_sdryg[18, 43] = 0.728212e-01
-ker_sdryg[18, 44] = 0.667257e-01
-ker_sdryg[18, 45] = 0.632100e-01
-ker_sdryg[18, 46] = 0.618886e-01
-ker_sdryg[18, 47] = 0.622846e-01
-ker_sdryg[18, 48] = 0.640674e-01
-ker_sdryg[18, 49] = 0.669386e-01
-ker_sdryg[18, 50] = 0.705747e-01
-ker_sdryg[18, 51] = 0.747677e-01
-ker_sdryg[18, 52] = 0.793092e-01
-ker_sdryg[18, 53] = 0.840736e-01
-ker_sdryg[18, 54] = 0.889086e-01
-ker_sdryg[18, 55] = 0.937517e-01
-ker_sdryg[18, 56] = 0.985202e-01
-ker_sdryg[18, 57] = 0.103163e00
-ker_sdryg[18, 58] = 0.107658e00
-ker_sdryg[18, 59] = 0.111974e00
-ker_sdryg[18, 60] = 0.116103e00
-ker_sdryg[18, 61] = 0.120035e00
-ker_sdryg[18, 62] = 0.123761e00
-ker_sdryg[18, 63] = 0.127277e00
-ker_sdryg[18, 64] = 0.130593e00
-ker_sdryg[18, 65] = 0.133720e00
-ker_sdryg[18, 66] = 0.136675e00
-ker_sdryg[18, 67] = 0.139464e00
-ker_sdryg[18, 68] = 0.142096e00
-ker_sdryg[18, 69] = 0.144574e00
-ker_sdryg[18, 70] = 0.146905e00
-ker_sdryg[18, 71] = 0.149093e00
-ker_sdryg[18, 72] = 0.151147e00
-ker_sdryg[18, 73] = 0.153075e00
-ker_sdryg[18, 74] = 0.154885e00
-ker_sdryg[18, 75] = 0.156583e00
-ker_sdryg[18, 76] = 0.158178e00
-ker_sdryg[18, 77] = 0.159675e00
-ker_sdryg[18, 78] = 0.161081e00
-ker_sdryg[18, 79] = 0.162401e00
-ker_sdryg[18, 80] = 0.163640e00
-ker_sdryg[19, 1] = 0.313430e01
-ker_sdryg[19, 2] = 0.293792e01
-ker_sdryg[19, 3] = 0.275353e01
-ker_sdryg[19, 4] = 0.258038e01
-ker_sdryg[19, 5] = 0.241780e01
-ker_sdryg[19, 6] = 0.226513e01
-ker_sdryg[19, 7] = 0.212176e01
-ker_sdryg[19, 8] = 0.198714e01
-ker_sdryg[19, 9] = 0.186073e01
-ker_sdryg[19, 10] = 0.174202e01
-ker_sdryg[19, 11] = 0.163053e01
-ker_sdryg[19, 12] = 0.152584e01
-ker_sdryg[19, 13] = 0.142751e01
-ker_sdryg[19, 14] = 0.133517e01
-ker_sdryg[19, 15] = 0.124842e01
-ker_sdryg[19, 16] = 0.116694e01
-ker_sdryg[19, 17] = 0.109039e01
-ker_sdryg[19, 18] = 0.101846e01
-ker_sdryg[19, 19] = 0.950864e00
-ker_sdryg[19, 20] = 0.887315e00
-ker_sdryg[19, 21] = 0.827553e00
-ker_sdryg[19, 22] = 0.771326e00
-ker_sdryg[19, 23] = 0.718393e00
-ker_sdryg[19, 24] = 0.668523e00
-ker_sdryg[19, 25] = 0.621489e00
-ker_sdryg[19, 26] = 0.577071e00
-ker_sdryg[19, 27] = 0.535052e00
-ker_sdryg[19, 28] = 0.495215e00
-ker_sdryg[19, 29] = 0.457343e00
-ker_sdryg[19, 30] = 0.421219e00
-ker_sdryg[19, 31] = 0.386628e00
-ker_sdryg[19, 32] = 0.353366e00
-ker_sdryg[19, 33] = 0.321252e00
-ker_sdryg[19, 34] = 0.290155e00
-ker_sdryg[19, 35] = 0.260019e00
-ker_sdryg[19, 36] = 0.230899e00
-ker_sdryg[19, 37] = 0.202987e00
-ker_sdryg[19, 38] = 0.176611e00
-ker_sdryg[19, 39] = 0.152167e00
-ker_sdryg[19, 40] = 0.130090e00
-ker_sdryg[19, 41] = 0.110741e00
-ker_sdryg[19, 42] = 0.943181e-01
-ker_sdryg[19, 43] = 0.809330e-01
-ker_sdryg[19, 44] = 0.704716e-01
-ker_sdryg[19, 45] = 0.626544e-01
-ker_sdryg[19, 46] = 0.573699e-01
-ker_sdryg[19, 47] = 0.541204e-01
-ker_sdryg[19, 48] = 0.527083e-01
-ker_sdryg[19, 49] = 0.527892e-01
-ker_sdryg[19, 50] = 0.540394e-01
-ker_sdryg[19, 51] = 0.562337e-01
-ker_sdryg[19, 52] = 0.591260e-01
-ker_sdryg[19, 53] = 0.625315e-01
-ker_sdryg[19, 54] = 0.662926e-01
-ker_sdryg[19, 55] = 0.702636e-01
-ker_sdryg[19, 56] = 0.743493e-01
-ker_sdryg[19, 57] = 0.784688e-01
-ker_sdryg[19, 58] = 0.825487e-01
-ker_sdryg[19, 59] = 0.865492e-01
-ker_sdryg[19, 60] = 0.904344e-01
-ker_sdryg[19, 61] = 0.941778e-01
-ker_sdryg[19, 62] = 0.977677e-01
-ker_sdryg[19, 63] = 0.101199e00
-ker_sdryg[19, 64] = 0.104457e00
-ker_sdryg[19, 65] = 0.107540e00
-ker_sdryg[19, 66] = 0.110449e00
-ker_sdryg[19, 67] = 0.113194e00
-ker_sdryg[19, 68] = 0.115786e00
-ker_sdryg[19, 69] = 0.118234e00
-ker_sdryg[19, 70] = 0.120546e00
-ker_sdryg[19, 71] = 0.122726e00
-ker_sdryg[19, 72] = 0.124778e00
-ker_sdryg[19, 73] = 0.126705e00
-ker_sdryg[19, 74] = 0.128515e00
-ker_sdryg[19, 75] = 0.130214e00
-ker_sdryg[19, 76] = 0.131809e00
-ker_sdryg[19, 77] = 0.133307e00
-ker_sdryg[19, 78] = 0.134712e00
-ker_sdryg[19, 79] = 0.136032e00
-ker_sdryg[19, 80] = 0.137271e00
-ker_sdryg[20, 1] = 0.314641e01
-ker_sdryg[20, 2] = 0.295004e01
-ker_sdryg[20, 3] = 0.276565e01
-ker_sdryg[20, 4] = 0.259251e01
-ker_sdryg[20, 5] = 0.242993e01
-ker_sdryg[20, 6] = 0.227726e01
-ker_sdryg[20, 7] = 0.213391e01
-ker_sdryg[20, 8] = 0.199929e01
-ker_sdryg[20, 9] = 0.187289e01
-ker_sdryg[20, 10] = 0.175419e01
-ker_sdryg[20, 11] = 0.164272e01
-ker_sdryg[20, 12] = 0.153804e01
-ker_sdryg[20, 13] = 0.143974e01
-ker_sdryg[20, 14] = 0.134741e01
-ker_sdryg[20, 15] = 0.126070e01
-ker_sdryg[20, 16] = 0.117926e01
-ker_sdryg[20, 17] = 0.110275e01
-ker_sdryg[20, 18] = 0.103088e01
-ker_sdryg[20, 19] = 0.963347e00
-ker_sdryg[20, 20] = 0.899882e00
-ker_sdryg[20, 21] = 0.840222e00
-ker_sdryg[20, 22] = 0.784121e00
-ker_sdryg[20, 23] = 0.731345e00
-ker_sdryg[20, 24] = 0.681666e00
-ker_sdryg[20, 25] = 0.634870e00
-ker_sdryg[20, 26] = 0.590745e00
-ker_sdryg[20, 27] = 0.549087e00
-ker_sdryg[20, 28] = 0.509694e00
-ker_sdryg[20, 29] = 0.472366e00
-ker_sdryg[20, 30] = 0.436902e00
-ker_sdryg[20, 31] = 0.403104e00
-ker_sdryg[20, 32] = 0.370773e00
-ker_sdryg[20, 33] = 0.339721e00
-ker_sdryg[20, 34] = 0.309780e00
-ker_sdryg[20, 35] = 0.280817e00
-ker_sdryg[20, 36] = 0.252766e00
-ker_sdryg[20, 37] = 0.225649e00
-ker_sdryg[20, 38] = 0.199598e00
-ker_sdryg[20, 39] = 0.174855e00
-ker_sdryg[20, 40] = 0.151733e00
-ker_sdryg[20, 41] = 0.130576e00
-ker_sdryg[20, 42] = 0.111685e00
-ker_sdryg[20, 43] = 0.952438e-01
-ker_sdryg[20, 44] = 0.813642e-01
-ker_sdryg[20, 45] = 0.700036e-01
-ker_sdryg[20, 46] = 0.610159e-01
-ker_sdryg[20, 47] = 0.542824e-01
-ker_sdryg[20, 48] = 0.495365e-01
-ker_sdryg[20, 49] = 0.465418e-01
-ker_sdryg[20, 50] = 0.450362e-01
-ker_sdryg[20, 51] = 0.448236e-01
-ker_sdryg[20, 52] = 0.456174e-01
-ker_sdryg[20, 53] = 0.472243e-01
-ker_sdryg[20, 54] = 0.495059e-01
-ker_sdryg[20, 55] = 0.522568e-01
-ker_sdryg[20, 56] = 0.553442e-01
-ker_sdryg[20, 57] = 0.586561e-01
-ker_sdryg[20, 58] = 0.621124e-01
-ker_sdryg[20, 59] = 0.656027e-01
-ker_sdryg[20, 60] = 0.690997e-01
-ker_sdryg[20, 61] = 0.725427e-01
-ker_sdryg[20, 62] = 0.758958e-01
-ker_sdryg[20, 63] = 0.791459e-01
-ker_sdryg[20, 64] = 0.822686e-01
-ker_sdryg[20, 65] = 0.852588e-01
-ker_sdryg[20, 66] = 0.881095e-01
-ker_sdryg[20, 67] = 0.908129e-01
-ker_sdryg[20, 68] = 0.933663e-01
-ker_sdryg[20, 69] = 0.957757e-01
-ker_sdryg[20, 70] = 0.980498e-01
-ker_sdryg[20, 71] = 0.100200e00
-ker_sdryg[20, 72] = 0.102230e00
-ker_sdryg[20, 73] = 0.104147e00
-ker_sdryg[20, 74] = 0.105953e00
-ker_sdryg[20, 75] = 0.107651e00
-ker_sdryg[20, 76] = 0.109246e00
-ker_sdryg[20, 77] = 0.110743e00
-ker_sdryg[20, 78] = 0.112149e00
-ker_sdryg[20, 79] = 0.113469e00
-ker_sdryg[20, 80] = 0.114708e00
-ker_sdryg[21, 1] = 0.315678e01
-ker_sdryg[21, 2] = 0.296041e01
-ker_sdryg[21, 3] = 0.277602e01
-ker_sdryg[21, 4] = 0.260288e01
-ker_sdryg[21, 5] = 0.244030e01
-ker_sdryg[21, 6] = 0.228764e01
-ker_sdryg[21, 7] = 0.214429e01
-ker_sdryg[21, 8] = 0.200969e01
-ker_sdryg[21, 9] = 0.188329e01
-ker_sdryg[21, 10] = 0.176459e01
-ker_sdryg[21, 11] = 0.165314e01
-ker_sdryg[21, 12] = 0.154847e01
-ker_sdryg[21, 13] = 0.145018e01
-ker_sdryg[21, 14] = 0.135788e01
-ker_sdryg[21, 15] = 0.127119e01
-ker_sdryg[21, 16] = 0.118977e01
-ker_sdryg[21, 17] = 0.111330e01
-ker_sdryg[21, 18] = 0.104147e01
-ker_sdryg[21, 19] = 0.973984e00
-ker_sdryg[21, 20] = 0.910579e00
-ker_sdryg[21, 21] = 0.850994e00
-ker_sdryg[21, 22] = 0.794985e00
-ker_sdryg[21, 23] = 0.742321e00
-ker_sdryg[21, 24] = 0.692781e00
-ker_sdryg[21, 25] = 0.646155e00
-ker_sdryg[21, 26] = 0.602240e00
-ker_sdryg[21, 27] = 0.560841e00
-ker_sdryg[21, 28] = 0.521767e00
-ker_sdryg[21, 29] = 0.484831e00
-ker_sdryg[21, 30] = 0.449847e00
-ker_sdryg[21, 31] = 0.416632e00
-ker_sdryg[21, 32] = 0.385000e00
-ker_sdryg[21, 33] = 0.354772e00
-ker_sdryg[21, 34] = 0.325773e00
-ker_sdryg[21, 35] = 0.297848e00
-ker_sdryg[21, 36] = 0.270871e00
-ker_sdryg[21, 37] = 0.244771e00
-ker_sdryg[21, 38] = 0.219552e00
-ker_sdryg[21, 39] = 0.195307e00
-ker_sdryg[21, 40] = 0.172218e00
-ker_sdryg[21, 41] = 0.150528e00
-ker_sdryg[21, 42] = 0.130506e00
-ker_sdryg[21, 43] = 0.112387e00
-ker_sdryg[21, 44] = 0.963217e-01
-ker_sdryg[21, 45] = 0.824142e-01
-ker_sdryg[21, 46] = 0.706536e-01
-ker_sdryg[21, 47] = 0.609423e-01
-ker_sdryg[21, 48] = 0.532273e-01
-ker_sdryg[21, 49] = 0.473264e-01
-ker_sdryg[21, 50] = 0.429933e-01
-ker_sdryg[21, 51] = 0.402064e-01
-ker_sdryg[21, 52] = 0.386102e-01
-ker_sdryg[21, 53] = 0.381308e-01
-ker_sdryg[21, 54] = 0.385657e-01
-ker_sdryg[21, 55] = 0.397270e-01
-ker_sdryg[21, 56] = 0.414742e-01
-ker_sdryg[21, 57] = 0.436663e-01
-ker_sdryg[21, 58] = 0.461938e-01
-ker_sdryg[21, 59] = 0.489445e-01
-ker_sdryg[21, 60] = 0.518374e-01
-ker_sdryg[21, 61] = 0.548037e-01
-ker_sdryg[21, 62] = 0.577875e-01
-ker_sdryg[21, 63] = 0.607451e-01
-ker_sdryg[21, 64] = 0.636436e-01
-ker_sdryg[21, 65] = 0.664592e-01
-ker_sdryg[21, 66] = 0.691751e-01
-ker_sdryg[21, 67] = 0.717806e-01
-ker_sdryg[21, 68] = 0.742731e-01
-ker_sdryg[21, 69] = 0.766406e-01
-ker_sdryg[21, 70] = 0.788820e-01
-ker_sdryg[21, 71] = 0.809983e-01
-ker_sdryg[21, 72] = 0.829967e-01
-ker_sdryg[21, 73] = 0.848837e-01
-ker_sdryg[21, 74] = 0.866675e-01
-ker_sdryg[21, 75] = 0.883526e-01
-ker_sdryg[21, 76] = 0.899415e-01
-ker_sdryg[21, 77] = 0.914371e-01
-ker_sdryg[21, 78] = 0.928426e-01
-ker_sdryg[21, 79] = 0.941625e-01
-ker_sdryg[21, 80] = 0.954017e-01
-ker_sdryg[22, 1] = 0.316565e01
-ker_sdryg[22, 2] = 0.296928e01
-ker_sdryg[22, 3] = 0.278490e01
-ker_sdryg[22, 4] = 0.261176e01
-ker_sdryg[22, 5] = 0.244918e01
-ker_sdryg[22, 6] = 0.229652e01
-ker_sdryg[22, 7] = 0.215318e01
-ker_sdryg[22, 8] = 0.201857e01
-ker_sdryg[22, 9] = 0.189218e01
-ker_sdryg[22, 10] = 0.177349e01
-ker_sdryg[22, 11] = 0.166204e01
-ker_sdryg[22, 12] = 0.155739e01
-ker_sdryg[22, 13] = 0.145911e01
-ker_sdryg[22, 14] = 0.136682e01
-ker_sdryg[22, 15] = 0.128015e01
-ker_sdryg[22, 16] = 0.119875e01
-ker_sdryg[22, 17] = 0.112230e01
-ker_sdryg[22, 18] = 0.105050e01
-ker_sdryg[22, 19] = 0.983055e00
-ker_sdryg[22, 20] = 0.919694e00
-ker_sdryg[22, 21] = 0.860163e00
-ker_sdryg[22, 22] = 0.804221e00
-ker_sdryg[22, 23] = 0.751638e00
-ker_sdryg[22, 24] = 0.702199e00
-ker_sdryg[22, 25] = 0.655696e00
-ker_sdryg[22, 26] = 0.611933e00
-ker_sdryg[22, 27] = 0.570720e00
-ker_sdryg[22, 28] = 0.531876e00
-ker_sdryg[22, 29] = 0.495222e00
-ker_sdryg[22, 30] = 0.460585e00
-ker_sdryg[22, 31] = 0.427793e00
-ker_sdryg[22, 32] = 0.396676e00
-ker_sdryg[22, 33] = 0.367065e00
-ker_sdryg[22, 34] = 0.338793e00
-ker_sdryg[22, 35] = 0.311700e00
-ker_sdryg[22, 36] = 0.285643e00
-ker_sdryg[22, 37] = 0.260506e00
-ker_sdryg[22, 38] = 0.236218e00
-ker_sdryg[22, 39] = 0.212773e00
-ker_sdryg[22, 40] = 0.190240e00
-ker_sdryg[22, 41] = 0.168759e00
-ker_sdryg[22, 42] = 0.148523e00
-ker_sdryg[22, 43] = 0.129738e00
-ker_sdryg[22, 44] = 0.112583e00
-ker_sdryg[22, 45] = 0.971811e-01
-ker_sdryg[22, 46] = 0.835936e-01
-ker_sdryg[22, 47] = 0.718231e-01
-ker_sdryg[22, 48] = 0.618072e-01
-ker_sdryg[22, 49] = 0.534898e-01
-ker_sdryg[22, 50] = 0.467624e-01
-ker_sdryg[22, 51] = 0.414860e-01
-ker_sdryg[22, 52] = 0.375763e-01
-ker_sdryg[22, 53] = 0.348805e-01
-ker_sdryg[22, 54] = 0.332667e-01
-ker_sdryg[22, 55] = 0.325688e-01
-ker_sdryg[22, 56] = 0.326954e-01
-ker_sdryg[22, 57] = 0.334646e-01
-ker_sdryg[22, 58] = 0.347486e-01
-ker_sdryg[22, 59] = 0.364906e-01
-ker_sdryg[22, 60] = 0.385370e-01
-ker_sdryg[22, 61] = 0.408038e-01
-ker_sdryg[22, 62] = 0.432264e-01
-ker_sdryg[22, 63] = 0.457437e-01
-ker_sdryg[22, 64] = 0.482800e-01
-ker_sdryg[22, 65] = 0.508227e-01
-ker_sdryg[22, 66] = 0.533231e-01
-ker_sdryg[22, 67] = 0.557593e-01
-ker_sdryg[22, 68] = 0.581222e-01
-ker_sdryg[22, 69] = 0.603926e-01
-ker_sdryg[22, 70] = 0.625678e-01
-ker_sdryg[22, 71] = 0.646420e-01
-ker_sdryg[22, 72] = 0.666097e-01
-ker_sdryg[22, 73] = 0.684688e-01
-ker_sdryg[22, 74] = 0.702238e-01
-ker_sdryg[22, 75] = 0.718811e-01
-ker_sdryg[22, 76] = 0.734478e-01
-ker_sdryg[22, 77] = 0.749287e-01
-ker_sdryg[22, 78] = 0.763265e-01
-ker_sdryg[22, 79] = 0.776433e-01
-ker_sdryg[22, 80] = 0.788817e-01
-ker_sdryg[23, 1] = 0.317324e01
-ker_sdryg[23, 2] = 0.297688e01
-ker_sdryg[23, 3] = 0.279249e01
-ker_sdryg[23, 4] = 0.261935e01
-ker_sdryg[23, 5] = 0.245678e01
-ker_sdryg[23, 6] = 0.230412e01
-ker_sdryg[23, 7] = 0.216078e01
-ker_sdryg[23, 8] = 0.202618e01
-ker_sdryg[23, 9] = 0.189979e01
-ker_sdryg[23, 10] = 0.178111e01
-ker_sdryg[23, 11] = 0.166966e01
-ker_sdryg[23, 12] = 0.156501e01
-ker_sdryg[23, 13] = 0.146674e01
-ker_sdryg[23, 14] = 0.137446e01
-ker_sdryg[23, 15] = 0.128780e01
-ker_sdryg[23, 16] = 0.120642e01
-ker_sdryg[23, 17] = 0.112999e01
-ker_sdryg[23, 18] = 0.105821e01
-ker_sdryg[23, 19] = 0.990793e00
-ker_sdryg[23, 20] = 0.927466e00
-ker_sdryg[23, 21] = 0.867975e00
-ker_sdryg[23, 22] = 0.812081e00
-ker_sdryg[23, 23] = 0.759559e00
-ker_sdryg[23, 24] = 0.710192e00
-ker_sdryg[23, 25] = 0.663779e00
-ker_sdryg[23, 26] = 0.620126e00
-ker_sdryg[23, 27] = 0.579048e00
-ker_sdryg[23, 28] = 0.540370e00
-ker_sdryg[23, 29] = 0.503920e00
-ker_sdryg[23, 30] = 0.469534e00
-ker_sdryg[23, 31] = 0.437049e00
-ker_sdryg[23, 32] = 0.406307e00
-ker_sdryg[23, 33] = 0.377150e00
-ker_sdryg[23, 34] = 0.349422e00
-ker_sdryg[23, 35] = 0.322971e00
-ker_sdryg[23, 36] = 0.297649e00
-ker_sdryg[23, 37] = 0.273324e00
-ker_sdryg[23, 38] = 0.249890e00
-ker_sdryg[23, 39] = 0.227278e00
-ker_sdryg[23, 40] = 0.205477e00
-ker_sdryg[23, 41] = 0.184540e00
-ker_sdryg[23, 42] = 0.164581e00
-ker_sdryg[23, 43] = 0.145753e00
-ker_sdryg[23, 44] = 0.128220e00
-ker_sdryg[23, 45] = 0.112118e00
-ker_sdryg[23, 46] = 0.975291e-01
-ker_sdryg[23, 47] = 0.844965e-01
-ker_sdryg[23, 48] = 0.730043e-01
-ker_sdryg[23, 49] = 0.629937e-01
-ker_sdryg[23, 50] = 0.544338e-01
-ker_sdryg[23, 51] = 0.472364e-01
-ker_sdryg[23, 52] = 0.413003e-01
-ker_sdryg[23, 53] = 0.366010e-01
-ker_sdryg[23, 54] = 0.330232e-01
-ker_sdryg[23, 55] = 0.304152e-01
-ker_sdryg[23, 56] = 0.287909e-01
-ker_sdryg[23, 57] = 0.279201e-01
-ker_sdryg[23, 58] = 0.277828e-01
-ker_sdryg[23, 59] = 0.282422e-01
-ker_sdryg[23, 60] = 0.291874e-01
-ker_sdryg[23, 61] = 0.305223e-01
-ker_sdryg[23, 62] = 0.321561e-01
-ker_sdryg[23, 63] = 0.340230e-01
-ker_sdryg[23, 64] = 0.360382e-01
-ker_sdryg[23, 65] = 0.381505e-01
-ker_sdryg[23, 66] = 0.403137e-01
-ker_sdryg[23, 67] = 0.424862e-01
-ker_sdryg[23, 68] = 0.446395e-01
-ker_sdryg[23, 69] = 0.467491e-01
-ker_sdryg[23, 70] = 0.487982e-01
-ker_sdryg[23, 71] = 0.507757e-01
-ker_sdryg[23, 72] = 0.526730e-01
-ker_sdryg[23, 73] = 0.544887e-01
-ker_sdryg[23, 74] = 0.562135e-01
-ker_sdryg[23, 75] = 0.578463e-01
-ker_sdryg[23, 76] = 0.593889e-01
-ker_sdryg[23, 77] = 0.608458e-01
-ker_sdryg[23, 78] = 0.622217e-01
-ker_sdryg[23, 79] = 0.635229e-01
-ker_sdryg[23, 80] = 0.647520e-01
-ker_sdryg[24, 1] = 0.317974e01
-ker_sdryg[24, 2] = 0.298337e01
-ker_sdryg[24, 3] = 0.279898e01
-ker_sdryg[24, 4] = 0.262585e01
-ker_sdryg[24, 5] = 0.246328e01
-ker_sdryg[24, 6] = 0.231062e01
-ker_sdryg[24, 7] = 0.216728e01
-ker_sdryg[24, 8] = 0.203268e01
-ker_sdryg[24, 9] = 0.190630e01
-ker_sdryg[24, 10] = 0.178762e01
-ker_sdryg[24, 11] = 0.167618e01
-ker_sdryg[24, 12] = 0.157153e01
-ker_sdryg[24, 13] = 0.147327e01
-ker_sdryg[24, 14] = 0.138100e01
-ker_sdryg[24, 15] = 0.129435e01
-ker_sdryg[24, 16] = 0.121298e01
-ker_sdryg[24, 17] = 0.113656e01
-ker_sdryg[24, 18] = 0.106480e01
-ker_sdryg[24, 19] = 0.997399e00
-ker_sdryg[24, 20] = 0.934096e00
-ker_sdryg[24, 21] = 0.874634e00
-ker_sdryg[24, 22] = 0.818777e00
-ker_sdryg[24, 23] = 0.766298e00
-ker_sdryg[24, 24] = 0.716985e00
-ker_sdryg[24, 25] = 0.670637e00
-ker_sdryg[24, 26] = 0.627064e00
-ker_sdryg[24, 27] = 0.586085e00
-ker_sdryg[24, 28] = 0.547527e00
-ker_sdryg[24, 29] = 0.511226e00
-ker_sdryg[24, 30] = 0.477021e00
-ker_sdryg[24, 31] = 0.444759e00
-ker_sdryg[24, 32] = 0.414290e00
-ker_sdryg[24, 33] = 0.385466e00
-ker_sdryg[24, 34] = 0.358141e00
-ker_sdryg[24, 35] = 0.332171e00
-ker_sdryg[24, 36] = 0.307415e00
-ker_sdryg[24, 37] = 0.283739e00
-ker_sdryg[24, 38] = 0.261021e00
-ker_sdryg[24, 39] = 0.239161e00
-ker_sdryg[24, 40] = 0.218098e00
-ker_sdryg[24, 41] = 0.197816e00
-ker_sdryg[24, 42] = 0.178358e00
-ker_sdryg[24, 43] = 0.159817e00
-ker_sdryg[24, 44] = 0.142322e00
-ker_sdryg[24, 45] = 0.126004e00
-ker_sdryg[24, 46] = 0.110966e00
-ker_sdryg[24, 47] = 0.972696e-01
-ker_sdryg[24, 48] = 0.849240e-01
-ker_sdryg[24, 49] = 0.739011e-01
-ker_sdryg[24, 50] = 0.641503e-01
-ker_sdryg[24, 51] = 0.556168e-01
-ker_sdryg[24, 52] = 0.482410e-01
-ker_sdryg[24, 53] = 0.419558e-01
-ker_sdryg[24, 54] = 0.367232e-01
-ker_sdryg[24, 55] = 0.324850e-01
-ker_sdryg[24, 56] = 0.291562e-01
-ker_sdryg[24, 57] = 0.266947e-01
-ker_sdryg[24, 58] = 0.250249e-01
-ker_sdryg[24, 59] = 0.240671e-01
-ker_sdryg[24, 60] = 0.237119e-01
-ker_sdryg[24, 61] = 0.239149e-01
-ker_sdryg[24, 62] = 0.245541e-01
-ker_sdryg[24, 63] = 0.255388e-01
-ker_sdryg[24, 64] = 0.268448e-01
-ker_sdryg[24, 65] = 0.283592e-01
-ker_sdryg[24, 66] = 0.300237e-01
-ker_sdryg[24, 67] = 0.317974e-01
-ker_sdryg[24, 68] = 0.336350e-01
-ker_sdryg[24, 69] = 0.354861e-01
-ker_sdryg[24, 70] = 0.373396e-01
-ker_sdryg[24, 71] = 0.391617e-01
-ker_sdryg[24, 72] = 0.409381e-01
-ker_sdryg[24, 73] = 0.426598e-01
-ker_sdryg[24, 74] = 0.443148e-01
-ker_sdryg[24, 75] = 0.459007e-01
-ker_sdryg[24, 76] = 0.474126e-01
-ker_sdryg[24, 77] = 0.488471e-01
-ker_sdryg[24, 78] = 0.502027e-01
-ker_sdryg[24, 79] = 0.514825e-01
-ker_sdryg[24, 80] = 0.526915e-01
-ker_sdryg[25, 1] = 0.318529e01
-ker_sdryg[25, 2] = 0.298893e01
-ker_sdryg[25, 3] = 0.280454e01
-ker_sdryg[25, 4] = 0.263141e01
-ker_sdryg[25, 5] = 0.246884e01
-ker_sdryg[25, 6] = 0.231618e01
-ker_sdryg[25, 7] = 0.217284e01
-ker_sdryg[25, 8] = 0.203825e01
-ker_sdryg[25, 9] = 0.191186e01
-ker_sdryg[25, 10] = 0.179319e01
-ker_sdryg[25, 11] = 0.168175e01
-ker_sdryg[25, 12] = 0.157711e01
-ker_sdryg[25, 13] = 0.147885e01
-ker_sdryg[25, 14] = 0.138659e01
-ker_sdryg[25, 15] = 0.129994e01
-ker_sdryg[25, 16] = 0.121858e01
-ker_sdryg[25, 17] = 0.114218e01
-ker_sdryg[25, 18] = 0.107042e01
-ker_sdryg[25, 19] = 0.100304e01
-ker_sdryg[25, 20] = 0.939754e00
-ker_sdryg[25, 21] = 0.880315e00
-ker_sdryg[25, 22] = 0.824484e00
-ker_sdryg[25, 23] = 0.772038e00
-ker_sdryg[25, 24] = 0.722764e00
-ker_sdryg[25, 25] = 0.676465e00
-ker_sdryg[25, 26] = 0.632951e00
-ker_sdryg[25, 27] = 0.592044e00
-ker_sdryg[25, 28] = 0.553574e00
-ker_sdryg[25, 29] = 0.517380e00
-ker_sdryg[25, 30] = 0.483308e00
-ker_sdryg[25, 31] = 0.451208e00
-ker_sdryg[25, 32] = 0.420937e00
-ker_sdryg[25, 33] = 0.392356e00
-ker_sdryg[25, 34] = 0.365326e00
-ker_sdryg[25, 35] = 0.339713e00
-ker_sdryg[25, 36] = 0.315384e00
-ker_sdryg[25, 37] = 0.292209e00
-ker_sdryg[25, 38] = 0.270064e00
-ker_sdryg[25, 39] = 0.248837e00
-ker_sdryg[25, 40] = 0.228437e00
-ker_sdryg[25, 41] = 0.208804e00
-ker_sdryg[25, 42] = 0.189923e00
-ker_sdryg[25, 43] = 0.171829e00
-ker_sdryg[25, 44] = 0.154601e00
-ker_sdryg[25, 45] = 0.138347e00
-ker_sdryg[25, 46] = 0.123178e00
-ker_sdryg[25, 47] = 0.109173e00
-ker_sdryg[25, 48] = 0.963727e-01
-ker_sdryg[25, 49] = 0.847717e-01
-ker_sdryg[25, 50] = 0.743296e-01
-ker_sdryg[25, 51] = 0.649850e-01
-ker_sdryg[25, 52] = 0.566822e-01
-ker_sdryg[25, 53] = 0.493595e-01
-ker_sdryg[25, 54] = 0.429562e-01
-ker_sdryg[25, 55] = 0.374539e-01
-ker_sdryg[25, 56] = 0.328017e-01
-ker_sdryg[25, 57] = 0.289442e-01
-ker_sdryg[25, 58] = 0.258795e-01
-ker_sdryg[25, 59] = 0.235524e-01
-ker_sdryg[25, 60] = 0.218674e-01
-ker_sdryg[25, 61] = 0.208371e-01
-ker_sdryg[25, 62] = 0.203194e-01
-ker_sdryg[25, 63] = 0.203049e-01
-ker_sdryg[25, 64] = 0.206977e-01
-ker_sdryg[25, 65] = 0.214318e-01
-ker_sdryg[25, 66] = 0.224335e-01
-ker_sdryg[25, 67] = 0.236433e-01
-ker_sdryg[25, 68] = 0.250200e-01
-ker_sdryg[25, 69] = 0.264977e-01
-ker_sdryg[25, 70] = 0.280428e-01
-ker_sdryg[25, 71] = 0.296240e-01
-ker_sdryg[25, 72] = 0.312105e-01
-ker_sdryg[25, 73] = 0.327816e-01
-ker_sdryg[25, 74] = 0.343205e-01
-ker_sdryg[25, 75] = 0.358148e-01
-ker_sdryg[25, 76] = 0.372575e-01
-ker_sdryg[25, 77] = 0.386413e-01
-ker_sdryg[25, 78] = 0.399659e-01
-ker_sdryg[25, 79] = 0.412241e-01
-ker_sdryg[25, 80] = 0.424150e-01
-ker_sdryg[26, 1] = 0.319005e01
-ker_sdryg[26, 2] = 0.299368e01
-ker_sdryg[26, 3] = 0.280930e01
-ker_sdryg[26, 4] = 0.263616e01
-ker_sdryg[26, 5] = 0.247359e01
-ker_sdryg[26, 6] = 0.232094e01
-ker_sdryg[26, 7] = 0.217760e01
-ker_sdryg[26, 8] = 0.204301e01
-ker_sdryg[26, 9] = 0.191663e01
-ker_sdryg[26, 10] = 0.179795e01
-ker_sdryg[26, 11] = 0.168652e01
-ker_sdryg[26, 12] = 0.158188e01
-ker_sdryg[26, 13] = 0.148363e01
-ker_sdryg[26, 14] = 0.139136e01
-ker_sdryg[26, 15] = 0.130473e01
-ker_sdryg[26, 16] = 0.122337e01
-ker_sdryg[26, 17] = 0.114697e01
-ker_sdryg[26, 18] = 0.107523e01
-ker_sdryg[26, 19] = 0.100786e01
-ker_sdryg[26, 20] = 0.944586e00
-ker_sdryg[26, 21] = 0.885163e00
-ker_sdryg[26, 22] = 0.829352e00
-ker_sdryg[26, 23] = 0.776930e00
-ker_sdryg[26, 24] = 0.727686e00
-ker_sdryg[26, 25] = 0.681422e00
-ker_sdryg[26, 26] = 0.637952e00
-ker_sdryg[26, 27] = 0.597097e00
-ker_sdryg[26, 28] = 0.558692e00
-ker_sdryg[26, 29] = 0.522578e00
-ker_sdryg[26, 30] = 0.488602e00
-ker_sdryg[26, 31] = 0.456621e00
-ker_sdryg[26, 32] = 0.426495e00
-ker_sdryg[26, 33] = 0.398091e00
-ker_sdryg[26, 34] = 0.371278e00
-ker_sdryg[26, 35] = 0.345928e00
-ker_sdryg[26, 36] = 0.321917e00
-ker_sdryg[26, 37] = 0.299121e00
-ker_sdryg[26, 38] = 0.277419e00
-ker_sdryg[26, 39] = 0.256699e00
-ker_sdryg[26, 40] = 0.236857e00
-ker_sdryg[26, 41] = 0.217808e00
-ker_sdryg[26, 42] = 0.199498e00
-ker_sdryg[26, 43] = 0.181910e00
-ker_sdryg[26, 44] = 0.165073e00
-ker_sdryg[26, 45] = 0.149056e00
-ker_sdryg[26, 46] = 0.133952e00
-ker_sdryg[26, 47] = 0.119852e00
-ker_sdryg[26, 48] = 0.106824e00
-ker_sdryg[26, 49] = 0.948930e-01
-ker_sdryg[26, 50] = 0.840437e-01
-ker_sdryg[26, 51] = 0.742268e-01
-ker_sdryg[26, 52] = 0.653792e-01
-ker_sdryg[26, 53] = 0.574320e-01
-ker_sdryg[26, 54] = 0.503214e-01
-ker_sdryg[26, 55] = 0.439973e-01
-ker_sdryg[26, 56] = 0.384248e-01
-ker_sdryg[26, 57] = 0.335714e-01
-ker_sdryg[26, 58] = 0.294087e-01
-ker_sdryg[26, 59] = 0.259221e-01
-ker_sdryg[26, 60] = 0.230931e-01
-ker_sdryg[26, 61] = 0.208678e-01
-ker_sdryg[26, 62] = 0.192226e-01
-ker_sdryg[26, 63] = 0.181215e-01
-ker_sdryg[26, 64] = 0.175118e-01
-ker_sdryg[26, 65] = 0.173173e-01
-ker_sdryg[26, 66] = 0.175126e-01
-ker_sdryg[26, 67] = 0.180143e-01
-ker_sdryg[26, 68] = 0.187588e-01
-ker_sdryg[26, 69] = 0.197277e-01
-ker_sdryg[26, 70] = 0.208458e-01
-ker_sdryg[26, 71] = 0.220691e-01
-ker_sdryg[26, 72] = 0.233679e-01
-ker_sdryg[26, 73] = 0.247120e-01
-ker_sdryg[26, 74] = 0.260656e-01
-ker_sdryg[26, 75] = 0.274186e-01
-ker_sdryg[26, 76] = 0.287488e-01
-ker_sdryg[26, 77] = 0.300462e-01
-ker_sdryg[26, 78] = 0.313023e-01
-ker_sdryg[26, 79] = 0.325101e-01
-ker_sdryg[26, 80] = 0.336677e-01
-ker_sdryg[27, 1] = 0.319411e01
-ker_sdryg[27, 2] = 0.299775e01
-ker_sdryg[27, 3] = 0.281337e01
-ker_sdryg[27, 4] = 0.264023e01
-ker_sdryg[27, 5] = 0.247766e01
-ker_sdryg[27, 6] = 0.232501e01
-ker_sdryg[27, 7] = 0.218167e01
-ker_sdryg[27, 8] = 0.204708e01
-ker_sdryg[27, 9] = 0.192070e01
-ker_sdryg[27, 10] = 0.180203e01
-ker_sdryg[27, 11] = 0.169060e01
-ker_sdryg[27, 12] = 0.158596e01
-ker_sdryg[27, 13] = 0.148771e01
-ker_sdryg[27, 14] = 0.139545e01
-ker_sdryg[27, 15] = 0.130882e01
-ker_sdryg[27, 16] = 0.122746e01
-ker_sdryg[27, 17] = 0.115107e01
-ker_sdryg[27, 18] = 0.107934e01
-ker_sdryg[27, 19] = 0.101197e01
-ker_sdryg[27, 20] = 0.948712e00
-ker_sdryg[27, 21] = 0.889302e00
-ker_sdryg[27, 22] = 0.833506e00
-ker_sdryg[27, 23] = 0.781102e00
-ker_sdryg[27, 24] = 0.731880e00
-ker_sdryg[27, 25] = 0.685643e00
-ker_sdryg[27, 26] = 0.642205e00
-ker_sdryg[27, 27] = 0.601390e00
-ker_sdryg[27, 28] = 0.563032e00
-ker_sdryg[27, 29] = 0.526976e00
-ker_sdryg[27, 30] = 0.493071e00
-ker_sdryg[27, 31] = 0.461177e00
-ker_sdryg[27, 32] = 0.431158e00
-ker_sdryg[27, 33] = 0.402883e00
-ker_sdryg[27, 34] = 0.376229e00
-ker_sdryg[27, 35] = 0.351073e00
-ker_sdryg[27, 36] = 0.327297e00
-ker_sdryg[27, 37] = 0.304783e00
-ker_sdryg[27, 38] = 0.283419e00
-ker_sdryg[27, 39] = 0.263094e00
-ker_sdryg[27, 40] = 0.243701e00
-ker_sdryg[27, 41] = 0.225146e00
-ker_sdryg[27, 42] = 0.207352e00
-ker_sdryg[27, 43] = 0.190265e00
-ker_sdryg[27, 44] = 0.173872e00
-ker_sdryg[27, 45] = 0.158194e00
-ker_sdryg[27, 46] = 0.143292e00
-ker_sdryg[27, 47] = 0.129246e00
-ker_sdryg[27, 48] = 0.116137e00
-ker_sdryg[27, 49] = 0.104019e00
-ker_sdryg[27, 50] = 0.929097e-01
-ker_sdryg[27, 51] = 0.827874e-01
-ker_sdryg[27, 52] = 0.735998e-01
-ker_sdryg[27, 53] = 0.652790e-01
-ker_sdryg[27, 54] = 0.577537e-01
-ker_sdryg[27, 55] = 0.509584e-01
-ker_sdryg[27, 56] = 0.448376e-01
-ker_sdryg[27, 57] = 0.393546e-01
-ker_sdryg[27, 58] = 0.344768e-01
-ker_sdryg[27, 59] = 0.301795e-01
-ker_sdryg[27, 60] = 0.264605e-01
-ker_sdryg[27, 61] = 0.233008e-01
-ker_sdryg[27, 62] = 0.206714e-01
-ker_sdryg[27, 63] = 0.185744e-01
-ker_sdryg[27, 64] = 0.169884e-01
-ker_sdryg[27, 65] = 0.158478e-01
-ker_sdryg[27, 66] = 0.151582e-01
-ker_sdryg[27, 67] = 0.148323e-01
-ker_sdryg[27, 68] = 0.148592e-01
-ker_sdryg[27, 69] = 0.151721e-01
-ker_sdryg[27, 70] = 0.157308e-01
-ker_sdryg[27, 71] = 0.164769e-01
-ker_sdryg[27, 72] = 0.173707e-01
-ker_sdryg[27, 73] = 0.183846e-01
-ker_sdryg[27, 74] = 0.194688e-01
-ker_sdryg[27, 75] = 0.206001e-01
-ker_sdryg[27, 76] = 0.217573e-01
-ker_sdryg[27, 77] = 0.229174e-01
-ker_sdryg[27, 78] = 0.240651e-01
-ker_sdryg[27, 79] = 0.251891e-01
-ker_sdryg[27, 80] = 0.262800e-01
-ker_sdryg[28, 1] = 0.319759e01
-ker_sdryg[28, 2] = 0.300123e01
-ker_sdryg[28, 3] = 0.281685e01
-ker_sdryg[28, 4] = 0.264371e01
-ker_sdryg[28, 5] = 0.248114e01
-ker_sdryg[28, 6] = 0.232849e01
-ker_sdryg[28, 7] = 0.218516e01
-ker_sdryg[28, 8] = 0.205056e01
-ker_sdryg[28, 9] = 0.192418e01
-ker_sdryg[28, 10] = 0.180551e01
-ker_sdryg[28, 11] = 0.169408e01
-ker_sdryg[28, 12] = 0.158945e01
-ker_sdryg[28, 13] = 0.149120e01
-ker_sdryg[28, 14] = 0.139894e01
-ker_sdryg[28, 15] = 0.131231e01
-ker_sdryg[28, 16] = 0.123097e01
-ker_sdryg[28, 17] = 0.115458e01
-ker_sdryg[28, 18] = 0.108285e01
-ker_sdryg[28, 19] = 0.101549e01
-ker_sdryg[28, 20] = 0.952238e00
-ker_sdryg[28, 21] = 0.892837e00
-ker_sdryg[28, 22] = 0.837052e00
-ker_sdryg[28, 23] = 0.784662e00
-ker_sdryg[28, 24] = 0.735456e00
-ker_sdryg[28, 25] = 0.689239e00
-ker_sdryg[28, 26] = 0.645825e00
-ker_sdryg[28, 27] = 0.605039e00
-ker_sdryg[28, 28] = 0.566718e00
-ker_sdryg[28, 29] = 0.530704e00
-ker_sdryg[28, 30] = 0.496852e00
-ker_sdryg[28, 31] = 0.465022e00
-ker_sdryg[28, 32] = 0.435081e00
-ker_sdryg[28, 33] = 0.406902e00
-ker_sdryg[28, 34] = 0.380365e00
-ker_sdryg[28, 35] = 0.355351e00
-ker_sdryg[28, 36] = 0.331748e00
-ker_sdryg[28, 37] = 0.309445e00
-ker_sdryg[28, 38] = 0.288334e00
-ker_sdryg[28, 39] = 0.268309e00
-ker_sdryg[28, 40] = 0.249267e00
-ker_sdryg[28, 41] = 0.231112e00
-ker_sdryg[28, 42] = 0.213755e00
-ker_sdryg[28, 43] = 0.197125e00
-ker_sdryg[28, 44] = 0.181172e00
-ker_sdryg[28, 45] = 0.165882e00
-ker_sdryg[28, 46] = 0.151274e00
-ker_sdryg[28, 47] = 0.137400e00
-ker_sdryg[28, 48] = 0.124331e00
-ker_sdryg[28, 49] = 0.112135e00
-ker_sdryg[28, 50] = 0.100860e00
-ker_sdryg[28, 51] = 0.905169e-01
-ker_sdryg[28, 52] = 0.810815e-01
-ker_sdryg[28, 53] = 0.725012e-01
-ker_sdryg[28, 54] = 0.647084e-01
-ker_sdryg[28, 55] = 0.576308e-01
-ker_sdryg[28, 56] = 0.512005e-01
-ker_sdryg[28, 57] = 0.453625e-01
-ker_sdryg[28, 58] = 0.400717e-01
-ker_sdryg[28, 59] = 0.352935e-01
-ker_sdryg[28, 60] = 0.310071e-01
-ker_sdryg[28, 61] = 0.272018e-01
-ker_sdryg[28, 62] = 0.238669e-01
-ker_sdryg[28, 63] = 0.209938e-01
-ker_sdryg[28, 64] = 0.185775e-01
-ker_sdryg[28, 65] = 0.166174e-01
-ker_sdryg[28, 66] = 0.150755e-01
-ker_sdryg[28, 67] = 0.139364e-01
-ker_sdryg[28, 68] = 0.131851e-01
-ker_sdryg[28, 69] = 0.127769e-01
-ker_sdryg[28, 70] = 0.126668e-01
-ker_sdryg[28, 71] = 0.128310e-01
-ker_sdryg[28, 72] = 0.132148e-01
-ker_sdryg[28, 73] = 0.137746e-01
-ker_sdryg[28, 74] = 0.144895e-01
-ker_sdryg[28, 75] = 0.153140e-01
-ker_sdryg[28, 76] = 0.162131e-01
-ker_sdryg[28, 77] = 0.171648e-01
-ker_sdryg[28, 78] = 0.181488e-01
-ker_sdryg[28, 79] = 0.191394e-01
-ker_sdryg[28, 80] = 0.201280e-01
-ker_sdryg[29, 1] = 0.320057e01
-ker_sdryg[29, 2] = 0.300421e01
-ker_sdryg[29, 3] = 0.281983e01
-ker_sdryg[29, 4] = 0.264669e01
-ker_sdryg[29, 5] = 0.248412e01
-ker_sdryg[29, 6] = 0.233147e01
-ker_sdryg[29, 7] = 0.218814e01
-ker_sdryg[29, 8] = 0.205355e01
-ker_sdryg[29, 9] = 0.192717e01
-ker_sdryg[29, 10] = 0.180850e01
-ker_sdryg[29, 11] = 0.169707e01
-ker_sdryg[29, 12] = 0.159244e01
-ker_sdryg[29, 13] = 0.149419e01
-ker_sdryg[29, 14] = 0.140193e01
-ker_sdryg[29, 15] = 0.131530e01
-ker_sdryg[29, 16] = 0.123396e01
-ker_sdryg[29, 17] = 0.115758e01
-ker_sdryg[29, 18] = 0.108585e01
-ker_sdryg[29, 19] = 0.101850e01
-ker_sdryg[29, 20] = 0.955250e00
-ker_sdryg[29, 21] = 0.895856e00
-ker_sdryg[29, 22] = 0.840080e00
-ker_sdryg[29, 23] = 0.787700e00
-ker_sdryg[29, 24] = 0.738507e00
-ker_sdryg[29, 25] = 0.692305e00
-ker_sdryg[29, 26] = 0.648909e00
-ker_sdryg[29, 27] = 0.608145e00
-ker_sdryg[29, 28] = 0.569850e00
-ker_sdryg[29, 29] = 0.533869e00
-ker_sdryg[29, 30] = 0.500057e00
-ker_sdryg[29, 31] = 0.468274e00
-ker_sdryg[29, 32] = 0.438391e00
-ker_sdryg[29, 33] = 0.410283e00
-ker_sdryg[29, 34] = 0.383831e00
-ker_sdryg[29, 35] = 0.358922e00
-ker_sdryg[29, 36] = 0.335447e00
-ker_sdryg[29, 37] = 0.313300e00
-ker_sdryg[29, 38] = 0.292377e00
-ker_sdryg[29, 39] = 0.272578e00
-ker_sdryg[29, 40] = 0.253805e00
-ker_sdryg[29, 41] = 0.235964e00
-ker_sdryg[29, 42] = 0.218962e00
-ker_sdryg[29, 43] = 0.202721e00
-ker_sdryg[29, 44] = 0.187172e00
-ker_sdryg[29, 45] = 0.172272e00
-ker_sdryg[29, 46] = 0.158003e00
-ker_sdryg[29, 47] = 0.144383e00
-ker_sdryg[29, 48] = 0.131457e00
-ker_sdryg[29, 49] = 0.119287e00
-ker_sdryg[29, 50] = 0.107934e00
-ker_sdryg[29, 51] = 0.974376e-01
-ker_sdryg[29, 52] = 0.878049e-01
-ker_sdryg[29, 53] = 0.790110e-01
-ker_sdryg[29, 54] = 0.710047e-01
-ker_sdryg[29, 55] = 0.637201e-01
-ker_sdryg[29, 56] = 0.570871e-01
-ker_sdryg[29, 57] = 0.510391e-01
-ker_sdryg[29, 58] = 0.455190e-01
-ker_sdryg[29, 59] = 0.404790e-01
-ker_sdryg[29, 60] = 0.358835e-01
-ker_sdryg[29, 61] = 0.317075e-01
-ker_sdryg[29, 62] = 0.279360e-01
-ker_sdryg[29, 63] = 0.245579e-01
-ker_sdryg[29, 64] = 0.215683e-01
-ker_sdryg[29, 65] = 0.189675e-01
-ker_sdryg[29, 66] = 0.167538e-01
-ker_sdryg[29, 67] = 0.149086e-01
-ker_sdryg[29, 68] = 0.134333e-01
-ker_sdryg[29, 69] = 0.123230e-01
-ker_sdryg[29, 70] = 0.115303e-01
-ker_sdryg[29, 71] = 0.110545e-01
-ker_sdryg[29, 72] = 0.108420e-01
-ker_sdryg[29, 73] = 0.108817e-01
-ker_sdryg[29, 74] = 0.111244e-01
-ker_sdryg[29, 75] = 0.115437e-01
-ker_sdryg[29, 76] = 0.120983e-01
-ker_sdryg[29, 77] = 0.127573e-01
-ker_sdryg[29, 78] = 0.135034e-01
-ker_sdryg[29, 79] = 0.142993e-01
-ker_sdryg[29, 80] = 0.151279e-01
-ker_sdryg[30, 1] = 0.320312e01
-ker_sdryg[30, 2] = 0.300676e01
-ker_sdryg[30, 3] = 0.282237e01
-ker_sdryg[30, 4] = 0.264924e01
-ker_sdryg[30, 5] = 0.248667e01
-ker_sdryg[30, 6] = 0.233402e01
-ker_sdryg[30, 7] = 0.219069e01
-ker_sdryg[30, 8] = 0.205610e01
-ker_sdryg[30, 9] = 0.192972e01
-ker_sdryg[30, 10] = 0.181105e01
-ker_sdryg[30, 11] = 0.169962e01
-ker_sdryg[30, 12] = 0.159499e01
-ker_sdryg[30, 13] = 0.149674e01
-ker_sdryg[30, 14] = 0.140449e01
-ker_sdryg[30, 15] = 0.131786e01
-ker_sdryg[30, 16] = 0.123652e01
-ker_sdryg[30, 17] = 0.116014e01
-ker_sdryg[30, 18] = 0.108842e01
-ker_sdryg[30, 19] = 0.102107e01
-ker_sdryg[30, 20] = 0.957825e00
-ker_sdryg[30, 21] = 0.898436e00
-ker_sdryg[30, 22] = 0.842667e00
-ker_sdryg[30, 23] = 0.790295e00
-ker_sdryg[30, 24] = 0.741111e00
-ker_sdryg[30, 25] = 0.694920e00
-ker_sdryg[30, 26] = 0.651538e00
-ker_sdryg[30, 27] = 0.610791e00
-ker_sdryg[30, 28] = 0.572516e00
-ker_sdryg[30, 29] = 0.536559e00
-ker_sdryg[30, 30] = 0.502776e00
-ker_sdryg[30, 31] = 0.471029e00
-ker_sdryg[30, 32] = 0.441189e00
-ker_sdryg[30, 33] = 0.413133e00
-ker_sdryg[30, 34] = 0.386745e00
-ker_sdryg[30, 35] = 0.361914e00
-ker_sdryg[30, 36] = 0.338534e00
-ker_sdryg[30, 37] = 0.316502e00
-ker_sdryg[30, 38] = 0.295719e00
-ker_sdryg[30, 39] = 0.276089e00
-ker_sdryg[30, 40] = 0.257519e00
-ker_sdryg[30, 41] = 0.239918e00
-ker_sdryg[30, 42] = 0.223197e00
-ker_sdryg[30, 43] = 0.207273e00
-ker_sdryg[30, 44] = 0.192071e00
-ker_sdryg[30, 45] = 0.177528e00
-ker_sdryg[30, 46] = 0.163604e00
-ker_sdryg[30, 47] = 0.150282e00
-ker_sdryg[30, 48] = 0.137575e00
-ker_sdryg[30, 49] = 0.125525e00
-ker_sdryg[30, 50] = 0.114185e00
-ker_sdryg[30, 51] = 0.103610e00
-ker_sdryg[30, 52] = 0.938314e-01
-ker_sdryg[30, 53] = 0.848558e-01
-ker_sdryg[30, 54] = 0.766574e-01
-ker_sdryg[30, 55] = 0.691873e-01
-ker_sdryg[30, 56] = 0.623830e-01
-ker_sdryg[30, 57] = 0.561775e-01
-ker_sdryg[30, 58] = 0.505069e-01
-ker_sdryg[30, 59] = 0.453150e-01
-ker_sdryg[30, 60] = 0.405539e-01
-ker_sdryg[30, 61] = 0.361851e-01
-ker_sdryg[30, 62] = 0.321814e-01
-ker_sdryg[30, 63] = 0.285232e-01
-ker_sdryg[30, 64] = 0.251963e-01
-ker_sdryg[30, 65] = 0.221941e-01
-ker_sdryg[30, 66] = 0.195174e-01
-ker_sdryg[30, 67] = 0.171634e-01
-ker_sdryg[30, 68] = 0.151306e-01
-ker_sdryg[30, 69] = 0.134200e-01
-ker_sdryg[30, 70] = 0.120326e-01
-ker_sdryg[30, 71] = 0.109418e-01
-ker_sdryg[30, 72] = 0.101394e-01
-ker_sdryg[30, 73] = 0.961608e-02
-ker_sdryg[30, 74] = 0.933453e-02
-ker_sdryg[30, 75] = 0.927173e-02
-ker_sdryg[30, 76] = 0.940407e-02
-ker_sdryg[30, 77] = 0.969318e-02
-ker_sdryg[30, 78] = 0.101124e-01
-ker_sdryg[30, 79] = 0.106403e-01
-ker_sdryg[30, 80] = 0.112467e-01
-ker_sdryg[31, 1] = 0.320530e01
-ker_sdryg[31, 2] = 0.300894e01
-ker_sdryg[31, 3] = 0.282455e01
-ker_sdryg[31, 4] = 0.265142e01
-ker_sdryg[31, 5] = 0.248885e01
-ker_sdryg[31, 6] = 0.233620e01
-ker_sdryg[31, 7] = 0.219287e01
-ker_sdryg[31, 8] = 0.205828e01
-ker_sdryg[31, 9] = 0.193190e01
-ker_sdryg[31, 10] = 0.181323e01
-ker_sdryg[31, 11] = 0.170180e01
-ker_sdryg[31, 12] = 0.159717e01
-ker_sdryg[31, 13] = 0.149893e01
-ker_sdryg[31, 14] = 0.140668e01
-ker_sdryg[31, 15] = 0.132005e01
-ker_sdryg[31, 16] = 0.123871e01
-ker_sdryg[31, 17] = 0.116233e01
-ker_sdryg[31, 18] = 0.109061e01
-ker_sdryg[31, 19] = 0.102327e01
-ker_sdryg[31, 20] = 0.960026e00
-ker_sdryg[31, 21] = 0.900641e00
-ker_sdryg[31, 22] = 0.844877e00
-ker_sdryg[31, 23] = 0.792511e00
-ker_sdryg[31, 24] = 0.743334e00
-ker_sdryg[31, 25] = 0.697152e00
-ker_sdryg[31, 26] = 0.653780e00
-ker_sdryg[31, 27] = 0.613046e00
-ker_sdryg[31, 28] = 0.574786e00
-ker_sdryg[31, 29] = 0.538847e00
-ker_sdryg[31, 30] = 0.505086e00
-ker_sdryg[31, 31] = 0.473366e00
-ker_sdryg[31, 32] = 0.443558e00
-ker_sdryg[31, 33] = 0.415542e00
-ker_sdryg[31, 34] = 0.389201e00
-ker_sdryg[31, 35] = 0.364428e00
-ker_sdryg[31, 36] = 0.341118e00
-ker_sdryg[31, 37] = 0.319171e00
-ker_sdryg[31, 38] = 0.298492e00
-ker_sdryg[31, 39] = 0.278989e00
-ker_sdryg[31, 40] = 0.260571e00
-ker_sdryg[31, 41] = 0.243153e00
-ker_sdryg[31, 42] = 0.226648e00
-ker_sdryg[31, 43] = 0.210975e00
-ker_sdryg[31, 44] = 0.196056e00
-ker_sdryg[31, 45] = 0.181823e00
-ker_sdryg[31, 46] = 0.168217e00
-ker_sdryg[31, 47] = 0.155200e00
-ker_sdryg[31, 48] = 0.142755e00
-ker_sdryg[31, 49] = 0.130895e00
-ker_sdryg[31, 50] = 0.119654e00
-ker_sdryg[31, 51] = 0.109081e00
-ker_sdryg[31, 52] = 0.992231e-01
-ker_sdryg[31, 53] = 0.901085e-01
-ker_sdryg[31, 54] = 0.817403e-01
-ker_sdryg[31, 55] = 0.740936e-01
-ker_sdryg[31, 56] = 0.671220e-01
-ker_sdryg[31, 57] = 0.607667e-01
-ker_sdryg[31, 58] = 0.549649e-01
-ker_sdryg[31, 59] = 0.496562e-01
-ker_sdryg[31, 60] = 0.447864e-01
-ker_sdryg[31, 61] = 0.403087e-01
-ker_sdryg[31, 62] = 0.361850e-01
-ker_sdryg[31, 63] = 0.323859e-01
-ker_sdryg[31, 64] = 0.288877e-01
-ker_sdryg[31, 65] = 0.256749e-01
-ker_sdryg[31, 66] = 0.227386e-01
-ker_sdryg[31, 67] = 0.200734e-01
-ker_sdryg[31, 68] = 0.176775e-01
-ker_sdryg[31, 69] = 0.155527e-01
-ker_sdryg[31, 70] = 0.136989e-01
-ker_sdryg[31, 71] = 0.121210e-01
-ker_sdryg[31, 72] = 0.108058e-01
-ker_sdryg[31, 73] = 0.975234e-02
-ker_sdryg[31, 74] = 0.896449e-02
-ker_sdryg[31, 75] = 0.840572e-02
-ker_sdryg[31, 76] = 0.807166e-02
-ker_sdryg[31, 77] = 0.793136e-02
-ker_sdryg[31, 78] = 0.797231e-02
-ker_sdryg[31, 79] = 0.815684e-02
-ker_sdryg[31, 80] = 0.847058e-02
-ker_sdryg[32, 1] = 0.320717e01
-ker_sdryg[32, 2] = 0.301080e01
-ker_sdryg[32, 3] = 0.282642e01
-ker_sdryg[32, 4] = 0.265329e01
-ker_sdryg[32, 5] = 0.249072e01
-ker_sdryg[32, 6] = 0.233807e01
-ker_sdryg[32, 7] = 0.219474e01
-ker_sdryg[32, 8] = 0.206015e01
-ker_sdryg[32, 9] = 0.193377e01
-ker_sdryg[32, 10] = 0.181510e01
-ker_sdryg[32, 11] = 0.170367e01
-ker_sdryg[32, 12] = 0.159904e01
-ker_sdryg[32, 13] = 0.150080e01
-ker_sdryg[32, 14] = 0.140855e01
-ker_sdryg[32, 15] = 0.132192e01
-ker_sdryg[32, 16] = 0.124058e01
-ker_sdryg[32, 17] = 0.116421e01
-ker_sdryg[32, 18] = 0.109249e01
-ker_sdryg[32, 19] = 0.102514e01
-ker_sdryg[32, 20] = 0.961907e00
-ker_sdryg[32, 21] = 0.902526e00
-ker_sdryg[32, 22] = 0.846765e00
-ker_sdryg[32, 23] = 0.794404e00
-ker_sdryg[32, 24] = 0.745233e00
-ker_sdryg[32, 25] = 0.699057e00
-ker_sdryg[32, 26] = 0.655693e00
-ker_sdryg[32, 27] = 0.614968e00
-ker_sdryg[32, 28] = 0.576720e00
-ker_sdryg[32, 29] = 0.540795e00
-ker_sdryg[32, 30] = 0.507051e00
-ker_sdryg[32, 31] = 0.475350e00
-ker_sdryg[32, 32] = 0.445567e00
-ker_sdryg[32, 33] = 0.417580e00
-ker_sdryg[32, 34] = 0.391276e00
-ker_sdryg[32, 35] = 0.366546e00
-ker_sdryg[32, 36] = 0.343288e00
-ker_sdryg[32, 37] = 0.321405e00
-ker_sdryg[32, 38] = 0.300804e00
-ker_sdryg[32, 39] = 0.281394e00
-ker_sdryg[32, 40] = 0.263091e00
-ker_sdryg[32, 41] = 0.245809e00
-ker_sdryg[32, 42] = 0.229469e00
-ker_sdryg[32, 43] = 0.213990e00
-ker_sdryg[32, 44] = 0.199297e00
-ker_sdryg[32, 45] = 0.185318e00
-ker_sdryg[32, 46] = 0.171989e00
-ker_sdryg[32, 47] = 0.159255e00
-ker_sdryg[32, 48] = 0.147081e00
-ker_sdryg[32, 49] = 0.135452e00
-ker_sdryg[32, 50] = 0.124376e00
-ker_sdryg[32, 51] = 0.113884e00
-ker_sdryg[32, 52] = 0.104021e00
-ker_sdryg[32, 53] = 0.948256e-01
-ker_sdryg[32, 54] = 0.863244e-01
-ker_sdryg[32, 55] = 0.785179e-01
-ker_sdryg[32, 56] = 0.713821e-01
-ker_sdryg[32, 57] = 0.648731e-01
-ker_sdryg[32, 58] = 0.589359e-01
-ker_sdryg[32, 59] = 0.535119e-01
-ker_sdryg[32, 60] = 0.485445e-01
-ker_sdryg[32, 61] = 0.439825e-01
-ker_sdryg[32, 62] = 0.397817e-01
-ker_sdryg[32, 63] = 0.359045e-01
-ker_sdryg[32, 64] = 0.323209e-01
-ker_sdryg[32, 65] = 0.290070e-01
-ker_sdryg[32, 66] = 0.259441e-01
-ker_sdryg[32, 67] = 0.231196e-01
-ker_sdryg[32, 68] = 0.205267e-01
-ker_sdryg[32, 69] = 0.181592e-01
-ker_sdryg[32, 70] = 0.160162e-01
-ker_sdryg[32, 71] = 0.141022e-01
-ker_sdryg[32, 72] = 0.124158e-01
-ker_sdryg[32, 73] = 0.109584e-01
-ker_sdryg[32, 74] = 0.973316e-02
-ker_sdryg[32, 75] = 0.873966e-02
-ker_sdryg[32, 76] = 0.796029e-02
-ker_sdryg[32, 77] = 0.738911e-02
-ker_sdryg[32, 78] = 0.702077e-02
-ker_sdryg[32, 79] = 0.682454e-02
-ker_sdryg[32, 80] = 0.678880e-02
-ker_sdryg[33, 1] = 0.320876e01
-ker_sdryg[33, 2] = 0.301240e01
-ker_sdryg[33, 3] = 0.282802e01
-ker_sdryg[33, 4] = 0.265489e01
-ker_sdryg[33, 5] = 0.249232e01
-ker_sdryg[33, 6] = 0.233967e01
-ker_sdryg[33, 7] = 0.219633e01
-ker_sdryg[33, 8] = 0.206174e01
-ker_sdryg[33, 9] = 0.193536e01
-ker_sdryg[33, 10] = 0.181670e01
-ker_sdryg[33, 11] = 0.170527e01
-ker_sdryg[33, 12] = 0.160064e01
-ker_sdryg[33, 13] = 0.150240e01
-ker_sdryg[33, 14] = 0.141015e01
-ker_sdryg[33, 15] = 0.132352e01
-ker_sdryg[33, 16] = 0.124219e01
-ker_sdryg[33, 17] = 0.116581e01
-ker_sdryg[33, 18] = 0.109409e01
-ker_sdryg[33, 19] = 0.102675e01
-ker_sdryg[33, 20] = 0.963516e00
-ker_sdryg[33, 21] = 0.904137e00
-ker_sdryg[33, 22] = 0.848379e00
-ker_sdryg[33, 23] = 0.796021e00
-ker_sdryg[33, 24] = 0.746854e00
-ker_sdryg[33, 25] = 0.700684e00
-ker_sdryg[33, 26] = 0.657326e00
-ker_sdryg[33, 27] = 0.616608e00
-ker_sdryg[33, 28] = 0.578369e00
-ker_sdryg[33, 29] = 0.542455e00
-ker_sdryg[33, 30] = 0.508723e00
-ker_sdryg[33, 31] = 0.477038e00
-ker_sdryg[33, 32] = 0.447273e00
-ker_sdryg[33, 33] = 0.419308e00
-ker_sdryg[33, 34] = 0.393031e00
-ker_sdryg[33, 35] = 0.368334e00
-ker_sdryg[33, 36] = 0.345115e00
-ker_sdryg[33, 37] = 0.323280e00
-ker_sdryg[33, 38] = 0.302737e00
-ker_sdryg[33, 39] = 0.283398e00
-ker_sdryg[33, 40] = 0.265179e00
-ker_sdryg[33, 41] = 0.248001e00
-ker_sdryg[33, 42] = 0.231784e00
-ker_sdryg[33, 43] = 0.216454e00
-ker_sdryg[33, 44] = 0.201936e00
-ker_sdryg[33, 45] = 0.188160e00
-ker_sdryg[33, 46] = 0.175059e00
-ker_sdryg[33, 47] = 0.162573e00
-ker_sdryg[33, 48] = 0.150653e00
-ker_sdryg[33, 49] = 0.139264e00
-ker_sdryg[33, 50] = 0.128391e00
-ker_sdryg[33, 51] = 0.118043e00
-ker_sdryg[33, 52] = 0.108246e00
-ker_sdryg[33, 53] = 0.990391e-01
-ker_sdryg[33, 54] = 0.904578e-01
-ker_sdryg[33, 55] = 0.825243e-01
-ker_sdryg[33, 56] = 0.752379e-01
-ker_sdryg[33, 57] = 0.685753e-01
-ker_sdryg[33, 58] = 0.624955e-01
-ker_sdryg[33, 59] = 0.569470e-01
-ker_sdryg[33, 60] = 0.518753e-01
-ker_sdryg[33, 61] = 0.472275e-01
-ker_sdryg[33, 62] = 0.429558e-01
-ker_sdryg[33, 63] = 0.390186e-01
-ker_sdryg[33, 64] = 0.353804e-01
-ker_sdryg[33, 65] = 0.320117e-01
-ker_sdryg[33, 66] = 0.288882e-01
-ker_sdryg[33, 67] = 0.259908e-01
-ker_sdryg[33, 68] = 0.233051e-01
-ker_sdryg[33, 69] = 0.208197e-01
-ker_sdryg[33, 70] = 0.185279e-01
-ker_sdryg[33, 71] = 0.164268e-01
-ker_sdryg[33, 72] = 0.145150e-01
-ker_sdryg[33, 73] = 0.127936e-01
-ker_sdryg[33, 74] = 0.112662e-01
-ker_sdryg[33, 75] = 0.993136e-02
-ker_sdryg[33, 76] = 0.879659e-02
-ker_sdryg[33, 77] = 0.785167e-02
-ker_sdryg[33, 78] = 0.709416e-02
-ker_sdryg[33, 79] = 0.653114e-02
-ker_sdryg[33, 80] = 0.613422e-02
-ker_sdryg[34, 1] = 0.321013e01
-ker_sdryg[34, 2] = 0.301377e01
-ker_sdryg[34, 3] = 0.282938e01
-ker_sdryg[34, 4] = 0.265625e01
-ker_sdryg[34, 5] = 0.249368e01
-ker_sdryg[34, 6] = 0.234103e01
-ker_sdryg[34, 7] = 0.219770e01
-ker_sdryg[34, 8] = 0.206311e01
-ker_sdryg[34, 9] = 0.193673e01
-ker_sdryg[34, 10] = 0.181807e01
-ker_sdryg[34, 11] = 0.170664e01
-ker_sdryg[34, 12] = 0.160201e01
-ker_sdryg[34, 13] = 0.150377e01
-ker_sdryg[34, 14] = 0.141152e01
-ker_sdryg[34, 15] = 0.132489e01
-ker_sdryg[34, 16] = 0.124356e01
-ker_sdryg[34, 17] = 0.116718e01
-ker_sdryg[34, 18] = 0.109547e01
-ker_sdryg[34, 19] = 0.102812e01
-ker_sdryg[34, 20] = 0.964891e00
-ker_sdryg[34, 21] = 0.905514e00
-ker_sdryg[34, 22] = 0.849759e00
-ker_sdryg[34, 23] = 0.797403e00
-ker_sdryg[34, 24] = 0.748240e00
-ker_sdryg[34, 25] = 0.702073e00
-ker_sdryg[34, 26] = 0.658720e00
-ker_sdryg[34, 27] = 0.618008e00
-ker_sdryg[34, 28] = 0.579775e00
-ker_sdryg[34, 29] = 0.543869e00
-ker_sdryg[34, 30] = 0.510147e00
-ker_sdryg[34, 31] = 0.478474e00
-ker_sdryg[34, 32] = 0.448723e00
-ker_sdryg[34, 33] = 0.420775e00
-ker_sdryg[34, 34] = 0.394518e00
-ker_sdryg[34, 35] = 0.369845e00
-ker_sdryg[34, 36] = 0.346657e00
-ker_sdryg[34, 37] = 0.324858e00
-ker_sdryg[34, 38] = 0.304358e00
-ker_sdryg[34, 39] = 0.285071e00
-ker_sdryg[34, 40] = 0.266917e00
-ker_sdryg[34, 41] = 0.249816e00
-ker_sdryg[34, 42] = 0.233693e00
-ker_sdryg[34, 43] = 0.218475e00
-ker_sdryg[34, 44] = 0.204091e00
-ker_sdryg[34, 45] = 0.190473e00
-ker_sdryg[34, 46] = 0.177555e00
-ker_sdryg[34, 47] = 0.165275e00
-ker_sdryg[34, 48] = 0.153578e00
-ker_sdryg[34, 49] = 0.142416e00
-ker_sdryg[34, 50] = 0.131757e00
-ker_sdryg[34, 51] = 0.121589e00
-ker_sdryg[34, 52] = 0.111916e00
-ker_sdryg[34, 53] = 0.102764e00
-ker_sdryg[34, 54] = 0.941652e-01
-ker_sdryg[34, 55] = 0.861526e-01
-ker_sdryg[34, 56] = 0.787448e-01
-ker_sdryg[34, 57] = 0.719403e-01
-ker_sdryg[34, 58] = 0.657167e-01
-ker_sdryg[34, 59] = 0.600352e-01
-ker_sdryg[34, 60] = 0.548480e-01
-ker_sdryg[34, 61] = 0.501041e-01
-ker_sdryg[34, 62] = 0.457547e-01
-ker_sdryg[34, 63] = 0.417550e-01
-ker_sdryg[34, 64] = 0.380663e-01
-ker_sdryg[34, 65] = 0.346552e-01
-ker_sdryg[34, 66] = 0.314935e-01
-ker_sdryg[34, 67] = 0.285580e-01
-ker_sdryg[34, 68] = 0.258292e-01
-ker_sdryg[34, 69] = 0.232916e-01
-ker_sdryg[34, 70] = 0.209331e-01
-ker_sdryg[34, 71] = 0.187445e-01
-ker_sdryg[34, 72] = 0.167197e-01
-ker_sdryg[34, 73] = 0.148560e-01
-ker_sdryg[34, 74] = 0.131512e-01
-ker_sdryg[34, 75] = 0.116067e-01
-ker_sdryg[34, 76] = 0.102254e-01
-ker_sdryg[34, 77] = 0.900807e-02
-ker_sdryg[34, 78] = 0.795670e-02
-ker_sdryg[34, 79] = 0.707317e-02
-ker_sdryg[34, 80] = 0.635774e-02
-ker_sdryg[35, 1] = 0.321130e01
-ker_sdryg[35, 2] = 0.301493e01
-ker_sdryg[35, 3] = 0.283055e01
-ker_sdryg[35, 4] = 0.265742e01
-ker_sdryg[35, 5] = 0.249485e01
-ker_sdryg[35, 6] = 0.234220e01
-ker_sdryg[35, 7] = 0.219887e01
-ker_sdryg[35, 8] = 0.206428e01
-ker_sdryg[35, 9] = 0.193790e01
-ker_sdryg[35, 10] = 0.181923e01
-ker_sdryg[35, 11] = 0.170781e01
-ker_sdryg[35, 12] = 0.160318e01
-ker_sdryg[35, 13] = 0.150494e01
-ker_sdryg[35, 14] = 0.141269e01
-ker_sdryg[35, 15] = 0.132607e01
-ker_sdryg[35, 16] = 0.124473e01
-ker_sdryg[35, 17] = 0.116835e01
-ker_sdryg[35, 18] = 0.109664e01
-ker_sdryg[35, 19] = 0.102930e01
-ker_sdryg[35, 20] = 0.966067e00
-ker_sdryg[35, 21] = 0.906692e00
-ker_sdryg[35, 22] = 0.850938e00
-ker_sdryg[35, 23] = 0.798585e00
-ker_sdryg[35, 24] = 0.749424e00
-ker_sdryg[35, 25] = 0.703260e00
-ker_sdryg[35, 26] = 0.659911e00
-ker_sdryg[35, 27] = 0.619203e00
-ker_sdryg[35, 28] = 0.580975e00
-ker_sdryg[35, 29] = 0.545076e00
-ker_sdryg[35, 30] = 0.511361e00
-ker_sdryg[35, 31] = 0.479697e00
-ker_sdryg[35, 32] = 0.449956e00
-ker_sdryg[35, 33] = 0.422022e00
-ker_sdryg[35, 34] = 0.395780e00
-ker_sdryg[35, 35] = 0.371126e00
-ker_sdryg[35, 36] = 0.347960e00
-ker_sdryg[35, 37] = 0.326188e00
-ker_sdryg[35, 38] = 0.305721e00
-ker_sdryg[35, 39] = 0.286474e00
-ker_sdryg[35, 40] = 0.268367e00
-ker_sdryg[35, 41] = 0.251325e00
-ker_sdryg[35, 42] = 0.235272e00
-ker_sdryg[35, 43] = 0.220139e00
-ker_sdryg[35, 44] = 0.205857e00
-ker_sdryg[35, 45] = 0.192361e00
-ker_sdryg[35, 46] = 0.179586e00
-ker_sdryg[35, 47] = 0.167472e00
-ker_sdryg[35, 48] = 0.155960e00
-ker_sdryg[35, 49] = 0.144998e00
-ker_sdryg[35, 50] = 0.134544e00
-ker_sdryg[35, 51] = 0.124567e00
-ker_sdryg[35, 52] = 0.115053e00
-ker_sdryg[35, 53] = 0.106009e00
-ker_sdryg[35, 54] = 0.974547e-01
-ker_sdryg[35, 55] = 0.894206e-01
-ker_sdryg[35, 56] = 0.819354e-01
-ker_sdryg[35, 57] = 0.750153e-01
-ker_sdryg[35, 58] = 0.686578e-01
-ker_sdryg[35, 59] = 0.628415e-01
-ker_sdryg[35, 60] = 0.575301e-01
-ker_sdryg[35, 61] = 0.526787e-01
-ker_sdryg[35, 62] = 0.482402e-01
-ker_sdryg[35, 63] = 0.441689e-01
-ker_sdryg[35, 64] = 0.404234e-01
-ker_sdryg[35, 65] = 0.369676e-01
-ker_sdryg[35, 66] = 0.337703e-01
-ker_sdryg[35, 67] = 0.308051e-01
-ker_sdryg[35, 68] = 0.280497e-01
-ker_sdryg[35, 69] = 0.254855e-01
-ker_sdryg[35, 70] = 0.230970e-01
-ker_sdryg[35, 71] = 0.208713e-01
-ker_sdryg[35, 72] = 0.187982e-01
-ker_sdryg[35, 73] = 0.168703e-01
-ker_sdryg[35, 74] = 0.150815e-01
-ker_sdryg[35, 75] = 0.134288e-01
-ker_sdryg[35, 76] = 0.119116e-01
-ker_sdryg[35, 77] = 0.105294e-01
-ker_sdryg[35, 78] = 0.928417e-02
-ker_sdryg[35, 79] = 0.817987e-02
-ker_sdryg[35, 80] = 0.721421e-02
-ker_sdryg[36, 1] = 0.321230e01
-ker_sdryg[36, 2] = 0.301593e01
-ker_sdryg[36, 3] = 0.283155e01
-ker_sdryg[36, 4] = 0.265842e01
-ker_sdryg[36, 5] = 0.249585e01
-ker_sdryg[36, 6] = 0.234320e01
-ker_sdryg[36, 7] = 0.219987e01
-ker_sdryg[36, 8] = 0.206528e01
-ker_sdryg[36, 9] = 0.193890e01
-ker_sdryg[36, 10] = 0.182024e01
-ker_sdryg[36, 11] = 0.170881e01
-ker_sdryg[36, 12] = 0.160418e01
-ker_sdryg[36, 13] = 0.150594e01
-ker_sdryg[36, 14] = 0.141369e01
-ker_sdryg[36, 15] = 0.132707e01
-ker_sdryg[36, 16] = 0.124573e01
-ker_sdryg[36, 17] = 0.116936e01
-ker_sdryg[36, 18] = 0.109764e01
-ker_sdryg[36, 19] = 0.103030e01
-ker_sdryg[36, 20] = 0.967073e00
-ker_sdryg[36, 21] = 0.907699e00
-ker_sdryg[36, 22] = 0.851947e00
-ker_sdryg[36, 23] = 0.799595e00
-ker_sdryg[36, 24] = 0.750436e00
-ker_sdryg[36, 25] = 0.704275e00
-ker_sdryg[36, 26] = 0.660928e00
-ker_sdryg[36, 27] = 0.620224e00
-ker_sdryg[36, 28] = 0.582000e00
-ker_sdryg[36, 29] = 0.546105e00
-ker_sdryg[36, 30] = 0.512396e00
-ker_sdryg[36, 31] = 0.480738e00
-ker_sdryg[36, 32] = 0.451006e00
-ker_sdryg[36, 33] = 0.423081e00
-ker_sdryg[36, 34] = 0.396851e00
-ker_sdryg[36, 35] = 0.372212e00
-ker_sdryg[36, 36] = 0.349063e00
-ker_sdryg[36, 37] = 0.327311e00
-ker_sdryg[36, 38] = 0.306869e00
-ker_sdryg[36, 39] = 0.287653e00
-ker_sdryg[36, 40] = 0.269582e00
-ker_sdryg[36, 41] = 0.252583e00
-ker_sdryg[36, 42] = 0.236584e00
-ker_sdryg[36, 43] = 0.221515e00
-ker_sdryg[36, 44] = 0.207311e00
-ker_sdryg[36, 45] = 0.193907e00
-ker_sdryg[36, 46] = 0.181243e00
-ker_sdryg[36, 47] = 0.169258e00
-ker_sdryg[36, 48] = 0.157896e00
-ker_sdryg[36, 49] = 0.147102e00
-ker_sdryg[36, 50] = 0.136828e00
-ker_sdryg[36, 51] = 0.127035e00
-ker_sdryg[36, 52] = 0.117693e00
-ker_sdryg[36, 53] = 0.108790e00
-ker_sdryg[36, 54] = 0.100330e00
-ker_sdryg[36, 55] = 0.923315e-01
-ker_sdryg[36, 56] = 0.848218e-01
-ker_sdryg[36, 57] = 0.778261e-01
-ker_sdryg[36, 58] = 0.713586e-01
-ker_sdryg[36, 59] = 0.654162e-01
-ker_sdryg[36, 60] = 0.599783e-01
-ker_sdryg[36, 61] = 0.550109e-01
-ker_sdryg[36, 62] = 0.504721e-01
-ker_sdryg[36, 63] = 0.463179e-01
-ker_sdryg[36, 64] = 0.425060e-01
-ker_sdryg[36, 65] = 0.389979e-01
-ker_sdryg[36, 66] = 0.357599e-01
-ker_sdryg[36, 67] = 0.327630e-01
-ker_sdryg[36, 68] = 0.299825e-01
-ker_sdryg[36, 69] = 0.273977e-01
-ker_sdryg[36, 70] = 0.249908e-01
-ker_sdryg[36, 71] = 0.227467e-01
-ker_sdryg[36, 72] = 0.206528e-01
-ker_sdryg[36, 73] = 0.186985e-01
-ker_sdryg[36, 74] = 0.168752e-01
-ker_sdryg[36, 75] = 0.151760e-01
-ker_sdryg[36, 76] = 0.135960e-01
-ker_sdryg[36, 77] = 0.121320e-01
-ker_sdryg[36, 78] = 0.107828e-01
-ker_sdryg[36, 79] = 0.954776e-02
-ker_sdryg[36, 80] = 0.842894e-02
-ker_sdryg[37, 1] = 0.321315e01
-ker_sdryg[37, 2] = 0.301679e01
-ker_sdryg[37, 3] = 0.283241e01
-ker_sdryg[37, 4] = 0.265928e01
-ker_sdryg[37, 5] = 0.249671e01
-ker_sdryg[37, 6] = 0.234406e01
-ker_sdryg[37, 7] = 0.220072e01
-ker_sdryg[37, 8] = 0.206614e01
-ker_sdryg[37, 9] = 0.193976e01
-ker_sdryg[37, 10] = 0.182109e01
-ker_sdryg[37, 11] = 0.170967e01
-ker_sdryg[37, 12] = 0.160504e01
-ker_sdryg[37, 13] = 0.150680e01
-ker_sdryg[37, 14] = 0.141455e01
-ker_sdryg[37, 15] = 0.132793e01
-ker_sdryg[37, 16] = 0.124659e01
-ker_sdryg[37, 17] = 0.117022e01
-ker_sdryg[37, 18] = 0.109850e01
-ker_sdryg[37, 19] = 0.103116e01
-ker_sdryg[37, 20] = 0.967933e00
-ker_sdryg[37, 21] = 0.908560e00
-ker_sdryg[37, 22] = 0.852809e00
-ker_sdryg[37, 23] = 0.800458e00
-ker_sdryg[37, 24] = 0.751301e00
-ker_sdryg[37, 25] = 0.705142e00
-ker_sdryg[37, 26] = 0.661797e00
-ker_sdryg[37, 27] = 0.621095e00
-ker_sdryg[37, 28] = 0.582874e00
-ker_sdryg[37, 29] = 0.546983e00
-ker_sdryg[37, 30] = 0.513278e00
-ker_sdryg[37, 31] = 0.481626e00
-ker_sdryg[37, 32] = 0.451901e00
-ker_sdryg[37, 33] = 0.423983e00
-ker_sdryg[37, 34] = 0.397762e00
-ker_sdryg[37, 35] = 0.373134e00
-ker_sdryg[37, 36] = 0.349998e00
-ker_sdryg[37, 37] = 0.328262e00
-ker_sdryg[37, 38] = 0.307839e00
-ker_sdryg[37, 39] = 0.288645e00
-ker_sdryg[37, 40] = 0.270603e00
-ker_sdryg[37, 41] = 0.253637e00
-ker_sdryg[37, 42] = 0.237677e00
-ker_sdryg[37, 43] = 0.222657e00
-ker_sdryg[37, 44] = 0.208511e00
-ker_sdryg[37, 45] = 0.195178e00
-ker_sdryg[37, 46] = 0.182599e00
-ker_sdryg[37, 47] = 0.170714e00
-ker_sdryg[37, 48] = 0.159470e00
-ker_sdryg[37, 49] = 0.148812e00
-ker_sdryg[37, 50] = 0.138690e00
-ker_sdryg[37, 51] = 0.129060e00
-ker_sdryg[37, 52] = 0.119883e00
-ker_sdryg[37, 53] = 0.111134e00
-ker_sdryg[37, 54] = 0.102800e00
-ker_sdryg[37, 55] = 0.948842e-01
-ker_sdryg[37, 56] = 0.874029e-01
-ker_sdryg[37, 57] = 0.803806e-01
-ker_sdryg[37, 58] = 0.738398e-01
-ker_sdryg[37, 59] = 0.677928e-01
-ker_sdryg[37, 60] = 0.622361e-01
-ker_sdryg[37, 61] = 0.571501e-01
-ker_sdryg[37, 62] = 0.525027e-01
-ker_sdryg[37, 63] = 0.482549e-01
-ker_sdryg[37, 64] = 0.443658e-01
-ker_sdryg[37, 65] = 0.407958e-01
-ker_sdryg[37, 66] = 0.375092e-01
-ker_sdryg[37, 67] = 0.344748e-01
-ker_sdryg[37, 68] = 0.316655e-01
-ker_sdryg[37, 69] = 0.290583e-01
-ker_sdryg[37, 70] = 0.266339e-01
-ker_sdryg[37, 71] = 0.243755e-01
-ker_sdryg[37, 72] = 0.222689e-01
-ker_sdryg[37, 73] = 0.203019e-01
-ker_sdryg[37, 74] = 0.184641e-01
-ker_sdryg[37, 75] = 0.167467e-01
-ker_sdryg[37, 76] = 0.151420e-01
-ker_sdryg[37, 77] = 0.136442e-01
-ker_sdryg[37, 78] = 0.122492e-01
-ker_sdryg[37, 79] = 0.109531e-01
-ker_sdryg[37, 80] = 0.975456e-02
-ker_sdryg[38, 1] = 0.321388e01
-ker_sdryg[38, 2] = 0.301752e01
-ker_sdryg[38, 3] = 0.283314e01
-ker_sdryg[38, 4] = 0.266001e01
-ker_sdryg[38, 5] = 0.249744e01
-ker_sdryg[38, 6] = 0.234479e01
-ker_sdryg[38, 7] = 0.220146e01
-ker_sdryg[38, 8] = 0.206687e01
-ker_sdryg[38, 9] = 0.194049e01
-ker_sdryg[38, 10] = 0.182182e01
-ker_sdryg[38, 11] = 0.171040e01
-ker_sdryg[38, 12] = 0.160577e01
-ker_sdryg[38, 13] = 0.150753e01
-ker_sdryg[38, 14] = 0.141528e01
-ker_sdryg[38, 15] = 0.132866e01
-ker_sdryg[38, 16] = 0.124732e01
-ker_sdryg[38, 17] = 0.117095e01
-ker_sdryg[38, 18] = 0.109924e01
-ker_sdryg[38, 19] = 0.103190e01
-ker_sdryg[38, 20] = 0.968669e00
-ker_sdryg[38, 21] = 0.909296e00
-ker_sdryg[38, 22] = 0.853546e00
-ker_sdryg[38, 23] = 0.801197e00
-ker_sdryg[38, 24] = 0.752040e00
-ker_sdryg[38, 25] = 0.705882e00
-ker_sdryg[38, 26] = 0.662539e00
-ker_sdryg[38, 27] = 0.621840e00
-ker_sdryg[38, 28] = 0.583621e00
-ker_sdryg[38, 29] = 0.547733e00
-ker_sdryg[38, 30] = 0.514032e00
-ker_sdryg[38, 31] = 0.482384e00
-ker_sdryg[38, 32] = 0.452663e00
-ker_sdryg[38, 33] = 0.424751e00
-ker_sdryg[38, 34] = 0.398537e00
-ker_sdryg[38, 35] = 0.373917e00
-ker_sdryg[38, 36] = 0.350791e00
-ker_sdryg[38, 37] = 0.329068e00
-ker_sdryg[38, 38] = 0.308659e00
-ker_sdryg[38, 39] = 0.289483e00
-ker_sdryg[38, 40] = 0.271461e00
-ker_sdryg[38, 41] = 0.254521e00
-ker_sdryg[38, 42] = 0.238592e00
-ker_sdryg[38, 43] = 0.223608e00
-ker_sdryg[38, 44] = 0.209507e00
-ker_sdryg[38, 45] = 0.196227e00
-ker_sdryg[38, 46] = 0.183712e00
-ker_sdryg[38, 47] = 0.171905e00
-ker_sdryg[38, 48] = 0.160752e00
-ker_sdryg[38, 49] = 0.150201e00
-ker_sdryg[38, 50] = 0.140203e00
-ker_sdryg[38, 51] = 0.130711e00
-ker_sdryg[38, 52] = 0.121682e00
-ker_sdryg[38, 53] = 0.113083e00
-ker_sdryg[38, 54] = 0.104887e00
-ker_sdryg[38, 55] = 0.970832e-01
-ker_sdryg[38, 56] = 0.896740e-01
-ker_sdryg[38, 57] = 0.826740e-01
-ker_sdryg[38, 58] = 0.761051e-01
-ker_sdryg[38, 59] = 0.699873e-01
-ker_sdryg[38, 60] = 0.643313e-01
-ker_sdryg[38, 61] = 0.591334e-01
-ker_sdryg[38, 62] = 0.543747e-01
-ker_sdryg[38, 63] = 0.500254e-01
-ker_sdryg[38, 64] = 0.460488e-01
-ker_sdryg[38, 65] = 0.424067e-01
-ker_sdryg[38, 66] = 0.390625e-01
-ker_sdryg[38, 67] = 0.359829e-01
-ker_sdryg[38, 68] = 0.331387e-01
-ker_sdryg[38, 69] = 0.305049e-01
-ker_sdryg[38, 70] = 0.280601e-01
-ker_sdryg[38, 71] = 0.257861e-01
-ker_sdryg[38, 72] = 0.236673e-01
-ker_sdryg[38, 73] = 0.216904e-01
-ker_sdryg[38, 74] = 0.198439e-01
-ker_sdryg[38, 75] = 0.181177e-01
-ker_sdryg[38, 76] = 0.165031e-01
-ker_sdryg[38, 77] = 0.149927e-01
-ker_sdryg[38, 78] = 0.135800e-01
-ker_sdryg[38, 79] = 0.122598e-01
-ker_sdryg[38, 80] = 0.110278e-01
-ker_sdryg[39, 1] = 0.321451e01
-ker_sdryg[39, 2] = 0.301815e01
-ker_sdryg[39, 3] = 0.283377e01
-ker_sdryg[39, 4] = 0.266063e01
-ker_sdryg[39, 5] = 0.249807e01
-ker_sdryg[39, 6] = 0.234542e01
-ker_sdryg[39, 7] = 0.220208e01
-ker_sdryg[39, 8] = 0.206749e01
-ker_sdryg[39, 9] = 0.194112e01
-ker_sdryg[39, 10] = 0.182245e01
-ker_sdryg[39, 11] = 0.171103e01
-ker_sdryg[39, 12] = 0.160640e01
-ker_sdryg[39, 13] = 0.150816e01
-ker_sdryg[39, 14] = 0.141591e01
-ker_sdryg[39, 15] = 0.132929e01
-ker_sdryg[39, 16] = 0.124795e01
-ker_sdryg[39, 17] = 0.117158e01
-ker_sdryg[39, 18] = 0.109987e01
-ker_sdryg[39, 19] = 0.103253e01
-ker_sdryg[39, 20] = 0.969298e00
-ker_sdryg[39, 21] = 0.909926e00
-ker_sdryg[39, 22] = 0.854176e00
-ker_sdryg[39, 23] = 0.801828e00
-ker_sdryg[39, 24] = 0.752672e00
-ker_sdryg[39, 25] = 0.706516e00
-ker_sdryg[39, 26] = 0.663174e00
-ker_sdryg[39, 27] = 0.622476e00
-ker_sdryg[39, 28] = 0.584259e00
-ker_sdryg[39, 29] = 0.548373e00
-ker_sdryg[39, 30] = 0.514674e00
-ker_sdryg[39, 31] = 0.483030e00
-ker_sdryg[39, 32] = 0.453313e00
-ker_sdryg[39, 33] = 0.425406e00
-ker_sdryg[39, 34] = 0.399197e00
-ker_sdryg[39, 35] = 0.374583e00
-ker_sdryg[39, 36] = 0.351465e00
-ker_sdryg[39, 37] = 0.329751e00
-ker_sdryg[39, 38] = 0.309353e00
-ker_sdryg[39, 39] = 0.290190e00
-ker_sdryg[39, 40] = 0.272185e00
-ker_sdryg[39, 41] = 0.255264e00
-ker_sdryg[39, 42] = 0.239358e00
-ker_sdryg[39, 43] = 0.224402e00
-ker_sdryg[39, 44] = 0.210335e00
-ker_sdryg[39, 45] = 0.197096e00
-ker_sdryg[39, 46] = 0.184630e00
-ker_sdryg[39, 47] = 0.172881e00
-ker_sdryg[39, 48] = 0.161799e00
-ker_sdryg[39, 49] = 0.151332e00
-ker_sdryg[39, 50] = 0.141432e00
-ker_sdryg[39, 51] = 0.132052e00
-ker_sdryg[39, 52] = 0.123149e00
-ker_sdryg[39, 53] = 0.114684e00
-ker_sdryg[39, 54] = 0.106623e00
-ker_sdryg[39, 55] = 0.989442e-01
-ker_sdryg[39, 56] = 0.916356e-01
-ker_sdryg[39, 57] = 0.846988e-01
-ker_sdryg[39, 58] = 0.781472e-01
-ker_sdryg[39, 59] = 0.720003e-01
-ker_sdryg[39, 60] = 0.662762e-01
-ker_sdryg[39, 61] = 0.609842e-01
-ker_sdryg[39, 62] = 0.561201e-01
-ker_sdryg[39, 63] = 0.516663e-01
-ker_sdryg[39, 64] = 0.475946e-01
-ker_sdryg[39, 65] = 0.438709e-01
-ker_sdryg[39, 66] = 0.404594e-01
-ker_sdryg[39, 67] = 0.373260e-01
-ker_sdryg[39, 68] = 0.344398e-01
-ker_sdryg[39, 69] = 0.317735e-01
-ker_sdryg[39, 70] = 0.293039e-01
-ker_sdryg[39, 71] = 0.270111e-01
-ker_sdryg[39, 72] = 0.248780e-01
-ker_sdryg[39, 73] = 0.228902e-01
-ker_sdryg[39, 74] = 0.210352e-01
-ker_sdryg[39, 75] = 0.193021e-01
-ker_sdryg[39, 76] = 0.176816e-01
-ker_sdryg[39, 77] = 0.161652e-01
-ker_sdryg[39, 78] = 0.147457e-01
-ker_sdryg[39, 79] = 0.134166e-01
-ker_sdryg[39, 80] = 0.121725e-01
-ker_sdryg[40, 1] = 0.321505e01
-ker_sdryg[40, 2] = 0.301868e01
-ker_sdryg[40, 3] = 0.283430e01
-ker_sdryg[40, 4] = 0.266117e01
-ker_sdryg[40, 5] = 0.249860e01
-ker_sdryg[40, 6] = 0.234595e01
-ker_sdryg[40, 7] = 0.220262e01
-ker_sdryg[40, 8] = 0.206803e01
-ker_sdryg[40, 9] = 0.194165e01
-ker_sdryg[40, 10] = 0.182299e01
-ker_sdryg[40, 11] = 0.171156e01
-ker_sdryg[40, 12] = 0.160694e01
-ker_sdryg[40, 13] = 0.150869e01
-ker_sdryg[40, 14] = 0.141644e01
-ker_sdryg[40, 15] = 0.132982e01
-ker_sdryg[40, 16] = 0.124849e01
-ker_sdryg[40, 17] = 0.117212e01
-ker_sdryg[40, 18] = 0.110040e01
-ker_sdryg[40, 19] = 0.103307e01
-ker_sdryg[40, 20] = 0.969836e00
-ker_sdryg[40, 21] = 0.910465e00
-ker_sdryg[40, 22] = 0.854716e00
-ker_sdryg[40, 23] = 0.802368e00
-ker_sdryg[40, 24] = 0.753213e00
-ker_sdryg[40, 25] = 0.707057e00
-ker_sdryg[40, 26] = 0.663716e00
-ker_sdryg[40, 27] = 0.623019e00
-ker_sdryg[40, 28] = 0.584804e00
-ker_sdryg[40, 29] = 0.548920e00
-ker_sdryg[40, 30] = 0.515223e00
-ker_sdryg[40, 31] = 0.483581e00
-ker_sdryg[40, 32] = 0.453867e00
-ker_sdryg[40, 33] = 0.425963e00
-ker_sdryg[40, 34] = 0.399759e00
-ker_sdryg[40, 35] = 0.375150e00
-ker_sdryg[40, 36] = 0.352038e00
-ker_sdryg[40, 37] = 0.330331e00
-ker_sdryg[40, 38] = 0.309942e00
-ker_sdryg[40, 39] = 0.290789e00
-ker_sdryg[40, 40] = 0.272796e00
-ker_sdryg[40, 41] = 0.255890e00
-ker_sdryg[40, 42] = 0.240002e00
-ker_sdryg[40, 43] = 0.225068e00
-ker_sdryg[40, 44] = 0.211026e00
-ker_sdryg[40, 45] = 0.197818e00
-ker_sdryg[40, 46] = 0.185389e00
-ker_sdryg[40, 47] = 0.173686e00
-ker_sdryg[40, 48] = 0.162657e00
-ker_sdryg[40, 49] = 0.152255e00
-ker_sdryg[40, 50] = 0.142431e00
-ker_sdryg[40, 51] = 0.133141e00
-ker_sdryg[40, 52] = 0.124340e00
-ker_sdryg[40, 53] = 0.115989e00
-ker_sdryg[40, 54] = 0.108051e00
-ker_sdryg[40, 55] = 0.100495e00
-ker_sdryg[40, 56] = 0.932989e-01
-ker_sdryg[40, 57] = 0.864523e-01
-ker_sdryg[40, 58] = 0.799563e-01
-ker_sdryg[40, 59] = 0.738226e-01
-ker_sdryg[40, 60] = 0.680689e-01
-ker_sdryg[40, 61] = 0.627114e-01
-ker_sdryg[40, 62] = 0.577583e-01
-ker_sdryg[40, 63] = 0.532053e-01
-ker_sdryg[40, 64] = 0.490356e-01
-ker_sdryg[40, 65] = 0.452228e-01
-ker_sdryg[40, 66] = 0.417349e-01
-ker_sdryg[40, 67] = 0.385386e-01
-ker_sdryg[40, 68] = 0.356022e-01
-ker_sdryg[40, 69] = 0.328967e-01
-ker_sdryg[40, 70] = 0.303969e-01
-ker_sdryg[40, 71] = 0.280809e-01
-ker_sdryg[40, 72] = 0.259303e-01
-ker_sdryg[40, 73] = 0.239293e-01
-ker_sdryg[40, 74] = 0.220643e-01
-ker_sdryg[40, 75] = 0.203236e-01
-ker_sdryg[40, 76] = 0.186972e-01
-ker_sdryg[40, 77] = 0.171761e-01
-ker_sdryg[40, 78] = 0.157525e-01
-ker_sdryg[40, 79] = 0.144193e-01
-ker_sdryg[40, 80] = 0.131706e-01
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""Collision kernels XKER_* of the accretion and dry growth processes.
+
+The kernels are tabulated over a log-regular grid of the slope parameters
+(lambda_x, lambda_z) of the collector and collected species. The literal
+tables of mode_ini_rain_ice.F90 are shipped in assets as .npy files. They are
+used as is on the grids they were tabulated with (SHIPPED_GRIDS), with the
+laws of the two species they were tabulated with (SHIPPED_LAWS) or with the
+laws of the default configuration (DEFAULT_LAWS). Other tables are generated
+from the laws of the run, and stored as .npy files in a cache directory.
+
+raccs, rdryg and sdryg are integrated over the size spectra as in mode_rzcolx.F90,
+all the (lambda_x, lambda_z) points at once. RRCOLSS and RSCOLRG
+(mode_rrcolss.F90 and mode_rscolrg.F90) are not ported : raccss and saccrg
+are only available as shipped (GENERATED_KERNELS).
+
+The cache directory defaults to ICE3_GT4PY_XKER_CACHE_DIR, then to
+$XDG_CACHE_HOME/ice3_gt4py/xker (~/.cache/ice3_gt4py/xker).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from math import gamma
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from ifs_physics_common.utils.f2py import ported_method
+
+KERNELS_DIR = Path(__file__).parent / "assets"
+XKER_CACHE_DIR_ENV = "ICE3_GT4PY_XKER_CACHE_DIR"
+
+# Translation note : integration settings of mode_ini_rain_ice.F90
+KND = 50  # IND : number of diameters in the spectra integration
+DINFTY = 20.0  # ZFDINFTY : largest diameter, times 1 / lambda
+EFFICIENCY = 1.0  # ZESR, ZEGS, ZEGR : collection efficiencies
+
+# Maximum number of points in the 4D integrand (lambda_x, lambda_z, D_x, D_z)
+CHUNK_SIZE = 2**22
+
+# Slope grids (min, max, number of values) of the tables shipped in assets
+Grid = Tuple[float, float, int]
+SHIPPED_GRIDS = {
+    "saccrg": ((1e3, 1e7, 40), (5e1, 5e5, 40)),
+    "raccs": ((5e1, 5e5, 40), (1e3, 1e7, 40)),
+    "raccss": ((5e1, 5e5, 40), (1e3, 1e7, 40)),
+    "rdryg": ((1e3, 1e7, 40), (1e3, 1e7, 40)),
+    "sdryg": ((1e3, 1e7, 40), (2.5e1, 2.5e9, 80)),
+}
+
+# Laws (ALPHA, NU, A, B, C, D) of each species the shipped tables are tabulated with,
+# an exponential law for rain drops (ALPHAR = NUR = 1)
+Laws = Tuple[float, float, float, float, float, float]
+SHIPPED_LAWS = {
+    "S": (1.0, 1.0, 0.02, 1.9, 5.1, 0.27),
+    "R": (1.0, 1.0, 524.0, 3.0, 842.0, 0.8),
+    "G": (1.0, 1.0, 19.6, 2.8, 124.0, 0.66),
+}
+
+# Laws of the default configuration (RainIceDescr), run with the shipped tables
+# although its rain drop law differs from the one of the literals (ALPHAR = 3)
+DEFAULT_LAWS = {
+    "S": (1.0, 1.0, 0.02, 1.9, 5.1, 0.27),
+    "R": (3.0, 1.0, 524.0, 3.0, 842.0, 0.8),
+    "G": (1.0, 1.0, 19.6, 2.8, 124.0, 0.66),
+}
+
+# Mass coefficient of each species in RainIceDescr
+MASS_COEFFICIENTS = {"S": "A_S", "R": "AR", "G": "AG"}
+
+# Kernels integrated from the laws, off the shipped grids and laws
+GENERATED_KERNELS = ("raccs", "rdryg", "sdryg")
+
+# Species (collector, collected) of each kernel
+KERNEL_SPECIES = {
+    "saccrg": "SR",
+    "raccs": "SR",
+    "raccss": "SR",
+    "rdryg": "GR",
+    "sdryg": "GS",
+}
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from ICE3_GT4PY_XKER_CACHE_DIR, user cache otherwise"""
+    if os.environ.get(XKER_CACHE_DIR_ENV):
+        return Path(os.environ[XKER_CACHE_DIR_ENV])
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ice3_gt4py" / "xker"
+
+
+def lbda_grid(lbda_min: float, lbda_max: float, n: int) -> NDArray:
+    """Log-regular grid of slope parameters, as in mode_rzcolx.F90"""
+    zdlbda = np.exp(np.log(lbda_max / lbda_min) / (n - 1))
+    return lbda_min * zdlbda ** np.arange(n)
+
+
+@ported_method(from_file="PHYEX/src/common/aux/general_gamma.F90")
+def general_gamma(alpha: float, nu: float, lbda, d) -> NDArray:
+    """Generalized gamma law, normalized to 1
+
+    Args:
+        alpha (float): shape parameter
+        nu (float): shape parameter
+        lbda (array_like): slope parameter
+        d (array_like): diameter
+
+    Returns:
+        NDArray: alpha / gamma(nu) * lbda**(alpha * nu) * d**(alpha * nu - 1) * exp(-(lbda * d)**alpha)
+    """
+    return (
+        alpha
+        / gamma(nu)
+        * lbda ** (alpha * nu)
+        * d ** (alpha * nu - 1)
+        * np.exp(-((lbda * d) ** alpha))
+    )
+
+
+@ported_method(from_file="PHYEX/src/common/micro/mode_rzcolx.F90")
+def rzcolx(
+    knd: int,
+    alphax: float,
+    nux: float,
+    alphaz: float,
+    nuz: float,
+    efficiency: float,
+    exmassz: float,
+    fallx: float,
+    exfallx: float,
+    fallz: float,
+    exfallz: float,
+    lbdax: Grid,
+    lbdaz: Grid,
+    dinfty: float,
+) -> NDArray:
+    """Collection kernel of species z by species x
+
+    Mean fall speed difference |fallx * Dx**exfallx - fallz * Dz**exfallz|,
+    weighted by (Dx + Dz)**2 * Dz**exmassz and by the size spectra of x and z.
+    Spectra are integrated with knd - 1 diameters up to dinfty / lambda,
+    on every (lambda_x, lambda_z) point at once.
+
+    Args:
+        knd (int): number of integration intervals
+        alphax, nux (float): generalized gamma law of the collector
+        alphaz, nuz (float): generalized gamma law of the collected species
+        efficiency (float): collection efficiency
+        exmassz (float): mass exponent of the collected species
+        fallx, exfallx (float): fall speed law of the collector
+        fallz, exfallz (float): fall speed law of the collected species
+        lbdax (Grid): (min, max, n) slope parameters of the collector
+        lbdaz (Grid): (min, max, n) slope parameters of the collected species
+        dinfty (float): largest diameter, times 1 / lambda
+
+    Returns:
+        NDArray: kernel of shape (lbdax[2], lbdaz[2])
+    """
+    lbx = lbda_grid(*lbdax)
+    lbz = lbda_grid(*lbdaz)
+    jd = np.arange(1, knd)
+
+    # Collected species (lambda_z, D_z)
+    dz = (dinfty / (knd * lbz))[:, np.newaxis] * jd
+    gz = general_gamma(alphaz, nuz, lbz[:, np.newaxis], dz) * dz**exmassz
+    vz = fallz * dz**exfallz
+
+    kernel = np.empty((lbx.size, lbz.size))
+    rows = max(1, CHUNK_SIZE // (lbz.size * jd.size**2))
+    for start in range(0, lbx.size, rows):
+        lb = lbx[start : start + rows]
+
+        # Collector (lambda_x, D_x)
+        dx = (dinfty / (knd * lb))[:, np.newaxis] * jd
+        gx = general_gamma(alphax, nux, lb[:, np.newaxis], dx)
+        vx = fallx * dx**exfallx
+
+        # Integrand over (lambda_x, lambda_z, D_x, D_z)
+        weight = (
+            (dx[:, np.newaxis, :, np.newaxis] + dz[np.newaxis, :, np.newaxis, :]) ** 2
+            * gx[:, np.newaxis, :, np.newaxis]
+            * gz[np.newaxis, :, np.newaxis, :]
+        )
+        collection = weight * np.abs(
+            vx[:, np.newaxis, :, np.newaxis] - vz[np.newaxis, :, np.newaxis, :]
+        )
+        kernel[start : start + rows] = (
+            efficiency * collection.sum(axis=(2, 3)) / weight.sum(axis=(2, 3))
+        )
+
+    return kernel
+
+
+def compute_kernel(name: str, rid, lbdax: Grid, lbdaz: Grid) -> NDArray:
+    """Compute a kernel over a slope parameters grid
+
+    Translation note : arguments of RZCOLX calls in mode_ini_rain_ice.F90.
+                       RRCOLSS and RSCOLRG (raccss, saccrg) are not ported
+
+    Args:
+        name (str): kernel (raccs, rdryg, sdryg)
+        rid (RainIceDescr): size distributions and fall speed laws
+        lbdax (Grid): (min, max, n) slope parameters of the first axis
+        lbdaz (Grid): (min, max, n) slope parameters of the second axis
+
+    Raises:
+        KeyError: Error if name is not a kernel name
+        ValueError: Error if name is not in GENERATED_KERNELS
+
+    Returns:
+        NDArray: kernel of shape (lbdax[2], lbdaz[2])
+    """
+    if name in SHIPPED_GRIDS and name not in GENERATED_KERNELS:
+        raise ValueError(
+            f"ker_{name} is not generated, RRCOLSS and RSCOLRG are not ported"
+        )
+
+    if name == "raccs":
+        return rzcolx(
+            KND,
+            rid.ALPHAS,
+            rid.NUS,
+            rid.ALPHAR,
+            rid.NUR,
+            EFFICIENCY,
+            rid.BR,
+            rid.CS,
+            rid.DS,
+            rid.CR,
+            rid.DR,
+            lbdax,
+            lbdaz,
+            DINFTY,
+        )
+    if name == "rdryg":
+        return rzcolx(
+            KND,
+            rid.ALPHAG,
+            rid.NUG,
+            rid.ALPHAR,
+            rid.NUR,
+            EFFICIENCY,
+            rid.BR,
+            rid.CG,
+            rid.DG,
+            rid.CR,
+            rid.DR,
+            lbdax,
+            lbdaz,
+            DINFTY,
+        )
+    if name == "sdryg":
+        return rzcolx(
+            KND,
+            rid.ALPHAG,
+            rid.NUG,
+            rid.ALPHAS,
+            rid.NUS,
+            EFFICIENCY,
+            rid.BS,
+            rid.CG,
+            rid.DG,
+            rid.CS,
+            rid.DS,
+            lbdax,
+            lbdaz,
+            DINFTY,
+        )
+
+    raise KeyError(f"{name} not found in GlobalTables")
+
+
+def species_laws(rid, species: str) -> Laws:
+    """Size distribution and fall speed laws of a species
+
+    Args:
+        rid (RainIceDescr): size distributions and fall speed laws
+        species (str): S, R or G
+
+    Returns:
+        Laws: ALPHA, NU, A, B, C, D of the species
+    """
+    return tuple(
+        float(getattr(rid, attr))
+        for attr in (
+            f"ALPHA{species}",
+            f"NU{species}",
+            MASS_COEFFICIENTS[species],
+            f"B{species}",
+            f"C{species}",
+            f"D{species}",
+        )
+    )
+
+
+def kernel_key(name: str, rid, lbdax: Grid, lbdaz: Grid) -> str:
+    """Name of the cached table of a kernel
+
+    Args:
+        name (str): kernel (saccrg, raccs, raccss, rdryg, sdryg)
+        rid (RainIceDescr): size distributions and fall speed laws
+        lbdax (Grid): (min, max, n) slope parameters of the first axis
+        lbdaz (Grid): (min, max, n) slope parameters of the second axis
+
+    Returns:
+        str: table file name
+    """
+    laws = tuple(species_laws(rid, species) for species in "SRG")
+    sha = hashlib.sha1()
+    sha.update(repr((name, lbdax, lbdaz, laws, KND, DINFTY, EFFICIENCY)).encode())
+    sha.update(Path(__file__).read_bytes())
+    return f"ker_{name}_{sha.hexdigest()[:16]}.npy"
+
+
+def load_kernel(
+    name: str,
+    rid,
+    lbdax: Grid,
+    lbdaz: Grid,
+    cache_dir: Optional[str | Path] = None,
+) -> NDArray:
+    """Load a kernel : shipped table on the grids of the literals, with the laws
+    of the literals or of the default configuration, cached or computed table
+    otherwise (raccs, rdryg and sdryg only).
+
+    Tables are memory-mapped, read-only.
+
+    Args:
+        name (str): kernel (saccrg, raccs, raccss, rdryg, sdryg)
+        rid (RainIceDescr): size distributions and fall speed laws
+        lbdax (Grid): (min, max, n) slope parameters of the first axis
+        lbdaz (Grid): (min, max, n) slope parameters of the second axis
+        cache_dir (Optional[str | Path]): cache directory, see default_cache_dir
+
+    Raises:
+        KeyError: Error if name is not a kernel name
+        ValueError: Error if raccss or saccrg is requested off the shipped grids and laws
+
+    Returns:
+        NDArray: kernel of shape (lbdax[2], lbdaz[2])
+    """
+    if name not in SHIPPED_GRIDS:
+        raise KeyError(f"{name} not found in GlobalTables")
+
+    laws = [species_laws(rid, species) for species in KERNEL_SPECIES[name]]
+    literal_laws = any(
+        laws == [shipped[species] for species in KERNEL_SPECIES[name]]
+        for shipped in (SHIPPED_LAWS, DEFAULT_LAWS)
+    )
+    if (lbdax, lbdaz) == SHIPPED_GRIDS[name] and literal_laws:
+        return np.load(KERNELS_DIR / f"ker_{name}.npy", mmap_mode="r")
+    if name not in GENERATED_KERNELS:
+        raise ValueError(
+            f"ker_{name} is only available on the grids {SHIPPED_GRIDS[name]}, "
+            f"with the laws of the shipped tables or of the default configuration"
+        )
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir()
+    path = cache_dir / kernel_key(name, rid, lbdax, lbdaz)
+    if path.exists():
+        try:
+            return np.load(path, mmap_mode="r")
+        except ValueError as e:
+            logging.warning(f"Corrupted kernel {path} ({e}), recomputed")
+
+    start = time.perf_counter()
+    kernel = compute_kernel(name, rid, lbdax, lbdaz)
+    logging.info(
+        f"ker_{name} {kernel.shape} computed in {time.perf_counter() - start:.3f} s"
+    )
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            np.save(file, kernel)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"Kernel not written to {path} : {e}")
+        return kernel
+
+    return np.load(path, mmap_mode="r")
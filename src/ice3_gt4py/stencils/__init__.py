@@ -1,25 +1,76 @@
 # -*- coding: utf-8 -*-
-import ice3_gt4py.stencils.aro_filter
-import ice3_gt4py.stencils.ice4_fast_rg
-import ice3_gt4py.stencils.ice4_fast_ri
-import ice3_gt4py.stencils.ice4_fast_rs
-import ice3_gt4py.stencils.ice4_nucleation
-import ice3_gt4py.stencils.ice4_rimltc
-import ice3_gt4py.stencils.ice4_rrhong
-import ice3_gt4py.stencils.ice4_slow
-import ice3_gt4py.stencils.ice4_warm
-import ice3_gt4py.stencils.ice_adjust
-import ice3_gt4py.stencils.statistical_sedimentation
-import ice3_gt4py.stencils.upwind_sedimentation
-import ice3_gt4py.stencils.step_limiter
-import ice3_gt4py.stencils.mixing_ratio_limiter
-import ice3_gt4py.stencils.ice4_tendencies
-import ice3_gt4py.stencils.ice4_stepping
-import ice3_gt4py.stencils.fog_deposition
-import ice3_gt4py.stencils.ice4_correct_negativities
-import ice3_gt4py.stencils.ice4_rainfr_vert
-import ice3_gt4py.stencils.ice4_stepping
-import ice3_gt4py.stencils.rain_ice_nucleation
-import ice3_gt4py.stencils.rain_ice_start
-import ice3_gt4py.stencils.rain_ice_total_tendencies
-import ice3_gt4py.stencils.ice4_compute_pdf
+"""Stencil collections, registered on first request.
+
+Importing ice3_gt4py.stencils does not import the stencil modules (and the
+gt4py frontend) : the module defining a collection is imported when the
+collection is first requested, through import_collection.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Stencil collection name -> module of ice3_gt4py.stencils defining it
+COLLECTIONS = {
+    "aro_filter": "aro_filter",
+    "fog_deposition": "fog_deposition",
+    "ice4_precipitation_fraction_sigma": "ice4_compute_pdf",
+    "ice4_precipitation_fraction_liquid_content": "ice4_compute_pdf",
+    "ice4_compute_pdf": "ice4_compute_pdf",
+    "ice4_correct_negativities": "ice4_correct_negativities",
+    "ice4_fast_rg": "ice4_fast_rg",
+    "ice4_fast_rg_pre_processing": "ice4_fast_rg",
+    "ice4_fast_ri": "ice4_fast_ri",
+    "ice4_fast_rs": "ice4_fast_rs",
+    "ice4_nucleation": "ice4_nucleation",
+    "ice4_nucleation_post_processing": "ice4_nucleation",
+    "rain_fraction_sedimentation": "ice4_rainfr_vert",
+    "ice4_rainfr_vert": "ice4_rainfr_vert",
+    "ice4_rimltc": "ice4_rimltc",
+    "ice4_rimltc_post_processing": "ice4_rimltc",
+    "ice4_rrhong": "ice4_rrhong",
+    "ice4_rrhong_post_processing": "ice4_rrhong",
+    "ice4_slow": "ice4_slow",
+    "ice4_stepping_tmicro_init": "ice4_stepping",
+    "ice4_stepping_tsoft_init": "ice4_stepping",
+    "ice4_stepping_heat": "ice4_stepping",
+    "ice4_stepping_ldcompute_init": "ice4_stepping",
+    "ice4_tendencies_update": "ice4_tendencies",
+    "ice4_increment_update": "ice4_tendencies",
+    "ice4_derived_fields": "ice4_tendencies",
+    "ice4_slope_parameters": "ice4_tendencies",
+    "ice4_tendencies_fused": "ice4_tendencies_fused",
+    "ice4_warm": "ice4_warm",
+    "ice_adjust": "ice_adjust",
+    "mixing_ratio_step_limiter": "mixing_ratio_limiter",
+    "rain_ice_nucleation_pre_processing": "rain_ice_nucleation",
+    "rain_ice_nucleation_post_processing": "rain_ice_nucleation",
+    "rain_ice_init": "rain_ice_start",
+    "initial_values_saving": "rain_ice_start",
+    "rain_ice_total_tendencies": "rain_ice_total_tendencies",
+    "statistical_sedimentation": "statistical_sedimentation",
+    "step_limiter": "step_limiter",
+    "state_update": "step_limiter",
+    "step_limiter_state_update": "step_limiter",
+    "external_tendencies_update": "step_limiter",
+    "upwind_sedimentation": "upwind_sedimentation",
+}
+
+
+def import_collection(name: str):
+    """Import the module registering a stencil collection.
+
+    Names unknown to COLLECTIONS are left to the stencil registry.
+
+    Args:
+        name (str): name of the stencil collection
+    """
+    module = COLLECTIONS.get(name)
+    if module is not None:
+        importlib.import_module(f"{__name__}.{module}")
+
+
+def import_all_collections():
+    """Import every stencil module, registering all the collections"""
+    for module in sorted(set(COLLECTIONS.values())):
+        importlib.import_module(f"{__name__}.{module}")
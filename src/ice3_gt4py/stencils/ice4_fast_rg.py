@@ -53,8 +53,8 @@ def ice4_fast_rg(
     rg_freez1_tnd: Field["float"],
     rg_freez2_tnd: Field["float"],
     rgmltr: Field["float"],
-    ker_sdryg: GlobalTable[float, (40, 40)],
-    ker_rdryg: GlobalTable[float, (40, 40)],
+    ker_sdryg: GlobalTable["float", ("NDRYLBDAG", "NDRYLBDAS")],
+    ker_rdryg: GlobalTable["float", ("NDRYLBDAG", "NDRYLBDAR")],
     index_floor_s: Field["int"],
     index_floor_g: Field["int"],
     index_floor_r: Field["int"],
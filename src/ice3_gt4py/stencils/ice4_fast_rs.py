@@ -57,12 +57,12 @@ def ice4_fast_rs(
     rs_rsaccrg_tnd: Field["float"],
     rs_freez1_tnd: Field["float"],
     rs_freez2_tnd: Field["float"],
-    gaminc_rim1: GlobalTable[float, (80)],
-    gaminc_rim2: GlobalTable[float, (80)],
-    gaminc_rim4: GlobalTable[float, (80)],
-    ker_raccs: GlobalTable[float, (40, 40)],
-    ker_raccss: GlobalTable[float, (40, 40)],
-    ker_saccrg: GlobalTable[float, (40, 40)],
+    gaminc_rim1: GlobalTable["float", ("NGAMINC",)],
+    gaminc_rim2: GlobalTable["float", ("NGAMINC",)],
+    gaminc_rim4: GlobalTable["float", ("NGAMINC",)],
+    ker_raccs: GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    ker_raccss: GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    ker_saccrg: GlobalTable["float", ("NACCLBDAR", "NACCLBDAS")],
     index_floor: Field["int"],
     index_floor_r: Field["int"],
     index_floor_s: Field["int"],
@@ -140,12 +140,12 @@ def ice4_fast_rs(
             )
 
             # Translation note l129 removed
-            freez_rate_tmp = 0
+            freez_rate_tmp = 0.0
 
         else:
             rs_freez1_tnd = 0
             rs_freez2_tnd = 0
-            freez_rate_tmp = 0
+            freez_rate_tmp = 0.0
 
     # 5.1 cloud droplet riming of the aggregates
     with computation(PARALLEL), interval(...):
@@ -59,8 +59,8 @@ def ice4_nucleation(
     # l72
     with computation(PARALLEL), interval(...):
         if t < TT and rv_t > V_RTMIN and ldcompute:
-            usw = 0
-            w2 = 0
+            usw = 0.0
+            w2 = 0.0
 
         else:
             w2 = log(t)
@@ -83,7 +83,7 @@ def ice4_nucleation(
 
     # l96
     with computation(PARALLEL), interval(...):
-        w2 = 0
+        w2 = 0.0
         if t < TT and rv_t > V_RTMIN and ldcompute:
             if t < TT - 5 and ssi > 0:
                 w2 = NU20 * exp(ALPHA2 * ssi - BETA2)
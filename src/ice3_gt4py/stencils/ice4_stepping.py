@@ -1,7 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from gt4py.cartesian.gtscript import Field, interval, computation, PARALLEL
+from gt4py.cartesian.gtscript import (
+    Field,
+    interval,
+    computation,
+    FORWARD,
+    IJ,
+    PARALLEL,
+)
 from ifs_physics_common.framework.stencil import stencil_collection
 
 from ifs_physics_common.utils.f2py import ported_method
@@ -20,20 +27,21 @@ from ice3_gt4py.functions.temperature import theta2temperature
     to_line=221,
 )
 @stencil_collection("ice4_stepping_tmicro_init")
-def ice4_stepping_tmicro_init(t_micro: Field["float"], ldmicro: Field["bool"]):
+def ice4_stepping_tmicro_init(
+    t_micro: Field["float"], ldmicro: Field["bool"], dt: "float"
+):
     """Initialise t_soft with value of t_micro after each loop
     on LSOFT condition.
 
     Args:
         t_micro (Field[float]): time for microphsyics loops
         ldmicro (Field[bool]): microphsyics activation mask
+        dt (float): timestep of the call, PTSTEP
     """
 
-    from __externals__ import TSTEP
-
     # 4.4 Temporal loop
     with computation(PARALLEL), interval(...):
-        t_micro = 0 if ldmicro else TSTEP
+        t_micro = 0 if ldmicro else dt
 
 
 @ported_method(
@@ -102,14 +110,27 @@ def ice4_stepping_heat(
     to_line=237,
 )
 @stencil_collection("ice4_stepping_ldcompute_init")
-def ice4_stepping_ldcompute_init(ldcompute: Field["bool"], t_micro: Field["float"]):
+def ice4_stepping_ldcompute_init(
+    ldcompute: Field["bool"],
+    t_micro: Field["float"],
+    ldcompute_count: Field[IJ, "int"],
+    dt: "float",
+):
     """Initialize ldcompute mask
 
     Args:
         ldcompute (Field[bool]): temperature
+        t_micro (Field[float]): time for microphsyics loops
+        ldcompute_count (Field[IJ, int]): number of points with ldcompute per column
+        dt (float): timestep of the call, PTSTEP
     """
 
-    from __externals__ import TSTEP
-
     with computation(PARALLEL), interval(...):
-        ldcompute = True if t_micro < TSTEP else False
+        ldcompute = True if t_micro < dt else False
+
+    # Translation note : column count replaces the host reduction ANY(ZTIME < PTSTEP) l223
+    with computation(FORWARD), interval(0, 1):
+        ldcompute_count[0, 0] = 0
+    with computation(FORWARD), interval(...):
+        if ldcompute:
+            ldcompute_count[0, 0] += 1
@@ -0,0 +1,1241 @@
+# -*- coding: utf-8 -*-
+"""Ice4Tendencies stencil chain fused in a single stencil.
+
+Pointwise transcription of the stencils launched by Ice4Tendencies.array_call,
+in the same order (see ice4_nucleation.py, ice4_rrhong.py, ice4_rimltc.py,
+ice4_tendencies.py, ice4_compute_pdf.py, ice4_slow.py, ice4_warm.py,
+ice4_fast_rs.py, ice4_fast_rg.py and ice4_fast_ri.py). None of these stencils
+reads at an offset : the chain fuses into a single launch, and the intermediate
+mixing ratios, slopes and transformation rates are stencil temporaries
+instead of full-domain fields.
+
+Process rates kept with ldsoft (SOFT_RATES in components.ice4_tendencies) remain fields.
+Lookup table indices remain int fields, floor() returning floats.
+"""
+
+from __future__ import annotations
+
+from gt4py.cartesian.gtscript import (
+    Field,
+    GlobalTable,
+    exp,
+    log,
+    sqrt,
+    computation,
+    interval,
+    PARALLEL,
+)
+from ifs_physics_common.framework.stencil import stencil_collection
+from ifs_physics_common.utils.f2py import ported_method
+
+from ice3_gt4py.functions.interp_micro import (
+    index_interp_micro_1d,
+    index_micro2d_acc_r,
+    index_micro2d_acc_s,
+    index_micro2d_dry_g,
+    index_micro2d_dry_r,
+    index_micro2d_dry_s,
+)
+from ice3_gt4py.functions.sign import sign
+
+
+@ported_method(
+    from_file="PHYEX/src/common/micro/mode_ice4_tendencies.F90",
+    from_line=136,
+    to_line=559,
+)
+@stencil_collection("ice4_tendencies_fused")
+def ice4_tendencies_fused(
+    ldsoft: "bool",
+    ldcompute: Field["bool"],
+    pres: Field["float"],
+    rhodref: Field["float"],
+    exn: Field["float"],
+    ls_fact: Field["float"],
+    lv_fact: Field["float"],
+    t: Field["float"],
+    th_t: Field["float"],
+    rv_t: Field["float"],
+    rc_t: Field["float"],
+    rr_t: Field["float"],
+    ri_t: Field["float"],
+    rs_t: Field["float"],
+    rg_t: Field["float"],
+    ci_t: Field["float"],
+    cf: Field["float"],
+    sigma_rc: Field["float"],
+    ssi: Field["float"],
+    ka: Field["float"],
+    dv: Field["float"],
+    ai: Field["float"],
+    cj: Field["float"],
+    hlc_hcf: Field["float"],
+    hlc_lcf: Field["float"],
+    hlc_hrc: Field["float"],
+    hlc_lrc: Field["float"],
+    hli_hcf: Field["float"],
+    hli_lcf: Field["float"],
+    hli_hri: Field["float"],
+    hli_lri: Field["float"],
+    fr: Field["float"],
+    theta_tnd: Field["float"],
+    rv_tnd: Field["float"],
+    rc_tnd: Field["float"],
+    rr_tnd: Field["float"],
+    ri_tnd: Field["float"],
+    rs_tnd: Field["float"],
+    rg_tnd: Field["float"],
+    theta_increment: Field["float"],
+    rv_increment: Field["float"],
+    rc_increment: Field["float"],
+    rr_increment: Field["float"],
+    ri_increment: Field["float"],
+    rs_increment: Field["float"],
+    rg_increment: Field["float"],
+    rc_honi_tnd: Field["float"],
+    rv_deps_tnd: Field["float"],
+    ri_aggs_tnd: Field["float"],
+    ri_auts_tnd: Field["float"],
+    rv_depg_tnd: Field["float"],
+    rcautr: Field["float"],
+    rcaccr: Field["float"],
+    rrevav: Field["float"],
+    rs_mltg_tnd: Field["float"],
+    rc_mltsr_tnd: Field["float"],
+    rs_rcrims_tnd: Field["float"],
+    rs_rcrimss_tnd: Field["float"],
+    rs_rsrimcg_tnd: Field["float"],
+    rs_rraccs_tnd: Field["float"],
+    rs_rraccss_tnd: Field["float"],
+    rs_rsaccrg_tnd: Field["float"],
+    rs_freez1_tnd: Field["float"],
+    rs_freez2_tnd: Field["float"],
+    rg_rcdry_tnd: Field["float"],
+    rg_ridry_tnd: Field["float"],
+    rg_rsdry_tnd: Field["float"],
+    rg_rrdry_tnd: Field["float"],
+    rg_riwet_tnd: Field["float"],
+    rg_rswet_tnd: Field["float"],
+    rg_freez1_tnd: Field["float"],
+    rg_freez2_tnd: Field["float"],
+    ricfrrg: Field["float"],
+    rrcfrig: Field["float"],
+    ricfrr: Field["float"],
+    rgmltr: Field["float"],
+    rc_beri_tnd: Field["float"],
+    gaminc_rim1: GlobalTable["float", ("NGAMINC",)],
+    gaminc_rim2: GlobalTable["float", ("NGAMINC",)],
+    gaminc_rim4: GlobalTable["float", ("NGAMINC",)],
+    ker_raccs: GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    ker_raccss: GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    ker_saccrg: GlobalTable["float", ("NACCLBDAR", "NACCLBDAS")],
+    ker_sdryg: GlobalTable["float", ("NDRYLBDAG", "NDRYLBDAS")],
+    ker_rdryg: GlobalTable["float", ("NDRYLBDAG", "NDRYLBDAR")],
+    index_floor: Field["int"],
+    index_floor_r: Field["int"],
+    index_floor_s: Field["int"],
+    index_floor_g: Field["int"],
+):
+    """Compute the microphysical tendencies in one launch
+
+    Same fields as the stencils of the multi-launch path, under the names
+    of the Ice4Tendencies state (th_t, pres, fr, ldcompute).
+
+    Args:
+        ldsoft (bool): keep the process rates computed at the previous call
+        ldcompute (Field[bool]): switch to compute microphysical processes
+        pres (Field[float]): absolute pressure at t
+        rhodref (Field[float]): reference density
+        exn (Field[float]): exner pressure
+        ls_fact (Field[float]): sublimation latent heat over heat capacity
+        lv_fact (Field[float]): vaporisation latent heat over heat capacity
+        t (Field[float]): temperature
+        th_t (Field[float]): potential temperature at t
+        rv_t (Field[float]): vapour m.r. at t
+        rc_t (Field[float]): cloud droplets m.r. at t
+        rr_t (Field[float]): rain m.r. at t
+        ri_t (Field[float]): ice m.r. at t
+        rs_t (Field[float]): snow m.r. at t
+        rg_t (Field[float]): graupel m.r. at t
+        ci_t (Field[float]): ice concentration at t
+        cf (Field[float]): cloud fraction
+        sigma_rc (Field[float]): standard dev of cloud droplets m.r. over the cell
+        ssi (Field[float]): supersaturation over ice
+        ka (Field[float]): thermal conductivity of the air
+        dv (Field[float]): diffusivity of water vapour
+        ai (Field[float]): thermodynamical function
+        cj (Field[float]): function to compute the ventilation coefficient
+        hlc_hcf, hlc_lcf, hlc_hrc, hlc_lrc (Field[float]): cloud water high / low content parts
+        hli_hcf, hli_lcf, hli_hri, hli_lri (Field[float]): ice high / low content parts
+        fr (Field[float]): precipitation fraction
+        theta_tnd, ..., rg_tnd (Field[float]): tendencies (A in f90)
+        theta_increment, ..., rg_increment (Field[float]): increments (B in f90)
+        rc_honi_tnd, ..., rc_beri_tnd (Field[float]): process rates kept with ldsoft
+        gaminc_rim1, ..., ker_rdryg (GlobalTable): lookup tables
+        index_floor, ..., index_floor_g (Field[int]): lookup table indices
+    """
+
+    from __externals__ import (
+        ACRIAUTI,
+        ALPHA1,
+        ALPHA2,
+        ALPHA3,
+        ALPI,
+        ALPW,
+        BCRIAUTI,
+        BETA1,
+        BETA2,
+        BETA3,
+        BETAI,
+        BETAW,
+        BS,
+        C_RTMIN,
+        CEXVT,
+        CI,
+        CL,
+        COLEXIG,
+        COLEXIS,
+        COLIG,
+        COLSG,
+        CPD,
+        CPV,
+        CRIAUTC,
+        CRIAUTI,
+        CRIMSG,
+        CRIMSS,
+        CXG,
+        CXS,
+        DG,
+        DI,
+        EPSILO,
+        ESTT,
+        EX0DEPG,
+        EX0DEPS,
+        EX0EVAR,
+        EX1DEPG,
+        EX1DEPS,
+        EX1EVAR,
+        EXCACCR,
+        EXCRIMSG,
+        EXCRIMSS,
+        EXIAGGS,
+        EXICFRR,
+        EXRCFRI,
+        EXSRIMCG,
+        EXSRIMCG2,
+        FCACCR,
+        FCDRYG,
+        FIAGGS,
+        FIDRYG,
+        FRACCSS,
+        FRDRYG,
+        FSACCRG,
+        FSCVMG,
+        FSDRYG,
+        G_RTMIN,
+        GAMI,
+        GAMW,
+        HON,
+        I_RTMIN,
+        ICFRR,
+        LBDAG_MAX,
+        LBDAS_MAX,
+        LBDAS_MIN,
+        LBEXI,
+        LBEXR,
+        LBEXS,
+        LBI,
+        LBR,
+        LBRACCS1,
+        LBRACCS2,
+        LBRACCS3,
+        LBS,
+        LBSACCR1,
+        LBSACCR2,
+        LBSACCR3,
+        LBSDRYG1,
+        LBSDRYG2,
+        LBSDRYG3,
+        LCRFLIMIT,
+        LEVLIMIT,
+        LFEEDBACKT,
+        LMTT,
+        LNULLWETG,
+        LSNOW_T,
+        LSTT,
+        LVTT,
+        LWETGPOST,
+        MNU0,
+        NU10,
+        NU20,
+        O0DEPG,
+        O0DEPI,
+        O0DEPS,
+        O0EVAR,
+        O1DEPG,
+        O1DEPS,
+        O1EVAR,
+        O2DEPI,
+        P00,
+        R_RTMIN,
+        RCFRI,
+        RV,
+        S_RTMIN,
+        SCFAC,
+        SNOW_RIMING,
+        SRIMCG,
+        SRIMCG2,
+        SRIMCG3,
+        SUBG_AUCV_RC,
+        SUBG_AUCV_RI,
+        SUBG_PR_PDF,
+        SUBG_RC_RR_ACCR,
+        SUBG_RR_EVAP,
+        TEXAUTI,
+        TIMAUTC,
+        TIMAUTI,
+        TRANS_MP_GAMMAS,
+        TT,
+        V_RTMIN,
+    )
+
+    # Transformation rates read by ice4_tendencies_update : the stencil chain
+    # does not write them, they hold the zero-filled temporaries of the chain.
+    # Deriving them from the process rates changes the results of the chain,
+    # it is left to a change validated against the reference data.
+    with computation(PARALLEL), interval(...):
+        rchoni = 0.0
+        rvdeps = 0.0
+        riaggs = 0.0
+        riauts = 0.0
+        rvdepg = 0.0
+        rcberi = 0.0
+        rsmltg = 0.0
+        rcmltsr = 0.0
+        rcwetg = 0.0
+        riwetg = 0.0
+        rrwetg = 0.0
+        rswetg = 0.0
+        rcdryg = 0.0
+        ridryg = 0.0
+        rrdryg = 0.0
+        rsdryg = 0.0
+        # Translation note : CSNOWRIMING = M90 in AROME, no riming-conversion increment
+        rsrimcg_mr = 0.0
+
+    ############################ ice4_nucleation ###############################
+    with computation(PARALLEL), interval(...):
+        if t < TT and rv_t > V_RTMIN and ldcompute:
+            usw = 0.0
+            w2 = 0.0
+        else:
+            w2 = log(t)
+            usw = exp(ALPW - BETAW / t - GAMW * w2)
+            w2 = exp(ALPI - BETAI / t - GAMI * w2)
+
+    with computation(PARALLEL), interval(...):
+        if t < TT and rv_t > V_RTMIN and ldcompute:
+            ssi = 0
+            w2 = min(pres / 2, w2)
+            ssi = rv_t * (pres - w2) / (EPSILO * w2) - 1
+            usw = min(pres / 2, usw)
+            usw = (usw / w2) * ((pres - w2) / (pres - usw))
+            ssi = min(ssi, usw)
+
+    with computation(PARALLEL), interval(...):
+        w2 = 0.0
+        if t < TT and rv_t > V_RTMIN and ldcompute:
+            if t < TT - 5 and ssi > 0:
+                w2 = NU20 * exp(ALPHA2 * ssi - BETA2)
+            elif t < TT - 2 and t > TT - 5 and ssi > 0:
+                w2 = max(
+                    NU20 * exp(-BETA2),
+                    NU10 * exp(-BETA1 * (t - TT)) * (ssi / usw) ** ALPHA1,
+                )
+
+    with computation(PARALLEL), interval(...):
+        w2 = w2 - ci_t
+        w2 = min(w2, 5e4)
+
+    with computation(PARALLEL), interval(...):
+        rvheni_mr = 0.0
+        if t < TT and rv_t > V_RTMIN and ldcompute:
+            rvheni_mr = max(w2, 0) * MNU0 / rhodref
+            rvheni_mr = min(rv_t, rvheni_mr)
+
+    with computation(PARALLEL), interval(...):
+        if LFEEDBACKT:
+            w1 = 0
+            if t < TT and rv_t > V_RTMIN and ldcompute:
+                w1 = min(rvheni_mr, max(0, (TT / exn - th_t)) / ls_fact) / max(
+                    rvheni_mr, 1e-20
+                )
+            w2 *= w1
+            rvheni_mr *= w1
+
+    with computation(PARALLEL), interval(...):
+        if t < TT and rv_t > V_RTMIN and ldcompute:
+            ci_t = max(w2 + ci_t, ci_t)
+
+    ##################### ice4_nucleation_post_processing ######################
+    with computation(PARALLEL), interval(...):
+        th_t += rvheni_mr * (ls_fact - lv_fact)
+        t = th_t / exn
+        rv_t -= rvheni_mr
+        ri_t += rvheni_mr
+
+    ############################ ice4_rrhong ###################################
+    with computation(PARALLEL), interval(...):
+        if t < TT - 35 and rr_t > R_RTMIN and ldcompute:
+            rrhong_mr = rr_t
+            if LFEEDBACKT == 1:
+                rrhong_mr = min(
+                    rrhong_mr, max(0, ((TT - 35) / exn - th_t) / (ls_fact - lv_fact))
+                )
+        else:
+            rrhong_mr = 0
+
+    ##################### ice4_rrhong_post_processing ##########################
+    with computation(PARALLEL), interval(...):
+        th_t += rrhong_mr * (ls_fact - lv_fact)
+        t = th_t / exn
+        rr_t -= rrhong_mr
+        rg_t += rrhong_mr
+
+    ############################ ice4_rimltc ###################################
+    with computation(PARALLEL), interval(...):
+        if ri_t > 0 and t > TT and ldcompute:
+            rimltc_mr = ri_t
+            if LFEEDBACKT:
+                rimltc_mr = min(
+                    rimltc_mr, max(0, (th_t - TT / exn) / (ls_fact - lv_fact))
+                )
+        else:
+            rimltc_mr = 0
+
+    ##################### ice4_rimltc_post_processing ##########################
+    with computation(PARALLEL), interval(...):
+        th_t -= rimltc_mr * (ls_fact - lv_fact)
+        t = th_t / exn
+        rc_t += rimltc_mr
+        ri_t -= rimltc_mr
+
+    ############################ ice4_increment_update #########################
+    with computation(PARALLEL), interval(...):
+        theta_increment += (
+            rvheni_mr * ls_fact
+            + rrhong_mr * (ls_fact - lv_fact)
+            + rimltc_mr * (ls_fact - lv_fact)
+        )
+        rv_increment -= rvheni_mr
+        rc_increment += rimltc_mr
+        rr_increment -= rrhong_mr
+        ri_increment += rvheni_mr - rimltc_mr
+        rs_increment -= rsrimcg_mr
+        rg_increment += rrhong_mr + rsrimcg_mr
+
+    ############################ ice4_compute_pdf ##############################
+    with computation(PARALLEL), interval(...):
+        rcrautc_tmp = CRIAUTC / rhodref if ldcompute else 0
+
+    with computation(PARALLEL), interval(...):
+        if SUBG_AUCV_RC == 0:
+            if rc_t > rcrautc_tmp and ldcompute:
+                hlc_hcf = 1
+                hlc_lcf = 0
+                hlc_hrc = rc_t
+                hlc_lrc = 0
+            elif rc_t > C_RTMIN and ldcompute:
+                hlc_hcf = 0
+                hlc_lcf = 1
+                hlc_hrc = 0
+                hlc_lrc = rc_t
+            else:
+                hlc_hcf = 0
+                hlc_lcf = 0
+                hlc_hrc = 0
+                hlc_lrc = 0
+
+        elif SUBG_AUCV_RC == 1:
+            if cf > 0 and rc_t > rcrautc_tmp * cf and ldcompute:
+                hlc_hcf = cf
+                hlc_lcf = 0
+                hlc_hrc = rc_t
+                hlc_lrc = 0
+            elif cf > 0 and rc_t > C_RTMIN and ldcompute:
+                hlc_hcf = 0
+                hlc_lcf = cf
+                hlc_hrc = 0
+                hlc_lrc = rc_t
+            else:
+                hlc_hcf = 0
+                hlc_lcf = 0
+                hlc_hrc = 0
+                hlc_lrc = 0
+
+        elif SUBG_AUCV_RC == 2:
+            sumrc_tmp = hlc_lrc + hlc_hrc if ldcompute else 0
+            if sumrc_tmp > 0 and ldcompute:
+                hlc_lrc *= rc_t / sumrc_tmp
+                hlc_hrc *= rc_t / sumrc_tmp
+            else:
+                hlc_lrc = 0
+                hlc_hrc = 0
+
+        elif SUBG_AUCV_RC == 3:
+            if SUBG_PR_PDF == 0:
+                if rc_t > rcrautc_tmp + sigma_rc and ldcompute:
+                    hlc_hcf = 1
+                    hlc_lcf = 0
+                    hlc_hrc = rc_t
+                    hlc_lrc = 0
+                elif (
+                    rc_t > (rcrautc_tmp - sigma_rc)
+                    and rc_t >= (rcrautc_tmp + sigma_rc)
+                    and ldcompute
+                ):
+                    hlc_hcf = (rc_t + sigma_rc - rcrautc_tmp) / (2.0 * sigma_rc)
+                    hlc_lcf = max(0.0, cf - hlc_hcf)
+                    hlc_hrc = (
+                        (rc_t + sigma_rc - rcrautc_tmp)
+                        * (rc_t + sigma_rc + rcrautc_tmp)
+                        / (4.0 * sigma_rc)
+                    )
+                    hlc_lrc = max(0.0, rc_t - hlc_hrc)
+                elif rc_t > C_RTMIN and cf > 0 and ldcompute:
+                    hlc_hcf = 0
+                    hlc_lcf = cf
+                    hlc_hrc = 0
+                    hlc_lrc = rc_t
+                else:
+                    hlc_hcf = 0.0
+                    hlc_lcf = 0.0
+                    hlc_hrc = 0.0
+                    hlc_lrc = 0.0
+
+    with computation(PARALLEL), interval(...):
+        criauti_tmp = (
+            min(CRIAUTI, 10 ** (ACRIAUTI * (t - TT) + BCRIAUTI)) if ldcompute else 0
+        )
+
+        if SUBG_AUCV_RI == 0:
+            if ri_t > criauti_tmp and ldcompute:
+                hli_hcf = 1
+                hli_lcf = 0
+                hli_hri = ri_t
+                hli_lri = 0
+            elif ri_t > I_RTMIN and ldcompute:
+                hli_hcf = 0
+                hli_lcf = 1
+                hli_hri = 0
+                hli_lri = ri_t
+            else:
+                hli_hcf = 0
+                hli_lcf = 0
+                hli_hri = 0
+                hli_lri = 0
+
+        elif SUBG_AUCV_RI == 1:
+            if cf > 0 and ri_t > criauti_tmp * cf and ldcompute:
+                hli_hcf = cf
+                hli_hri = 0
+                hli_hri = ri_t
+                hli_lri = 0
+            elif cf > 0 and ri_t > I_RTMIN and ldcompute:
+                hli_hcf = 0
+                hli_lcf = cf
+                hli_hri = 0
+                hli_lri = ri_t
+            else:
+                hli_hcf = 0
+                hli_lcf = 0
+                hli_hri = 0
+                hli_lri = 0
+
+        elif SUBG_AUCV_RI == 2:
+            sumri_tmp = hli_lri + hli_hri if ldcompute else 0
+            if sumri_tmp > 0 and ldcompute:
+                hli_lri *= ri_t / sumri_tmp
+                hli_hri *= ri_t / sumri_tmp
+            else:
+                hli_lri = 0
+                hli_hri = 0
+
+    with computation(PARALLEL), interval(...):
+        fr = max(hlc_hcf, hli_hcf) if ldcompute else 0
+
+    ############################ ice4_derived_fields ###########################
+    with computation(PARALLEL), interval(...):
+        zw = exp(ALPI - BETAI / t - GAMI * log(t))
+        ssi = rv_t * (pres - zw) / (EPSILO * zw)
+        ka = 2.38e-2 + 7.1e-5 * (t - TT)
+        dv = 2.11e-5 * (t / TT) ** 1.94 * (P00 / pres)
+        ai = (LSTT + (CPV - CI) * (t - TT)) ** 2 / (ka**RV * t**2) + (
+            RV * t / (dv * zw)
+        )
+        cj = SCFAC * rhodref**0.3 / sqrt(1.718e-5 + 4.9 - 8 * (t - TT))
+
+    ############################ ice4_slope_parameters #########################
+    with computation(PARALLEL), interval(...):
+        lbdar = LBR * (rhodref * max(rr_t, R_RTMIN)) ** LBEXR if rr_t > 0 else 0
+        lbdar_rf = lbdar
+
+        if LSNOW_T:
+            if rs_t > 0 and t > 263.15:
+                lbdas = (
+                    max(min(LBDAS_MAX, 10 ** (14.554 - 0.0423 * t)), LBDAS_MIN)
+                    * TRANS_MP_GAMMAS
+                )
+            elif rs_t > 0 and t <= 263.15:
+                lbdas = (
+                    max(min(LBDAS_MAX, 10 ** (6.226 - 0.0106 * t)), LBDAS_MIN)
+                    * TRANS_MP_GAMMAS
+                )
+            else:
+                lbdas = 0
+        else:
+            lbdas = (
+                min(LBDAS_MAX, LBS * (rhodref * max(rs_t, S_RTMIN)) ** LBEXS)
+                if rs_t > 0
+                else 0
+            )
+
+        lbdag = (
+            min(LBDAG_MAX, LBS * (rhodref * max(rg_t, G_RTMIN)) ** LBEXS)
+            if rg_t > 0
+            else 0
+        )
+
+    ############################ ice4_slow #####################################
+    with computation(PARALLEL), interval(...):
+        if t < TT - 35.0 and rc_t > C_RTMIN and ldcompute:
+            rc_honi_tnd = (
+                min(1000, HON * rhodref * rc_t * exp(ALPHA3 * (t - TT) - BETA3))
+                if not ldsoft
+                else rc_honi_tnd
+            )
+        else:
+            rc_honi_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if rv_t < V_RTMIN and rs_t < S_RTMIN and ldcompute:
+            rv_deps_tnd = (
+                (ssi / (rhodref * ai))
+                * (O0DEPS * lbdas**EX0DEPS + O1DEPS * cj * lbdas**EX1DEPS)
+                if not ldsoft
+                else rv_deps_tnd
+            )
+        else:
+            rv_deps_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if ri_t > I_RTMIN and rs_t > S_RTMIN and ldcompute:
+            ri_aggs_tnd = (
+                (
+                    FIAGGS
+                    * exp(COLEXIS * (t - TT))
+                    * ri_t
+                    * lbdas**EXIAGGS
+                    * rhodref ** (-CEXVT)
+                )
+                if not ldsoft
+                else ri_aggs_tnd
+            )
+        else:
+            ri_aggs_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if hli_hri > I_RTMIN and ldcompute:
+            if not ldsoft:
+                criauti_tmp = min(CRIAUTI, 10 ** (ACRIAUTI * (t - TT) + BCRIAUTI))
+                ri_auts_tnd = (
+                    TIMAUTI
+                    * exp(TEXAUTI * (t - TT))
+                    * max(0, hli_hri - criauti_tmp * hli_hcf)
+                )
+        else:
+            ri_auts_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if rv_t > V_RTMIN and rg_t > G_RTMIN and ldcompute:
+            rv_depg_tnd = (
+                (ssi / (rhodref * ai))
+                * (O0DEPG * lbdag**EX0DEPG + O1DEPG * cj * lbdag**EX1DEPG)
+                if not ldsoft
+                else rv_depg_tnd
+            )
+        else:
+            rv_depg_tnd = 0
+
+    ############################ ice4_warm #####################################
+    with computation(PARALLEL), interval(...):
+        if hlc_hrc > C_RTMIN and hlc_hcf > 0 and ldcompute:
+            rcautr = (
+                TIMAUTC * max(hlc_hrc - hlc_hcf * CRIAUTC / rhodref, 0)
+                if not ldsoft
+                else rcautr
+            )
+        else:
+            rcautr = 0
+
+    with computation(PARALLEL), interval(...):
+        if SUBG_RC_RR_ACCR == 0:
+            if rc_t > C_RTMIN and rr_t > R_RTMIN and ldcompute:
+                rcaccr = (
+                    FCACCR * rc_t * lbdar * EXCACCR * rhodref ** (-CEXVT)
+                    if not ldsoft
+                    else rcaccr
+                )
+            else:
+                rcaccr = 0
+
+    with computation(PARALLEL), interval(...):
+        if SUBG_RR_EVAP == 0:
+            if rr_t > R_RTMIN and rc_t <= C_RTMIN and ldcompute:
+                if not ldsoft:
+                    rrevav = exp(ALPW - BETAW / t - GAMW * log(t))
+                    usw = 1 - rv_t * (pres - rrevav)
+                    rrevav = (LVTT + (CPV - CL) * (t - TT)) ** 2 / (
+                        ka * RV * t**2
+                    ) + (RV * t) / (dv * rrevav)
+                    rrevav = (max(0, usw / (rhodref * rrevav))) * (
+                        O0EVAR * lbdar**EX0EVAR + O1EVAR * cj * EX1EVAR
+                    )
+
+    with computation(PARALLEL), interval(...):
+        if SUBG_RR_EVAP == 1 or SUBG_RR_EVAP == 2:
+            if SUBG_RR_EVAP == 1:
+                zw4 = 1
+                zw3 = lbdar
+            elif SUBG_RR_EVAP == 2:
+                zw4 = fr
+                zw3 = lbdar_rf
+
+            if rr_t > R_RTMIN and zw4 > cf and ldcompute:
+                if not ldsoft:
+                    thlt_tmp = th_t - LVTT * th_t / CPD / t * rc_t
+                    zw2 = thlt_tmp * t / th_t
+                    rrevav = exp(ALPW - BETAW / zw2 - GAMW * log(zw2))
+                    usw = 1 - rv_t * (pres - rrevav) / (EPSILO * rrevav)
+                    rrevav = (LVTT + (CPV - CL) * (zw2 - TT)) ** 2 / (
+                        ka * RV * zw2**2
+                    ) + RV * zw2 / (dv * rrevav)
+                    rrevav = (
+                        max(0, usw)
+                        / (rhodref * rrevav)
+                        * (O0EVAR * zw3**EX0EVAR + O1EVAR * cj * zw3**EX1EVAR)
+                    )
+                    rrevav = rrevav * (zw4 - cf)
+            else:
+                rrevav = 0
+
+    ############################ ice4_fast_rs ##################################
+    with computation(PARALLEL), interval(...):
+        if rs_t < S_RTMIN and ldcompute:
+            rs_freez1_tnd = rv_t * pres / (EPSILO + rv_t)
+            if LEVLIMIT:
+                rs_freez1_tnd = min(
+                    rs_freez1_tnd, exp(ALPI - BETAI / t - GAMI * log(t))
+                )
+            rs_freez1_tnd = ka * (TT - t) + dv * (LVTT + (CPV - CL) * (t - TT)) * (
+                ESTT - rs_freez1_tnd
+            ) / (RV * t)
+            rs_freez1_tnd *= (
+                O0DEPS * lbdas**EX0DEPS + O1DEPS * cj * lbdas**EX1DEPS
+            ) / (rhodref * (LMTT - CL * (TT - t)))
+            rs_freez2_tnd = (rhodref * (LMTT + (CI - CL) * (TT - t))) / (
+                rhodref * (LMTT - CL * (TT - t))
+            )
+            freez_rate_tmp = 0.0
+        else:
+            rs_freez1_tnd = 0
+            rs_freez2_tnd = 0
+            freez_rate_tmp = 0.0
+
+    with computation(PARALLEL), interval(...):
+        if rc_t > C_RTMIN and rs_t > S_RTMIN and ldcompute:
+            zw_tmp = lbdas
+            grim_tmp = True
+        else:
+            grim_tmp = False
+            rs_rcrims_tnd = 0
+            rs_rcrimss_tnd = 0
+            rs_rsrimcg_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if (not ldsoft) and grim_tmp:
+            index_floor, index_float = index_interp_micro_1d(zw_tmp)
+            zw1_tmp = (
+                index_float * gaminc_rim1.A[index_floor + 1]
+                + (1 - index_float) * gaminc_rim1.A[index_floor]
+            )
+            zw2_tmp = (
+                index_float * gaminc_rim2.A[index_floor + 1]
+                + (1 - index_float) * gaminc_rim2.A[index_floor]
+            )
+            zw3_tmp = (
+                index_float * gaminc_rim4.A[index_floor + 1]
+                + (1 - index_float) * gaminc_rim4.A[index_floor]
+            )
+
+    with computation(PARALLEL), interval(...):
+        if grim_tmp:
+            rs_rcrimss_tnd = (
+                CRIMSS * zw1_tmp * rc_t * lbdas**EXCRIMSS * rhodref ** (-CEXVT)
+            )
+
+    with computation(PARALLEL), interval(...):
+        if grim_tmp:
+            rs_rcrims_tnd = CRIMSG * rc_t * lbdas**EXCRIMSG * rhodref ** (-CEXVT)
+
+    with computation(PARALLEL), interval(...):
+        if SNOW_RIMING == 0:
+            if grim_tmp:
+                zw_tmp = rs_rsrimcg_tnd - rs_rcrimss_tnd
+                rs_rsrimcg_tnd = SRIMCG * lbdas**EXSRIMCG * (1 - zw2_tmp)
+                rs_rsrimcg_tnd = (
+                    zw_tmp
+                    * rs_rsrimcg_tnd
+                    / max(
+                        1e-20,
+                        SRIMCG3 * SRIMCG2 * lbdas**EXSRIMCG2 * (1 - zw3_tmp)
+                        - SRIMCG3 * rs_rsrimcg_tnd,
+                    )
+                )
+        else:
+            rs_rsrimcg_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if grim_tmp and t < TT:
+            rcrimss = min(freez_rate_tmp, rs_rcrimss_tnd)
+            freez_rate_tmp = max(0, freez_rate_tmp - rcrimss)
+            zw0_tmp = min(1, freez_rate_tmp / max(1e-20, rs_rcrims_tnd - rcrimss))
+            rcrimsg = zw0_tmp * max(0, rs_rcrims_tnd - rcrimss)
+            freez_rate_tmp = max(0, freez_rate_tmp - rcrimsg)
+            rsrimcg = zw0_tmp * rs_rsrimcg_tnd
+            rsrimcg *= max(0, -sign(1, -rcrimsg))
+            rcrimsg = max(0, rcrimsg)
+        else:
+            rcrimss = 0
+            rcrimsg = 0
+            rsrimcg = 0
+
+    with computation(PARALLEL), interval(...):
+        if rr_t > R_RTMIN and rs_t > S_RTMIN and ldcompute:
+            gacc_tmp = True
+        else:
+            gacc_tmp = False
+            rs_rraccs_tnd = 0
+            rs_rraccss_tnd = 0
+            rs_rsaccrg_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if (not ldsoft) and gacc_tmp:
+            rs_rraccs_tnd = 0
+            rs_rraccss_tnd = 0
+            rs_rsaccrg_tnd = 0
+
+            index_floor_r, index_float_r = index_micro2d_acc_r(lbdar)
+            index_floor_s, index_float_s = index_micro2d_acc_s(lbdas)
+            zw1_tmp = index_float_s * (
+                index_float_r * ker_raccss.A[index_floor_s + 1, index_floor_r + 1]
+                + (1 - index_float_r) * ker_raccss.A[index_floor_s + 1, index_floor_r]
+            ) + (1 - index_float_s) * (
+                index_float_r * ker_raccss.A[index_floor_s, index_floor_r + 1]
+                + (1 - index_float_r) * ker_raccss.A[index_floor_s, index_floor_r]
+            )
+
+            zw2_tmp = index_float_s * (
+                index_float_r * ker_raccs.A[index_floor_s + 1, index_floor_r + 1]
+                + (1 - index_float_r) * ker_raccs.A[index_floor_s + 1, index_floor_r]
+            ) + (1 - index_float_s) * (
+                index_float_r * ker_raccs.A[index_floor_s, index_floor_r + 1]
+                + (1 - index_float_r) * ker_raccs.A[index_floor_s, index_floor_r]
+            )
+
+            zw3_tmp = index_float_s * (
+                index_float_r * ker_saccrg.A[index_floor_s + 1, index_floor_r + 1]
+                + (1 - index_float_r) * ker_saccrg.A[index_floor_s + 1, index_floor_r]
+            ) + (1 - index_float_s) * (
+                index_float_r * ker_saccrg.A[index_floor_s, index_floor_r + 1]
+                + (1 - index_float_r) * ker_saccrg.A[index_floor_s, index_floor_r]
+            )
+
+    with computation(PARALLEL), interval(...):
+        if gacc_tmp:
+            zw_tmp = (
+                FRACCSS
+                * (lbdas**CXS)
+                * (rhodref ** (-CEXVT))
+                * (
+                    LBRACCS1 / (lbdas**2)
+                    + LBRACCS2 / (lbdas * lbdar)
+                    + LBRACCS3 / (lbdar**2)
+                )
+                / lbdar**4
+            )
+
+    with computation(PARALLEL), interval(...):
+        if gacc_tmp:
+            rs_rsaccrg_tnd = (
+                FSACCRG
+                * zw3_tmp
+                * (lbdas ** (CXS - BS))
+                * (rhodref ** (-CEXVT - 1))
+                * (
+                    LBSACCR1 / (lbdas**2)
+                    + LBSACCR2 / (lbdar * lbdas)
+                    + LBSACCR3 / (lbdas**2)
+                )
+                / lbdar
+            )
+
+    with computation(PARALLEL), interval(...):
+        if gacc_tmp and t < TT:
+            rraccss = min(freez_rate_tmp, rs_rraccss_tnd)
+            freez_rate_tmp = max(0, freez_rate_tmp - rraccss)
+            zw_tmp = min(1, freez_rate_tmp / max(1e-20, rs_rraccss_tnd - rraccss))
+            rraccsg = zw_tmp * max(0, rs_rraccs_tnd - rraccss)
+            freez_rate_tmp = max(0, freez_rate_tmp - rraccsg)
+            rsaccrg = zw_tmp * rs_rsaccrg_tnd
+            rsaccrg *= max(0, -sign(1, -rraccsg))
+            rraccsg = max(0, rraccsg)
+        else:
+            rraccss = 0
+            rraccsg = 0
+            rsaccrg = 0
+
+    with computation(PARALLEL), interval(...):
+        if rs_t < S_RTMIN and t > TT and ldcompute:
+            if not ldsoft:
+                rs_mltg_tnd = rv_t * pres / (EPSILO + rv_t)
+                if LEVLIMIT:
+                    rs_mltg_tnd = min(
+                        rs_mltg_tnd, exp(ALPW - BETAW / t - GAMW * log(t))
+                    )
+                rs_mltg_tnd = ka * (TT - t) + (
+                    dv
+                    * (LVTT + (CPV - CL) * (t - TT))
+                    * (ESTT - rs_mltg_tnd)
+                    / (RV * t)
+                )
+                rs_mltg_tnd = FSCVMG * max(
+                    0,
+                    (
+                        -rs_mltg_tnd
+                        * (O0DEPS * lbdas**EX0DEPS + O1DEPS * cj * lbdas * EX1DEPS)
+                        - (rs_rcrims_tnd + rs_rraccs_tnd) * (rhodref * CL * (TT - t))
+                    )
+                    / (rhodref * LMTT),
+                )
+                rc_mltsr_tnd = rs_rcrims_tnd
+        else:
+            rs_mltg_tnd = 0
+            rc_mltsr_tnd = 0
+
+    # Translation note : ice4_fast_rg_pre_processing omitted,
+    #                    rgsi and rgsi_mr are not read by the chain
+
+    ############################ ice4_fast_rg ##################################
+    with computation(PARALLEL), interval(...):
+        if ri_t > I_RTMIN and rr_t > R_RTMIN and ldcompute:
+            if not ldsoft:
+                ricfrrg = ICFRR * ri_t * lbdar**EXICFRR * rhodref ** (-CEXVT)
+                rrcfrig = RCFRI * ci_t * lbdar**EXRCFRI * rhodref ** (-CEXVT)
+                if LCRFLIMIT:
+                    zw0d = max(
+                        0,
+                        min(
+                            1,
+                            (ricfrrg * CI + rrcfrig * CL)
+                            * (TT - t)
+                            / max(1e-20, LVTT * rrcfrig),
+                        ),
+                    )
+                    rrcfrig = zw0d * rrcfrig
+                    ricfrr = (1 - zw0d) * rrcfrig
+                    ricfrrg = zw0d * ricfrrg
+                else:
+                    ricfrr = 0
+        else:
+            ricfrrg = 0
+            rrcfrig = 0
+            ricfrr = 0
+
+    with computation(PARALLEL), interval(...):
+        if rg_t > G_RTMIN and rc_t > R_RTMIN and ldcompute:
+            if not ldsoft:
+                rg_rcdry_tnd = lbdag ** (CXG - DG - 2.0) * rhodref ** (-CEXVT)
+                rg_rcdry_tnd = rg_rcdry_tnd * FCDRYG * rc_t
+        else:
+            rg_rcdry_tnd = 0
+
+        if rg_t > G_RTMIN and ri_t > I_RTMIN and ldcompute:
+            if not ldsoft:
+                rg_ridry_tnd = lbdag ** (CXG - DG - 2.0) * rhodref ** (-CEXVT)
+                rg_ridry_tnd = FIDRYG * exp(COLEXIG * (t - TT)) * ri_t * rg_ridry_tnd
+                rg_riwet_tnd = rg_ridry_tnd / (COLIG * exp(COLEXIG * (t - TT)))
+        else:
+            rg_ridry_tnd = 0
+            rg_riwet_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if rs_t > S_RTMIN and rg_t > G_RTMIN and ldcompute:
+            gdry = True
+        else:
+            gdry = False
+            rg_rsdry_tnd = 0
+            rg_rswet_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if (not ldsoft) and gdry:
+            index_floor_s, index_float_s = index_micro2d_dry_s(lbdas)
+            index_floor_g, index_float_g = index_micro2d_dry_g(lbdag)
+            zw_tmp = index_float_g * (
+                index_float_s * ker_sdryg.A[index_floor_g + 1, index_floor_s + 1]
+                + (1 - index_float_s) * ker_sdryg.A[index_floor_g + 1, index_floor_s]
+            ) + (1 - index_float_g) * (
+                index_float_s * ker_sdryg.A[index_floor_g, index_floor_s + 1]
+                + (1 - index_float_s) * ker_sdryg.A[index_floor_g, index_floor_s]
+            )
+
+    with computation(PARALLEL), interval(...):
+        if gdry:
+            rg_rswet_tnd = (
+                FSDRYG
+                * zw_tmp
+                / COLSG
+                * (lbdas * (CXS - BS))
+                * (lbdag**CXG)
+                * (rhodref ** (-CEXVT))
+                * (
+                    LBSDRYG1 / (lbdag**2)
+                    + LBSDRYG2 / (lbdag * lbdas)
+                    + LBSDRYG3 / (lbdas**2)
+                )
+            )
+            rg_rsdry_tnd = rg_rswet_tnd * COLSG * exp(t - TT)
+
+    with computation(PARALLEL), interval(...):
+        if rr_t < R_RTMIN and rg_t < G_RTMIN and ldcompute:
+            gdry = True
+        else:
+            gdry = False
+            rg_rrdry_tnd = 0
+
+    with computation(PARALLEL), interval(...):
+        if not ldsoft:
+            index_floor_g, index_float_g = index_micro2d_dry_g(lbdag)
+            index_floor_r, index_float_r = index_micro2d_dry_r(lbdar)
+            zw_tmp = index_float_r * (
+                index_float_g * ker_rdryg.A[index_floor_r + 1, index_floor_g + 1]
+                + (1 - index_float_g) * ker_rdryg.A[index_floor_r + 1, index_floor_g]
+            ) + (1 - index_float_r) * (
+                index_float_g * ker_rdryg.A[index_floor_r, index_floor_g + 1]
+                + (1 - index_float_g) * ker_rdryg.A[index_floor_r, index_floor_g]
+            )
+
+    with computation(PARALLEL), interval(...):
+        if (not ldsoft) and gdry:
+            rg_rrdry_tnd = (
+                FRDRYG
+                * zw_tmp
+                * (lbdar ** (-4))
+                * (lbdag**CXG)
+                * (rhodref ** (-CEXVT - 1))
+                * (
+                    LBSDRYG1 / (lbdag**2)
+                    + LBSDRYG2 / (lbdag * lbdar)
+                    + LBSDRYG3 / (lbdar**2)
+                )
+            )
+
+    with computation(PARALLEL), interval(...):
+        rdryg_init_tmp = rg_rcdry_tnd + rg_ridry_tnd + rg_rsdry_tnd + rg_rrdry_tnd
+
+    with computation(PARALLEL), interval(...):
+        if rg_t > G_RTMIN and ldcompute:
+            if not ldsoft:
+                rg_freez1_tnd = rv_t * pres / (EPSILO + rv_t)
+                if LEVLIMIT:
+                    rg_freez1_tnd = min(
+                        rg_freez1_tnd, exp(ALPI - BETAI / t - GAMI * log(t))
+                    )
+                rg_freez1_tnd = ka * (TT - t) + dv * (LVTT + (CPV - CL) * (t - TT)) * (
+                    ESTT - rg_freez1_tnd
+                ) / (RV * t)
+                rg_freez1_tnd *= (
+                    O0DEPG * lbdag**EX0DEPG + O1DEPG * cj * lbdag**EX1DEPG
+                ) / (rhodref * (LMTT - CL * (TT - t)))
+                rg_freez2_tnd = (rhodref * (LMTT + (CI - CL) * (TT - t))) / (
+                    rhodref * (LMTT - CL * (TT - t))
+                )
+
+            rwetg_init_tmp = max(
+                rg_riwet_tnd + rg_rswet_tnd,
+                max(0, rg_freez1_tnd + rg_freez2_tnd * (rg_riwet_tnd + rg_rswet_tnd)),
+            )
+
+            ldwetg = (
+                1
+                if (
+                    max(0, rwetg_init_tmp - rg_riwet_tnd - rg_rswet_tnd)
+                    <= max(0, rdryg_init_tmp - rg_ridry_tnd - rg_rsdry_tnd)
+                )
+                else 0
+            )
+
+            if not LNULLWETG:
+                ldwetg = 1 if (ldwetg == 1 and rdryg_init_tmp > 0) else 0
+            else:
+                ldwetg = 1 if (ldwetg == 1 and rwetg_init_tmp > 0) else 0
+
+            if not LWETGPOST:
+                ldwetg = 1 if (ldwetg == 1 and t < TT) else 0
+
+            lldryg = (
+                1
+                if (
+                    t < TT
+                    and rdryg_init_tmp > 1e-20
+                    and max(0, rwetg_init_tmp - rg_riwet_tnd - rg_rswet_tnd)
+                    > max(0, rg_rsdry_tnd - rg_ridry_tnd - rg_rsdry_tnd)
+                )
+                else 0
+            )
+        else:
+            rg_freez1_tnd = 0
+            rg_freez2_tnd = 0
+            rwetg_init_tmp = 0
+            ldwetg = 0
+            lldryg = 0
+
+    # Translation note : wet and dry growth rates (rr_wetg, ..., rs_dry) of
+    #                    ice4_fast_rg are not read by the chain, l317 omitted
+
+    with computation(PARALLEL), interval(...):
+        if rg_t > G_RTMIN and t > TT and ldcompute:
+            if not ldsoft:
+                rgmltr = rv_t * pres / (EPSILO + rv_t)
+                if LEVLIMIT:
+                    rgmltr = min(rgmltr, exp(ALPW - BETAW / t - GAMW * log(t)))
+                rgmltr = ka * (TT - t) + dv * (LVTT + (CPV - CL) * (t - TT)) * (
+                    ESTT - rgmltr
+                ) / (RV * t)
+                rgmltr = max(
+                    0,
+                    (
+                        -rgmltr
+                        * (O0DEPG * lbdag**EX0DEPG + O1DEPG * cj * lbdag**EX1DEPG)
+                        - (rg_rcdry_tnd + rg_rrdry_tnd) * (rhodref * CL * (TT - t))
+                    )
+                    / (rhodref * LMTT),
+                )
+        else:
+            rgmltr = 0
+
+    ############################ ice4_fast_ri ##################################
+    with computation(PARALLEL), interval(...):
+        if not ldsoft:
+            if (
+                ssi > 0
+                and rc_t > C_RTMIN
+                and ri_t > I_RTMIN
+                and ci_t > 1e-20
+                and ldcompute
+            ):
+                rc_beri_tnd = min(1e-8, LBI * (rhodref * ri_t / ci_t) ** LBEXI)
+                rc_beri_tnd = (
+                    (ssi / (rhodref * ai))
+                    * ci_t
+                    * (O0DEPI / rc_beri_tnd + O2DEPI * cj / rc_beri_tnd ** (DI + 2.0))
+                )
+            else:
+                rc_beri_tnd = 0
+
+    ############################ ice4_tendencies_update ########################
+    with computation(PARALLEL), interval(...):
+        theta_tnd += (
+            rvdepg * ls_fact
+            + rchoni * (ls_fact - lv_fact)
+            + rvdeps * ls_fact
+            - rrevav * lv_fact
+            + rcrimss * (ls_fact - lv_fact)
+            + rcrimsg * (ls_fact - lv_fact)
+            + rraccss * (ls_fact - lv_fact)
+            + rraccsg * (ls_fact - lv_fact)
+            + (rrcfrig - ricfrr) * (ls_fact - lv_fact)
+            + (rcwetg + rrwetg) * (ls_fact - lv_fact)
+            + (rcdryg + rrdryg) * (ls_fact - lv_fact)
+            - rgmltr * (ls_fact - lv_fact)
+            + rcberi * (ls_fact - lv_fact)
+        )
+
+        # (v)
+        rv_tnd += -rvdepg - rvdeps + rrevav
+
+        # (c)
+        rc_tnd += (
+            -rchoni
+            - rcautr
+            - rcaccr
+            - rcrimss
+            - rcrimsg
+            - rcmltsr
+            - rcwetg
+            - rcdryg
+            - rcberi
+        )
+
+        # (r)
+        rr_tnd += (
+            rcautr
+            + rcaccr
+            - rrevav
+            - rraccss
+            - rraccsg
+            + rcmltsr
+            - rrcfrig
+            + ricfrr
+            - rrwetg
+            - rrdryg
+            + rgmltr
+        )
+
+        # (i)
+        ri_tnd += rchoni - riaggs - riauts - ricfrrg - ricfrr - riwetg - ridryg + rcberi
+
+        # (s)
+        rs_tnd += (
+            rvdeps
+            + riaggs
+            + riauts
+            + rcrimss
+            - rcrimsg
+            + rraccss
+            - rsaccrg
+            - rsmltg
+            - rswetg
+            - rsdryg
+        )
+
+        # (g)
+        rg_tnd += (
+            rvdepg
+            + rcrimsg
+            + rsrimcg
+            + rraccsg
+            + rsaccrg
+            + rsmltg
+            + ricfrrg
+            + rrcfrig
+            + rcwetg
+            + riwetg
+            + rswetg
+            + rrwetg
+            + rcdryg
+            + ridryg
+            + rsdryg
+            + rrdryg
+            - rgmltr
+        )
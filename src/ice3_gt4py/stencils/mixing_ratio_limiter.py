@@ -6,6 +6,8 @@ from gt4py.cartesian.gtscript import (
     __externals__,
     computation,
     interval,
+    FORWARD,
+    IJ,
     PARALLEL,
 )
 from ifs_physics_common.framework.stencil import stencil_collection
@@ -44,6 +46,7 @@ def mixing_ratio_step_limiter(
     rg_tnd_a: Field["float"],
     delta_t_micro: Field["float"],
     ldcompute: Field["bool"],
+    ldcompute_count: Field[IJ, "int"],
 ):
     """_summary_
 
@@ -70,6 +73,7 @@ def mixing_ratio_step_limiter(
         rg_tnd_a (Field[float]): _description_
         delta_t_micro (Field[float]): _description_
         time_threshold_tmp (Field[float]): _description_
+        ldcompute_count (Field[IJ, int]): number of points with ldcompute per column
     """
     from __externals__ import C_RTMIN, G_RTMIN, I_RTMIN, MRSTEP, R_RTMIN, S_RTMIN
 
@@ -132,7 +136,7 @@ def mixing_ratio_step_limiter(
         if (
             time_threshold_tmp >= 0
             and time_threshold_tmp < delta_t_micro
-            and (rc_t > I_RTMIN or ri_tnd_a > 0)
+            and (ri_t > I_RTMIN or ri_tnd_a > 0)
         ):
             delta_t_micro = min(delta_t_micro, time_threshold_tmp)
             ldcompute = False
@@ -185,3 +189,10 @@ def mixing_ratio_step_limiter(
         if r_b_max > MRSTEP:
             delta_t_micro = 0
             ldcompute = False
+
+    # Translation note : column count replaces the host reduction ANY(LLCOMPUTE) of the inner loop
+    with computation(FORWARD), interval(0, 1):
+        ldcompute_count[0, 0] = 0
+    with computation(FORWARD), interval(...):
+        if ldcompute:
+            ldcompute_count[0, 0] += 1
@@ -1,10 +1,18 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
 
-from gt4py.cartesian.gtscript import Field, computation, PARALLEL, interval
+from gt4py.cartesian.gtscript import (
+    Field,
+    computation,
+    FORWARD,
+    IJ,
+    PARALLEL,
+    interval,
+)
 from ifs_physics_common.framework.stencil import stencil_collection
 from ifs_physics_common.utils.f2py import ported_method
 
+from ice3_gt4py.functions.sign import sign
 from ice3_gt4py.functions.stepping import mixing_ratio_step_limiter
 
 
@@ -45,6 +53,7 @@ def step_limiter(
     delta_t_soft: Field["float"],
     t_soft: Field["float"],
     ldcompute: Field["bool"],
+    dt: "float",
 ):
     from __externals__ import (
         C_RTMIN,
@@ -53,7 +62,6 @@ def step_limiter(
         MNH_TINY,
         R_RTMIN,
         S_RTMIN,
-        TSTEP,
         TSTEP_TS,
         TT,
     )
@@ -69,7 +77,7 @@ def step_limiter(
 
     # 4.6 Time integration
     with computation(PARALLEL), interval(...):
-        delta_t_micro = TSTEP - t_micro if ldcompute else 0
+        delta_t_micro = dt - t_micro if ldcompute else 0
 
     # Adjustment of tendencies when temperature reaches 0
     with computation(PARALLEL), interval(...):
@@ -77,7 +85,7 @@ def step_limiter(
         if (theta_t - theta_tt) * (theta_t + theta_b - theta_tt) < 0:
             delta_t_micro = 0
 
-        if abs(theta_a_tnd > 1e-20):
+        if abs(theta_a_tnd) > 1e-20:
             delta_t_tmp = (theta_tt - theta_b - theta_t) / theta_a_tnd
             if delta_t_tmp > 0:
                 delta_t_micro = min(delta_t_micro, delta_t_tmp)
@@ -111,7 +119,7 @@ def step_limiter(
 
     # We stop when the end of the timestep is reached
     with computation(PARALLEL), interval(...):
-        ldcompute = False if t_micro + delta_t_micro > TSTEP else ldcompute
+        ldcompute = False if t_micro + delta_t_micro > dt else ldcompute
 
     # TODO : TSTEP_TS out of the loop
     with computation(PARALLEL), interval(...):
@@ -215,14 +223,232 @@ def external_tendencies_update(
     rs_tnd_ext: Field["float"],
     rg_tnd_ext: Field["float"],
     ldmicro: Field["bool"],
+    dt: "float",
 ):
-    from __externals__ import TSTEP
-
     with computation(PARALLEL), interval(...):
         if ldmicro:
-            th_t -= theta_tnd_ext * TSTEP
-            rc_t -= rc_tnd_ext * TSTEP
-            rr_t -= rr_tnd_ext * TSTEP
-            ri_t -= ri_tnd_ext * TSTEP
-            rs_t -= rs_tnd_ext * TSTEP
-            rg_t -= rg_tnd_ext * TSTEP
+            th_t -= theta_tnd_ext * dt
+            rc_t -= rc_tnd_ext * dt
+            rr_t -= rr_tnd_ext * dt
+            ri_t -= ri_tnd_ext * dt
+            rs_t -= rs_tnd_ext * dt
+            rg_t -= rg_tnd_ext * dt
+
+
+@ported_method(
+    from_file="PHYEX/src/common/micro/mode_ice4_stepping.F90",
+    from_line=290,
+    to_line=404,
+)
+@stencil_collection("step_limiter_state_update")
+def step_limiter_state_update(
+    exn: Field["float"],
+    th_t: Field["float"],
+    rc_t: Field["float"],
+    rr_t: Field["float"],
+    ri_t: Field["float"],
+    rs_t: Field["float"],
+    rg_t: Field["float"],
+    ci_t: Field["float"],
+    theta_a_tnd: Field["float"],
+    rc_a_tnd: Field["float"],
+    rr_a_tnd: Field["float"],
+    ri_a_tnd: Field["float"],
+    rs_a_tnd: Field["float"],
+    rg_a_tnd: Field["float"],
+    theta_b: Field["float"],
+    rc_b: Field["float"],
+    rr_b: Field["float"],
+    ri_b: Field["float"],
+    rs_b: Field["float"],
+    rg_b: Field["float"],
+    rc_0r_t: Field["float"],
+    rr_0r_t: Field["float"],
+    ri_0r_t: Field["float"],
+    rs_0r_t: Field["float"],
+    rg_0r_t: Field["float"],
+    t_micro: Field["float"],
+    ldcompute: Field["bool"],
+    ldmicro: Field["bool"],
+    ldcompute_count: Field[IJ, "int"],
+    dt: "float",
+):
+    """Time step limit, mixing ratio limiter and state update in a single sweep
+
+    Same computations as step_limiter, mixing_ratio_step_limiter and state_update
+    launched in sequence, delta_t_micro being a stencil temporary.
+
+    Args:
+        exn (Field[float]): exner pressure
+        th_t (Field[float]): potential temperature at t
+        rc_t, rr_t, ri_t, rs_t, rg_t (Field[float]): mixing ratios at t
+        ci_t (Field[float]): ice concentration at t
+        theta_a_tnd, ..., rg_a_tnd (Field[float]): tendencies (A in f90)
+        theta_b, ..., rg_b (Field[float]): increments (B in f90)
+        rc_0r_t, ..., rg_0r_t (Field[float]): mixing ratios at the start of the outer iteration
+        t_micro (Field[float]): time of microphysics reached
+        ldcompute (Field[bool]): switch to compute microphysical processes
+        ldmicro (Field[bool]): microphysics mask
+        ldcompute_count (Field[IJ, int]): number of points with ldcompute per column
+        dt (float): timestep of the call, PTSTEP
+    """
+    from __externals__ import (
+        C_RTMIN,
+        G_RTMIN,
+        I_RTMIN,
+        MNH_TINY,
+        MRSTEP,
+        R_RTMIN,
+        S_RTMIN,
+        TT,
+    )
+
+    # Translation note : no external tendencies in AROME, l277 to l283 omitted
+    #                    XTSTEP_TS = 0 is assumed as in Ice4Stepping, l334 to l341 omitted
+
+    ############################ step_limiter ##################################
+    # 4.6 Time integration
+    with computation(PARALLEL), interval(...):
+        delta_t_micro = dt - t_micro if ldcompute else 0
+
+    # Adjustment of tendencies when temperature reaches 0
+    with computation(PARALLEL), interval(...):
+        theta_tt = TT / exn
+        if (th_t - theta_tt) * (th_t + theta_b - theta_tt) < 0:
+            delta_t_micro = 0
+
+        if abs(theta_a_tnd) > 1e-20:
+            delta_t_tmp = (theta_tt - theta_b - th_t) / theta_a_tnd
+            if delta_t_tmp > 0:
+                delta_t_micro = min(delta_t_micro, delta_t_tmp)
+
+    # Tendencies adjustment if a species disappears
+    with computation(PARALLEL), interval(...):
+        delta_t_micro = mixing_ratio_step_limiter(
+            rc_a_tnd, rc_b, rc_t, delta_t_micro, C_RTMIN, MNH_TINY
+        )
+        delta_t_micro = mixing_ratio_step_limiter(
+            rr_a_tnd, rr_b, rr_t, delta_t_micro, R_RTMIN, MNH_TINY
+        )
+        delta_t_micro = mixing_ratio_step_limiter(
+            ri_a_tnd, ri_b, ri_t, delta_t_micro, I_RTMIN, MNH_TINY
+        )
+        delta_t_micro = mixing_ratio_step_limiter(
+            rs_a_tnd, rs_b, rs_t, delta_t_micro, S_RTMIN, MNH_TINY
+        )
+        delta_t_micro = mixing_ratio_step_limiter(
+            rg_a_tnd, rg_b, rg_t, delta_t_micro, G_RTMIN, MNH_TINY
+        )
+
+    # We stop when the end of the timestep is reached
+    with computation(PARALLEL), interval(...):
+        ldcompute = False if t_micro + delta_t_micro > dt else ldcompute
+
+    ############################ mixing_ratio_step_limiter #####################
+    # (c)
+    with computation(PARALLEL), interval(...):
+        time_threshold_tmp = (
+            (sign(1, rc_a_tnd) * MRSTEP + rc_0r_t - rc_t - rc_b)
+            if abs(rc_a_tnd) > 1e-20
+            else -1
+        )
+        if (
+            time_threshold_tmp >= 0
+            and time_threshold_tmp < delta_t_micro
+            and (rc_t > C_RTMIN or rc_a_tnd > 0)
+        ):
+            delta_t_micro = min(delta_t_micro, time_threshold_tmp)
+            ldcompute = False
+        r_b_max = abs(rr_b)
+
+    # (r)
+    with computation(PARALLEL), interval(...):
+        time_threshold_tmp = (
+            (sign(1, rr_a_tnd) * MRSTEP + rr_0r_t - rr_t - rr_b)
+            if abs(rr_a_tnd) > 1e-20
+            else -1
+        )
+        if (
+            time_threshold_tmp >= 0
+            and time_threshold_tmp < delta_t_micro
+            and (rr_t > R_RTMIN or rr_a_tnd > 0)
+        ):
+            delta_t_micro = min(delta_t_micro, time_threshold_tmp)
+            ldcompute = False
+        r_b_max = max(r_b_max, abs(rr_b))
+
+    # (i)
+    with computation(PARALLEL), interval(...):
+        time_threshold_tmp = (
+            (sign(1, ri_a_tnd) * MRSTEP + ri_0r_t - ri_t - ri_b)
+            if abs(ri_a_tnd) > 1e-20
+            else -1
+        )
+        if (
+            time_threshold_tmp >= 0
+            and time_threshold_tmp < delta_t_micro
+            and (ri_t > I_RTMIN or ri_a_tnd > 0)
+        ):
+            delta_t_micro = min(delta_t_micro, time_threshold_tmp)
+            ldcompute = False
+        r_b_max = max(r_b_max, abs(ri_b))
+
+    # (s)
+    with computation(PARALLEL), interval(...):
+        time_threshold_tmp = (
+            (sign(1, rs_a_tnd) * MRSTEP + rs_0r_t - rs_t - rs_b)
+            if abs(rs_a_tnd) > 1e-20
+            else -1
+        )
+        if (
+            time_threshold_tmp >= 0
+            and time_threshold_tmp < delta_t_micro
+            and (rs_t > S_RTMIN or rs_a_tnd > 0)
+        ):
+            delta_t_micro = min(delta_t_micro, time_threshold_tmp)
+            ldcompute = False
+        r_b_max = max(r_b_max, abs(rs_b))
+
+    # (g)
+    with computation(PARALLEL), interval(...):
+        time_threshold_tmp = (
+            (sign(1, rg_a_tnd) * MRSTEP + rg_0r_t - rg_t - rg_b)
+            if abs(rg_a_tnd) > 1e-20
+            else -1
+        )
+        if (
+            time_threshold_tmp >= 0
+            and time_threshold_tmp < delta_t_micro
+            and (rg_t > G_RTMIN or rg_a_tnd > 0)
+        ):
+            delta_t_micro = min(delta_t_micro, time_threshold_tmp)
+            ldcompute = False
+        r_b_max = max(r_b_max, abs(rg_b))
+
+    # Limiter on max mixing ratio
+    with computation(PARALLEL), interval(...):
+        if r_b_max > MRSTEP:
+            delta_t_micro = 0
+            ldcompute = False
+
+    ############################ state_update ##################################
+    # 4.7 New values of variables for next iteration
+    with computation(PARALLEL), interval(...):
+        th_t += theta_a_tnd * delta_t_micro + theta_b
+        rc_t += rc_a_tnd * delta_t_micro + rc_b
+        rr_t += rr_a_tnd * delta_t_micro + rr_b
+        ri_t += ri_a_tnd * delta_t_micro + ri_b
+        rs_t += rs_a_tnd * delta_t_micro + rs_b
+        rg_t += rg_a_tnd * delta_t_micro + rg_b
+
+    with computation(PARALLEL), interval(...):
+        if ri_t <= 0 and ldmicro:
+            t_micro += delta_t_micro
+            ci_t = 0
+
+    # Translation note : column count replaces the host reduction ANY(LLCOMPUTE) of the inner loop
+    with computation(FORWARD), interval(0, 1):
+        ldcompute_count[0, 0] = 0
+    with computation(FORWARD), interval(...):
+        if ldcompute:
+            ldcompute_count[0, 0] += 1
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Call plans : stencil calls with their arguments bound once.
+
+A component assembles the arguments of its stencils (state fields and temporaries)
+into a plan on its first call. Later calls on the same storages replay the plan,
+passing only the scalars (e.g. ldsoft) : no argument dict is built again.
+
+Plans are cached by the identity of the storages they bind. A plan holds references
+to its storages, so that their ids cannot be reused while it is cached.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping, Tuple
+
+
+@dataclass(frozen=True)
+class StencilCall:
+    """Stencil (or any callable) with its arguments bound
+
+    Args:
+        stencil (Callable): stencil to call
+        args (Mapping[str, Any]): bound arguments
+        scalars (Tuple[str, ...]): arguments given at each call
+    """
+
+    stencil: Callable
+    args: Mapping[str, Any]
+    scalars: Tuple[str, ...] = ()
+
+    def __call__(self, scalars: Mapping[str, Any]) -> None:
+        if self.scalars:
+            self.stencil(**self.args, **{name: scalars[name] for name in self.scalars})
+        else:
+            self.stencil(**self.args)
+
+
+def bind(
+    stencil: Callable, *args: Mapping[str, Any], scalars: Tuple[str, ...] = ()
+) -> StencilCall:
+    """Bind arguments to a stencil
+
+    Args:
+        stencil (Callable): stencil to call
+        args (Mapping[str, Any]): bound arguments, merged in order
+        scalars (Tuple[str, ...]): arguments given at each call
+
+    Returns:
+        StencilCall: stencil with its arguments bound
+    """
+    merged = {}
+    for mapping in args:
+        merged.update(mapping)
+    return StencilCall(stencil, MappingProxyType(merged), tuple(scalars))
+
+
+@dataclass(frozen=True)
+class CallPlan:
+    """Sequence of stencil calls, replayed in order
+
+    Args:
+        calls (Tuple[StencilCall, ...]): calls of the plan
+    """
+
+    calls: Tuple[StencilCall, ...]
+
+    def __call__(self, **scalars: Any) -> None:
+        for call in self.calls:
+            call(scalars)
+
+
+@dataclass
+class CallPlanStats:
+    """Plans built and replayed by a component
+
+    build_time is the host time spent assembling arguments, saved by each replay.
+    """
+
+    builds: int = 0
+    replays: int = 0
+    build_time: float = 0.0
+
+    def __str__(self) -> str:
+        per_build = self.build_time / self.builds if self.builds else 0.0
+        return (
+            f"{self.builds} plans built, {self.replays} replays, "
+            f"{per_build * 1e6:.1f} us per build"
+        )
+
+
+class CallPlanCache:
+    """Call plans keyed by the identity of the storages they bind
+
+    Args:
+        maxsize (int): number of plans kept, the least recently used is dropped
+    """
+
+    def __init__(self, maxsize: int = 4):
+        self.maxsize = maxsize
+        self.stats = CallPlanStats()
+        self._plans: OrderedDict[Tuple[int, ...], CallPlan] = OrderedDict()
+
+    def get(self, storages: Iterable[Any], build: Callable[[], CallPlan]) -> CallPlan:
+        """Plan binding storages, built on first use
+
+        Args:
+            storages (Iterable[Any]): storages bound by the plan
+            build (Callable[[], CallPlan]): builds the plan
+
+        Returns:
+            CallPlan: cached or newly built plan
+        """
+        key = tuple(map(id, storages))
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self.stats.replays += 1
+            return plan
+
+        start = time.perf_counter()
+        plan = build()
+        self.stats.build_time += time.perf_counter() - start
+        self.stats.builds += 1
+
+        self._plans[key] = plan
+        if len(self._plans) > self.maxsize:
+            self._plans.popitem(last=False)
+        return plan
+
+    def clear(self):
+        """Drop the cached plans and the storages they hold"""
+        self._plans.clear()
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Parallel compilation of the stencils requested by components.
+
+Inside a parallel_compilation() block, components do not compile their
+stencils : compile_stencil returns a DeferredStencil handle and records the
+request. When the block exits, the distinct requests are compiled on a process
+pool into the stencil cache, then every handle is bound to the stencil loaded
+back from the cache.
+
+    with parallel_compilation(workers=32):
+        rain_ice = RainIce(grid, gt4py_config, phyex)
+
+The default worker count is read from ICE3_GT4PY_COMPILE_WORKERS, and falls
+back on the number of cpus.
+
+With keep_going=True, each stencil is compiled independently : failures are
+logged and collected, their handles stay unbound, and the other stencils are
+compiled and bound.
+
+    with parallel_compilation(keep_going=True) as failures:
+        ...
+    for deferred, error in failures:
+        ...
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from gt4py.cartesian.stencil_object import StencilObject
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.utils.stencil_cache import (
+    StencilCache,
+    compile_stencil,
+    get_stencil_cache,
+)
+from ice3_gt4py.utils.stencil_registry import get_stencil_registry
+
+COMPILE_WORKERS_ENV = "ICE3_GT4PY_COMPILE_WORKERS"
+
+
+class DeferredStencil:
+    """Handle on a stencil whose compilation has been deferred.
+
+    Calls and attribute accesses are forwarded to the compiled stencil
+    once bound.
+
+    Args:
+        name (str): name of the stencil collection
+        gt4py_config (GT4PyConfig): backend, dtypes and build options
+        externals (Optional[Dict[str, Any]]): externals given at compilation
+    """
+
+    def __init__(
+        self,
+        name: str,
+        gt4py_config: GT4PyConfig,
+        externals: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.gt4py_config = gt4py_config
+        self.externals = externals or {}
+        self._stencil: Optional[StencilObject] = None
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """Identifies the requests compiling to the same stencil"""
+        return get_stencil_registry().key(self.name, self.gt4py_config, self.externals)
+
+    @property
+    def stencil(self) -> StencilObject:
+        if self._stencil is None:
+            raise RuntimeError(
+                f"Stencil {self.name} used before the end of its parallel compilation"
+            )
+        return self._stencil
+
+    def bind(self, stencil: StencilObject):
+        self._stencil = stencil
+
+    def __call__(self, *args, **kwargs):
+        return self.stencil(*args, **kwargs)
+
+    def __getattr__(self, name: str):
+        if name.startswith("__") or name == "_stencil":
+            raise AttributeError(name)
+        return getattr(self.stencil, name)
+
+
+_PENDING: Optional[List[DeferredStencil]] = None
+_FAILURES: Optional[List[Tuple[DeferredStencil, Exception]]] = None
+
+
+def default_workers() -> int:
+    """Worker count from ICE3_GT4PY_COMPILE_WORKERS, number of cpus otherwise"""
+    return int(os.environ.get(COMPILE_WORKERS_ENV, os.cpu_count() or 1))
+
+
+def defer_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+) -> Optional[DeferredStencil]:
+    """Record a compilation request if inside a parallel_compilation block.
+
+    Returns:
+        Optional[DeferredStencil]: handle to bind, None outside of a block
+    """
+    if _PENDING is None:
+        return None
+    deferred = DeferredStencil(name, gt4py_config, externals)
+    _PENDING.append(deferred)
+    return deferred
+
+
+def _build(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Dict[str, Any],
+    cache_path: Optional[Path],
+    cache_max_size: Optional[int],
+) -> float:
+    """Compile a stencil in a worker process, returns the elapsed time"""
+    cache = StencilCache(cache_path, cache_max_size) if cache_path else None
+    start = time.perf_counter()
+    compile_stencil(name, gt4py_config, externals, cache=cache)
+    return time.perf_counter() - start
+
+
+def compile_deferred(
+    stencils: List[DeferredStencil],
+    workers: Optional[int] = None,
+    keep_going: bool = False,
+) -> List[Tuple[DeferredStencil, Exception]]:
+    """Compile deferred stencils on a process pool and bind them.
+
+    Args:
+        stencils (List[DeferredStencil]): handles to compile
+        workers (Optional[int]): number of processes, see default_workers
+        keep_going (bool): collect failures instead of raising the first one
+
+    Returns:
+        List[Tuple[DeferredStencil, Exception]]: handles left unbound, with their error
+    """
+    workers = workers or default_workers()
+    registry = get_stencil_registry()
+    errors: Dict[Tuple[str, str, str], Exception] = {}
+
+    def fail(key: Tuple[str, str, str], deferred: DeferredStencil, error: Exception):
+        if not keep_going:
+            raise error
+        logging.error(
+            f"Compilation of {deferred.name} on {deferred.gt4py_config.backend} "
+            f"failed : {type(error).__name__}: {error}"
+        )
+        errors[key] = error
+
+    keys = []
+    unique = {}
+    for index, deferred in enumerate(stencils):
+        try:
+            key = deferred.key
+        except Exception as error:
+            # Definition rejected by the frontend, before compilation
+            key = (deferred.name, deferred.gt4py_config.backend, f"#{index}")
+            fail(key, deferred, error)
+        keys.append(key)
+        if key not in registry and key not in errors:
+            unique.setdefault(key, deferred)
+
+    start = time.perf_counter()
+    pooled = workers > 1 and len(unique) > 1
+    if pooled:
+        cache = get_stencil_cache()
+        logging.info(
+            f"Compiling {len(unique)} stencils on {min(workers, len(unique))} processes"
+        )
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(unique)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _build,
+                    deferred.name,
+                    deferred.gt4py_config,
+                    deferred.externals,
+                    cache.path if cache is not None else None,
+                    cache.max_size if cache is not None else None,
+                ): key
+                for key, deferred in unique.items()
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    elapsed = future.result()
+                except Exception as error:
+                    fail(key, unique[key], error)
+                else:
+                    logging.debug(f"Compiled {key[0]} in {elapsed:.2f} s")
+
+    # Workers filled the cache : binding only loads the compiled modules
+    for key, deferred in zip(keys, stencils):
+        if key in errors:
+            continue
+        gt4py_config = (
+            deferred.gt4py_config.copy(update={"rebuild": False})
+            if pooled
+            else deferred.gt4py_config
+        )
+        try:
+            deferred.bind(
+                registry.get_or_compile(deferred.name, gt4py_config, deferred.externals)
+            )
+        except Exception as error:
+            fail(key, deferred, error)
+
+    logging.info(
+        f"Compiled {len(unique)} stencils ({len(stencils)} requests) "
+        f"in {time.perf_counter() - start:.2f} s"
+    )
+    if errors:
+        logging.error(f"{len(errors)} stencils failed to compile")
+    return [
+        (deferred, errors[key])
+        for key, deferred in zip(keys, stencils)
+        if key in errors
+    ]
+
+
+@contextmanager
+def parallel_compilation(workers: Optional[int] = None, keep_going: bool = False):
+    """Defer the stencil compilations of the components built in the block,
+    and compile them in parallel when the block exits.
+
+    Nested blocks join the outermost one.
+
+    Args:
+        workers (Optional[int]): number of processes, see default_workers
+        keep_going (bool): collect failures instead of raising the first one
+
+    Yields:
+        List[Tuple[DeferredStencil, Exception]]: failed compilations of the
+            outermost block, filled when it exits
+    """
+    global _PENDING, _FAILURES
+    if _PENDING is not None:
+        yield _FAILURES
+        return
+
+    _PENDING, _FAILURES = [], []
+    failures = _FAILURES
+    try:
+        yield failures
+        pending = _PENDING
+    finally:
+        _PENDING, _FAILURES = None, None
+    failures.extend(compile_deferred(pending, workers, keep_going))
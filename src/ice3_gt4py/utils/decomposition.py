@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+"""Column decomposition of a state over worker processes or threads.
+
+Microphysics columns are independent : the state is split in chunks of columns,
+run concurrently on zero-copy views.
+
+ColumnWorkers splits the I dimension in contiguous chunks, each run by a worker
+process on a view of the state held in multiprocessing.shared_memory blocks.
+Each worker builds one component per chunk size, and keeps it for the next runs.
+Stencils are compiled once, by the driver : workers load them from the
+persistent stencil cache (see ice3_gt4py.utils.stencil_cache) and the gt4py cache.
+
+ColumnThreads splits the IJ plane in tiles, each run by a thread of the process
+on a view of the state, with its own component (temporaries, call plans, counters).
+Stencils are shared by the tiles : tiles run concurrently with backends whose
+stencils release the GIL (gt:cpu_*, numpy).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+from ifs_physics_common.framework.grid import ComputationalGrid
+
+from ice3_gt4py.utils.stencil_cache import get_stencil_cache, set_stencil_cache
+
+# (shared memory block, shape, dtype, axes from slowest to fastest)
+ArraySpec = Tuple[str, Tuple[int, ...], str, Tuple[int, ...]]
+
+
+def split_columns(nx: int, n_chunks: int) -> List[Tuple[int, int]]:
+    """Contiguous chunks of [0, nx), sizes differ by 1 at most
+
+    Args:
+        nx (int): number of columns
+        n_chunks (int): number of chunks, at most nx chunks are returned
+
+    Returns:
+        List[Tuple[int, int]]: (start, stop) of each chunk
+    """
+    n_chunks = max(1, min(n_chunks, nx))
+    size, remainder = divmod(nx, n_chunks)
+    bounds = []
+    start = 0
+    for chunk in range(n_chunks):
+        stop = start + size + (1 if chunk < remainder else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def split_plane(
+    nx: int, ny: int, n_chunks: int
+) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Tiles of the IJ plane, split along I first, then along J if nx < n_chunks
+
+    Args:
+        nx (int): size of the I dimension
+        ny (int): size of the J dimension
+        n_chunks (int): number of tiles, at most nx * ny tiles are returned
+
+    Returns:
+        List[Tuple[Tuple[int, int], Tuple[int, int]]]: (start, stop) along I and J
+            of each tile
+    """
+    ni = max(1, min(n_chunks, nx))
+    nj = max(1, min(n_chunks // ni, ny))
+    return [
+        (i_bounds, j_bounds)
+        for i_bounds in split_columns(nx, ni)
+        for j_bounds in split_columns(ny, nj)
+    ]
+
+
+class SharedState:
+    """Arrays of a state held in shared memory blocks, one block per array
+
+    Arrays keep the memory layout (strides order) of the arrays they are created from.
+    Created by the driver (create) and attached by workers (attach) :
+    the creator unlinks the blocks on close.
+    """
+
+    def __init__(
+        self,
+        blocks: Dict[str, SharedMemory],
+        spec: Dict[str, ArraySpec],
+        owner: bool,
+    ):
+        self.spec = spec
+        self.owner = owner
+        self._blocks = blocks
+        self.arrays: Dict[str, np.ndarray] = {}
+        for key, (_, shape, dtype, axes) in spec.items():
+            buffer = np.ndarray(
+                tuple(shape[axis] for axis in axes),
+                dtype=np.dtype(dtype),
+                buffer=blocks[key].buf,
+            )
+            self.arrays[key] = buffer.transpose(np.argsort(axes))
+
+    @classmethod
+    def create(cls, arrays: Mapping[str, np.ndarray]) -> SharedState:
+        """Copy arrays into new shared memory blocks
+
+        Args:
+            arrays (Mapping[str, np.ndarray]): arrays of the state
+
+        Returns:
+            SharedState: shared copy of arrays
+        """
+        blocks = {}
+        spec = {}
+        try:
+            for key, array in arrays.items():
+                array = np.asarray(array)
+                axes = tuple(
+                    sorted(range(array.ndim), key=lambda axis: -array.strides[axis])
+                )
+                blocks[key] = SharedMemory(create=True, size=max(array.nbytes, 1))
+                spec[key] = (blocks[key].name, array.shape, array.dtype.str, axes)
+        except BaseException:
+            for block in blocks.values():
+                block.close()
+                block.unlink()
+            raise
+
+        shared = cls(blocks, spec, owner=True)
+        try:
+            shared.load(arrays)
+        except BaseException:
+            shared.close()
+            raise
+        return shared
+
+    @classmethod
+    def attach(cls, spec: Dict[str, ArraySpec]) -> SharedState:
+        """Attach to the blocks of a shared state
+
+        Args:
+            spec (Dict[str, ArraySpec]): spec of the shared state
+
+        Returns:
+            SharedState: views on the shared blocks
+        """
+        blocks = {key: SharedMemory(name=name) for key, (name, *_) in spec.items()}
+        return cls(blocks, spec, owner=False)
+
+    def load(self, arrays: Mapping[str, np.ndarray]):
+        """Copy arrays into the shared blocks"""
+        for key, shared in self.arrays.items():
+            shared[...] = arrays[key]
+
+    def store(self, arrays: Mapping[str, np.ndarray]):
+        """Copy the shared blocks into arrays"""
+        for key, shared in self.arrays.items():
+            arrays[key][...] = shared
+
+    @property
+    def nbytes(self) -> int:
+        return sum(array.nbytes for array in self.arrays.values())
+
+    def close(self):
+        """Release the views, and unlink the blocks if owned"""
+        self.arrays = {}
+        for block in self._blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+        self._blocks = {}
+
+    def __enter__(self) -> SharedState:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass(frozen=True)
+class ColumnFactory:
+    """Builds a component on a chunk of nx columns, picklable for worker processes
+
+    Args:
+        component (Callable): component class, e.g. IceAdjust
+        ny (int): size of the J dimension
+        nz (int): size of the K dimension
+        kwargs (Dict[str, Any]): arguments of the component (gt4py_config, phyex, ...)
+    """
+
+    component: Callable
+    ny: int
+    nz: int
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def __call__(self, nx: int, ny: Optional[int] = None):
+        return self.component(
+            ComputationalGrid(nx, ny or self.ny, self.nz), **self.kwargs
+        )
+
+
+@dataclass
+class DecompositionStats:
+    """Columns processed by ColumnWorkers or ColumnThreads
+
+    elapsed is the time spent running the chunks, copy_time the time spent
+    copying the state to and from shared memory (ColumnWorkers only).
+    """
+
+    workers: int = 0
+    chunks: int = 0
+    columns: int = 0
+    elapsed: float = 0.0
+    copy_time: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Columns per second"""
+        return self.columns / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.columns} columns in {self.chunks} chunks on {self.workers} workers, "
+            f"{self.elapsed:.3f} s ({self.throughput:.0f} columns/s), "
+            f"{self.copy_time:.3f} s copying"
+        )
+
+
+# Worker process state, set by _init_worker.
+# Attached states are kept until a spec with other blocks arrives : the call
+# plans of the components hold views on them (see ice3_gt4py.utils.call_plan).
+_FACTORY: Optional[ColumnFactory] = None
+_COMPONENTS: Dict[int, Any] = {}
+_ATTACHED: Dict[Tuple[str, ...], SharedState] = {}
+_VIEWS: Dict[Tuple[Tuple[str, ...], Tuple[int, int]], Dict[str, np.ndarray]] = {}
+
+
+def _init_worker(
+    factory: ColumnFactory, cache_path: Optional[str], cache_max_size: Optional[int]
+):
+    global _FACTORY
+    _FACTORY = factory
+    if cache_path is not None:
+        set_stencil_cache(cache_path, cache_max_size)
+
+
+def _detach_stale(names: Tuple[str, ...]):
+    """Close the attachments to blocks other than names, replaced by the driver"""
+    stale = [key for key in _ATTACHED if key != names]
+    if not stale:
+        return
+
+    for key in [key for key in _VIEWS if key[0] != names]:
+        del _VIEWS[key]
+    # Call plans hold views on the stale blocks
+    for component in _COMPONENTS.values():
+        call_plans = getattr(component, "call_plans", None)
+        if call_plans is not None:
+            call_plans.clear()
+    for key in stale:
+        _ATTACHED.pop(key).close()
+
+
+def _run_chunk(
+    spec: Dict[str, ArraySpec], bounds: Tuple[int, int], timestep: timedelta
+) -> float:
+    """Run the component of the worker on a chunk of the shared state,
+    returns the elapsed time"""
+    start, stop = bounds
+    nx = stop - start
+    if nx not in _COMPONENTS:
+        _COMPONENTS[nx] = _FACTORY(nx)
+
+    # Same views at each run : call plans are replayed
+    names = tuple(name for name, *_ in spec.values())
+    if (names, bounds) not in _VIEWS:
+        if names not in _ATTACHED:
+            _detach_stale(names)
+            _ATTACHED[names] = SharedState.attach(spec)
+        _VIEWS[(names, bounds)] = {
+            key: array[start:stop] for key, array in _ATTACHED[names].arrays.items()
+        }
+
+    tic = time.perf_counter()
+    _COMPONENTS[nx].nested_call(_VIEWS[(names, bounds)], timestep)
+    return time.perf_counter() - tic
+
+
+class ColumnWorkers:
+    """Process pool running a component on column chunks of a state
+
+    Workers are spawned on entry, and keep their components between runs.
+    The shared state is kept between runs on arrays of the same shapes and dtypes.
+
+    Args:
+        factory (ColumnFactory): builds the component of a chunk
+        workers (int): number of processes
+        n_chunks (Optional[int]): number of chunks, one per worker if None
+    """
+
+    def __init__(
+        self, factory: ColumnFactory, workers: int, n_chunks: Optional[int] = None
+    ):
+        self.factory = factory
+        self.workers = workers
+        self.n_chunks = n_chunks or workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared: Optional[SharedState] = None
+
+    def __enter__(self) -> ColumnWorkers:
+        cache = get_stencil_cache()
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(
+                self.factory,
+                str(cache.path) if cache is not None else None,
+                cache.max_size if cache is not None else None,
+            ),
+        )
+        return self
+
+    def __exit__(self, *exc):
+        self._pool.shutdown()
+        self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def shared_state(self, arrays: Mapping[str, np.ndarray]) -> SharedState:
+        """Shared copy of arrays, reusing the blocks of the previous run if possible"""
+        if (
+            self._shared is not None
+            and all(
+                key in arrays
+                and arrays[key].shape == shared.shape
+                and arrays[key].dtype == shared.dtype
+                for key, shared in self._shared.arrays.items()
+            )
+            and len(arrays) == len(self._shared.arrays)
+        ):
+            self._shared.load(arrays)
+            return self._shared
+
+        if self._shared is not None:
+            self._shared.close()
+        self._shared = SharedState.create(arrays)
+        return self._shared
+
+    def run(
+        self, arrays: Mapping[str, np.ndarray], timestep: timedelta
+    ) -> DecompositionStats:
+        """Run the component on arrays, split along their first (I) dimension
+
+        Arrays are copied to shared memory, and the outputs copied back.
+
+        Args:
+            arrays (Mapping[str, np.ndarray]): fields of the state, updated in place
+            timestep (timedelta): timestep
+
+        Returns:
+            DecompositionStats: timings of the run
+        """
+        nx = next(iter(arrays.values())).shape[0]
+        chunks = split_columns(nx, self.n_chunks)
+        stats = DecompositionStats(workers=self.workers, chunks=len(chunks), columns=nx)
+
+        tic = time.perf_counter()
+        shared = self.shared_state(arrays)
+        stats.copy_time += time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        futures = [
+            self._pool.submit(_run_chunk, shared.spec, bounds, timestep)
+            for bounds in chunks
+        ]
+        for future in futures:
+            future.result()
+        stats.elapsed = time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        shared.store(arrays)
+        stats.copy_time += time.perf_counter() - tic
+
+        return stats
+
+
+class ColumnThreads:
+    """Component running on tiles of the IJ plane, concurrently on a thread pool
+
+    One component is built per tile, on the tile grid : tiles do not share
+    temporaries, call plans nor counters. Components are built on the calling thread.
+    gt4py_config.exec_info, if any, records the calls of every tile.
+
+    Args:
+        factory (ColumnFactory): builds the component of a tile
+        nx (int): size of the I dimension of the state
+        threads (int): number of threads
+        n_chunks (Optional[int]): number of tiles, one per thread if None
+    """
+
+    def __init__(
+        self,
+        factory: ColumnFactory,
+        nx: int,
+        threads: int,
+        n_chunks: Optional[int] = None,
+    ):
+        self.threads = threads
+        self.tiles = split_plane(nx, factory.ny, n_chunks or threads)
+        self.components = [
+            factory(i_stop - i_start, j_stop - j_start)
+            for (i_start, i_stop), (j_start, j_stop) in self.tiles
+        ]
+        self._pool = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="ColumnThreads"
+        )
+
+        # Views of the last state : same views at each call, call plans are replayed
+        self._state: Optional[Mapping[str, Any]] = None
+        self._state_key: Optional[Tuple[int, ...]] = None
+        self._views: List[Dict[str, Any]] = []
+
+    def views(self, state: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Views of state on each tile, fields on (I, J) or (I, J, K)"""
+        state_key = tuple(map(id, state.values()))
+        if state_key != self._state_key:
+            self._views = [
+                {
+                    key: array[i_start:i_stop, j_start:j_stop]
+                    for key, array in state.items()
+                }
+                for (i_start, i_stop), (j_start, j_stop) in self.tiles
+            ]
+            # Keeps state alive, so that its ids cannot be reused
+            self._state = state
+            self._state_key = state_key
+        return self._views
+
+    def nested_call(self, state: Mapping[str, Any], timestep: timedelta, **kwargs):
+        """Run the components of the tiles on views of state, see Ice3Component
+
+        Args:
+            state (Mapping[str, Any]): storages of the inputs, updated in place
+            timestep (timedelta): timestep
+            kwargs: extra arguments of array_call
+        """
+        futures = [
+            self._pool.submit(component.nested_call, views, timestep, **kwargs)
+            for component, views in zip(self.components, self.views(state))
+        ]
+        for future in futures:
+            future.result()
+
+    def run(self, arrays: Mapping[str, Any], timestep: timedelta) -> DecompositionStats:
+        """Run the components of the tiles on arrays
+
+        Args:
+            arrays (Mapping[str, Any]): fields of the state, updated in place
+            timestep (timedelta): timestep
+
+        Returns:
+            DecompositionStats: timings of the run
+        """
+        array = next(iter(arrays.values()))
+        stats = DecompositionStats(
+            workers=self.threads,
+            chunks=len(self.tiles),
+            columns=array.shape[0] * array.shape[1],
+        )
+        tic = time.perf_counter()
+        self.nested_call(arrays, timestep)
+        stats.elapsed = time.perf_counter() - tic
+        return stats
+
+    def close(self):
+        """Shut the thread pool down"""
+        self._pool.shutdown()
+
+    def __enter__(self) -> ColumnThreads:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""Aliasing of temporaries with disjoint lifetimes.
+
+A component calling its stencils in a fixed order binds them in a call plan.
+The temporaries passed to each call are found in its bound arguments, and their
+accesses (read / write) are taken from the compiled stencils
+(StencilObject.field_info). A temporary is live from its first access
+to its last one. Temporaries read before being written (e.g. rates kept
+from a previous call under ldsoft) are live throughout and keep their own buffer,
+which is zero-filled when handed out (pinned slots) : plans are replayed on
+buffers reused by other components in between.
+
+Temporaries of the same dtype with disjoint lifetimes share a buffer.
+Two temporaries passed to the same stencil never share one.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Mapping, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from gt4py.cartesian.stencil_object import StencilObject
+
+    from ice3_gt4py.utils.call_plan import StencilCall
+
+# Access flags, as gt4py.cartesian.definitions.AccessKind
+READ = 1
+WRITE = 2
+
+Accesses = Dict[str, int]
+
+
+@dataclass
+class AliasingPlan:
+    """Buffer (slot) of each temporary
+
+    Args:
+        slots (Dict[str, int]): slot of each temporary
+        dtypes (List[str]): dtype of each slot
+        pinned (List[int]): slots read before being written, to be zero-filled
+    """
+
+    slots: Dict[str, int]
+    dtypes: List[str]
+    pinned: List[int] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        n_temporaries = len(self.slots)
+        n_slots = len(self.dtypes)
+        reduction = 1 - n_slots / n_temporaries if n_temporaries else 0.0
+        return (
+            f"{n_temporaries} temporaries on {n_slots} buffers "
+            f"({reduction:.0%} footprint reduction)"
+        )
+
+    def assign(self, names: Sequence[str], buffers: Sequence) -> Tuple:
+        """Buffers of the temporaries, in the order of names
+
+        Args:
+            names (Sequence[str]): temporaries
+            buffers (Sequence): one buffer per slot
+
+        Returns:
+            Tuple: buffer of each temporary
+        """
+        return tuple(buffers[self.slots[name]] for name in names)
+
+    def written(self) -> List[int]:
+        """Slots written before being read, handed out as left by the workspace"""
+        return [slot for slot in range(len(self.dtypes)) if slot not in self.pinned]
+
+    def nbytes(self, n_points: int, itemsizes: Dict[str, int]) -> Tuple[int, int]:
+        """Footprint without and with aliasing
+
+        Args:
+            n_points (int): number of points of the grid (e.g. nx * ny * 90)
+            itemsizes (Dict[str, int]): size in bytes of each dtype
+
+        Returns:
+            Tuple[int, int]: bytes without aliasing, bytes with aliasing
+        """
+        dtypes = [self.dtypes[slot] for slot in self.slots.values()]
+        return (
+            n_points * sum(itemsizes[dtype] for dtype in dtypes),
+            n_points * sum(itemsizes[dtype] for dtype in self.dtypes),
+        )
+
+
+def stencil_accesses(stencil: StencilObject, args: Sequence[str]) -> Accesses:
+    """Accesses of a compiled stencil to some of its field arguments
+
+    Args:
+        stencil (StencilObject): compiled stencil
+        args (Sequence[str]): field arguments
+
+    Returns:
+        Accesses: READ / WRITE flags of each argument (0 if not accessed)
+    """
+    accesses = {}
+    for arg in args:
+        info = stencil.field_info.get(arg)
+        accesses[arg] = int(info.access) if info is not None else 0
+    return accesses
+
+
+def call_accesses(call: StencilCall, temporaries: Mapping[int, str]) -> Accesses:
+    """Accesses of a bound stencil call to the temporaries among its arguments
+
+    Args:
+        call (StencilCall): stencil with its arguments bound
+        temporaries (Mapping[int, str]): name of each temporary, by id of its buffer
+
+    Returns:
+        Accesses: READ / WRITE flags of each temporary passed to the call
+    """
+    args = {
+        arg: temporaries[id(value)]
+        for arg, value in call.args.items()
+        if id(value) in temporaries
+    }
+    accesses: Accesses = {}
+    for arg, access in stencil_accesses(call.stencil, list(args)).items():
+        accesses[args[arg]] = accesses.get(args[arg], 0) | access
+    return accesses
+
+
+def live_intervals(
+    calls: Sequence[Accesses],
+) -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """Lifetime of each temporary over an ordered sequence of calls
+
+    Args:
+        calls (Sequence[Accesses]): accesses of each call to the temporaries
+
+    Returns:
+        Tuple[Dict[str, Tuple[int, int]], List[str]]: first and last call using
+            each temporary, temporaries read before being written
+    """
+    intervals: Dict[str, Tuple[int, int]] = {}
+    pinned: List[str] = []
+    for index, accesses in enumerate(calls):
+        for name, access in accesses.items():
+            if not access:
+                continue
+            if name not in intervals:
+                intervals[name] = (index, index)
+                if access & READ:
+                    pinned.append(name)
+            else:
+                intervals[name] = (intervals[name][0], index)
+    return intervals, pinned
+
+
+def alias_temporaries(
+    temporaries: Sequence[Tuple[str, str]],
+    calls: Sequence[Accesses],
+    share: bool = True,
+) -> AliasingPlan:
+    """Map temporaries with disjoint lifetimes onto shared buffers
+
+    Temporaries never accessed, or read before being written, get their own buffer.
+
+    Args:
+        temporaries (Sequence[Tuple[str, str]]): (name, dtype) of each temporary
+        calls (Sequence[Accesses]): accesses of each call to the temporaries
+        share (bool): share buffers, one buffer per temporary otherwise
+
+    Returns:
+        AliasingPlan: buffer of each temporary
+    """
+    intervals, pinned = live_intervals(calls)
+    dtypes = dict(temporaries)
+
+    slots: Dict[str, int] = {}
+    slot_dtypes: List[str] = []
+    for name, dtype in temporaries:
+        if not share or name not in intervals or name in pinned:
+            slots[name] = len(slot_dtypes)
+            slot_dtypes.append(dtype)
+
+    # Linear scan over the temporaries sorted by first use
+    slot_ends: Dict[int, int] = {}
+    aliased = sorted(
+        (name for name in intervals if name not in slots and name in dtypes),
+        key=lambda name: intervals[name],
+    )
+    for name in aliased:
+        start, end = intervals[name]
+        free = [
+            slot
+            for slot, slot_end in slot_ends.items()
+            if slot_end < start and slot_dtypes[slot] == dtypes[name]
+        ]
+        if free:
+            slot = min(free)
+        else:
+            slot = len(slot_dtypes)
+            slot_dtypes.append(dtypes[name])
+        slots[name] = slot
+        slot_ends[slot] = end
+
+    return AliasingPlan(
+        slots={name: slots[name] for name, _ in temporaries},
+        dtypes=slot_dtypes,
+        pinned=[slots[name] for name in pinned if name in slots],
+    )
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Gather / scatter of a subset of grid points on a packed (kproma, 1, 1) domain.
+
+Points are given by their (i, j, k) indices, as returned by mask.nonzero().
+The tail of a pack (beyond the gathered points) repeats the last point,
+so that stencils run on valid values there : results in the tail are discarded.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Tuple
+
+if TYPE_CHECKING:
+    from ifs_physics_common.utils.typingx import NDArrayLike, NDArrayLikeDict
+
+    Points = Tuple[NDArrayLike, NDArrayLike, NDArrayLike]
+
+
+def pack_size(npromicro: int, n_points: int, n_total: int) -> int:
+    """Number of points of a pack
+
+    NPROMICRO = 0 packs all points together : the size is rounded up
+    to a power of 2 so that a few packed domains are reused across calls.
+
+    Args:
+        npromicro (int): NPROMICRO from ParamIce
+        n_points (int): number of points to pack
+        n_total (int): number of points of the domain
+
+    Returns:
+        int: number of points of a pack
+    """
+    if npromicro > 0:
+        return npromicro
+    return min(1 << (n_points - 1).bit_length(), n_total)
+
+
+def gather(
+    fields: NDArrayLikeDict,
+    packed: NDArrayLikeDict,
+    keys: Iterable[str],
+    points: Points,
+) -> int:
+    """Gather points of fields into packed fields
+
+    Args:
+        fields (NDArrayLikeDict): fields on the whole domain
+        packed (NDArrayLikeDict): fields on the packed domain
+        keys (Iterable[str]): fields to gather
+        points (Points): indices of the points to gather
+
+    Returns:
+        int: number of gathered points
+    """
+    size = int(points[0].shape[0])
+    for key in keys:
+        packed[key][:size, 0, 0] = fields[key][points]
+        packed[key][size:, 0, 0] = packed[key][size - 1, 0, 0]
+    return size
+
+
+def scatter(
+    packed: NDArrayLikeDict,
+    fields: NDArrayLikeDict,
+    keys: Iterable[str],
+    points: Points,
+) -> None:
+    """Scatter packed fields back to the points of fields
+
+    Args:
+        packed (NDArrayLikeDict): fields on the packed domain
+        fields (NDArrayLikeDict): fields on the whole domain
+        keys (Iterable[str]): fields to scatter
+        points (Points): indices of the gathered points
+    """
+    size = int(points[0].shape[0])
+    for key in keys:
+        fields[key][points] = packed[key][:size, 0, 0]
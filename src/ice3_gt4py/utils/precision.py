@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Floating point precision of a run.
+
+Components allocate their storages, lookup tables and temporaries as "float" / "int",
+resolved through GT4PyConfig.dtypes : the precision of a run is set
+on the GT4PyConfig given at construction (see with_precision).
+Stencils are compiled and cached per dtypes (see ice3_gt4py.utils.stencil_registry).
+
+field_errors compares the fields of a run against a reference run
+(e.g. single against double precision).
+"""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Dict, Mapping
+
+import numpy as np
+from ifs_physics_common.framework.config import DataTypes, GT4PyConfig
+
+PRECISIONS = {
+    "double": DataTypes(bool=bool, float=np.float64, int=np.int64),
+    "single": DataTypes(bool=bool, float=np.float32, int=np.int32),
+}
+
+
+def with_precision(gt4py_config: GT4PyConfig, precision: str) -> GT4PyConfig:
+    """Copy of gt4py_config with the dtypes of precision
+
+    Args:
+        gt4py_config (GT4PyConfig): backend and build options
+        precision (str): "double" (float64, int64) or "single" (float32, int32)
+
+    Raises:
+        KeyError: unknown precision
+
+    Returns:
+        GT4PyConfig: configuration with the dtypes of precision
+    """
+    if precision not in PRECISIONS:
+        raise KeyError(f"Precision not in {list(PRECISIONS)}, got {precision}")
+    args = gt4py_config.dict()
+    args["dtypes"] = PRECISIONS[precision]
+    return GT4PyConfig(**args)
+
+
+@dataclass
+class FieldError:
+    """Error of a field against its reference
+
+    max_rel is the maximum absolute error relative to the maximum
+    of the reference field (0 for a null reference and run).
+    """
+
+    max_abs: float
+    max_rel: float
+    rms: float
+
+    def __str__(self) -> str:
+        return (
+            f"max abs {self.max_abs:.3e}, max rel {self.max_rel:.3e}, "
+            f"rms {self.rms:.3e}"
+        )
+
+
+def field_error(reference: np.ndarray, run: np.ndarray) -> FieldError:
+    """Error of run against reference, computed in float64
+
+    Args:
+        reference (np.ndarray): reference field
+        run (np.ndarray): field to compare
+
+    Returns:
+        FieldError: errors of run
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    diff = np.abs(np.asarray(run, dtype=np.float64) - reference)
+    max_abs = float(diff.max()) if diff.size else 0.0
+    scale = float(np.abs(reference).max()) if reference.size else 0.0
+    if scale > 0:
+        max_rel = max_abs / scale
+    else:
+        max_rel = 0.0 if max_abs == 0 else float("inf")
+    rms = float(np.sqrt(np.mean(diff**2))) if diff.size else 0.0
+    return FieldError(max_abs=max_abs, max_rel=max_rel, rms=rms)
+
+
+def field_errors(
+    reference: Mapping[str, np.ndarray], run: Mapping[str, np.ndarray]
+) -> Dict[str, FieldError]:
+    """Errors of the fields of run against reference, for the keys of reference
+
+    Args:
+        reference (Mapping[str, np.ndarray]): reference fields
+        run (Mapping[str, np.ndarray]): fields to compare
+
+    Returns:
+        Dict[str, FieldError]: error of each field
+    """
+    return {key: field_error(field, run[key]) for key, field in reference.items()}
+
+
+def errors_report(errors: Mapping[str, FieldError]) -> Dict[str, Dict[str, float]]:
+    """Errors as a json-serializable dict"""
+    return {key: asdict(error) for key, error in errors.items()}
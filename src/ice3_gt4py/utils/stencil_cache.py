@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+"""Persistent cache of compiled stencils shared by all components.
+
+GT4Py already addresses its JIT cache by content : the module generated for a
+stencil is suffixed with a hash of its definition, of the externals it actually
+reads and of the build options. This module pins that cache to a chosen
+directory, keeps an index of the stencils it holds (size, last access), counts
+hits and misses and evicts the least recently used stencils once the directory
+grows past a size limit.
+
+Processes sharing a cache directory (compilation pool, column workers) hold a
+file lock on it : shared while loading or building a stencil, exclusive while
+updating the index and evicting, so that no stencil is evicted while loaded.
+
+The cache directory and size limit default to the environment variables
+ICE3_GT4PY_CACHE_DIR and ICE3_GT4PY_CACHE_MAX_SIZE (bytes, K/M/G suffixes
+accepted).
+"""
+from __future__ import annotations
+
+import fcntl
+import json
+import logging
+import os
+import shutil
+import time
+import types
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from gt4py.cartesian import gtscript
+from gt4py.cartesian.stencil_object import StencilObject
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.stencil import STENCIL_COLLECTION
+
+from ice3_gt4py.stencils import import_collection
+
+CACHE_DIR_ENV = "ICE3_GT4PY_CACHE_DIR"
+CACHE_MAX_SIZE_ENV = "ICE3_GT4PY_CACHE_MAX_SIZE"
+INDEX_FILE = "ice3_gt4py_index.json"
+LOCK_FILE = "ice3_gt4py_index.lock"
+
+_SIZE_UNITS = {"K": 1024, "M": 1024**2, "G": 1024**3}
+
+
+def parse_size(size: str | int | None) -> Optional[int]:
+    """Convert a size given as bytes or with a K/M/G suffix ("500M", "2G").
+
+    Args:
+        size (str | int | None): size to parse
+
+    Returns:
+        Optional[int]: size in bytes, None if no size is given
+    """
+    if size is None or size == "":
+        return None
+    if isinstance(size, int):
+        return size
+    size = size.strip().upper().rstrip("B")
+    if size[-1] in _SIZE_UNITS:
+        return int(float(size[:-1]) * _SIZE_UNITS[size[-1]])
+    return int(size)
+
+
+@dataclass
+class CacheStats:
+    """Hit / miss counters of a stencil cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    load_time: float = 0.0
+    build_time: float = 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.hits} hits ({self.load_time:.2f} s), "
+            f"{self.misses} misses ({self.build_time:.2f} s), "
+            f"{self.evictions} evictions"
+        )
+
+
+def get_definition(name: str):
+    """Get the definition registered for a stencil collection.
+
+    The module defining the collection is imported on first request.
+
+    Args:
+        name (str): name of the stencil collection
+
+    Returns:
+        definition function of the collection
+    """
+    if name not in STENCIL_COLLECTION:
+        import_collection(name)
+    stencil_info = STENCIL_COLLECTION.get(name, None)
+    if stencil_info is None:
+        raise RuntimeError(f"Unknown stencil `{name}`.")
+    return stencil_info["definition"]
+
+
+def resolve_table_shapes(definition, externals: Optional[Dict[str, Any]] = None):
+    """Definition with the shapes of its GlobalTable arguments read from externals.
+
+    The shapes of the lookup tables depend on Phyex : they are annotated with
+    the names of the externals, e.g. GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    as dtypes are annotated with the names of GT4PyConfig.dtypes. Shape names are
+    replaced on a copy of the definition, the registered one is left as is, and
+    the dtype name is kept to be resolved with the other dtypes at compilation.
+
+    Args:
+        definition: definition function of a stencil collection
+        externals (Optional[Dict[str, Any]]): externals given at compilation
+
+    Raises:
+        ValueError: Error if a table shape names a missing external
+
+    Returns:
+        definition if no table shape is named, resolved copy otherwise
+    """
+    externals = externals or {}
+    tables = {}
+    for arg, annotation in getattr(definition, "__annotations__", {}).items():
+        if isinstance(annotation, str) and annotation.startswith("GlobalTable["):
+            annotation = eval(annotation, definition.__globals__)
+        data_dims = getattr(annotation, "data_dims", ())
+        if not any(isinstance(dim, str) for dim in data_dims):
+            continue
+        try:
+            shape = tuple(
+                externals[dim] if isinstance(dim, str) else dim for dim in data_dims
+            )
+        except KeyError as e:
+            raise ValueError(f"Shape of {arg} not found in externals : {e}")
+        tables[arg] = gtscript.GlobalTable[annotation.dtype, shape]
+
+    if not tables:
+        return definition
+
+    resolved = types.FunctionType(
+        definition.__code__,
+        definition.__globals__,
+        definition.__name__,
+        definition.__defaults__,
+        definition.__closure__,
+    )
+    resolved.__qualname__ = definition.__qualname__
+    resolved.__doc__ = definition.__doc__
+    resolved.__annotations__ = {**definition.__annotations__, **tables}
+    return resolved
+
+
+def module_path(stencil: StencilObject) -> Path:
+    """Generated module of a compiled stencil.
+
+    gt4py 1.0 sets it on the stencil class (_file_name), later versions do not :
+    it is read from the code of the generated run method.
+
+    Args:
+        stencil (StencilObject): compiled stencil
+
+    Returns:
+        Path: resolved path of the module
+    """
+    file_name = getattr(stencil, "_file_name", None)
+    if file_name is None:
+        file_name = type(stencil).run.__code__.co_filename
+    return Path(file_name).resolve()
+
+
+def _build_kwargs(gt4py_config: GT4PyConfig) -> Dict[str, Any]:
+    kwargs = gt4py_config.backend_opts.copy()
+    if gt4py_config.backend not in ("debug", "numpy", "gtc:numpy"):
+        kwargs["verbose"] = gt4py_config.verbose
+    return kwargs
+
+
+class StencilCache:
+    """On-disk cache of compiled stencils with size-bounded eviction.
+
+    Args:
+        path (str | Path): cache directory
+        max_size (Optional[int]): size limit in bytes, unbounded if None
+    """
+
+    def __init__(self, path: str | Path, max_size: Optional[int] = None):
+        self.path = Path(path).resolve()
+        self.max_size = max_size
+        self.stats = CacheStats()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def cache_settings(self) -> Dict[str, str]:
+        """Cache settings forwarded to gtscript.stencil"""
+        return {"root_path": str(self.path.parent), "dir_name": self.path.name}
+
+    @property
+    def index_path(self) -> Path:
+        return self.path / INDEX_FILE
+
+    @contextmanager
+    def lock(self, exclusive: bool = False) -> Iterator[None]:
+        """File lock on the cache directory, shared between processes
+
+        Not reentrant : a process holding the lock must release it
+        before taking it again.
+
+        Args:
+            exclusive (bool): exclusive lock (index update, eviction),
+                shared lock (load, build) otherwise
+        """
+        with open(self.path / LOCK_FILE, "a") as file:
+            fcntl.flock(file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+    def load_or_build(
+        self,
+        name: str,
+        gt4py_config: GT4PyConfig,
+        externals: Optional[Dict[str, Any]] = None,
+    ) -> StencilObject:
+        """Load a stencil from the cache, or compile it on a miss.
+
+        Args:
+            name (str): name of the stencil collection
+            gt4py_config (GT4PyConfig): backend, dtypes and build options
+            externals (Optional[Dict[str, Any]]): externals given at compilation
+
+        Returns:
+            StencilObject: compiled stencil
+        """
+        definition = resolve_table_shapes(get_definition(name), externals)
+        kwargs = dict(
+            name=name,
+            build_info=gt4py_config.build_info,
+            dtypes=gt4py_config.dtypes.dict(),
+            externals=externals or {},
+            cache_settings=self.cache_settings,
+            **_build_kwargs(gt4py_config),
+        )
+
+        # Evictions wait for the stencil to be loaded
+        with self.lock():
+            stencil = None
+            if not gt4py_config.rebuild:
+                start = time.perf_counter()
+                try:
+                    stencil = gtscript.stencil(
+                        gt4py_config.backend,
+                        definition,
+                        raise_if_not_cached=True,
+                        **kwargs,
+                    )
+                    self.stats.hits += 1
+                    self.stats.load_time += time.perf_counter() - start
+                except ValueError:
+                    logging.debug(f"Stencil cache miss for {name}")
+
+            if stencil is None:
+                start = time.perf_counter()
+                stencil = gtscript.stencil(
+                    gt4py_config.backend,
+                    definition,
+                    rebuild=gt4py_config.rebuild,
+                    **kwargs,
+                )
+                self.stats.misses += 1
+                self.stats.build_time += time.perf_counter() - start
+
+        self._record(name, gt4py_config.backend, module_path(stencil))
+        return stencil
+
+    def size(self) -> int:
+        """Total size in bytes of the stencils in the index"""
+        return sum(entry["size"] for entry in self._read_index().values())
+
+    def clear(self):
+        """Remove every indexed stencil from the cache"""
+        with self.lock(exclusive=True):
+            index = self._read_index()
+            for key in list(index.keys()):
+                self._remove(key)
+            self._write_index({})
+
+    def _record(self, name: str, backend: str, module_path: Path):
+        """Update the index entry of a stencil and evict if over the limit"""
+        with self.lock(exclusive=True):
+            self._update_index(name, backend, module_path)
+
+    def _update_index(self, name: str, backend: str, module_path: Path):
+        index = self._read_index()
+        key = str(module_path.relative_to(self.path).with_suffix(""))
+        index[key] = {
+            "name": name,
+            "backend": backend,
+            "size": self._artifacts_size(key),
+            "last_used": time.time(),
+        }
+
+        if self.max_size is not None:
+            total = sum(entry["size"] for entry in index.values())
+            for old_key in sorted(index, key=lambda k: index[k]["last_used"]):
+                if total <= self.max_size:
+                    break
+                if old_key == key:
+                    continue
+                total -= index.pop(old_key)["size"]
+                self._remove(old_key)
+                self.stats.evictions += 1
+                logging.info(f"Evicted {old_key} from stencil cache")
+
+        self._write_index(index)
+
+    def _artifacts(self, key: str):
+        """Module, cache info, extension and build directory of a stencil
+
+        gt4py names the module of a stencil m_<name>__<backend>_<hash>, and the
+        other artifacts (m_computation__<backend>_<hash>.py, build directories)
+        after the same <backend>_<hash> : they are selected by this suffix.
+        """
+        stem = self.path / key
+        return stem.parent.glob(f"*__{stem.name.rpartition('__')[2]}*")
+
+    def _artifacts_size(self, key: str) -> int:
+        size = 0
+        for artifact in self._artifacts(key):
+            if artifact.is_dir():
+                size += sum(
+                    f.stat().st_size for f in artifact.rglob("*") if f.is_file()
+                )
+            else:
+                size += artifact.stat().st_size
+        return size
+
+    def _remove(self, key: str):
+        for artifact in self._artifacts(key):
+            if artifact.is_dir():
+                shutil.rmtree(artifact, ignore_errors=True)
+            else:
+                artifact.unlink(missing_ok=True)
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, "r") as file:
+                return json.load(file)
+        except json.JSONDecodeError:
+            logging.warning(f"Corrupted stencil cache index {self.index_path}, reset")
+            return {}
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]):
+        tmp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(index, file, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def report(self) -> Dict[str, Any]:
+        """Statistics and size of the cache, as a json-serializable dict"""
+        return {
+            "path": str(self.path),
+            "size": self.size(),
+            "max_size": self.max_size,
+            **asdict(self.stats),
+        }
+
+
+_STENCIL_CACHE: Optional[StencilCache] = None
+
+
+def get_stencil_cache() -> Optional[StencilCache]:
+    """Get the process-wide stencil cache.
+
+    Created from ICE3_GT4PY_CACHE_DIR on first call, None if unset.
+    """
+    global _STENCIL_CACHE
+    if _STENCIL_CACHE is None and os.environ.get(CACHE_DIR_ENV):
+        _STENCIL_CACHE = StencilCache(
+            os.environ[CACHE_DIR_ENV],
+            parse_size(os.environ.get(CACHE_MAX_SIZE_ENV)),
+        )
+    return _STENCIL_CACHE
+
+
+def set_stencil_cache(
+    path: Optional[str | Path], max_size: Optional[int] = None
+) -> Optional[StencilCache]:
+    """Set the process-wide stencil cache directory.
+
+    Args:
+        path (Optional[str | Path]): cache directory, None to disable the cache
+        max_size (Optional[int]): size limit in bytes
+
+    Returns:
+        Optional[StencilCache]: the new cache
+    """
+    global _STENCIL_CACHE
+    _STENCIL_CACHE = StencilCache(path, max_size) if path is not None else None
+    return _STENCIL_CACHE
+
+
+def compile_stencil(
+    name: str,
+    gt4py_config: GT4PyConfig,
+    externals: Optional[Dict[str, Any]] = None,
+    cache: Optional[StencilCache] = None,
+) -> StencilObject:
+    """Compile a stencil collection through the stencil cache.
+
+    Falls back on the GT4Py default cache if no cache is configured.
+
+    Args:
+        name (str): name of the stencil collection
+        gt4py_config (GT4PyConfig): backend, dtypes and build options
+        externals (Optional[Dict[str, Any]]): externals given at compilation
+        cache (Optional[StencilCache]): cache to use, process-wide cache if None
+
+    Returns:
+        StencilObject: compiled stencil
+    """
+    cache = cache or get_stencil_cache()
+    if cache is None:
+        return gtscript.stencil(
+            gt4py_config.backend,
+            resolve_table_shapes(get_definition(name), externals),
+            name=name,
+            build_info=gt4py_config.build_info,
+            dtypes=gt4py_config.dtypes.dict(),
+            externals=externals or {},
+            rebuild=gt4py_config.rebuild,
+            **_build_kwargs(gt4py_config),
+        )
+    return cache.load_or_build(name, gt4py_config, externals)
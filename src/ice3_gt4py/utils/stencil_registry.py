@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Per-process registry of compiled stencils.
+
+Nested components (RainIce > Ice4Stepping > Ice4Tendencies) request some
+collections more than once, each with its own Phyex.to_externals() dict.
+The registry hands back the same StencilObject for every request sharing
+the collection name, the backend and the fingerprint of the externals the
+stencil actually reads.
+"""
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from gt4py.cartesian import utils as gt_utils
+from gt4py.cartesian.frontend.gtscript_frontend import GTScriptParser
+from gt4py.cartesian.stencil_object import StencilObject
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.utils.stencil_cache import (
+    compile_stencil,
+    get_definition,
+    resolve_table_shapes,
+)
+
+
+def stencil_fingerprint(
+    name: str, gt4py_config: GT4PyConfig, externals: Optional[Dict[str, Any]] = None
+) -> str:
+    """Hash of what determines a compiled stencil.
+
+    Only the externals read by the definition (and by the gtscript functions
+    it calls) and the shapes of its lookup tables enter the hash : unrelated
+    keys of Phyex.to_externals() do not change it.
+
+    Args:
+        name (str): name of the stencil collection
+        gt4py_config (GT4PyConfig): backend, dtypes and build options
+        externals (Optional[Dict[str, Any]]): externals given at compilation
+
+    Returns:
+        str: fingerprint of the stencil
+    """
+    definition = resolve_table_shapes(get_definition(name), externals)
+    GTScriptParser.annotate_definition(definition, externals=externals or {})
+    used_externals = {
+        key: value._gtscript_["canonical_ast"]
+        if hasattr(value, "_gtscript_")
+        else value
+        for key, value in definition._gtscript_["externals"].items()
+    }
+    return gt_utils.shashed_id(
+        definition._gtscript_["canonical_ast"],
+        {key: str(value) for key, value in gt4py_config.dtypes.dict().items()},
+        gt4py_config.backend_opts,
+        used_externals,
+        {key: str(value) for key, value in definition.__annotations__.items()},
+        length=16,
+    )
+
+
+@dataclass
+class RegistryStats:
+    """Compilation requests and actual compilations of a registry"""
+
+    requests: int = 0
+    compilations: int = 0
+    avoided_by_name: Counter = field(default_factory=Counter)
+
+    @property
+    def avoided(self) -> int:
+        return self.requests - self.compilations
+
+
+class StencilRegistry:
+    """Compiled stencils keyed by (collection name, backend, fingerprint)
+
+    Requests are serialized : components can be built (or compacted, see
+    Ice4Stepping.compacted) on several threads (see ice3_gt4py.utils.decomposition).
+    """
+
+    def __init__(self):
+        self._stencils: Dict[Tuple[str, str, str], StencilObject] = {}
+        self._lock = threading.RLock()
+        self.stats = RegistryStats()
+
+    def __len__(self) -> int:
+        return len(self._stencils)
+
+    def __contains__(self, key: Tuple[str, str, str]) -> bool:
+        return key in self._stencils
+
+    def key(
+        self,
+        name: str,
+        gt4py_config: GT4PyConfig,
+        externals: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[str, str, str]:
+        return (
+            name,
+            gt4py_config.backend,
+            stencil_fingerprint(name, gt4py_config, externals),
+        )
+
+    def get_or_compile(
+        self,
+        name: str,
+        gt4py_config: GT4PyConfig,
+        externals: Optional[Dict[str, Any]] = None,
+    ) -> StencilObject:
+        """Get the stencil compiled for the same key, or compile it.
+
+        Args:
+            name (str): name of the stencil collection
+            gt4py_config (GT4PyConfig): backend, dtypes and build options
+            externals (Optional[Dict[str, Any]]): externals given at compilation
+
+        Returns:
+            StencilObject: compiled stencil
+        """
+        # The fingerprint annotates the (shared) definition of the stencil
+        with self._lock:
+            key = self.key(name, gt4py_config, externals)
+            self.stats.requests += 1
+            stencil = self._stencils.get(key)
+            if stencil is None:
+                stencil = compile_stencil(name, gt4py_config, externals)
+                self._stencils[key] = stencil
+                self.stats.compilations += 1
+            else:
+                self.stats.avoided_by_name[name] += 1
+        return stencil
+
+    def clear(self):
+        self._stencils.clear()
+        self.stats = RegistryStats()
+
+    def report(self) -> Dict[str, Any]:
+        """Compilations avoided by the registry, as a json-serializable dict"""
+        return {
+            "requests": self.stats.requests,
+            "compilations": self.stats.compilations,
+            "avoided": self.stats.avoided,
+            "avoided_by_name": dict(self.stats.avoided_by_name),
+        }
+
+
+_STENCIL_REGISTRY = StencilRegistry()
+
+
+def get_stencil_registry() -> StencilRegistry:
+    """Get the process-wide stencil registry"""
+    return _STENCIL_REGISTRY
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""Streaming of a dataset through a component, chunk of columns by chunk of columns.
+
+column_chunks yields the columns of a NetCDF dataset (IJ dimension) by chunks of
+a fixed size. Each chunk is read as a NetCDFReader restricted to its columns,
+so that the initialize_state functions of ice3_gt4py.initialisation fill the
+storages of a state allocated once, on a chunk-sized grid.
+
+NetCDFAppender writes the outputs of each chunk along an unlimited I dimension.
+Memory is bounded by the chunk size, not by the dataset size.
+"""
+
+from __future__ import annotations
+
+import resource
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Optional
+
+import netCDF4
+import numpy as np
+import xarray as xr
+
+
+class ColumnChunk:
+    """Columns [start, stop) of a dataset, read as a NetCDFReader
+
+    Fields without the column dimension are read whole.
+    Fields are read once per chunk.
+
+    Args:
+        dataset (xr.Dataset): open dataset
+        start (int): first column
+        stop (int): last column (excluded)
+        dim (str): column dimension of the dataset
+    """
+
+    def __init__(self, dataset: xr.Dataset, start: int, stop: int, dim: str = "IJ"):
+        self.dataset = dataset
+        self.start = start
+        self.stop = stop
+        self.dim = dim
+        self._fields: Dict[str, np.ndarray] = {}
+
+    @property
+    def size(self) -> int:
+        return self.stop - self.start
+
+    def get_field(self, name: str) -> np.ndarray:
+        if name not in self._fields:
+            field = self.dataset[name]
+            if self.dim in field.dims:
+                field = field.isel({self.dim: slice(self.start, self.stop)})
+            self._fields[name] = field.values
+        return self._fields[name]
+
+    def get_dims(self) -> Dict[str, int]:
+        return {**self.dataset.sizes, self.dim: self.size}
+
+
+def column_chunks(
+    path: str | Path,
+    chunk_size: int,
+    dim: str = "IJ",
+    max_columns: Optional[int] = None,
+) -> Iterator[ColumnChunk]:
+    """Columns of a NetCDF dataset, by chunks of chunk_size columns
+
+    The dataset is opened once, and read lazily : only the fields
+    of the current chunk are held in memory.
+
+    Args:
+        path (str | Path): NetCDF dataset
+        chunk_size (int): number of columns per chunk, the last chunk may be smaller
+        dim (str): column dimension of the dataset
+        max_columns (Optional[int]): number of columns to read, all if None
+
+    Yields:
+        ColumnChunk: columns of the chunk
+    """
+    with xr.open_dataset(path) as dataset:
+        n_columns = dataset.sizes[dim]
+        if max_columns is not None:
+            n_columns = min(n_columns, max_columns)
+        for start in range(0, n_columns, chunk_size):
+            yield ColumnChunk(dataset, start, min(start + chunk_size, n_columns), dim)
+
+
+class NetCDFAppender:
+    """NetCDF output written chunk by chunk along an unlimited I dimension
+
+    Variables are created on the first append : (I, J) for 2D fields,
+    (I, J, K) for 3D fields.
+
+    Args:
+        path (str | Path): output file, overwritten
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.columns = 0
+        self._dataset: Optional[netCDF4.Dataset] = None
+
+    def append(self, fields: Mapping[str, Any], size: Optional[int] = None):
+        """Append the first size columns of fields
+
+        Args:
+            fields (Mapping[str, Any]): fields on (I, J) or (I, J, K)
+            size (Optional[int]): number of columns to write, all if None
+        """
+        if self._dataset is None:
+            self._create(fields)
+
+        if size is None:
+            size = np.shape(next(iter(fields.values())))[0]
+        for key, field in fields.items():
+            array = np.asarray(field)[:size]
+            self._dataset[key][self.columns : self.columns + size] = array
+        self.columns += size
+
+    def _create(self, fields: Mapping[str, Any]):
+        self._dataset = netCDF4.Dataset(self.path, "w")
+        self._dataset.createDimension("I", None)
+        for key, field in fields.items():
+            array = np.asarray(field)
+            for dim, size in zip(("J", "K"), array.shape[1:]):
+                if dim not in self._dataset.dimensions:
+                    self._dataset.createDimension(dim, size)
+            # NetCDF has no boolean type
+            dtype = "i1" if array.dtype == bool else array.dtype
+            self._dataset.createVariable(key, dtype, ("I", "J", "K")[: array.ndim])
+
+    def close(self):
+        if self._dataset is not None:
+            self._dataset.close()
+            self._dataset = None
+
+    def __enter__(self) -> NetCDFAppender:
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class StreamingStats:
+    """Chunks streamed through a component
+
+    peak_rss is the peak resident memory of the process.
+    """
+
+    chunks: int = 0
+    columns: int = 0
+    read_time: float = 0.0
+    run_time: float = 0.0
+    write_time: float = 0.0
+    peak_rss: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Columns per second of run time"""
+        return self.columns / self.run_time if self.run_time else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.columns} columns in {self.chunks} chunks, "
+            f"read {self.read_time:.2f} s, run {self.run_time:.2f} s "
+            f"({self.throughput:.0f} columns/s), write {self.write_time:.2f} s, "
+            f"peak memory {self.peak_rss / 2**20:.1f} MiB"
+        )
+
+
+def peak_rss() -> int:
+    """Peak resident memory of the process, in bytes (Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def stream_columns(
+    chunks: Iterable[ColumnChunk],
+    state: Mapping[str, Any],
+    initialize: Callable[[Mapping[str, Any], ColumnChunk], None],
+    run: Callable[[Dict[str, Any]], None],
+    writer: NetCDFAppender,
+) -> StreamingStats:
+    """Run a component on each chunk, and append its outputs to writer
+
+    The storages of state are reused by every chunk : the last chunk,
+    if smaller, is initialized over the whole state but only its columns are written.
+
+    Args:
+        chunks (Iterable[ColumnChunk]): chunks of columns, see column_chunks
+        state (Mapping[str, Any]): DataArrays allocated on a chunk-sized grid
+        initialize (Callable): fills state from a chunk, e.g. initialize_state
+        run (Callable[[Dict[str, Any]], None]): runs the component on the storages
+            of state, e.g. component.nested_call
+        writer (NetCDFAppender): output
+
+    Returns:
+        StreamingStats: timings and peak memory
+    """
+    stats = StreamingStats()
+    storages = {key: field.data for key, field in state.items() if key != "time"}
+
+    chunks = iter(chunks)
+    while True:
+        tic = time.perf_counter()
+        chunk = next(chunks, None)
+        if chunk is None:
+            break
+        initialize(state, chunk)
+        stats.read_time += time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        run(storages)
+        stats.run_time += time.perf_counter() - tic
+
+        tic = time.perf_counter()
+        writer.append(storages, chunk.size)
+        stats.write_time += time.perf_counter() - tic
+
+        stats.chunks += 1
+        stats.columns += chunk.size
+
+    stats.peak_rss = peak_rss()
+    return stats
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""Registry of lookup tables uploaded to the backend.
+
+GlobalTable arguments (gaminc_rim1/2/4, ker_* collision kernels, src_1d)
+are read-only : they are uploaded once per backend, dtype and content
+(i.e. per Phyex) and the same storage is handed to every call.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from gt4py.storage import from_array
+
+
+@dataclass
+class TableEntry:
+    """Table uploaded to a backend"""
+
+    name: str
+    backend: str
+    storage: Any
+    shape: Tuple[int, ...]
+    dtype: str
+    nbytes: int
+
+
+class TableRegistry:
+    """Lookup tables keyed by (backend, name, dtype, content hash)
+
+    Requests are serialized, as components can be built on several threads.
+    """
+
+    def __init__(self):
+        self._tables: Dict[Tuple[str, str, str, str], TableEntry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get(
+        self,
+        name: str,
+        table: np.ndarray,
+        backend: str,
+        dtype: Optional[Any] = None,
+    ):
+        """Get the storage holding a table on a backend, upload it on first request.
+
+        Args:
+            name (str): name of the table
+            table (np.ndarray): table values
+            backend (str): gt4py backend
+            dtype (Optional[Any]): storage dtype, dtype of the table if None
+
+        Returns:
+            storage holding the table on the backend
+        """
+        table = np.asarray(table, dtype=dtype)
+        key = (
+            backend,
+            name,
+            table.dtype.str,
+            hashlib.sha1(np.ascontiguousarray(table).tobytes()).hexdigest(),
+        )
+        with self._lock:
+            entry = self._tables.get(key)
+            if entry is None:
+                logging.info(f"Uploading {name} table to {backend}")
+                entry = TableEntry(
+                    name=name,
+                    backend=backend,
+                    storage=from_array(table, backend=backend),
+                    shape=table.shape,
+                    dtype=table.dtype.name,
+                    nbytes=table.nbytes,
+                )
+                self._tables[key] = entry
+        return entry.storage
+
+    def nbytes(self) -> int:
+        """Memory held by the tables, in bytes"""
+        return sum(entry.nbytes for entry in self._tables.values())
+
+    def clear(self):
+        self._tables.clear()
+
+    def report(self) -> Dict[str, Any]:
+        """Tables held and memory footprint, as a json-serializable dict"""
+        return {
+            "tables": [
+                {
+                    "name": entry.name,
+                    "backend": entry.backend,
+                    "shape": list(entry.shape),
+                    "dtype": entry.dtype,
+                    "nbytes": entry.nbytes,
+                }
+                for entry in self._tables.values()
+            ],
+            "nbytes": self.nbytes(),
+        }
+
+
+_TABLE_REGISTRY = TableRegistry()
+
+
+def get_table_registry() -> TableRegistry:
+    """Get the process-wide table registry"""
+    return _TABLE_REGISTRY
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""Arena of temporary storages shared by a component hierarchy.
+
+Components of a hierarchy (RainIce > Ice4Pack > Ice4Stepping > Ice4Tendencies)
+hand the same Workspace down to their children. Temporaries are allocated once
+per grid shape and dtype, and handed back to the arena at the end of each call :
+from the second call on, no allocation happens.
+
+Storages are handed out zero-filled, as by managed_temporary_storage :
+a reused storage is zeroed when handed out, unless its caller writes it
+before reading it (written).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Collection, Dict, Iterator, List, Tuple
+
+from ifs_physics_common.framework.storage import zeros
+
+if TYPE_CHECKING:
+    from typing import Literal
+
+    from ifs_physics_common.framework.config import GT4PyConfig
+    from ifs_physics_common.framework.grid import ComputationalGrid, DimSymbol
+    from ifs_physics_common.utils.typingx import NDArrayLike
+
+
+@dataclass
+class WorkspaceStats:
+    """Allocations and memory held by a workspace
+
+    nbytes is the memory held by the arena (steady state),
+    peak_in_use the largest amount of it handed out at once.
+    """
+
+    allocations: int = 0
+    reuses: int = 0
+    nbytes: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.allocations} allocations, {self.reuses} reuses, "
+            f"{self.nbytes / 2**20:.1f} MiB held, "
+            f"{self.peak_in_use / 2**20:.1f} MiB peak in use"
+        )
+
+
+class Workspace:
+    """Temporary storages keyed by (grid shape, dtype)"""
+
+    def __init__(self, gt4py_config: GT4PyConfig):
+        self.gt4py_config = gt4py_config
+        self.stats = WorkspaceStats()
+        self._free: Dict[Tuple[Tuple[int, ...], str], List[NDArrayLike]] = defaultdict(
+            list
+        )
+
+    @contextmanager
+    def temporaries(
+        self,
+        computational_grid: ComputationalGrid,
+        *args: Tuple[Tuple[DimSymbol, ...], Literal["bool", "float", "int"]],
+        written: Collection[int] = (),
+    ) -> Iterator[List[NDArrayLike]]:
+        """Temporaries of the arena, same arguments as managed_temporary_storage
+
+        Args:
+            computational_grid (ComputationalGrid): grid of the temporaries
+            args: (grid_id, dtype) of each temporary
+            written (Collection[int]): indices of the temporaries written before
+                being read, handed out as left by their previous user
+
+        Yields:
+            List[NDArrayLike]: storages, in the order of args
+        """
+        keys = []
+        storages = []
+        for index, (grid_id, dtype) in enumerate(args):
+            key = (tuple(computational_grid.grids[grid_id].shape), dtype)
+            free = self._free[key]
+            if free:
+                storage = free.pop()
+                if index not in written:
+                    storage[...] = 0
+                self.stats.reuses += 1
+            else:
+                storage = zeros(
+                    computational_grid,
+                    grid_id,
+                    gt4py_config=self.gt4py_config,
+                    dtype=dtype,
+                )
+                self.stats.allocations += 1
+                self.stats.nbytes += storage.nbytes
+            self.stats.in_use += storage.nbytes
+            keys.append(key)
+            storages.append(storage)
+
+        self.stats.peak_in_use = max(self.stats.peak_in_use, self.stats.in_use)
+
+        try:
+            yield storages
+        finally:
+            # Handed back in reverse order : the same sequence of requests
+            # gets the same storages at each call (see call_plan)
+            for key, storage in reversed(list(zip(keys, storages))):
+                self._free[key].append(storage)
+                self.stats.in_use -= storage.nbytes
+
+    def clear(self):
+        """Release the storages held by the arena"""
+        self._free.clear()
+        self.stats.nbytes = self.stats.in_use
+
+    def report(self) -> Dict[str, Any]:
+        """Storages held per (shape, dtype), as a json-serializable dict"""
+        return {
+            "storages": [
+                {"shape": list(shape), "dtype": dtype, "count": len(storages)}
+                for (shape, dtype), storages in self._free.items()
+                if storages
+            ],
+            "nbytes": self.stats.nbytes,
+            "peak_in_use": self.stats.peak_in_use,
+        }
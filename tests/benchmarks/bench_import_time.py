@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import logging
+import statistics
+import subprocess
+import sys
+from typing import List
+
+import typer
+
+logging.basicConfig(stream=sys.stdout, level=logging.INFO)
+
+app = typer.Typer()
+
+MODULES = ["ice3_gt4py", "ice3_gt4py.phyex_common", "drivers.cli"]
+
+
+def import_time(module: str) -> float:
+    """Import time of a module in a fresh interpreter, in seconds.
+
+    Uses python -X importtime : cumulated time of the module import,
+    interpreter start-up excluded.
+
+    Args:
+        module (str): module to import
+
+    Returns:
+        float: import time in seconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines : "import time: self [us] | cumulative | imported package"
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) * 1e-6
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+@app.command()
+def bench_import_time(
+    module: List[str] = typer.Option(MODULES),
+    repeat: int = 5,
+):
+    """Report start-up import times (median over repeats)"""
+
+    for name in module:
+        timings = [import_time(name) for _ in range(repeat)]
+        logging.info(
+            f"import {name} : {statistics.median(timings) * 1e3:.1f} ms "
+            f"(min {min(timings) * 1e3:.1f} ms, max {max(timings) * 1e3:.1f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    app()
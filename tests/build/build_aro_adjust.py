@@ -26,7 +26,7 @@ logging.getLogger()
 if __name__ == "__main__":
 
     BACKEND = "gt:cpu_kfirst"
-    from ifs_physics_common.framework.stencil import compile_stencil
+    from ice3_gt4py.utils.stencil_cache import compile_stencil
 
     ################### Grid #################
     logging.info("Initializing grid ...")
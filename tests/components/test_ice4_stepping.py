@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+import datetime
+import inspect
+
+import numpy as np
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid
+
+from ice3_gt4py.components import ice4_stepping
+from ice3_gt4py.components.base import Ice3Component
+from ice3_gt4py.components.ice4_stepping import (
+    STEPPING_ACCUMULATED,
+    STEPPING_FIELDS,
+    STEPPING_WORK,
+    Ice4Stepping,
+)
+from ice3_gt4py.components.ice4_tendencies import FUSED_FIELDS
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.call_plan import bind
+from ice3_gt4py.utils.stencil_cache import get_definition
+from utils.state_ice4_stepping import get_constant_state_ice4_stepping
+from utils.state_ice4_tendencies import initialize_state_supercooled
+
+
+@pytest.fixture
+def no_compilation(monkeypatch):
+    """Stencils replaced by no-ops, nothing is compiled"""
+
+    def compile_stencil(self, name, externals=None):
+        return lambda **kwargs: None
+
+    monkeypatch.setattr(Ice3Component, "compile_stencil", compile_stencil)
+
+
+@pytest.fixture
+def packed_runs(monkeypatch, no_compilation):
+    """Packed states handed to run_loops by recompact"""
+    runs = []
+
+    def run_loops(
+        self,
+        state,
+        dt,
+        t_micro_0=None,
+        max_outerloop_iterations=10,
+        accumulated_0=None,
+    ):
+        runs.append(
+            {
+                "ldmicro": np.array(state["ldmicro"]),
+                "t_micro": np.array(t_micro_0),
+                "accumulated": {
+                    key: np.array(field) for key, field in accumulated_0.items()
+                },
+                "dt": dt,
+            }
+        )
+
+    monkeypatch.setattr(Ice4Stepping, "run_loops", run_loops)
+    return runs
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_tendencies_fields_bound(monkeypatch, no_compilation, fused):
+    """Every field of the fused Ice4Tendencies stencil is given by Ice4Stepping"""
+    bound = {}
+
+    def record(stencil, *args, scalars=()):
+        call = bind(stencil, *args, scalars=scalars)
+        bound[stencil] = call.args
+        return call
+
+    monkeypatch.setattr(ice4_stepping, "bind", record)
+    stepping = Ice4Stepping(
+        ComputationalGrid(10, 1, 15),
+        GT4PyConfig(backend="numpy", rebuild=False, validate_args=False),
+        Phyex("AROME"),
+        fused=fused,
+    )
+
+    shape = (10, 1, 15)
+    state = {
+        key: np.zeros(shape) for key in (*STEPPING_FIELDS, *STEPPING_WORK, "ldmicro")
+    }
+    stepping.run_loops(state, 45.0, max_outerloop_iterations=1)
+
+    tendencies_state = bound[stepping.ice4_tendencies.nested_call]["state"]
+    assert set(FUSED_FIELDS) <= set(tendencies_state)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_stencil_arguments_bound(monkeypatch, fused):
+    """Arguments bound by Ice4Stepping are the fields of the stencil definitions"""
+    names, bound = {}, {}
+
+    def compile_stencil(self, name, externals=None):
+        def stencil(**kwargs):
+            pass
+
+        names[stencil] = name
+        return stencil
+
+    def record(stencil, *args, scalars=()):
+        call = bind(stencil, *args, scalars=scalars)
+        bound[stencil] = (*call.args, *call.scalars)
+        return call
+
+    monkeypatch.setattr(Ice3Component, "compile_stencil", compile_stencil)
+    monkeypatch.setattr(ice4_stepping, "bind", record)
+    stepping = Ice4Stepping(
+        ComputationalGrid(10, 1, 15),
+        GT4PyConfig(backend="numpy", rebuild=False, validate_args=False),
+        Phyex("AROME"),
+        fused=fused,
+    )
+
+    shape = (10, 1, 15)
+    state = {
+        key: np.zeros(shape) for key in (*STEPPING_FIELDS, *STEPPING_WORK, "ldmicro")
+    }
+    stepping.run_loops(state, 45.0, max_outerloop_iterations=1)
+
+    for stencil, args in bound.items():
+        if stencil in names:
+            definition = get_definition(names[stencil])
+            assert set(args) == set(inspect.signature(definition).parameters)
+
+
+@pytest.mark.parametrize("dt", [20.0, 60.0])
+def test_recompact_tail_inactive(packed_runs, dt):
+    """Padding points of the pack fail t_micro < dt, dt apart from TSTEP (45 s)"""
+    stepping = Ice4Stepping(
+        ComputationalGrid(10, 1, 15),
+        GT4PyConfig(backend="numpy", rebuild=False, validate_args=False),
+        Phyex("AROME"),
+    )
+
+    shape = (10, 1, 15)
+    state = {key: np.zeros(shape) for key in STEPPING_FIELDS}
+    t_micro = np.full(shape, dt)
+    ldcompute = np.zeros(shape, dtype=bool)
+    ldcompute[[1, 4, 7], 0, [2, 9, 14]] = True
+    t_micro[ldcompute] = dt / 2
+    accumulated = {key: np.full(shape, 1.0) for key in STEPPING_ACCUMULATED}
+
+    stepping.recompact(
+        state, t_micro, ldcompute, accumulated, dt, max_outerloop_iterations=3
+    )
+
+    (run,) = packed_runs
+    n_points = int(ldcompute.sum())
+    active = run["t_micro"][:, 0, 0] < run["dt"]
+    assert run["t_micro"].shape[0] > n_points
+    assert active[:n_points].all() and not active[n_points:].any()
+    assert not run["ldmicro"][n_points:].any()
+    for key in STEPPING_ACCUMULATED:
+        assert np.all(run["accumulated"][key][:n_points] == 1.0)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_recompaction_matches_full_domain(fused: bool):
+    """Recompacted Ice4Stepping gives the mixing ratios of the full domain run"""
+    grid = ComputationalGrid(10, 1, 15)
+    dt = datetime.timedelta(seconds=45)
+    phyex = Phyex("AROME")
+    gt4py_config = GT4PyConfig(backend="debug", rebuild=False, validate_args=True)
+
+    states = {}
+    for threshold in [0.0, 0.5]:
+        stepping = Ice4Stepping(
+            grid, gt4py_config, phyex, fused=fused, recompaction_threshold=threshold
+        )
+        states[threshold] = {
+            key: field.data
+            for key, field in get_constant_state_ice4_stepping(
+                grid, gt4py_config=gt4py_config
+            ).items()
+            if key != "time"
+        }
+        initialize_state_supercooled(states[threshold], pres="pabs_t")
+        stepping.array_call(states[threshold], dt, {}, {}, {})
+        assert (stepping.stats.recompactions > 0) == (threshold > 0)
+
+    for key in ["th_t", "rv_t", "rc_t", "rr_t", "ri_t", "rs_t", "rg_t", "ci_t"]:
+        for threshold in [0.0, 0.5]:
+            assert np.all(np.isfinite(states[threshold][key])), f"{key} is not finite"
+        assert np.array_equal(
+            states[0.0][key], states[0.5][key]
+        ), f"{key} differs with recompaction"
+
+
+@pytest.mark.parametrize("backend", ["debug"])
+def test_fused_matches_multi_launch(backend: str):
+    """Fused Ice4Stepping gives the mixing ratios of the multi-launch reference"""
+    grid = ComputationalGrid(10, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex("AROME")
+    gt4py_config = GT4PyConfig(backend=backend, rebuild=False, validate_args=True)
+
+    states = {}
+    for fused in [False, True]:
+        stepping = Ice4Stepping(grid, gt4py_config, phyex, fused=fused)
+        states[fused] = {
+            key: field.data
+            for key, field in get_constant_state_ice4_stepping(
+                grid, gt4py_config=gt4py_config
+            ).items()
+            if key != "time"
+        }
+        initialize_state_supercooled(states[fused], pres="pabs_t")
+        stepping.array_call(states[fused], dt, {}, {}, {})
+        assert stepping.stats.inner_iterations > 0
+
+    for key in ["th_t", "rv_t", "rc_t", "rr_t", "ri_t", "rs_t", "rg_t", "ci_t"]:
+        for fused in [False, True]:
+            assert np.all(np.isfinite(states[fused][key])), f"{key} is not finite"
+        assert np.allclose(
+            states[False][key], states[True][key]
+        ), f"{key} differs between fused and multi-launch Ice4Stepping"
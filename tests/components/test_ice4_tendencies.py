@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import numpy as np
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid
+
+from ice3_gt4py.components.ice4_tendencies import (
+    FUSED_FIELDS,
+    SOFT_RATES,
+    Ice4Tendencies,
+)
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.workspace import Workspace
+from utils.state_ice4_tendencies import (
+    get_constant_state_ice4_tendencies,
+    initialize_state_supercooled,
+)
+
+# ai is infinite on any state (ka**RV underflows to 0), other fields are compared
+COMPARED_FIELDS = tuple(key for key in FUSED_FIELDS + SOFT_RATES if key != "ai")
+
+
+@pytest.mark.parametrize("backend", ["debug"])
+def test_fused_matches_multi_launch(backend: str):
+    """Fused Ice4Tendencies gives the fields of the stencil chain"""
+    grid = ComputationalGrid(10, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex("AROME")
+    gt4py_config = GT4PyConfig(backend=backend, rebuild=False, validate_args=True)
+
+    states = {}
+    for fused in [False, True]:
+        tendencies = Ice4Tendencies(grid, gt4py_config, phyex, fused=fused)
+        states[fused] = {
+            key: field.data
+            for key, field in get_constant_state_ice4_tendencies(
+                grid, gt4py_config=gt4py_config
+            ).items()
+        }
+        initialize_state_supercooled(states[fused])
+        tendencies.nested_call(states[fused], dt, ldsoft=False)
+
+    for key in COMPARED_FIELDS:
+        for fused in [False, True]:
+            assert np.all(np.isfinite(states[fused][key])), f"{key} is not finite"
+        assert np.allclose(
+            states[False][key], states[True][key]
+        ), f"{key} differs between fused and multi-launch Ice4Tendencies"
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_shared_workspace(fused: bool):
+    """Temporaries left by another component of the workspace do not change the results"""
+    grid = ComputationalGrid(10, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex("AROME")
+    gt4py_config = GT4PyConfig(backend="debug", rebuild=False, validate_args=True)
+
+    def run(tendencies, seed):
+        state = {
+            key: field.data
+            for key, field in get_constant_state_ice4_tendencies(
+                grid, gt4py_config=gt4py_config
+            ).items()
+        }
+        initialize_state_supercooled(state, seed=seed)
+        tendencies.nested_call(state, dt, ldsoft=False)
+        return state
+
+    reference = run(Ice4Tendencies(grid, gt4py_config, phyex, fused=fused), 42)
+
+    workspace = Workspace(gt4py_config)
+    run(Ice4Tendencies(grid, gt4py_config, phyex, workspace=workspace), 7)
+    tendencies = Ice4Tendencies(
+        grid, gt4py_config, phyex, fused=fused, workspace=workspace
+    )
+    state = run(tendencies, 42)
+    assert workspace.stats.reuses > 0
+
+    for key in COMPARED_FIELDS:
+        assert np.all(np.isfinite(state[key])), f"{key} is not finite"
+        assert np.array_equal(
+            reference[key], state[key]
+        ), f"{key} depends on the temporaries left in the workspace"
+
+
+def test_unset_rates_zero_filled():
+    """Transformation rates the chain does not write are zero-filled at each call,
+    as the fused stencil sets them"""
+    tendencies = Ice4Tendencies(
+        ComputationalGrid(10, 1, 15),
+        GT4PyConfig(backend="debug", rebuild=False, validate_args=True),
+        Phyex("AROME"),
+    )
+    plan = tendencies.aliasing_plan
+    pinned = {name for name, slot in plan.slots.items() if slot in plan.pinned}
+    assert pinned == {
+        "rsrimcg_mr",
+        "rchoni",
+        "rvdeps",
+        "riaggs",
+        "riauts",
+        "rvdepg",
+        "rcberi",
+        "rsmltg",
+        "rcmltsr",
+        "rcwetg",
+        "riwetg",
+        "rrwetg",
+        "rswetg",
+        "rcdryg",
+        "ridryg",
+        "rrdryg",
+        "rsdryg",
+    }
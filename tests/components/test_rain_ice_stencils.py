@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid
+
+from ice3_gt4py.components.base import Ice3Component
+from ice3_gt4py.components.rain_ice import RainIce
+from ice3_gt4py.phyex_common.param_ice import SubgRREvap, SubgRRRCAccr
+from ice3_gt4py.phyex_common.phyex import Phyex
+
+
+@pytest.fixture
+def compiled(monkeypatch):
+    """Names of the stencils compiled by the components, nothing is compiled"""
+    names = []
+
+    def compile_stencil(self, name, externals=None):
+        names.append(name)
+        return lambda **kwargs: None
+
+    monkeypatch.setattr(Ice3Component, "compile_stencil", compile_stencil)
+    return names
+
+
+@pytest.mark.parametrize(
+    "keys, reached, skipped",
+    [
+        (
+            {"LDEPOSC": False, "LSEDIM_AFTER": False},
+            [],
+            ["fog_deposition", "rain_fraction_sedimentation", "ice4_rainfr_vert"],
+        ),
+        ({"LDEPOSC": True}, ["fog_deposition"], []),
+        (
+            {"LSEDIM_AFTER": True},
+            ["rain_fraction_sedimentation", "ice4_rainfr_vert"],
+            [],
+        ),
+        (
+            {"SUBG_RR_EVAP": SubgRREvap.PRFR.value},
+            ["ice4_rainfr_vert"],
+            [],
+        ),
+    ],
+)
+def test_reachable_stencils(compiled, keys, reached, skipped):
+    """Stencils are compiled only if the ParamIce keys make array_call reach them"""
+    phyex = Phyex("AROME")
+    phyex.param_icen.SUBG_RC_RR_ACCR = SubgRRRCAccr.NONE.value
+    phyex.param_icen.SUBG_RR_EVAP = SubgRREvap.NONE.value
+    for key, value in keys.items():
+        setattr(phyex.param_icen, key, value)
+
+    RainIce(
+        ComputationalGrid(10, 1, 15),
+        GT4PyConfig(backend="numpy", rebuild=False, validate_args=False),
+        phyex,
+    )
+    assert all(name in compiled for name in reached)
+    assert not any(name in compiled for name in skipped)
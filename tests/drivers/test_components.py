@@ -8,6 +8,7 @@ import logging
 import datetime
 import time
 import sys
+from typing import List
 import xarray as xr
 
 from ifs_physics_common.framework.config import GT4PyConfig
@@ -15,6 +16,7 @@ from ifs_physics_common.framework.grid import ComputationalGrid
 
 from drivers.core import core
 from ice3_gt4py.components.aro_adjust import AroAdjust
+from ice3_gt4py.components.ice4_pack import Ice4Pack
 from ice3_gt4py.components.ice4_stepping import Ice4Stepping
 from ice3_gt4py.components.ice4_tendencies import Ice4Tendencies
 from utils.state_aro_adjust import (
@@ -23,6 +25,7 @@ from utils.state_aro_adjust import (
 )
 from utils.state_ice4_tendencies import (
     get_constant_state_ice4_tendencies,
+    initialize_state_supercooled,
 )
 from utils.state_ice4_stepping import (
     get_constant_state_ice4_stepping,
@@ -146,11 +149,295 @@ def run_stepping(
     elapsed_time = stop - start
     logging.info(f"Execution duration for RainIce : {elapsed_time} s")
 
+    # Temporaries are reused from the workspace on the next calls
+    allocations = stepping.workspace.stats.allocations
+    stepping(state, dt)
+    assert stepping.workspace.stats.allocations == allocations
+    logging.info(f"Workspace : {stepping.workspace.stats}")
+
     logging.info(f"Extracting exec tracking to {tracking_file}")
     with open(tracking_file, "w") as file:
         json.dump(gt4py_config.exec_info, file)
 
 
+@app.command()
+def run_pack(backend: str, rebuild: bool = True, validate_args: bool = False):
+    """Test Ice4Pack component against Ice4Stepping on the whole domain.
+
+    Args:
+        backend (str): gt4py backend
+        rebuild (bool, optional): force compilation. Defaults to True.
+        validate_args (bool, optional): validate stencil arguments. Defaults to False.
+    """
+
+    ##### Grid #####
+    logging.info("Initializing grid and timestep ...")
+    grid = ComputationalGrid(100, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+
+    ################## Phyex #################
+    logging.info("Initializing Phyex in AROME configuration")
+    phyex = Phyex(program="AROME")
+    phyex.param_icen.LPACK_MICRO = True
+    phyex.param_icen.NPROMICRO = 64
+
+    ######## Backend and gt4py config #######
+    logging.info(f"With backend {backend}")
+    gt4py_config = GT4PyConfig(
+        backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+    )
+
+    ######## Instanciation + compilation #####
+    stepping = Ice4Stepping(grid, gt4py_config, phyex)
+    pack = Ice4Pack(grid, gt4py_config, phyex)
+
+    ####### Create states, one point out of 5 with ldmicro #######
+    state_stepping = get_constant_state_ice4_stepping(grid, gt4py_config=gt4py_config)
+    state_pack = get_constant_state_ice4_stepping(grid, gt4py_config=gt4py_config)
+    for state in [state_stepping, state_pack]:
+        state["ldmicro"].data[...] = False
+        state["ldmicro"].data[::5, :, :] = True
+
+    ###### Launching Ice4Stepping and Ice4Pack ###############
+    stepping(state_stepping, dt)
+    pack(state_pack, dt)
+    logging.info(f"Ice4Pack : {pack.pack_stats}")
+
+    for key in ["th_t", "rv_t", "rc_t", "rr_t", "ri_t", "rs_t", "rg_t", "ci_t"]:
+        assert np.allclose(
+            state_stepping[key].data, state_pack[key].data
+        ), f"{key} differs between Ice4Stepping and Ice4Pack"
+    logging.info("Ice4Pack matches Ice4Stepping")
+
+
+@app.command()
+def run_stepping_fused(backend: str, rebuild: bool = True, validate_args: bool = False):
+    """Test fused Ice4Stepping against the multi-launch reference.
+
+    Args:
+        backend (str): gt4py backend
+        rebuild (bool, optional): force compilation. Defaults to True.
+        validate_args (bool, optional): validate stencil arguments. Defaults to False.
+    """
+
+    grid = ComputationalGrid(100, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex(program="AROME")
+    gt4py_config = GT4PyConfig(
+        backend=backend, rebuild=rebuild, validate_args=validate_args, verbose=True
+    )
+
+    ######## Instanciation + compilation #####
+    stepping = Ice4Stepping(grid, gt4py_config, phyex)
+    stepping_fused = Ice4Stepping(grid, gt4py_config, phyex, fused=True)
+
+    ###### Launching both paths on the same state ###############
+    state = get_constant_state_ice4_stepping(grid, gt4py_config=gt4py_config)
+    state_fused = get_constant_state_ice4_stepping(grid, gt4py_config=gt4py_config)
+    stepping(state, dt)
+    stepping_fused(state_fused, dt)
+    logging.info(f"Ice4Stepping : {stepping.stats}")
+    logging.info(f"Ice4Stepping (fused) : {stepping_fused.stats}")
+
+    for key in ["th_t", "rv_t", "rc_t", "rr_t", "ri_t", "rs_t", "rg_t", "ci_t"]:
+        assert np.allclose(
+            state[key].data, state_fused[key].data
+        ), f"{key} differs between fused and multi-launch Ice4Stepping"
+    logging.info("Fused Ice4Stepping matches the multi-launch reference")
+
+
+@app.command()
+def bench_tendencies(
+    backends: List[str] = typer.Option(["gt:cpu_ifirst", "gt:cpu_kfirst"]),
+    n_runs: int = 10,
+    rebuild: bool = False,
+):
+    """Compare fused and multi-launch Ice4Tendencies, on results and execution time.
+
+    Args:
+        backends (List[str]): gt4py backends to benchmark
+        n_runs (int, optional): timed calls per path. Defaults to 10.
+        rebuild (bool, optional): force compilation. Defaults to False.
+    """
+
+    grid = ComputationalGrid(10000, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex(program="AROME")
+
+    for backend in backends:
+        gt4py_config = GT4PyConfig(backend=backend, rebuild=rebuild, verbose=True)
+
+        durations = {}
+        states = {}
+        for fused in [False, True]:
+            tendencies = Ice4Tendencies(grid, gt4py_config, phyex, fused=fused)
+            state = {
+                key: field.data
+                for key, field in get_constant_state_ice4_tendencies(
+                    grid, gt4py_config=gt4py_config
+                ).items()
+            }
+            initialize_state_supercooled(state)
+
+            # Warm-up call, then n_runs timed calls
+            for run in range(n_runs + 1):
+                if run == 1:
+                    start = time.perf_counter()
+                tendencies.array_call(
+                    ldsoft=False,
+                    state=state,
+                    timestep=dt,
+                    out_tendencies={},
+                    out_diagnostics={},
+                    overwrite_tendencies={},
+                )
+            durations[fused] = (time.perf_counter() - start) / n_runs
+            states[fused] = state
+
+        for key in [
+            "theta_tnd",
+            "rv_tnd",
+            "rc_tnd",
+            "rr_tnd",
+            "ri_tnd",
+            "rs_tnd",
+            "rg_tnd",
+        ]:
+            assert np.allclose(
+                states[False][key], states[True][key]
+            ), f"{key} differs between fused and multi-launch Ice4Tendencies"
+
+        logging.info(
+            f"{backend} : multi-launch {durations[False] * 1e3:.2f} ms, "
+            f"fused {durations[True] * 1e3:.2f} ms, "
+            f"speedup {durations[False] / durations[True]:.2f}"
+        )
+
+
+@app.command()
+def bench_call_plans(
+    backend: str = "gt:cpu_ifirst",
+    n_runs: int = 20,
+    rebuild: bool = False,
+):
+    """Host time saved by call plans on Ice4Stepping, on a small domain.
+
+    Args:
+        backend (str): gt4py backend
+        n_runs (int, optional): timed calls per path. Defaults to 20.
+        rebuild (bool, optional): force compilation. Defaults to False.
+    """
+
+    grid = ComputationalGrid(20, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex(program="AROME")
+    gt4py_config = GT4PyConfig(backend=backend, rebuild=rebuild, verbose=True)
+
+    durations = {}
+    for call_plans in [False, True]:
+        stepping = Ice4Stepping(grid, gt4py_config, phyex, call_plans=call_plans)
+        state = {
+            key: field.data
+            for key, field in get_constant_state_ice4_stepping(
+                grid, gt4py_config=gt4py_config
+            ).items()
+        }
+
+        # Warm-up call, then n_runs timed calls
+        for run in range(n_runs + 1):
+            if run == 1:
+                start = time.perf_counter()
+            stepping.array_call(
+                state,
+                timestep=dt,
+                out_tendencies={},
+                out_diagnostics={},
+                overwrite_tendencies={},
+            )
+        durations[call_plans] = (time.perf_counter() - start) / n_runs
+
+        if call_plans:
+            logging.info(f"Ice4Stepping plans : {stepping.call_plans.stats}")
+            logging.info(
+                f"Ice4Tendencies plans : {stepping.ice4_tendencies.call_plans.stats}"
+            )
+    logging.info(f"Ice4Stepping counters : {stepping.stats}")
+
+    logging.info(
+        f"{backend} : without plans {durations[False] * 1e3:.3f} ms, "
+        f"with plans {durations[True] * 1e3:.3f} ms, "
+        f"host time saved {(durations[False] - durations[True]) * 1e3:.3f} ms per call"
+    )
+
+
+@app.command()
+def bench_nested(
+    backend: str = "gt:cpu_ifirst",
+    n_runs: int = 20,
+    rebuild: bool = False,
+):
+    """Overhead of calling a nested component (Ice4Pack, as in RainIce)
+    through __call__ on DataArrays, against nested_call on storages.
+
+    Args:
+        backend (str): gt4py backend
+        n_runs (int, optional): timed calls per path. Defaults to 20.
+        rebuild (bool, optional): force compilation. Defaults to False.
+    """
+
+    grid = ComputationalGrid(20, 1, 15)
+    dt = datetime.timedelta(seconds=1)
+    phyex = Phyex(program="AROME")
+    gt4py_config = GT4PyConfig(backend=backend, rebuild=rebuild, verbose=True)
+
+    pack = Ice4Pack(grid, gt4py_config, phyex)
+    state = {
+        key: field.data
+        for key, field in get_constant_state_ice4_stepping(
+            grid, gt4py_config=gt4py_config
+        ).items()
+    }
+
+    def dataarray_call():
+        # DataArrays built at each call, as RainIce did before nested_call
+        state_dataarrays = {
+            **{
+                key: xr.DataArray(
+                    data=field,
+                    dims=["x", "y", "z"],
+                    coords={
+                        "x": range(field.shape[0]),
+                        "y": range(field.shape[1]),
+                        "z": range(field.shape[2]),
+                    },
+                    name=key,
+                )
+                for key, field in state.items()
+            },
+            "time": datetime.datetime(year=2024, month=1, day=1),
+        }
+        pack(state_dataarrays, dt)
+
+    durations = {}
+    for name, call in [
+        ("__call__", dataarray_call),
+        ("nested_call", lambda: pack.nested_call(state, dt)),
+    ]:
+        # Warm-up call, then n_runs timed calls
+        for run in range(n_runs + 1):
+            if run == 1:
+                start = time.perf_counter()
+            call()
+        durations[name] = (time.perf_counter() - start) / n_runs
+
+    logging.info(
+        f"{backend} : __call__ {durations['__call__'] * 1e3:.3f} ms, "
+        f"nested_call {durations['nested_call'] * 1e3:.3f} ms, "
+        f"nested overhead saved "
+        f"{(durations['__call__'] - durations['nested_call']) * 1e3:.3f} ms per call"
+    )
+
+
 @app.command()
 def run_aro_adjust(backend: str, rebuild: bool = True, validate_args: bool = False):
     """Run aro_adjust component"""
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.phyex_common.phyex_cache import load_phyex, phyex_key
+
+
+def test_load_phyex(tmp_path):
+    """Snapshot written on first call, loaded back identical on second call"""
+    phyex = load_phyex("AROME", cache_dir=tmp_path)
+    assert (tmp_path / phyex_key("AROME")).exists()
+
+    cached = load_phyex("AROME", cache_dir=tmp_path)
+    np.testing.assert_equal(cached.to_externals(), Phyex("AROME").to_externals())
+    assert cached is not phyex
+
+
+def test_phyex_key():
+    """Snapshots keyed by program and arguments"""
+    assert phyex_key("AROME") == phyex_key("AROME")
+    assert phyex_key("AROME") != phyex_key("MESO-NH", PROGRAM="MESO-NH")
+    assert phyex_key("AROME") != phyex_key("AROME", TSTEP=50)
+
+
+def test_corrupted_snapshot(tmp_path):
+    (tmp_path / phyex_key("AROME")).write_bytes(b"corrupted")
+    phyex = load_phyex("AROME", cache_dir=tmp_path)
+    assert phyex.PROGRAM == "AROME"
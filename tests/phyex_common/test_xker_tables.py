@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from copy import copy
+
+import numpy as np
+import pytest
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.phyex_common.xker_tables import (
+    DEFAULT_LAWS,
+    KERNELS_DIR,
+    SHIPPED_GRIDS,
+    SHIPPED_LAWS,
+    compute_kernel,
+    load_kernel,
+    species_laws,
+)
+
+# Shipped tables are printed with 6 significant digits
+RTOL = 1e-5
+
+
+@pytest.mark.parametrize("name", ["raccs", "rdryg", "sdryg"])
+def test_compute_kernel_vs_shipped(name: str):
+    """Generated kernels against the literals of mode_ini_rain_ice.F90"""
+    # Literals are tabulated for an exponential law of the rain drops
+    rid = copy(Phyex("AROME").rain_ice_param.rid)
+    rid.ALPHAR, rid.NUR = 1.0, 1.0
+    reference = np.load(KERNELS_DIR / f"ker_{name}.npy")
+    kernel = compute_kernel(name, rid, *SHIPPED_GRIDS[name])
+    assert kernel.shape == reference.shape
+    assert np.allclose(kernel, reference, rtol=RTOL, atol=0)
+
+
+def literal_rid():
+    """Laws of AROME, rain drops with the exponential law of the literals"""
+    rid = copy(Phyex("AROME").rain_ice_param.rid)
+    rid.ALPHAR, rid.NUR = 1.0, 1.0
+    return rid
+
+
+def test_shipped_laws():
+    for species, laws in SHIPPED_LAWS.items():
+        assert species_laws(literal_rid(), species) == laws
+    for species, laws in DEFAULT_LAWS.items():
+        assert species_laws(Phyex("AROME").rain_ice_param.rid, species) == laws
+
+
+def test_load_kernel(tmp_path):
+    """Shipped tables on the grids and laws of the literals, cached tables otherwise"""
+    rid = literal_rid()
+
+    kernel = load_kernel("sdryg", rid, *SHIPPED_GRIDS["sdryg"], cache_dir=tmp_path)
+    assert np.array_equal(kernel, np.load(KERNELS_DIR / "ker_sdryg.npy"))
+    assert not any(tmp_path.iterdir())
+
+    grids = ((1e3, 1e7, 60), (2.5e1, 2.5e9, 120))
+    kernel = load_kernel("sdryg", rid, *grids, cache_dir=tmp_path)
+    assert kernel.shape == (60, 120)
+    assert len(list(tmp_path.glob("ker_sdryg_*.npy"))) == 1
+
+    cached = load_kernel("sdryg", rid, *grids, cache_dir=tmp_path)
+    assert np.array_equal(cached, kernel)
+
+    with pytest.raises(KeyError):
+        load_kernel("rdrys", rid, *grids, cache_dir=tmp_path)
+
+
+def test_load_kernel_default(tmp_path):
+    """The default configuration runs with the shipped tables, nothing is computed"""
+    rid = Phyex("AROME").rain_ice_param.rid
+    for name, grids in SHIPPED_GRIDS.items():
+        kernel = load_kernel(name, rid, *grids, cache_dir=tmp_path)
+        assert np.array_equal(kernel, np.load(KERNELS_DIR / f"ker_{name}.npy"))
+    assert not any(tmp_path.iterdir())
+
+
+def test_load_kernel_laws(tmp_path):
+    """Laws changed from the default configuration are integrated on the shipped
+    grids, raccss and saccrg are not generated"""
+    rid = copy(Phyex("AROME").rain_ice_param.rid)
+    rid.NUR = 2.0
+
+    for name in ["raccs", "rdryg"]:
+        grids = SHIPPED_GRIDS[name]
+        kernel = load_kernel(name, rid, *grids, cache_dir=tmp_path)
+        assert np.allclose(kernel, compute_kernel(name, rid, *grids))
+        assert not np.allclose(kernel, np.load(KERNELS_DIR / f"ker_{name}.npy"))
+        assert len(list(tmp_path.glob(f"ker_{name}_*.npy"))) == 1
+
+    kernel = load_kernel("sdryg", rid, *SHIPPED_GRIDS["sdryg"], cache_dir=tmp_path)
+    assert np.array_equal(kernel, np.load(KERNELS_DIR / "ker_sdryg.npy"))
+
+    for name in ["raccss", "saccrg"]:
+        with pytest.raises(ValueError):
+            load_kernel(name, rid, *SHIPPED_GRIDS[name], cache_dir=tmp_path)
+        with pytest.raises(ValueError):
+            compute_kernel(name, rid, *SHIPPED_GRIDS[name])
+    assert not any(tmp_path.glob("ker_raccss_*")) and not any(
+        tmp_path.glob("ker_saccrg_*")
+    )
+
+
+def test_load_kernel_grids(tmp_path):
+    """raccss and saccrg are not generated on other grids"""
+    rid = Phyex("AROME").rain_ice_param.rid
+    lbdas, lbdar = (5e1, 5e6, 30), (1e3, 1e8, 50)
+
+    with pytest.raises(ValueError):
+        load_kernel("raccss", rid, lbdas, lbdar, cache_dir=tmp_path)
+    with pytest.raises(ValueError):
+        load_kernel("saccrg", rid, lbdar, lbdas, cache_dir=tmp_path)
+    assert load_kernel("raccs", rid, lbdas, lbdar, cache_dir=tmp_path).shape == (30, 50)
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-from ifs_physics_common.framework.stencil import compile_stencil
+from ice3_gt4py.utils.stencil_cache import compile_stencil
 import sys
 import logging
 
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import inspect
+
+import numpy as np
+import pytest
+from gt4py.storage import from_array, zeros
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.stencil_cache import compile_stencil, get_definition
+
+
+@pytest.mark.parametrize("dt", [20.0, 45.0, 60.0])
+def test_ldcompute_init_count(dt: float):
+    """Column counts of ldcompute match t_micro < dt, dt apart from TSTEP (45 s)"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False, validate_args=True)
+    ldcompute_init = compile_stencil(
+        "ice4_stepping_ldcompute_init", gt4py_config, Phyex("AROME").to_externals()
+    )
+
+    shape = (5, 4, 15)
+    t_micro = np.random.default_rng(0).uniform(0.0, 60.0, shape)
+    ldcompute = zeros(shape, dtype=bool, backend="numpy")
+    ldcompute_count = zeros(
+        shape[:2], dtype=gt4py_config.dtypes.int, backend="numpy", dimensions=("I", "J")
+    )
+
+    ldcompute_init(
+        ldcompute=ldcompute,
+        t_micro=from_array(t_micro, backend="numpy"),
+        ldcompute_count=ldcompute_count,
+        dt=dt,
+    )
+
+    expected = t_micro < dt
+    assert np.array_equal(np.asarray(ldcompute), expected)
+    assert np.array_equal(np.asarray(ldcompute_count), expected.sum(axis=2))
+
+
+@pytest.mark.parametrize("dt", [20.0, 60.0])
+def test_tmicro_init(dt: float):
+    """Points out of ldmicro start with the timestep elapsed, dt apart from TSTEP (45 s)"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False, validate_args=True)
+    tmicro_init = compile_stencil(
+        "ice4_stepping_tmicro_init", gt4py_config, Phyex("AROME").to_externals()
+    )
+
+    shape = (5, 4, 15)
+    ldmicro = np.random.default_rng(0).uniform(0.0, 1.0, shape) < 0.5
+    t_micro = zeros(shape, dtype=float, backend="numpy")
+
+    tmicro_init(
+        t_micro=t_micro, ldmicro=from_array(ldmicro, dtype=bool, backend="numpy"), dt=dt
+    )
+
+    assert np.array_equal(np.asarray(t_micro), np.where(ldmicro, 0.0, dt))
+
+
+@pytest.mark.parametrize("dt", [20.0, 60.0])
+def test_step_limiter_dt(dt: float):
+    """Without tendencies, the step reaches dt, dt apart from TSTEP (45 s)"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False, validate_args=True)
+    step_limiter = compile_stencil(
+        "step_limiter", gt4py_config, Phyex("AROME").to_externals()
+    )
+
+    shape = (5, 4, 15)
+    fields = {
+        name: zeros(shape, dtype=float, backend="numpy")
+        for name in inspect.signature(get_definition("step_limiter")).parameters
+        if name not in ["ldcompute", "dt"]
+    }
+    fields["exn"][...] = 1.0
+    fields["theta_t"][...] = 250.0
+    t_micro = np.random.default_rng(0).uniform(0.0, dt, shape)
+    fields["t_micro"][...] = t_micro
+    ldcompute = from_array(np.ones(shape, dtype=bool), dtype=bool, backend="numpy")
+
+    step_limiter(**fields, ldcompute=ldcompute, dt=dt)
+
+    assert np.allclose(np.asarray(fields["delta_t_micro"]), dt - t_micro)
+    assert np.all(np.asarray(ldcompute))
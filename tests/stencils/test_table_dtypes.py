@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.precision import with_precision
+from ice3_gt4py.utils.stencil_cache import compile_stencil
+
+TABLES = {
+    "ice4_fast_rs": [
+        "gaminc_rim1",
+        "gaminc_rim2",
+        "gaminc_rim4",
+        "ker_raccs",
+        "ker_raccss",
+        "ker_saccrg",
+    ],
+    "ice4_fast_rg": ["ker_sdryg", "ker_rdryg"],
+}
+
+
+@pytest.mark.parametrize(
+    "precision, dtype", [("single", np.float32), ("double", np.float64)]
+)
+@pytest.mark.parametrize("name", list(TABLES))
+def test_table_dtypes(name: str, precision: str, dtype: type):
+    """Lookup tables compiled with the precision of the fields"""
+    gt4py_config = with_precision(
+        GT4PyConfig(backend="debug", rebuild=False, validate_args=True), precision
+    )
+    stencil = compile_stencil(name, gt4py_config, Phyex("AROME").to_externals())
+
+    assert stencil.field_info["rhodref"].dtype == dtype
+    for table in TABLES[name]:
+        assert stencil.field_info[table].dtype == dtype
+        assert stencil.field_info[table].data_dims
@@ -4,9 +4,11 @@ from __future__ import annotations
 from functools import partial
 from typing import TYPE_CHECKING
 
+import numpy as np
 from ifs_physics_common.framework.grid import I, J, K
 from ifs_physics_common.framework.storage import allocate_data_array
 
+from ice3_gt4py.components.ice4_tendencies import SOFT_RATES
 from ice3_gt4py.initialisation.state import initialize_state_with_constant
 
 if TYPE_CHECKING:
@@ -20,6 +22,7 @@ if TYPE_CHECKING:
         NDArrayLikeDict,
     )
 
+
 ############################## Ice4Tendencies #################################
 def allocate_state_ice4_tendencies(
     computational_grid: ComputationalGrid, gt4py_config: GT4PyConfig
@@ -85,7 +88,12 @@ def allocate_state_ice4_tendencies(
         "hlc_hrc": allocate_f(),  # LWC that is high in grid
         "hlc_lrc": allocate_f(),
         "hli_hcf": allocate_f(),
+        "hli_lcf": allocate_f(),
         "hli_hri": allocate_f(),
+        "hli_lri": allocate_f(),
+        "cf": allocate_f(),  # cloud fraction
+        "sigma_rc": allocate_f(),
+        "fr": allocate_f(),  # precipitation fraction
     }
 
     increments = {
@@ -109,12 +117,16 @@ def allocate_state_ice4_tendencies(
         "rg_tnd": allocate_f(),
     }
 
+    # Process rates, kept with ldsoft
+    rates = {name: allocate_f() for name in SOFT_RATES}
+
     return {
         **time_state,
         **masks,
         **state,
         **tnd_update,
         **increments,
+        **rates,
     }
 
 
@@ -135,3 +147,87 @@ def get_constant_state_ice4_tendencies(
     )
     initialize_state_with_constant(state, 0.5, gt4py_config, list(state.keys()))
     return state
+
+
+def initialize_state_mixed_phase(
+    state: NDArrayLikeDict,
+    pres: str = "pres",
+    seed: int = 42,
+    t_range: Tuple[float, float] = (250.0, 290.0),
+    exn_range: Tuple[float, float] = (0.9, 1.0),
+    p_range: Tuple[float, float] = (6e4, 1e5),
+) -> None:
+    """Set state to random mixed phase conditions near water saturation.
+
+    Fields without a prescribed range are set to 0.
+
+    Args:
+        state (NDArrayLikeDict): arrays of the state, set in place
+        pres (str, optional): key of the absolute pressure. Defaults to "pres".
+        seed (int, optional): seed of the random generator. Defaults to 42.
+        t_range (Tuple[float, float], optional): range of temperature (K). Defaults to (250.0, 290.0).
+        exn_range (Tuple[float, float], optional): range of Exner function. Defaults to (0.9, 1.0).
+        p_range (Tuple[float, float], optional): range of absolute pressure (Pa). Defaults to (6e4, 1e5).
+    """
+    rng = np.random.default_rng(seed)
+    shape = state["t"].shape
+
+    def uniform(low, high):
+        return rng.uniform(low, high, shape)
+
+    exn = uniform(*exn_range)
+    t = uniform(*t_range)
+    p = uniform(*p_range)
+    esw = np.exp(60.22 - 6822.4 / t - 5.139 * np.log(t))
+    fields = {
+        "ldcompute": np.ones(shape, dtype=bool),
+        "ldmicro": np.ones(shape, dtype=bool),
+        "exn": exn,
+        "t": t,
+        "th_t": t / exn,
+        pres: p,
+        "rhodref": p / (287.0 * t),
+        "lv_fact": 2.5e6 / (1004.0 * exn),
+        "ls_fact": 2.83e6 / (1004.0 * exn),
+        "rv_t": uniform(0.9, 1.1) * 0.622 * esw / (p - esw),
+        **{key: uniform(0.0, 1e-3) for key in ["rc_t", "rr_t", "ri_t", "rs_t", "rg_t"]},
+        "ci_t": uniform(1e3, 1e6),
+        "sigma_rc": uniform(0.0, 1e-4),
+        **{
+            key: uniform(0.0, 1.0)
+            for key in ["cf", "hlc_hcf", "hlc_lcf", "hli_hcf", "hli_lcf"]
+        },
+        **{
+            key: uniform(0.0, 1e-4)
+            for key in ["hlc_hrc", "hlc_lrc", "hli_hri", "hli_lri"]
+        },
+    }
+    for key, field in state.items():
+        if hasattr(field, "shape"):
+            field[...] = fields.get(key, 0)
+
+
+def initialize_state_supercooled(
+    state: NDArrayLikeDict, pres: str = "pres", seed: int = 42
+) -> None:
+    """Set state to random mixed phase conditions below freezing, near the surface.
+
+    Above TT, the ice4 processes give non-finite fields (e.g. cj), and the
+    post-processing stencils read t back as th_t / exn : temperatures and
+    Exner function are drawn so that t / exn**2 stays below TT.
+    On this state, every field of Ice4Tendencies is finite but ai
+    (ka**RV underflows to 0).
+
+    Args:
+        state (NDArrayLikeDict): arrays of the state, set in place
+        pres (str, optional): key of the absolute pressure. Defaults to "pres".
+        seed (int, optional): seed of the random generator. Defaults to 42.
+    """
+    initialize_state_mixed_phase(
+        state,
+        pres,
+        seed,
+        t_range=(235.0, 255.0),
+        exn_range=(0.97, 1.0),
+        p_range=(9e4, 1e5),
+    )
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from ice3_gt4py.utils.call_plan import CallPlan, CallPlanCache, bind
+
+
+def add(a, b, out, scale=1.0):
+    out[...] = scale * (a + b)
+
+
+def test_replay():
+    """Bound storages are used at each replay, scalars are given per call"""
+    a, b, out = np.ones(3), np.full(3, 2.0), np.zeros(3)
+    plan = CallPlan((bind(add, {"a": a, "b": b}, {"out": out}, scalars=("scale",)),))
+
+    plan(scale=1.0)
+    assert np.all(out == 3.0)
+
+    a[...] = 0.0
+    plan(scale=2.0)
+    assert np.all(out == 4.0)
+
+
+def test_plan_is_immutable():
+    call = bind(add, {"a": np.ones(3)})
+    with pytest.raises(TypeError):
+        call.args["a"] = np.zeros(3)
+
+
+def test_cache_identity():
+    """Same storages replay the plan, other storages build a new one"""
+    cache = CallPlanCache(maxsize=2)
+    storages = [np.zeros(3), np.zeros(3)]
+    build = lambda: CallPlan((bind(add, {"a": storages[0]}),))
+
+    plan = cache.get(storages, build)
+    assert cache.get(storages, build) is plan
+    assert cache.get([np.zeros(3)], build) is not plan
+    assert (cache.stats.builds, cache.stats.replays) == (2, 1)
+
+
+def test_cache_eviction():
+    cache = CallPlanCache(maxsize=1)
+    first, second = [np.zeros(3)], [np.zeros(3)]
+    build = lambda: CallPlan(())
+
+    plan = cache.get(first, build)
+    cache.get(second, build)
+    assert cache.get(first, build) is not plan
+    assert cache.stats.builds == 3
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.utils import compilation
+from ice3_gt4py.utils.compilation import defer_stencil, parallel_compilation
+
+
+class FakeRegistry:
+    """Stands for the stencil registry : "compiles" a stencil into a callable"""
+
+    def __init__(self):
+        self.compiled = []
+
+    def key(self, name, gt4py_config, externals=None):
+        return (name, gt4py_config.backend, "")
+
+    def __contains__(self, key):
+        return False
+
+    def get_or_compile(self, name, gt4py_config, externals=None):
+        if name.startswith("broken"):
+            raise ValueError(f"{name} does not compile")
+        self.compiled.append(name)
+        return lambda **kwargs: (name, kwargs)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = FakeRegistry()
+    monkeypatch.setattr(compilation, "get_stencil_registry", lambda: registry)
+    return registry
+
+
+def test_bound_at_block_exit(registry):
+    """Deferred stencils raise before the end of the block, run after"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    with parallel_compilation(workers=1):
+        deferred = defer_stencil("stencil_a", gt4py_config)
+        with pytest.raises(RuntimeError):
+            deferred(a=1)
+        assert registry.compiled == []
+
+    assert deferred(a=1) == ("stencil_a", {"a": 1})
+    assert registry.compiled == ["stencil_a"]
+
+
+def test_outside_block(registry):
+    assert defer_stencil("stencil_a", GT4PyConfig(backend="numpy")) is None
+
+
+def test_nested_blocks(registry):
+    """Nested blocks join the outermost one"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    with parallel_compilation(workers=1):
+        with parallel_compilation(workers=1):
+            inner = defer_stencil("stencil_a", gt4py_config)
+        with pytest.raises(RuntimeError):
+            inner()
+        outer = defer_stencil("stencil_b", gt4py_config)
+
+    assert inner() == ("stencil_a", {})
+    assert outer() == ("stencil_b", {})
+
+
+def test_first_failure_raised(registry):
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    with pytest.raises(ValueError):
+        with parallel_compilation(workers=1):
+            defer_stencil("broken_a", gt4py_config)
+            defer_stencil("stencil_a", gt4py_config)
+
+
+def test_keep_going(registry):
+    """Failures are collected, the other stencils are compiled and bound"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    with parallel_compilation(workers=1, keep_going=True) as failures:
+        broken = defer_stencil("broken_a", gt4py_config)
+        deferred = defer_stencil("stencil_a", gt4py_config)
+
+    assert [(handle, type(error)) for handle, error in failures] == [
+        (broken, ValueError)
+    ]
+    assert deferred(a=1) == ("stencil_a", {"a": 1})
+    with pytest.raises(RuntimeError):
+        broken()
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from ice3_gt4py.utils import decomposition
+from ice3_gt4py.utils.decomposition import (
+    ColumnFactory,
+    ColumnThreads,
+    ColumnWorkers,
+    SharedState,
+    split_columns,
+    split_plane,
+)
+
+
+class Double:
+    """Stands for a component : doubles x on its columns"""
+
+    def __init__(self, computational_grid):
+        self.computational_grid = computational_grid
+
+    def nested_call(self, state, timestep):
+        state["x"][...] *= 2
+
+
+@pytest.mark.parametrize("nx, n_chunks", [(10, 3), (10, 1), (4, 8), (10000, 7)])
+def test_split_columns(nx, n_chunks):
+    chunks = split_columns(nx, n_chunks)
+    assert chunks[0][0] == 0 and chunks[-1][1] == nx
+    assert all(stop == start for (_, stop), (start, _) in zip(chunks, chunks[1:]))
+    sizes = [stop - start for start, stop in chunks]
+    assert len(chunks) == min(n_chunks, nx)
+    assert max(sizes) - min(sizes) <= 1
+
+
+def test_shared_state_layout():
+    """Shared arrays keep the values and the strides order of the state"""
+    arrays = {
+        "c": np.arange(24.0).reshape(2, 3, 4),
+        "f": np.asfortranarray(np.arange(24).reshape(2, 3, 4)),
+        "mask": np.ones((2, 3), dtype=bool),
+    }
+    with SharedState.create(arrays) as shared:
+        for key, array in arrays.items():
+            assert shared.arrays[key].dtype == array.dtype
+            assert np.array_equal(shared.arrays[key], array)
+        assert shared.arrays["f"].flags.f_contiguous
+
+        attached = SharedState.attach(shared.spec)
+        attached.arrays["c"][0, 0, 0] = -1.0
+        assert shared.arrays["c"][0, 0, 0] == -1.0
+        attached.close()
+
+
+def test_worker_detaches_stale_blocks(monkeypatch):
+    """A worker closes its attachments to the blocks of a previous state"""
+    for name in ["_COMPONENTS", "_ATTACHED", "_VIEWS"]:
+        monkeypatch.setattr(decomposition, name, {})
+    monkeypatch.setattr(decomposition, "_FACTORY", ColumnFactory(Double, ny=1, nz=3))
+    timestep = timedelta(seconds=1)
+
+    with SharedState.create({"x": np.ones((4, 1, 3))}) as first:
+        decomposition._run_chunk(first.spec, (0, 4), timestep)
+        (attached,) = decomposition._ATTACHED.values()
+
+    with SharedState.create({"x": np.ones((6, 1, 3))}) as second:
+        decomposition._run_chunk(second.spec, (0, 6), timestep)
+        assert not attached.arrays and not attached._blocks
+        assert list(decomposition._ATTACHED) == [(second.spec["x"][0],)]
+        assert all(names == (second.spec["x"][0],) for names, _ in decomposition._VIEWS)
+        assert np.all(second.arrays["x"] == 2.0)
+
+        decomposition._VIEWS.clear()
+        decomposition._ATTACHED.popitem()[1].close()
+
+
+def test_column_workers():
+    arrays = {"x": np.arange(30.0).reshape(10, 1, 3)}
+    expected = 2 * arrays["x"]
+    with ColumnWorkers(ColumnFactory(Double, ny=1, nz=3), workers=2) as workers:
+        stats = workers.run(arrays, timedelta(seconds=1))
+    assert np.array_equal(arrays["x"], expected)
+    assert (stats.chunks, stats.columns) == (2, 10)
+
+
+@pytest.mark.parametrize("nx, ny, n_chunks", [(10, 1, 4), (2, 3, 6), (1, 1, 4)])
+def test_split_plane(nx, ny, n_chunks):
+    """Tiles cover the plane once"""
+    covered = np.zeros((nx, ny), dtype=int)
+    tiles = split_plane(nx, ny, n_chunks)
+    for (i_start, i_stop), (j_start, j_stop) in tiles:
+        covered[i_start:i_stop, j_start:j_stop] += 1
+    assert np.all(covered == 1)
+    assert len(tiles) == min(n_chunks, nx * ny)
+
+
+def test_column_threads():
+    """One component per tile, views kept between calls on the same state"""
+    state = {"x": np.arange(60.0).reshape(10, 2, 3)}
+    expected = 4 * state["x"]
+    with ColumnThreads(ColumnFactory(Double, ny=2, nz=3), 10, threads=4) as threads:
+        views = threads.views(state)
+        threads.nested_call(state, timedelta(seconds=1))
+        stats = threads.run(state, timedelta(seconds=1))
+        assert threads.views(state) is views
+    assert np.array_equal(state["x"], expected)
+    assert len(threads.components) == stats.chunks == 4
+    assert stats.columns == 20
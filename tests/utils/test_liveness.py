@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+from types import SimpleNamespace
+
+from ice3_gt4py.utils.call_plan import bind
+
+from ice3_gt4py.utils.liveness import (
+    READ,
+    WRITE,
+    alias_temporaries,
+    call_accesses,
+    live_intervals,
+    stencil_accesses,
+)
+
+TEMPORARIES = [
+    ("rrhong_mr", "float"),
+    ("rimltc_mr", "float"),
+    ("rc_honi_tnd", "float"),
+    ("lbdar", "float"),
+    ("index_floor", "int"),
+    ("unused", "float"),
+]
+
+# rrhong_mr and rimltc_mr : written then read by the next call
+# rc_honi_tnd : read before written (ldsoft)
+CALLS = [
+    {"rrhong_mr": WRITE},
+    {"rrhong_mr": READ},
+    {"rimltc_mr": WRITE},
+    {"rimltc_mr": READ, "rc_honi_tnd": READ | WRITE},
+    {"lbdar": WRITE, "index_floor": WRITE},
+    {"lbdar": READ, "index_floor": READ},
+]
+
+
+def test_live_intervals():
+    intervals, pinned = live_intervals(CALLS)
+    assert intervals["rrhong_mr"] == (0, 1)
+    assert intervals["lbdar"] == (4, 5)
+    assert pinned == ["rc_honi_tnd"]
+
+
+def test_alias_temporaries():
+    """Disjoint lifetimes share a buffer, pinned and unused temporaries do not"""
+    plan = alias_temporaries(TEMPORARIES, CALLS)
+    slots = plan.slots
+
+    assert slots["rrhong_mr"] == slots["rimltc_mr"] == slots["lbdar"]
+    assert len({slots["rc_honi_tnd"], slots["unused"], slots["rrhong_mr"]}) == 3
+    assert plan.dtypes[slots["index_floor"]] == "int"
+    assert len(plan.dtypes) == 4
+
+    # 90-level columns
+    before, after = plan.nbytes(90, {"float": 8, "int": 4})
+    assert before == 90 * (5 * 8 + 4)
+    assert after == 90 * (3 * 8 + 4)
+
+
+def test_pinned_slots():
+    """Slots read before being written are zero-filled, shared or not"""
+    for share in [True, False]:
+        plan = alias_temporaries(TEMPORARIES, CALLS, share=share)
+        assert plan.pinned == [plan.slots["rc_honi_tnd"]]
+        assert plan.slots["rc_honi_tnd"] not in plan.written()
+        assert len(plan.written()) == len(plan.dtypes) - 1
+
+    assert len(alias_temporaries(TEMPORARIES, CALLS, share=False).dtypes) == len(
+        TEMPORARIES
+    )
+
+
+def test_same_call_never_aliased():
+    calls = [{"a": WRITE}, {"a": READ, "b": WRITE}, {"b": READ}]
+    plan = alias_temporaries([("a", "float"), ("b", "float")], calls)
+    assert plan.slots["a"] != plan.slots["b"]
+
+
+def test_no_calls():
+    plan = alias_temporaries(TEMPORARIES, [])
+    assert len(plan.dtypes) == len(TEMPORARIES)
+
+
+def test_stencil_accesses():
+    stencil = SimpleNamespace(
+        field_info={"lbdar": SimpleNamespace(access=WRITE), "lbdas": None}
+    )
+    assert stencil_accesses(stencil, ["lbdar", "lbdas", "lbdag"]) == {
+        "lbdar": WRITE,
+        "lbdas": 0,
+        "lbdag": 0,
+    }
+
+
+def test_call_accesses():
+    """Temporaries are found in the bound arguments, whatever their argument name"""
+    lbdar, rrhong_mr, th_t = object(), object(), object()
+    stencil = SimpleNamespace(
+        field_info={
+            "lbdar": SimpleNamespace(access=WRITE),
+            "rrhong": SimpleNamespace(access=READ),
+            "th_t": SimpleNamespace(access=READ | WRITE),
+        }
+    )
+    call = bind(stencil, {"lbdar": lbdar, "rrhong": rrhong_mr, "th_t": th_t})
+    temporaries = {id(lbdar): "lbdar", id(rrhong_mr): "rrhong_mr"}
+    assert call_accesses(call, temporaries) == {"lbdar": WRITE, "rrhong_mr": READ}
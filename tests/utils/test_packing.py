@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from ice3_gt4py.utils.packing import gather, pack_size, scatter
+
+
+def test_pack_size():
+    """NPROMICRO is used as is, 0 rounds up to a power of 2 within the domain"""
+    assert pack_size(128, 5, 1000) == 128
+    assert pack_size(0, 5, 1000) == 8
+    assert pack_size(0, 8, 1000) == 8
+    assert pack_size(0, 900, 1000) == 1000
+
+
+def test_gather_scatter():
+    """Gathered points are scattered back in place, the tail repeats the last point"""
+    rng = np.random.default_rng(0)
+    fields = {"th_t": rng.random((6, 2, 4)), "rc_t": rng.random((6, 2, 4))}
+    mask = rng.random((6, 2, 4)) < 0.3
+    points = mask.nonzero()
+    n_points = int(mask.sum())
+
+    kproma = pack_size(0, n_points, mask.size)
+    packed = {key: np.zeros((kproma, 1, 1)) for key in fields}
+    size = gather(fields, packed, fields.keys(), points)
+    assert size == n_points
+    np.testing.assert_array_equal(packed["th_t"][:size, 0, 0], fields["th_t"][mask])
+    assert np.all(packed["rc_t"][size:, 0, 0] == fields["rc_t"][points][-1])
+
+    packed["th_t"] += 1.0
+    reference = fields["th_t"] + mask
+    scatter(packed, fields, ["th_t"], points)
+    np.testing.assert_array_equal(fields["th_t"], reference)
@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.utils.precision import field_error, field_errors, with_precision
+
+
+def test_with_precision():
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=True)
+    single = with_precision(gt4py_config, "single")
+
+    assert single.dtypes.float == np.float32
+    assert single.dtypes.int == np.int32
+    assert single.backend == "numpy" and single.rebuild
+    assert gt4py_config.dtypes.float == np.float64
+
+    with pytest.raises(KeyError):
+        with_precision(gt4py_config, "half")
+
+
+def test_field_error():
+    reference = np.array([0.0, 1.0, -2.0])
+    error = field_error(reference, reference.astype(np.float32) + [0.0, 0.0, 0.5])
+
+    assert error.max_abs == 0.5
+    assert error.max_rel == 0.25
+    assert np.isclose(error.rms, np.sqrt(0.25 / 3))
+
+
+def test_field_errors_null_reference():
+    errors = field_errors(
+        {"rc": np.zeros(3), "ri": np.zeros(3)}, {"rc": np.zeros(3), "ri": np.ones(3)}
+    )
+    assert errors["rc"].max_rel == 0.0
+    assert errors["ri"].max_rel == float("inf")
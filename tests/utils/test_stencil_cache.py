@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from gt4py.cartesian.gtscript import GlobalTable
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils import stencil_cache
+from ice3_gt4py.utils.stencil_cache import (
+    INDEX_FILE,
+    StencilCache,
+    resolve_table_shapes,
+)
+
+
+class FakeGTScript:
+    """Stands for gtscript : "compiles" a stencil into 1000 bytes, laid out as gt4py
+
+    <name>/m_<name>__<backend>_<hash>.py, next to m_computation__<backend>_<hash>.py
+    """
+
+    def __init__(self):
+        self.builds = 0
+
+    def stencil(
+        self,
+        backend,
+        definition,
+        *,
+        name,
+        cache_settings,
+        raise_if_not_cached=False,
+        **kwargs,
+    ):
+        path = Path(cache_settings["root_path"], cache_settings["dir_name"], name)
+        module = path / f"m_{name}__{backend}_0123456789.py"
+        if not module.exists():
+            if raise_if_not_cached:
+                raise ValueError(f"{name} not cached")
+            path.mkdir(parents=True, exist_ok=True)
+            module.write_bytes(b"0" * 500)
+            (path / f"m_computation__{backend}_0123456789.py").write_bytes(b"0" * 500)
+            self.builds += 1
+        return SimpleNamespace(_file_name=str(module))
+
+
+@pytest.fixture
+def fake_gtscript(monkeypatch):
+    gtscript = FakeGTScript()
+    monkeypatch.setattr(stencil_cache, "gtscript", gtscript)
+    monkeypatch.setattr(stencil_cache, "get_definition", lambda name: None)
+    return gtscript
+
+
+def test_miss_then_hit(tmp_path, fake_gtscript):
+    cache = StencilCache(tmp_path / "cache")
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+
+    cache.load_or_build("stencil_a", gt4py_config)
+    cache.load_or_build("stencil_a", gt4py_config)
+    assert (cache.stats.misses, cache.stats.hits) == (1, 1)
+    assert fake_gtscript.builds == 1
+    assert cache.size() == 1000
+
+
+def test_eviction(tmp_path, fake_gtscript):
+    """Least recently used stencils are evicted past max_size"""
+    cache = StencilCache(tmp_path / "cache", max_size=2500)
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+
+    for name in ["stencil_a", "stencil_b", "stencil_c"]:
+        cache.load_or_build(name, gt4py_config)
+    assert cache.stats.evictions == 1
+    assert cache.size() == 2000
+    assert not any((cache.path / "stencil_a").iterdir())
+
+    cache.load_or_build("stencil_a", gt4py_config)
+    assert cache.stats.misses == 4
+
+
+def test_eviction_removes_every_artifact(tmp_path, fake_gtscript):
+    """Generated modules and build directories are evicted with the stencil"""
+    cache = StencilCache(tmp_path / "cache", max_size=1500)
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+
+    build_dir = cache.path / "stencil_a" / "m_stencil_a__numpy_0123456789_BUILD"
+    build_dir.mkdir(parents=True)
+    (build_dir / "extension.so").write_bytes(b"0" * 200)
+    cache.load_or_build("stencil_a", gt4py_config)
+    assert cache.size() == 1200
+
+    cache.load_or_build("stencil_b", gt4py_config)
+    assert cache.stats.evictions == 1
+    assert not any((cache.path / "stencil_a").iterdir())
+    assert cache.size() == 1000
+
+
+def test_records_compiled_stencil(tmp_path):
+    """Index entry of a stencil compiled by gt4py"""
+    cache = StencilCache(tmp_path)
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    externals = Phyex("AROME").to_externals()
+    cache.load_or_build("ice4_stepping_ldcompute_init", gt4py_config, externals)
+
+    (entry,) = cache._read_index().values()
+    assert entry["name"] == "ice4_stepping_ldcompute_init"
+    assert entry["size"] > 0
+
+
+def test_concurrent_records(tmp_path):
+    """Index updates are serialized : no entry is lost"""
+    path = tmp_path / "cache"
+    keys = [f"stencil_{i}" for i in range(16)]
+    StencilCache(path)
+    for key in keys:
+        (path / f"{key}.py").write_bytes(b"0" * 10)
+
+    def record(key):
+        StencilCache(path)._record(key, "numpy", path / f"{key}.py")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(record, keys))
+
+    with open(path / INDEX_FILE) as file:
+        assert sorted(json.load(file)) == sorted(keys)
+
+
+def table_definition(
+    ker: GlobalTable["float", ("NACCLBDAS", "NACCLBDAR")],
+    src_1d: GlobalTable["float", (34)],
+):
+    pass
+
+
+def test_resolve_table_shapes():
+    """Table shapes read from the externals, registered definition left as is"""
+    externals = {"NACCLBDAS": 40, "NACCLBDAR": 60}
+    resolved = resolve_table_shapes(table_definition, externals)
+    assert resolved.__annotations__["ker"].data_dims == (40, 60)
+    assert resolved.__annotations__["ker"].dtype == "float"
+    assert (
+        resolved.__annotations__["src_1d"] == table_definition.__annotations__["src_1d"]
+    )
+    assert resolved.__qualname__ == table_definition.__qualname__
+    assert isinstance(table_definition.__annotations__["ker"], str)
+
+    with pytest.raises(ValueError):
+        resolve_table_shapes(table_definition, {"NACCLBDAS": 40})
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from ifs_physics_common.framework.config import GT4PyConfig
+
+from ice3_gt4py.phyex_common.phyex import Phyex
+from ice3_gt4py.utils.precision import with_precision
+from ice3_gt4py.utils.stencil_registry import stencil_fingerprint
+
+
+def test_stencil_fingerprint():
+    """Unread externals leave the fingerprint as is, dtypes and read externals change it"""
+    gt4py_config = GT4PyConfig(backend="numpy", rebuild=False)
+    externals = Phyex("AROME").to_externals()
+    fingerprint = stencil_fingerprint("ice4_fast_rs", gt4py_config, externals)
+
+    assert fingerprint == stencil_fingerprint(
+        "ice4_fast_rs", gt4py_config, {**externals, "NOT_READ": 1}
+    )
+    assert fingerprint != stencil_fingerprint(
+        "ice4_fast_rs", gt4py_config, {**externals, "NACCLBDAS": 20}
+    )
+    assert fingerprint != stencil_fingerprint(
+        "ice4_fast_rs", with_precision(gt4py_config, "single"), externals
+    )
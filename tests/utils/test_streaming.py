@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import xarray as xr
+
+from ice3_gt4py.utils.streaming import NetCDFAppender, column_chunks, stream_columns
+
+
+class Field:
+    """Stands for a DataArray of the state"""
+
+    def __init__(self, data):
+        self.data = data
+
+
+def initialize(state, chunk):
+    state["th"].data[: chunk.size, 0, :] = chunk.get_field("PTH")
+    state["sea"].data[: chunk.size, 0] = chunk.get_field("PSEA")
+
+
+def double(storages):
+    storages["th"][...] *= 2
+
+
+def test_stream_columns(tmp_path):
+    """Output matches a whole-dataset run, written chunk by chunk"""
+    th = np.arange(22.0 * 3).reshape(22, 3)
+    sea = np.arange(22.0)
+    xr.Dataset(
+        {"PTH": (("IJ", "K"), th), "PSEA": (("IJ",), sea)},
+    ).to_netcdf(tmp_path / "input.nc")
+
+    chunk_size = 5
+    state = {
+        "th": Field(np.zeros((chunk_size, 1, 3))),
+        "sea": Field(np.zeros((chunk_size, 1))),
+    }
+    with NetCDFAppender(tmp_path / "output.nc") as writer:
+        stats = stream_columns(
+            column_chunks(tmp_path / "input.nc", chunk_size),
+            state,
+            initialize,
+            double,
+            writer,
+        )
+
+    assert (stats.chunks, stats.columns) == (5, 22)
+    with xr.open_dataset(tmp_path / "output.nc") as output:
+        assert output["th"].shape == (22, 1, 3)
+        assert np.array_equal(output["th"].values[:, 0, :], 2 * th)
+        assert np.array_equal(output["sea"].values[:, 0], sea)
+
+
+def test_max_columns(tmp_path):
+    xr.Dataset({"PSEA": (("IJ",), np.arange(10.0))}).to_netcdf(tmp_path / "input.nc")
+    chunks = [
+        (chunk.start, chunk.stop, chunk.get_dims()["IJ"])
+        for chunk in column_chunks(tmp_path / "input.nc", 4, max_columns=7)
+    ]
+    assert chunks == [(0, 4, 4), (4, 7, 3)]
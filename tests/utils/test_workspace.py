@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+from ifs_physics_common.framework.config import GT4PyConfig
+from ifs_physics_common.framework.grid import ComputationalGrid, I, J, K
+
+from ice3_gt4py.utils.liveness import READ, WRITE, alias_temporaries
+from ice3_gt4py.utils.workspace import Workspace
+
+
+def test_temporaries_zeroed():
+    """Reused storages are handed out zero-filled, unless written before being read"""
+    grid = ComputationalGrid(4, 1, 3)
+    workspace = Workspace(GT4PyConfig(backend="numpy", rebuild=False))
+    args = (((I, J, K), "float"), ((I, J, K), "float"), ((I, J), "bool"))
+
+    with workspace.temporaries(grid, *args) as (a, b, mask):
+        a[...], b[...], mask[...] = 1.0, 2.0, True
+
+    with workspace.temporaries(grid, *args, written=[1]) as (a, b, mask):
+        assert workspace.stats.reuses == 3
+        assert np.all(np.asarray(a) == 0)
+        assert np.all(np.asarray(b) == 2.0)
+        assert not np.any(np.asarray(mask))
+
+
+def test_pinned_slots_zeroed():
+    """Buffers of an aliasing plan : pinned slots come back zero-filled"""
+    grid = ComputationalGrid(4, 1, 3)
+    workspace = Workspace(GT4PyConfig(backend="numpy", rebuild=False))
+    calls = [{"rate": READ | WRITE}, {"tmp": WRITE}, {"tmp": READ}]
+    plan = alias_temporaries([("rate", "float"), ("tmp", "float")], calls)
+    args = [((I, J, K), dtype) for dtype in plan.dtypes]
+
+    for _ in range(2):
+        with workspace.temporaries(grid, *args, written=plan.written()) as buffers:
+            rate, tmp = plan.assign(["rate", "tmp"], buffers)
+            assert np.all(np.asarray(rate) == 0)
+            rate[...], tmp[...] = 1.0, 1.0
+    assert workspace.stats.reuses == 2